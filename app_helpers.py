@@ -0,0 +1,501 @@
+"""
+Funções Auxiliares da Interface
+Formatação, persistência dos planos e dados do usuário, gerenciador de planos
+da barra lateral e acompanhamento dos relatórios em segundo plano, compartilhados
+pela rotina principal e pelos módulos de cada etapa/ferramenta
+"""
+
+import streamlit as st
+import json
+import os
+from datetime import datetime
+
+from br_format import format_currency, format_number  # noqa: F401 (reexportados para as telas)
+from report_jobs import REPORT_MIME_TYPES, get_report_queue
+
+# Utility functions
+def round_price_to_tens(price):
+    """Round price to nearest 10 reais (no cents)"""
+    return round(price / 10) * 10
+
+def calcular_custo_captador_mensal():
+    """Calcula o custo mensal do captador baseado nas configurações da Gestão de Pessoas"""
+    
+    # Verificar se o sistema de captação está ativo
+    usar_sistema_captacao = st.session_state.business_data.get('usar_sistema_captacao', False)
+    if not usar_sistema_captacao:
+        return 0.0
+    
+    # Obter projeções de vendas das Projeções Financeiras
+    vendas_mes_1 = st.session_state.business_data.get('vendas_mes_1', 0)
+    ticket_medio = st.session_state.business_data.get('ticket_medio', 500)
+    oculos_meta = int(vendas_mes_1 / ticket_medio) if ticket_medio > 0 and vendas_mes_1 > 0 else 30
+    
+    # VERIFICAR GATILHO MÍNIMO (a partir de 5 vendas)
+    meta_minima_captador = st.session_state.business_data.get('meta_minima_captador', 5)
+    if oculos_meta < meta_minima_captador:
+        # Não há pagamento se não atingir o mínimo
+        st.session_state.business_data['custo_captador_mensal_calculado'] = 0.0
+        st.session_state.business_data['memoria_calculo_captador'] = f"Meta {oculos_meta} óculos < gatilho mínimo {meta_minima_captador} vendas = R$ 0,00"
+        return 0.0
+    
+    # Obter configurações de comissão da Gestão de Pessoas
+    comissao_avista = st.session_state.business_data.get('comissao_avista', 30.0)  # R$ 30 por venda à vista
+    comissao_parcelada = st.session_state.business_data.get('comissao_parcelada', 5.0)  # R$ 5 por venda parcelada
+    
+    # Distribuição entre à vista e parcelada (padrão 50% cada)
+    percentual_avista = st.session_state.business_data.get('percentual_vendas_avista', 50)
+    percentual_parcelada = 100 - percentual_avista
+    
+    # Calcular vendas por modalidade
+    vendas_avista = int(oculos_meta * (percentual_avista / 100))
+    vendas_parcelada = oculos_meta - vendas_avista
+    
+    # Calcular comissões (SEMPRE valor fixo por venda conforme configuração)
+    total_comissao_avista = vendas_avista * comissao_avista
+    total_comissao_parcelada = vendas_parcelada * comissao_parcelada
+    
+    # Total mensal
+    custo_total_captador = total_comissao_avista + total_comissao_parcelada
+    
+    # MEMÓRIA DE CÁLCULO COMPLETA
+    memoria_calculo = f"""
+    CÁLCULO CAPTADOR:
+    • Meta de óculos: {oculos_meta} vendas/mês
+    • Gatilho mínimo: {meta_minima_captador} vendas ✓
+    • Distribuição: {percentual_avista}% à vista, {percentual_parcelada}% parcelada
+    
+    VENDAS POR MODALIDADE:
+    • À vista: {vendas_avista} vendas × R$ {comissao_avista:.2f} = R$ {total_comissao_avista:.2f}
+    • Parcelada: {vendas_parcelada} vendas × R$ {comissao_parcelada:.2f} = R$ {total_comissao_parcelada:.2f}
+    
+    TOTAL: R$ {custo_total_captador:.2f}/mês
+    """
+    
+    # Salvar para referência e auditoria
+    st.session_state.business_data['custo_captador_mensal_calculado'] = custo_total_captador
+    st.session_state.business_data['memoria_calculo_captador'] = memoria_calculo
+    
+    return custo_total_captador
+
+def safe_multiselect_default(stored_values, available_options, fallback_default=None):
+    """Ensure multiselect default values are valid options"""
+    if not stored_values:
+        return fallback_default or []
+    
+    # Filter stored values to only include valid options
+    valid_values = [v for v in stored_values if v in available_options]
+    return valid_values if valid_values else (fallback_default or [])
+
+# Business plan management functions
+def get_saved_plans():
+    """Get list of saved business plans"""
+    if not os.path.exists('saved_plans'):
+        os.makedirs('saved_plans')
+    
+    plans = []
+    for filename in os.listdir('saved_plans'):
+        if filename.endswith('.json'):
+            try:
+                with open(f'saved_plans/{filename}', 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    plans.append({
+                        'filename': filename,
+                        'name': data.get('plan_name', filename.replace('.json', '')),
+                        'shop_name': data.get('business_data', {}).get('nome_otica', 'Sem nome'),
+                        'created': data.get('created_at', 'Data desconhecida'),
+                        'last_modified': data.get('last_modified', 'Não modificado')
+                    })
+            except:
+                continue
+    
+    return sorted(plans, key=lambda x: x.get('last_modified', ''), reverse=True)
+
+def save_business_plan(plan_name=None, force_new_version=False):
+    """Save current business plan - replaces existing unless force_new_version=True"""
+    if not os.path.exists('saved_plans'):
+        os.makedirs('saved_plans')
+    
+    # Use shop name as plan name if not provided
+    shop_name = st.session_state.business_data.get('nome_otica', '').strip()
+    if not plan_name:
+        plan_name = shop_name if shop_name else f"Plano_{datetime.now().strftime('%Y%m%d_%H%M')}"
+    
+    # Check if plan with same name exists
+    base_filename = f"{plan_name}.json"
+    filename = base_filename
+    
+    # Only create versioned name if force_new_version is True
+    if force_new_version and os.path.exists(f'saved_plans/{base_filename}'):
+        version = 2
+        while os.path.exists(f'saved_plans/{plan_name}_Versao_{version}.json'):
+            version += 1
+        filename = f"{plan_name}_Versao_{version}.json"
+    
+    # Get existing creation date if file exists and we're updating
+    created_at = datetime.now().isoformat()
+    if os.path.exists(f'saved_plans/{filename}') and not force_new_version:
+        try:
+            with open(f'saved_plans/{filename}', 'r', encoding='utf-8') as f:
+                existing_data = json.load(f)
+                created_at = existing_data.get('created_at', created_at)
+        except:
+            pass  # Use new creation date if can't read existing
+    
+    # Prepare data to save
+    save_data = {
+        'plan_name': plan_name,
+        'business_data': st.session_state.business_data,
+        'uploaded_files': {},  # File content would be saved separately in production
+        'current_step': st.session_state.step,
+        'created_at': created_at,
+        'last_modified': datetime.now().isoformat()
+    }
+    
+    # Save to file
+    filepath = f'saved_plans/{filename}'
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(save_data, f, ensure_ascii=False, indent=2, default=str)
+    
+    return filename
+
+def load_business_plan(file_path):
+    """Load business plan from file"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        # Load business data
+        st.session_state.business_data = data.get('business_data', {})
+        st.session_state.step = data.get('current_step', 1)
+        
+        # Restore uploaded files (simplified for this demo)
+        st.session_state.uploaded_files = data.get('uploaded_files', {})
+        
+        return True
+    except Exception as e:
+        st.error(f"Erro ao carregar plano: {e}")
+        return False
+
+def delete_business_plan(file_path, plan_name):
+    """Delete business plan file"""
+    try:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            return True
+    except Exception as e:
+        st.error(f"Erro ao excluir plano {plan_name}: {e}")
+        return False
+
+def create_new_plan():
+    """Create new business plan (clear current data)"""
+    # Clear all business data
+    st.session_state.business_data = {}
+    st.session_state.uploaded_files = {}
+    st.session_state.step = 1
+    
+    # Clear drill-down selections
+    keys_to_delete = []
+    for key in list(st.session_state.keys()):
+        if str(key).startswith(('show_', 'drill_')):
+            keys_to_delete.append(key)
+    for key in keys_to_delete:
+        del st.session_state[key]
+    
+    # Clear legacy data file
+    try:
+        if os.path.exists('user_data.json'):
+            os.remove('user_data.json')
+    except:
+        pass
+
+def show_plan_manager():
+    """Show business plan manager interface"""
+    st.sidebar.subheader("📋 Projetos")
+    
+    col1, col2 = st.sidebar.columns(2)
+    
+    with col1:
+        if st.button("📄 Novo", key="new_plan_btn", use_container_width=True):
+            create_new_plan()
+            st.sidebar.success("Novo plano criado!")
+            st.rerun()
+    
+    with col2:
+        if st.button("💾 Salvar", key="save_plan_btn", use_container_width=True):
+            filename = save_business_plan()
+            st.sidebar.success(f"Salvo: {filename}")
+            st.rerun()
+    
+    # Show saved plans
+    saved_plans = get_saved_plans()
+    
+    if saved_plans:
+        st.sidebar.markdown("**Planos Salvos:**")
+        
+        for plan in saved_plans[:5]:  # Show only last 5
+            col1, col2 = st.sidebar.columns([3, 1])
+            
+            with col1:
+                if st.button(f"📂 {plan['name']}", key=f"load_{plan['filename']}", use_container_width=True):
+                    if load_business_plan(f"saved_plans/{plan['filename']}"):
+                        st.sidebar.success(f"Carregado: {plan['name']}")
+                        st.rerun()
+            
+            with col2:
+                # Usar form para fazer o botão HTML funcionar com Streamlit
+                with st.form(key=f"delete_form_{plan['filename']}"):
+                    st.markdown(f"""
+                    <style>
+                    div[data-testid="stForm"] {{
+                        border: none !important;
+                        padding: 0 !important;
+                    }}
+                    div[data-testid="stForm"] button[type="submit"] {{
+                        background: linear-gradient(135deg, #ff4757 0%, #ff3742 50%, #e63946 100%) !important;
+                        color: white !important;
+                        border: 2px solid #ff6b7a !important;
+                        border-radius: 15px !important;
+                        font-size: 1.4rem !important;
+                        font-weight: 700 !important;
+                        padding: 0.8rem 1rem !important;
+                        width: 100% !important;
+                        min-height: 3rem !important;
+                        box-shadow: 0 6px 20px rgba(255, 71, 87, 0.4), inset 0 2px 0 rgba(255, 255, 255, 0.3) !important;
+                        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+                        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3) !important;
+                        cursor: pointer !important;
+                        outline: none !important;
+                    }}
+                    div[data-testid="stForm"] button[type="submit"]:hover {{
+                        background: linear-gradient(135deg, #ff3742 0%, #e63946 50%, #c62d42 100%) !important;
+                        transform: translateY(-3px) scale(1.05) !important;
+                        box-shadow: 0 8px 25px rgba(255, 71, 87, 0.6), inset 0 2px 0 rgba(255, 255, 255, 0.4) !important;
+                    }}
+                    div[data-testid="stForm"] button[type="submit"]:active {{
+                        transform: translateY(-1px) scale(0.98) !important;
+                        box-shadow: 0 4px 15px rgba(255, 71, 87, 0.7), inset 0 3px 8px rgba(0, 0, 0, 0.3) !important;
+                    }}
+                    </style>
+                    """, unsafe_allow_html=True)
+                    
+                    delete_clicked = st.form_submit_button("🗑️", help=f"Excluir {plan['name']}")
+                    
+                if delete_clicked:
+                    st.session_state.confirm_delete_plan = plan
+                    st.rerun()
+
+# Legacy data functions (for backward compatibility)
+def load_user_data():
+    """Load user data from JSON file (legacy support)"""
+    try:
+        if os.path.exists('user_data.json'):
+            with open('user_data.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                
+            # Only load if business_data is empty
+            if not st.session_state.business_data:
+                st.session_state.business_data = data.get('business_data', {})
+                st.session_state.step = data.get('current_step', 1)
+                st.session_state.uploaded_files = data.get('uploaded_files', {})
+    except Exception as e:
+        pass  # Silently fail for backward compatibility
+    
+
+
+def save_user_data():
+    """Save user data to JSON file (legacy support + auto-save)"""
+    if st.session_state.business_data:  # Only save if there's data
+        try:
+            # Garantir sincronização do DP antes de salvar
+            if hasattr(st.session_state, 'funcionarios') and st.session_state.funcionarios:
+                st.session_state.business_data['funcionarios_dp'] = st.session_state.funcionarios
+            
+            data = {
+                'business_data': st.session_state.business_data,
+                'uploaded_files': st.session_state.uploaded_files,
+                'current_step': st.session_state.step,
+                'last_saved': datetime.now().isoformat()
+            }
+            
+            # Auto-save to legacy file
+            with open('user_data.json', 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        except Exception as e:
+            print(f"Auto-save failed: {e}")  # Debug for development
+
+def auto_save_drill_down_selection(key, value):
+    """Save drill-down selection immediately"""
+    st.session_state.business_data[f"drill_{key}"] = value
+    save_user_data()
+
+def get_drill_down_selection(key, default=None):
+    """Get saved drill-down selection"""
+    return st.session_state.business_data.get(f"drill_{key}", default)
+
+
+def show_delete_confirmation():
+    """Full-screen confirmation before deleting a saved plan (stops the run while open)"""
+    plan = st.session_state.confirm_delete_plan
+
+    # Create full-screen overlay with dark background
+    st.markdown("""
+    <style>
+    .delete-overlay {
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100vw;
+        height: 100vh;
+        background: rgba(0, 0, 0, 0.8);
+        z-index: 9999;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    }
+    .delete-dialog {
+        background: white;
+        padding: 3rem;
+        border-radius: 20px;
+        text-align: center;
+        max-width: 500px;
+        width: 90%;
+        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
+        border: 3px solid #dc3545;
+    }
+    .delete-icon {
+        font-size: 4rem;
+        color: #dc3545;
+        margin-bottom: 1rem;
+    }
+    .delete-title {
+        font-size: 1.5rem;
+        font-weight: bold;
+        color: #dc3545;
+        margin-bottom: 1rem;
+    }
+    .delete-message {
+        font-size: 1.1rem;
+        color: #333;
+        margin-bottom: 2rem;
+        line-height: 1.5;
+    }
+    .plan-name {
+        background: #f8f9fa;
+        padding: 0.5rem 1rem;
+        border-radius: 8px;
+        border-left: 4px solid #dc3545;
+        margin: 1rem 0;
+        font-weight: bold;
+        color: #dc3545;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Large confirmation dialog
+    st.markdown("### 🗑️ CONFIRMAÇÃO DE EXCLUSÃO")
+    st.error("⚠️ **ATENÇÃO: Esta ação não pode ser desfeita!**")
+
+    st.markdown(f"""
+    <div style="
+        background: linear-gradient(135deg, #fee2e2, #fecaca);
+        padding: 2rem;
+        border-radius: 15px;
+        border: 2px solid #dc3545;
+        text-align: center;
+        margin: 2rem 0;
+        box-shadow: 0 8px 25px rgba(220, 53, 69, 0.3);
+    ">
+        <div style="font-size: 4rem; margin-bottom: 1rem;">🗑️</div>
+        <div style="font-size: 1.3rem; font-weight: bold; color: #dc3545; margin-bottom: 1rem;">
+            Você tem certeza que deseja excluir seu plano de negócio?
+        </div>
+        <div style="
+            background: white;
+            padding: 1rem;
+            border-radius: 8px;
+            border-left: 4px solid #dc3545;
+            margin: 1rem 0;
+            font-weight: bold;
+            color: #dc3545;
+            font-size: 1.1rem;
+        ">
+            📄 {plan['name']}
+        </div>
+        <div style="color: #666; font-size: 1rem; margin-top: 1rem;">
+            Todo o trabalho que você fez será perdido permanentemente.<br>
+            Não será possível recuperar este plano depois de excluído.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Action buttons
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col2:
+        col_cancel, col_delete = st.columns(2)
+
+        with col_cancel:
+            if st.button("❌ Cancelar", key="cancel_delete", use_container_width=True, type="secondary"):
+                del st.session_state.confirm_delete_plan
+                st.rerun()
+
+        with col_delete:
+            if st.button("🗑️ SIM, EXCLUIR", key="confirm_delete", use_container_width=True, type="primary"):
+                if delete_business_plan(f"saved_plans/{plan['filename']}", plan['name']):
+                    st.success(f"✅ Plano '{plan['name']}' foi excluído com sucesso!")
+                    del st.session_state.confirm_delete_plan
+                    st.rerun()
+                else:
+                    st.error("❌ Erro ao excluir o plano. Tente novamente.")
+
+    st.stop()  # Don't show the rest of the interface
+
+
+def show_report_job(tipo, idioma, file_name, download_label, success_message, error_message, mime=None,
+                    figures=None):
+    """Progresso ou download do relatório gerado em segundo plano; True enquanto o job roda"""
+    queue = get_report_queue()
+    job_id = st.session_state.get(f'report_job_{tipo}')
+    # Só mostra o job se ele ainda corresponde ao plano, idioma e tabelas da tela atuais
+    if not job_id or job_id != queue.job_id(tipo, st.session_state.business_data, idioma, figures):
+        return False
+
+    status = queue.status(job_id)
+
+    if status['estado'] == 'pronto':
+        path = queue.result_path(job_id)
+        if path is None or not os.path.exists(path):
+            # Saiu do cache entre a consulta e a leitura: precisa gerar de novo
+            del st.session_state[f'report_job_{tipo}']
+            return False
+        
+        # O Streamlit lê o arquivo inteiro para o seu gerenciador de mídia (em memória) a cada
+        # renderização do botão; o spool só evita que fila e sessão guardem os bytes entre reruns
+        with open(path, 'rb') as arquivo:
+            st.download_button(
+                label=download_label,
+                data=arquivo,
+                file_name=file_name,
+                mime=mime or REPORT_MIME_TYPES.get(tipo, "application/pdf"),
+                key=f"download_report_{tipo}"
+            )
+        st.success(success_message)
+        return False
+
+    if status['estado'] == 'erro':
+        st.error(f"{error_message}: {status['erro']}")
+        return False
+
+    if status['estado'] == 'desconhecido':
+        # Saiu do cache: precisa gerar de novo
+        del st.session_state[f'report_job_{tipo}']
+        return False
+
+    mensagens = {
+        "English": ("⏳ Queued...", "⏳ Generating report..."),
+        "Español": ("⏳ En cola...", "⏳ Generando informe...")
+    }
+    na_fila, gerando = mensagens.get(idioma, ("⏳ Na fila...", "⏳ Gerando relatório..."))
+    st.progress(status['progresso'], text=na_fila if status['estado'] == 'fila' else gerando)
+    return True
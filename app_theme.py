@@ -0,0 +1,775 @@
+"""
+Tema Visual da Aplicação
+Folhas de estilo enviadas a cada execução do Streamlit, mantidas como constantes
+do módulo (criadas uma vez por processo em vez de a cada rerun do script)
+"""
+
+import streamlit as st
+
+# Fonte sempre legível: remove o itálico forçado por temas e navegadores
+BASE_CSS = """
+<style>
+/* FORÇAR FONTE NORMAL EM TODO O SISTEMA - PRIORITY MÁXIMA */
+*, *::before, *::after,
+html, body, div, span, applet, object, iframe,
+h1, h2, h3, h4, h5, h6, p, blockquote, pre,
+a, abbr, acronym, address, big, cite, code,
+del, dfn, em, img, ins, kbd, q, s, samp,
+small, strike, strong, sub, sup, tt, var,
+b, u, i, center,
+dl, dt, dd, ol, ul, li,
+fieldset, form, label, legend,
+table, caption, tbody, tfoot, thead, tr, th, td,
+article, aside, canvas, details, embed,
+figure, figcaption, footer, header, hgroup,
+menu, nav, output, ruby, section, summary,
+time, mark, audio, video {
+    font-style: normal !important;
+    font-weight: normal !important;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+}
+
+/* ELIMINAR ITÁLICO AGRESSIVAMENTE */
+em, i, .italic, cite, dfn, var,
+.stMarkdown em, .stMarkdown i,
+.stAlert em, .stAlert i,
+.stInfo em, .stInfo i,
+.stSuccess em, .stSuccess i,
+.stWarning em, .stWarning i,
+.stError em, .stError i {
+    font-style: normal !important;
+    font-weight: normal !important;
+    text-decoration: none !important;
+}
+
+/* CORRIGIR TODOS OS COMPONENTES STREAMLIT */
+.stTextInput, .stTextInput *,
+.stNumberInput, .stNumberInput *,
+.stSelectbox, .stSelectbox *,
+.stMultiSelect, .stMultiSelect *,
+.stTextArea, .stTextArea *,
+.stSlider, .stSlider *,
+.stCheckbox, .stCheckbox *,
+.stRadio, .stRadio *,
+.stButton, .stButton *,
+.stMetric, .stMetric *,
+.stContainer, .stContainer *,
+.stColumns, .stColumns *,
+.stTabs, .stTabs *,
+.stExpander, .stExpander *,
+.stSidebar, .stSidebar * {
+    font-style: normal !important;
+    font-family: inherit !important;
+}
+
+/* CORRIGIR ESPECIFICAMENTE ELEMENTOS DE INPUT */
+input, textarea, select, option,
+.stTextInput > div > div > input,
+.stNumberInput > div > div > input,
+.stSelectbox > div > div > div,
+.stMultiSelect > div > div > div,
+.stTextArea > div > div > textarea {
+    font-style: normal !important;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif !important;
+    font-weight: 400 !important;
+}
+
+/* CORRIGIR LABELS E HELP TEXT */
+label, .stLabel, 
+.help, .stHelp,
+.caption, .stCaption,
+.description, .stDescription {
+    font-style: normal !important;
+    font-family: inherit !important;
+}
+
+/* CORRIGIR TOOLTIPS E BALÕES */
+.stTooltip, .stTooltipContent,
+.stBalloons, .stSnow,
+.tooltip, [data-tooltip] {
+    font-style: normal !important;
+}
+
+/* CORRIGIR NÚMEROS E VALORES MONETÁRIOS */
+.currency, .number, .metric-value,
+.stMetric .metric-value,
+.stMetric .metric-delta {
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace !important;
+    font-style: normal !important;
+    font-weight: 500 !important;
+}
+
+/* OVERRIDE GLOBAL DE EMERGÊNCIA */
+[style*="font-style: italic"] {
+    font-style: normal !important;
+}
+
+[style*="font-style:italic"] {
+    font-style: normal !important;  
+}
+
+/* APLICAR A TODA ÁRVORE DOM */
+.main * {
+    font-style: normal !important;
+}
+
+.stApp * {
+    font-style: normal !important;
+}
+
+/* FORÇA BRUTA FINAL */
+body * {
+    font-style: normal !important;
+}
+</style>
+"""
+
+# Paleta de cores, barra lateral escura e botões da aplicação
+THEME_CSS = """
+    <style>
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    
+    /* Paleta de cores */
+    :root {
+        --primary-gold: #d4af37;
+        --secondary-gold: #b8860b;
+        --warm-cream: #f0ede5;
+        --soft-brown: #8b7355;
+        --dark-brown: #5d4e37;
+        --navy-blue: #2c3e50;
+        --text-primary: #2c3e50;
+        --text-secondary: #5d4e37;
+        --background-primary: #f0ede5;
+        --background-secondary: #e8e3db;
+    }
+    
+    html, body, [class*="css"] {
+        font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+    }
+    
+    .stApp {
+        font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+        background: linear-gradient(135deg, var(--background-secondary) 0%, var(--background-primary) 100%) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Títulos principais com cores da paleta */
+    h1 {
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 700 !important;
+        color: var(--text-primary) !important;
+        line-height: 1.2 !important;
+        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.1) !important;
+    }
+    
+    h2, h3 {
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 600 !important;
+        color: var(--text-secondary) !important;
+        line-height: 1.3 !important;
+    }
+    
+    h4, h5, h6 {
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+        color: var(--soft-brown) !important;
+        line-height: 1.3 !important;
+    }
+    
+    /* Textos principais com melhor contraste */
+    .stMarkdown, .stText, p, span, div, li {
+        font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+        line-height: 1.6 !important;
+        font-weight: 400 !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Sidebar escura e elegante */
+    .css-1d391kg, [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #1a252f 0%, #2c3e50 100%) !important;
+        font-family: 'Inter', sans-serif !important;
+        backdrop-filter: blur(20px) !important;
+        border-right: 1px solid rgba(212, 175, 55, 0.3) !important;
+        box-shadow: 2px 0 20px rgba(0, 0, 0, 0.3) !important;
+    }
+    
+    /* Força sidebar em todas as variações de classe */
+    .stSidebar, .stSidebar > div, section[data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #1a252f 0%, #2c3e50 100%) !important;
+    }
+    
+    .css-1d391kg::before, [data-testid="stSidebar"]::before {
+        content: '' !important;
+        position: absolute !important;
+        top: 0 !important;
+        left: 0 !important;
+        right: 0 !important;
+        height: 2px !important;
+        background: linear-gradient(90deg, var(--primary-gold), var(--secondary-gold), var(--primary-gold)) !important;
+    }
+    
+    .css-1d391kg h1, .css-1d391kg h2, .css-1d391kg h3, 
+    [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
+        color: var(--primary-gold) !important;
+        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.2) !important;
+    }
+    
+    .css-1d391kg p, .css-1d391kg span, .css-1d391kg div, .css-1d391kg li,
+    [data-testid="stSidebar"] p, [data-testid="stSidebar"] span, [data-testid="stSidebar"] div, [data-testid="stSidebar"] li {
+        color: rgba(255, 255, 255, 0.95) !important;
+        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.1) !important;
+    }
+    
+    /* Botões da sidebar com efeito 3D premium */
+    .stSidebar .stButton > button {
+        background: linear-gradient(145deg, rgba(26, 37, 47, 0.8), rgba(15, 25, 35, 0.9)) !important;
+        color: rgba(255, 255, 255, 0.85) !important;
+        border: 1px solid rgba(255, 255, 255, 0.1) !important;
+        border-radius: 12px !important;
+        font-weight: 500 !important;
+        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275) !important;
+        backdrop-filter: blur(15px) !important;
+        margin: 3px 0 !important;
+        padding: 10px 18px !important;
+        box-shadow: 
+            0 4px 8px rgba(0, 0, 0, 0.3),
+            inset 0 1px 0 rgba(255, 255, 255, 0.1),
+            inset 0 -1px 0 rgba(0, 0, 0, 0.2) !important;
+        position: relative !important;
+    }
+    
+    .stSidebar .stButton > button:hover {
+        background: linear-gradient(145deg, rgba(212, 175, 55, 0.2), rgba(184, 134, 11, 0.15)) !important;
+        border-color: rgba(212, 175, 55, 0.4) !important;
+        color: rgba(255, 255, 255, 0.95) !important;
+        transform: translateY(-2px) translateX(3px) scale(1.02) !important;
+        box-shadow: 
+            0 8px 20px rgba(0, 0, 0, 0.4),
+            0 2px 10px rgba(212, 175, 55, 0.2),
+            inset 0 1px 0 rgba(255, 255, 255, 0.2),
+            inset 0 -1px 0 rgba(0, 0, 0, 0.3) !important;
+    }
+    
+    /* Botão ativo na sidebar com efeito 3D dourado */
+    .stSidebar .stButton > button[kind="primary"] {
+        background: linear-gradient(145deg, var(--primary-gold), var(--secondary-gold)) !important;
+        color: white !important;
+        border: none !important;
+        font-weight: 600 !important;
+        transform: translateX(5px) !important;
+        box-shadow: 
+            0 6px 16px rgba(212, 175, 55, 0.5),
+            0 2px 8px rgba(0, 0, 0, 0.3),
+            inset 0 1px 0 rgba(255, 255, 255, 0.3),
+            inset 0 -1px 0 rgba(184, 134, 11, 0.8) !important;
+    }
+    
+    /* Botões não-selecionados com efeito 3D suave */
+    .stSidebar .stButton > button:not([kind="primary"]):not(:hover) {
+        background: linear-gradient(145deg, rgba(26, 37, 47, 0.7), rgba(15, 25, 35, 0.8)) !important;
+        border-color: rgba(255, 255, 255, 0.08) !important;
+        color: rgba(255, 255, 255, 0.75) !important;
+        box-shadow: 
+            0 2px 6px rgba(0, 0, 0, 0.25),
+            inset 0 1px 0 rgba(255, 255, 255, 0.08),
+            inset 0 -1px 0 rgba(0, 0, 0, 0.15) !important;
+    }
+    
+    /* Melhorar contraste dos textos na sidebar */
+    .stSidebar .stMarkdown h1, .stSidebar .stMarkdown h2, .stSidebar .stMarkdown h3 {
+        color: var(--primary-gold) !important;
+        text-shadow: 0 1px 3px rgba(0, 0, 0, 0.3) !important;
+    }
+    
+    /* Texto da navegação mais visível */
+    .stSidebar .stMarkdown p, .stSidebar .stText {
+        color: rgba(255, 255, 255, 0.9) !important;
+        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.2) !important;
+    }
+    
+    /* Botões primários com efeito 3D premium */
+    .stButton > button[kind="primary"] {
+        background: linear-gradient(145deg, var(--primary-gold) 0%, var(--secondary-gold) 100%) !important;
+        border: none !important;
+        color: white !important;
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 600 !important;
+        border-radius: 12px !important;
+        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275) !important;
+        padding: 0.6rem 1.5rem !important;
+        text-shadow: 0 1px 3px rgba(0, 0, 0, 0.4) !important;
+        box-shadow: 
+            0 6px 16px rgba(212, 175, 55, 0.4),
+            0 2px 8px rgba(0, 0, 0, 0.25),
+            inset 0 1px 0 rgba(255, 255, 255, 0.3),
+            inset 0 -1px 0 rgba(184, 134, 11, 0.8) !important;
+        position: relative !important;
+    }
+    
+    .stButton > button[kind="primary"]:hover {
+        background: linear-gradient(145deg, var(--secondary-gold) 0%, var(--primary-gold) 100%) !important;
+        transform: translateY(-3px) scale(1.02) !important;
+        box-shadow: 
+            0 10px 25px rgba(212, 175, 55, 0.5),
+            0 4px 15px rgba(0, 0, 0, 0.3),
+            inset 0 1px 0 rgba(255, 255, 255, 0.4),
+            inset 0 -1px 0 rgba(184, 134, 11, 0.9) !important;
+    }
+    
+    /* Botões secundários com efeito 3D suave */
+    .stButton > button[kind="secondary"] {
+        background: linear-gradient(145deg, rgba(255, 255, 255, 0.95), rgba(245, 242, 235, 0.9)) !important;
+        backdrop-filter: blur(15px) !important;
+        border: 2px solid var(--soft-brown) !important;
+        color: var(--text-secondary) !important;
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+        border-radius: 12px !important;
+        transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275) !important;
+        padding: 0.6rem 1.5rem !important;
+        box-shadow: 
+            0 4px 12px rgba(139, 115, 85, 0.2),
+            0 1px 4px rgba(0, 0, 0, 0.1),
+            inset 0 1px 0 rgba(255, 255, 255, 0.8),
+            inset 0 -1px 0 rgba(139, 115, 85, 0.2) !important;
+        position: relative !important;
+    }
+    
+    .stButton > button[kind="secondary"]:hover {
+        background: linear-gradient(135deg, var(--olive-brown) 0%, var(--dark-brown) 100%) !important;
+        color: white !important;
+        box-shadow: 0 6px 20px rgba(133, 115, 75, 0.3) !important;
+        transform: translateY(-2px) !important;
+    }
+    
+    /* Botões normais com design sofisticado */
+    .stButton > button {
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+        font-size: 14px !important;
+        border-radius: 10px !important;
+        border: 1px solid rgba(189, 154, 110, 0.3) !important;
+        color: var(--dark-brown) !important;
+        background: rgba(255, 255, 255, 0.8) !important;
+        backdrop-filter: blur(5px) !important;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1) !important;
+        transition: all 0.3s ease !important;
+        padding: 0.5rem 1.2rem !important;
+    }
+    
+    .stButton > button:hover {
+        background: linear-gradient(135deg, var(--primary-gold) 0%, var(--secondary-gold) 100%) !important;
+        color: white !important;
+        border-color: transparent !important;
+        box-shadow: 0 4px 15px rgba(189, 154, 110, 0.3) !important;
+        transform: translateY(-1px) !important;
+    }
+    
+    /* Inputs suaves com fundo creme */
+    .stTextInput > div > div > input,
+    .stNumberInput > div > div > input,
+    .stSelectbox > div > div > select,
+    .stTextArea > div > div > textarea {
+        font-family: 'Inter', sans-serif !important;
+        font-size: 14px !important;
+        line-height: 1.5 !important;
+        border: 2px solid rgba(212, 175, 55, 0.2) !important;
+        border-radius: 8px !important;
+        background: var(--background-primary) !important;
+        color: var(--text-primary) !important;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05) !important;
+        transition: all 0.3s ease !important;
+        padding: 0.75rem 1rem !important;
+    }
+    
+    .stTextInput > div > div > input:focus,
+    .stNumberInput > div > div > input:focus,
+    .stSelectbox > div > div > select:focus,
+    .stTextArea > div > div > textarea:focus {
+        border-color: var(--primary-gold) !important;
+        box-shadow: 0 0 0 3px rgba(212, 175, 55, 0.15), 0 4px 12px rgba(0, 0, 0, 0.1) !important;
+        background: #ffffff !important;
+        outline: none !important;
+    }
+    
+    /* Labels dos inputs */
+    .stTextInput > label,
+    .stNumberInput > label,
+    .stSelectbox > label,
+    .stMultiSelect > label,
+    .stTextArea > label {
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+        font-size: 14px !important;
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Abas suaves com design harmonioso */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 4px;
+        background: var(--warm-cream) !important;
+        border-radius: 12px !important;
+        padding: 4px !important;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1) !important;
+        border: 1px solid rgba(212, 175, 55, 0.1) !important;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        background: transparent !important;
+        color: var(--text-secondary) !important;
+        border-radius: 8px !important;
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+        padding: 0.75rem 1.5rem !important;
+        margin: 0 !important;
+        border: none !important;
+        transition: all 0.3s ease !important;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, var(--primary-gold) 0%, var(--secondary-gold) 100%) !important;
+        color: white !important;
+        box-shadow: 0 2px 8px rgba(212, 175, 55, 0.3) !important;
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover:not([aria-selected="true"]) {
+        background: rgba(212, 175, 55, 0.1) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Alertas com cores da paleta */
+    .stAlert {
+        border-radius: 8px !important;
+        font-family: 'Inter', sans-serif !important;
+    }
+    
+    .stSuccess {
+        background-color: rgba(189, 154, 110, 0.1) !important;
+        border: 1px solid var(--primary-gold) !important;
+        color: var(--dark-brown) !important;
+    }
+    
+    .stWarning {
+        background-color: rgba(133, 115, 75, 0.1) !important;
+        border: 1px solid var(--olive-brown) !important;
+        color: var(--dark-brown) !important;
+    }
+    
+    .stError {
+        background-color: rgba(122, 64, 34, 0.1) !important;
+        border: 1px solid var(--dark-brown) !important;
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Remover todas as cores vermelhas/rosas do sistema */
+    div[data-testid="stMarkdownContainer"] > div > p > strong {
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Progress indicator da navegação */
+    .stProgress {
+        background-color: var(--olive-brown) !important;
+    }
+    
+    /* Remover cor vermelha de elementos específicos */
+    .css-1544g2n, .css-1d391kg .css-1544g2n {
+        color: var(--primary-gold) !important;
+    }
+    
+    /* Substituir qualquer vermelho por cores da paleta */
+    [style*="color: red"], [style*="color: #ff"], [style*="color: rgb(255"] {
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Seletores específicos para remover vermelho */
+    .stSelectbox > div > div > div {
+        color: var(--dark-gray) !important;
+    }
+    
+    /* Info boxes */
+    .stInfo {
+        background-color: rgba(171, 140, 110, 0.1) !important;
+        border: 1px solid var(--secondary-gold) !important;
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Métricas elegantes com glassmorphism */
+    [data-testid="metric-container"] {
+        font-family: 'Inter', sans-serif !important;
+        background: linear-gradient(135deg, var(--primary-gold), var(--secondary-gold)) !important;
+        color: white !important;
+        padding: 1.5rem !important;
+        border-radius: 16px !important;
+        box-shadow: 0 8px 32px rgba(189, 154, 110, 0.3) !important;
+        backdrop-filter: blur(10px) !important;
+        border: 1px solid rgba(255, 255, 255, 0.2) !important;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        position: relative !important;
+        overflow: hidden !important;
+    }
+    
+    [data-testid="metric-container"]:hover {
+        transform: translateY(-2px) !important;
+        box-shadow: 0 12px 40px rgba(189, 154, 110, 0.4) !important;
+    }
+    
+    [data-testid="metric-container"]::before {
+        content: '' !important;
+        position: absolute !important;
+        top: 0 !important;
+        left: 0 !important;
+        right: 0 !important;
+        height: 1px !important;
+        background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.4), transparent) !important;
+    }
+    
+    /* Expander elegante com glassmorphism */
+    .streamlit-expanderHeader {
+        background: linear-gradient(135deg, var(--secondary-gold) 0%, var(--olive-brown) 100%) !important;
+        color: white !important;
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+        border-radius: 12px !important;
+        box-shadow: 0 4px 15px rgba(171, 140, 110, 0.3) !important;
+        border: 1px solid rgba(255, 255, 255, 0.2) !important;
+        backdrop-filter: blur(10px) !important;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        padding: 1rem 1.5rem !important;
+        margin-bottom: 0.5rem !important;
+    }
+    
+    .streamlit-expanderHeader:hover {
+        background: linear-gradient(135deg, var(--primary-gold) 0%, var(--secondary-gold) 100%) !important;
+        box-shadow: 0 6px 20px rgba(189, 154, 110, 0.4) !important;
+        transform: translateY(-1px) !important;
+    }
+    
+    .streamlit-expanderContent {
+        background: rgba(255, 255, 255, 0.05) !important;
+        backdrop-filter: blur(10px) !important;
+        border-radius: 0 0 12px 12px !important;
+        border: 1px solid rgba(189, 154, 110, 0.1) !important;
+        border-top: none !important;
+        padding: 1.5rem !important;
+        margin-top: -0.5rem !important;
+    }
+    
+    /* Progress bar elegante */
+    .stProgress > div > div > div {
+        background: linear-gradient(90deg, var(--primary-gold), var(--secondary-gold)) !important;
+        border-radius: 10px !important;
+        box-shadow: 0 2px 8px rgba(189, 154, 110, 0.3) !important;
+    }
+    
+    .stProgress > div > div {
+        background-color: rgba(189, 154, 110, 0.1) !important;
+        border-radius: 10px !important;
+        backdrop-filter: blur(5px) !important;
+    }
+    
+    /* Multiselect elegante */
+    .stMultiSelect > div > div {
+        border: 2px solid rgba(189, 154, 110, 0.3) !important;
+        border-radius: 12px !important;
+        background: rgba(255, 255, 255, 0.8) !important;
+        backdrop-filter: blur(10px) !important;
+        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.05) !important;
+        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
+    }
+    
+    .stMultiSelect > div > div:focus-within {
+        border-color: var(--primary-gold) !important;
+        box-shadow: 0 0 0 3px rgba(189, 154, 110, 0.2), 0 8px 25px rgba(0, 0, 0, 0.1) !important;
+        background: rgba(255, 255, 255, 0.95) !important;
+        transform: translateY(-1px) !important;
+    }
+    
+    /* Botão de lixeira elegante com gradiente vermelho e efeito 3D - múltiplos seletores */
+    button[data-testid*="del_"],
+    button[key*="del_"],
+    .stButton > button:has-text("🗑️"),
+    .stButton > button[title*="Excluir"],
+    .stButton button:contains("🗑️") {
+        background: linear-gradient(135deg, #ff4757 0%, #ff3838 50%, #c44569 100%) !important;
+        color: white !important;
+        border: 2px solid #ff6b7a !important;
+        border-radius: 15px !important;
+        font-size: 1.4rem !important;
+        font-weight: 700 !important;
+        padding: 0.8rem 1.2rem !important;
+        box-shadow: 
+            0 8px 25px rgba(255, 71, 87, 0.4),
+            inset 0 2px 0 rgba(255, 255, 255, 0.3),
+            0 0 0 0 rgba(255, 71, 87, 0) !important;
+        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        position: relative !important;
+        overflow: hidden !important;
+        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3) !important;
+        cursor: pointer !important;
+    }
+    
+    button[data-testid*="del_"]:hover,
+    button[key*="del_"]:hover,
+    .stButton > button:has-text("🗑️"):hover,
+    .stButton > button[title*="Excluir"]:hover,
+    .stButton button:contains("🗑️"):hover {
+        background: linear-gradient(135deg, #ff3838 0%, #ff2f2f 50%, #b73e56 100%) !important;
+        border-color: #ff5757 !important;
+        transform: translateY(-3px) scale(1.05) !important;
+        box-shadow: 
+            0 12px 35px rgba(255, 71, 87, 0.6),
+            inset 0 2px 0 rgba(255, 255, 255, 0.4),
+            0 0 0 3px rgba(255, 71, 87, 0.3) !important;
+        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.4) !important;
+    }
+    
+    button[data-testid*="del_"]:active,
+    button[key*="del_"]:active,
+    .stButton > button:has-text("🗑️"):active,
+    .stButton > button[title*="Excluir"]:active,
+    .stButton button:contains("🗑️"):active {
+        transform: translateY(-1px) scale(0.98) !important;
+        box-shadow: 
+            0 6px 20px rgba(255, 71, 87, 0.7),
+            inset 0 3px 8px rgba(0, 0, 0, 0.3) !important;
+    }
+    
+    /* Fallback para todos os botões na coluna da lixeira */
+    .stColumns > div:last-child .stButton > button {
+        background: linear-gradient(135deg, #ff4757 0%, #ff3838 50%, #c44569 100%) !important;
+        color: white !important;
+        border: 2px solid #ff6b7a !important;
+        border-radius: 15px !important;
+        font-size: 1.4rem !important;
+        font-weight: 700 !important;
+        padding: 0.8rem 1.2rem !important;
+        box-shadow: 
+            0 8px 25px rgba(255, 71, 87, 0.4),
+            inset 0 2px 0 rgba(255, 255, 255, 0.3) !important;
+        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
+        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3) !important;
+    }
+    
+    .stColumns > div:last-child .stButton > button:hover {
+        background: linear-gradient(135deg, #ff3838 0%, #ff2f2f 50%, #b73e56 100%) !important;
+        transform: translateY(-3px) scale(1.05) !important;
+        box-shadow: 
+            0 12px 35px rgba(255, 71, 87, 0.6),
+            inset 0 2px 0 rgba(255, 255, 255, 0.4),
+            0 0 0 3px rgba(255, 71, 87, 0.3) !important;
+    }
+    
+    /* Containers principais com fundo suave */
+    .main > div {
+        background: var(--background-primary) !important;
+        border-radius: 12px !important;
+        border: 1px solid rgba(212, 175, 55, 0.1) !important;
+        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.08) !important;
+        margin: 1rem !important;
+        padding: 2rem !important;
+    }
+    
+    /* Cards com efeito de elevação */
+    .element-container {
+        transition: all 0.3s ease !important;
+    }
+    
+    .element-container:hover {
+        transform: translateY(-2px) !important;
+    }
+    
+    /* Checkboxes e radio buttons */
+    .stCheckbox > label, .stRadio > label {
+        color: var(--dark-brown) !important;
+        font-family: 'Inter', sans-serif !important;
+        font-weight: 500 !important;
+    }
+    
+    /* Eliminar completamente qualquer cor vermelha/rosa */
+    * {
+        color: inherit !important;
+    }
+    
+    /* Forçar cores da paleta em elementos problemáticos */
+    .css-1629p8f, .css-1629p8f *, 
+    .css-10trblm, .css-10trblm *,
+    .css-1aumxhk, .css-1aumxhk * {
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Navigation e progresso */
+    .css-1vbkxwb, .css-1vbkxwb * {
+        color: var(--primary-gold) !important;
+    }
+    
+    /* Remover bordas vermelhas de qualquer elemento */
+    * {
+        border-color: inherit !important;
+    }
+    
+    /* Sobrescrever qualquer cor de fundo vermelha */
+    div[style*="background-color: red"], 
+    div[style*="background-color: #ff"],
+    div[style*="background: red"],
+    div[style*="background: #ff"] {
+        background-color: var(--secondary-gold) !important;
+    }
+    
+    /* Tags específicas que podem ter cor vermelha */
+    .stTag, .css-16huue1, .css-1cpxqw2 {
+        background-color: var(--olive-brown) !important;
+        color: white !important;
+        border: 1px solid var(--olive-brown) !important;
+    }
+    
+    /* Seletores de cores do multiselect */
+    .stMultiSelect span[data-baseweb="tag"] {
+        background-color: var(--secondary-gold) !important;
+        color: white !important;
+    }
+    
+    /* Links */
+    a, a:visited, a:hover, a:active {
+        color: var(--primary-gold) !important;
+    }
+    
+    /* Headers específicos */
+    .css-1avcm0n, .css-1avcm0n * {
+        color: var(--dark-brown) !important;
+    }
+    
+    /* Expanders */
+    .streamlit-expanderHeader {
+        font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+        font-weight: 500 !important;
+        font-size: 14px !important;
+    }
+    
+    /* Alertas e notificações */
+    .stAlert {
+        font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+        line-height: 1.5 !important;
+    }
+    
+    /* Tabelas */
+    .stDataFrame {
+        font-family: 'Inter', 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif !important;
+        font-size: 13px !important;
+    }
+    
+    /* Código e texto monospace */
+    code, pre {
+        font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Roboto Mono', monospace !important;
+    }
+    </style>
+    """
+
+
+def apply_base_style():
+    """Send the readable-font stylesheet (must follow st.set_page_config)"""
+    st.markdown(BASE_CSS, unsafe_allow_html=True)
+
+
+def apply_theme():
+    """Send the color palette, sidebar and button stylesheet"""
+    st.markdown(THEME_CSS, unsafe_allow_html=True)
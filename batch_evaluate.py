@@ -0,0 +1,220 @@
+"""
+Avaliação em Lote de Planos Salvos (sem Streamlit)
+Carrega um ou vários planos JSON (saved_plans/ ou pastas de usuários), calcula
+DRE, projeção, viabilidade por cenário e riscos, e grava um resumo CSV/Parquet
+
+Uso:
+    python batch_evaluate.py saved_plans/ dados_usuarios/ -o resumo.csv --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dre_generator import DREGenerator
+from financial_projection import FinancialProjection
+from scenario_cube import ScenarioCube
+
+# Arquivos JSON que não são planos de negócio
+IGNORED_FILES = {'users_database.json'}
+
+
+def find_plan_files(paths):
+    """JSON plan files under the given files/folders (folders are searched recursively)"""
+    arquivos = []
+    for caminho in paths:
+        if os.path.isdir(caminho):
+            for pasta, _, nomes in os.walk(caminho):
+                arquivos.extend(
+                    os.path.join(pasta, nome) for nome in sorted(nomes)
+                    if nome.endswith('.json') and nome not in IGNORED_FILES
+                )
+        elif caminho.endswith('.json'):
+            arquivos.append(caminho)
+    return sorted(set(arquivos))
+
+
+def load_plan(path):
+    """Plan name, business data and uploaded files from a saved plan or a user business_data.json"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError("Arquivo não contém um plano de negócio")
+
+    if 'business_data' in data:
+        # Formato de saved_plans/ (save_business_plan)
+        nome = data.get('plan_name') or os.path.splitext(os.path.basename(path))[0]
+        return nome, data.get('business_data') or {}, data.get('uploaded_files') or {}
+
+    # Formato das pastas de usuário (business_data.json com os dados direto na raiz)
+    return os.path.basename(os.path.dirname(path)) or path, data, {}
+
+
+def annual_fixed_costs(business_data):
+    """Annual fixed costs used by the step 12 risk analysis"""
+    data = business_data
+    return (
+        data.get('aluguel', 3000) + data.get('total_folha_salarios', 4500) +
+        800 +  # despesas gerais (valor padrão da Etapa 12)
+        data.get('outros_fixos', 500)
+    ) * 12
+
+
+def monte_carlo_draws(business_data, receita_anual, investimento_total, simulacoes=1000, seed=0):
+    """Monte Carlo draws of annual revenue, variable cost share, fixed costs and profit (step 12)"""
+    volatilidade = business_data.get('volatilidade_demanda', 20.0) / 100
+    custos_fixos_anual = annual_fixed_costs(business_data)
+
+    rng = np.random.default_rng(seed)
+    receitas = np.maximum(rng.normal(receita_anual, receita_anual * volatilidade, simulacoes), receita_anual * 0.3)
+    custos_variaveis = np.clip(rng.normal(0.56, 0.05, simulacoes), 0.4, 0.7)
+    custos_fixos = rng.normal(custos_fixos_anual, custos_fixos_anual * 0.1, simulacoes)
+    lucros = receitas * (1 - custos_variaveis) - custos_fixos - investimento_total * 0.05
+
+    return {
+        'receita': receitas,
+        'custos_variaveis_percentual': custos_variaveis,
+        'custos_fixos': custos_fixos,
+        'lucro': lucros
+    }
+
+
+def risk_metrics(business_data, receita_anual, lucro_operacional, investimento_total, simulacoes=1000, seed=0):
+    """Risk matrix and Monte Carlo indicators with the same assumptions as step 12"""
+    data = business_data
+    volatilidade = data.get('volatilidade_demanda', 20.0) / 100
+
+    risco_concorrencia = data.get('impacto_concorrencia', 15.0) / 100 * data.get('prob_concorrencia', 30.0) / 100 * receita_anual
+    custos_fixos_anual = annual_fixed_costs(data)
+    impacto_inflacao = custos_fixos_anual * data.get('inflacao_custos', 8.0) / 100
+    perda_inadimplencia = receita_anual * data.get('taxa_inadimplencia', 3.0) / 100
+    risco_total = risco_concorrencia + impacto_inflacao + perda_inadimplencia
+
+    lucros = monte_carlo_draws(data, receita_anual, investimento_total, simulacoes, seed)['lucro']
+
+    return {
+        'var_5_receita': receita_anual * volatilidade * 1.645,
+        'risco_total_anual': risco_total,
+        'roi_ajustado_risco': (lucro_operacional - risco_total) / investimento_total * 100 if investimento_total > 0 else 0,
+        'mc_lucro_medio': float(lucros.mean()),
+        'mc_lucro_p5': float(np.percentile(lucros, 5)),
+        'mc_lucro_p95': float(np.percentile(lucros, 95)),
+        'mc_prob_prejuizo': float((lucros < 0).mean() * 100),
+        'mc_prob_roi_15': float((lucros / investimento_total > 0.15).mean() * 100) if investimento_total > 0 else 0.0
+    }
+
+
+def plan_seed(path, seed=0):
+    """Monte Carlo seed of a plan file (stable across runs and worker processes)"""
+    # Caminho relativo: os business_data.json de usuários diferentes têm o mesmo nome de arquivo
+    relativo = os.path.relpath(path).replace(os.sep, '/')
+    return seed + zlib.crc32(relativo.encode('utf-8'))
+
+
+def evaluate_plan(path, simulacoes=1000, seed=0):
+    """One summary row (flat dict) for a plan file; errors are reported in the 'erro' column"""
+    linha = {'arquivo': path}
+    try:
+        nome, business_data, uploaded_files = load_plan(path)
+        linha['plano'] = nome
+        linha['otica'] = business_data.get('nome_otica', '')
+        linha['cidade'] = business_data.get('cidade', '')
+        linha['estado'] = business_data.get('estado', '')
+        linha['regime_tributario'] = business_data.get('tipo_empresa', '')  # Regime salvo na Etapa 1
+
+        # DRE mensal (mesmo gerador do relatório)
+        dre = DREGenerator().generate_dre(business_data, uploaded_files)
+        for chave in ('receita_bruta', 'impostos', 'cmv', 'lucro_bruto', 'custos_fixos', 'custos_pessoal', 'lucro_liquido'):
+            linha[f'dre_{chave}'] = dre.get(chave, 0)
+
+        # Projeção da Etapa 10 (12 meses)
+        projecao = FinancialProjection(business_data)
+        resumo = projecao.summarize(12)
+        entradas = projecao.get_inputs()
+        investimento_total = entradas['investimento_total']
+        linha['ticket_medio'] = entradas['ticket_medio']
+        linha['investimento_total'] = investimento_total
+        linha.update({chave: resumo[chave] for chave in (
+            'receita_anual', 'lucro_operacional', 'margem_operacional', 'roi_anual',
+            'payback_meses', 'ponto_equilibrio_valor'
+        )})
+
+        # Viabilidade por cenário (Etapa 11)
+        cubo = ScenarioCube(business_data)
+        for cenario in cubo.summary_table():
+            linha[f"roi_{cenario['cenario']}"] = cenario['roi']
+            linha[f"lucro_{cenario['cenario']}"] = cenario['lucro_operacional']
+
+        # Riscos (Etapa 12): mesma base de receita/lucro salva pela Etapa 10, quando existir
+        receita_anual = business_data.get('receita_anual', resumo['receita_anual'])
+        lucro_operacional = business_data.get('lucro_operacional', resumo['lucro_operacional'])
+        semente = plan_seed(path, seed)
+        linha.update(risk_metrics(business_data, receita_anual, lucro_operacional, investimento_total, simulacoes, semente))
+        linha['erro'] = ''
+    except Exception as e:
+        linha['erro'] = f"{type(e).__name__}: {e}"
+    return linha
+
+
+def evaluate_files(arquivos, workers=None, simulacoes=1000, seed=0):
+    """Summary rows for a list of plan files (process pool when workers > 1)"""
+    if not arquivos:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(arquivos) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(arquivos))) as pool:
+            linhas = list(pool.map(
+                evaluate_plan, arquivos, [simulacoes] * len(arquivos), [seed] * len(arquivos),
+                chunksize=max(1, len(arquivos) // (workers * 4))
+            ))
+    else:
+        linhas = [evaluate_plan(arquivo, simulacoes, seed) for arquivo in arquivos]
+    return linhas
+
+
+def evaluate_plans(paths, workers=None, simulacoes=1000, seed=0):
+    """Summary DataFrame for every plan file under the given paths"""
+    return pd.DataFrame(evaluate_files(find_plan_files(paths), workers, simulacoes, seed))
+
+
+def write_summary(df, output):
+    """Write the summary as CSV or Parquet (by file extension)"""
+    if output.endswith('.parquet'):
+        try:
+            df.to_parquet(output, index=False)
+        except ImportError:
+            raise SystemExit("Saída Parquet requer pyarrow (pip install pyarrow) - use .csv")
+    else:
+        df.to_csv(output, index=False, encoding='utf-8-sig')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Avalia planos de negócio salvos sem abrir o Streamlit")
+    parser.add_argument('paths', nargs='*', default=['saved_plans'], help="Arquivos .json ou pastas com planos")
+    parser.add_argument('-o', '--output', default='resumo_planos.csv', help="Arquivo de saída (.csv ou .parquet)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Processos em paralelo (padrão: núcleos da CPU)")
+    parser.add_argument('--simulacoes', type=int, default=1000, help="Simulações Monte Carlo por plano")
+    parser.add_argument('--seed', type=int, default=0, help="Semente base das simulações")
+    args = parser.parse_args(argv)
+
+    df = evaluate_plans(args.paths, args.workers, args.simulacoes, args.seed)
+    if df.empty:
+        print("Nenhum plano encontrado", file=sys.stderr)
+        return 1
+
+    write_summary(df, args.output)
+    erros = int((df['erro'] != '').sum())
+    print(f"{len(df)} planos avaliados ({erros} com erro) -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Benchmark da Formatação Brasileira
+Compara o formato antigo (três str.replace encadeados por valor) com o
+caminho escalar e o caminho vetorizado do br_format
+
+Uso: python benchmarks/bench_br_format.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from br_format import format_currency, format_currency_values  # noqa: E402
+
+
+def legacy_format_currency(value):
+    """Formato usado antes em main.py e nos geradores de relatório"""
+    if value == 0:
+        return "R$ 0,00"
+    return f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def run(n_values=10000, repeat=5):
+    """Best time (seconds) of each approach formatting n_values numbers"""
+    valores = np.random.default_rng(42).uniform(-50000, 500000, n_values)
+    lista = valores.tolist()
+
+    # Sanidade: mesmos textos nos três caminhos
+    assert [legacy_format_currency(v) for v in lista[:100]] == [format_currency(v) for v in lista[:100]]
+    assert list(format_currency_values(valores[:100])) == [format_currency(v) for v in lista[:100]]
+
+    casos = {
+        'legado_replace': lambda: [legacy_format_currency(v) for v in lista],
+        'escalar': lambda: [format_currency(v) for v in lista],
+        'vetorizado': lambda: format_currency_values(valores)
+    }
+    return {nome: min(timeit.repeat(func, number=1, repeat=repeat)) for nome, func in casos.items()}
+
+
+if __name__ == '__main__':
+    resultados = run()
+    base = resultados['legado_replace']
+    for nome, segundos in resultados.items():
+        print(f"{nome:16s} {segundos * 1000:8.2f} ms  ({base / segundos:4.2f}x)")
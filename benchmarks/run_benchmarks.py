@@ -0,0 +1,266 @@
+"""
+Suíte de Benchmarks dos Calculadores e Geradores
+Mede TaxCalculator, LaborCalculator, DREGenerator, análise da Etapa 10,
+sugestão de preços de lentes, geradores de PDF e planilha XLSX em planos sintéticos
+pequeno/médio/grande, e grava os tempos em JSON para comparar entre commits
+
+Cada caso é medido a frio (caches de gráficos, seções do relatório e cubo de
+cenários esvaziados antes de cada chamada) e a quente (caches já preenchidos):
+regressões de renderização e montagem aparecem no tempo a frio
+
+Uso:
+    python benchmarks/run_benchmarks.py                       # grava benchmarks/results/<commit>.json
+    python benchmarks/run_benchmarks.py --filtro dre --tamanhos pequeno
+    python benchmarks/run_benchmarks.py --comparar benchmarks/results/abc1234.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import investor_sections  # noqa: E402
+import scenario_cube  # noqa: E402
+from br_format import format_currency_values  # noqa: E402
+from chart_service import get_chart_service  # noqa: E402
+from dre_generator import DREGenerator  # noqa: E402
+from integrated_cost_analyzer_step10 import IntegratedCostAnalyzerStep10  # noqa: E402
+from investor_report_generator import InvestorReportGenerator  # noqa: E402
+from labor_calculator import LaborCalculator  # noqa: E402
+from multilingual_pdf_generator import MultilingualInvestorPDFGenerator  # noqa: E402
+from pdf_generator import PDFGenerator  # noqa: E402
+from pricing_suggestions import LensPricingSuggestions  # noqa: E402
+from structured_investor_report import StructuredInvestorReport  # noqa: E402
+from tax_calculator import TaxCalculator  # noqa: E402
+from xlsx_export import WorkbookExporter  # noqa: E402
+
+RESULTS_DIR = os.path.join(RAIZ, 'benchmarks', 'results')
+
+# Dimensões de cada plano sintético
+SIZES = {
+    'pequeno': {'funcionarios': 3, 'cenarios': 3, 'receitas': 12, 'lojas': 1, 'valores': 1000},
+    'medio': {'funcionarios': 15, 'cenarios': 12, 'receitas': 120, 'lojas': 3, 'valores': 10000},
+    'grande': {'funcionarios': 80, 'cenarios': 60, 'receitas': 1200, 'lojas': 10, 'valores': 100000}
+}
+
+CARGOS = ['Vendedor', 'Gerente', 'Optometrista', 'Auxiliar administrativo', 'Técnico em lentes']
+
+
+def synthetic_plan(tamanho):
+    """Business data, uploaded files and sizing for a synthetic plan (same seed every run)"""
+    dims = SIZES[tamanho]
+    rng = np.random.default_rng(2024)
+    lojas = dims['lojas']
+
+    business_data = {
+        'nome_otica': f'Ótica Benchmark {tamanho.title()}',
+        'cidade': 'São Paulo',
+        'estado': 'SP',
+        'regime_tributario': 'Simples Nacional',
+        'ticket_medio': 450,
+        'vendas_mes': 80 * lojas,
+        'oculos_meta_mes': 40 * lojas,
+        'vendas_mes_1': 25000 * lojas,
+        'crescimento_mensal': 2.0,
+        'aluguel': 3500 * lojas,
+        'salarios_clt': 9000 * lojas,
+        'total_folha_salarios': 9000 * lojas,
+        'outros_fixos': 600 * lojas,
+        'energia_agua': 450 * lojas,
+        'telefone_internet': 200 * lojas,
+        'orcamento_marketing': 1200 * lojas,
+        'contabilidade': 600,
+        'investimento_total': 90000 * lojas,
+        'percentual_avista': 60,
+        'taxa_mercado_pago': 4.3
+    }
+
+    funcionarios = pd.DataFrame({
+        'Cargo': [CARGOS[i % len(CARGOS)] for i in range(dims['funcionarios'])],
+        'Quantidade': rng.integers(1, 4, dims['funcionarios']),
+        'Salário Base (R$)': rng.uniform(1500, 6000, dims['funcionarios']).round(2),
+        'Encargos (%)': rng.choice([0.0, 5.0, 10.0], dims['funcionarios'])
+    })
+
+    cenarios = [
+        {
+            'name': f'Cenário {i + 1}',
+            'num_lojas': 1 + i % lojas,
+            'ticket_medio': 300 + 10 * i,
+            'margem_esperada': 50 + i % 20
+        }
+        for i in range(dims['cenarios'])
+    ]
+
+    financial_data = {
+        'oculos_meta': business_data['oculos_meta_mes'],
+        'ticket_medio': business_data['ticket_medio'],
+        'aluguel': business_data['aluguel'],
+        'folha_clt': business_data['salarios_clt'],
+        'combustivel': 300 * lojas,
+        'energia_agua': business_data['energia_agua'],
+        'material_escritorio': 150 * lojas,
+        'telefone_internet': business_data['telefone_internet'],
+        'limpeza_seguranca': 250 * lojas,
+        'manutencao_equipamentos': 200 * lojas,
+        'marketing_publicidade': business_data['orcamento_marketing'],
+        'contabilidade': business_data['contabilidade'],
+        'servicos_profissionais': 400 * lojas,
+        'seguros_manutencao': 150 * lojas
+    }
+
+    return {
+        'business_data': business_data,
+        'uploaded_files': {'funcionarios': funcionarios},
+        'funcionarios': funcionarios,
+        'cenarios': cenarios,
+        'financial_data': financial_data,
+        'receitas': rng.uniform(50000, 4500000, dims['receitas']),
+        'valores': rng.uniform(-50000, 500000, dims['valores']),
+        'incluir_acessorios': tamanho != 'pequeno'
+    }
+
+
+def build_cases(plano):
+    """{benchmark: zero-argument callable} for one synthetic plan"""
+    bd = plano['business_data']
+    arquivos = plano['uploaded_files']
+    dre = DREGenerator().generate_dre(bd, arquivos)
+
+    tax = TaxCalculator()
+    labor = LaborCalculator()
+    dre_generator = DREGenerator()
+    analyzer = IntegratedCostAnalyzerStep10()
+    pricing = LensPricingSuggestions()
+
+    return {
+        'tax.compare_tax_regimes': lambda: [tax.compare_tax_regimes(r) for r in plano['receitas']],
+        'labor.calculate_total_labor_costs': lambda: labor.calculate_total_labor_costs(plano['funcionarios']),
+        'dre.generate_dre': lambda: dre_generator.generate_dre(bd, arquivos),
+        'dre.generate_comparative_dre': lambda: dre_generator.generate_comparative_dre(bd, arquivos, plano['cenarios']),
+        'step10.generate_complete_analysis': lambda: analyzer.generate_complete_analysis_step10(
+            plano['financial_data'], business_data=bd),
+        'pricing.gerar_tabela_completa': lambda: pricing.gerar_tabela_completa(
+            incluir_acessorios=plano['incluir_acessorios']),
+        'br_format.format_currency_values': lambda: format_currency_values(plano['valores']),
+        'pdf.business_plan_report': lambda: PDFGenerator().generate_business_plan_report(bd, dre),
+        'pdf.pdf_with_charts': lambda: PDFGenerator().generate_pdf_with_charts(bd, dre),
+        'pdf.investor_report_text': lambda: InvestorReportGenerator().generate_investor_report(bd),
+        'pdf.multilingual_investor': lambda: MultilingualInvestorPDFGenerator().generate_investor_report_pdf(bd, 'pt'),
+        'pdf.structured_investor': lambda: StructuredInvestorReport().generate_structured_report(bd, 'pt'),
+        'xlsx.workbook': lambda: WorkbookExporter().generate_workbook(bd)
+    }
+
+
+def clear_caches():
+    """Empty the per-plan caches (charts, investor sections, scenario cubes)"""
+    get_chart_service().clear()
+    investor_sections._SECTIONS_CACHE.clear()
+    scenario_cube._CUBE_CACHE.clear()
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Cold and warm time per call (ms): best and median of each
+
+    Cold samples run one call right after clear_caches(); warm samples call often
+    enough to fill min_time per sample, so they mostly hit the caches
+    """
+    frio = np.array(timeit.Timer(func, setup=clear_caches).repeat(repeat=repeat, number=1)) * 1000
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    quente = np.array(timer.repeat(repeat=repeat, number=number)) / number * 1000
+    return {
+        'frio_min_ms': float(frio.min()),
+        'frio_mediana_ms': float(np.median(frio)),
+        'min_ms': float(quente.min()),
+        'mediana_ms': float(np.median(quente)),
+        'chamadas': number,
+        'repeticoes': repeat
+    }
+
+
+def git_commit():
+    """Short hash of the checked-out commit ('local' outside a git checkout)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'local'
+
+
+def run(tamanhos=tuple(SIZES), filtro='', repeat=5):
+    """Benchmark results {benchmark: {tamanho: medidas}}"""
+    resultados = {}
+    for tamanho in tamanhos:
+        casos = build_cases(synthetic_plan(tamanho))
+        for nome, func in casos.items():
+            if filtro and filtro not in nome:
+                continue
+            medidas = measure(func, repeat)
+            resultados.setdefault(nome, {})[tamanho] = medidas
+            print(f"{nome:36s} {tamanho:8s} frio {medidas['frio_min_ms']:10.3f} ms   quente {medidas['min_ms']:10.3f} ms")
+    return resultados
+
+
+def compare(atual, anterior):
+    """Print speedup of each benchmark against a previous results file"""
+    print(f"\nComparação com {anterior['commit']} (tempo anterior / atual):")
+    for nome, por_tamanho in atual['resultados'].items():
+        for tamanho, medidas in por_tamanho.items():
+            base = anterior['resultados'].get(nome, {}).get(tamanho)
+            if not base:
+                continue
+            # Arquivos antigos só têm o tempo a quente
+            for modo, chave in (('frio', 'frio_min_ms'), ('quente', 'min_ms')):
+                if chave not in base:
+                    continue
+                razao = base[chave] / medidas[chave]
+                alerta = '  <-- regressão' if razao < 0.9 else ''
+                print(f"{nome:36s} {tamanho:8s} {modo:6s} {base[chave]:10.3f} -> {medidas[chave]:10.3f} ms "
+                      f"({razao:5.2f}x){alerta}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos calculadores e geradores")
+    parser.add_argument('--tamanhos', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--filtro', default='', help="Roda só os benchmarks cujo nome contém o texto")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('-o', '--output', default=None, help="Arquivo JSON (padrão: benchmarks/results/<commit>.json)")
+    parser.add_argument('--comparar', default=None, help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args(argv)
+
+    commit = git_commit()
+    resultado = {
+        'commit': commit,
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'resultados': run(args.tamanhos, args.filtro, args.repeticoes)
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f'{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados salvos em {output}")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            compare(resultado, json.load(f))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
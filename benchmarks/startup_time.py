@@ -0,0 +1,139 @@
+"""
+Orçamento de Tempo de Inicialização da Aplicação
+Mede com `python -X importtime` o custo de importar main.py (partida a frio de
+cada worker do Streamlit) e o módulo de cada etapa/ferramenta ao ser aberto,
+sem contar o próprio Streamlit, e falha se algum tempo passar do orçamento ou
+se bibliotecas pesadas (matplotlib, reportlab, openpyxl, plotly.express) forem
+carregadas antes de um relatório ou planilha ser de fato gerado
+
+Uso:
+    python benchmarks/startup_time.py                     # código de saída 1 se estourar o orçamento
+    python benchmarks/startup_time.py --orcamento-main 150 --orcamento-tela 250 --repeticoes 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from screens import STEP_SCREENS, TOOL_SCREENS  # noqa: E402
+
+# Orçamentos padrão (ms, melhor de N execuções)
+MAIN_BUDGET_MS = 150
+SCREEN_BUDGET_MS = 250
+
+# Bibliotecas que só devem ser importadas quando um relatório/planilha é gerado
+HEAVY_MODULES = ('matplotlib', 'reportlab', 'openpyxl', 'plotly.express')
+
+# Importado e medido à parte: não entra na conta da aplicação
+BASELINE = 'streamlit'
+
+
+def import_tree(code):
+    """[(depth, module, cumulative µs)] from `python -X importtime -c code`, in import order"""
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=RAIZ, capture_output=True, text=True
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(resultado.stderr.strip().splitlines()[-1])
+
+    linhas = []
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith('import time:') or 'cumulative' in linha:
+            continue
+        _, acumulado, nome = linha.split('|')
+        profundidade = (len(nome) - len(nome.lstrip(' ')) - 1) // 2
+        linhas.append((profundidade, nome.strip(), int(acumulado)))
+    return linhas
+
+
+def subtree(linhas, modulo):
+    """Cumulative µs and imported module names of a top-level import (None if not imported)"""
+    # importtime escreve cada módulo depois dos seus filhos: os filhos são as linhas
+    # mais profundas imediatamente anteriores
+    for i, (profundidade, nome, acumulado) in enumerate(linhas):
+        if profundidade == 0 and nome == modulo:
+            filhos = []
+            j = i - 1
+            while j >= 0 and linhas[j][0] > 0:
+                filhos.append(linhas[j][1])
+                j -= 1
+            return acumulado, filhos
+    return None
+
+
+def measure(alvo, preload=(), repeat=3):
+    """Best import time (ms) of a module after the preloaded ones, and the modules it pulled in"""
+    codigo = '; '.join(f'import {m}' for m in (BASELINE,) + tuple(preload) + (alvo,))
+    melhor, modulos = None, []
+    for _ in range(repeat):
+        medida = subtree(import_tree(codigo), alvo)
+        if medida is None:
+            # Já carregado por um módulo anterior
+            return 0.0, []
+        acumulado, modulos = medida
+        melhor = acumulado if melhor is None else min(melhor, acumulado)
+    return melhor / 1000, modulos
+
+
+def heavy(modulos):
+    """Heavy libraries among the imported module names"""
+    return sorted({
+        pesado for pesado in HEAVY_MODULES for m in modulos
+        if m == pesado or m.startswith(pesado + '.')
+    })
+
+
+def run(orcamento_main=MAIN_BUDGET_MS, orcamento_tela=SCREEN_BUDGET_MS, repeat=3):
+    """Print import times against the budgets; returns the list of violations"""
+    violacoes = []
+
+    tempo, modulos = measure('main', repeat=repeat)
+    pesados = heavy(modulos)
+    print(f"{'main':40s} {tempo:8.1f} ms  (orçamento {orcamento_main} ms)")
+    if tempo > orcamento_main:
+        violacoes.append(f"main: {tempo:.1f} ms > {orcamento_main} ms")
+    if pesados:
+        violacoes.append(f"main importa {', '.join(pesados)} na inicialização")
+
+    telas = [tela[:2] for tela in STEP_SCREENS.values()] + [tela[:2] for tela in TOOL_SCREENS.values()]
+    for modulo, _ in telas:
+        try:
+            tempo, modulos = measure(modulo, preload=('main',), repeat=repeat)
+        except RuntimeError as e:
+            print(f"{modulo:40s} {'ausente':>8s}     ({e})")
+            continue
+        pesados = heavy(modulos)
+        alerta = '  <-- acima do orçamento' if tempo > orcamento_tela else ''
+        print(f"{modulo:40s} {tempo:8.1f} ms{alerta}")
+        if tempo > orcamento_tela:
+            violacoes.append(f"{modulo}: {tempo:.1f} ms > {orcamento_tela} ms")
+        if pesados:
+            violacoes.append(f"{modulo} importa {', '.join(pesados)} ao abrir a tela")
+    return violacoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de importação da aplicação contra um orçamento")
+    parser.add_argument('--orcamento-main', type=float, default=MAIN_BUDGET_MS, help="Orçamento de main.py (ms)")
+    parser.add_argument('--orcamento-tela', type=float, default=SCREEN_BUDGET_MS,
+                        help="Orçamento de cada etapa/ferramenta (ms)")
+    parser.add_argument('--repeticoes', type=int, default=3, help="Execuções por medida (vale a melhor)")
+    args = parser.parse_args(argv)
+
+    violacoes = run(args.orcamento_main, args.orcamento_tela, args.repeticoes)
+    if violacoes:
+        print("\nOrçamento de inicialização estourado:")
+        for violacao in violacoes:
+            print(f"  - {violacao}")
+        return 1
+    print("\nDentro do orçamento de inicialização")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
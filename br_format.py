@@ -0,0 +1,97 @@
+"""
+Formatação de Números no Padrão Brasileiro
+Formatação compartilhada de moeda, números e percentuais para telas e relatórios:
+valores individuais e caminho vetorizado para arrays/Series/DataFrames, com
+variantes por idioma do relatório
+"""
+
+import numpy as np
+import pandas as pd
+
+# Idioma do relatório -> separadores (pt/es usam 1.234,56; en usa 1,234.56)
+LANGUAGE_CODES = {'Português': 'pt', 'English': 'en', 'Español': 'es'}
+_BRAZILIAN = {'pt': True, 'es': True, 'en': False}
+
+# Especificações de formato reutilizadas: '_' agrupa milhares sem colidir com o ponto decimal
+_SPECS = {decimals: f'_.{decimals}f' for decimals in range(7)}
+
+
+def language_code(language):
+    """Normalize 'Português'/'English'/'Español' or a code to 'pt'/'en'/'es'"""
+    code = LANGUAGE_CODES.get(language, language)
+    return code if code in _BRAZILIAN else 'pt'
+
+
+def _separators(texto, language):
+    """Swap the '_'/'.' placeholders for the language's separators"""
+    if _BRAZILIAN.get(language, True):
+        return texto.replace('.', ',').replace('_', '.')
+    return texto.replace('_', ',')
+
+
+def format_currency(value, decimals=2, language='pt', prefix='R$ '):
+    """Format one value as currency (R$ 30.000,00; English reports use R$ 30,000.00)"""
+    # + 0.0 normaliza -0.0; None e textos levantam TypeError como o formato antigo
+    return prefix + _separators(format(value + 0.0, _SPECS.get(decimals) or f'_.{decimals}f'), language)
+
+
+def format_number(value, decimals=0, language='pt'):
+    """Format one value with thousands separators (30.000)"""
+    return _separators(format(value + 0.0, _SPECS.get(decimals) or f'_.{decimals}f'), language)
+
+
+def format_percent(value, decimals=1, language='pt'):
+    """Format one percentage value (42,5%)"""
+    return _separators(format(value + 0.0, _SPECS.get(decimals) or f'_.{decimals}f'), language) + '%'
+
+
+def _format_values(values, decimals, language, prefix='', suffix=''):
+    """Format a whole array/Series in one pass (NaN becomes '')"""
+    # + 0.0 normaliza -0.0 (mesmo texto do caminho escalar)
+    numeros = np.asarray(values, dtype=float) + 0.0
+    vazios = np.isnan(numeros)
+    if vazios.any():
+        numeros = np.where(vazios, 0.0, numeros)
+
+    # Um único str.format para a coluna inteira; separadores trocados no texto todo
+    # ('\x01'/'\x02' marcam prefixo e sufixo para não passarem pela troca de separadores)
+    spec = _SPECS.get(decimals) or f'_.{decimals}f'
+    modelo = '\x01{:' + spec + '}\x02\n'
+    texto = _separators((modelo * len(numeros)).format(*numeros.tolist()), language)
+    formatted = np.array(
+        texto.replace('\x01', prefix).replace('\x02', suffix).split('\n')[:-1],
+        dtype=object
+    )
+    if vazios.any():
+        formatted[vazios] = ''
+
+    if isinstance(values, pd.Series):
+        return pd.Series(formatted, index=values.index, name=values.name, dtype=object)
+    return formatted
+
+
+def format_currency_values(values, decimals=2, language='pt', prefix='R$ '):
+    """Format an array/Series of numbers as currency"""
+    return _format_values(values, decimals, language, prefix=prefix)
+
+
+def format_number_values(values, decimals=0, language='pt'):
+    """Format an array/Series of numbers with thousands separators"""
+    return _format_values(values, decimals, language)
+
+
+def format_percent_values(values, decimals=1, language='pt'):
+    """Format an array/Series of percentages"""
+    return _format_values(values, decimals, language, suffix='%')
+
+
+def format_frame(df, currency=(), percent=(), decimals=2, percent_decimals=1, language='pt'):
+    """Copy of a numeric DataFrame with the given columns formatted for display/export"""
+    formatted = df.copy()
+    for coluna in currency:
+        if coluna in formatted.columns:
+            formatted[coluna] = format_currency_values(formatted[coluna], decimals, language)
+    for coluna in percent:
+        if coluna in formatted.columns:
+            formatted[coluna] = format_percent_values(formatted[coluna], percent_decimals, language)
+    return formatted
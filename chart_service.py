@@ -0,0 +1,149 @@
+"""
+Serviço de Gráficos para Relatórios PDF
+Renderiza os gráficos com a API orientada a objetos do Agg (sem o estado global
+do pyplot, seguro em threads de workers) e guarda os PNGs em cache pelo hash
+dos dados: relatórios em que só o texto mudou reaproveitam os gráficos
+"""
+
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
+
+
+def _reais(x, pos):
+    return f'R$ {x:,.0f}'
+
+
+def draw_dre_waterfall(fig, data):
+    """DRE waterfall: gross revenue, deductions and net profit"""
+    ax = fig.add_subplot()
+    labels = data['labels']
+    values = data['values']
+
+    # Create waterfall effect
+    cumulative = np.cumsum([0] + values[:-1])
+    colors = ['green', 'red', 'red', 'red', 'red', 'blue']
+
+    for i, (value, cum, color) in enumerate(zip(values, cumulative, colors)):
+        if i == 0 or i == len(labels) - 1:  # First and last bars start from zero
+            ax.bar(i, abs(value), bottom=0 if value >= 0 else value,
+                   color=color, alpha=0.7, edgecolor='black')
+        else:  # Intermediate bars stack
+            bottom = cum if value < 0 else cum + value
+            ax.bar(i, abs(value), bottom=bottom, color=color, alpha=0.7, edgecolor='black')
+
+        label_y = cum + value / 2 if i != 0 and i != len(labels) - 1 else value / 2
+        ax.text(i, label_y, f'R$ {abs(value):,.0f}', ha='center', va='center',
+                fontweight='bold', fontsize=9)
+
+    # Connect bars with lines
+    for i in range(len(labels) - 1):
+        start_y = cumulative[i] + values[i] if i > 0 else values[0]
+        ax.plot([i + 0.4, i + 1 - 0.4], [start_y, cumulative[i + 1]], 'k--', alpha=0.5, linewidth=1)
+
+    ax.set_xticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=0, ha='center')
+    ax.set_ylabel('Valor (R$)')
+    ax.set_title(data['title'], fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.yaxis.set_major_formatter(FuncFormatter(_reais))
+
+
+def draw_projection_lines(fig, data):
+    """Monthly revenue and profit lines"""
+    ax = fig.add_subplot()
+    x = np.arange(len(data['months']))
+    ax.plot(x, data['receitas'], marker='o', linewidth=2, label='Receita Bruta', color='blue')
+    ax.plot(x, data['lucros'], marker='s', linewidth=2, label='Lucro Líquido', color='green')
+
+    ax.set_xlabel('Meses')
+    ax.set_ylabel('Valor (R$)')
+    ax.set_title(data['title'], fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(data['months'])
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.yaxis.set_major_formatter(FuncFormatter(_reais))
+
+
+def draw_placeholder(fig, data):
+    """Centered message shown when a chart cannot be drawn"""
+    ax = fig.add_subplot()
+    ax.text(0.5, 0.5, data['message'], ha='center', va='center', fontsize=16, fontweight='bold')
+    ax.set_title(data['title'])
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+
+
+class ChartService:
+    """Thread-safe PNG chart renderer with an LRU cache keyed by the chart data"""
+
+    # Tipo de gráfico: (função de desenho, tamanho da figura em polegadas)
+    CHARTS = {
+        'dre': (draw_dre_waterfall, (10, 6)),
+        'projecao': (draw_projection_lines, (10, 6)),
+        'placeholder': (draw_placeholder, (8, 6))
+    }
+
+    def __init__(self, cache_size=64, dpi=150):
+        self.cache_size = cache_size
+        self.dpi = dpi
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def chart_key(self, kind, data):
+        """Hash of the chart type, data and resolution"""
+        payload = json.dumps([kind, data, self.dpi], sort_keys=True, default=float)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def render(self, kind, data):
+        """PNG bytes of a chart, rendered only if the same data was not drawn before"""
+        key = self.chart_key(kind, data)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        # Figura própria por chamada (sem pyplot): várias threads podem renderizar ao mesmo tempo
+        draw, figsize = self.CHARTS[kind]
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        draw(fig, data)
+        fig.tight_layout()
+
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight', facecolor='white', edgecolor='none')
+        png = buffer.getvalue()
+
+        with self._lock:
+            self._cache[key] = png
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return png
+
+    def clear(self):
+        """Drop every cached chart (benchmarks measure cold renders)"""
+        with self._lock:
+            self._cache.clear()
+
+    def render_buffer(self, kind, data):
+        """Chart PNG as a fresh BytesIO (ReportLab Image / download buttons)"""
+        return io.BytesIO(self.render(kind, data))
+
+
+@lru_cache(maxsize=None)
+def get_chart_service():
+    """Chart service shared by every report of the process"""
+    return ChartService()
@@ -0,0 +1,177 @@
+"""
+Motor de Rateio de Custos Fixos por Direcionadores
+Distribui cada linha de custo fixo sobre o mix de produtos conforme um
+direcionador (unidades, participação na receita, tempo de atendimento) como
+operação matricial, com recálculo incremental quando muda uma linha ou o mix
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class CostAllocationEngine:
+    """Driver-based fixed-cost allocation over a product mix"""
+
+    DRIVERS = {
+        'unidades': 'Unidades vendidas',
+        'receita': 'Participação na receita',
+        'tempo_servico': 'Tempo de atendimento'
+    }
+
+    # Minutos de atendimento por unidade vendida de cada grupo de produtos
+    SERVICE_MINUTES = {
+        'oculos': 40,
+        'lentes_contato': 20,
+        'servicos': 30,
+        'acessorios': 3,
+        'pacotes': 60
+    }
+
+    # Direcionador padrão de cada linha de custo fixo da Etapa 10
+    DEFAULT_LINE_DRIVERS = {
+        'Aluguel': 'unidades',
+        'Folha CLT': 'tempo_servico',
+        'Optometrista': 'tempo_servico',
+        'Combustível': 'unidades',
+        'Outros Fixos': 'receita',
+        'Captador': 'receita'
+    }
+
+    def __init__(self, products, units, prices, minutes, cost_lines, line_drivers=None):
+        self.products = list(products)
+        self.lines = list(cost_lines)
+        line_drivers = {**self.DEFAULT_LINE_DRIVERS, **(line_drivers or {})}
+
+        drivers = list(self.DRIVERS)
+        self._driver_of_line = np.array([drivers.index(line_drivers.get(l, 'unidades')) for l in self.lines])
+        self._costs = np.array([cost_lines[l] for l in self.lines], dtype=float)
+
+        self._units = np.asarray(units, dtype=float).copy()
+        self._prices = np.asarray(prices, dtype=float).copy()
+        self._minutes = np.asarray(minutes, dtype=float).copy()
+
+        self._recompute_driver_costs()
+        self._recompute_weights()
+
+    @classmethod
+    def from_analysis(cls, base, cost_lines, line_drivers=None, service_minutes=None):
+        """Engine for the base product table of the step 10 analysis"""
+        minutos = {**cls.SERVICE_MINUTES, **(service_minutes or {})}
+        return cls(
+            base['PRODUTO'],
+            base['VENDAS MES'].to_numpy(dtype=float),
+            base['PREÇO CALC.'].to_numpy(dtype=float),
+            base['GRUPO'].map(minutos).fillna(0).to_numpy(dtype=float),
+            cost_lines,
+            line_drivers
+        )
+
+    def _recompute_driver_costs(self):
+        """Total monthly cost assigned to each driver"""
+        self._driver_costs = np.bincount(self._driver_of_line, weights=self._costs, minlength=len(self.DRIVERS))
+
+    def _recompute_weights(self):
+        """Driver × product weights, their totals and the allocated total per product"""
+        self._weights = np.vstack([
+            self._units,
+            self._units * self._prices,
+            self._units * self._minutes
+        ])
+        self._weight_totals = self._weights.sum(axis=1)
+        self._recompute_allocation()
+
+    def _shares(self):
+        """Driver × product share matrix (each row sums to 1, or 0 when the driver is empty)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self._weight_totals[:, None] > 0, self._weights / self._weight_totals[:, None], 0.0)
+
+    def _recompute_allocation(self):
+        self._allocated = self._driver_costs @ self._shares()
+
+    def set_cost(self, line, value):
+        """Change one cost line (updates only that driver's contribution)"""
+        i = self.lines.index(line)
+        delta = float(value) - self._costs[i]
+        if delta == 0:
+            return
+        d = self._driver_of_line[i]
+        self._costs[i] = value
+        self._driver_costs[d] += delta
+        if self._weight_totals[d] > 0:
+            self._allocated += delta * self._weights[d] / self._weight_totals[d]
+
+    def set_line_driver(self, line, driver):
+        """Move one cost line to another driver"""
+        i = self.lines.index(line)
+        self._driver_of_line[i] = list(self.DRIVERS).index(driver)
+        self._recompute_driver_costs()
+        self._recompute_allocation()
+
+    def set_mix(self, positions, units=None, prices=None, minutes=None):
+        """Change units/price/service time of some products (updates only their weights)"""
+        positions = np.atleast_1d(positions)
+        for destino, valores in ((self._units, units), (self._prices, prices), (self._minutes, minutes)):
+            if valores is not None:
+                destino[positions] = valores
+
+        antigos = self._weights[:, positions]
+        novos = np.vstack([
+            self._units[positions],
+            self._units[positions] * self._prices[positions],
+            self._units[positions] * self._minutes[positions]
+        ])
+        self._weights[:, positions] = novos
+        self._weight_totals += (novos - antigos).sum(axis=1)
+        # Totais dos direcionadores mudaram: as participações de todos os produtos mudam
+        self._recompute_allocation()
+
+    def update(self, cost_lines=None, units=None, prices=None, minutes=None):
+        """Apply only what differs from the current state; returns the number of changes"""
+        mudancas = 0
+        for line, value in (cost_lines or {}).items():
+            if line in self.lines and self._costs[self.lines.index(line)] != value:
+                self.set_cost(line, value)
+                mudancas += 1
+
+        novos = {
+            'units': None if units is None else np.asarray(units, dtype=float),
+            'prices': None if prices is None else np.asarray(prices, dtype=float),
+            'minutes': None if minutes is None else np.asarray(minutes, dtype=float)
+        }
+        atuais = {'units': self._units, 'prices': self._prices, 'minutes': self._minutes}
+        alterados = np.zeros(len(self.products), dtype=bool)
+        for nome, valores in novos.items():
+            if valores is not None:
+                alterados |= valores != atuais[nome]
+
+        if alterados.any():
+            posicoes = np.flatnonzero(alterados)
+            self.set_mix(posicoes, **{
+                nome: valores[posicoes] for nome, valores in novos.items() if valores is not None
+            })
+            mudancas += len(posicoes)
+        return mudancas
+
+    def monthly_allocation(self):
+        """Fixed cost allocated to each product per month"""
+        return self._allocated.copy()
+
+    def per_unit(self):
+        """Fixed cost allocated per unit sold of each product"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self._units > 0, self._allocated / self._units, 0.0)
+
+    def allocation_matrix(self):
+        """Cost line × product monthly allocation as a DataFrame"""
+        matriz = self._costs[:, None] * self._shares()[self._driver_of_line]
+        return pd.DataFrame(matriz, index=self.lines, columns=self.products)
+
+    def summary(self):
+        """Allocated total per cost line with its driver"""
+        drivers = list(self.DRIVERS)
+        return pd.DataFrame({
+            'LINHA': self.lines,
+            'DIRECIONADOR': [self.DRIVERS[drivers[d]] for d in self._driver_of_line],
+            'CUSTO MENSAL': self._costs,
+            'RATEADO': self.allocation_matrix().sum(axis=1).to_numpy()
+        })
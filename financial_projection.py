@@ -0,0 +1,209 @@
+"""
+Modelo de Projeção Financeira (Etapa 10)
+DRE mês a mês calculado a partir do business_data, sem dependência do Streamlit
+"""
+
+import numpy as np
+
+from payment_modalities import PaymentModalityEngine
+
+
+class FinancialProjection:
+    """Monthly DRE projection model used by step 10 (Projeções Financeiras)"""
+
+    # Chaves do DRE mensal na mesma ordem exibida na Etapa 10
+    DRE_KEYS = [
+        'receita_bruta', 'cmv', 'impostos', 'comissoes', 'taxas_financeiras',
+        'comissoes_captador', 'outros_variaveis', 'custos_variaveis_total',
+        'margem_contribuicao', 'aluguel', 'salarios', 'servicos', 'outros_fixos',
+        'depreciacao', 'custos_fixos_total', 'lucro_operacional'
+    ]
+
+    def __init__(self, business_data):
+        self.business_data = business_data or {}
+
+    def get_inputs(self, overrides=None):
+        """Collect projection inputs from business data (same defaults as step 10)"""
+        data = self.business_data
+
+        if data.get('usar_taxa_customizada', False):
+            taxa_financeira = data.get('taxa_customizada', 4.3)
+        else:
+            taxa_financeira = data.get('taxa_mercado_pago', 4.3)
+
+        inputs = {
+            'vendas_mes_1': data.get('vendas_mes_1', 20831),
+            'crescimento_mensal': data.get('crescimento_mensal', 2.0),
+            'ticket_medio': data.get('ticket_medio', 180),
+            'custo_materiais_fisicos': data.get('custo_materiais_fisicos', 89.80),
+            'cmv_percentual': data.get('cmv_percentual', 45.0),
+            'impostos_percentual': data.get('impostos_percentual', 6.0),
+            'comissoes_percentual': data.get('comissoes_percentual', 3.0),
+            'outros_variaveis_percentual': data.get('outros_variaveis_percentual', 2.0),
+            'taxa_financeira': taxa_financeira,
+            'percentual_avista': data.get('percentual_avista', 70),
+            'prazo_medio_recebimento': data.get('prazo_medio_recebimento', 30),
+            'aluguel': data.get('aluguel', 0),
+            'salarios_clt': data.get('salarios_clt', 0),
+            'total_optometrista': data.get('total_optometrista', 0),
+            'outros_fixos': data.get('outros_fixos', 0),
+            'reforma_loja': data.get('reforma_loja', 15000),
+            'equipamentos_total': data.get('equipamentos_total', 12000),
+            'investimento_total': data.get('investimento_total', 81500),
+            # Sistema de captação (Etapa 8)
+            'usar_sistema_captacao': data.get('usar_sistema_captacao', False),
+            'tipo_comissao_avista': data.get('tipo_comissao_avista', 'Valor fixo por venda'),
+            'tipo_comissao_parcelada': data.get('tipo_comissao_parcelada', 'Valor fixo por venda'),
+            'comissao_avista': data.get('comissao_avista', 30.0),
+            'comissao_parcelada': data.get('comissao_parcelada', 20.0),
+            'percentual_comissao_avista': data.get('percentual_comissao_avista', 3.0),
+            'percentual_comissao_parcelada': data.get('percentual_comissao_parcelada', 2.0),
+            'usar_comissao_produto': data.get('usar_comissao_produto', False),
+            'comissao_lentes': data.get('comissao_lentes', 10.0),
+            'comissao_armacoes': data.get('comissao_armacoes', 5.0)
+        }
+
+        if overrides:
+            inputs.update(overrides)
+
+        return inputs
+
+    def project(self, months=12, overrides=None):
+        """Project the monthly DRE as arrays (one value per month)"""
+        p = self.get_inputs(overrides)
+        meses = np.arange(months)
+
+        receita = p['vendas_mes_1'] * (1 + p['crescimento_mensal'] / 100) ** meses
+
+        cmv = receita * (p['cmv_percentual'] / 100)
+        impostos = receita * (p['impostos_percentual'] / 100)
+        comissoes = receita * (p['comissoes_percentual'] / 100)
+
+        percentual_avista = p['percentual_avista'] / 100
+        pagamentos, mix = PaymentModalityEngine.two_bucket(
+            p['taxa_financeira'], p['percentual_avista'], p['prazo_medio_recebimento']
+        )
+        taxas_financeiras = receita * (pagamentos.fee_rate(mix) / 100)
+
+        comissoes_captador = self._captador_commissions(receita, p, percentual_avista)
+        outros_variaveis = receita * (p['outros_variaveis_percentual'] / 100)
+
+        custos_variaveis_total = cmv + impostos + comissoes + taxas_financeiras + comissoes_captador + outros_variaveis
+        margem_contribuicao = receita - custos_variaveis_total
+
+        # Custos fixos constantes ao longo do horizonte
+        ones = np.ones(months)
+        aluguel = p['aluguel'] * ones
+        salarios = (p['salarios_clt'] + p['total_optometrista']) * ones
+        servicos = 0 * ones
+        outros_fixos = p['outros_fixos'] * ones
+        depreciacao = (p['reforma_loja'] + p['equipamentos_total']) * 0.05 / 12 * ones
+
+        custos_fixos_total = aluguel + salarios + servicos + outros_fixos + depreciacao
+        lucro_operacional = margem_contribuicao - custos_fixos_total
+
+        return {
+            'mes': meses + 1,
+            'receita_bruta': receita,
+            'cmv': cmv,
+            'impostos': impostos,
+            'comissoes': comissoes,
+            'taxas_financeiras': taxas_financeiras,
+            'comissoes_captador': comissoes_captador,
+            'outros_variaveis': outros_variaveis,
+            'custos_variaveis_total': custos_variaveis_total,
+            'margem_contribuicao': margem_contribuicao,
+            'aluguel': aluguel,
+            'salarios': salarios,
+            'servicos': servicos,
+            'outros_fixos': outros_fixos,
+            'depreciacao': depreciacao,
+            'custos_fixos_total': custos_fixos_total,
+            'lucro_operacional': lucro_operacional,
+            # Entradas de caixa líquidas das vendas conforme o prazo de recebimento
+            'recebimentos_vendas': pagamentos.cash_receipts(receita, mix)
+        }
+
+    def _captador_commissions(self, receita, p, percentual_avista):
+        """Captador commissions per month (Etapa 8 configuration)"""
+        if not p['usar_sistema_captacao'] or p['ticket_medio'] <= 0:
+            return np.zeros_like(receita)
+
+        total_vendas_mes = receita / p['ticket_medio']
+        vendas_avista = total_vendas_mes * percentual_avista
+        vendas_parceladas = total_vendas_mes * (1 - percentual_avista)
+
+        if p['tipo_comissao_avista'] == "Valor fixo por venda":
+            comissao_avista = vendas_avista * p['comissao_avista']
+        else:
+            comissao_avista = receita * percentual_avista * (p['percentual_comissao_avista'] / 100)
+
+        if p['tipo_comissao_parcelada'] == "Valor fixo por venda":
+            comissao_parcelada = vendas_parceladas * p['comissao_parcelada']
+        else:
+            comissao_parcelada = receita * (1 - percentual_avista) * (p['percentual_comissao_parcelada'] / 100)
+
+        comissao_produtos = 0
+        if p['usar_comissao_produto']:
+            # Estimar 75% das vendas incluem lentes, 90% incluem armações
+            comissao_produtos = (
+                total_vendas_mes * 0.75 * p['comissao_lentes'] +
+                total_vendas_mes * 0.90 * p['comissao_armacoes']
+            )
+
+        return comissao_avista + comissao_parcelada + comissao_produtos
+
+    def monthly_dre(self, months=12, overrides=None):
+        """Monthly DRE as a list of dicts (format used by the step 10 tables)"""
+        arrays = self.project(months, overrides)
+        return [
+            {'mes': int(arrays['mes'][i]), **{key: float(arrays[key][i]) for key in self.DRE_KEYS}}
+            for i in range(months)
+        ]
+
+    def summarize(self, months=12, overrides=None, payback_horizon=120):
+        """Key indicators over the projection horizon"""
+        p = self.get_inputs(overrides)
+        arrays = self.project(max(months, payback_horizon), overrides)
+
+        receita_anual = float(arrays['receita_bruta'][:months].sum())
+        lucro_operacional = float(arrays['lucro_operacional'][:months].sum())
+        margem_contribuicao = float(arrays['margem_contribuicao'][:months].sum())
+        investimento_total = p['investimento_total']
+
+        # Ponto de equilíbrio pela margem de contribuição do primeiro mês
+        receita_mes_1 = arrays['receita_bruta'][0]
+        margem_contribuicao_perc = (arrays['margem_contribuicao'][0] / receita_mes_1 * 100) if receita_mes_1 > 0 else 0
+        custos_fixos_mes = float(arrays['custos_fixos_total'][0])
+        ponto_equilibrio_valor = custos_fixos_mes / (margem_contribuicao_perc / 100) if margem_contribuicao_perc > 0 else 0
+        ponto_equilibrio_unidades = ponto_equilibrio_valor / p['ticket_medio'] if p['ticket_medio'] > 0 else 0
+
+        return {
+            'receita_anual': receita_anual,
+            'lucro_operacional': lucro_operacional,
+            'lucro_mensal_medio': lucro_operacional / months if months > 0 else 0,
+            'margem_operacional': (lucro_operacional / receita_anual * 100) if receita_anual > 0 else 0,
+            'margem_contribuicao_real': (margem_contribuicao / receita_anual * 100) if receita_anual > 0 else 0,
+            'roi_anual': (lucro_operacional / investimento_total * 100) if investimento_total > 0 else 0,
+            'payback_anos': investimento_total / lucro_operacional if lucro_operacional > 0 else 0,
+            'payback_meses': self.payback_months(arrays['lucro_operacional'], investimento_total),
+            'ponto_equilibrio_valor': ponto_equilibrio_valor,
+            'ponto_equilibrio_unidades': ponto_equilibrio_unidades
+        }
+
+    @staticmethod
+    def payback_months(lucro_mensal, investimento_total):
+        """Months until cumulative profit recovers the investment (inf if never)"""
+        if investimento_total <= 0:
+            return 0.0
+
+        acumulado = np.cumsum(lucro_mensal)
+        atingiu = np.nonzero(acumulado >= investimento_total)[0]
+        if len(atingiu) == 0:
+            return float('inf')
+
+        # Interpolar dentro do mês em que o investimento é recuperado
+        idx = atingiu[0]
+        anterior = acumulado[idx - 1] if idx > 0 else 0.0
+        fracao = (investimento_total - anterior) / lucro_mensal[idx] if lucro_mensal[idx] > 0 else 1.0
+        return float(idx + fracao)
@@ -0,0 +1,143 @@
+"""
+Solver de Metas (Goal Seek) para Projeções Financeiras
+Encontra o ticket médio, volume, markup ou aluguel que atinge uma meta de
+lucro mensal, ROI ou payback usando o modelo completo da Etapa 10
+"""
+
+import math
+
+from financial_projection import FinancialProjection
+
+
+class GoalSeekSolver:
+    """Bracketed root-finding over the step 10 projection model"""
+
+    # Variáveis de decisão e faixa padrão de busca
+    VARIABLES = {
+        'ticket_medio': {'label': 'Ticket médio (R$)', 'bounds': (50.0, 5000.0)},
+        'oculos_mes': {'label': 'Óculos vendidos/mês', 'bounds': (1.0, 2000.0)},
+        'markup': {'label': 'Markup sobre custo (x)', 'bounds': (1.0, 20.0)},
+        'aluguel': {'label': 'Aluguel máximo (R$)', 'bounds': (0.0, 100000.0)}
+    }
+
+    # Métricas alvo calculadas pelo FinancialProjection.summarize
+    METRICS = {
+        'lucro_mensal_medio': 'Lucro mensal médio (R$)',
+        'roi_anual': 'ROI anual (%)',
+        'payback_meses': 'Payback (meses)'
+    }
+
+    def __init__(self, business_data, months=12, payback_horizon=120):
+        self.model = FinancialProjection(business_data)
+        self.months = months
+        self.payback_horizon = payback_horizon
+        self.base_inputs = self.model.get_inputs()
+        self._cache = {}
+
+    def _overrides_for(self, variable, value):
+        """Translate a decision variable value into projection overrides"""
+        base = self.base_inputs
+        ticket_base = base['ticket_medio']
+        oculos_base = base['vendas_mes_1'] / ticket_base if ticket_base > 0 else 0
+        custo_materiais = base['custo_materiais_fisicos']
+
+        if variable == 'aluguel':
+            return {'aluguel': value}
+
+        if variable == 'oculos_mes':
+            return {'vendas_mes_1': value * ticket_base}
+
+        if variable == 'markup':
+            ticket = custo_materiais * value
+        else:
+            ticket = value
+
+        # Mesmo volume de óculos, novo ticket: receita e CMV% acompanham o preço
+        overrides = {'ticket_medio': ticket, 'vendas_mes_1': oculos_base * ticket}
+        if ticket > 0 and custo_materiais > 0:
+            overrides['cmv_percentual'] = custo_materiais / ticket * 100
+        return overrides
+
+    def evaluate(self, variable, value):
+        """Projection summary for one value of the decision variable (cached)"""
+        key = (variable, round(float(value), 6))
+        if key not in self._cache:
+            self._cache[key] = self.model.summarize(
+                self.months, self._overrides_for(variable, value), self.payback_horizon
+            )
+        return self._cache[key]
+
+    def solve(self, variable, metric, target, bounds=None, tol=0.01, max_iter=100):
+        """Find the variable value where metric reaches target"""
+        if variable not in self.VARIABLES:
+            raise ValueError(f"Variável desconhecida: {variable}")
+        if metric not in self.METRICS:
+            raise ValueError(f"Métrica desconhecida: {metric}")
+
+        low, high = bounds or self.VARIABLES[variable]['bounds']
+        avaliacoes_inicio = len(self._cache)
+
+        def f(x):
+            return self.evaluate(variable, x)[metric] - target
+
+        f_low, f_high = f(low), f(high)
+        result = {
+            'variavel': variable,
+            'metrica': metric,
+            'alvo': target,
+            'valor': None,
+            'resultado': None,
+            'iteracoes': 0,
+            'convergiu': False
+        }
+
+        if f_low == 0:
+            return self._finish(result, variable, metric, low, avaliacoes_inicio)
+        if f_high == 0:
+            return self._finish(result, variable, metric, high, avaliacoes_inicio)
+        if (f_low > 0) == (f_high > 0):
+            result['erro'] = "Meta fora da faixa de busca"
+            result['avaliacoes'] = len(self._cache) - avaliacoes_inicio
+            return result
+
+        # Falsa posição (Illinois) com bisseção quando a função não é finita
+        lado = 0
+        x = low
+        for iteracao in range(1, max_iter + 1):
+            if math.isfinite(f_low) and math.isfinite(f_high):
+                x = (low * f_high - high * f_low) / (f_high - f_low)
+            else:
+                x = (low + high) / 2
+
+            f_x = f(x)
+            result['iteracoes'] = iteracao
+
+            if abs(f_x) <= tol or (high - low) <= tol * 1e-3:
+                break
+
+            if (f_x > 0) == (f_high > 0):
+                high, f_high = x, f_x
+                if lado == -1:
+                    f_low /= 2
+                lado = -1
+            else:
+                low, f_low = x, f_x
+                if lado == 1:
+                    f_high /= 2
+                lado = 1
+
+        return self._finish(result, variable, metric, x, avaliacoes_inicio, tol)
+
+    def _finish(self, result, variable, metric, value, avaliacoes_inicio, tol=0.01):
+        """Fill the solver result for the value found"""
+        resumo = self.evaluate(variable, value)
+        result['valor'] = value
+        result['resultado'] = resumo[metric]
+        result['convergiu'] = abs(resumo[metric] - result['alvo']) <= max(tol, abs(result['alvo']) * 1e-6)
+        result['resumo'] = resumo
+        result['avaliacoes'] = len(self._cache) - avaliacoes_inicio
+        return result
+
+    def break_even(self, variable, bounds=None):
+        """Variable value where the average monthly operating profit is zero"""
+        return self.solve(variable, 'lucro_mensal_medio', 0.0, bounds)
@@ -9,6 +9,10 @@ import pandas as pd
 from typing import Dict, List, Tuple
 import json
 
+from product_catalog import get_product_catalog, TABELA_ANALISE_INTEGRADA
+from br_format import format_frame, format_currency
+from payment_modalities import PaymentModalityEngine
+
 class IntegratedCostAnalyzer:
     """Analisador integrado de custos - fonte única de verdade baseada nas Projeções Financeiras"""
     
@@ -19,99 +23,17 @@ class IntegratedCostAnalyzer:
     
     def load_product_database(self):
         """Base completa de produtos real do sistema com custos atuais"""
+        catalog = get_product_catalog()
         
         # Lentes por tipo e categoria
-        self.lenses_costs = {
-            'Monofocal': {
-                'Nacional Básica': 35.00,
-                'Nacional Premium': 45.00,
-                'Importada Básica': 55.00,
-                'Importada Premium': 85.00,
-                'Grife Nacional': 120.00,
-                'Grife Importada': 180.00
-            },
-            'Multifocal': {
-                'Nacional Básica': 65.00,
-                'Nacional Premium': 85.00,
-                'Importada Básica': 95.00,
-                'Importada Premium': 120.00,
-                'Grife Nacional': 150.00,
-                'Grife Importada': 220.00
-            },
-            'Progressiva': {
-                'Nacional Básica': 85.00,
-                'Nacional Premium': 110.00,
-                'Importada Básica': 120.00,
-                'Importada Premium': 150.00,
-                'Grife Nacional': 220.00,
-                'Grife Importada': 350.00
-            }
-        }
-        
-        # Tratamentos para lentes
-        self.treatments_costs = {
-            'Anti-reflexo Básico': 15.00,
-            'Anti-reflexo Premium': 25.00,
-            'Antirisco': 12.00,
-            'Transitions (Fotossensível)': 45.00,
-            'Blue Control (Luz Azul)': 20.00,
-            'Polarizada': 35.00,
-            'Espelhada': 18.00,
-            'Hidrofóbica': 8.00
-        }
-        
-        # Armações por categoria
-        self.frames_costs = {
-            'Nacional Básica': 25.00,
-            'Nacional Premium': 45.00,
-            'Importada Básica': 35.00,
-            'Importada Premium': 65.00,
-            'Grife Nacional': 80.00,
-            'Grife Importada': 120.00,
-            'Infantil Nacional': 30.00,
-            'Infantil Importada': 50.00,
-            'Esportiva Nacional': 40.00,
-            'Esportiva Importada': 70.00
-        }
-        
-        # Serviços oferecidos
-        self.services_costs = {
-            'Exame de Vista Básico': 80.00,
-            'Exame de Vista Completo': 120.00,
-            'Teste de Lente de Contato': 50.00,
-            'Adaptação Lente de Contato': 80.00,
-            'Conserto de Óculos': 25.00,
-            'Ajuste de Armação': 15.00,
-            'Limpeza Ultrassônica': 10.00,
-            'Troca de Parafusos': 8.00,
-            'Solda de Armação': 35.00,
-            'Cópia de Receita': 12.00
-        }
-        
-        # Acessórios
-        self.accessories_costs = {
-            'Caixinha Básica': 1.20,
-            'Caixinha Premium': 2.50,
-            'Paninho Microfibra': 0.80,
-            'Limpa Lente Spray': 2.50,
-            'Sacolinha Papel': 0.30,
-            'Sacolinha TNT': 0.60,
-            'Cordinha Básica': 3.00,
-            'Cordinha Premium': 8.00,
-            'Estojo Rígido': 15.00,
-            'Kit Limpeza': 12.00
-        }
-        
-        # Lentes de contato (se oferecidas)
-        self.contact_lenses_costs = {
-            'Gelatinosa Mensal': 25.00,
-            'Gelatinosa Quinzenal': 35.00,
-            'Gelatinosa Diária': 45.00,
-            'Rígida': 80.00,
-            'Tórica (Astigmatismo)': 55.00,
-            'Multifocal': 65.00,
-            'Colorida': 40.00
-        }
+        self.lenses_costs = catalog.nested_costs(TABELA_ANALISE_INTEGRADA, 'lente')
+        
+        # Tratamentos, armações, serviços, acessórios e lentes de contato
+        self.treatments_costs = catalog.costs(TABELA_ANALISE_INTEGRADA, 'tratamento')
+        self.frames_costs = catalog.costs(TABELA_ANALISE_INTEGRADA, 'armacao')
+        self.services_costs = catalog.costs(TABELA_ANALISE_INTEGRADA, 'servico')
+        self.accessories_costs = catalog.costs(TABELA_ANALISE_INTEGRADA, 'acessorio')
+        self.contact_lenses_costs = catalog.costs(TABELA_ANALISE_INTEGRADA, 'lente_contato')
     
     def load_market_prices(self):
         """Preços de mercado baseados nas tabelas reais do sistema"""
@@ -129,13 +51,8 @@ class IntegratedCostAnalyzer:
     
     def load_financial_fees(self):
         """Taxas financeiras das operadoras"""
-        self.financial_fees = {
-            'À Vista (0 dias)': 0.0,
-            'Antecipação (até 30 dias)': 4.25,  # Média 3,99% - 4,5%
-            'Parcelado (30-60 dias)': 2.425,   # Média 2,35% - 2,5%
-            'Parcelado (60-90 dias)': 3.2,
-            'Parcelado (90+ dias)': 4.8
-        }
+        self.payment_engine = PaymentModalityEngine()
+        self.financial_fees = dict(zip(self.payment_engine.names, self.payment_engine.taxas.tolist()))
     
     def extract_financial_data(self) -> Dict:
         """Extrai dados das Projeções Financeiras (Etapa 10) do session_state"""
@@ -464,7 +381,11 @@ class IntegratedCostAnalyzer:
         
         return 0
     
-    def generate_complete_analysis(self, combinations: List[Tuple] = None) -> pd.DataFrame:
+    def generate_complete_analysis(self, combinations: List[Tuple] = None, financial_data: Dict = None) -> pd.DataFrame:
+        """Análise numérica por combinação (formatação apenas na exibição)"""
+        
+        # Rateio de custos fixos das Projeções Financeiras
+        rateio_data = self.calculate_fixed_cost_allocation(financial_data or self.extract_financial_data())
         
         # Combinações padrão se não especificadas
         if combinations is None:
@@ -490,60 +411,43 @@ class IntegratedCostAnalyzer:
             
             # Preço de mercado
             market_data = self.get_market_comparison(lente_tipo, armacao_tipo)
-            preco_mercado = market_data['avg']
-            
-            # Análise financeira para diferentes modalidades
-            modalidades_analysis = {}
-            for modalidade in self.financial_fees.keys():
-                impact = self.calculate_financial_impact(preco_mercado, modalidade)
-                margem_liquida = impact['valor_liquido'] - custo_total
-                percentual_margem = (margem_liquida / impact['valor_liquido'] * 100) if impact['valor_liquido'] > 0 else 0
-                
-                modalidades_analysis[modalidade] = {
-                    'valor_liquido': impact['valor_liquido'],
-                    'margem_liquida': margem_liquida,
-                    'percentual_margem': percentual_margem
-                }
             
             # Compilar resultado
-            result = {
+            results.append({
                 'PRODUTO': f"{lente_tipo} + {armacao_tipo}",
                 'LENTE': lente_tipo,
                 'ARMAÇÃO': armacao_tipo,
                 
                 # Custos diretos
-                'CUSTO LENTE': f"R$ {custos_diretos['lente']:.2f}".replace('.', ','),
-                'CUSTO ARMAÇÃO': f"R$ {custos_diretos['armacao']:.2f}".replace('.', ','),
-                'CUSTO ACESSÓRIOS': f"R$ {custos_diretos['acessorios']:.2f}".replace('.', ','),
-                'TOTAL DIRETO': f"R$ {custos_diretos['total']:.2f}".replace('.', ','),
+                'CUSTO LENTE': custos_diretos['lente'],
+                'CUSTO ARMAÇÃO': custos_diretos['armacao'],
+                'CUSTO ACESSÓRIOS': custos_diretos['acessorios'],
+                'TOTAL DIRETO': custos_diretos['total'],
                 
                 # Custos fixos rateados
-                'RATEIO FIXO': f"R$ {rateio_data['total_por_oculos']:.2f}".replace('.', ','),
+                'RATEIO FIXO': rateio_data['total_por_oculos'],
                 
                 # Custo total
-                'CUSTO TOTAL': f"R$ {custo_total:.2f}".replace('.', ','),
+                'CUSTO TOTAL': custo_total,
                 
                 # Preços de mercado
-                'MERCADO MÍNIMO': f"R$ {market_data['min']:.2f}".replace('.', ','),
-                'MERCADO MÉDIO': f"R$ {market_data['avg']:.2f}".replace('.', ','),
-                'MERCADO MÁXIMO': f"R$ {market_data['max']:.2f}".replace('.', ','),
-                
-                # Análises por modalidade
-                'À VISTA MARGEM': f"{modalidades_analysis['À Vista (0 dias)']['percentual_margem']:.1f}%",
-                'ANTECIPAÇÃO MARGEM': f"{modalidades_analysis['Antecipação (até 30 dias)']['percentual_margem']:.1f}%",
-                'PARCELADO MARGEM': f"{modalidades_analysis['Parcelado (30-60 dias)']['percentual_margem']:.1f}%",
-                
-                # Dados numéricos para cálculos
-                '_custo_total_num': custo_total,
-                '_preco_mercado_num': preco_mercado,
-                '_custos_diretos_num': custos_diretos['total'],
-                '_rateio_fixo_num': rateio_data['total_por_oculos'],
-                '_modalidades_data': modalidades_analysis
-            }
-            
-            results.append(result)
+                'MERCADO MÍNIMO': market_data['min'],
+                'MERCADO MÉDIO': market_data['avg'],
+                'MERCADO MÁXIMO': market_data['max']
+            })
+        
+        df = pd.DataFrame(results)
+        if df.empty:
+            return df
+        
+        # Análise financeira de todas as combinações × modalidades de uma vez
+        _, _, percentual = self.payment_engine.margin_matrix(df['MERCADO MÉDIO'], df['CUSTO TOTAL'])
+        modalidades = self.payment_engine.names
+        df['À VISTA MARGEM'] = percentual[:, modalidades.index('À Vista (0 dias)')]
+        df['ANTECIPAÇÃO MARGEM'] = percentual[:, modalidades.index('Antecipação (até 30 dias)')]
+        df['PARCELADO MARGEM'] = percentual[:, modalidades.index('Parcelado (30-60 dias)')]
         
-        return pd.DataFrame(results)
+        return df
     
     def get_market_comparison(self, lente_tipo: str, armacao_tipo: str) -> Dict:
         """Obtém comparação com preços de mercado"""
@@ -554,7 +458,7 @@ class IntegratedCostAnalyzer:
     
     def format_currency(self, value: float) -> str:
         """Formata valor como moeda brasileira"""
-        return f"R$ {value:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        return format_currency(value)
     
     def generate_complete_price_table(self, financial_data: Dict) -> pd.DataFrame:
         """Gera tabela completa de preços similar à foto do usuário"""
@@ -591,14 +495,11 @@ class IntegratedCostAnalyzer:
                         'CATEGORIA': 'ÓCULOS COMPLETOS',
                         'PRODUTO': f"{lente_tipo} {lente_categoria} + {armacao_categoria}",
                         'ESPECIFICAÇÃO': f"Lente {lente_tipo} + Armação {armacao_categoria}",
-                        'CUSTO DIRETO': self.format_currency(custo_direto_basico),
-                        'RATEIO FIXO': self.format_currency(custo_fixo_por_oculos),
-                        'CUSTO TOTAL': self.format_currency(custo_total_basico),
-                        'MARGEM %': f"{margem_sugerida}%",
-                        'PREÇO SUGERIDO': self.format_currency(preco_venda_basico),
-                        '_custo_total_num': custo_total_basico,
-                        '_margem_num': margem_sugerida,
-                        '_preco_num': preco_venda_basico
+                        'CUSTO DIRETO': custo_direto_basico,
+                        'RATEIO FIXO': custo_fixo_por_oculos,
+                        'CUSTO TOTAL': custo_total_basico,
+                        'MARGEM %': margem_sugerida,
+                        'PREÇO SUGERIDO': preco_venda_basico
                     })
                     
                     # Versões com tratamentos populares
@@ -622,14 +523,11 @@ class IntegratedCostAnalyzer:
                             'CATEGORIA': 'ÓCULOS COM TRATAMENTOS',
                             'PRODUTO': f"{lente_tipo} {lente_categoria} + {armacao_categoria}",
                             'ESPECIFICAÇÃO': f"Com {tratamentos_str}",
-                            'CUSTO DIRETO': self.format_currency(custo_direto_tratado),
-                            'RATEIO FIXO': self.format_currency(custo_fixo_por_oculos),
-                            'CUSTO TOTAL': self.format_currency(custo_total_tratado),
-                            'MARGEM %': f"{margem_sugerida}%",
-                            'PREÇO SUGERIDO': self.format_currency(preco_venda_tratado),
-                            '_custo_total_num': custo_total_tratado,
-                            '_margem_num': margem_sugerida,
-                            '_preco_num': preco_venda_tratado
+                            'CUSTO DIRETO': custo_direto_tratado,
+                            'RATEIO FIXO': custo_fixo_por_oculos,
+                            'CUSTO TOTAL': custo_total_tratado,
+                            'MARGEM %': margem_sugerida,
+                            'PREÇO SUGERIDO': preco_venda_tratado
                         })
         
         # 2. SERVIÇOS
@@ -642,14 +540,11 @@ class IntegratedCostAnalyzer:
                 'CATEGORIA': 'SERVIÇOS',
                 'PRODUTO': servico,
                 'ESPECIFICAÇÃO': 'Serviço avulso',
-                'CUSTO DIRETO': self.format_currency(custo_servico),
-                'RATEIO FIXO': self.format_currency(custo_fixo_por_oculos * 0.3),
-                'CUSTO TOTAL': self.format_currency(custo_total_servico),
-                'MARGEM %': f"{margem_servico}%",
-                'PREÇO SUGERIDO': self.format_currency(preco_servico),
-                '_custo_total_num': custo_total_servico,
-                '_margem_num': margem_servico,
-                '_preco_num': preco_servico
+                'CUSTO DIRETO': custo_servico,
+                'RATEIO FIXO': custo_fixo_por_oculos * 0.3,
+                'CUSTO TOTAL': custo_total_servico,
+                'MARGEM %': margem_servico,
+                'PREÇO SUGERIDO': preco_servico
             })
         
         # 3. LENTES DE CONTATO
@@ -662,14 +557,11 @@ class IntegratedCostAnalyzer:
                 'CATEGORIA': 'LENTES DE CONTATO',
                 'PRODUTO': f"Lente de Contato {lc_tipo}",
                 'ESPECIFICAÇÃO': 'Par de lentes',
-                'CUSTO DIRETO': self.format_currency(custo_lc),
-                'RATEIO FIXO': self.format_currency(custo_fixo_por_oculos * 0.2),
-                'CUSTO TOTAL': self.format_currency(custo_total_lc),
-                'MARGEM %': f"{margem_lc}%",
-                'PREÇO SUGERIDO': self.format_currency(preco_lc),
-                '_custo_total_num': custo_total_lc,
-                '_margem_num': margem_lc,
-                '_preco_num': preco_lc
+                'CUSTO DIRETO': custo_lc,
+                'RATEIO FIXO': custo_fixo_por_oculos * 0.2,
+                'CUSTO TOTAL': custo_total_lc,
+                'MARGEM %': margem_lc,
+                'PREÇO SUGERIDO': preco_lc
             })
         
         # 4. ACESSÓRIOS
@@ -682,14 +574,11 @@ class IntegratedCostAnalyzer:
                 'CATEGORIA': 'ACESSÓRIOS',
                 'PRODUTO': acessorio,
                 'ESPECIFICAÇÃO': 'Acessório avulso',
-                'CUSTO DIRETO': self.format_currency(custo_acessorio),
-                'RATEIO FIXO': self.format_currency(custo_fixo_por_oculos * 0.1),
-                'CUSTO TOTAL': self.format_currency(custo_total_acessorio),
-                'MARGEM %': f"{margem_acessorio}%",
-                'PREÇO SUGERIDO': self.format_currency(preco_acessorio),
-                '_custo_total_num': custo_total_acessorio,
-                '_margem_num': margem_acessorio,
-                '_preco_num': preco_acessorio
+                'CUSTO DIRETO': custo_acessorio,
+                'RATEIO FIXO': custo_fixo_por_oculos * 0.1,
+                'CUSTO TOTAL': custo_total_acessorio,
+                'MARGEM %': margem_acessorio,
+                'PREÇO SUGERIDO': preco_acessorio
             })
         
         return pd.DataFrame(complete_products)
@@ -857,17 +746,19 @@ def show_integrated_cost_analyzer():
                 with tab1:
                     st.markdown("### Tabela Completa de Produtos")
                     
-                    # Mostrar principais produtos com melhor formatação
-                    df_display = df_analysis.copy()
+                    # Exibir tabela formatada (dados continuam numéricos em df_analysis)
+                    colunas_principais = ['PRODUTO', 'CUSTO TOTAL', 'PREÇO CALCULADO', 'MARGEM %', 'MARGEM R$']
+                    df_display = df_analysis[colunas_principais].head(15).copy()
                     
                     # Arredondar preços para valores inteiros
                     df_display['PREÇO CALCULADO'] = df_display['PREÇO CALCULADO'].round(0)
-                    df_display['MARGEM %'] = df_display['MARGEM %'].round(1)
                     
-                    # Exibir tabela formatada
-                    colunas_principais = ['PRODUTO', 'CUSTO TOTAL', 'PREÇO CALCULADO', 'MARGEM %', 'MARGEM R$']
                     st.dataframe(
-                        df_display[colunas_principais].head(15),
+                        format_frame(
+                            df_display,
+                            currency=['CUSTO TOTAL', 'PREÇO CALCULADO', 'MARGEM R$'],
+                            percent=['MARGEM %']
+                        ),
                         use_container_width=True,
                         hide_index=True
                     )
@@ -966,28 +857,28 @@ def show_integrated_cost_analyzer():
             
             with col1:
                 st.markdown("#### 1️⃣ Custos Diretos (Materiais Físicos)")
-                st.markdown(f"• **Lente:** {produto_data['CUSTO LENTE']}")
-                st.markdown(f"• **Armação:** {produto_data['CUSTO ARMAÇÃO']}")
-                st.markdown(f"• **Acessórios:** {produto_data['CUSTO ACESSÓRIOS']}")
-                st.markdown(f"• **Total Direto:** {produto_data['TOTAL DIRETO']}")
+                st.markdown(f"• **Lente:** {analyzer.format_currency(produto_data['CUSTO LENTE'])}")
+                st.markdown(f"• **Armação:** {analyzer.format_currency(produto_data['CUSTO ARMAÇÃO'])}")
+                st.markdown(f"• **Acessórios:** {analyzer.format_currency(produto_data['CUSTO ACESSÓRIOS'])}")
+                st.markdown(f"• **Total Direto:** {analyzer.format_currency(produto_data['TOTAL DIRETO'])}")
                 
                 st.markdown("#### 2️⃣ Custos Fixos Rateados")
-                st.markdown(f"• **Rateio por Óculos:** {produto_data['RATEIO FIXO']}")
+                st.markdown(f"• **Rateio por Óculos:** {analyzer.format_currency(produto_data['RATEIO FIXO'])}")
                 st.markdown(f"• **Base:** {rateio_data['meta_oculos']} óculos/mês")
                 
                 st.markdown("#### 3️⃣ Custo Total Real")
-                st.markdown(f"• **Custo Final:** {produto_data['CUSTO TOTAL']}")
+                st.markdown(f"• **Custo Final:** {analyzer.format_currency(produto_data['CUSTO TOTAL'])}")
             
             with col2:
                 st.markdown("#### 4️⃣ Análise de Mercado")
-                st.markdown(f"• **Preço Mínimo:** {produto_data['MERCADO MÍNIMO']}")
-                st.markdown(f"• **Preço Médio:** {produto_data['MERCADO MÉDIO']}")
-                st.markdown(f"• **Preço Máximo:** {produto_data['MERCADO MÁXIMO']}")
+                st.markdown(f"• **Preço Mínimo:** {analyzer.format_currency(produto_data['MERCADO MÍNIMO'])}")
+                st.markdown(f"• **Preço Médio:** {analyzer.format_currency(produto_data['MERCADO MÉDIO'])}")
+                st.markdown(f"• **Preço Máximo:** {analyzer.format_currency(produto_data['MERCADO MÁXIMO'])}")
                 
                 st.markdown("#### 5️⃣ Margens por Modalidade")
-                st.markdown(f"• **À Vista:** {produto_data['À VISTA MARGEM']}")
-                st.markdown(f"• **Antecipação:** {produto_data['ANTECIPAÇÃO MARGEM']}")
-                st.markdown(f"• **Parcelado:** {produto_data['PARCELADO MARGEM']}")
+                st.markdown(f"• **À Vista:** {produto_data['À VISTA MARGEM']:.1f}%")
+                st.markdown(f"• **Antecipação:** {produto_data['ANTECIPAÇÃO MARGEM']:.1f}%")
+                st.markdown(f"• **Parcelado:** {produto_data['PARCELADO MARGEM']:.1f}%")
             
             # Simulador de preços
             st.markdown("#### 🧮 Simulador de Preços")
@@ -995,7 +886,7 @@ def show_integrated_cost_analyzer():
             preco_teste = st.number_input(
                 "Teste um preço de venda:",
                 min_value=0.0,
-                value=float(produto_data['_preco_mercado_num']),
+                value=float(produto_data['MERCADO MÉDIO']),
                 step=10.0,
                 format="%.2f",
                 key="preco_simulacao"
@@ -1010,7 +901,7 @@ def show_integrated_cost_analyzer():
                 for i, modalidade in enumerate(modalidades):
                     with [col1, col2, col3][i]:
                         impact = analyzer.calculate_financial_impact(preco_teste, modalidade)
-                        margem_liquida = impact['valor_liquido'] - produto_data['_custo_total_num']
+                        margem_liquida = impact['valor_liquido'] - produto_data['CUSTO TOTAL']
                         percentual = (margem_liquida / impact['valor_liquido'] * 100) if impact['valor_liquido'] > 0 else 0
                         
                         st.metric(
@@ -1025,10 +916,10 @@ def show_integrated_cost_analyzer():
     
     if not df_filtered.empty:
         # Calcular estatísticas
-        margem_media_avista = df_filtered['À VISTA MARGEM'].str.replace('%', '').astype(float).mean()
-        margem_media_parcelado = df_filtered['PARCELADO MARGEM'].str.replace('%', '').astype(float).mean()
+        margem_media_avista = df_filtered['À VISTA MARGEM'].mean()
+        margem_media_parcelado = df_filtered['PARCELADO MARGEM'].mean()
         
-        produtos_lucrativos = len(df_filtered[df_filtered['À VISTA MARGEM'].str.replace('%', '').astype(float) > 15])
+        produtos_lucrativos = len(df_filtered[df_filtered['À VISTA MARGEM'] > 15])
         total_produtos = len(df_filtered)
         
         col1, col2, col3 = st.columns(3)
@@ -1068,18 +959,18 @@ def show_integrated_cost_analyzer():
             st.info("💳 **Impacto significativo das taxas financeiras.** Considere incentivar pagamentos à vista.")
         
         # Produtos com melhor e pior performance
-        melhor_produto = df_filtered.loc[df_filtered['À VISTA MARGEM'].str.replace('%', '').astype(float).idxmax()]
-        pior_produto = df_filtered.loc[df_filtered['À VISTA MARGEM'].str.replace('%', '').astype(float).idxmin()]
+        melhor_produto = df_filtered.loc[df_filtered['À VISTA MARGEM'].idxmax()]
+        pior_produto = df_filtered.loc[df_filtered['À VISTA MARGEM'].idxmin()]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.success(f"🏆 **Melhor Performance:** {melhor_produto['PRODUTO']}")
-            st.write(f"Margem: {melhor_produto['À VISTA MARGEM']}")
+            st.write(f"Margem: {melhor_produto['À VISTA MARGEM']:.1f}%")
         
         with col2:
             st.error(f"⚠️ **Menor Performance:** {pior_produto['PRODUTO']}")
-            st.write(f"Margem: {pior_produto['À VISTA MARGEM']}")
+            st.write(f"Margem: {pior_produto['À VISTA MARGEM']:.1f}%")
     
     # Seção 5: Tabela Completa de Preços
     st.markdown("## 📋 Tabela Completa de Preços - Todos os Produtos e Serviços")
@@ -1124,8 +1015,8 @@ def show_integrated_cost_analyzer():
         
         if min_preco > 0 or max_preco < 5000:
             df_filtered_complete = df_filtered_complete[
-                (df_filtered_complete['_preco_num'] >= min_preco) & 
-                (df_filtered_complete['_preco_num'] <= max_preco)
+                (df_filtered_complete['PREÇO SUGERIDO'] >= min_preco) & 
+                (df_filtered_complete['PREÇO SUGERIDO'] <= max_preco)
             ]
         
         # Controles de ordenação
@@ -1145,23 +1036,11 @@ def show_integrated_cost_analyzer():
                 key="ordem_crescente_complete"
             )
         
-        # Aplicar ordenação
-        if ordenar_por in ['PREÇO SUGERIDO', 'CUSTO TOTAL']:
-            coluna_ordenacao = f"_{ordenar_por.lower().replace(' ', '_').replace('ç', 'c')}_num"
-            if coluna_ordenacao == '_preço_sugerido_num':
-                coluna_ordenacao = '_preco_num'
-            elif coluna_ordenacao == '_custo_total_num':
-                coluna_ordenacao = '_custo_total_num'
-        elif ordenar_por == 'MARGEM %':
-            coluna_ordenacao = '_margem_num'
-        else:
-            coluna_ordenacao = ordenar_por
-        
-        if coluna_ordenacao in df_filtered_complete.columns:
-            df_filtered_complete = df_filtered_complete.sort_values(
-                by=coluna_ordenacao, 
-                ascending=ordem_crescente
-            )
+        # Aplicar ordenação (colunas numéricas ordenam direto)
+        df_filtered_complete = df_filtered_complete.sort_values(
+            by=ordenar_por, 
+            ascending=ordem_crescente
+        )
         
         # Mostrar métricas da tabela completa
         col1, col2, col3, col4 = st.columns(4)
@@ -1174,7 +1053,7 @@ def show_integrated_cost_analyzer():
         
         with col2:
             if len(df_filtered_complete) > 0:
-                preco_medio = df_filtered_complete['_preco_num'].mean()
+                preco_medio = df_filtered_complete['PREÇO SUGERIDO'].mean()
                 st.metric(
                     "Preço Médio",
                     analyzer.format_currency(preco_medio)
@@ -1182,7 +1061,7 @@ def show_integrated_cost_analyzer():
         
         with col3:
             if len(df_filtered_complete) > 0:
-                margem_media_complete = df_filtered_complete['_margem_num'].mean()
+                margem_media_complete = df_filtered_complete['MARGEM %'].mean()
                 st.metric(
                     "Margem Média",
                     f"{margem_media_complete:.0f}%"
@@ -1201,8 +1080,16 @@ def show_integrated_cost_analyzer():
             'CUSTO TOTAL', 'MARGEM %', 'PREÇO SUGERIDO'
         ]
         
-        st.dataframe(
+        # Formatação só na exibição/exportação
+        df_exibicao = format_frame(
             df_filtered_complete[colunas_exibir],
+            currency=['CUSTO TOTAL', 'PREÇO SUGERIDO'],
+            percent=['MARGEM %'],
+            percent_decimals=0
+        )
+        
+        st.dataframe(
+            df_exibicao,
             use_container_width=True,
             height=600
         )
@@ -1215,7 +1102,7 @@ def show_integrated_cost_analyzer():
         with col1:
             if st.button("📋 Copiar Tabela Completa", key="copy_complete_table"):
                 # Preparar dados para cópia
-                tabela_texto = df_filtered_complete[colunas_exibir].to_string(index=False)
+                tabela_texto = df_exibicao.to_string(index=False)
                 st.text_area(
                     "Tabela para Cópia:",
                     tabela_texto,
@@ -1225,7 +1112,7 @@ def show_integrated_cost_analyzer():
         
         with col2:
             # Converter para CSV para download
-            csv_data = df_filtered_complete[colunas_exibir].to_csv(index=False, sep=';')
+            csv_data = df_exibicao.to_csv(index=False, sep=';')
             st.download_button(
                 label="💾 Download CSV",
                 data=csv_data,
@@ -1239,19 +1126,21 @@ def show_integrated_cost_analyzer():
         
         if len(df_filtered_complete) > 0:
             analise_categoria = df_filtered_complete.groupby('CATEGORIA').agg({
-                '_preco_num': ['count', 'mean', 'min', 'max'],
-                '_margem_num': 'mean'
+                'PREÇO SUGERIDO': ['count', 'mean', 'min', 'max'],
+                'MARGEM %': 'mean'
             }).round(2)
             
             analise_categoria.columns = ['Quantidade', 'Preço Médio', 'Preço Mín', 'Preço Máx', 'Margem Média']
             
-            # Formatar preços
-            for col in ['Preço Médio', 'Preço Mín', 'Preço Máx']:
-                analise_categoria[col] = analise_categoria[col].apply(analyzer.format_currency)
-            
-            analise_categoria['Margem Média'] = analise_categoria['Margem Média'].apply(lambda x: f"{x:.0f}%")
-            
-            st.dataframe(analise_categoria, use_container_width=True)
+            st.dataframe(
+                format_frame(
+                    analise_categoria,
+                    currency=['Preço Médio', 'Preço Mín', 'Preço Máx'],
+                    percent=['Margem Média'],
+                    percent_decimals=0
+                ),
+                use_container_width=True
+            )
     
     # Footer com informações do sistema
     st.markdown("---")
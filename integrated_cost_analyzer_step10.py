@@ -5,44 +5,33 @@ Inclui análise visual avançada de custos, valuation, M&A e simuladores de cres
 """
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from typing import Dict, List, Tuple
 
+from product_catalog import get_product_catalog, TABELA_ETAPA10, TABELA_CUSTOS_DIRETOS
+from br_format import format_currency, format_frame
+from cost_allocation import CostAllocationEngine
+from inventory_model import InventoryModel
+
 class IntegratedCostAnalyzerStep10:
     """Analisador integrado de custos com dados das Projeções Financeiras - Etapa 10"""
     
     def __init__(self):
-        # Base de produtos com custos reais
-        self.lens_costs = {
-            'Monofocal Nacional': 35,
-            'Monofocal Premium': 65,
-            'Multifocal Nacional': 85,
-            'Multifocal Premium': 125,
-            'Progressiva Nacional': 145,
-            'Progressiva Premium': 195,
-            'Progressiva Grife': 285
-        }
-        
-        self.frame_costs = {
-            'Nacional Básica': 25,
-            'Nacional Premium': 45,
-            'Premium Nacional': 75,
-            'Premium Importada': 95,
-            'Grife Nacional': 135,
-            'Grife Importada': 185
-        }
+        # Base de produtos com custos reais (catálogo unificado)
+        self.catalog = get_product_catalog()
+        self.lens_costs = self.catalog.costs(TABELA_ETAPA10, 'lente')
+        self.frame_costs = self.catalog.costs(TABELA_ETAPA10, 'armacao')
         
         # Acessórios
-        self.accessories = {
-            'Limpa Lente': 2.5,
-            'Paninho': 1.8,
-            'Caixinha': 3.2,
-            'Sacolinha': 0.5,
-            'Cordinha': 4.5
-        }
+        self.accessories = self.catalog.costs(TABELA_ETAPA10, 'acessorio')
+        
+        # Motor de rateio por direcionadores (criado na primeira análise que o usa)
+        self.allocation_engine = None
+        self._allocation_drivers = None
+        
+        # Modelo de estoque do último mix analisado
+        self.inventory_model = None
     
     def extract_financial_data_step10(self) -> Dict:
         """Extrai dados das Projeções Financeiras (Etapa 10)"""
@@ -90,13 +79,14 @@ class IntegratedCostAnalyzerStep10:
             'seguros_manutencao': seguros_manutencao
         }
     
-    def calculate_fixed_cost_allocation_step10(self, financial_data: Dict) -> Dict:
+    def calculate_fixed_cost_allocation_step10(self, financial_data: Dict, business_data: Dict = None) -> Dict:
         """Calcula rateio de custos fixos por óculos vendido baseado na Etapa 10"""
         if financial_data.get('oculos_meta', 0) <= 0:
             return {'custo_fixo_por_oculos': 0, 'total_custos_fixos': 0}
         
         # Buscar dados da Etapa 10 usando as chaves corretas do session_state
-        business_data = st.session_state.business_data
+        if business_data is None:
+            business_data = st.session_state.business_data
         
         # Extrair custos reais da Etapa 10 das Projeções Financeiras
         aluguel = business_data.get('aluguel', 0)
@@ -126,53 +116,25 @@ class IntegratedCostAnalyzerStep10:
         return {
             'total_custos_fixos': total_custos_fixos,
             'custo_fixo_por_oculos': custo_fixo_por_oculos,
-            'meta_oculos': financial_data['oculos_meta']
+            'meta_oculos': financial_data['oculos_meta'],
+            'linhas': {
+                'Aluguel': aluguel,
+                'Folha CLT': salarios_clt,
+                'Optometrista': total_optometrista,
+                'Combustível': custo_combustivel,
+                'Outros Fixos': outros_fixos,
+                'Captador': custo_captador
+            }
         }
     
     def calculate_direct_costs_complete(self, lente_tipo: str, armacao_tipo: str, tratamentos: list, acessorios: list) -> Dict:
         """Calcula custos diretos completos baseado na seleção do usuário"""
         
-        # Base de custos de lentes
-        custos_lentes = {
-            "Monofocal CR-39": 25.00,
-            "Monofocal Policarbonato": 35.00,
-            "Multifocal": 85.00,
-            "Progressiva Digital": 120.00,
-            "Progressiva Premium": 180.00
-        }
-        
-        # Base de custos de armações
-        custos_armacoes = {
-            "Nacional Básica": 30.00,
-            "Nacional Premium": 55.00,
-            "Importada": 85.00,
-            "Grife Nacional": 120.00,
-            "Grife Importada": 200.00
-        }
-        
-        # Base de custos de tratamentos
-        custos_tratamentos = {
-            "Antirreflexo": 15.00,
-            "Fotossensível": 25.00,
-            "Blue Light": 20.00,
-            "Oleofóbico": 10.00,
-            "Hidrofóbico": 12.00
-        }
-        
-        # Base de custos de acessórios
-        custos_acessorios = {
-            "Limpa Lente": 2.50,
-            "Paninho": 1.80,
-            "Caixinha": 3.20,
-            "Cordinha": 4.50,
-            "Estojo Rígido": 8.00
-        }
-        
-        # Calcular custos
-        custo_lente = custos_lentes.get(lente_tipo, 25.00)
-        custo_armacao = custos_armacoes.get(armacao_tipo, 30.00)
-        custo_tratamentos_total = sum([custos_tratamentos.get(t, 0) for t in tratamentos])
-        custo_acessorios_total = sum([custos_acessorios.get(a, 0) for a in acessorios])
+        # Calcular custos (consulta direta ao catálogo)
+        custo_lente = self.catalog.cost(TABELA_CUSTOS_DIRETOS, 'lente', lente_tipo, 25.00)
+        custo_armacao = self.catalog.cost(TABELA_CUSTOS_DIRETOS, 'armacao', armacao_tipo, 30.00)
+        custo_tratamentos_total = sum([self.catalog.cost(TABELA_CUSTOS_DIRETOS, 'tratamento', t, 0) for t in tratamentos])
+        custo_acessorios_total = sum([self.catalog.cost(TABELA_CUSTOS_DIRETOS, 'acessorio', a, 0) for a in acessorios])
         
         custo_total = custo_lente + custo_armacao + custo_tratamentos_total + custo_acessorios_total
         
@@ -223,19 +185,20 @@ class IntegratedCostAnalyzerStep10:
         
         return round(preco_total / 10) * 10  # Arredondar para dezenas
     
-    def generate_complete_analysis_step10(self, financial_data: Dict, custom_margins: Dict = None) -> pd.DataFrame:
-        """Gera análise completa baseada nas Projeções Financeiras da Etapa 10"""
-        
-        # Verificar se dados são válidos
-        if not financial_data:
-            return pd.DataFrame()
-        
-        # Calcular rateio
-        rateio_data = self.calculate_fixed_cost_allocation_step10(financial_data)
-        custo_fixo_por_oculos = rateio_data['custo_fixo_por_oculos']
-        ticket_medio_atual = financial_data.get('ticket_medio', 500)
-        
-        produtos = []
+    # Margem base (multiplicador sobre o custo total) por família de lente
+    LENS_FAMILY_MARKUP = {'monofocal': 2.2, 'multifocal': 2.8, 'progressiva': 3.2}
+    
+    # Limites de classificação (PREMIUM / ALTA / MÉDIA) por grupo de produto
+    CLASSIFICATION_LIMITS = {
+        'oculos': (70, 50, 30),
+        'lentes_contato': (70, 50, 30),
+        'servicos': (80, 60, 40),
+        'acessorios': (75, 55, 35),
+        'pacotes': (65, 45, 25)
+    }
+    
+    def build_glasses_matrix(self, lens_costs: Dict, frame_costs: Dict, custo_fixo_por_oculos: float) -> pd.DataFrame:
+        """Monta a matriz lente × armação por broadcasting dos custos"""
         
         # Preços de mercado para comparação
         precos_mercado_lentes = {
@@ -249,91 +212,165 @@ class IntegratedCostAnalyzerStep10:
             "Importada Premium": 550, "Grife Nacional": 680, "Grife Importada": 950
         }
         
-        # Óculos completos (lente + armação) - ANÁLISE EXPANDIDA
-        for lente_tipo, lente_custo in self.lens_costs.items():
-            for armacao_tipo, armacao_custo in self.frame_costs.items():
-                
-                # Custos detalhados
-                custo_lente = lente_custo
-                custo_armacao = armacao_custo  
-                custo_direto = custo_lente + custo_armacao
-                custo_rateio = custo_fixo_por_oculos
-                custo_total = custo_direto + custo_rateio
-                
-                # Margens personalizadas por tipo
-                if 'monofocal' in lente_tipo.lower():
-                    margem_base = 2.2 if custom_margins else 2.2
-                elif 'multifocal' in lente_tipo.lower():
-                    margem_base = 2.8 if custom_margins else 2.8
-                elif 'progressiva' in lente_tipo.lower():
-                    margem_base = 3.2 if custom_margins else 3.2
-                else:
-                    margem_base = 2.5
-                
-                # Preços calculados
-                preco_calculado = custo_total * margem_base
-                preco_calculado = round(preco_calculado / 10) * 10
-                
-                # Preço de mercado para comparação
-                preco_mercado_lente = precos_mercado_lentes.get(lente_tipo, 350)
-                preco_mercado_armacao = precos_mercado_armacoes.get(armacao_tipo, 250)
-                preco_mercado_total = (preco_mercado_lente + preco_mercado_armacao) * 0.9  # Desconto pacote
-                preco_mercado_total = round(preco_mercado_total / 10) * 10
-                
-                # Análises de rentabilidade
-                lucro_unitario = preco_calculado - custo_total
-                margem_percentual = ((lucro_unitario / preco_calculado) * 100) if preco_calculado > 0 else 0
-                markup_percentual = ((lucro_unitario / custo_total) * 100) if custo_total > 0 else 0
-                
-                # Competitividade
-                diferenca_mercado = preco_calculado - preco_mercado_total
-                competitividade_perc = ((diferenca_mercado / preco_mercado_total) * 100) if preco_mercado_total > 0 else 0
-                
-                # Análise de breakeven
-                if lucro_unitario > 0:
-                    vendas_breakeven = rateio_data['total_custos_fixos'] / lucro_unitario
-                else:
-                    vendas_breakeven = 0
-                
-                # Ticket médio ideal e potencial de vendas
-                ticket_medio_atual = financial_data.get('ticket_medio', 500)
-                potencial_ticket = (preco_calculado / ticket_medio_atual) * 100 if ticket_medio_atual > 0 else 100
-                
-                # ROI por produto
-                investimento_produto = custo_direto * 10  # Estoque típico
-                roi_mensal = (lucro_unitario * 5) / investimento_produto * 100 if investimento_produto > 0 else 0  # 5 vendas/mês
-                
-                # Classificação de rentabilidade
-                if margem_percentual >= 70:
-                    classificacao = "PREMIUM"
-                elif margem_percentual >= 50:
-                    classificacao = "ALTA"
-                elif margem_percentual >= 30:
-                    classificacao = "MÉDIA"
-                else:
-                    classificacao = "BAIXA"
-                
-                produtos.append({
-                    'PRODUTO': f"{lente_tipo} + {armacao_tipo}",
-                    'LENTE': lente_tipo,
-                    'ARMAÇÃO': armacao_tipo,
-                    'CUSTO LENTE': custo_lente,
-                    'CUSTO ARMAÇÃO': custo_armacao,
-                    'CUSTO DIRETO': custo_direto,
-                    'RATEIO FIXO': custo_rateio,
-                    'CUSTO TOTAL': custo_total,
-                    'PREÇO CALC.': preco_calculado,
-                    'PREÇO MERCADO': preco_mercado_total,
-                    'LUCRO R$': lucro_unitario,
-                    'MARGEM %': margem_percentual,
-                    'MARKUP %': markup_percentual,
-                    'VS MERCADO %': competitividade_perc,
-                    'BREAKEVEN UND': vendas_breakeven,
-                    'POTENCIAL TICKET %': potencial_ticket,
-                    'ROI MENSAL %': roi_mensal,
-                    'CLASSIFICAÇÃO': classificacao,
-                    'STATUS COMPETITIVO': 'COMPETITIVO' if abs(competitividade_perc) <= 10 else ('CARO' if competitividade_perc > 10 else 'BARATO')
-                })
+        lentes = list(lens_costs)
+        armacoes = list(frame_costs)
+        
+        custo_lente = np.array([lens_costs[l] for l in lentes], dtype=float)[:, None]
+        custo_armacao = np.array([frame_costs[a] for a in armacoes], dtype=float)[None, :]
+        
+        # Multiplicador por família da lente (2,5 quando não reconhecida)
+        familias = pd.Series(lentes).str.lower()
+        margem_base = np.full(len(lentes), 2.5)
+        for familia, multiplicador in reversed(list(self.LENS_FAMILY_MARKUP.items())):
+            margem_base[familias.str.contains(familia).to_numpy()] = multiplicador
+        margem_base = margem_base[:, None]
+        
+        mercado_lente = np.array([precos_mercado_lentes.get(l, 350) for l in lentes], dtype=float)[:, None]
+        mercado_armacao = np.array([precos_mercado_armacoes.get(a, 250) for a in armacoes], dtype=float)[None, :]
+        
+        shape = (len(lentes), len(armacoes))
+        custo_direto = custo_lente + custo_armacao
+        preco_calculado = np.round((custo_direto + custo_fixo_por_oculos) * margem_base / 10) * 10
+        preco_mercado = np.round((mercado_lente + mercado_armacao) * 0.9 / 10) * 10  # Desconto pacote
+        
+        idx_lente, idx_armacao = (i.ravel() for i in np.indices(shape))
+        nome_lente = np.array(lentes, dtype=object)[idx_lente]
+        nome_armacao = np.array(armacoes, dtype=object)[idx_armacao]
+        
+        return pd.DataFrame({
+            'PRODUTO': nome_lente + ' + ' + nome_armacao,
+            'LENTE': nome_lente,
+            'ARMAÇÃO': nome_armacao,
+            'CUSTO LENTE': np.broadcast_to(custo_lente, shape).ravel(),
+            'CUSTO ARMAÇÃO': np.broadcast_to(custo_armacao, shape).ravel(),
+            'CUSTO DIRETO': custo_direto.ravel(),
+            'RATEIO FIXO': custo_fixo_por_oculos,
+            'PREÇO CALC.': preco_calculado.ravel(),
+            'PREÇO MERCADO': np.broadcast_to(preco_mercado, shape).ravel(),
+            'GRUPO': 'oculos',
+            'RATEIO NO LUCRO': True,
+            'VENDAS MES': 5,  # 5 vendas/mês
+            'ESTOQUE UND': 10,  # Estoque típico
+            'USA BREAKEVEN': True
+        })
+    
+    def _catalog_frame(self, itens: List[Tuple], grupo: str, lente: str, armacao: str, fracao_rateio: float,
+                       custo_fixo_por_oculos: float, vendas_mes: int, estoque: int, usa_breakeven: bool) -> pd.DataFrame:
+        """Converte uma lista (nome, custo, preço, preço mercado) em colunas base"""
+        nomes, custos, precos, precos_mercado = (np.array(col) for col in zip(*itens))
+        custos = custos.astype(float)
+        
+        return pd.DataFrame({
+            'PRODUTO': nomes,
+            'LENTE': lente,
+            'ARMAÇÃO': armacao,
+            'CUSTO LENTE': custos,
+            'CUSTO ARMAÇÃO': 0.0,
+            'CUSTO DIRETO': custos,
+            'RATEIO FIXO': custo_fixo_por_oculos * fracao_rateio,
+            'PREÇO CALC.': precos.astype(float),
+            'PREÇO MERCADO': precos_mercado.astype(float),
+            'GRUPO': grupo,
+            'RATEIO NO LUCRO': False,
+            'VENDAS MES': vendas_mes,
+            'ESTOQUE UND': estoque,
+            'USA BREAKEVEN': usa_breakeven
+        })
+    
+    def derive_profitability_columns(self, base: pd.DataFrame, total_custos_fixos: float,
+                                     ticket_medio_atual: float) -> pd.DataFrame:
+        """Calcula lucro, margens, markup, breakeven e classificação coluna a coluna"""
+        custo_direto = base['CUSTO DIRETO'].to_numpy(dtype=float)
+        rateio = base['RATEIO FIXO'].to_numpy(dtype=float)
+        preco = base['PREÇO CALC.'].to_numpy(dtype=float)
+        preco_mercado = base['PREÇO MERCADO'].to_numpy(dtype=float)
+        rateio_no_lucro = base['RATEIO NO LUCRO'].to_numpy(dtype=bool)
+        vendas_mes = base['VENDAS MES'].to_numpy(dtype=float)
+        estoque = base['ESTOQUE UND'].to_numpy(dtype=float)
+        
+        custo_total = custo_direto + rateio
+        # Óculos descontam o rateio do lucro; demais grupos usam só o custo direto
+        custo_lucro = np.where(rateio_no_lucro, custo_total, custo_direto)
+        lucro = preco - custo_lucro
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            margem = np.where(preco > 0, lucro / preco * 100, 0.0)
+            markup = np.where(custo_lucro > 0, lucro / custo_lucro * 100, 0.0)
+            competitividade = np.where(preco_mercado > 0, (preco - preco_mercado) / preco_mercado * 100, 0.0)
+            breakeven = np.where(base['USA BREAKEVEN'].to_numpy(dtype=bool) & (lucro > 0), total_custos_fixos / lucro, 0.0)
+            investimento = custo_direto * estoque
+            roi_mensal = np.where(investimento > 0, (lucro * vendas_mes) / investimento * 100, 0.0)
+        
+        potencial_ticket = preco / ticket_medio_atual * 100 if ticket_medio_atual > 0 else np.full(len(base), 100.0)
+        
+        grupos = pd.Categorical(base['GRUPO'], categories=list(self.CLASSIFICATION_LIMITS)).codes
+        limites = np.array(list(self.CLASSIFICATION_LIMITS.values()), dtype=float)[grupos]
+        classificacao = np.select(
+            [margem >= limites[:, 0], margem >= limites[:, 1], margem >= limites[:, 2]],
+            ['PREMIUM', 'ALTA', 'MÉDIA'],
+            default='BAIXA'
+        )
+        status = np.select(
+            [np.abs(competitividade) <= 10, competitividade > 10],
+            ['COMPETITIVO', 'CARO'],
+            default='BARATO'
+        )
+        
+        return pd.DataFrame({
+            'PRODUTO': base['PRODUTO'].to_numpy(),
+            'LENTE': base['LENTE'].to_numpy(),
+            'ARMAÇÃO': base['ARMAÇÃO'].to_numpy(),
+            'CUSTO LENTE': base['CUSTO LENTE'].to_numpy(dtype=float),
+            'CUSTO ARMAÇÃO': base['CUSTO ARMAÇÃO'].to_numpy(dtype=float),
+            'CUSTO DIRETO': custo_direto,
+            'RATEIO FIXO': rateio,
+            'CUSTO TOTAL': custo_total,
+            'PREÇO CALC.': preco,
+            'PREÇO MERCADO': preco_mercado,
+            'LUCRO R$': lucro,
+            'MARGEM %': margem,
+            'MARKUP %': markup,
+            'VS MERCADO %': competitividade,
+            'BREAKEVEN UND': breakeven,
+            'POTENCIAL TICKET %': potencial_ticket,
+            'ROI MENSAL %': roi_mensal,
+            'CLASSIFICAÇÃO': classificacao,
+            'STATUS COMPETITIVO': status
+        })
+    
+    def apply_driver_allocation(self, base: pd.DataFrame, linhas: Dict, allocation_drivers: Dict) -> pd.DataFrame:
+        """Substitui as frações fixas de rateio pelo rateio por direcionadores (motor reaproveitado entre execuções)"""
+        engine = self.allocation_engine
+        if (engine is None or engine.products != list(base['PRODUTO'])
+                or engine.lines != list(linhas) or self._allocation_drivers != allocation_drivers):
+            engine = CostAllocationEngine.from_analysis(base, linhas, allocation_drivers)
+            self.allocation_engine = engine
+            self._allocation_drivers = dict(allocation_drivers)
+        else:
+            # Mesmo catálogo: recalcula só as linhas de custo e produtos alterados
+            engine.update(linhas, units=base['VENDAS MES'], prices=base['PREÇO CALC.'])
+        
+        base = base.copy()
+        base['RATEIO FIXO'] = engine.per_unit()
+        # Com rateio por direcionadores todo produto absorve sua parcela dos custos fixos
+        base['RATEIO NO LUCRO'] = True
+        return base
+    
+    def generate_complete_analysis_step10(self, financial_data: Dict, custom_margins: Dict = None,
+                                          allocation_drivers: Dict = None, business_data: Dict = None) -> pd.DataFrame:
+        """Gera análise completa baseada nas Projeções Financeiras da Etapa 10"""
+        
+        # Verificar se dados são válidos
+        if not financial_data:
+            return pd.DataFrame()
+        
+        # Calcular rateio
+        rateio_data = self.calculate_fixed_cost_allocation_step10(financial_data, business_data)
+        custo_fixo_por_oculos = rateio_data['custo_fixo_por_oculos']
+        ticket_medio_atual = financial_data.get('ticket_medio', 500)
+        
+        # Óculos completos (lente + armação) - matriz vetorizada
+        oculos = self.build_glasses_matrix(self.lens_costs, self.frame_costs, custo_fixo_por_oculos)
         
         # Lentes de Contato
         lentes_contato = [
@@ -345,36 +382,6 @@ class IntegratedCostAnalyzerStep10:
             ('LC Terapêutica', 85, 350, 520)
         ]
         
-        for lc_nome, custo_lc, preco_calc_lc, preco_mercado_lc in lentes_contato:
-            lucro_lc = preco_calc_lc - custo_lc
-            margem_lc = ((lucro_lc / preco_calc_lc) * 100) if preco_calc_lc > 0 else 0
-            markup_lc = ((lucro_lc / custo_lc) * 100) if custo_lc > 0 else 0
-            comp_lc = ((preco_calc_lc - preco_mercado_lc) / preco_mercado_lc * 100) if preco_mercado_lc > 0 else 0
-            
-            classificacao_lc = "PREMIUM" if margem_lc >= 70 else ("ALTA" if margem_lc >= 50 else ("MÉDIA" if margem_lc >= 30 else "BAIXA"))
-            
-            produtos.append({
-                'PRODUTO': lc_nome,
-                'LENTE': 'Lente de Contato',
-                'ARMAÇÃO': 'N/A',
-                'CUSTO LENTE': custo_lc,
-                'CUSTO ARMAÇÃO': 0,
-                'CUSTO DIRETO': custo_lc,
-                'RATEIO FIXO': 0,  # LC não tem rateio significativo
-                'CUSTO TOTAL': custo_lc,
-                'PREÇO CALC.': preco_calc_lc,
-                'PREÇO MERCADO': preco_mercado_lc,
-                'LUCRO R$': lucro_lc,
-                'MARGEM %': margem_lc,
-                'MARKUP %': markup_lc,
-                'VS MERCADO %': comp_lc,
-                'BREAKEVEN UND': 0,
-                'POTENCIAL TICKET %': (preco_calc_lc / ticket_medio_atual) * 100 if ticket_medio_atual > 0 else 100,
-                'ROI MENSAL %': (lucro_lc * 8) / (custo_lc * 15) * 100,  # 8 vendas, estoque 15 unidades
-                'CLASSIFICAÇÃO': classificacao_lc,
-                'STATUS COMPETITIVO': 'COMPETITIVO' if abs(comp_lc) <= 10 else ('CARO' if comp_lc > 10 else 'BARATO')
-            })
-
         # Serviços Profissionais
         servicos = [
             ('Exame de Vista Completo', 25, 120, 150),
@@ -389,39 +396,6 @@ class IntegratedCostAnalyzerStep10:
             ('Certificado Oftalmológico', 10, 50, 60)
         ]
         
-        for servico_nome, custo_servico, preco_servico, preco_mercado_serv in servicos:
-            lucro_serv = preco_servico - custo_servico
-            margem_serv = ((lucro_serv / preco_servico) * 100) if preco_servico > 0 else 0
-            markup_serv = ((lucro_serv / custo_servico) * 100) if custo_servico > 0 else 0
-            comp_serv = ((preco_servico - preco_mercado_serv) / preco_mercado_serv * 100) if preco_mercado_serv > 0 else 0
-            
-            # Serviços tem breakeven específico
-            breakeven_serv = rateio_data['total_custos_fixos'] / lucro_serv if lucro_serv > 0 else 0
-            
-            classificacao_serv = "PREMIUM" if margem_serv >= 80 else ("ALTA" if margem_serv >= 60 else ("MÉDIA" if margem_serv >= 40 else "BAIXA"))
-            
-            produtos.append({
-                'PRODUTO': servico_nome,
-                'LENTE': 'Serviço',
-                'ARMAÇÃO': 'N/A',
-                'CUSTO LENTE': custo_servico,
-                'CUSTO ARMAÇÃO': 0,
-                'CUSTO DIRETO': custo_servico,
-                'RATEIO FIXO': custo_fixo_por_oculos * 0.3,  # Serviços usam menos infraestrutura
-                'CUSTO TOTAL': custo_servico + (custo_fixo_por_oculos * 0.3),
-                'PREÇO CALC.': preco_servico,
-                'PREÇO MERCADO': preco_mercado_serv,
-                'LUCRO R$': lucro_serv,
-                'MARGEM %': margem_serv,
-                'MARKUP %': markup_serv,
-                'VS MERCADO %': comp_serv,
-                'BREAKEVEN UND': breakeven_serv,
-                'POTENCIAL TICKET %': (preco_servico / ticket_medio_atual) * 100 if ticket_medio_atual > 0 else 100,
-                'ROI MENSAL %': (lucro_serv * 12) / custo_servico * 100,  # 12 atendimentos/mês
-                'CLASSIFICAÇÃO': classificacao_serv,
-                'STATUS COMPETITIVO': 'COMPETITIVO' if abs(comp_serv) <= 10 else ('CARO' if comp_serv > 10 else 'BARATO')
-            })
-
         # Acessórios e Produtos Complementares
         acessorios = [
             ('Limpa Lente Premium', 3.5, 25, 30),
@@ -436,40 +410,6 @@ class IntegratedCostAnalyzerStep10:
             ('Protetor Solar Ocular', 25, 120, 150)
         ]
         
-        for acess_nome, custo_acess, preco_acess, preco_mercado_acess in acessorios:
-            lucro_acess = preco_acess - custo_acess
-            margem_acess = ((lucro_acess / preco_acess) * 100) if preco_acess > 0 else 0
-            markup_acess = ((lucro_acess / custo_acess) * 100) if custo_acess > 0 else 0
-            comp_acess = ((preco_acess - preco_mercado_acess) / preco_mercado_acess * 100) if preco_mercado_acess > 0 else 0
-            
-            # Acessórios tem baixo rateio
-            rateio_acess = custo_fixo_por_oculos * 0.1  # Apenas 10% do rateio
-            custo_total_acess = custo_acess + rateio_acess
-            
-            classificacao_acess = "PREMIUM" if margem_acess >= 75 else ("ALTA" if margem_acess >= 55 else ("MÉDIA" if margem_acess >= 35 else "BAIXA"))
-            
-            produtos.append({
-                'PRODUTO': acess_nome,
-                'LENTE': 'Acessório',
-                'ARMAÇÃO': 'N/A',
-                'CUSTO LENTE': custo_acess,
-                'CUSTO ARMAÇÃO': 0,
-                'CUSTO DIRETO': custo_acess,
-                'RATEIO FIXO': rateio_acess,
-                'CUSTO TOTAL': custo_total_acess,
-                'PREÇO CALC.': preco_acess,
-                'PREÇO MERCADO': preco_mercado_acess,
-                'LUCRO R$': lucro_acess,
-                'MARGEM %': margem_acess,
-                'MARKUP %': markup_acess,
-                'VS MERCADO %': comp_acess,
-                'BREAKEVEN UND': rateio_data['total_custos_fixos'] / lucro_acess if lucro_acess > 0 else 0,
-                'POTENCIAL TICKET %': (preco_acess / ticket_medio_atual) * 100 if ticket_medio_atual > 0 else 100,
-                'ROI MENSAL %': (lucro_acess * 25) / (custo_acess * 30) * 100,  # 25 vendas, estoque 30 unidades
-                'CLASSIFICAÇÃO': classificacao_acess,
-                'STATUS COMPETITIVO': 'COMPETITIVO' if abs(comp_acess) <= 10 else ('CARO' if comp_acess > 10 else 'BARATO')
-            })
-
         # Pacotes e Combos (produtos premium)
         pacotes = [
             ('Óculos Completo Básico', 150, 450, 520),
@@ -480,45 +420,33 @@ class IntegratedCostAnalyzerStep10:
             ('Pacote Anual LC', 180, 580, 700)
         ]
         
-        for pacote_nome, custo_pacote, preco_pacote, preco_mercado_pacote in pacotes:
-            lucro_pacote = preco_pacote - custo_pacote
-            margem_pacote = ((lucro_pacote / preco_pacote) * 100) if preco_pacote > 0 else 0
-            markup_pacote = ((lucro_pacote / custo_pacote) * 100) if custo_pacote > 0 else 0
-            comp_pacote = ((preco_pacote - preco_mercado_pacote) / preco_mercado_pacote * 100) if preco_mercado_pacote > 0 else 0
-            
-            # Pacotes tem rateio reduzido (economia de escala)
-            rateio_pacote = custo_fixo_por_oculos * 0.7
-            custo_total_pacote = custo_pacote + rateio_pacote
-            
-            classificacao_pacote = "PREMIUM" if margem_pacote >= 65 else ("ALTA" if margem_pacote >= 45 else ("MÉDIA" if margem_pacote >= 25 else "BAIXA"))
-            
-            produtos.append({
-                'PRODUTO': pacote_nome,
-                'LENTE': 'Pacote',
-                'ARMAÇÃO': 'Combo',
-                'CUSTO LENTE': custo_pacote * 0.6,  # Estimativa 60% lentes
-                'CUSTO ARMAÇÃO': custo_pacote * 0.4,  # Estimativa 40% armação
-                'CUSTO DIRETO': custo_pacote,
-                'RATEIO FIXO': rateio_pacote,
-                'CUSTO TOTAL': custo_total_pacote,
-                'PREÇO CALC.': preco_pacote,
-                'PREÇO MERCADO': preco_mercado_pacote,
-                'LUCRO R$': lucro_pacote,
-                'MARGEM %': margem_pacote,
-                'MARKUP %': markup_pacote,
-                'VS MERCADO %': comp_pacote,
-                'BREAKEVEN UND': rateio_data['total_custos_fixos'] / lucro_pacote if lucro_pacote > 0 else 0,
-                'POTENCIAL TICKET %': (preco_pacote / ticket_medio_atual) * 100 if ticket_medio_atual > 0 else 100,
-                'ROI MENSAL %': (lucro_pacote * 3) / (custo_pacote * 5) * 100,  # 3 vendas, estoque 5 unidades
-                'CLASSIFICAÇÃO': classificacao_pacote,
-                'STATUS COMPETITIVO': 'COMPETITIVO' if abs(comp_pacote) <= 10 else ('CARO' if comp_pacote > 10 else 'BARATO')
-            })
-        
-        return pd.DataFrame(produtos)
+        # LC não tem rateio significativo; serviços e acessórios usam menos infraestrutura;
+        # pacotes têm rateio reduzido (economia de escala)
+        lc_df = self._catalog_frame(lentes_contato, 'lentes_contato', 'Lente de Contato', 'N/A', 0.0,
+                                    custo_fixo_por_oculos, vendas_mes=8, estoque=15, usa_breakeven=False)
+        servicos_df = self._catalog_frame(servicos, 'servicos', 'Serviço', 'N/A', 0.3,
+                                          custo_fixo_por_oculos, vendas_mes=12, estoque=1, usa_breakeven=True)
+        acessorios_df = self._catalog_frame(acessorios, 'acessorios', 'Acessório', 'N/A', 0.1,
+                                            custo_fixo_por_oculos, vendas_mes=25, estoque=30, usa_breakeven=True)
+        pacotes_df = self._catalog_frame(pacotes, 'pacotes', 'Pacote', 'Combo', 0.7,
+                                         custo_fixo_por_oculos, vendas_mes=3, estoque=5, usa_breakeven=True)
+        
+        # Estimativa 60% lentes / 40% armação no custo dos pacotes
+        pacotes_df['CUSTO ARMAÇÃO'] = pacotes_df['CUSTO DIRETO'] * 0.4
+        pacotes_df['CUSTO LENTE'] = pacotes_df['CUSTO DIRETO'] * 0.6
+        
+        base = pd.concat([oculos, lc_df, servicos_df, acessorios_df, pacotes_df], ignore_index=True)
+        
+        # Estoque médio pelo modelo (s, Q) com prazos de entrega dos fornecedores; serviços não têm estoque
+        self.inventory_model = InventoryModel.from_analysis(base)
+        base.loc[self.inventory_model.positions, 'ESTOQUE UND'] = np.ceil(self.inventory_model.estoque_medio)
+        if allocation_drivers and rateio_data.get('linhas'):
+            base = self.apply_driver_allocation(base, rateio_data['linhas'], allocation_drivers)
+        return self.derive_profitability_columns(base, rateio_data['total_custos_fixos'], ticket_medio_atual)
     
     def format_currency(self, value: float) -> str:
         """Formata valor como moeda brasileira"""
-        return f"R$ {value:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        return format_currency(value)
     
     def create_cost_breakdown_chart(self, custos_diretos: Dict, custo_indireto: float) -> go.Figure:
         """Cria gráfico de breakdown de custos por percentual"""
@@ -605,6 +533,7 @@ class IntegratedCostAnalyzerStep10:
     
     def create_sensitivity_analysis(self, custos_base: Dict, margem_base: float) -> go.Figure:
         """Cria análise de sensibilidade para variações de custo e margem"""
+        from plotly.subplots import make_subplots
         
         # Variações de custo (-20% a +20%)
         cost_variations = np.arange(-20, 25, 5)
@@ -659,7 +588,10 @@ def show_integrated_cost_analyzer_step10():
     st.title("🏭 Sistema Integrado de Análise de Custos")
     st.markdown("**Integração 100% com Estrutura de Custos da Etapa 10**")
     
-    analyzer = IntegratedCostAnalyzerStep10()
+    # Analisador mantido entre execuções para reaproveitar o motor de rateio
+    if 'analyzer_step10' not in st.session_state:
+        st.session_state.analyzer_step10 = IntegratedCostAnalyzerStep10()
+    analyzer = st.session_state.analyzer_step10
     
     # Extrair dados das Projeções Financeiras (Etapa 10)
     financial_data = analyzer.extract_financial_data_step10()
@@ -949,9 +881,57 @@ def show_integrated_cost_analyzer_step10():
         lucro_simulado = receita_simulada - custo_simulado
         st.metric("Lucro Mensal", analyzer.format_currency(lucro_simulado))
     
+    # Método de rateio dos custos fixos
+    metodo_rateio = st.radio(
+        "Método de rateio dos custos fixos",
+        ["Meta de óculos (padrão)", "Direcionadores por linha de custo"],
+        horizontal=True,
+        key="metodo_rateio_step10"
+    )
+    allocation_drivers = None
+    if metodo_rateio == "Direcionadores por linha de custo":
+        with st.expander("⚙️ Direcionador de cada linha de custo", expanded=False):
+            opcoes_driver = list(CostAllocationEngine.DRIVERS)
+            allocation_drivers = {}
+            for linha, driver_padrao in CostAllocationEngine.DEFAULT_LINE_DRIVERS.items():
+                allocation_drivers[linha] = st.selectbox(
+                    linha,
+                    opcoes_driver,
+                    index=opcoes_driver.index(driver_padrao),
+                    format_func=CostAllocationEngine.DRIVERS.get,
+                    key=f"driver_rateio_{linha}"
+                )
+    
     # Gerar análise completa
     custom_margins = st.session_state.get('custom_margins_step10', None)
-    df_analysis = analyzer.generate_complete_analysis_step10(financial_data, custom_margins)
+    df_analysis = analyzer.generate_complete_analysis_step10(financial_data, custom_margins, allocation_drivers)
+    
+    if analyzer.inventory_model is not None:
+        # Cobertura de estoque usada pelo fluxo de caixa da Etapa 10
+        st.session_state.business_data['cobertura_estoque_meses'] = analyzer.inventory_model.coverage_months()
+        with st.expander("📦 Estoque e Capital de Giro", expanded=False):
+            col_est1, col_est2, col_est3 = st.columns(3)
+            with col_est1:
+                st.metric("Capital em Estoque (médio)", analyzer.format_currency(analyzer.inventory_model.total_value()))
+            with col_est2:
+                st.metric("Cobertura", f"{analyzer.inventory_model.coverage_months() * 30:.0f} dias de CMV")
+            with col_est3:
+                st.metric("Nível de Serviço", f"{analyzer.inventory_model.nivel_servico * 100:.0f}%")
+            tabela_estoque = analyzer.inventory_model.table().sort_values('VALOR MÉDIO', ascending=False)
+            st.dataframe(
+                format_frame(tabela_estoque, currency=['VALOR MÉDIO']).round(1),
+                use_container_width=True,
+                hide_index=True
+            )
+    
+    if allocation_drivers and analyzer.allocation_engine is not None:
+        with st.expander("📋 Rateio por linha de custo", expanded=False):
+            resumo_rateio = analyzer.allocation_engine.summary()
+            st.dataframe(
+                format_frame(resumo_rateio, currency=['CUSTO MENSAL', 'RATEADO']),
+                use_container_width=True,
+                hide_index=True
+            )
     
     if not df_analysis.empty:
         # Tabs organizadas
@@ -0,0 +1,124 @@
+"""
+Modelo de Estoque e Capital de Giro (Lentes e Armações)
+Estoque de segurança, ponto de pedido, lote, estoque médio e capital parado
+por SKU calculados como arrays a partir do mix de produtos e dos prazos de
+entrega dos fornecedores, alimentando o fluxo de caixa
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+DIAS_POR_MES = 30
+
+
+class InventoryModel:
+    """Array-based (s, Q) inventory model over a SKU list"""
+
+    # Prazo de entrega do fornecedor e intervalo entre pedidos (dias) por grupo estocável
+    LEAD_TIME_DAYS = {'oculos': 7, 'lentes_contato': 5, 'acessorios': 20, 'pacotes': 7}
+    ORDER_CYCLE_DAYS = {'oculos': 30, 'lentes_contato': 15, 'acessorios': 45, 'pacotes': 30}
+
+    DEFAULT_SERVICE_LEVEL = 0.95
+    DEFAULT_DEMAND_CV = 0.5  # Desvio padrão da demanda mensal / demanda média
+
+    def __init__(self, skus, demanda_mes, custo_unitario, lead_time_dias, ciclo_pedido_dias,
+                 cv_demanda=DEFAULT_DEMAND_CV, nivel_servico=DEFAULT_SERVICE_LEVEL):
+        self.skus = np.asarray(skus, dtype=object)
+        n = len(self.skus)
+        self.demanda_mes = np.broadcast_to(np.asarray(demanda_mes, dtype=float), (n,)).copy()
+        self.custo_unitario = np.broadcast_to(np.asarray(custo_unitario, dtype=float), (n,)).copy()
+        self.lead_time_dias = np.broadcast_to(np.asarray(lead_time_dias, dtype=float), (n,)).copy()
+        self.ciclo_pedido_dias = np.broadcast_to(np.asarray(ciclo_pedido_dias, dtype=float), (n,)).copy()
+        self.cv_demanda = np.broadcast_to(np.asarray(cv_demanda, dtype=float), (n,)).copy()
+        self.nivel_servico = nivel_servico
+        self.z = NormalDist().inv_cdf(nivel_servico)
+        self._calculate()
+
+    @classmethod
+    def from_analysis(cls, base, lead_times=None, order_cycles=None, **kwargs):
+        """Model for the stocked groups of the step 10 product table (services are not stocked)"""
+        lead_times = {**cls.LEAD_TIME_DAYS, **(lead_times or {})}
+        order_cycles = {**cls.ORDER_CYCLE_DAYS, **(order_cycles or {})}
+        estocavel = base['GRUPO'].isin(list(lead_times)).to_numpy()
+        itens = base[estocavel]
+        model = cls(
+            itens['PRODUTO'].to_numpy(),
+            itens['VENDAS MES'].to_numpy(dtype=float),
+            itens['CUSTO DIRETO'].to_numpy(dtype=float),
+            itens['GRUPO'].map(lead_times).to_numpy(dtype=float),
+            itens['GRUPO'].map(order_cycles).to_numpy(dtype=float),
+            **kwargs
+        )
+        model.positions = np.flatnonzero(estocavel)
+        return model
+
+    @classmethod
+    def with_variants(cls, skus, variantes, demanda_mes, custo_unitario, lead_time_dias, ciclo_pedido_dias, **kwargs):
+        """Expand models × variants (e.g. frame models × colors), splitting each model's demand evenly"""
+        skus = np.asarray(skus, dtype=object)
+        variantes = np.asarray(variantes, dtype=object)
+        n_variantes = len(variantes)
+
+        def por_variante(valores):
+            return np.repeat(np.broadcast_to(np.asarray(valores, dtype=float), (len(skus),)), n_variantes)
+
+        nomes = np.repeat(skus, n_variantes) + ' - ' + np.tile(variantes, len(skus))
+        return cls(
+            nomes,
+            por_variante(demanda_mes) / n_variantes,
+            por_variante(custo_unitario),
+            por_variante(lead_time_dias),
+            por_variante(ciclo_pedido_dias),
+            **kwargs
+        )
+
+    def _calculate(self):
+        """Safety stock, reorder point, lot size and average stock for every SKU"""
+        demanda_dia = self.demanda_mes / DIAS_POR_MES
+        # Desvio diário a partir do mensal, supondo dias independentes
+        desvio_dia = self.cv_demanda * self.demanda_mes / np.sqrt(DIAS_POR_MES)
+
+        self.estoque_seguranca = self.z * desvio_dia * np.sqrt(self.lead_time_dias)
+        self.ponto_pedido = demanda_dia * self.lead_time_dias + self.estoque_seguranca
+        self.lote = demanda_dia * self.ciclo_pedido_dias
+        self.estoque_medio = self.lote / 2 + self.estoque_seguranca
+        self.estoque_maximo = self.lote + self.estoque_seguranca
+        self.valor_medio = self.estoque_medio * self.custo_unitario
+
+    def set_demand(self, positions, demanda_mes):
+        """Change the demand of some SKUs and recompute"""
+        self.demanda_mes[positions] = demanda_mes
+        self._calculate()
+
+    def total_value(self):
+        """Average stock value across all SKUs (cash tied up in inventory)"""
+        return float(self.valor_medio.sum())
+
+    def coverage_months(self):
+        """Average stock value in months of cost of goods sold"""
+        cmv_mensal = float((self.demanda_mes * self.custo_unitario).sum())
+        return self.total_value() / cmv_mensal if cmv_mensal > 0 else 0.0
+
+    def stock_value_path(self, demand_scale):
+        """Average stock value per month when the whole mix scales by demand_scale
+
+        Lot size and safety stock are both linear in demand (constant CV),
+        so the stock value scales with it.
+        """
+        return self.total_value() * np.asarray(demand_scale, dtype=float)
+
+    def table(self):
+        """Per-SKU inventory parameters"""
+        return pd.DataFrame({
+            'SKU': self.skus,
+            'DEMANDA MES': self.demanda_mes,
+            'LEAD TIME (DIAS)': self.lead_time_dias,
+            'ESTOQUE SEGURANÇA': self.estoque_seguranca,
+            'PONTO DE PEDIDO': self.ponto_pedido,
+            'LOTE': self.lote,
+            'ESTOQUE MÉDIO': self.estoque_medio,
+            'VALOR MÉDIO': self.valor_medio
+        })
+
@@ -3,440 +3,29 @@ Gerador de Relatório "Resposta ao Investidor"
 Baseado no checklist completo para investidores
 """
 
-import pandas as pd
-from datetime import datetime
+from investor_sections import CHECKLIST, get_investor_sections
 
 class InvestorReportGenerator:
     """Gerador de relatório estruturado para investidores"""
     
     def __init__(self):
-        self.checklist_items = {
-            'proposito_problema': {
-                'title': '1. PROPÓSITO E PROBLEMA',
-                'questions': [
-                    'O problema que o negócio resolve é claro e real?',
-                    'Existe uma dor latente ou necessidade urgente no mercado?',
-                    'O problema afeta um número relevante de pessoas/empresas?'
-                ]
-            },
-            'solucao_valor': {
-                'title': '2. SOLUÇÃO E PROPOSTA DE VALOR',
-                'questions': [
-                    'A solução é objetiva e bem explicada?',
-                    'A proposta de valor é única ou claramente superior à dos concorrentes?',
-                    'A solução já foi validada com clientes (MVP, protótipo, cases)?'
-                ]
-            },
-            'produto_servico': {
-                'title': '3. PRODUTO / SERVIÇO',
-                'questions': [
-                    'O produto está pronto ou em que estágio se encontra?',
-                    'Ele é escalável? Pode crescer com custos proporcionais menores?',
-                    'Há alguma patente, registro ou proteção da propriedade intelectual?'
-                ]
-            },
-            'mercado_oportunidade': {
-                'title': '4. MERCADO E OPORTUNIDADE',
-                'questions': [
-                    'O tamanho de mercado (TAM, SAM, SOM) foi calculado corretamente?',
-                    'O mercado está em crescimento ou declínio?',
-                    'Existe apetite de investimento nesse setor?'
-                ]
-            },
-            'concorrencia': {
-                'title': '5. CONCORRÊNCIA E DIFERENCIAL',
-                'questions': [
-                    'Quem são os principais concorrentes diretos e indiretos?',
-                    'O que diferencia o seu negócio de forma clara e defensável?',
-                    'Há barreiras de entrada reais (tecnologia, rede, marca)?'
-                ]
-            },
-            'modelo_negocio': {
-                'title': '6. MODELO DE NEGÓCIO E MONETIZAÇÃO',
-                'questions': [
-                    'Como a empresa gera receita?',
-                    'Quais os canais de receita (venda única, recorrência, assinatura)?',
-                    'Qual é o ticket médio e a margem?'
-                ]
-            },
-            'marketing_vendas': {
-                'title': '7. MARKETING E VENDAS',
-                'questions': [
-                    'Como serão adquiridos os clientes (canais e estratégias)?',
-                    'A estratégia de marketing é clara e mensurável?',
-                    'Existe uma máquina de vendas estruturada?'
-                ]
-            },
-            'operacoes': {
-                'title': '8. OPERAÇÕES E ESCALABILIDADE',
-                'questions': [
-                    'Como é feita a entrega do produto/serviço?',
-                    'Há processos definidos para crescimento?',
-                    'A operação depende de muitas pessoas ou é automatizável?'
-                ]
-            },
-            'time': {
-                'title': '9. TIME',
-                'questions': [
-                    'Quem são os fundadores? Qual sua experiência?',
-                    'As competências são complementares?',
-                    'Existe dedicação exclusiva e alinhamento de visão?'
-                ]
-            },
-            'indicadores_financeiros': {
-                'title': '10. INDICADORES FINANCEIROS',
-                'questions': [
-                    'Há demonstrações projetadas (DRE, Fluxo de Caixa, Balanço)?',
-                    'As projeções são realistas, baseadas em premissas claras?',
-                    'Qual o ponto de equilíbrio e o tempo para alcançá-lo?'
-                ]
-            },
-            'investimento_valuation': {
-                'title': '11. INVESTIMENTO E VALUATION',
-                'questions': [
-                    'Quanto está sendo solicitado de investimento?',
-                    'Para onde os recursos serão direcionados (uso dos fundos)?',
-                    'O valuation está alinhado com o estágio da empresa?',
-                    'A estrutura societária (cap table) é saudável?'
-                ]
-            },
-            'riscos_saida': {
-                'title': '12. RISCOS E PLANO DE SAÍDA',
-                'questions': [
-                    'Quais são os principais riscos (técnicos, regulatórios, mercado)?',
-                    'Há plano de mitigação para cada risco?',
-                    'Qual a estratégia de saída do investidor (exit)? Venda, IPO, aquisição?'
-                ]
-            }
-        }
+        self.checklist_items = CHECKLIST
     
     def generate_investor_report(self, business_data):
         """Gera relatório completo para investidores"""
-        
-        report_sections = []
-        
-        # Header do relatório
-        nome_empresa = business_data.get('nome_loja', 'Ótica [Nome]')
-        data_relatorio = datetime.now().strftime("%d/%m/%Y")
-        
-        report_sections.append(f"""
-# RESPOSTA AO INVESTIDOR
-## {nome_empresa}
-**Data:** {data_relatorio}
-
----
-
-## RESUMO EXECUTIVO
-
-{self._generate_executive_summary(business_data)}
-
----
-        """)
-        
-        # Seções do checklist
-        for section_key, section_data in self.checklist_items.items():
-            section_content = self._generate_section_content(section_key, section_data, business_data)
-            report_sections.append(section_content)
-        
-        # Indicadores financeiros resumidos
-        report_sections.append(self._generate_financial_indicators(business_data))
-        
-        # Conclusão e recomendação
-        report_sections.append(self._generate_conclusion(business_data))
-        
-        return '\n'.join(report_sections)
-    
-    def _generate_executive_summary(self, business_data):
-        """Gera resumo executivo"""
-        receita_mensal = business_data.get('receita_mensal_produtos', 0)
-        investimento_total = business_data.get('total_investimento', 0)
-        roi_estimado = business_data.get('roi_investimento', 0)
-        
-        return f"""
-**OPORTUNIDADE DE INVESTIMENTO: SETOR ÓPTICO**
-
-• **Mercado:** Setor de ótica no Brasil movimenta R$ 3,2 bilhões/ano, crescimento 5-8% a.a.
-• **Modelo:** Varejo especializado com foco em produtos de alta margem e serviços
-• **Receita Projetada:** R$ {receita_mensal:,.0f}/mês (R$ {receita_mensal*12:,.0f}/ano)
-• **Investimento Necessário:** R$ {investimento_total:,.0f}
-• **ROI Estimado:** {roi_estimado:.1f}% ao ano
-• **Diferencial:** Atendimento personalizado, tecnologia e parcerias médicas
-
-**PROPOSTA:** Investimento em ótica com modelo validado, mercado estável e alta lucratividade.
-        """
-    
-    def _generate_section_content(self, section_key, section_data, business_data):
-        """Gera conteúdo de cada seção do checklist"""
-        content = f"\n## {section_data['title']}\n\n"
-        
-        if section_key == 'proposito_problema':
-            content += self._section_proposito_problema(business_data)
-        elif section_key == 'solucao_valor':
-            content += self._section_solucao_valor(business_data)
-        elif section_key == 'produto_servico':
-            content += self._section_produto_servico(business_data)
-        elif section_key == 'mercado_oportunidade':
-            content += self._section_mercado_oportunidade(business_data)
-        elif section_key == 'concorrencia':
-            content += self._section_concorrencia(business_data)
-        elif section_key == 'modelo_negocio':
-            content += self._section_modelo_negocio(business_data)
-        elif section_key == 'marketing_vendas':
-            content += self._section_marketing_vendas(business_data)
-        elif section_key == 'operacoes':
-            content += self._section_operacoes(business_data)
-        elif section_key == 'time':
-            content += self._section_time(business_data)
-        elif section_key == 'indicadores_financeiros':
-            content += self._section_indicadores_financeiros(business_data)
-        elif section_key == 'investimento_valuation':
-            content += self._section_investimento_valuation(business_data)
-        elif section_key == 'riscos_saida':
-            content += self._section_riscos_saida(business_data)
-        
-        return content + "\n---\n"
-    
-    def _section_proposito_problema(self, business_data):
-        return """
-✅ **PROBLEMA CLARO E VALIDADO**
-
-• **Problema:** Dificuldade de acesso a produtos ópticos de qualidade com atendimento especializado
-• **Dor do mercado:** 75% da população brasileira tem problemas de visão, mercado pulverizado
-• **Urgência:** Necessidade básica de saúde visual, demanda constante e crescente
-• **Escala:** Mercado endereçável de 160+ milhões de pessoas que precisam de correção visual
-
-**Status:** ✅ VALIDADO - Problema real com demanda comprovada
-        """
-    
-    def _section_solucao_valor(self, business_data):
-        diferencial = business_data.get('diferencial_competitivo', 'Atendimento personalizado')
-        return f"""
-✅ **SOLUÇÃO DIFERENCIADA**
-
-• **Solução:** Ótica com atendimento personalizado, tecnologia e parcerias médicas
-• **Proposta de Valor:** {diferencial}
-• **Diferencial:** Combinação de produtos premium + atendimento especializado + conveniência
-• **Validação:** Modelo testado e aprovado no mercado brasileiro
-
-**Status:** ✅ APROVADO - Solução clara com diferencial competitivo
-        """
-    
-    def _section_produto_servico(self, business_data):
-        return """
-✅ **PRODUTO PRONTO E ESCALÁVEL**
-
-• **Estágio:** Negócio operacional pronto para funcionamento
-• **Produtos:** Lentes, armações, óculos de sol, exames e serviços ópticos
-• **Escalabilidade:** Modelo replicável, não depende de tecnologia proprietária
-• **Proteção:** Relacionamentos com fornecedores e clientes como barreira de entrada
-
-**Status:** ✅ OPERACIONAL - Produto maduro e escalável
-        """
-    
-    def _section_mercado_oportunidade(self, business_data):
-        return """
-✅ **MERCADO ATRATIVO E EM CRESCIMENTO**
-
-• **TAM (Total):** R$ 3,2 bilhões (mercado óptico brasileiro)
-• **SAM (Acessível):** R$ 800 milhões (região de atuação)
-• **SOM (Capturável):** R$ 8 milhões (market share estimado 1%)
-• **Crescimento:** 5-8% ao ano, impulsionado por envelhecimento populacional
-• **Investimento:** Setor com histórico de atratividade para investidores
-
-**Status:** ✅ ATRATIVO - Mercado sólido com crescimento sustentável
-        """
-    
-    def _section_concorrencia(self, business_data):
-        posicionamento = business_data.get('posicionamento', 'Ótica Familiar')
-        return f"""
-✅ **POSICIONAMENTO COMPETITIVO CLARO**
-
-• **Concorrentes Diretos:** Óticas independentes locais
-• **Concorrentes Indiretos:** Grandes redes (Óticas Carol, Diniz, etc.)
-• **Diferencial:** {posicionamento} - foco em relacionamento e qualidade
-• **Barreiras:** Relacionamento com clientes, parcerias médicas, localização estratégica
-
-**Status:** ✅ DEFENSÁVEL - Nicho bem definido com barreiras naturais
-        """
-    
-    def _section_modelo_negocio(self, business_data):
-        receita_mensal = business_data.get('receita_mensal_produtos', 0)
-        ticket_medio = business_data.get('ticket_medio_calculado', 0)
-        margem_produtos = business_data.get('percentual_margem_produtos', 50)
-        
-        return f"""
-✅ **MODELO DE NEGÓCIO LUCRATIVO**
-
-• **Receita:** Venda direta de produtos ópticos e serviços
-• **Canais:** Loja física + atendimento domiciliar
-• **Ticket Médio:** R$ {ticket_medio:,.0f}
-• **Margem Bruta:** {margem_produtos:.0f}%
-• **Receita Mensal:** R$ {receita_mensal:,.0f}
-• **Recorrência:** Alta fidelização de clientes (troca a cada 2-3 anos)
-
-**Status:** ✅ VALIDADO - Modelo com margens saudáveis e recorrência natural
-        """
-    
-    def _section_marketing_vendas(self, business_data):
-        canais = business_data.get('canais_marketing', ['Redes sociais', 'Indicação médicos'])
-        meta_clientes = business_data.get('meta_clientes_mes', 50)
-        
-        canais_str = ', '.join(canais) if canais else 'A definir'
-        
-        return f"""
-✅ **ESTRATÉGIA DE AQUISIÇÃO ESTRUTURADA**
-
-• **Canais:** {canais_str}
-• **Meta:** {meta_clientes} novos clientes/mês
-• **Estratégia:** Marketing local + parcerias médicas + indicações
-• **Métricas:** CAC, LTV, taxa de conversão monitorados mensalmente
-
-**Status:** ✅ ESTRUTURADO - Plano de marketing com métricas definidas
-        """
-    
-    def _section_operacoes(self, business_data):
-        return """
-✅ **OPERAÇÃO EFICIENTE E ESCALÁVEL**
-
-• **Entrega:** Atendimento presencial + laboratório próprio/terceirizado
-• **Processos:** Padronizados para garantir qualidade e eficiência
-• **Escalabilidade:** Modelo replicável com baixa dependência de pessoas-chave
-• **Tecnologia:** Sistema de gestão integrado (vendas, estoque, financeiro)
-
-**Status:** ✅ EFICIENTE - Operação estruturada e escalável
-        """
-    
-    def _section_time(self, business_data):
-        return """
-✅ **TIME PREPARADO**
-
-• **Perfil:** Empreendedor com conhecimento do setor óptico
-• **Experiência:** Conhecimento técnico + visão de negócios
-• **Dedicação:** Foco exclusivo no empreendimento
-• **Complementaridade:** Competências técnicas e comerciais alinhadas
-
-**Status:** ✅ ADEQUADO - Time com perfil e experiência necessários
-        """
-    
-    def _section_indicadores_financeiros(self, business_data):
-        receita_anual = business_data.get('receita_mensal_produtos', 0) * 12
-        lucro_estimado = receita_anual * 0.15  # Estimativa 15% margem líquida
-        break_even = business_data.get('break_even_faturamento', 0)
-        
-        return f"""
-✅ **PROJEÇÕES FINANCEIRAS REALISTAS**
-
-• **Receita Anual:** R$ {receita_anual:,.0f}
-• **Lucro Líquido Estimado:** R$ {lucro_estimado:,.0f} (15% margem)
-• **Break-even:** R$ {break_even:,.0f}/mês
-• **Tempo para Equilíbrio:** 6-12 meses
-• **Base:** Premissas conservadoras baseadas em dados de mercado
-
-**Status:** ✅ CONSISTENTE - Projeções baseadas em dados reais do setor
-        """
-    
-    def _section_investimento_valuation(self, business_data):
-        investimento = business_data.get('total_investimento', 0)
-        valor_empresa = business_data.get('valor_medio_final', 0)
-        
-        return f"""
-✅ **PROPOSTA DE INVESTIMENTO ESTRUTURADA**
-
-• **Investimento Solicitado:** R$ {investimento:,.0f}
-• **Uso dos Recursos:** 45% estoque, 30% infraestrutura, 25% capital giro
-• **Valuation Estimado:** R$ {valor_empresa:,.0f}
-• **Estrutura:** Sociedade simples com participação proporcional ao investimento
-
-**Status:** ✅ ALINHADO - Valuation compatível com o estágio do negócio
-        """
-    
-    def _section_riscos_saida(self, business_data):
-        riscos = business_data.get('riscos_mercado', []) + business_data.get('riscos_operacionais', [])
-        return f"""
-✅ **RISCOS MAPEADOS E MITIGADOS**
-
-• **Principais Riscos:** Concorrência, crise econômica, problemas operacionais
-• **Mitigação:** Diferenciação, reserva emergência, processos estruturados
-• **Estratégia de Saída:** Venda estratégica, expansão para rede, IPO (longo prazo)
-• **Timeline:** 5-7 anos para saída com múltiplos atrativos
-
-**Status:** ✅ CONTROLADO - Riscos identificados com planos de mitigação
-        """
-    
-    def _generate_financial_indicators(self, business_data):
-        """Gera seção de indicadores financeiros chave"""
-        receita_mensal = business_data.get('receita_mensal_produtos', 0)
-        receita_anual = receita_mensal * 12
-        lucro_estimado = receita_anual * 0.15
-        investimento = business_data.get('total_investimento', 0)
-        roi = business_data.get('roi_investimento', 0)
-        ticket_medio = business_data.get('ticket_medio_calculado', 0)
-        
-        return f"""
-## INDICADORES FINANCEIROS CHAVE
-
-| Métrica | Valor | Status |
-|---------|--------|--------|
-| **Receita Mensal** | R$ {receita_mensal:,.0f} | ✅ |
-| **Receita Anual** | R$ {receita_anual:,.0f} | ✅ |
-| **Margem Bruta** | 60-70% | ✅ |
-| **Margem Líquida** | 15-20% | ✅ |
-| **Ticket Médio** | R$ {ticket_medio:,.0f} | ✅ |
-| **ROI Estimado** | {roi:.1f}% a.a. | ✅ |
-| **Payback** | 24-36 meses | ✅ |
-| **Investimento** | R$ {investimento:,.0f} | ✅ |
-
-**BENCHMARK SETOR:** Indicadores dentro ou acima da média do setor óptico.
-        """
-    
-    def _generate_conclusion(self, business_data):
-        """Gera conclusão e recomendação"""
-        return """
-## CONCLUSÃO E RECOMENDAÇÃO
-
-### 🟢 SINAIS VERDES IDENTIFICADOS
-
-✅ **Problema Real:** Necessidade básica com demanda comprovada
-✅ **Solução Validada:** Modelo de negócio testado e aprovado
-✅ **Mercado Atrativo:** Setor estável com crescimento sustentável  
-✅ **Modelo Lucrativo:** Margens saudáveis e recorrência natural
-✅ **Time Adequado:** Experiência e dedicação necessárias
-✅ **Indicadores Positivos:** ROI, margem e payback atrativos
-✅ **Uso Claro do Capital:** Plano detalhado de aplicação dos recursos
-✅ **Riscos Controlados:** Identificados e com planos de mitigação
-
-### 📊 SCORE FINAL: 95/100
-
-**RECOMENDAÇÃO: INVESTIMENTO APROVADO**
-
-O negócio apresenta todos os elementos necessários para um investimento de sucesso:
-mercado maduro, modelo validado, projeções realistas e equipe preparada.
-
-**PRÓXIMOS PASSOS:**
-1. Due diligence detalhada
-2. Estruturação jurídica da sociedade  
-3. Cronograma de implementação
-4. Marcos de acompanhamento (milestones)
-
----
-
-*Relatório gerado automaticamente pelo Sistema de Análise de Negócios*
-*Data: {datetime.now().strftime("%d/%m/%Y às %H:%M")}*
-        """
+        return get_investor_sections(business_data).markdown()
     
     def generate_investment_summary(self, business_data):
         """Gera resumo executivo para investidores"""
-        receita_anual = business_data.get('receita_mensal_produtos', 0) * 12
-        investimento = business_data.get('total_investimento', 0)
-        roi = business_data.get('roi_investimento', 0)
+        vm = get_investor_sections(business_data).view_model
         
         return {
             'oportunidade': 'Setor Óptico - Varejo Especializado',
             'mercado_tam': 'R$ 3,2 bilhões (Brasil)',
-            'receita_projetada': f'R$ {receita_anual:,.0f}/ano',
-            'investimento_necessario': f'R$ {investimento:,.0f}',
-            'roi_estimado': f'{roi:.1f}% ao ano',
+            'receita_projetada': f'R$ {vm["receita_anual_produtos"]:,.0f}/ano',
+            'investimento_necessario': f'R$ {vm["total_investimento"]:,.0f}',
+            'roi_estimado': f'{vm["roi_investimento"]:.1f}% ao ano',
             'payback_estimado': '24-36 meses',
             'status_recomendacao': 'APROVADO',
             'score_investimento': '95/100'
-        }
\ No newline at end of file
+        }
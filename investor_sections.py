@@ -0,0 +1,504 @@
+"""
+Seções do Relatório para Investidores
+Os números e textos do relatório são calculados uma vez por plano (view-model)
+e as seções são templates analisados na importação; o resultado fica em cache
+pela impressão digital do plano e é reaproveitado pelas abas da ferramenta,
+pela exportação em Markdown e pelos geradores de PDF
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from string import Formatter
+
+from scenario_cube import plan_fingerprint
+
+# Mercado óptico brasileiro e fatias usadas no relatório
+MARKET_TAM = 4200000000
+MARKET_SAM_SHARE = 0.02   # Região de atuação
+MARKET_SOM_SHARE = 0.01   # Fatia capturável da região
+
+# Campos preenchidos na hora da renderização: nunca entram no view-model em cache
+TIMESTAMP_FIELDS = {'data_relatorio', 'data_hora'}
+
+
+class SectionTemplate:
+    """Markdown section body parsed once at import and rendered against a view-model"""
+
+    def __init__(self, key, body, title=None):
+        self.key = key
+        self.title = title
+        self.body = body
+        # Campos do view-model usados pelo template (erros de digitação aparecem na importação)
+        self.fields = {
+            campo.split('.')[0].split('[')[0]
+            for _, campo, _, _ in Formatter().parse(body) if campo
+        }
+
+    def render(self, view_model):
+        """Section markdown (checklist sections get their '## title' header and separator)"""
+        texto = self.body.format_map(view_model)
+        if self.title is None:
+            return texto
+        return f"\n## {self.title}\n\n{texto}\n---\n"
+
+
+# Checklist do investidor: título e perguntas de cada seção
+CHECKLIST = OrderedDict([
+    ('proposito_problema', {
+        'title': '1. PROPÓSITO E PROBLEMA',
+        'questions': [
+            'O problema que o negócio resolve é claro e real?',
+            'Existe uma dor latente ou necessidade urgente no mercado?',
+            'O problema afeta um número relevante de pessoas/empresas?'
+        ]
+    }),
+    ('solucao_valor', {
+        'title': '2. SOLUÇÃO E PROPOSTA DE VALOR',
+        'questions': [
+            'A solução é objetiva e bem explicada?',
+            'A proposta de valor é única ou claramente superior à dos concorrentes?',
+            'A solução já foi validada com clientes (MVP, protótipo, cases)?'
+        ]
+    }),
+    ('produto_servico', {
+        'title': '3. PRODUTO / SERVIÇO',
+        'questions': [
+            'O produto está pronto ou em que estágio se encontra?',
+            'Ele é escalável? Pode crescer com custos proporcionais menores?',
+            'Há alguma patente, registro ou proteção da propriedade intelectual?'
+        ]
+    }),
+    ('mercado_oportunidade', {
+        'title': '4. MERCADO E OPORTUNIDADE',
+        'questions': [
+            'O tamanho de mercado (TAM, SAM, SOM) foi calculado corretamente?',
+            'O mercado está em crescimento ou declínio?',
+            'Existe apetite de investimento nesse setor?'
+        ]
+    }),
+    ('concorrencia', {
+        'title': '5. CONCORRÊNCIA E DIFERENCIAL',
+        'questions': [
+            'Quem são os principais concorrentes diretos e indiretos?',
+            'O que diferencia o seu negócio de forma clara e defensável?',
+            'Há barreiras de entrada reais (tecnologia, rede, marca)?'
+        ]
+    }),
+    ('modelo_negocio', {
+        'title': '6. MODELO DE NEGÓCIO E MONETIZAÇÃO',
+        'questions': [
+            'Como a empresa gera receita?',
+            'Quais os canais de receita (venda única, recorrência, assinatura)?',
+            'Qual é o ticket médio e a margem?'
+        ]
+    }),
+    ('marketing_vendas', {
+        'title': '7. MARKETING E VENDAS',
+        'questions': [
+            'Como serão adquiridos os clientes (canais e estratégias)?',
+            'A estratégia de marketing é clara e mensurável?',
+            'Existe uma máquina de vendas estruturada?'
+        ]
+    }),
+    ('operacoes', {
+        'title': '8. OPERAÇÕES E ESCALABILIDADE',
+        'questions': [
+            'Como é feita a entrega do produto/serviço?',
+            'Há processos definidos para crescimento?',
+            'A operação depende de muitas pessoas ou é automatizável?'
+        ]
+    }),
+    ('time', {
+        'title': '9. TIME',
+        'questions': [
+            'Quem são os fundadores? Qual sua experiência?',
+            'As competências são complementares?',
+            'Existe dedicação exclusiva e alinhamento de visão?'
+        ]
+    }),
+    ('indicadores_financeiros', {
+        'title': '10. INDICADORES FINANCEIROS',
+        'questions': [
+            'Há demonstrações projetadas (DRE, Fluxo de Caixa, Balanço)?',
+            'As projeções são realistas, baseadas em premissas claras?',
+            'Qual o ponto de equilíbrio e o tempo para alcançá-lo?'
+        ]
+    }),
+    ('investimento_valuation', {
+        'title': '11. INVESTIMENTO E VALUATION',
+        'questions': [
+            'Quanto está sendo solicitado de investimento?',
+            'Para onde os recursos serão direcionados (uso dos fundos)?',
+            'O valuation está alinhado com o estágio da empresa?',
+            'A estrutura societária (cap table) é saudável?'
+        ]
+    }),
+    ('riscos_saida', {
+        'title': '12. RISCOS E PLANO DE SAÍDA',
+        'questions': [
+            'Quais são os principais riscos (técnicos, regulatórios, mercado)?',
+            'Há plano de mitigação para cada risco?',
+            'Qual a estratégia de saída do investidor (exit)? Venda, IPO, aquisição?'
+        ]
+    })
+])
+
+# Corpo de cada seção do checklist
+CHECKLIST_BODIES = {
+    'proposito_problema': """
+✅ **PROBLEMA CLARO E VALIDADO**
+
+• **Problema:** Dificuldade de acesso a produtos ópticos de qualidade com atendimento especializado
+• **Dor do mercado:** 75% da população brasileira tem problemas de visão, mercado pulverizado
+• **Urgência:** Necessidade básica de saúde visual, demanda constante e crescente
+• **Escala:** Mercado endereçável de 160+ milhões de pessoas que precisam de correção visual
+
+**Status:** ✅ VALIDADO - Problema real com demanda comprovada
+        """,
+    'solucao_valor': """
+✅ **SOLUÇÃO DIFERENCIADA**
+
+• **Solução:** Ótica com atendimento personalizado, tecnologia e parcerias médicas
+• **Proposta de Valor:** {diferencial}
+• **Diferencial:** Combinação de produtos premium + atendimento especializado + conveniência
+• **Validação:** Modelo testado e aprovado no mercado brasileiro
+
+**Status:** ✅ APROVADO - Solução clara com diferencial competitivo
+        """,
+    'produto_servico': """
+✅ **PRODUTO PRONTO E ESCALÁVEL**
+
+• **Estágio:** Negócio operacional pronto para funcionamento
+• **Produtos:** Lentes, armações, óculos de sol, exames e serviços ópticos
+• **Escalabilidade:** Modelo replicável, não depende de tecnologia proprietária
+• **Proteção:** Relacionamentos com fornecedores e clientes como barreira de entrada
+
+**Status:** ✅ OPERACIONAL - Produto maduro e escalável
+        """,
+    'mercado_oportunidade': """
+✅ **MERCADO ATRATIVO E EM CRESCIMENTO**
+
+• **TAM (Total):** R$ 3,2 bilhões (mercado óptico brasileiro)
+• **SAM (Acessível):** R$ 800 milhões (região de atuação)
+• **SOM (Capturável):** R$ 8 milhões (market share estimado 1%)
+• **Crescimento:** 5-8% ao ano, impulsionado por envelhecimento populacional
+• **Investimento:** Setor com histórico de atratividade para investidores
+
+**Status:** ✅ ATRATIVO - Mercado sólido com crescimento sustentável
+        """,
+    'concorrencia': """
+✅ **POSICIONAMENTO COMPETITIVO CLARO**
+
+• **Concorrentes Diretos:** Óticas independentes locais
+• **Concorrentes Indiretos:** Grandes redes (Óticas Carol, Diniz, etc.)
+• **Diferencial:** {posicionamento} - foco em relacionamento e qualidade
+• **Barreiras:** Relacionamento com clientes, parcerias médicas, localização estratégica
+
+**Status:** ✅ DEFENSÁVEL - Nicho bem definido com barreiras naturais
+        """,
+    'modelo_negocio': """
+✅ **MODELO DE NEGÓCIO LUCRATIVO**
+
+• **Receita:** Venda direta de produtos ópticos e serviços
+• **Canais:** Loja física + atendimento domiciliar
+• **Ticket Médio:** R$ {ticket_medio_calculado:,.0f}
+• **Margem Bruta:** {percentual_margem_produtos:.0f}%
+• **Receita Mensal:** R$ {receita_mensal_produtos:,.0f}
+• **Recorrência:** Alta fidelização de clientes (troca a cada 2-3 anos)
+
+**Status:** ✅ VALIDADO - Modelo com margens saudáveis e recorrência natural
+        """,
+    'marketing_vendas': """
+✅ **ESTRATÉGIA DE AQUISIÇÃO ESTRUTURADA**
+
+• **Canais:** {canais_marketing}
+• **Meta:** {meta_clientes_mes} novos clientes/mês
+• **Estratégia:** Marketing local + parcerias médicas + indicações
+• **Métricas:** CAC, LTV, taxa de conversão monitorados mensalmente
+
+**Status:** ✅ ESTRUTURADO - Plano de marketing com métricas definidas
+        """,
+    'operacoes': """
+✅ **OPERAÇÃO EFICIENTE E ESCALÁVEL**
+
+• **Entrega:** Atendimento presencial + laboratório próprio/terceirizado
+• **Processos:** Padronizados para garantir qualidade e eficiência
+• **Escalabilidade:** Modelo replicável com baixa dependência de pessoas-chave
+• **Tecnologia:** Sistema de gestão integrado (vendas, estoque, financeiro)
+
+**Status:** ✅ EFICIENTE - Operação estruturada e escalável
+        """,
+    'time': """
+✅ **TIME PREPARADO**
+
+• **Perfil:** Empreendedor com conhecimento do setor óptico
+• **Experiência:** Conhecimento técnico + visão de negócios
+• **Dedicação:** Foco exclusivo no empreendimento
+• **Complementaridade:** Competências técnicas e comerciais alinhadas
+
+**Status:** ✅ ADEQUADO - Time com perfil e experiência necessários
+        """,
+    'indicadores_financeiros': """
+✅ **PROJEÇÕES FINANCEIRAS REALISTAS**
+
+• **Receita Anual:** R$ {receita_anual_produtos:,.0f}
+• **Lucro Líquido Estimado:** R$ {lucro_estimado:,.0f} (15% margem)
+• **Break-even:** R$ {break_even_faturamento:,.0f}/mês
+• **Tempo para Equilíbrio:** 6-12 meses
+• **Base:** Premissas conservadoras baseadas em dados de mercado
+
+**Status:** ✅ CONSISTENTE - Projeções baseadas em dados reais do setor
+        """,
+    'investimento_valuation': """
+✅ **PROPOSTA DE INVESTIMENTO ESTRUTURADA**
+
+• **Investimento Solicitado:** R$ {total_investimento:,.0f}
+• **Uso dos Recursos:** 45% estoque, 30% infraestrutura, 25% capital giro
+• **Valuation Estimado:** R$ {valor_medio_final:,.0f}
+• **Estrutura:** Sociedade simples com participação proporcional ao investimento
+
+**Status:** ✅ ALINHADO - Valuation compatível com o estágio do negócio
+        """,
+    'riscos_saida': """
+✅ **RISCOS MAPEADOS E MITIGADOS**
+
+• **Principais Riscos:** Concorrência, crise econômica, problemas operacionais
+• **Mitigação:** Diferenciação, reserva emergência, processos estruturados
+• **Estratégia de Saída:** Venda estratégica, expansão para rede, IPO (longo prazo)
+• **Timeline:** 5-7 anos para saída com múltiplos atrativos
+
+**Status:** ✅ CONTROLADO - Riscos identificados com planos de mitigação
+        """
+}
+
+HEADER_TEMPLATE = SectionTemplate('cabecalho', """
+# RESPOSTA AO INVESTIDOR
+## {nome_loja}
+**Data:** {data_relatorio}
+
+---
+
+## RESUMO EXECUTIVO
+
+
+**OPORTUNIDADE DE INVESTIMENTO: SETOR ÓPTICO**
+
+• **Mercado:** Setor de ótica no Brasil movimenta R$ 3,2 bilhões/ano, crescimento 5-8% a.a.
+• **Modelo:** Varejo especializado com foco em produtos de alta margem e serviços
+• **Receita Projetada:** R$ {receita_mensal_produtos:,.0f}/mês (R$ {receita_anual_produtos:,.0f}/ano)
+• **Investimento Necessário:** R$ {total_investimento:,.0f}
+• **ROI Estimado:** {roi_investimento:.1f}% ao ano
+• **Diferencial:** Atendimento personalizado, tecnologia e parcerias médicas
+
+**PROPOSTA:** Investimento em ótica com modelo validado, mercado estável e alta lucratividade.
+        
+
+---
+        """)
+
+INDICATORS_TEMPLATE = SectionTemplate('indicadores', """
+## INDICADORES FINANCEIROS CHAVE
+
+| Métrica | Valor | Status |
+|---------|--------|--------|
+| **Receita Mensal** | R$ {receita_mensal_produtos:,.0f} | ✅ |
+| **Receita Anual** | R$ {receita_anual_produtos:,.0f} | ✅ |
+| **Margem Bruta** | 60-70% | ✅ |
+| **Margem Líquida** | 15-20% | ✅ |
+| **Ticket Médio** | R$ {ticket_medio_calculado:,.0f} | ✅ |
+| **ROI Estimado** | {roi_investimento:.1f}% a.a. | ✅ |
+| **Payback** | 24-36 meses | ✅ |
+| **Investimento** | R$ {total_investimento:,.0f} | ✅ |
+
+**BENCHMARK SETOR:** Indicadores dentro ou acima da média do setor óptico.
+        """)
+
+CONCLUSION_TEMPLATE = SectionTemplate('conclusao', """
+## CONCLUSÃO E RECOMENDAÇÃO
+
+### 🟢 SINAIS VERDES IDENTIFICADOS
+
+✅ **Problema Real:** Necessidade básica com demanda comprovada
+✅ **Solução Validada:** Modelo de negócio testado e aprovado
+✅ **Mercado Atrativo:** Setor estável com crescimento sustentável  
+✅ **Modelo Lucrativo:** Margens saudáveis e recorrência natural
+✅ **Time Adequado:** Experiência e dedicação necessárias
+✅ **Indicadores Positivos:** ROI, margem e payback atrativos
+✅ **Uso Claro do Capital:** Plano detalhado de aplicação dos recursos
+✅ **Riscos Controlados:** Identificados e com planos de mitigação
+
+### 📊 SCORE FINAL: 95/100
+
+**RECOMENDAÇÃO: INVESTIMENTO APROVADO**
+
+O negócio apresenta todos os elementos necessários para um investimento de sucesso:
+mercado maduro, modelo validado, projeções realistas e equipe preparada.
+
+**PRÓXIMOS PASSOS:**
+1. Due diligence detalhada
+2. Estruturação jurídica da sociedade  
+3. Cronograma de implementação
+4. Marcos de acompanhamento (milestones)
+
+---
+
+*Relatório gerado automaticamente pelo Sistema de Análise de Negócios*
+*Data: {data_hora}*
+        """)
+
+# Ordem do relatório em Markdown
+SECTION_TEMPLATES = OrderedDict(
+    [('cabecalho', HEADER_TEMPLATE)]
+    + [(chave, SectionTemplate(chave, CHECKLIST_BODIES[chave], item['title'])) for chave, item in CHECKLIST.items()]
+    + [('indicadores', INDICATORS_TEMPLATE), ('conclusao', CONCLUSION_TEMPLATE)]
+)
+
+
+def report_timestamps(agora=None):
+    """Report date fields, taken when the report is rendered"""
+    agora = agora or datetime.now()
+    return {
+        'data_relatorio': agora.strftime("%d/%m/%Y"),
+        'data_hora': agora.strftime("%d/%m/%Y às %H:%M")
+    }
+
+
+def investor_view_model(business_data):
+    """Every number and text field the investor report needs, computed once from the plan"""
+    bd = business_data or {}
+
+    # Investimento inicial (total informado ou soma das partes)
+    reforma = bd.get('reforma_loja', 0) or 0
+    equipamentos = bd.get('equipamentos_moveis', 0) or 0
+    estoque = bd.get('estoque_inicial', 0) or 0
+    capital_giro = bd.get('capital_giro', 0) or 0
+    investimento_total = bd.get('investimento_total') or (reforma + equipamentos + estoque + capital_giro)
+
+    vendas_mes_1 = bd.get('vendas_mes_1', 0) or 0
+    sam = MARKET_TAM * MARKET_SAM_SHARE
+
+    # Campos do checklist "Resposta ao Investidor"
+    receita_mensal_produtos = bd.get('receita_mensal_produtos', 0)
+    canais = bd.get('canais_marketing', ['Redes sociais', 'Indicação médicos'])
+
+    view_model = {
+        'nome_negocio': bd.get('nome_negocio', 'Ótica não informada'),
+        'nome_loja': bd.get('nome_loja', 'Ótica [Nome]'),
+        'cidade': bd.get('cidade', 'Cidade não informada'),
+        'estado': bd.get('estado', 'Estado não informado'),
+        'problema_mercado': bd.get('problema_mercado', 'Não definido'),
+        'publico_alvo': bd.get('publico_alvo', 'Não definido'),
+        'proposta_valor': bd.get('proposta_valor', 'Não definida'),
+        'produtos_servicos': bd.get('produtos_servicos', 'Não definidos'),
+        'experiencia_setor': bd.get('experiencia_setor', 'Não informada'),
+        'motivacao': bd.get('motivacao', 'Não informada'),
+        'densidade_populacional': bd.get('densidade_populacional', 'Não informada'),
+        'principais_concorrentes': bd.get('principais_concorrentes', 'Não identificados'),
+        'estrategia_marketing': bd.get('estrategia_marketing', 'Não definida'),
+        'num_funcionarios': bd.get('num_funcionarios', 1),
+        'salarios_total': bd.get('salarios_total', 0),
+        'ticket_medio': bd.get('ticket_medio', 0),
+
+        'reforma_loja': reforma,
+        'equipamentos_moveis': equipamentos,
+        'estoque_inicial': estoque,
+        'capital_giro': capital_giro,
+        'investimento_total': investimento_total,
+
+        'vendas_mes_1': vendas_mes_1,
+        'faturamento_anual': bd.get('receita_anual') or vendas_mes_1 * 12,
+
+        'mercado_tam': MARKET_TAM,
+        'mercado_sam': sam,
+        'mercado_som': sam * MARKET_SOM_SHARE,
+
+        'receita_mensal_produtos': receita_mensal_produtos,
+        'receita_anual_produtos': receita_mensal_produtos * 12,
+        'lucro_estimado': receita_mensal_produtos * 12 * 0.15,  # Estimativa 15% margem líquida
+        'ticket_medio_calculado': bd.get('ticket_medio_calculado', 0),
+        'percentual_margem_produtos': bd.get('percentual_margem_produtos', 50),
+        'total_investimento': bd.get('total_investimento', 0),
+        'roi_investimento': bd.get('roi_investimento', 0),
+        'break_even_faturamento': bd.get('break_even_faturamento', 0),
+        'valor_medio_final': bd.get('valor_medio_final', 0),
+        'diferencial': bd.get('diferencial_competitivo', 'Atendimento personalizado'),
+        'posicionamento': bd.get('posicionamento', 'Ótica Familiar'),
+        'canais_marketing': ', '.join(canais) if canais else 'A definir',
+        'meta_clientes_mes': bd.get('meta_clientes_mes', 50),
+
+        'dre': None
+    }
+
+    # DRE mensal e indicadores (só com projeção de vendas)
+    if vendas_mes_1 > 0:
+        try:
+            from dre_generator import DREGenerator
+            dre = DREGenerator().generate_dre(bd, {})
+        except Exception:
+            dre = None
+        if dre:
+            receita = dre['receita_bruta']
+            lucro_anual = dre['lucro_liquido'] * 12
+            view_model['dre'] = {
+                'receita_bruta': receita,
+                'impostos': dre['impostos'],
+                'cmv': dre['cmv'],
+                'lucro_bruto': dre['lucro_bruto'],
+                'despesas_operacionais': dre['lucro_bruto'] - dre['lucro_operacional'],
+                'lucro_liquido': dre['lucro_liquido'],
+                'margem_bruta': dre['lucro_bruto'] / receita * 100 if receita > 0 else 0,
+                'margem_liquida': dre['lucro_liquido'] / receita * 100 if receita > 0 else 0,
+                'roi_anual': lucro_anual / investimento_total * 100 if investimento_total > 0 and lucro_anual > 0 else None,
+                'payback_anos': investimento_total / lucro_anual if investimento_total > 0 and lucro_anual > 0 else None
+            }
+
+    return view_model
+
+
+class InvestorSections:
+    """View-model and rendered sections of one plan's investor report"""
+
+    def __init__(self, business_data):
+        self.view_model = investor_view_model(business_data)
+        self._sections = None
+
+    def render(self, agora=None):
+        """{section key: markdown}; dated sections are filled in at each call, the others only once"""
+        if self._sections is None:
+            self._sections = OrderedDict(
+                (chave, None if template.fields & TIMESTAMP_FIELDS else template.render(self.view_model))
+                for chave, template in SECTION_TEMPLATES.items()
+            )
+        datado = {**self.view_model, **report_timestamps(agora)}
+        return OrderedDict(
+            (chave, SECTION_TEMPLATES[chave].render(datado) if texto is None else texto)
+            for chave, texto in self._sections.items()
+        )
+
+    @property
+    def sections(self):
+        """{section key: markdown} dated now"""
+        return self.render()
+
+    def markdown(self, agora=None):
+        """Complete "Resposta ao Investidor" report in Markdown"""
+        return '\n'.join(self.render(agora).values())
+
+
+_SECTIONS_CACHE = OrderedDict()
+_SECTIONS_CACHE_SIZE = 32
+
+
+def get_investor_sections(business_data):
+    """Investor report sections for a plan, reused while the plan fingerprint is unchanged"""
+    key = plan_fingerprint(business_data)
+
+    if key in _SECTIONS_CACHE:
+        _SECTIONS_CACHE.move_to_end(key)
+        return _SECTIONS_CACHE[key]
+
+    secoes = InvestorSections(business_data)
+    _SECTIONS_CACHE[key] = secoes
+    if len(_SECTIONS_CACHE) > _SECTIONS_CACHE_SIZE:
+        _SECTIONS_CACHE.popitem(last=False)
+    return secoes
@@ -3,259 +3,228 @@ Gerador de PDF Multilíngue para Relatório de Investidores
 Formato profissional e elegante com suporte a Português, Inglês e Espanhol
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from io import BytesIO
-from datetime import datetime
 import locale
+import zipfile
+
+from scenario_cube import get_scenario_cube
+from investor_sections import get_investor_sections
+from br_format import format_currency
+from report_styles import get_report_styles
+
+# Idiomas do pacote e sufixo de cada arquivo no ZIP
+BUNDLE_LANGUAGES = {"Português": "pt", "English": "en", "Español": "es"}
+
+# Textos do relatório por idioma
+TRANSLATIONS = {
+    "pt": {
+        "title": "RELATÓRIO COMPLETO PARA INVESTIDORES",
+        "executive_summary": "SUMÁRIO EXECUTIVO",
+        "purpose_problem": "1. PROPÓSITO E PROBLEMA",
+        "solution_value": "2. SOLUÇÃO E PROPOSTA DE VALOR",
+        "market_opportunity": "3. MERCADO E OPORTUNIDADE", 
+        "competition": "4. ANÁLISE DA CONCORRÊNCIA",
+        "financial": "5. PROJEÇÕES FINANCEIRAS",
+        "team": "6. EQUIPE E GESTÃO",
+        "conclusion": "7. CONCLUSÃO E RECOMENDAÇÃO",
+        "problem_identified": "Problema Identificado",
+        "market_validation": "Validação do Mercado",
+        "value_proposition": "Proposta de Valor",
+        "products_services": "Produtos e Serviços",
+        "competitive_advantage": "Diferencial Competitivo",
+        "market_size": "Tamanho do Mercado",
+        "location": "Localização",
+        "sector_trends": "Tendências do Setor",
+        "initial_investment": "Investimento Inicial",
+        "annual_projections": "Projeções Anuais",
+        "entrepreneur_experience": "Experiência do Empreendedor",
+        "organizational_structure": "Estrutura Organizacional",
+        "investment_strengths": "Pontos Fortes do Investimento",
+        "identified_risks": "Riscos Identificados",
+        "recommendation": "Recomendação",
+        "recommended": "RECOMENDADO",
+        "total": "TOTAL",
+        "revenue": "Faturamento",
+        "average_ticket": "Ticket Médio",
+        "employees": "Funcionários",
+        "payroll": "Folha de Pagamento",
+        "renovation": "Reforma",
+        "equipment": "Equipamentos",
+        "initial_stock": "Estoque Inicial",
+        "working_capital": "Capital de Giro",
+        "scenarios": "Cenários (Ano 1)",
+        "scenario": "Cenário",
+        "operating_profit": "Lucro Operacional",
+        "scenario_pessimista": "Pessimista",
+        "scenario_realista": "Realista",
+        "scenario_otimista": "Otimista"
+    },
+    "en": {
+        "title": "COMPLETE INVESTOR REPORT",
+        "executive_summary": "EXECUTIVE SUMMARY",
+        "purpose_problem": "1. PURPOSE AND PROBLEM",
+        "solution_value": "2. SOLUTION AND VALUE PROPOSITION",
+        "market_opportunity": "3. MARKET AND OPPORTUNITY",
+        "competition": "4. COMPETITION ANALYSIS",
+        "financial": "5. FINANCIAL PROJECTIONS",
+        "team": "6. TEAM AND MANAGEMENT",
+        "conclusion": "7. CONCLUSION AND RECOMMENDATION",
+        "problem_identified": "Identified Problem",
+        "market_validation": "Market Validation",
+        "value_proposition": "Value Proposition",
+        "products_services": "Products and Services",
+        "competitive_advantage": "Competitive Advantage",
+        "market_size": "Market Size",
+        "location": "Location",
+        "sector_trends": "Sector Trends",
+        "initial_investment": "Initial Investment",
+        "annual_projections": "Annual Projections",
+        "entrepreneur_experience": "Entrepreneur Experience",
+        "organizational_structure": "Organizational Structure",
+        "investment_strengths": "Investment Strengths",
+        "identified_risks": "Identified Risks",
+        "recommendation": "Recommendation",
+        "recommended": "RECOMMENDED",
+        "total": "TOTAL",
+        "revenue": "Revenue",
+        "average_ticket": "Average Ticket",
+        "employees": "Employees",
+        "payroll": "Payroll",
+        "renovation": "Renovation",
+        "equipment": "Equipment",
+        "initial_stock": "Initial Stock",
+        "working_capital": "Working Capital",
+        "scenarios": "Scenarios (Year 1)",
+        "scenario": "Scenario",
+        "operating_profit": "Operating Profit",
+        "scenario_pessimista": "Pessimistic",
+        "scenario_realista": "Base case",
+        "scenario_otimista": "Optimistic"
+    },
+    "es": {
+        "title": "INFORME COMPLETO PARA INVERSORES",
+        "executive_summary": "RESUMEN EJECUTIVO",
+        "purpose_problem": "1. PROPÓSITO Y PROBLEMA",
+        "solution_value": "2. SOLUCIÓN Y PROPUESTA DE VALOR",
+        "market_opportunity": "3. MERCADO Y OPORTUNIDAD",
+        "competition": "4. ANÁLISIS DE COMPETENCIA",
+        "financial": "5. PROYECCIONES FINANCIERAS",
+        "team": "6. EQUIPO Y GESTIÓN",
+        "conclusion": "7. CONCLUSIÓN Y RECOMENDACIÓN",
+        "problem_identified": "Problema Identificado",
+        "market_validation": "Validación del Mercado",
+        "value_proposition": "Propuesta de Valor",
+        "products_services": "Productos y Servicios",
+        "competitive_advantage": "Ventaja Competitiva",
+        "market_size": "Tamaño del Mercado",
+        "location": "Ubicación",
+        "sector_trends": "Tendencias del Sector",
+        "initial_investment": "Inversión Inicial",
+        "annual_projections": "Proyecciones Anuales",
+        "entrepreneur_experience": "Experiencia del Emprendedor",
+        "organizational_structure": "Estructura Organizacional",
+        "investment_strengths": "Fortalezas de la Inversión",
+        "identified_risks": "Riesgos Identificados",
+        "recommendation": "Recomendación",
+        "recommended": "RECOMENDADO",
+        "total": "TOTAL",
+        "revenue": "Facturación",
+        "average_ticket": "Ticket Promedio",
+        "employees": "Empleados",
+        "payroll": "Nómina",
+        "renovation": "Renovación",
+        "equipment": "Equipos",
+        "initial_stock": "Stock Inicial",
+        "working_capital": "Capital de Trabajo",
+        "scenarios": "Escenarios (Año 1)",
+        "scenario": "Escenario",
+        "operating_profit": "Beneficio Operativo",
+        "scenario_pessimista": "Pesimista",
+        "scenario_realista": "Realista",
+        "scenario_otimista": "Optimista"
+    }
+}
+
 
 class MultilingualInvestorPDFGenerator:
     """Gerador de PDF para relatório de investidores em múltiplos idiomas"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-        
-        # Configurações de idioma
-        self.translations = {
-            "pt": {
-                "title": "RELATÓRIO COMPLETO PARA INVESTIDORES",
-                "date": "Data:",
-                "page": "Página",
-                "executive_summary": "SUMÁRIO EXECUTIVO",
-                "purpose_problem": "1. PROPÓSITO E PROBLEMA",
-                "solution_value": "2. SOLUÇÃO E PROPOSTA DE VALOR",
-                "market_opportunity": "3. MERCADO E OPORTUNIDADE", 
-                "competition": "4. ANÁLISE DA CONCORRÊNCIA",
-                "financial": "5. PROJEÇÕES FINANCEIRAS",
-                "team": "6. EQUIPE E GESTÃO",
-                "conclusion": "7. CONCLUSÃO E RECOMENDAÇÃO",
-                "problem_identified": "Problema Identificado",
-                "market_validation": "Validação do Mercado",
-                "value_proposition": "Proposta de Valor",
-                "products_services": "Produtos e Serviços",
-                "competitive_advantage": "Diferencial Competitivo",
-                "market_size": "Tamanho do Mercado",
-                "location": "Localização",
-                "sector_trends": "Tendências do Setor",
-                "initial_investment": "Investimento Inicial",
-                "annual_projections": "Projeções Anuais",
-                "entrepreneur_experience": "Experiência do Empreendedor",
-                "organizational_structure": "Estrutura Organizacional",
-                "investment_strengths": "Pontos Fortes do Investimento",
-                "identified_risks": "Riscos Identificados",
-                "recommendation": "Recomendação",
-                "recommended": "RECOMENDADO",
-                "total": "TOTAL",
-                "revenue": "Faturamento",
-                "average_ticket": "Ticket Médio",
-                "employees": "Funcionários",
-                "payroll": "Folha de Pagamento",
-                "renovation": "Reforma",
-                "equipment": "Equipamentos",
-                "initial_stock": "Estoque Inicial",
-                "working_capital": "Capital de Giro"
-            },
-            "en": {
-                "title": "COMPLETE INVESTOR REPORT",
-                "date": "Date:",
-                "page": "Page",
-                "executive_summary": "EXECUTIVE SUMMARY",
-                "purpose_problem": "1. PURPOSE AND PROBLEM",
-                "solution_value": "2. SOLUTION AND VALUE PROPOSITION",
-                "market_opportunity": "3. MARKET AND OPPORTUNITY",
-                "competition": "4. COMPETITION ANALYSIS",
-                "financial": "5. FINANCIAL PROJECTIONS",
-                "team": "6. TEAM AND MANAGEMENT",
-                "conclusion": "7. CONCLUSION AND RECOMMENDATION",
-                "problem_identified": "Identified Problem",
-                "market_validation": "Market Validation",
-                "value_proposition": "Value Proposition",
-                "products_services": "Products and Services",
-                "competitive_advantage": "Competitive Advantage",
-                "market_size": "Market Size",
-                "location": "Location",
-                "sector_trends": "Sector Trends",
-                "initial_investment": "Initial Investment",
-                "annual_projections": "Annual Projections",
-                "entrepreneur_experience": "Entrepreneur Experience",
-                "organizational_structure": "Organizational Structure",
-                "investment_strengths": "Investment Strengths",
-                "identified_risks": "Identified Risks",
-                "recommendation": "Recommendation",
-                "recommended": "RECOMMENDED",
-                "total": "TOTAL",
-                "revenue": "Revenue",
-                "average_ticket": "Average Ticket",
-                "employees": "Employees",
-                "payroll": "Payroll",
-                "renovation": "Renovation",
-                "equipment": "Equipment",
-                "initial_stock": "Initial Stock",
-                "working_capital": "Working Capital"
-            },
-            "es": {
-                "title": "INFORME COMPLETO PARA INVERSORES",
-                "date": "Fecha:",
-                "page": "Página",
-                "executive_summary": "RESUMEN EJECUTIVO",
-                "purpose_problem": "1. PROPÓSITO Y PROBLEMA",
-                "solution_value": "2. SOLUCIÓN Y PROPUESTA DE VALOR",
-                "market_opportunity": "3. MERCADO Y OPORTUNIDAD",
-                "competition": "4. ANÁLISIS DE COMPETENCIA",
-                "financial": "5. PROYECCIONES FINANCIERAS",
-                "team": "6. EQUIPO Y GESTIÓN",
-                "conclusion": "7. CONCLUSIÓN Y RECOMENDACIÓN",
-                "problem_identified": "Problema Identificado",
-                "market_validation": "Validación del Mercado",
-                "value_proposition": "Propuesta de Valor",
-                "products_services": "Productos y Servicios",
-                "competitive_advantage": "Ventaja Competitiva",
-                "market_size": "Tamaño del Mercado",
-                "location": "Ubicación",
-                "sector_trends": "Tendencias del Sector",
-                "initial_investment": "Inversión Inicial",
-                "annual_projections": "Proyecciones Anuales",
-                "entrepreneur_experience": "Experiencia del Emprendedor",
-                "organizational_structure": "Estructura Organizacional",
-                "investment_strengths": "Fortalezas de la Inversión",
-                "identified_risks": "Riesgos Identificados",
-                "recommendation": "Recomendación",
-                "recommended": "RECOMENDADO",
-                "total": "TOTAL",
-                "revenue": "Facturación",
-                "average_ticket": "Ticket Promedio",
-                "employees": "Empleados",
-                "payroll": "Nómina",
-                "renovation": "Renovación",
-                "equipment": "Equipos",
-                "initial_stock": "Stock Inicial",
-                "working_capital": "Capital de Trabajo"
-            }
-        }
-    
-    def _setup_custom_styles(self):
-        """Configura estilos customizados para o PDF"""
-        
-        # Estilo do título principal
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=18,
-            textColor=colors.HexColor('#1f4e79'),
-            alignment=TA_CENTER,
-            spaceAfter=30,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Estilo dos cabeçalhos de seção
-        self.section_style = ParagraphStyle(
-            'SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#2f5f8f'),
-            alignment=TA_LEFT,
-            spaceAfter=12,
-            spaceBefore=20,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Estilo dos subcabeçalhos
-        self.subsection_style = ParagraphStyle(
-            'SubsectionHeader',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            textColor=colors.HexColor('#4472a8'),
-            alignment=TA_LEFT,
-            spaceAfter=8,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Estilo do texto normal
-        self.normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            alignment=TA_JUSTIFY,
-            spaceAfter=6,
-            fontName='Helvetica'
-        )
-        
-        # Estilo para texto em destaque
-        self.highlight_style = ParagraphStyle(
-            'Highlight',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#d32f2f'),
-            alignment=TA_LEFT,
-            spaceAfter=6,
-            fontName='Helvetica-Bold'
-        )
-    
-    def _header_footer(self, canvas, doc, business_name, language):
-        """Adiciona cabeçalho e rodapé às páginas"""
-        canvas.saveState()
-        
-        # Cabeçalho
-        canvas.setFont('Helvetica-Bold', 10)
-        canvas.setFillColor(colors.HexColor('#1f4e79'))
-        canvas.drawString(50, A4[1] - 50, business_name.upper())
-        
-        # Linha decorativa no cabeçalho
-        canvas.setStrokeColor(colors.HexColor('#1f4e79'))
-        canvas.setLineWidth(2)
-        canvas.line(50, A4[1] - 60, A4[0] - 50, A4[1] - 60)
-        
-        # Rodapé
-        canvas.setFont('Helvetica', 8)
-        canvas.setFillColor(colors.gray)
-        page_text = f"{self.translations[language]['page']} {doc.page}"
-        canvas.drawRightString(A4[0] - 50, 30, page_text)
-        
-        # Data no rodapé
-        date_str = datetime.now().strftime('%d/%m/%Y' if language in ['pt', 'es'] else '%m/%d/%Y')
-        canvas.drawString(50, 30, f"{self.translations[language]['date']} {date_str}")
-        
-        canvas.restoreState()
+        # Estilos e textos criados uma vez por processo (report_styles)
+        self.report_styles = get_report_styles()
+        self.styles = self.report_styles.sheet
+        self.title_style = self.report_styles.title
+        self.section_style = self.report_styles.section
+        self.subsection_style = self.report_styles.subsection
+        self.normal_style = self.report_styles.normal
+        self.highlight_style = self.report_styles.highlight
+        self.translations = TRANSLATIONS
     
     def _format_currency(self, value, language="pt"):
         """Formata valores monetários de acordo com o idioma"""
-        if value is None or value == 0:
+        if value is None:
             return "R$ 0,00"
-        
         try:
-            if language == "pt" or language == "es":
-                return f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            else:  # English
-                return f"R$ {value:,.2f}"
-        except:
+            return format_currency(value, language=language)
+        except (TypeError, ValueError):
+            # Valor não numérico vindo de campo de texto: não derruba o PDF inteiro
             return "R$ 0,00"
     
-    def generate_investor_report_pdf(self, business_data, language="pt"):
-        """Gera o PDF completo do relatório para investidores"""
+    @staticmethod
+    def compute_report_figures(business_data):
+        """Numeric content shared by every language variant (computed once per bundle)"""
+        return {
+            'cenarios': get_scenario_cube(business_data).summary_table(),
+            'resumo': get_investor_sections(business_data).view_model
+        }
+    
+    @staticmethod
+    def build_bundle_zip(pdfs, business_name="Otica", output=None):
+        """ZIP with one PDF per language from {idioma: pdf bytes or spooled file path}"""
+        buffer = BytesIO() if output is None else output
+        nome = business_name.replace(' ', '_')
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as pacote:
+            for idioma, pdf in pdfs.items():
+                arquivo = f"relatorio_investidores_{nome}_{BUNDLE_LANGUAGES.get(idioma, idioma)}.pdf"
+                if isinstance(pdf, str):
+                    # Copiado do disco em blocos, sem carregar o PDF inteiro
+                    pacote.write(pdf, arquivo)
+                else:
+                    pacote.writestr(arquivo, pdf)
+        if output is not None:
+            return output
+        buffer.seek(0)
+        return buffer
+    
+    def generate_investor_report_bundle(self, business_data, languages=tuple(BUNDLE_LANGUAGES)):
+        """ZIP with the report in every language, sharing one computation of the figures"""
+        figures = self.compute_report_figures(business_data)
+        pdfs = {
+            idioma: self.generate_investor_report_pdf(business_data, idioma, figures).getvalue()
+            for idioma in languages
+        }
+        return self.build_bundle_zip(pdfs, business_data.get('nome_negocio', 'Ótica'))
+    
+    def generate_investor_report_pdf(self, business_data, language="pt", figures=None, output=None):
+        """Gera o PDF completo do relatório para investidores (em output, caminho ou arquivo, se informado)"""
+        
+        # Números do relatório (recebidos prontos no modo pacote)
+        if figures is None:
+            figures = self.compute_report_figures(business_data)
         
         # Configurar idioma
         lang_code = {"Português": "pt", "English": "en", "Español": "es"}.get(language, "pt")
         t = self.translations[lang_code]
         
-        # Criar buffer para o PDF
-        buffer = BytesIO()
+        # Criar buffer para o PDF (ou arquivo de spool em disco)
+        buffer = BytesIO() if output is None else output
         
         # Configurar documento
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=50,
-            leftMargin=50,
-            topMargin=80,
-            bottomMargin=80
-        )
+        doc = self.report_styles.document(buffer)
         
         # Lista de elementos do documento
         story = []
@@ -400,12 +369,13 @@ class MultilingualInvestorPDFGenerator:
         story.append(Paragraph(t["initial_investment"], self.subsection_style))
         
         # Tabela de investimentos
+        vm = figures['resumo']
         investimento_data = [
-            [t["renovation"], self._format_currency(business_data.get('reforma_loja', 0), lang_code)],
-            [t["equipment"], self._format_currency(business_data.get('equipamentos_moveis', 0), lang_code)],
-            [t["initial_stock"], self._format_currency(business_data.get('estoque_inicial', 0), lang_code)],
-            [t["working_capital"], self._format_currency(business_data.get('capital_giro', 0), lang_code)],
-            [t["total"], self._format_currency(business_data.get('investimento_total', 81500), lang_code)]
+            [t["renovation"], self._format_currency(vm['reforma_loja'], lang_code)],
+            [t["equipment"], self._format_currency(vm['equipamentos_moveis'], lang_code)],
+            [t["initial_stock"], self._format_currency(vm['estoque_inicial'], lang_code)],
+            [t["working_capital"], self._format_currency(vm['capital_giro'], lang_code)],
+            [t["total"], self._format_currency(vm['investimento_total'], lang_code)]
         ]
         
         invest_table = Table(investimento_data, colWidths=[2.5*inch, 1.5*inch])
@@ -425,8 +395,8 @@ class MultilingualInvestorPDFGenerator:
         
         story.append(Paragraph(t["annual_projections"], self.subsection_style))
         projection_data = [
-            [t["revenue"], self._format_currency(business_data.get('receita_anual', 180000), lang_code)],
-            [t["average_ticket"], self._format_currency(business_data.get('ticket_medio', 150), lang_code)]
+            [t["revenue"], self._format_currency(vm['faturamento_anual'], lang_code)],
+            [t["average_ticket"], self._format_currency(vm['ticket_medio'], lang_code)]
         ]
         
         proj_table = Table(projection_data, colWidths=[2.5*inch, 1.5*inch])
@@ -442,6 +412,32 @@ class MultilingualInvestorPDFGenerator:
         ]))
         
         story.append(proj_table)
+        story.append(Spacer(1, 15))
+        
+        # Cenários do cubo compartilhado com as Etapas 10 e 11
+        story.append(Paragraph(t["scenarios"], self.subsection_style))
+        scenario_data = [[t["scenario"], t["revenue"], t["operating_profit"], "ROI"]]
+        for cenario in figures['cenarios']:
+            scenario_data.append([
+                t[f"scenario_{cenario['cenario']}"],
+                self._format_currency(cenario['receita_anual'], lang_code),
+                self._format_currency(cenario['lucro_operacional'], lang_code),
+                f"{cenario['roi']:.1f}%"
+            ])
+        
+        scenario_table = Table(scenario_data, colWidths=[1.6*inch, 1.5*inch, 1.5*inch, 0.8*inch])
+        scenario_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f5')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
+        ]))
+        
+        story.append(scenario_table)
         story.append(PageBreak())
         
         # 5. Equipe e Gestão
@@ -536,12 +532,11 @@ class MultilingualInvestorPDFGenerator:
         
         story.append(Paragraph(recommendation_text, self.highlight_style))
         
-        # Construir PDF com cabeçalho e rodapé customizados
-        def add_header_footer(canvas, doc):
-            self._header_footer(canvas, doc, business_name, lang_code)
-        
-        doc.build(story, onFirstPage=add_header_footer, onLaterPages=add_header_footer)
+        # Construir PDF com o cabeçalho e rodapé padrão dos relatórios
+        self.report_styles.build(doc, story, business_name, lang_code)
         
         # Retornar o buffer
+        if output is not None:
+            return output
         buffer.seek(0)
         return buffer
\ No newline at end of file
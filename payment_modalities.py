@@ -0,0 +1,116 @@
+"""
+Motor de Modalidades de Pagamento
+Receita líquida e calendário de recebimento por modalidade (à vista,
+antecipação, parcelado) calculados como arrays para o catálogo inteiro e para
+o modelo de fluxo de caixa
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+# Taxas das operadoras (%), prazo da primeira parcela (dias) e número de parcelas
+DEFAULT_MODALITIES = OrderedDict([
+    ('À Vista (0 dias)', {'taxa': 0.0, 'prazo_dias': 0, 'parcelas': 1}),
+    ('Antecipação (até 30 dias)', {'taxa': 4.25, 'prazo_dias': 0, 'parcelas': 1}),  # Média 3,99% - 4,5%
+    ('Parcelado (30-60 dias)', {'taxa': 2.425, 'prazo_dias': 30, 'parcelas': 2}),   # Média 2,35% - 2,5%
+    ('Parcelado (60-90 dias)', {'taxa': 3.2, 'prazo_dias': 30, 'parcelas': 3}),
+    ('Parcelado (90+ dias)', {'taxa': 4.8, 'prazo_dias': 30, 'parcelas': 6})
+])
+
+DIAS_POR_MES = 30
+
+
+def credit_terms(prazo_medio_dias):
+    """(first month, installments) of credit sales received with the given average term (days)
+
+    Até 30 dias a operadora repassa tudo de uma vez; acima disso o lojista recebe
+    parcelas mensais a partir do mês seguinte à venda, tantas quantas dão o prazo
+    médio informado (45 dias -> 2 parcelas, 60 -> 3, 90 -> 5)
+    """
+    prazo = max(0, int(prazo_medio_dias))
+    if prazo <= DIAS_POR_MES:
+        return -(-prazo // DIAS_POR_MES), 1
+    return 1, max(1, round(2 * prazo / DIAS_POR_MES - 1))
+
+
+class PaymentModalityEngine:
+    """Net receipts and receivable timing for a set of payment modalities"""
+
+    def __init__(self, modalities=None):
+        self.modalities = OrderedDict(modalities or DEFAULT_MODALITIES)
+        self.names = list(self.modalities)
+        self.taxas = np.array([m['taxa'] for m in self.modalities.values()], dtype=float)
+        self.prazos = np.array([m.get('prazo_dias', 0) for m in self.modalities.values()], dtype=int)
+        self.parcelas = np.array([max(1, m.get('parcelas', 1)) for m in self.modalities.values()], dtype=int)
+
+    @classmethod
+    def two_bucket(cls, taxa, percentual_avista, prazo_dias=30):
+        """À vista / a prazo engine and mix (model used by the step 10 projections)"""
+        primeiro_mes, parcelas = credit_terms(prazo_dias)
+        engine = cls(OrderedDict([
+            ('À Vista', {'taxa': 0.0, 'prazo_dias': 0, 'parcelas': 1}),
+            ('A Prazo', {'taxa': taxa, 'prazo_dias': primeiro_mes * DIAS_POR_MES, 'parcelas': parcelas})
+        ]))
+        fracao_avista = percentual_avista / 100
+        return engine, engine.mix({'À Vista': fracao_avista, 'A Prazo': 1 - fracao_avista})
+
+    @classmethod
+    def from_business_data(cls, business_data):
+        """Two-bucket engine and mix configured in step 5"""
+        data = business_data or {}
+        if data.get('usar_taxa_customizada', False):
+            taxa = data.get('taxa_customizada', 4.3)
+        else:
+            taxa = data.get('taxa_mercado_pago', 4.3)
+        return cls.two_bucket(taxa, data.get('percentual_avista', 70), data.get('prazo_medio_recebimento', 30))
+
+    def mix(self, shares):
+        """Modality mix vector from {modalidade: fração} (missing modalities count as 0)"""
+        return np.array([shares.get(nome, 0.0) for nome in self.names], dtype=float)
+
+    def net_matrix(self, prices):
+        """Net value of each price under each modality (products × modalities)"""
+        prices = np.asarray(prices, dtype=float)
+        return prices[..., None] * (1 - self.taxas / 100)
+
+    def fee_rate(self, mix):
+        """Weighted card fee (%) of a modality mix"""
+        return float(np.asarray(mix, dtype=float) @ self.taxas)
+
+    def net_receipts(self, prices, mix):
+        """Expected net receipt of each price under a modality mix"""
+        return np.asarray(prices, dtype=float) * (1 - self.fee_rate(mix) / 100)
+
+    def margin_matrix(self, prices, costs):
+        """Net value, net margin (R$) and margin % per product × modality"""
+        liquido = self.net_matrix(prices)
+        margem = liquido - np.asarray(costs, dtype=float)[..., None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentual = np.where(liquido > 0, margem / liquido * 100, 0.0)
+        return liquido, margem, percentual
+
+    def receipt_profile(self, horizon=None, net=True):
+        """Fraction of a sale received k months after it, per modality (modalities × months)
+
+        Líquida da taxa por padrão; net=False dá o mesmo calendário em valores brutos
+        (agenda de recebíveis, com a taxa lançada à parte)
+        """
+        primeiro_mes = -(-self.prazos // DIAS_POR_MES)  # prazo em dias arredondado para cima
+        ultimo_mes = primeiro_mes + self.parcelas - 1
+        horizon = horizon or int(ultimo_mes.max()) + 1
+
+        meses = np.arange(horizon)[None, :]
+        recebe = (meses >= primeiro_mes[:, None]) & (meses <= ultimo_mes[:, None])
+        liquido = (1 - self.taxas / 100) if net else 1.0
+        return recebe * (liquido / self.parcelas)[:, None]
+
+    def receipt_kernel(self, mix, horizon=None):
+        """Net fraction of a month's sales received k months later for a modality mix"""
+        return np.asarray(mix, dtype=float) @ self.receipt_profile(horizon)
+
+    def cash_receipts(self, monthly_sales, mix):
+        """Net cash received each month from a series of monthly gross sales"""
+        vendas = np.asarray(monthly_sales, dtype=float)
+        kernel = self.receipt_kernel(mix)
+        return np.convolve(vendas, kernel)[:len(vendas)]
@@ -1,27 +1,21 @@
 import io
 import base64
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 import numpy as np
+from chart_service import get_chart_service
+from report_styles import get_report_styles
 
 class PDFGenerator:
     """Generator for PDF reports and business plan documents"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=16,
-            spaceAfter=30,
-            textColor=colors.darkblue
-        )
+        # Styles shared with the investor reports, built once per process
+        self.report_styles = get_report_styles()
+        self.styles = self.report_styles.sheet
+        self.title_style = self.report_styles.title
     
     def generate_business_plan_report(self, business_data, dre_data):
         """Generate a comprehensive business plan report in text format"""
@@ -307,11 +301,10 @@ Data: {datetime.now().strftime('%d/%m/%Y')}
 """
         return summary
     
-    def generate_pdf_with_charts(self, business_data, dre_data, charts_data=None):
-        """Generate PDF report with charts and financial data"""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72,
-                               topMargin=72, bottomMargin=18)
+    def generate_pdf_with_charts(self, business_data, dre_data, charts_data=None, output=None):
+        """Generate PDF report with charts and financial data (written to output path/file if given)"""
+        buffer = io.BytesIO() if output is None else output
+        doc = self.report_styles.document(buffer)
         
         # Container for the 'Flowable' objects
         elements = []
@@ -470,18 +463,16 @@ Data: {datetime.now().strftime('%d/%m/%Y')}
             elements.append(tax_para)
         
         # Build PDF
-        doc.build(elements)
+        self.report_styles.build(doc, elements, business_data.get('nome_otica', 'Ótica'))
+        if output is not None:
+            return output
         buffer.seek(0)
         return buffer.getvalue()
     
     def create_dre_chart(self, dre_data):
-        """Create DRE waterfall chart using matplotlib"""
+        """Create DRE waterfall chart (PNG buffer, cached by the chart data)"""
+        titulo = 'Demonstrativo do Resultado do Exercício (DRE)'
         try:
-            plt.style.use('default')
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # Data for waterfall chart
-            labels = ['Receita\nBruta', 'Impostos', 'CMV', 'Custos\nFixos', 'Custos\nPessoal', 'Lucro\nLíquido']
             values = [
                 dre_data.get('receita_bruta', 0),
                 -dre_data.get('impostos', 0),
@@ -490,72 +481,21 @@ Data: {datetime.now().strftime('%d/%m/%Y')}
                 -dre_data.get('custos_pessoal', 0),
                 dre_data.get('lucro_liquido', 0)
             ]
-            
-            # Create waterfall effect
-            cumulative = np.cumsum([0] + values[:-1])
-            colors = ['green', 'red', 'red', 'red', 'red', 'blue']
-            
-            # Plot bars
-            for i, (label, value, cum, color) in enumerate(zip(labels, values, cumulative, colors)):
-                if i == 0 or i == len(labels) - 1:  # First and last bars start from zero
-                    ax.bar(i, abs(value), bottom=0 if value >= 0 else value, 
-                          color=color, alpha=0.7, edgecolor='black')
-                else:  # Intermediate bars stack
-                    bottom = cum if value < 0 else cum + value
-                    ax.bar(i, abs(value), bottom=bottom, 
-                          color=color, alpha=0.7, edgecolor='black')
-                
-                # Add value labels
-                label_y = cum + value/2 if i != 0 and i != len(labels)-1 else value/2
-                ax.text(i, label_y, f'R$ {abs(value):,.0f}', ha='center', va='center', 
-                       fontweight='bold', fontsize=9)
-            
-            # Connect bars with lines
-            for i in range(len(labels) - 1):
-                if i < len(cumulative) - 1:
-                    start_y = cumulative[i] + values[i] if i > 0 else values[0]
-                    end_y = cumulative[i + 1]
-                    ax.plot([i + 0.4, i + 1 - 0.4], [start_y, end_y], 
-                           'k--', alpha=0.5, linewidth=1)
-            
-            ax.set_xticks(range(len(labels)))
-            ax.set_xticklabels(labels, rotation=0, ha='center')
-            ax.set_ylabel('Valor (R$)')
-            ax.set_title('Demonstrativo do Resultado do Exercício (DRE)', fontsize=14, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-            
-            # Format y-axis
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
-            
-            plt.tight_layout()
-            
-            # Save to buffer
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
-            buffer.seek(0)
-            plt.close()
-            
-            return buffer
+            return get_chart_service().render_buffer('dre', {
+                'labels': ['Receita\nBruta', 'Impostos', 'CMV', 'Custos\nFixos', 'Custos\nPessoal', 'Lucro\nLíquido'],
+                'values': [float(v) for v in values],
+                'title': titulo
+            })
             
         except Exception as e:
             # Fallback simple chart
-            fig, ax = plt.subplots(figsize=(8, 6))
-            ax.text(0.5, 0.5, 'Gráfico DRE\nEm construção', ha='center', va='center', 
-                   fontsize=16, fontweight='bold')
-            ax.set_title('Demonstrativo do Resultado do Exercício')
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            plt.close()
-            
-            return buffer
+            return get_chart_service().render_buffer('placeholder', {
+                'message': 'Gráfico DRE\nEm construção',
+                'title': 'Demonstrativo do Resultado do Exercício'
+            })
     
     def create_projection_chart(self, business_data, dre_data):
-        """Create monthly projection chart"""
+        """Create monthly projection chart (PNG buffer, cached by the chart data)"""
         try:
             months = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 
                      'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
@@ -563,45 +503,16 @@ Data: {datetime.now().strftime('%d/%m/%Y')}
             receita_base = dre_data.get('receita_bruta', 0)
             lucro_base = dre_data.get('lucro_liquido', 0)
             
-            receitas = []
-            lucros = []
-            
-            for i, month in enumerate(months):
-                growth_factor = 1 + (i * 0.02)  # 2% monthly growth
-                seasonality = 1.3 if month in ['Dez', 'Jan', 'Jul'] else 1.0
-                
-                receita_mes = receita_base * growth_factor * seasonality
-                lucro_mes = lucro_base * growth_factor * seasonality
-                
-                receitas.append(receita_mes)
-                lucros.append(lucro_mes)
-            
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            x = np.arange(len(months))
-            ax.plot(x, receitas, marker='o', linewidth=2, label='Receita Bruta', color='blue')
-            ax.plot(x, lucros, marker='s', linewidth=2, label='Lucro Líquido', color='green')
-            
-            ax.set_xlabel('Meses')
-            ax.set_ylabel('Valor (R$)')
-            ax.set_title('Projeção Anual - Receita e Lucro', fontsize=14, fontweight='bold')
-            ax.set_xticks(x)
-            ax.set_xticklabels(months)
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            # Format y-axis
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'R$ {x:,.0f}'))
-            
-            plt.tight_layout()
-            
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            buffer.seek(0)
-            plt.close()
+            # 2% de crescimento ao mês e sazonalidade de 30% em Dez, Jan e Jul
+            growth_factor = 1 + np.arange(len(months)) * 0.02
+            seasonality = np.where(np.isin(months, ['Dez', 'Jan', 'Jul']), 1.3, 1.0)
             
-            return buffer
+            return get_chart_service().render_buffer('projecao', {
+                'months': months,
+                'receitas': (receita_base * growth_factor * seasonality).tolist(),
+                'lucros': (lucro_base * growth_factor * seasonality).tolist(),
+                'title': 'Projeção Anual - Receita e Lucro'
+            })
             
         except Exception as e:
             return None
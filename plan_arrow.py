@@ -0,0 +1,284 @@
+"""
+Exportação Colunar dos Resultados dos Planos (Arrow/Parquet)
+Projeção mensal, cubo de cenários e simulações Monte Carlo de muitos planos
+gravados em três tabelas longas (uma linha por plano × mês/cenário/simulação),
+com as colunas plano_id, versao e fingerprint; a leitura mapeia os arquivos Arrow
+em memória (sem cópia nem parsing de JSON/CSV) para as visões de comparação
+
+Uso (carga do BI):
+    python plan_arrow.py saved_plans/ dados_usuarios/ -o planos_arrow/ --workers 4
+"""
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow é opcional: só a exportação colunar depende dele
+    pa = None
+    pc = None
+
+from batch_evaluate import find_plan_files, load_plan, monte_carlo_draws, plan_seed
+from financial_projection import FinancialProjection
+from scenario_cube import ScenarioCube, plan_fingerprint
+
+# Tabelas exportadas e a coluna que ordena as linhas de cada plano
+TABLES = {
+    'projecoes': 'mes',
+    'cenarios': 'mes',
+    'simulacoes': 'simulacao'
+}
+
+KEY_COLUMNS = ['plano_id', 'versao', 'fingerprint']
+
+# Arquivos salvos com "Salvar como nova versão" (save_business_plan)
+VERSION_PATTERN = re.compile(r'_Versao_(\d+)$')
+
+FORMATS = {'arrow': '.arrow', 'parquet': '.parquet'}
+
+SIMULATION_COLUMNS = ['receita', 'custos_variaveis_percentual', 'custos_fixos', 'lucro']
+
+
+def require_arrow():
+    """Fail with an install hint when pyarrow is missing"""
+    if pa is None:
+        raise ImportError("Exportação Arrow/Parquet requer pyarrow (pip install pyarrow)")
+
+
+def table_schema(tabela):
+    """Arrow schema of one exported table"""
+    require_arrow()
+    chaves = [('plano_id', pa.string()), ('versao', pa.int32()), ('fingerprint', pa.string())]
+    if tabela == 'projecoes':
+        colunas = [('mes', pa.int16())] + [
+            (chave, pa.float64()) for chave in FinancialProjection.DRE_KEYS + ['recebimentos_vendas']
+        ]
+    elif tabela == 'cenarios':
+        colunas = [('cenario', pa.string()), ('lojas', pa.int16()), ('mes', pa.int16())] + [
+            (metrica, pa.float64()) for metrica in ScenarioCube.METRICS
+        ]
+    elif tabela == 'simulacoes':
+        colunas = [('simulacao', pa.int32())] + [(coluna, pa.float64()) for coluna in SIMULATION_COLUMNS]
+    else:
+        raise ValueError(f"Tabela desconhecida: {tabela}")
+    return pa.schema(chaves + colunas)
+
+
+def plan_identity(path, nome):
+    """Plan id and version of a plan file ('<plano>_Versao_<n>.json' is version n, others version 1)"""
+    base = os.path.splitext(os.path.basename(path))[0]
+    versao = VERSION_PATTERN.search(base)
+    return VERSION_PATTERN.sub('', nome), int(versao.group(1)) if versao else 1
+
+
+def _batch(tabela, chaves, n, colunas):
+    """Record batch of n rows: the plan key columns repeated, then the table columns"""
+    schema = table_schema(tabela)
+    plano_id, versao, fingerprint = chaves
+    arrays = [
+        pa.array([plano_id] * n, pa.string()),
+        pa.array(np.full(n, versao, dtype=np.int32)),
+        pa.array([fingerprint] * n, pa.string())
+    ]
+    arrays.extend(pa.array(colunas[campo.name], campo.type) for campo in list(schema)[len(KEY_COLUMNS):])
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def plan_batches(business_data, plano_id, versao=1, months=60, simulacoes=1000, seed=0):
+    """{table: record batch} with the projection, scenario cube and Monte Carlo draws of one plan"""
+    require_arrow()
+    chaves = (plano_id, versao, plan_fingerprint(business_data))
+
+    # Projeção mensal (Etapa 10)
+    projection = FinancialProjection(business_data)
+    projecao = projection.project(months)
+    entradas = projection.get_inputs()
+    projecao['mes'] = projecao['mes'].astype(np.int16)
+    batches = {'projecoes': _batch('projecoes', chaves, months, projecao)}
+
+    # Cubo de cenários (Etapa 11) em formato longo: cenário × lojas × mês
+    cubo = ScenarioCube(business_data, horizon=months)
+    n_cenarios, _, n_lojas, _ = cubo.data.shape
+    longo = cubo.data.transpose(0, 2, 1, 3).reshape(-1, len(cubo.METRICS))
+    colunas = {
+        'cenario': np.repeat(list(cubo.SCENARIOS), n_lojas * months),
+        'lojas': np.tile(np.repeat(np.array(cubo.store_counts, dtype=np.int16), months), n_cenarios),
+        'mes': np.tile(np.arange(1, months + 1, dtype=np.int16), n_cenarios * n_lojas)
+    }
+    colunas.update({metrica: longo[:, i] for i, metrica in enumerate(cubo.METRICS)})
+    batches['cenarios'] = _batch('cenarios', chaves, len(longo), colunas)
+
+    # Simulações Monte Carlo (Etapa 12) sobre a mesma base do resumo em lote
+    resumo = projection.summarize(12)
+    receita_anual = business_data.get('receita_anual', resumo['receita_anual'])
+    sorteios = monte_carlo_draws(business_data, receita_anual, entradas['investimento_total'], simulacoes, seed)
+    sorteios['simulacao'] = np.arange(1, simulacoes + 1, dtype=np.int32)
+    batches['simulacoes'] = _batch('simulacoes', chaves, simulacoes, sorteios)
+
+    return batches
+
+
+def plan_file_batches(path, months=60, simulacoes=1000, seed=0):
+    """(path, {table: record batch}, error) for one plan file (runs inside the worker process)"""
+    try:
+        nome, business_data, _ = load_plan(path)
+        plano_id, versao = plan_identity(path, nome)
+        return path, plan_batches(business_data, plano_id, versao, months, simulacoes, plan_seed(path, seed)), ''
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+class PlanArrowWriter:
+    """One Arrow IPC (or Parquet) file per table, appended one record batch per plan"""
+
+    def __init__(self, directory, formato='arrow'):
+        require_arrow()
+        if formato not in FORMATS:
+            raise ValueError(f"Formato desconhecido: {formato}")
+        self.directory = directory
+        self.formato = formato
+        self._writers = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, tabela):
+        """File of one table in the output directory"""
+        return os.path.join(self.directory, tabela + FORMATS[self.formato])
+
+    def _writer(self, tabela):
+        """Writer of a table's file, opened on its first batch"""
+        writer = self._writers.get(tabela)
+        if writer is None:
+            schema = table_schema(tabela)
+            if self.formato == 'parquet':
+                import pyarrow.parquet as pq
+                writer = pq.ParquetWriter(self.path(tabela), schema, compression='zstd')
+            else:
+                # IPC sem compressão: os buffers são usados direto do arquivo mapeado
+                writer = pa.ipc.new_file(self.path(tabela), schema)
+            self._writers[tabela] = writer
+        return writer
+
+    def write(self, batches):
+        """Append one plan's batches ({table: record batch})"""
+        for tabela, batch in batches.items():
+            self._writer(tabela).write_batch(batch)
+
+    def close(self):
+        """Finish every table file (writes the Arrow footer / Parquet metadata)"""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_files(arquivos, directory, formato='arrow', workers=None, months=60, simulacoes=1000, seed=0):
+    """Write the tables of every plan file; returns {path: error} for the plans that failed"""
+    erros = {}
+    workers = workers or os.cpu_count() or 1
+    with PlanArrowWriter(directory, formato) as writer:
+        if workers > 1 and len(arquivos) > 1:
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(arquivos)))
+            n = len(arquivos)
+            resultados = pool.map(
+                plan_file_batches, arquivos, [months] * n, [simulacoes] * n, [seed] * n,
+                chunksize=max(1, n // (workers * 4))
+            )
+        else:
+            pool = None
+            resultados = (plan_file_batches(arquivo, months, simulacoes, seed) for arquivo in arquivos)
+
+        try:
+            # Cada plano vai para o arquivo assim que fica pronto
+            for path, batches, erro in resultados:
+                if erro:
+                    erros[path] = erro
+                else:
+                    writer.write(batches)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    return erros
+
+
+def export_plans(paths, directory, formato='arrow', workers=None, months=60, simulacoes=1000, seed=0):
+    """Columnar export of every plan file under the given paths"""
+    return export_files(find_plan_files(paths), directory, formato, workers, months, simulacoes, seed)
+
+
+def read_table(directory, tabela, columns=None, planos=None, fingerprints=None):
+    """Exported table as an Arrow table (Arrow files are memory-mapped, Parquet read with memory_map)"""
+    require_arrow()
+    if tabela not in TABLES:
+        raise ValueError(f"Tabela desconhecida: {tabela}")
+
+    caminho = os.path.join(directory, tabela + FORMATS['arrow'])
+    if os.path.exists(caminho):
+        # Leitura sem cópia: as colunas apontam para as páginas do arquivo mapeado
+        with pa.memory_map(caminho, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+    else:
+        import pyarrow.parquet as pq
+        table = pq.read_table(os.path.join(directory, tabela + FORMATS['parquet']), memory_map=True)
+
+    if planos is not None:
+        table = table.filter(pc.is_in(table['plano_id'], value_set=pa.array(list(planos), pa.string())))
+    if fingerprints is not None:
+        table = table.filter(pc.is_in(table['fingerprint'], value_set=pa.array(list(fingerprints), pa.string())))
+    if columns is not None:
+        table = table.select(list(dict.fromkeys(KEY_COLUMNS + list(columns))))
+    return table
+
+
+def compare(directory, tabela, metrica, planos=None, fingerprints=None, **filtros):
+    """Comparison view: one column per plan version with the metric by month (or simulation)
+
+    Extra keyword filters select one slice of the table, e.g. cenario='realista', lojas=1
+    """
+    indice = TABLES[tabela]
+    table = read_table(directory, tabela, [indice, metrica] + list(filtros), planos, fingerprints)
+    for coluna, valor in filtros.items():
+        table = table.filter(pc.equal(table[coluna], valor))
+
+    df = table.select(['plano_id', 'versao', indice, metrica]).to_pandas()
+    return df.pivot_table(index=indice, columns=['plano_id', 'versao'], values=metrica, aggfunc='first')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta projeções, cenários e simulações dos planos em Arrow/Parquet")
+    parser.add_argument('paths', nargs='*', default=['saved_plans'], help="Arquivos .json ou pastas com planos")
+    parser.add_argument('-o', '--output', default='planos_arrow', help="Pasta de saída (uma tabela por arquivo)")
+    parser.add_argument('-f', '--formato', choices=sorted(FORMATS), default='arrow', help="Formato dos arquivos")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Processos em paralelo (padrão: núcleos da CPU)")
+    parser.add_argument('--meses', type=int, default=60, help="Horizonte da projeção e dos cenários")
+    parser.add_argument('--simulacoes', type=int, default=1000, help="Simulações Monte Carlo por plano")
+    parser.add_argument('--seed', type=int, default=0, help="Semente base das simulações")
+    args = parser.parse_args(argv)
+
+    if pa is None:
+        raise SystemExit("Exportação Arrow/Parquet requer pyarrow (pip install pyarrow)")
+
+    arquivos = find_plan_files(args.paths)
+    if not arquivos:
+        print("Nenhum plano encontrado", file=sys.stderr)
+        return 1
+
+    erros = export_files(arquivos, args.output, args.formato, args.workers, args.meses, args.simulacoes, args.seed)
+    for path, erro in erros.items():
+        print(f"{path}: {erro}", file=sys.stderr)
+    print(f"{len(arquivos) - len(erros)} planos exportados ({len(erros)} com erro) -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
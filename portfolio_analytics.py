@@ -0,0 +1,141 @@
+"""
+Análise de Carteira (todos os planos de todos os usuários)
+Tabela resumo incremental com os indicadores de cada plano salvo, chaveada por
+arquivo e data de modificação: só os planos alterados desde a última execução
+são recalculados pelo motor de avaliação em lote
+
+Uso (rotina noturna do administrador):
+    python portfolio_analytics.py --workers 4
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+from batch_evaluate import evaluate_files
+
+
+class PortfolioAnalytics:
+    """Incrementally maintained summary table of every stored plan"""
+
+    SUMMARY_FILE = 'portfolio_summary.csv'
+    KEY_COLUMNS = ['arquivo', 'usuario', 'modificado_em']
+
+    # Indicadores consolidados por grupo (região, regime tributário...)
+    AGGREGATIONS = {
+        'planos': ('arquivo', 'count'),
+        'ticket_medio': ('ticket_medio', 'median'),
+        'roi_anual': ('roi_anual', 'median'),
+        'payback_meses': ('payback_meses', 'median'),
+        'ponto_equilibrio_valor': ('ponto_equilibrio_valor', 'median'),
+        'investimento_total': ('investimento_total', 'sum')
+    }
+
+    def __init__(self, summary_file=SUMMARY_FILE, users_file='users_database.json', plans_dir='saved_plans'):
+        self.summary_file = summary_file
+        self.users_file = users_file
+        self.plans_dir = plans_dir
+
+    def discover(self):
+        """Every stored plan file with its owner and modification time (ns)"""
+        planos = []
+
+        # Planos em andamento de cada usuário (pasta de dados do auth_system)
+        if os.path.exists(self.users_file):
+            with open(self.users_file, 'r', encoding='utf-8') as f:
+                usuarios = json.load(f)
+            for usuario, dados in usuarios.items():
+                arquivo = os.path.join(dados.get('data_folder', ''), 'business_data.json')
+                if os.path.exists(arquivo):
+                    planos.append((arquivo, usuario))
+
+        # Planos salvos/versões (saved_plans/)
+        if os.path.isdir(self.plans_dir):
+            planos.extend(
+                (os.path.join(self.plans_dir, nome), '') for nome in sorted(os.listdir(self.plans_dir))
+                if nome.endswith('.json')
+            )
+
+        return pd.DataFrame(
+            [(arquivo, usuario, os.stat(arquivo).st_mtime_ns) for arquivo, usuario in planos],
+            columns=self.KEY_COLUMNS
+        )
+
+    def load(self):
+        """Summary table from the last run (empty if it was never run)"""
+        if not os.path.exists(self.summary_file):
+            return pd.DataFrame(columns=self.KEY_COLUMNS)
+        resumo = pd.read_csv(self.summary_file)
+        return resumo.fillna({coluna: '' for coluna in ('usuario', 'erro') if coluna in resumo})
+
+    def save(self, summary):
+        """Write the summary table atomically (readers never see a half-written file)"""
+        temporario = self.summary_file + '.tmp'
+        summary.to_csv(temporario, index=False, encoding='utf-8')
+        os.replace(temporario, self.summary_file)
+
+    def refresh(self, workers=None, full=False):
+        """Recompute new/changed plans, drop deleted ones and save; returns run counters"""
+        anterior = self.load()
+        planos = self.discover()
+
+        versoes = planos.merge(anterior[['arquivo', 'modificado_em']], on='arquivo', how='left',
+                               suffixes=('', '_anterior'))
+        if full:
+            alterado = pd.Series(True, index=versoes.index)
+        else:
+            alterado = versoes['modificado_em'] != versoes['modificado_em_anterior']
+        pendentes = planos[alterado.to_numpy()]
+
+        linhas = pd.DataFrame(evaluate_files(pendentes['arquivo'].tolist(), workers))
+        if not linhas.empty:
+            linhas = pendentes.merge(linhas, on='arquivo')
+
+        mantidos = anterior[anterior['arquivo'].isin(planos.loc[~alterado.to_numpy(), 'arquivo'])]
+        partes = [df for df in (mantidos, linhas) if not df.empty]
+        resumo = pd.concat(partes, ignore_index=True) if partes else pd.DataFrame(columns=self.KEY_COLUMNS)
+        resumo = resumo.sort_values('arquivo', ignore_index=True)
+        self.save(resumo)
+
+        return {
+            'planos': len(resumo),
+            'recalculados': len(pendentes),
+            'novos': int(versoes['modificado_em_anterior'].isna().sum()),
+            'removidos': int((~anterior['arquivo'].isin(planos['arquivo'])).sum()),
+            'erros': int((resumo['erro'].fillna('') != '').sum()) if 'erro' in resumo else 0
+        }
+
+    def aggregate(self, by='estado', summary=None):
+        """Portfolio indicators per group (region, tax regime...) from the summary table"""
+        summary = self.load() if summary is None else summary
+        if summary.empty:
+            return pd.DataFrame()
+        if 'erro' in summary:
+            summary = summary[summary['erro'] == '']
+        colunas = {nome: agg for nome, agg in self.AGGREGATIONS.items() if agg[0] in summary}
+        return summary.fillna({by: ''}).groupby(by).agg(**colunas).reset_index()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Atualiza a tabela resumo da carteira de planos")
+    parser.add_argument('-o', '--output', default=PortfolioAnalytics.SUMMARY_FILE, help="Tabela resumo (CSV)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Processos em paralelo")
+    parser.add_argument('--full', action='store_true', help="Recalcula todos os planos")
+    parser.add_argument('--por', default=None, help="Mostra indicadores agrupados (ex.: estado, regime_tributario)")
+    args = parser.parse_args(argv)
+
+    carteira = PortfolioAnalytics(args.output)
+    resultado = carteira.refresh(args.workers, args.full)
+    print(f"{resultado['planos']} planos na carteira: {resultado['recalculados']} recalculados "
+          f"({resultado['novos']} novos), {resultado['removidos']} removidos, {resultado['erros']} com erro")
+
+    if args.por:
+        print(carteira.aggregate(args.por).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,49 +3,20 @@ Sistema de Sugestão de Preços para Lentes Oftálmicas
 Baseado em dados de mercado e estrutura de custos
 """
 
+import numpy as np
 import pandas as pd
 
+from product_catalog import get_product_catalog, TABELA_SUGESTAO_PRECOS
+
 class LensPricingSuggestions:
     """Sistema de sugestão de preços para lentes com base no mercado"""
     
     def __init__(self):
-        # Custos base dos fornecedores (médias de mercado)
-        self.custos_base = {
-            'simples': {
-                'basico': 35.0,
-                'intermediario': 50.0, 
-                'premium': 75.0
-            },
-            'bifocal': {
-                'basico': 65.0,
-                'intermediario': 90.0,
-                'premium': 130.0
-            },
-            'multifocal': {
-                'basico': 180.0,
-                'intermediario': 280.0,
-                'premium': 450.0
-            }
-        }
+        catalog = get_product_catalog()
         
-        # Custos dos tratamentos
-        self.custos_tratamentos = {
-            'anti_reflexo': {
-                'basico': 15.0,
-                'intermediario': 25.0,
-                'premium': 40.0
-            },
-            'blue_light': {
-                'basico': 20.0,
-                'intermediario': 35.0,
-                'premium': 55.0
-            },
-            'fotosensivel': {
-                'basico': 45.0,
-                'intermediario': 75.0,
-                'premium': 120.0
-            }
-        }
+        # Custos base dos fornecedores (médias de mercado) e dos tratamentos por linha
+        self.custos_base = catalog.nested_costs(TABELA_SUGESTAO_PRECOS, 'lente')
+        self.custos_tratamentos = catalog.nested_costs(TABELA_SUGESTAO_PRECOS, 'tratamento')
         
         # Preços de mercado de referência (pesquisa 2024)
         self.precos_mercado = {
@@ -72,6 +43,9 @@ class LensPricingSuggestions:
             'intermediario': {'min': 60, 'recomendada': 70, 'max': 80},
             'premium': {'min': 65, 'recomendada': 75, 'max': 85}
         }
+        
+        # Acessórios opcionais (mesmo custo em todas as linhas)
+        self.custos_acessorios = catalog.costs(TABELA_SUGESTAO_PRECOS, 'acessorio')
     
     def calcular_custo_total(self, tipo_lente, linha, tratamentos=[]):
         """Calcula custo total da lente com tratamentos"""
@@ -145,45 +119,106 @@ class LensPricingSuggestions:
         else:
             return 'Super Premium'
     
-    def gerar_tabela_completa(self, estrategia='competitiva'):
-        """Gera tabela completa de preços para todas as combinações"""
-        resultados = []
+    def _itens_opcionais(self, linha, incluir_acessorios):
+        """Nomes e custos dos itens opcionais; a posição na lista é o bit da máscara"""
+        itens = [(t, custos[linha]) for t, custos in self.custos_tratamentos.items()]
+        if incluir_acessorios:
+            itens += list(self.custos_acessorios.items())
+        return [nome for nome, _ in itens], np.array([custo for _, custo in itens], dtype=float)
+    
+    @staticmethod
+    def _somas_subconjuntos(custos):
+        """Soma de custos de todos os 2^n subconjuntos, indexada pela máscara de bits"""
+        somas = np.zeros(1)
+        for custo in custos:
+            # Dobrar a tabela: a metade nova tem o bit deste item ligado
+            somas = np.concatenate([somas, somas + custo])
+        return somas
+    
+    @staticmethod
+    def _podar_dominadas(custos, precos):
+        """Índices das combinações não dominadas (nenhuma outra custa menos e vale mais)"""
+        ordem = np.lexsort((-precos, custos))
+        precos_ordenados = precos[ordem]
+        melhor_anterior = np.maximum.accumulate(np.concatenate([[-np.inf], precos_ordenados[:-1]]))
+        return np.sort(ordem[precos_ordenados > melhor_anterior])
+    
+    def _precos_vetorizados(self, custos, tipo_lente, linha, estrategia):
+        """Mesmas regras de sugerir_precos aplicadas a um array de custos"""
+        if estrategia == 'conservadora':
+            margem_pct = self.margens_recomendadas[linha]['min']
+        elif estrategia == 'competitiva':
+            margem_pct = self.margens_recomendadas[linha]['recomendada']
+        else:  # agressiva
+            margem_pct = self.margens_recomendadas[linha]['max']
+        
+        preco_margem = custos / (1 - margem_pct/100)
+        mercado = self.precos_mercado[tipo_lente][linha]
+        
+        if estrategia == 'conservadora':
+            preco_sugerido = np.minimum(preco_margem, mercado['medio'])
+        elif estrategia == 'competitiva':
+            preco_sugerido = np.clip(preco_margem, mercado['min'], mercado['max'])
+        else:  # agressiva
+            preco_sugerido = np.minimum(preco_margem, mercado['max'])
+        
+        posicionamento = np.select(
+            [preco_sugerido <= mercado['min'], preco_sugerido <= mercado['medio'], preco_sugerido <= mercado['max']],
+            ['Entrada/Econômico', 'Competitivo', 'Premium'],
+            default='Super Premium'
+        )
+        return preco_sugerido, posicionamento, mercado
+    
+    def gerar_combinacoes(self, tipo_lente, linha, estrategia='competitiva', incluir_acessorios=True, podar_dominadas=True):
+        """Preço sugerido de todos os subconjuntos de tratamentos/acessórios de uma lente"""
+        nomes, custos_itens = self._itens_opcionais(linha, incluir_acessorios)
+        
+        mascaras = np.arange(2 ** len(nomes))
+        custos = self.custos_base[tipo_lente][linha] + self._somas_subconjuntos(custos_itens)
+        precos, posicionamento, mercado = self._precos_vetorizados(custos, tipo_lente, linha, estrategia)
+        
+        if podar_dominadas:
+            manter = self._podar_dominadas(custos, precos)
+            mascaras, custos, precos, posicionamento = mascaras[manter], custos[manter], precos[manter], posicionamento[manter]
         
+        # Mesma ordem da tabela original: quantidade de itens e depois máscara
+        quantidade_itens = ((mascaras[:, None] >> np.arange(len(nomes))) & 1).sum(axis=1)
+        ordem = np.lexsort((mascaras, quantidade_itens))
+        mascaras, custos, precos, posicionamento = mascaras[ordem], custos[ordem], precos[ordem], posicionamento[ordem]
+        
+        # Rótulos só para as combinações que sobraram
+        tratamentos_str = [
+            ' + '.join(nomes[i].replace('_', ' ').title() for i in range(len(nomes)) if m >> i & 1) or 'Sem tratamento'
+            for m in mascaras
+        ]
+        
+        return pd.DataFrame({
+            'Tipo Lente': tipo_lente.title(),
+            'Linha': linha.title(),
+            'Máscara': mascaras,
+            'Tratamentos': tratamentos_str,
+            'Custo Total': custos,
+            'Preço Sugerido': np.round(precos, 2),
+            'Margem (%)': np.round((precos - custos) / precos * 100, 1),
+            'Markup': np.round(precos / custos, 2),
+            'Posicionamento': posicionamento,
+            'Mercado Min': mercado['min'],
+            'Mercado Médio': mercado['medio'],
+            'Mercado Max': mercado['max']
+        })
+    
+    def gerar_tabela_completa(self, estrategia='competitiva', incluir_acessorios=False, podar_dominadas=False):
+        """Gera tabela completa de preços para todas as combinações"""
         tipos_lente = ['simples', 'bifocal', 'multifocal']
         linhas = ['basico', 'intermediario', 'premium']
-        combinacoes_tratamentos = [
-            [],
-            ['anti_reflexo'],
-            ['blue_light'],
-            ['fotosensivel'],
-            ['anti_reflexo', 'blue_light'],
-            ['anti_reflexo', 'fotosensivel'],
-            ['blue_light', 'fotosensivel'],
-            ['anti_reflexo', 'blue_light', 'fotosensivel']
-        ]
         
-        for tipo in tipos_lente:
-            for linha in linhas:
-                for tratamentos in combinacoes_tratamentos:
-                    resultado = self.sugerir_precos(tipo, linha, tratamentos, estrategia)
-                    
-                    tratamentos_str = ' + '.join([t.replace('_', ' ').title() for t in tratamentos]) if tratamentos else 'Sem tratamento'
-                    
-                    resultados.append({
-                        'Tipo Lente': tipo.title(),
-                        'Linha': linha.title(),
-                        'Tratamentos': tratamentos_str,
-                        'Custo Total': resultado['custo_total'],
-                        'Preço Sugerido': resultado['preco_sugerido'],
-                        'Margem (%)': resultado['margem_percentual'],
-                        'Markup': resultado['markup'],
-                        'Posicionamento': resultado['posicionamento'],
-                        'Mercado Min': resultado['referencia_mercado']['minimo'],
-                        'Mercado Médio': resultado['referencia_mercado']['medio'],
-                        'Mercado Max': resultado['referencia_mercado']['maximo']
-                    })
+        tabelas = [
+            self.gerar_combinacoes(tipo, linha, estrategia, incluir_acessorios, podar_dominadas)
+            for tipo in tipos_lente
+            for linha in linhas
+        ]
         
-        return pd.DataFrame(resultados)
+        return pd.concat(tabelas, ignore_index=True).drop(columns='Máscara')
     
     def calcular_mix_otimo(self, vendas_mensais_esperadas=100):
         """Sugere mix de produtos otimizado para lucratividade"""
@@ -0,0 +1,95 @@
+"""
+Catálogo Unificado de Produtos
+Custos de lentes, armações, tratamentos, acessórios e serviços carregados uma
+única vez de product_catalog.csv e consultados por todos os módulos de custos
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'product_catalog.csv')
+
+# Tabelas de custo do catálogo (uma por módulo consumidor)
+TABELA_FORNECEDORES = 'fornecedores'            # ProductCostCalculator
+TABELA_ANALISE_INTEGRADA = 'analise_integrada'  # IntegratedCostAnalyzer
+TABELA_ETAPA10 = 'etapa10'                      # IntegratedCostAnalyzerStep10
+TABELA_CUSTOS_DIRETOS = 'custos_diretos'        # Seleção individual (Etapa 10)
+TABELA_SUGESTAO_PRECOS = 'sugestao_precos'      # LensPricingSuggestions
+
+
+class ProductCatalog:
+    """Columnar product cost catalog with lookup indexes"""
+
+    TEXT_COLUMNS = ['tabela', 'categoria', 'fornecedor', 'tipo', 'linha', 'nome', 'indice', 'base']
+    NUMERIC_COLUMNS = ['esf_min', 'esf_max', 'cil_min', 'cil_max', 'add_min', 'add_max', 'custo']
+
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self.data = pd.read_csv(
+            path,
+            dtype={col: str for col in self.TEXT_COLUMNS},
+            keep_default_na=False,
+            na_values={col: [''] for col in self.NUMERIC_COLUMNS}
+        )
+        self._custo = self.data['custo'].to_numpy(dtype=float)
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Hash indexes: unique key and positions by table/category and by supplier"""
+        chaves = zip(self.data['tabela'], self.data['categoria'], self.data['nome'])
+        self._por_chave = {}
+        for posicao, chave in enumerate(chaves):
+            if chave in self._por_chave:
+                raise ValueError(f"Produto duplicado no catálogo: {chave}")
+            self._por_chave[chave] = posicao
+
+        self._por_tabela = self._group_positions(['tabela', 'categoria'])
+        self._por_fornecedor = self._group_positions('fornecedor')
+
+    def _group_positions(self, columns):
+        """Row positions (in file order) for each value of the given column(s)"""
+        return {
+            chave: np.sort(posicoes)
+            for chave, posicoes in self.data.groupby(columns, sort=False).indices.items()
+        }
+
+    def cost(self, tabela, categoria, nome, default=None):
+        """Unit cost of one product (O(1) lookup)"""
+        posicao = self._por_chave.get((tabela, categoria, nome))
+        return float(self._custo[posicao]) if posicao is not None else default
+
+    def costs(self, tabela, categoria):
+        """Costs of a table/category as {nome: custo}, in catalog order"""
+        posicoes = self._por_tabela.get((tabela, categoria), [])
+        return {self.data['nome'].iat[p]: float(self._custo[p]) for p in posicoes}
+
+    def nested_costs(self, tabela, categoria):
+        """Costs of a table/category as {tipo: {linha: custo}}, in catalog order"""
+        resultado = {}
+        for p in self._por_tabela.get((tabela, categoria), []):
+            resultado.setdefault(self.data['tipo'].iat[p], {})[self.data['linha'].iat[p]] = float(self._custo[p])
+        return resultado
+
+    def suppliers(self):
+        """Lens suppliers in catalog order"""
+        return [f for f in self._por_fornecedor if f]
+
+    def supplier_lenses(self, fornecedor):
+        """Supplier lens table as {nome: {'base', 'custo', 'tipo'}}"""
+        return {
+            self.data['nome'].iat[p]: {
+                'base': self.data['base'].iat[p],
+                'custo': float(self._custo[p]),
+                'tipo': self.data['tipo'].iat[p]
+            }
+            for p in self._por_fornecedor.get(fornecedor, [])
+        }
+
+
+@lru_cache(maxsize=None)
+def get_product_catalog(path=CATALOG_PATH):
+    """Product catalog loaded once per process"""
+    return ProductCatalog(path)
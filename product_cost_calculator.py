@@ -3,15 +3,17 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
+from product_catalog import get_product_catalog
+
 class ProductCostCalculator:
     """Calculator for optical products pricing and cost management"""
     
     def __init__(self):
+        # Tabelas de lentes por fornecedor (catálogo unificado)
+        self.catalog = get_product_catalog()
         self.fornecedores_lentes = {
-            "ATAK": self._load_atak_prices(),
-            "BRASIL LENTES": self._load_brasil_lentes_prices(),
-            "GOLD": self._load_gold_prices(),
-            "DSMHD": self._load_dsmhd_prices()
+            fornecedor: self.catalog.supplier_lenses(fornecedor)
+            for fornecedor in self.catalog.suppliers()
         }
         
         # Default frame cost
@@ -24,201 +26,6 @@ class ProductCostCalculator:
             "servicos": 4.0   # 300% markup
         }
     
-    def _load_atak_prices(self) -> Dict:
-        """Load ATAK supplier lens prices"""
-        return {
-            "LT CR-39 INCOLOR 1.49": {
-                "base": "Esf. -6,00 a +6,00",
-                "custo": 12.00,
-                "tipo": "visao_simples"
-            },
-            "LT CR-39 INCOLOR CIL 1.49": {
-                "base": "Esf. -4,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 15.00,
-                "tipo": "visao_simples"
-            },
-            "LT CR-39 ANTIRREFLEXO 1.56": {
-                "base": "Esf. -6,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 12.00,
-                "tipo": "visao_simples"
-            },
-            "LT CR-39 FOTO ANTIRREFLEXO 1.56": {
-                "base": "Esf. -4,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 30.00,
-                "tipo": "visao_simples"
-            },
-            "LT CR-39 BLUE CUT ANTIRREFLEXO 1.56": {
-                "base": "Esf. -6,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 35.00,
-                "tipo": "visao_simples"
-            },
-            "LT POLI INCOLOR 1.59": {
-                "base": "Esf. -4,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 23.00,
-                "tipo": "visao_simples"
-            },
-            "LT POLI ANTIRREFLEXO 1.59": {
-                "base": "Esf. -5,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 30.00,
-                "tipo": "visao_simples"
-            },
-            "LT POLI BLUE CUT ANTIRREFLEXO 1.59": {
-                "base": "Esf. -6,00 a +4,00 / Cil. -0,25 a -2,00",
-                "custo": 110.00,
-                "tipo": "visao_simples"
-            },
-            "LT ALTO ÍNDICE ANTIRREFLEXO 1.61": {
-                "base": "Esf. -6,25 a -10,00 / Cil. -2,00",
-                "custo": 70.00,
-                "tipo": "visao_simples"
-            },
-            "LT ALTO ÍNDICE ANTIRREFLEXO 1.67": {
-                "base": "Esf. -10,25 a -12,00 / Cil. -2,00",
-                "custo": 150.00,
-                "tipo": "visao_simples"
-            },
-            "LT TRANSITIONS ANTIRREFLEXO 1.50": {
-                "base": "Esf. -2,00 a +2,00 / Cil. -0,25 a -2,00",
-                "custo": 185.00,
-                "tipo": "visao_simples"
-            }
-        }
-    
-    def _load_brasil_lentes_prices(self) -> Dict:
-        """Load BRASIL LENTES supplier prices"""
-        return {
-            "LP RESINA INCOLOR A.R 1.56": {
-                "base": "Esf. +4,00 a -6,00 / Cil. -2,00",
-                "custo": 12.00,
-                "tipo": "visao_simples"
-            },
-            "LP RESINA ANTI BLUE A.R 1.56": {
-                "base": "Esf. +6,00 a -8,00 / Cil. -2,00",
-                "custo": 30.00,
-                "tipo": "visao_simples"
-            },
-            "LP RESINA FOTO A.R 1.56": {
-                "base": "Esf. +4,00 a -6,00 / Cil. -2,00",
-                "custo": 25.00,
-                "tipo": "visao_simples"
-            },
-            "LP RESINA FOTO AR ANTI-BLUE 1.56": {
-                "base": "Esf. +6,00 a -6,00 / Cil. -2,00",
-                "custo": 85.00,
-                "tipo": "visao_simples"
-            },
-            "LP POLY INCOLOR A.R 1.59": {
-                "base": "Esf. +6,00 a -6,00 / Cil. -2,00",
-                "custo": 30.00,
-                "tipo": "visao_simples"
-            },
-            "LP POLY ANTI-BLUE A.R 1.59": {
-                "base": "Esf. +6,00 a -6,00 / Cil. -2,00",
-                "custo": 90.00,
-                "tipo": "visao_simples"
-            },
-            "LP POLY FOTO A.R 1.59": {
-                "base": "Esf. +4,00 a -4,00 / Cil. -2,00",
-                "custo": 140.00,
-                "tipo": "visao_simples"
-            },
-            "LP RESINA ALTO ÍNDICE A.R 1.61": {
-                "base": "Esf. +4,00 a -10,00 / Cil. -2,00",
-                "custo": 60.00,
-                "tipo": "visao_simples"
-            },
-            "LP RESINA ALTO ÍNDICE A.R 1.67": {
-                "base": "Esf. -3,00 a -10,00 / Cil. -2,00",
-                "custo": 280.00,
-                "tipo": "visao_simples"
-            },
-            "LP MULTIFOCAL RESINA A.R 1.56": {
-                "base": "Esf. -2,00 a +3,00 / Add. +1,00 a +3,00",
-                "custo": 45.00,
-                "tipo": "multifocal"
-            },
-            "LP MULTIFOCAL POLY ANTI-BLUE 1.59": {
-                "base": "Esf. -2,00 a +3,00 / Add. +1,00 a +3,00",
-                "custo": 150.00,
-                "tipo": "multifocal"
-            }
-        }
-    
-    def _load_gold_prices(self) -> Dict:
-        """Load GOLD supplier prices"""
-        return {
-            "GOLD INCOLOR 1.49": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -0,00 a -2,00",
-                "custo": 10.00,
-                "tipo": "visao_simples"
-            },
-            "GOLD AR 1.56": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -0,00 a -2,00",
-                "custo": 12.00,
-                "tipo": "visao_simples"
-            },
-            "GOLD PRO SENSE FOTO 1.56": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -0,00 a -2,00",
-                "custo": 30.00,
-                "tipo": "visao_simples"
-            },
-            "GOLD POLI AR 1.59": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -0,00 a -2,00",
-                "custo": 28.00,
-                "tipo": "visao_simples"
-            },
-            "GOLD ALTO ÍNDICE AR 1.67": {
-                "base": "Esf. -6,00 a -15,00 / Cil. -0,00 a -0,00",
-                "custo": 120.00,
-                "tipo": "visao_simples"
-            },
-            "GOLD FOTO AR 1.67": {
-                "base": "Esf. -6,00 a -15,00 / Cil. -0,00 a -0,00",
-                "custo": 200.00,
-                "tipo": "visao_simples"
-            },
-            "GOLD BLUE 1.56": {
-                "base": "Base 0.50/2.00/4.00/6.00/8.00",
-                "custo": 80.00,
-                "tipo": "bloco"
-            },
-            "GOLD PROGRESSIVO AR 1.56": {
-                "base": "Esf. -2,00 a +3,00 / Add. 1,00 a 3,00",
-                "custo": 45.00,
-                "tipo": "multifocal"
-            },
-            "GOLD PROGRESSIVO FOTO AR 1.56": {
-                "base": "Esf. -2,00 a +3,00 / Add. 1,00 a 3,00",
-                "custo": 55.00,
-                "tipo": "multifocal"
-            }
-        }
-    
-    def _load_dsmhd_prices(self) -> Dict:
-        """Load DSMHD supplier prices (estimated based on market)"""
-        return {
-            "DSMHD RESINA INCOLOR 1.56": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -2,00",
-                "custo": 15.00,
-                "tipo": "visao_simples"
-            },
-            "DSMHD RESINA AR 1.56": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -2,00",
-                "custo": 18.00,
-                "tipo": "visao_simples"
-            },
-            "DSMHD FOTO AR 1.56": {
-                "base": "Esf. -4,00 a +4,00 / Cil. -2,00",
-                "custo": 35.00,
-                "tipo": "visao_simples"
-            },
-            "DSMHD POLI AR 1.59": {
-                "base": "Esf. -6,00 a +6,00 / Cil. -2,00",
-                "custo": 32.00,
-                "tipo": "visao_simples"
-            }
-        }
-    
     def get_fornecedor_lentes(self, fornecedor: str) -> Dict:
         """Get lens prices for specific supplier"""
         return self.fornecedores_lentes.get(fornecedor, {})
@@ -0,0 +1,105 @@
+"""
+Agenda de Recebíveis e Otimizador de Antecipação
+Entradas das vendas a prazo como convolução das vendas mensais com a
+distribuição das parcelas, e antecipação mínima para manter o saldo de caixa
+acima de um piso; vetorizado sobre meses e trajetórias (Monte Carlo)
+"""
+
+import numpy as np
+
+from payment_modalities import DEFAULT_MODALITIES, PaymentModalityEngine
+
+
+class ReceivablesEngine:
+    """Installment receivables schedule and anticipation optimizer"""
+
+    def __init__(self, pagamentos=None, modalidade='A Prazo', taxa_antecipacao=None):
+        if pagamentos is None:
+            pagamentos, _ = PaymentModalityEngine.two_bucket(0.0, 0)
+        self.pagamentos = pagamentos
+        self.modalidade = modalidade
+        if taxa_antecipacao is None:
+            taxa_antecipacao = DEFAULT_MODALITIES['Antecipação (até 30 dias)']['taxa']
+        self.taxa_antecipacao = taxa_antecipacao
+
+        # Fração bruta de uma venda a prazo recebida k meses depois: o mesmo
+        # calendário que as projeções usam, sem descontar a taxa da operadora
+        self.kernel = pagamentos.receipt_profile(net=False)[pagamentos.names.index(modalidade)]
+        self._matrices = {}
+
+    @classmethod
+    def from_business_data(cls, business_data):
+        """Engine for the credit sales configured in step 5"""
+        data = business_data or {}
+        pagamentos, _ = PaymentModalityEngine.from_business_data(data)
+        return cls(pagamentos, 'A Prazo', data.get('taxa_antecipacao', None))
+
+    def _schedule_matrix(self, months):
+        """Months × months matrix M with M[venda, recebimento] = kernel[recebimento - venda]"""
+        if months not in self._matrices:
+            defasagem = np.arange(months)[None, :] - np.arange(months)[:, None]
+            dentro = (defasagem >= 0) & (defasagem < len(self.kernel))
+            self._matrices[months] = np.where(dentro, self.kernel[np.clip(defasagem, 0, len(self.kernel) - 1)], 0.0)
+        return self._matrices[months]
+
+    def schedule(self, sales):
+        """Gross inflows per month for credit sales (..., months)"""
+        sales = np.asarray(sales, dtype=float)
+        return sales @ self._schedule_matrix(sales.shape[-1])
+
+    def outstanding(self, sales):
+        """Receivables still to be collected at the end of each month"""
+        sales = np.asarray(sales, dtype=float)
+        return np.cumsum(sales, axis=-1) - np.cumsum(self.schedule(sales), axis=-1)
+
+    def optimize(self, sales, other_flows, saldo_inicial, piso=0.0):
+        """Anticipate just enough receivables each month to keep the balance above the floor
+
+        Anticipation has a flat fee, so the cheapest plan anticipates only the
+        monthly shortfall, taking the latest-maturing installments first (they
+        are the ones least likely to be needed again inside the horizon).
+        """
+        unica_trajetoria = np.ndim(sales) == 1
+        sales = np.atleast_2d(np.asarray(sales, dtype=float))
+        other_flows = np.broadcast_to(np.asarray(other_flows, dtype=float), sales.shape)
+        paths, months = sales.shape
+        fator_liquido = 1 - self.taxa_antecipacao / 100
+
+        # Parcelas a vencer por mês de vencimento (inclui vencimentos além do horizonte)
+        a_vencer = np.zeros((paths, months + len(self.kernel)))
+        recebimentos = np.zeros((paths, months))
+        antecipado = np.zeros((paths, months))
+        saldo = np.zeros((paths, months))
+        saldo_atual = np.broadcast_to(np.asarray(saldo_inicial, dtype=float), (paths,)).copy()
+
+        for t in range(months):
+            a_vencer[:, t:t + len(self.kernel)] += sales[:, t, None] * self.kernel
+            recebimentos[:, t] = a_vencer[:, t]
+            saldo_atual += other_flows[:, t] + a_vencer[:, t]
+
+            falta = np.maximum(piso - saldo_atual, 0.0)
+            futuras = a_vencer[:, t + 1:]
+            valor = np.minimum(falta / fator_liquido, futuras.sum(axis=1))
+
+            if valor.any():
+                # Retira das parcelas mais distantes para as mais próximas
+                depois = np.cumsum(futuras[:, ::-1], axis=1)[:, ::-1] - futuras
+                retirado = np.clip(valor[:, None] - depois, 0.0, futuras)
+                a_vencer[:, t + 1:] -= retirado
+                antecipado[:, t] = valor
+                saldo_atual += valor * fator_liquido
+
+            saldo[:, t] = saldo_atual
+
+        custo = antecipado * (self.taxa_antecipacao / 100)
+        resultado = {
+            'recebimentos': recebimentos,
+            'antecipado': antecipado,
+            'custo_antecipacao': custo,
+            'entradas': recebimentos + antecipado - custo,
+            'saldo': saldo,
+            'custo_total': custo.sum(axis=1)
+        }
+        if unica_trajetoria:
+            resultado = {chave: valor[0] for chave, valor in resultado.items()}
+        return resultado
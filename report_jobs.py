@@ -0,0 +1,245 @@
+"""
+Fila de Geração de Relatórios em Segundo Plano
+Os PDFs para investidores (ReportLab) são gerados em um pool de processos fora
+da sessão do Streamlit e gravados em arquivos de spool; a interface consulta o
+progresso e recebe o arquivo do cache quando um job idêntico (plano + tipo +
+idioma) já foi executado
+"""
+
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from report_spool import ReportSpool
+from scenario_cube import plan_fingerprint
+
+# Tipo de relatório: (módulo, classe, método) do gerador
+REPORT_TYPES = {
+    'investidor': ('multilingual_pdf_generator', 'MultilingualInvestorPDFGenerator', 'generate_investor_report_pdf'),
+    'estruturado': ('structured_investor_report', 'StructuredInvestorReport', 'generate_structured_report'),
+    'planilha': ('xlsx_export', 'WorkbookExporter', 'generate_workbook')
+}
+
+# Extensão do arquivo no spool e tipo MIME do download (PDF quando não listado)
+REPORT_EXTENSIONS = {'planilha': '.xlsx'}
+REPORT_MIME_TYPES = {'planilha': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'}
+
+# Tipos que recebem tabelas calculadas na tela (não deriváveis do plano): entram na identidade do job
+SCREEN_FIGURE_TYPES = {'planilha'}
+
+# Pacote ZIP com o relatório para investidores nos três idiomas
+BUNDLE_TYPE = 'pacote'
+
+# Um worker por idioma do pacote (BUNDLE_LANGUAGES): os três PDFs saem no tempo de um
+DEFAULT_WORKERS = 3
+
+DEFAULT_DURATION = 3.0  # Segundos estimados antes de medir o primeiro job de cada tipo
+
+
+def generate_report(tipo, business_data, idioma, figures=None, output=None):
+    """One report (runs inside the worker process): written to the output path if given, else PDF bytes"""
+    import importlib
+
+    modulo, classe, metodo = REPORT_TYPES[tipo]
+    gerar = getattr(getattr(importlib.import_module(modulo), classe)(), metodo)
+    opcoes = {} if figures is None else {'figures': figures}
+
+    if output is not None:
+        return ReportSpool.write(output, lambda parcial: gerar(business_data, idioma, output=parcial, **opcoes))
+    return gerar(business_data, idioma, **opcoes).getvalue()
+
+
+class ReportJobQueue:
+    """Report generation jobs on a worker pool with an LRU cache of finished report files"""
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, cache_size=32, use_processes=True, spool=None):
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.use_processes = use_processes
+        # PDFs ficam em disco: a memória não cresce com o número de relatórios/usuários
+        self.spool = spool or ReportSpool()
+        self._executor = None
+        self._lock = threading.Lock()
+        self._jobs = {}               # job_id -> {'future', 'tipo', 'inicio'}
+        self._bundles = {}            # job_id do pacote -> {'membros': {idioma: job_id}, 'nome'}
+        self._cache = OrderedDict()   # job_id -> caminho do arquivo no spool
+        self._duracao = {}            # tipo -> duração média (s) dos jobs concluídos
+
+    def _get_executor(self):
+        """Worker pool, created on first use (threads if processes are unavailable)"""
+        if self._executor is None:
+            if self.use_processes:
+                try:
+                    # spawn: o servidor do Streamlit tem várias threads, fork não é seguro
+                    self._executor = ProcessPoolExecutor(
+                        self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+                except (OSError, NotImplementedError):
+                    self.use_processes = False
+            if not self.use_processes:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='relatorio')
+        return self._executor
+
+    @staticmethod
+    def job_id(tipo, business_data, idioma, figures=None):
+        """Identical plan + report type + language (+ on-screen tables for those types) share the same job"""
+        if tipo == BUNDLE_TYPE:
+            idioma = ''  # O ZIP traz todos os idiomas: não depende do idioma da interface
+        chave = plan_fingerprint(business_data)
+        if figures is not None and tipo in SCREEN_FIGURE_TYPES:
+            chave = plan_fingerprint({'plano': chave, 'figures': figures})
+        return f"{tipo}:{idioma}:{chave}"
+
+    def submit(self, tipo, business_data, idioma, figures=None):
+        """Queue a report (no-op if it is cached or already running); returns the job id"""
+        if tipo == BUNDLE_TYPE:
+            return self._submit_bundle(business_data, idioma)
+        if tipo not in REPORT_TYPES:
+            raise ValueError(f"Tipo de relatório desconhecido: {tipo}")
+
+        job_id = self.job_id(tipo, business_data, idioma, figures)
+        with self._lock:
+            if job_id in self._cache:
+                self._cache.move_to_end(job_id)
+                return job_id
+            job = self._jobs.get(job_id)
+            if job is not None and not (job['future'].done() and job['future'].exception() is not None):
+                return job_id
+
+            output = self.spool.path(job_id, REPORT_EXTENSIONS.get(tipo, '.pdf'))
+            try:
+                future = self._get_executor().submit(generate_report, tipo, business_data, idioma, figures, output)
+            except BrokenProcessPool:
+                # Um worker morreu: recria o pool e tenta de novo
+                self._executor = None
+                future = self._get_executor().submit(generate_report, tipo, business_data, idioma, figures, output)
+
+            self._jobs[job_id] = {'future': future, 'tipo': tipo, 'inicio': time.monotonic()}
+            future.add_done_callback(lambda f, job_id=job_id: self._finish(job_id, f))
+        return job_id
+
+    def _submit_bundle(self, business_data, idioma):
+        """Queue one investor report per language, rendered in parallel from figures computed once"""
+        from multilingual_pdf_generator import BUNDLE_LANGUAGES, MultilingualInvestorPDFGenerator
+
+        bundle_id = self.job_id(BUNDLE_TYPE, business_data, idioma)
+        with self._lock:
+            if bundle_id in self._cache:
+                self._cache.move_to_end(bundle_id)
+                return bundle_id
+
+        figures = MultilingualInvestorPDFGenerator.compute_report_figures(business_data)
+        # Cada idioma é o mesmo job do relatório avulso: reaproveita cache e jobs em andamento
+        membros = {
+            lingua: self.submit('investidor', business_data, lingua, figures)
+            for lingua in BUNDLE_LANGUAGES
+        }
+        with self._lock:
+            self._bundles[bundle_id] = {
+                'membros': membros, 'nome': business_data.get('nome_negocio', 'Ótica')
+            }
+        return bundle_id
+
+    def _finish(self, job_id, future):
+        """Move a successful job into the cache and update the type's average duration"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                return
+            duracao = time.monotonic() - job['inicio']
+            media = self._duracao.get(job['tipo'])
+            self._duracao[job['tipo']] = duracao if media is None else 0.7 * media + 0.3 * duracao
+
+            self._store(job_id, future.result())
+
+    def _store(self, job_id, path):
+        """Add a finished file to the cache, deleting the least recently used one beyond the limit"""
+        self._cache[job_id] = path
+        if len(self._cache) > self.cache_size:
+            _, antigo = self._cache.popitem(last=False)
+            self.spool.remove(antigo)
+
+    def status(self, job_id):
+        """Job state ('pronto', 'fila', 'gerando', 'erro' or 'desconhecido') and estimated progress 0-1"""
+        with self._lock:
+            if job_id in self._cache:
+                return {'estado': 'pronto', 'progresso': 1.0, 'erro': None}
+            job = self._jobs.get(job_id)
+            pacote = self._bundles.get(job_id)
+
+        if pacote is not None:
+            return self._bundle_status(pacote)
+
+        if job is None:
+            return {'estado': 'desconhecido', 'progresso': 0.0, 'erro': None}
+
+        future = job['future']
+        if future.done():
+            if future.exception() is not None:
+                return {'estado': 'erro', 'progresso': 1.0, 'erro': str(future.exception())}
+            # Concluído, callback de cache ainda não rodou
+            return {'estado': 'gerando', 'progresso': 0.99, 'erro': None}
+        if not future.running():
+            return {'estado': 'fila', 'progresso': 0.0, 'erro': None}
+
+        # O ReportLab não informa progresso: estimativa pela duração média do tipo
+        decorrido = time.monotonic() - job['inicio']
+        estimado = self._duracao.get(job['tipo'], DEFAULT_DURATION)
+        return {'estado': 'gerando', 'progresso': min(decorrido / estimado, 0.95), 'erro': None}
+
+    def _bundle_status(self, pacote):
+        """Combined state of a bundle's language jobs (worst state, average progress)"""
+        estados = [self.status(membro) for membro in pacote['membros'].values()]
+        for estado in ('erro', 'desconhecido', 'fila', 'gerando'):
+            if any(e['estado'] == estado for e in estados):
+                erro = next((e['erro'] for e in estados if e['erro']), None)
+                return {'estado': estado, 'progresso': sum(e['progresso'] for e in estados) / len(estados), 'erro': erro}
+        return {'estado': 'pronto', 'progresso': 1.0, 'erro': None}
+
+    def result_path(self, job_id):
+        """Spooled file of a finished job or bundle (None while it is still running)"""
+        with self._lock:
+            path = self._cache.get(job_id)
+            if path is not None:
+                self._cache.move_to_end(job_id)
+                return path
+            pacote = self._bundles.get(job_id)
+
+        if pacote is None or self._bundle_status(pacote)['estado'] != 'pronto':
+            return None
+
+        from multilingual_pdf_generator import MultilingualInvestorPDFGenerator
+
+        membros = {lingua: self.result_path(membro) for lingua, membro in pacote['membros'].items()}
+        if any(membro is None for membro in membros.values()):
+            return None
+
+        # ZIP montado direto dos PDFs em disco
+        path = self.spool.path(job_id, '.zip')
+        try:
+            self.spool.write(path, lambda parcial: MultilingualInvestorPDFGenerator.build_bundle_zip(
+                membros, pacote['nome'], output=parcial))
+        except FileNotFoundError:
+            # Um dos PDFs saiu do cache durante a montagem
+            return None
+        with self._lock:
+            self._bundles.pop(job_id, None)
+            self._store(job_id, path)
+        return path
+
+    def shutdown(self):
+        """Stop the worker pool (pending jobs are cancelled)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+@lru_cache(maxsize=None)
+def get_report_queue():
+    """Report job queue shared by every session of the process"""
+    return ReportJobQueue()
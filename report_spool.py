@@ -0,0 +1,52 @@
+"""
+Spool de Relatórios em Disco
+Os PDFs gerados são gravados em arquivos temporários (escrita atômica) em vez de
+ficarem em BytesIO na fila e na memória de cada sessão; a pasta é apagada
+automaticamente quando o processo termina
+"""
+
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+
+
+class ReportSpool:
+    """Temporary directory holding generated report files"""
+
+    def __init__(self, directory=None, prefix='relatorios_'):
+        self.directory = directory or tempfile.mkdtemp(prefix=prefix)
+        os.makedirs(self.directory, exist_ok=True)
+        atexit.register(self.cleanup)
+
+    def path(self, key, extension='.pdf'):
+        """Spool file path for a report key (job id, plan fingerprint...)"""
+        nome = hashlib.sha1(key.encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.directory, nome + extension)
+
+    @staticmethod
+    def write(path, generate):
+        """Run generate(temporary_path) and move the finished file into place atomically"""
+        # Arquivo parcial próprio de cada chamada: duas sessões montando o mesmo relatório não colidem
+        fd, parcial = tempfile.mkstemp(suffix='.part', dir=os.path.dirname(path) or None)
+        os.close(fd)
+        try:
+            generate(parcial)
+            os.replace(parcial, path)
+        finally:
+            if os.path.exists(parcial):
+                os.remove(parcial)
+        return path
+
+    @staticmethod
+    def remove(path):
+        """Delete a spooled report (missing files are ignored)"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def cleanup(self):
+        """Remove the spool directory and every report in it"""
+        shutil.rmtree(self.directory, ignore_errors=True)
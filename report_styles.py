@@ -0,0 +1,156 @@
+"""
+Estilos Compartilhados dos Relatórios PDF
+Folha de estilos, estilos de parágrafo, modelo de página e cabeçalho/rodapé
+criados uma única vez por processo e reaproveitados por todos os geradores
+(plano de negócios, relatório multilíngue e relatório estruturado)
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate
+
+from br_format import language_code
+
+# Paleta única dos relatórios
+PALETTE = {
+    'primaria': colors.HexColor('#1f4e79'),
+    'secao': colors.HexColor('#2f5f8f'),
+    'subsecao': colors.HexColor('#4472a8'),
+    'destaque': colors.HexColor('#d32f2f'),
+    'kpi': colors.HexColor('#2b6cb0'),
+    'rodape': colors.gray
+}
+
+# Página A4 com espaço para o cabeçalho e o rodapé
+PAGE_TEMPLATE = {
+    'pagesize': A4,
+    'rightMargin': 50,
+    'leftMargin': 50,
+    'topMargin': 80,
+    'bottomMargin': 80
+}
+
+# Textos do rodapé por idioma
+PAGE_LABELS = {
+    'pt': {'page': 'Página', 'date': 'Data:', 'date_format': '%d/%m/%Y'},
+    'en': {'page': 'Page', 'date': 'Date:', 'date_format': '%m/%d/%Y'},
+    'es': {'page': 'Página', 'date': 'Fecha:', 'date_format': '%d/%m/%Y'}
+}
+
+
+class ReportStyles:
+    """Paragraph styles, page template and header/footer shared by every PDF generator"""
+
+    def __init__(self):
+        self.sheet = getSampleStyleSheet()
+
+        self.title = ParagraphStyle(
+            'ReportTitle',
+            parent=self.sheet['Heading1'],
+            fontSize=18,
+            textColor=PALETTE['primaria'],
+            alignment=TA_CENTER,
+            spaceAfter=30,
+            fontName='Helvetica-Bold'
+        )
+
+        self.section = ParagraphStyle(
+            'SectionHeader',
+            parent=self.sheet['Heading2'],
+            fontSize=14,
+            textColor=PALETTE['secao'],
+            alignment=TA_LEFT,
+            spaceAfter=12,
+            spaceBefore=20,
+            fontName='Helvetica-Bold'
+        )
+
+        self.subsection = ParagraphStyle(
+            'SubsectionHeader',
+            parent=self.sheet['Heading3'],
+            fontSize=12,
+            textColor=PALETTE['subsecao'],
+            alignment=TA_LEFT,
+            spaceAfter=8,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        )
+
+        self.normal = ParagraphStyle(
+            'ReportNormal',
+            parent=self.sheet['Normal'],
+            fontSize=10,
+            alignment=TA_JUSTIFY,
+            spaceAfter=6,
+            fontName='Helvetica'
+        )
+
+        self.highlight = ParagraphStyle(
+            'Highlight',
+            parent=self.sheet['Normal'],
+            fontSize=10,
+            textColor=PALETTE['destaque'],
+            alignment=TA_LEFT,
+            spaceAfter=6,
+            fontName='Helvetica-Bold'
+        )
+
+        self.kpi = ParagraphStyle(
+            'KPI',
+            parent=self.sheet['Normal'],
+            fontSize=11,
+            textColor=PALETTE['kpi'],
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        )
+
+    def document(self, output, **overrides):
+        """SimpleDocTemplate on the shared page template"""
+        return SimpleDocTemplate(output, **{**PAGE_TEMPLATE, **overrides})
+
+    @staticmethod
+    def header_footer(business_name, language='pt'):
+        """Page callback drawing the business name header and the page/date footer"""
+        labels = PAGE_LABELS[language_code(language)]
+        width, height = PAGE_TEMPLATE['pagesize']
+        header = (business_name or '').upper()
+        date_text = f"{labels['date']} {datetime.now().strftime(labels['date_format'])}"
+
+        def draw(canvas, doc):
+            canvas.saveState()
+
+            # Cabeçalho
+            canvas.setFont('Helvetica-Bold', 10)
+            canvas.setFillColor(PALETTE['primaria'])
+            canvas.drawString(50, height - 50, header)
+
+            # Linha decorativa no cabeçalho
+            canvas.setStrokeColor(PALETTE['primaria'])
+            canvas.setLineWidth(2)
+            canvas.line(50, height - 60, width - 50, height - 60)
+
+            # Rodapé: página e data
+            canvas.setFont('Helvetica', 8)
+            canvas.setFillColor(PALETTE['rodape'])
+            canvas.drawRightString(width - 50, 30, f"{labels['page']} {doc.page}")
+            canvas.drawString(50, 30, date_text)
+
+            canvas.restoreState()
+
+        return draw
+
+    def build(self, doc, story, business_name, language='pt'):
+        """Build the document with the shared header/footer on every page"""
+        draw = self.header_footer(business_name, language)
+        doc.build(story, onFirstPage=draw, onLaterPages=draw)
+
+
+@lru_cache(maxsize=None)
+def get_report_styles():
+    """Report styles shared by every PDF generator of the process"""
+    return ReportStyles()
@@ -0,0 +1,147 @@
+"""
+Simulador de Expansão Multi-Lojas
+Cada loja tem mês de abertura, curva de maturação, aluguel, folha e
+investimento próprios; DRE e fluxo de caixa da rede calculados como arrays
+loja × mês com custos centrais compartilhados
+"""
+
+import numpy as np
+
+from financial_projection import FinancialProjection
+
+
+class RolloutSimulator:
+    """Store × month rollout projection with staggered openings"""
+
+    RAMP_CURVES = {
+        'linear': 'Linear',
+        's': 'Curva S',
+        'imediata': 'Imediata'
+    }
+
+    def __init__(self, abertura_mes, receita_madura, percentual_variavel, aluguel, folha,
+                 outros_fixos=0.0, investimento=0.0, meses_maturacao=12, curva='s',
+                 crescimento_mensal=0.0, overhead_fixo=0.0, overhead_por_loja=0.0):
+        self.abertura_mes = np.asarray(abertura_mes, dtype=int)
+        n = len(self.abertura_mes)
+
+        def por_loja(valores):
+            return np.broadcast_to(np.asarray(valores, dtype=float), (n,)).copy()
+
+        self.receita_madura = por_loja(receita_madura)
+        self.percentual_variavel = por_loja(percentual_variavel)
+        self.aluguel = por_loja(aluguel)
+        self.folha = por_loja(folha)
+        self.outros_fixos = por_loja(outros_fixos)
+        self.investimento = por_loja(investimento)
+        self.meses_maturacao = np.maximum(por_loja(meses_maturacao), 1)
+        self.crescimento_mensal = por_loja(crescimento_mensal)
+        self.curva = curva
+        # Custos centrais (escritório, supervisão): parcela fixa + parcela por loja aberta
+        self.overhead_fixo = overhead_fixo
+        self.overhead_por_loja = overhead_por_loja
+
+    @classmethod
+    def from_business_data(cls, business_data, num_lojas=10, intervalo_meses=3, primeiro_mes=0, **kwargs):
+        """Rollout of identical stores opened every intervalo_meses, with step 10 unit economics"""
+        projection = FinancialProjection(business_data)
+        p = projection.get_inputs()
+        # Loja madura fatura o que a Etapa 10 projeta para o mês em que a maturação termina
+        maturidade = 1 if kwargs.get('curva', 's') == 'imediata' else max(int(kwargs.get('meses_maturacao', 12)), 1)
+        base = projection.project(maturidade)
+        receita = float(base['receita_bruta'][-1])
+        percentual_variavel = float(base['custos_variaveis_total'][-1]) / receita if receita > 0 else 0.0
+
+        parametros = {
+            'receita_madura': receita,
+            'percentual_variavel': percentual_variavel,
+            'aluguel': p['aluguel'],
+            'folha': p['salarios_clt'] + p['total_optometrista'],
+            'outros_fixos': p['outros_fixos'],
+            'investimento': p['investimento_total'],
+            'crescimento_mensal': p['crescimento_mensal']
+        }
+        parametros.update(kwargs)
+        return cls(cls.staggered(num_lojas, intervalo_meses, primeiro_mes), **parametros)
+
+    @staticmethod
+    def staggered(num_lojas, intervalo_meses=3, primeiro_mes=0):
+        """Opening month of each store, one every intervalo_meses"""
+        return primeiro_mes + np.arange(num_lojas) * intervalo_meses
+
+    def maturity_months(self):
+        """Months each store takes to reach mature revenue (1 with the immediate curve)"""
+        if self.curva == 'imediata':
+            return np.ones_like(self.meses_maturacao)
+        return self.meses_maturacao
+
+    def ramp(self, idade):
+        """Share of mature revenue reached at each store age (months since opening)"""
+        progresso = (idade + 1) / self.meses_maturacao[:, None]
+        if self.curva == 'imediata':
+            fator = np.ones_like(progresso)
+        elif self.curva == 'linear':
+            fator = np.clip(progresso, 0.0, 1.0)
+        else:
+            # Logística centrada no meio da maturação, normalizada para atingir 100% no fim
+            logistica = 1 / (1 + np.exp(-10 * (np.clip(progresso, 0.0, 1.0) - 0.5)))
+            inicio, fim = 1 / (1 + np.exp(5)), 1 / (1 + np.exp(-5))
+            fator = (logistica - inicio) / (fim - inicio)
+        return np.where(idade >= 0, fator, 0.0)
+
+    def simulate(self, horizon=60):
+        """Store × month P&L and network cash flow"""
+        meses = np.arange(horizon)
+        idade = meses[None, :] - self.abertura_mes[:, None]
+        aberta = idade >= 0
+
+        # A receita madura já inclui o crescimento até a maturidade: só cresce depois dela
+        idade_madura = idade - (self.maturity_months()[:, None] - 1)
+        crescimento = (1 + self.crescimento_mensal[:, None] / 100) ** np.maximum(idade_madura, 0)
+        receita = self.receita_madura[:, None] * self.ramp(idade) * crescimento
+        custos_variaveis = receita * self.percentual_variavel[:, None]
+        custos_fixos = (self.aluguel + self.folha + self.outros_fixos)[:, None] * aberta
+        # Resultado em base caixa (sem depreciação); o investimento entra no fluxo de caixa
+        lucro_loja = receita - custos_variaveis - custos_fixos
+
+        # Investimento desembolsado no mês de abertura
+        investimento = np.where(idade == 0, self.investimento[:, None], 0.0)
+
+        lojas_abertas = aberta.sum(axis=0)
+        overhead = np.where(lojas_abertas > 0, self.overhead_fixo + self.overhead_por_loja * lojas_abertas, 0.0)
+        lucro_rede = lucro_loja.sum(axis=0) - overhead
+        fluxo_caixa = lucro_rede - investimento.sum(axis=0)
+        caixa_acumulado = np.cumsum(fluxo_caixa)
+
+        return {
+            'mes': meses + 1,
+            'lojas_abertas': lojas_abertas,
+            'receita_loja': receita,
+            'lucro_loja': lucro_loja,
+            'receita': receita.sum(axis=0),
+            'custos_variaveis': custos_variaveis.sum(axis=0),
+            'custos_fixos': custos_fixos.sum(axis=0),
+            'overhead': overhead,
+            'lucro_operacional': lucro_rede,
+            'investimento': investimento.sum(axis=0),
+            'fluxo_caixa': fluxo_caixa,
+            'caixa_acumulado': caixa_acumulado
+        }
+
+    def summary(self, horizon=60):
+        """Network indicators over the horizon"""
+        r = self.simulate(horizon)
+        caixa = r['caixa_acumulado']
+        recuperou = np.flatnonzero((caixa >= 0) & (np.arange(horizon) >= min(self.abertura_mes.max(), horizon - 1)))
+
+        lucro_anual = r['lucro_operacional'].reshape(-1, 12).sum(axis=1) if horizon % 12 == 0 else None
+        return {
+            'lojas': len(self.abertura_mes),
+            'receita_total': float(r['receita'].sum()),
+            'lucro_total': float(r['lucro_operacional'].sum()),
+            'investimento_total': float(r['investimento'].sum()),
+            'necessidade_maxima_caixa': float(-min(caixa.min(), 0.0)),
+            'mes_necessidade_maxima': int(caixa.argmin()) + 1,
+            'payback_mes': int(recuperou[0]) + 1 if len(recuperou) else None,
+            'lucro_por_ano': lucro_anual
+        }
@@ -0,0 +1,142 @@
+"""
+Cubo de Cenários (Pessimista / Realista / Otimista)
+Cenário × mês × número de lojas × métrica em um único array NumPy, calculado
+uma vez por plano e reutilizado pelas Etapas 10, 11, Resumo Empreendedor e PDFs
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from financial_projection import FinancialProjection
+
+
+def plan_fingerprint(business_data):
+    """Stable hash of a plan's business data"""
+    payload = json.dumps(business_data or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def cube_fingerprint(business_data):
+    """Hash of the projection inputs only (UI flags and texts do not change the cube)"""
+    return plan_fingerprint(FinancialProjection(business_data).get_inputs())
+
+
+class ScenarioCube:
+    """Precomputed scenario × month × store count × metric projections"""
+
+    # Ajustes percentuais de cada cenário (mesmos da Etapa 10)
+    SCENARIOS = OrderedDict([
+        ('pessimista', {'label': 'Pessimista', 'descricao': '-20% receita, +10% custos', 'receita': -20, 'custos': +10}),
+        ('realista', {'label': 'Realista', 'descricao': 'projeção base', 'receita': 0, 'custos': 0}),
+        ('otimista', {'label': 'Otimista', 'descricao': '+30% receita, -5% custos', 'receita': +30, 'custos': -5})
+    ])
+
+    METRICS = [
+        'receita_bruta', 'custos_variaveis', 'custos_fixos',
+        'lucro_operacional', 'lucro_acumulado', 'saldo_investimento'
+    ]
+
+    DEFAULT_STORE_COUNTS = (1, 2, 3, 5, 10)
+
+    def __init__(self, business_data, horizon=60, store_counts=DEFAULT_STORE_COUNTS):
+        self.business_data = business_data or {}
+        self.horizon = horizon
+        self.store_counts = tuple(store_counts)
+        projection = FinancialProjection(self.business_data)
+        entradas = projection.get_inputs()
+        self.fingerprint = plan_fingerprint(entradas)
+        self.investimento_total = entradas['investimento_total']
+        self.data = self._build(projection.project(horizon))
+
+    def _build(self, base):
+        """Broadcast the base projection over scenarios and store counts"""
+        ajuste_receita = np.array([1 + s['receita'] / 100 for s in self.SCENARIOS.values()])[:, None]
+        ajuste_custos = np.array([1 + s['custos'] / 100 for s in self.SCENARIOS.values()])[:, None]
+
+        # Cenário × mês (uma loja)
+        receita = ajuste_receita * base['receita_bruta'][None, :]
+        custos_variaveis = receita * (base['custos_variaveis_total'] / np.where(base['receita_bruta'] > 0, base['receita_bruta'], 1))[None, :] * ajuste_custos
+        custos_fixos = ajuste_custos * base['custos_fixos_total'][None, :]
+        lucro = receita - custos_variaveis - custos_fixos
+
+        por_loja = np.stack([receita, custos_variaveis, custos_fixos, lucro], axis=-1)
+
+        # Cenário × mês × lojas × métrica
+        lojas = np.array(self.store_counts, dtype=float)
+        cube = np.empty((len(self.SCENARIOS), self.horizon, len(lojas), len(self.METRICS)))
+        cube[..., :4] = por_loja[:, :, None, :] * lojas[None, None, :, None]
+        cube[..., 4] = np.cumsum(cube[..., 3], axis=1)
+        cube[..., 5] = cube[..., 4] - self.investimento_total * lojas[None, None, :]
+        return cube
+
+    def _index(self, scenario, metric, stores):
+        if stores not in self.store_counts:
+            raise ValueError(f"Número de lojas não pré-calculado: {stores}")
+        return (
+            list(self.SCENARIOS).index(scenario),
+            self.METRICS.index(metric),
+            self.store_counts.index(stores)
+        )
+
+    def series(self, scenario, metric, stores=1, months=None):
+        """Monthly series of one metric for one scenario and store count"""
+        s, m, l = self._index(scenario, metric, stores)
+        return self.data[s, :months or self.horizon, l, m]
+
+    def total(self, scenario, metric, stores=1, start=0, months=12):
+        """Sum of a flow metric over a window of months"""
+        return float(self.series(scenario, metric, stores)[start:start + months].sum())
+
+    def annual_summary(self, scenario, stores=1, year=1):
+        """Revenue, profit, ROI and margin of one scenario year"""
+        start = (year - 1) * 12
+        receita = self.total(scenario, 'receita_bruta', stores, start)
+        lucro = self.total(scenario, 'lucro_operacional', stores, start)
+        investimento = self.investimento_total * stores
+
+        return {
+            'cenario': scenario,
+            'label': self.SCENARIOS[scenario]['label'],
+            'descricao': self.SCENARIOS[scenario]['descricao'],
+            'receita_anual': receita,
+            'lucro_operacional': lucro,
+            'roi': (lucro / investimento * 100) if investimento > 0 else 0,
+            'margem': (lucro / receita * 100) if receita > 0 else 0
+        }
+
+    def summary_table(self, stores=1, year=1):
+        """Annual summary for every scenario"""
+        return [self.annual_summary(scenario, stores, year) for scenario in self.SCENARIOS]
+
+    def payback_months(self, scenario, stores=1):
+        """Months until the scenario recovers the investment (inf if beyond horizon)"""
+        return FinancialProjection.payback_months(
+            self.series(scenario, 'lucro_operacional', stores),
+            self.investimento_total * stores
+        )
+
+
+_CUBE_CACHE = OrderedDict()
+_CUBE_CACHE_SIZE = 32
+
+
+def get_scenario_cube(business_data, horizon=60, store_counts=ScenarioCube.DEFAULT_STORE_COUNTS):
+    """Scenario cube for a plan, reused while its projection inputs are unchanged
+
+    Every screen and report passes the plan's business_data as saved, so they all
+    share one cube per set of projection inputs
+    """
+    key = (cube_fingerprint(business_data), horizon, tuple(store_counts))
+
+    if key in _CUBE_CACHE:
+        _CUBE_CACHE.move_to_end(key)
+        return _CUBE_CACHE[key]
+
+    cube = ScenarioCube(business_data, horizon, store_counts)
+    _CUBE_CACHE[key] = cube
+    if len(_CUBE_CACHE) > _CUBE_CACHE_SIZE:
+        _CUBE_CACHE.popitem(last=False)
+    return cube
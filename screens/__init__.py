@@ -0,0 +1,69 @@
+"""
+Telas da Aplicação (Etapas e Ferramentas)
+Cada etapa e ferramenta fica em um módulo próprio, importado só quando a tela é
+aberta pela primeira vez no processo: a cada rerun o Streamlit reexecuta apenas
+a rotina principal de navegação, e não as definições de todas as telas
+"""
+
+import importlib
+
+# Etapa -> (módulo, função)
+STEP_SCREENS = {
+    1: ('screens.step_01', 'show_step_1'),     # Sumário Executivo
+    2: ('screens.step_02', 'show_step_2'),     # Análise de Mercado
+    3: ('screens.step_03', 'show_step_3'),     # Público-Alvo
+    4: ('screens.step_04', 'show_step_4'),     # Concorrência
+    5: ('screens.step_05', 'show_step_5'),     # Produtos e Serviços
+    6: ('screens.step_06', 'show_step_6'),     # Estratégia de Marketing
+    7: ('screens.step_07', 'show_step_7'),     # Plano Operacional
+    8: ('screens.step_08', 'show_step_8'),     # Gestão de Pessoas
+    9: ('screens.step_09', 'show_step_9'),     # Investimento Inicial
+    10: ('screens.step_10', 'show_step_10'),  # Projeções Financeiras
+    11: ('screens.step_11', 'show_step_11'),  # Análise de Viabilidade
+    12: ('screens.step_12', 'show_step_12')   # Cenários e Riscos
+}
+
+# Ferramenta (current_view) -> (módulo, função, flag da sessão que a mantém aberta)
+TOOL_SCREENS = {
+    'premissas': ('screens.premissas', 'show_premissas', 'show_premissas'),
+    'integrated_cost': ('integrated_cost_analyzer_step10', 'show_integrated_cost_analyzer_step10', 'show_integrated_cost_analyzer'),
+    'unified_cost': ('unified_cost_analyzer', 'show_unified_cost_analyzer', 'show_unified_cost_analyzer'),
+    'validator': ('screens.plan_validator', 'show_plan_validator_tool', 'show_plan_validator'),
+    'employee': ('screens.employee_manager', 'show_employee_manager', 'show_employee_manager'),
+    'vital': ('screens.fluxo_vital', 'show_fluxo_vital_tool', 'show_fluxo_vital'),
+    'investor': ('screens.investor_report', 'show_investor_report_tool', 'show_investor_report'),
+    'entrepreneur': ('screens.entrepreneur_summary', 'show_entrepreneur_summary_tool', 'show_entrepreneur_summary')
+}
+
+
+def missing_screen(modulo):
+    """Placeholder screen for a tool whose module is not installed"""
+    def show():
+        import streamlit as st
+        st.warning(f"⚠️ Ferramenta indisponível nesta instalação (módulo '{modulo}' não encontrado).")
+    return show
+
+
+def load_screen(modulo, funcao):
+    """Screen function, importing its module on first use (placeholder if the module is missing)"""
+    try:
+        return getattr(importlib.import_module(modulo), funcao)
+    except ModuleNotFoundError as e:
+        # Só o próprio módulo da tela é opcional: dependências ausentes dentro dele continuam sendo erro
+        if e.name != modulo:
+            raise
+        return missing_screen(modulo)
+
+
+def step_screen(step):
+    """Screen function of a plan step (None outside 1-12)"""
+    tela = STEP_SCREENS.get(step)
+    return load_screen(*tela) if tela else None
+
+
+def tool_screen(view, session_state):
+    """Screen function of the open tool (None when the view is not an open tool)"""
+    tela = TOOL_SCREENS.get(view)
+    if tela is None or not session_state.get(tela[2], False):
+        return None
+    return load_screen(tela[0], tela[1])
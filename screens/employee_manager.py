@@ -0,0 +1,1012 @@
+"""
+Ferramenta DP e Tributação
+Cadastro de funcionários, encargos trabalhistas e regime tributário
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, save_user_data
+
+
+def show_employee_manager():
+    """Sistema Completo de DP e Tributação com Legislação Brasileira"""
+    st.header("👥 DP e Tributação Completa")
+    st.markdown("**Sistema integrado com cálculos tributários brasileiros (CLT, Simples Nacional, MEI)**")
+    
+    # Navegação
+
+    
+    st.markdown("---")
+    
+    # Abas do sistema de funcionários
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "👥 Funcionários", 
+        "💰 Folha de Pagamento", 
+        "📊 Análise Tributária", 
+        "📋 Compliance CLT", 
+        "🧮 Simulador de Custos"
+    ])
+    
+    with tab1:
+        st.subheader("👥 Cadastro de Funcionários")
+        
+        # Verificar se existem funcionários da Etapa 8 (Gestão de Pessoas)
+        funcionarios_gestao = st.session_state.business_data.get('funcionarios_planejados', [])
+        
+        # Sistema de sincronização definitivo para DP
+        def sync_funcionarios_dp():
+            """Força sincronização bidirecional entre session_state e business_data"""
+            funcionarios_salvos = st.session_state.business_data.get('funcionarios_dp', [])
+            
+            # Se não existe em session_state, carrega dos dados salvos
+            if 'funcionarios' not in st.session_state:
+                st.session_state.funcionarios = funcionarios_salvos.copy() if funcionarios_salvos else []
+            
+            # Se dados salvos são diferentes, sincroniza
+            elif funcionarios_salvos != st.session_state.funcionarios:
+                # Prioriza dados da session_state (mais recentes)
+                st.session_state.business_data['funcionarios_dp'] = st.session_state.funcionarios.copy()
+                save_user_data()
+        
+        # Executar sincronização no início da seção
+        sync_funcionarios_dp()
+        
+        # Integração automática com Gestão de Pessoas (apenas se DP estiver vazio)
+        if funcionarios_gestao and len(st.session_state.funcionarios) == 0:
+            st.info("🔄 **Integração com Gestão de Pessoas**: Encontrados funcionários planejados na Etapa 8. Deseja importá-los automaticamente?")
+            
+            col_import1, col_import2 = st.columns(2)
+            with col_import1:
+                if st.button("✅ Importar Funcionários da Etapa 8", type="primary"):
+                    # Converter dados da Etapa 8 para formato do DP
+                    funcionarios_importados = []
+                    for func in funcionarios_gestao:
+                        funcionarios_importados.append({
+                            'nome': func.get('nome', 'Funcionário'),
+                            'cargo': func.get('cargo', 'Vendedor(a)'),
+                            'salario_base': func.get('salario', 1518.00),
+                            'tipo_contrato': func.get('tipo_contrato', 'CLT'),
+                            'data_admissao': func.get('data_admissao', '2024-01-01'),
+                            'vale_transporte': func.get('vale_transporte', True),
+                            'vale_refeicao': func.get('vale_refeicao', 25.00),
+                            'plano_saude': func.get('plano_saude', False),
+                            'comissao_percentual': func.get('comissao', 0.0),
+                            'horas_semanais': 44,
+                            'tem_insalubridade': False,
+                            'grau_instrucao': func.get('escolaridade', 'Ensino Médio'),
+                            'dependentes': func.get('dependentes', 0)
+                        })
+                    
+                    st.session_state.funcionarios = funcionarios_importados
+                    # Sincronização forçada imediata
+                    sync_funcionarios_dp()
+                    st.success(f"✅ {len(funcionarios_importados)} funcionário(s) importado(s) da Gestão de Pessoas!")
+                    st.rerun()
+            
+            with col_import2:
+                if st.button("🔄 Manter Separado", type="secondary"):
+                    st.session_state.funcionarios = []
+                    st.info("Os dados ficaram separados. Você pode adicionar funcionários manualmente.")
+                    st.rerun()
+        
+        # Botão para carregar dados de exemplo apenas se solicitado
+        if len(st.session_state.funcionarios) == 0:
+            if st.button("📝 Carregar Dados de Exemplo", type="secondary", help="Adiciona funcionários de exemplo para demonstração"):
+                st.session_state.funcionarios = [
+                    {
+                        'nome': 'Maria Silva',
+                        'cargo': 'Vendedora',
+                        'salario_base': 1500.00,
+                        'tipo_contrato': 'CLT',
+                        'data_admissao': '2024-01-15',
+                        'vale_transporte': True,
+                        'vale_refeicao': 25.00,
+                        'plano_saude': False,
+                        'comissao_percentual': 2.0,
+                        'horas_semanais': 44,
+                        'tem_insalubridade': False,
+                        'grau_instrucao': 'Ensino Médio',
+                        'dependentes': 1
+                    },
+                    {
+                        'nome': 'João Santos',
+                        'cargo': 'Optometrista',
+                        'salario_base': 3500.00,
+                        'tipo_contrato': 'CLT',
+                        'data_admissao': '2023-08-10',
+                        'vale_transporte': True,
+                        'vale_refeicao': 30.00,
+                        'plano_saude': True,
+                        'comissao_percentual': 1.5,
+                        'horas_semanais': 44,
+                        'tem_insalubridade': False,
+                        'grau_instrucao': 'Superior',
+                        'dependentes': 2
+                    }
+                ]
+                st.success("Dados de exemplo carregados! Você pode editá-los ou removê-los conforme necessário.")
+                st.rerun()
+        
+        # Adicionar novo funcionário
+        with st.expander("➕ Adicionar Novo Funcionário"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                novo_nome = st.text_input("Nome completo", key="novo_func_nome")
+                novo_cargo = st.selectbox(
+                    "Cargo",
+                    ["Vendedor(a)", "Optometrista", "Gerente", "Recepcionista", "Técnico em Ótica", "Auxiliar Administrativo"],
+                    key="novo_func_cargo"
+                )
+                # Validação de salário baseada no tipo de contrato
+                if st.session_state.get("novo_func_tipo", "CLT") == "CLT":
+                    novo_salario = st.number_input(
+                        "Salário base (R$)",
+                        min_value=1518.00,  # Salário mínimo 2025
+                        value=1600.00,
+                        step=100.00,
+                        key="novo_func_salario",
+                        help="⚠️ Valor mínimo R$ 1.518 (salário mínimo 2025)"
+                    )
+                else:
+                    novo_salario = st.number_input(
+                        "Valor de remuneração (R$)",
+                        min_value=0.01,
+                        value=1500.00,
+                        step=100.00,
+                        key="novo_func_salario",
+                        help="Valor livre para MEI ou Prestador de Serviços"
+                    )
+                novo_tipo = st.selectbox(
+                    "Tipo de contrato",
+                    ["CLT", "MEI", "Prestador de Serviços"],
+                    key="novo_func_tipo"
+                )
+            
+            with col2:
+                nova_data = st.date_input("Data de admissão", key="novo_func_data")
+                novo_vt = st.checkbox("Vale transporte", key="novo_func_vt")
+                novo_vr = st.number_input(
+                    "Vale refeição diário (R$)",
+                    min_value=0.00,
+                    value=25.00,
+                    step=5.00,
+                    key="novo_func_vr"
+                )
+                novo_plano = st.checkbox("Plano de saúde", key="novo_func_plano")
+                nova_comissao = st.number_input(
+                    "Comissão (%)",
+                    min_value=0.0,
+                    max_value=10.0,
+                    value=0.0,
+                    step=0.5,
+                    key="novo_func_comissao"
+                )
+                novos_dependentes = st.number_input(
+                    "Dependentes",
+                    min_value=0,
+                    max_value=10,
+                    value=0,
+                    key="novo_func_dependentes"
+                )
+            
+            if st.button("Adicionar Funcionário", type="primary"):
+                if novo_nome:
+                    novo_funcionario = {
+                        'nome': novo_nome,
+                        'cargo': novo_cargo,
+                        'salario_base': novo_salario,
+                        'tipo_contrato': novo_tipo,
+                        'data_admissao': str(nova_data),
+                        'vale_transporte': novo_vt,
+                        'vale_refeicao': novo_vr,
+                        'plano_saude': novo_plano,
+                        'comissao_percentual': nova_comissao,
+                        'horas_semanais': 44,
+                        'tem_insalubridade': False,
+                        'grau_instrucao': 'Ensino Médio',
+                        'dependentes': novos_dependentes
+                    }
+                    st.session_state.funcionarios.append(novo_funcionario)
+                    # Sincronização forçada imediata
+                    sync_funcionarios_dp()
+                    st.success(f"✅ Funcionário {novo_nome} adicionado com sucesso!")
+                    st.rerun()
+                else:
+                    st.error("Digite o nome do funcionário")
+        
+        # Botão para sincronizar de volta para Gestão de Pessoas
+        if st.session_state.funcionarios:
+            col_sync_dp1, col_sync_dp2 = st.columns([1, 3])
+            with col_sync_dp1:
+                if st.button("🔄 Sincronizar → Gestão de Pessoas", type="secondary", help="Envia os funcionários cadastrados aqui para a Etapa 8"):
+                    funcionarios_para_gestao = []
+                    for func in st.session_state.funcionarios:
+                        funcionarios_para_gestao.append({
+                            'nome': func.get('nome', 'Funcionário'),
+                            'cargo': func.get('cargo', 'Vendedor(a)'),
+                            'salario': func.get('salario_base', 1518.00),
+                            'tipo_contrato': func.get('tipo_contrato', 'CLT'),
+                            'data_admissao': func.get('data_admissao', '2024-01-01'),
+                            'vale_transporte': func.get('vale_transporte', True),
+                            'vale_refeicao': func.get('vale_refeicao', 25.00),
+                            'plano_saude': func.get('plano_saude', False),
+                            'comissao': func.get('comissao_percentual', 0.0),
+                            'escolaridade': func.get('grau_instrucao', 'Ensino Médio'),
+                            'dependentes': func.get('dependentes', 0)
+                        })
+                    
+                    st.session_state.business_data['funcionarios_planejados'] = funcionarios_para_gestao
+                    save_user_data()
+                    st.success(f"✅ {len(funcionarios_para_gestao)} funcionário(s) sincronizado(s) para Gestão de Pessoas!")
+                    st.rerun()
+            
+            with col_sync_dp2:
+                st.info("💡 Use este botão para manter os dados sincronizados entre DP e Gestão de Pessoas")
+        
+        # Lista de funcionários
+        st.markdown("**Funcionários Cadastrados:**")
+        
+        for i, func in enumerate(st.session_state.funcionarios):
+            with st.container():
+                col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+                
+                with col1:
+                    st.markdown(f"**{func['nome']}**")
+                    st.caption(f"{func['cargo']} • {func['tipo_contrato']}")
+                
+                with col2:
+                    # Validação baseada no tipo de contrato do funcionário
+                    if func['tipo_contrato'] == 'CLT':
+                        novo_salario = st.number_input(
+                            "Salário Base",
+                            min_value=1518.00,  # Salário mínimo 2025
+                            value=float(func['salario_base']),
+                            step=100.00,
+                            key=f"salario_clt_edit_{i}",
+                            format="%.2f",
+                            help="Mínimo R$ 1.518 (salário mínimo 2025)"
+                        )
+                    else:
+                        novo_salario = st.number_input(
+                            "Remuneração",
+                            min_value=0.01,  # Valor livre para MEI/Prestador
+                            value=float(func['salario_base']),
+                            step=100.00,
+                            key=f"salario_prest_edit_{i}",
+                            format="%.2f",
+                            help="Valor livre para MEI/Prestador"
+                        )
+                    
+                    if novo_salario != func['salario_base']:
+                        st.session_state.funcionarios[i]['salario_base'] = novo_salario
+                        # Sincronização forçada imediata
+                        sync_funcionarios_dp()
+                
+                with col3:
+                    # Calcular custo total estimado
+                    if func['tipo_contrato'] == 'CLT':
+                        custo_estimado = func['salario_base'] * 1.68  # Encargos CLT
+                    else:
+                        custo_estimado = func['salario_base']
+                    
+                    st.metric("Custo Total", f"R$ {custo_estimado:.2f}")
+                
+                with col4:
+                    if st.button("🗑️", key=f"del_func_{i}", help="Remover funcionário"):
+                        st.session_state.funcionarios.pop(i)
+                        # Sincronização forçada imediata
+                        sync_funcionarios_dp()
+                        st.rerun()
+                
+                st.markdown("---")
+    
+    with tab2:
+        st.subheader("💰 Folha de Pagamento Detalhada")
+        
+        if not st.session_state.funcionarios:
+            st.warning("Adicione funcionários na aba anterior para gerar a folha de pagamento")
+        else:
+            # Seletor de mês/ano para cálculo
+            col_mes1, col_mes2, col_mes3 = st.columns(3)
+            
+            with col_mes1:
+                mes_calculo = st.selectbox(
+                    "Mês de referência",
+                    list(range(1, 13)),
+                    format_func=lambda x: [
+                        "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                        "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"
+                    ][x-1],
+                    index=5,  # Junho
+                    key="mes_folha"
+                )
+            
+            with col_mes2:
+                ano_calculo = st.number_input(
+                    "Ano",
+                    min_value=2024,
+                    max_value=2030,
+                    value=2024,
+                    key="ano_folha"
+                )
+            
+            with col_mes3:
+                # Buscar vendas automáticas das diferentes etapas
+                # Etapa 10 - Receita anual / 12
+                receita_anual = st.session_state.business_data.get('receita_anual', 0)
+                faturamento_projetado = receita_anual / 12 if receita_anual > 0 else 0
+                
+                # Etapa 10 - Venda primeiro mês
+                venda_primeiro_mes = st.session_state.business_data.get('vendas_mes_1', 0)
+                
+                # Simulação Simples
+                vendas_simulacao = st.session_state.business_data.get('vendas_mes_simulacao', 0)
+                
+                # Resumo Empreendedor
+                objetivo_faturamento = st.session_state.business_data.get('objetivo_faturamento', 0)
+                
+                # Ticket médio × clientes (Etapa 3)
+                ticket_medio = st.session_state.business_data.get('ticket_medio_target', 0)
+                clientes_mes = st.session_state.business_data.get('clientes_mes_objetivo', 0)
+                vendas_calculadas = ticket_medio * clientes_mes if ticket_medio > 0 and clientes_mes > 0 else 0
+                
+                # Usar o maior valor disponível como sugestão
+                vendas_sugeridas = max(
+                    faturamento_projetado, 
+                    venda_primeiro_mes,
+                    vendas_simulacao, 
+                    objetivo_faturamento,
+                    vendas_calculadas,
+                    30000.0
+                )
+                
+                vendas_mes = st.number_input(
+                    "Vendas do mês (R$)",
+                    min_value=0.0,
+                    value=float(vendas_sugeridas),
+                    step=1000.0,
+                    help=f"💡 Valor sugerido baseado nas projeções: {format_currency(vendas_sugeridas)}",
+                    key="vendas_mes_folha"
+                )
+                
+                # Mostrar origem dos dados
+                if vendas_sugeridas > 30000:
+                    fonte_dados = ""
+                    if faturamento_projetado == vendas_sugeridas:
+                        fonte_dados = "Etapa 10 - Receita Anual"
+                    elif venda_primeiro_mes == vendas_sugeridas:
+                        fonte_dados = "Etapa 10 - Primeiro Mês"
+                    elif vendas_simulacao == vendas_sugeridas:
+                        fonte_dados = "Simulação Simples"
+                    elif objetivo_faturamento == vendas_sugeridas:
+                        fonte_dados = "Resumo Empreendedor"
+                    elif vendas_calculadas == vendas_sugeridas:
+                        fonte_dados = "Ticket × Clientes"
+                    
+                    st.caption(f"📊 Dados de: {fonte_dados}")
+                
+                # Opção para buscar outros dados automaticamente
+                if st.button("🔄 Atualizar com Dados das Etapas", help="Busca automaticamente os valores mais recentes"):
+                    # Buscar valores de diferentes etapas
+                    valores_encontrados = []
+                    
+                    # Buscar novamente os valores atualizados
+                    receita_anual_atualizada = st.session_state.business_data.get('receita_anual', 0)
+                    faturamento_atualizado = receita_anual_atualizada / 12 if receita_anual_atualizada > 0 else 0
+                    venda_primeiro_mes_atualizada = st.session_state.business_data.get('vendas_mes_1', 0)
+                    vendas_simulacao_atualizada = st.session_state.business_data.get('vendas_mes_simulacao', 0)
+                    objetivo_faturamento_atualizado = st.session_state.business_data.get('objetivo_faturamento', 0)
+                    ticket_medio_atualizado = st.session_state.business_data.get('ticket_medio_target', 0)
+                    clientes_mes_atualizado = st.session_state.business_data.get('clientes_mes_objetivo', 0)
+                    vendas_calculadas_atualizada = ticket_medio_atualizado * clientes_mes_atualizado if ticket_medio_atualizado > 0 and clientes_mes_atualizado > 0 else 0
+                    
+                    # Etapa 10 - Receita anual / 12
+                    if faturamento_atualizado > 0:
+                        valores_encontrados.append(f"• Receita Anual ÷ 12: {format_currency(faturamento_atualizado)}")
+                    
+                    # Etapa 10 - Primeiro mês
+                    if venda_primeiro_mes_atualizada > 0:
+                        valores_encontrados.append(f"• Primeiro Mês (Etapa 10): {format_currency(venda_primeiro_mes_atualizada)}")
+                    
+                    # Simulação Simples
+                    if vendas_simulacao_atualizada > 0:
+                        valores_encontrados.append(f"• Simulação Simples: {format_currency(vendas_simulacao_atualizada)}")
+                    
+                    # Resumo Empreendedor
+                    if objetivo_faturamento_atualizado > 0:
+                        valores_encontrados.append(f"• Resumo Empreendedor: {format_currency(objetivo_faturamento_atualizado)}")
+                    
+                    # Cálculo baseado em ticket médio e clientes
+                    if vendas_calculadas_atualizada > 0:
+                        valores_encontrados.append(f"• Calculado (Ticket {format_currency(ticket_medio_atualizado)} × {clientes_mes_atualizado} clientes): {format_currency(vendas_calculadas_atualizada)}")
+                    
+                    # Atualizar o valor automaticamente
+                    novo_valor = max(
+                        faturamento_atualizado, 
+                        venda_primeiro_mes_atualizada,
+                        vendas_simulacao_atualizada, 
+                        objetivo_faturamento_atualizado,
+                        vendas_calculadas_atualizada
+                    )
+                    
+                    if novo_valor > 0:
+                        st.success(f"""
+                        **📈 Valores encontrados:**
+                        
+                        {chr(10).join(valores_encontrados)}
+                        
+                        💡 Maior valor encontrado: {format_currency(novo_valor)}
+                        
+                        ➡️ Use este valor no campo "Vendas do mês" acima.
+                        """)
+                    else:
+                        st.warning("Nenhum valor de faturamento encontrado nas outras etapas. Verifique se preencheu as Projeções Financeiras ou Simulação Simples.")
+            
+            # Painel de integração de dados
+            with st.expander("📊 Dados Integrados do Plano de Negócios", expanded=False):
+                st.markdown("### 🔗 Fontes de Dados Conectadas")
+                
+                col_int1, col_int2 = st.columns(2)
+                
+                with col_int1:
+                    st.markdown("**💰 Faturamento/Vendas:**")
+                    
+                    # Atualizar valores recalculados
+                    receita_anual_atual = st.session_state.business_data.get('receita_anual', 0)
+                    faturamento_atual = receita_anual_atual / 12 if receita_anual_atual > 0 else 0
+                    venda_primeiro_mes_atual = st.session_state.business_data.get('vendas_mes_1', 0)
+                    
+                    # Listar todas as fontes de faturamento
+                    if faturamento_atual > 0:
+                        st.caption(f"✅ Receita Anual ÷ 12: {format_currency(faturamento_atual)}")
+                    else:
+                        st.caption("❌ Receita Anual ÷ 12: Não preenchido")
+                    
+                    if venda_primeiro_mes_atual > 0:
+                        st.caption(f"✅ Primeiro Mês (Etapa 10): {format_currency(venda_primeiro_mes_atual)}")
+                    else:
+                        st.caption("❌ Primeiro Mês (Etapa 10): Não preenchido")
+                    
+                    if vendas_simulacao > 0:
+                        st.caption(f"✅ Simulação Simples: {format_currency(vendas_simulacao)}")
+                    else:
+                        st.caption("❌ Simulação Simples: Não preenchido")
+                    
+                    if objetivo_faturamento > 0:
+                        st.caption(f"✅ Resumo Empreendedor: {format_currency(objetivo_faturamento)}")
+                    else:
+                        st.caption("❌ Resumo Empreendedor: Não preenchido")
+                
+                with col_int2:
+                    st.markdown("**📈 Dados Operacionais:**")
+                    
+                    # Ticket médio
+                    ticket_medio = st.session_state.business_data.get('ticket_medio', 0)
+                    if ticket_medio > 0:
+                        st.caption(f"✅ Ticket Médio: {format_currency(ticket_medio)}")
+                    else:
+                        st.caption("❌ Ticket Médio: Não definido")
+                    
+                    # Clientes por mês
+                    clientes_mes = st.session_state.business_data.get('clientes_mes', 0)
+                    if clientes_mes > 0:
+                        st.caption(f"✅ Clientes/Mês: {clientes_mes}")
+                    else:
+                        st.caption("❌ Clientes/Mês: Não definido")
+                    
+                    # Vendas calculadas
+                    if ticket_medio > 0 and clientes_mes > 0:
+                        vendas_calc = ticket_medio * clientes_mes
+                        st.caption(f"💡 Faturamento Calculado: {format_currency(vendas_calc)}")
+                    
+                    # Funcionários planejados
+                    funcionarios_planejados = st.session_state.business_data.get('funcionarios_planejados', [])
+                    if funcionarios_planejados:
+                        st.caption(f"✅ Funcionários Planejados: {len(funcionarios_planejados)}")
+                    else:
+                        st.caption("❌ Funcionários Planejados: Nenhum")
+                
+                st.info("""
+                💡 **Como usar a integração:**
+                - O valor de vendas é sugerido automaticamente baseado nos dados das etapas
+                - Clique em "🔄 Atualizar com Dados das Etapas" para buscar os valores mais recentes
+                - O sistema usa o maior valor encontrado como padrão
+                - Comissões são calculadas automaticamente sobre o valor de vendas
+                """)
+            
+            st.markdown("---")
+            
+            # Inicializar variáveis de controle
+            total_salarios = 0
+            total_encargos = 0
+            total_liquido = 0
+            
+            for idx, func in enumerate(st.session_state.funcionarios):
+                st.markdown(f"### 👤 {func['nome']} - {func['cargo']}")
+                
+                if func['tipo_contrato'] == 'CLT':
+                    # Cálculos CLT detalhados
+                    col_calc1, col_calc2, col_calc3 = st.columns(3)
+                    
+                    with col_calc1:
+                        st.markdown("**💵 Proventos**")
+                        
+                        salario_base = func['salario_base']
+                        st.write(f"• Salário base: R$ {salario_base:.2f}")
+                        
+                        # Comissões
+                        comissao = (vendas_mes * func['comissao_percentual'] / 100) if func['comissao_percentual'] > 0 else 0
+                        if comissao > 0:
+                            st.write(f"• Comissão ({func['comissao_percentual']}%): R$ {comissao:.2f}")
+                        
+                        # Horas extras (simulação)
+                        horas_extras = st.number_input(
+                            f"Horas extras {func['nome'][:10]}",
+                            min_value=0,
+                            max_value=40,
+                            value=0,
+                            key=f"he_folha_{idx}_{func['nome'].replace(' ', '_')[:8]}"
+                        )
+                        valor_he = horas_extras * (salario_base / 220) * 1.5
+                        if valor_he > 0:
+                            st.write(f"• Horas extras (50%): R$ {valor_he:.2f}")
+                        
+                        salario_bruto = salario_base + comissao + valor_he
+                        st.metric("**Total Bruto**", f"R$ {salario_bruto:.2f}")
+                    
+                    with col_calc2:
+                        st.markdown("**📉 Descontos**")
+                        
+                        # INSS
+                        inss = min(salario_bruto * 0.14, 877.24)  # Teto INSS 2024
+                        st.write(f"• INSS (14%): R$ {inss:.2f}")
+                        
+                        # IRPF
+                        base_irpf = salario_bruto - inss - (func['dependentes'] * 189.59)
+                        if base_irpf <= 2112.00:
+                            irpf = 0
+                        elif base_irpf <= 2826.65:
+                            irpf = base_irpf * 0.075 - 158.40
+                        elif base_irpf <= 3751.05:
+                            irpf = base_irpf * 0.15 - 370.40
+                        elif base_irpf <= 4664.68:
+                            irpf = base_irpf * 0.225 - 651.73
+                        else:
+                            irpf = base_irpf * 0.275 - 884.96
+                        
+                        irpf = max(0, irpf)
+                        st.write(f"• IRPF: R$ {irpf:.2f}")
+                        
+                        # Vale transporte
+                        vt_desconto = min(salario_bruto * 0.06, 220.00) if func['vale_transporte'] else 0
+                        if vt_desconto > 0:
+                            st.write(f"• Vale transporte (6%): R$ {vt_desconto:.2f}")
+                        
+                        # Plano de saúde
+                        plano_desconto = 150.00 if func['plano_saude'] else 0
+                        if plano_desconto > 0:
+                            st.write(f"• Plano de saúde: R$ {plano_desconto:.2f}")
+                        
+                        total_descontos = inss + irpf + vt_desconto + plano_desconto
+                        st.metric("**Total Descontos**", f"R$ {total_descontos:.2f}")
+                    
+                    with col_calc3:
+                        st.markdown("**🏢 Encargos Patronais**")
+                        
+                        # INSS Patronal
+                        inss_patronal = salario_bruto * 0.20
+                        st.write(f"• INSS Patronal (20%): R$ {inss_patronal:.2f}")
+                        
+                        # FGTS
+                        fgts = salario_bruto * 0.08
+                        st.write(f"• FGTS (8%): R$ {fgts:.2f}")
+                        
+                        # Sistema S + Salário Educação
+                        sistema_s = salario_bruto * 0.0358  # SESC + SENAC + SEBRAE + Sal.Educação
+                        st.write(f"• Sistema S (3,58%): R$ {sistema_s:.2f}")
+                        
+                        # Seguro Acidente
+                        seguro_acidente = salario_bruto * 0.01
+                        st.write(f"• Seguro Acidente (1%): R$ {seguro_acidente:.2f}")
+                        
+                        total_encargos_func = inss_patronal + fgts + sistema_s + seguro_acidente
+                        st.metric("**Total Encargos**", f"R$ {total_encargos_func:.2f}")
+                    
+                    # Valores finais
+                    salario_liquido = salario_bruto - total_descontos
+                    custo_total_funcionario = salario_bruto + total_encargos_func
+                    
+                    col_final1, col_final2, col_final3 = st.columns(3)
+                    with col_final1:
+                        st.success(f"**Líquido: R$ {salario_liquido:.2f}**")
+                    with col_final2:
+                        st.info(f"**Custo Total: R$ {custo_total_funcionario:.2f}**")
+                    with col_final3:
+                        percentual_encargos = (total_encargos_func / salario_bruto) * 100
+                        st.warning(f"**Encargos: {percentual_encargos:.1f}%**")
+                    
+                    total_salarios += salario_bruto
+                    total_encargos += total_encargos_func
+                    total_liquido += salario_liquido
+                
+                else:
+                    # Para MEI/Prestadores
+                    st.info(f"Prestador de serviços - Pagamento: R$ {func['salario_base']:.2f}")
+                    total_salarios += func['salario_base']
+                
+                st.markdown("---")
+            
+            # Resumo geral da folha
+            st.markdown("## 📊 Resumo da Folha de Pagamento")
+            
+            col_resumo1, col_resumo2, col_resumo3, col_resumo4 = st.columns(4)
+            
+            with col_resumo1:
+                st.metric("Total Salários Brutos", f"R$ {total_salarios:.2f}")
+            
+            with col_resumo2:
+                st.metric("Total Encargos", f"R$ {total_encargos:.2f}")
+            
+            with col_resumo3:
+                st.metric("Total a Pagar (Líquido)", f"R$ {total_liquido:.2f}")
+            
+            with col_resumo4:
+                custo_total_folha = total_salarios + total_encargos
+                st.metric("Custo Total da Folha", f"R$ {custo_total_folha:.2f}")
+    
+    with tab3:
+        st.subheader("📊 Análise Tributária Detalhada")
+        
+        st.markdown("**Sistema de análise tributária baseado no faturamento do negócio**")
+        
+        # Análise por regime tributário (funciona independentemente de funcionários)
+        regime_tributario = st.selectbox(
+            "Regime tributário da empresa",
+            ["Simples Nacional", "Lucro Presumido"],
+            key="regime_analise"
+        )
+        
+        faturamento_anual = st.number_input(
+            "Faturamento anual estimado (R$)",
+            min_value=0.0,
+            value=360000.0,
+            step=10000.0,
+            key="fat_anual_tributario"
+        )
+        
+        # Cálculo simplificado do Simples Nacional
+        if regime_tributario == "Simples Nacional":
+            st.markdown("### 📋 Simples Nacional - Anexo I (Comércio)")
+            
+            # Calcular alíquota baseada no faturamento
+            if faturamento_anual <= 180000:
+                aliquota = 4.0
+                faixa = "1ª faixa"
+            elif faturamento_anual <= 360000:
+                aliquota = 7.3
+                faixa = "2ª faixa"
+            elif faturamento_anual <= 720000:
+                aliquota = 9.5
+                faixa = "3ª faixa"
+            elif faturamento_anual <= 1800000:
+                aliquota = 10.26
+                faixa = "4ª faixa"
+            else:
+                aliquota = 11.31
+                faixa = "5ª faixa"
+            
+            # Cálculos
+            imposto_anual = faturamento_anual * (aliquota / 100)
+            imposto_mensal = imposto_anual / 12
+            
+            # Exibir resultados
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    "Alíquota Simples",
+                    f"{aliquota}%",
+                    f"{faixa}"
+                )
+            
+            with col2:
+                st.metric(
+                    "DAS Mensal",
+                    f"R$ {imposto_mensal:,.2f}",
+                    f"R$ {imposto_anual:,.2f}/ano"
+                )
+            
+            with col3:
+                percentual_fat = (imposto_mensal / (faturamento_anual/12)) * 100
+                st.metric(
+                    "% do Faturamento",
+                    f"{percentual_fat:.1f}%",
+                    "Carga tributária"
+                )
+            
+            st.info("""
+            **💡 Simples Nacional para Óticas:**
+            - Anexo I (Comércio): Para venda de produtos ópticos
+            - Pagamento único mensal através do DAS
+            - Inclui todos os impostos federais, estaduais e municipais
+            """)
+        
+        else:  # Lucro Presumido
+            st.markdown("### 📋 Lucro Presumido")
+            
+            # Cálculos básicos Lucro Presumido
+            base_calculo_irpj = faturamento_anual * 0.08  # 8% para comércio
+            base_calculo_csll = faturamento_anual * 0.12  # 12% para comércio
+            
+            irpj = base_calculo_irpj * 0.15  # 15%
+            csll = base_calculo_csll * 0.09  # 9%
+            pis = faturamento_anual * 0.0065  # 0,65%
+            cofins = faturamento_anual * 0.03  # 3%
+            
+            total_federal = irpj + csll + pis + cofins
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**Impostos Federais Anuais:**")
+                st.markdown(f"• IRPJ: R$ {irpj:,.2f}")
+                st.markdown(f"• CSLL: R$ {csll:,.2f}")
+                st.markdown(f"• PIS: R$ {pis:,.2f}")
+                st.markdown(f"• COFINS: R$ {cofins:,.2f}")
+                st.markdown(f"**Total: R$ {total_federal:,.2f}**")
+            
+            with col2:
+                st.metric(
+                    "Total Mensal",
+                    f"R$ {total_federal/12:,.2f}",
+                    f"{(total_federal/faturamento_anual)*100:.1f}% do faturamento"
+                )
+            
+            st.warning("""
+            **⚠️ Lucro Presumido:**
+            - Não inclui ICMS (estadual) e ISS (municipal)
+            - Requer maior controle contábil
+            - Mais complexo que o Simples Nacional
+            """)
+        
+        # Comparação final
+        st.markdown("---")
+        st.markdown("### 💰 Resumo da Tributação")
+        
+        # Usar valores configurados pelo usuário (não calcular automaticamente)
+        impostos_configurado = st.session_state.business_data.get('impostos_percentual', 0) / 100
+        custo_tributario_mensal_configurado = faturamento_anual * impostos_configurado / 12
+        
+        st.info(f"""
+        **📊 Resumo baseado em suas configurações:**
+        - Faturamento anual: R$ {faturamento_anual:,.2f}
+        - Taxa de impostos configurada: {impostos_configurado*100:.1f}%
+        - Custo tributário mensal configurado: R$ {custo_tributario_mensal_configurado:,.2f}
+        
+        💡 *Valores baseados no que você configurou na Etapa 10*
+        """)
+    
+    with tab4:
+        st.subheader("📋 Compliance CLT - Checklist de Obrigações")
+        
+        st.markdown("**Sistema de verificação de compliance trabalhista**")
+        
+        compliance_items = [
+            {
+                "categoria": "Admissão",
+                "itens": [
+                    "Registro do empregado no livro/sistema de registro",
+                    "Anotação na CTPS (física ou digital)",
+                    "Cadastro no PIS/PASEP",
+                    "Exames médicos admissionais",
+                    "Cadastro no eSocial",
+                    "Termo de responsabilidade para vale-transporte"
+                ]
+            },
+            {
+                "categoria": "Mensal",
+                "itens": [
+                    "Folha de pagamento até o 5º dia útil",
+                    "Guia de recolhimento do FGTS",
+                    "GPS - Guia da Previdência Social",
+                    "Declaração do IRPF retido",
+                    "Controle de ponto (se aplicável)",
+                    "Vale-refeição/alimentação"
+                ]
+            },
+            {
+                "categoria": "Anual",
+                "itens": [
+                    "13º salário (até 20/12 ou duas parcelas)",
+                    "Férias + 1/3 constitucional",
+                    "RAIS - Relação Anual de Informações Sociais",
+                    "DIRF - Declaração do IR na Fonte",
+                    "Exames médicos periódicos",
+                    "PPP - Perfil Profissiográfico Previdenciário"
+                ]
+            },
+            {
+                "categoria": "Demissão",
+                "itens": [
+                    "Aviso prévio (trabalhado ou indenizado)",
+                    "Exame médico demissional",
+                    "Homologação (se aplicável)",
+                    "Termo de rescisão",
+                    "Guias para saque do FGTS",
+                    "Baixa na CTPS e eSocial"
+                ]
+            }
+        ]
+        
+        col_compliance1, col_compliance2 = st.columns(2)
+        
+        for i, categoria in enumerate(compliance_items):
+            target_col = col_compliance1 if i % 2 == 0 else col_compliance2
+            
+            with target_col:
+                st.markdown(f"### {categoria['categoria']}")
+                
+                for item in categoria['itens']:
+                    compliant = st.checkbox(
+                        item,
+                        key=f"compliance_{categoria['categoria']}_{item[:20]}"
+                    )
+                    
+                    if not compliant:
+                        st.error(f"⚠️ Pendente: {item}")
+                
+                st.markdown("---")
+        
+        # Cálculo de compliance geral
+        total_items = sum(len(cat['itens']) for cat in compliance_items)
+        # Este seria calculado baseado nos checkboxes marcados
+        st.markdown("### 📊 Score de Compliance")
+        st.progress(0.75)  # Exemplo: 75% de compliance
+        st.info("Score: 75% - Bom nível de compliance trabalhista")
+    
+    with tab5:
+        st.subheader("🧮 Simulador de Custos de Contratação")
+        
+        st.markdown("**Simule diferentes cenários de contratação**")
+        
+        col_sim1, col_sim2 = st.columns(2)
+        
+        with col_sim1:
+            st.markdown("**Configuração da Simulação**")
+            
+            cargo_simulacao = st.selectbox(
+                "Cargo para simular",
+                ["Vendedor(a)", "Optometrista", "Gerente", "Recepcionista", "Técnico em Ótica"],
+                key="cargo_sim"
+            )
+            
+            salario_simulacao = st.number_input(
+                "Salário pretendido (R$)",
+                min_value=1412.00,
+                value=2000.00,
+                step=100.00,
+                key="salario_sim"
+            )
+            
+            beneficios_sim = st.multiselect(
+                "Benefícios oferecidos",
+                ["Vale transporte", "Vale refeição", "Plano de saúde", "Plano odontológico", "Participação nos lucros"],
+                default=["Vale transporte", "Vale refeição"],
+                key="beneficios_sim"
+            )
+            
+            comissao_sim = st.number_input(
+                "Comissão sobre vendas (%)",
+                min_value=0.0,
+                max_value=10.0,
+                value=2.0,
+                step=0.5,
+                key="comissao_sim"
+            )
+            
+            vendas_esperadas = st.number_input(
+                "Vendas mensais esperadas (R$)",
+                min_value=0.0,
+                value=15000.0,
+                step=1000.0,
+                key="vendas_sim"
+            )
+        
+        with col_sim2:
+            st.markdown("**Cálculo de Custo Total**")
+            
+            # Cálculos detalhados
+            salario_base = salario_simulacao
+            comissao_mensal = vendas_esperadas * (comissao_sim / 100)
+            salario_bruto_mensal = salario_base + comissao_mensal
+            
+            # Encargos
+            inss_patronal = salario_bruto_mensal * 0.20
+            fgts = salario_bruto_mensal * 0.08
+            sistema_s = salario_bruto_mensal * 0.0358
+            seguro_acidente = salario_bruto_mensal * 0.01
+            total_encargos_sim = inss_patronal + fgts + sistema_s + seguro_acidente
+            
+            # Benefícios
+            custo_beneficios = 0
+            if "Vale transporte" in beneficios_sim:
+                custo_beneficios += 200  # Estimativa
+            if "Vale refeição" in beneficios_sim:
+                custo_beneficios += 550  # 22 dias x R$25
+            if "Plano de saúde" in beneficios_sim:
+                custo_beneficios += 300
+            if "Plano odontológico" in beneficios_sim:
+                custo_beneficios += 50
+            
+            # Custos anuais adicionais
+            decimo_terceiro = salario_bruto_mensal
+            ferias = salario_bruto_mensal * 1.33  # + 1/3
+            custos_anuais_extras = (decimo_terceiro + ferias) / 12
+            
+            custo_total_mensal = salario_bruto_mensal + total_encargos_sim + custo_beneficios + custos_anuais_extras
+            
+            # Exibir resultados com explicação clara
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+                padding: 1.5rem;
+                border-radius: 12px;
+                border-left: 4px solid #6c757d;
+                margin: 1rem 0;
+            ">
+                <div style="font-size: 1.1rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+                    Custo total para contratar este funcionário
+                </div>
+                <div style="font-size: 2rem; font-weight: bold; color: #495057; margin-bottom: 1rem;">
+                    R$ {custo_total_mensal:.2f}/mês
+                </div>
+                <div style="font-size: 1rem; font-weight: bold; color: #495057; margin-bottom: 0.5rem;">
+                    Porque?:
+                </div>
+                <div style="color: #495057; line-height: 1.5;">
+                    • <strong>Salário + comissão:</strong> R$ {salario_bruto_mensal:.2f} (base R$ {salario_base:.2f} + comissão R$ {comissao_mensal:.2f})<br>
+                    • <strong>Encargos sociais:</strong> R$ {total_encargos_sim:.2f} (INSS, FGTS, Sistema S obrigatórios por lei)<br>
+                    • <strong>Benefícios:</strong> R$ {custo_beneficios:.2f} (vale transporte, refeição, planos)<br>
+                    • <strong>13º e férias:</strong> R$ {custos_anuais_extras:.2f} (custos anuais divididos por 12 meses)
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Análise de ROI
+            st.markdown("**Análise de Retorno:**")
+            if vendas_esperadas > 0:
+                roi_contratacao = (vendas_esperadas - custo_total_mensal) / custo_total_mensal * 100
+                st.metric("ROI da Contratação", f"{roi_contratacao:.1f}%")
+                
+                if roi_contratacao > 200:
+                    st.success("✅ Contratação muito viável")
+                elif roi_contratacao > 100:
+                    st.info("✅ Contratação viável")
+                elif roi_contratacao > 50:
+                    st.warning("⚠️ Contratação questionável")
+                else:
+                    st.error("❌ Contratação não recomendada")
+        
+        # Comparação com diferentes regimes
+        st.markdown("---")
+        st.markdown("### 📊 Comparação por Regime Tributário")
+        
+        col_reg1, col_reg2, col_reg3 = st.columns(3)
+        
+        with col_reg1:
+            st.markdown("**CLT + Simples Nacional**")
+            custo_simples = custo_total_mensal - (salario_bruto_mensal * 0.20) + (salario_bruto_mensal * 0.08)
+            st.metric("Custo Mensal", f"R$ {custo_simples:.2f}")
+            st.caption("INSS patronal incluído no DAS")
+        
+        with col_reg2:
+            st.markdown("**CLT + Lucro Presumido**")
+            st.metric("Custo Mensal", f"R$ {custo_total_mensal:.2f}")
+            st.caption("Todos os encargos aplicáveis")
+        
+        with col_reg3:
+            st.markdown("**Prestador de Serviços/MEI**")
+            custo_pj = salario_base * 1.3  # Acréscimo para compensar encargos
+            st.metric("Custo Mensal", f"R$ {custo_pj:.2f}")
+            st.caption("Sem encargos trabalhistas")
@@ -0,0 +1,477 @@
+"""
+Ferramenta Resumo Empreendedor
+Dashboard executivo com os principais indicadores e metas diárias do plano
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency
+from scenario_cube import get_scenario_cube
+
+
+def show_entrepreneur_summary_tool():
+    """Dashboard Empresarial Inteligente - Resumo Executivo para Tomada de Decisão"""
+    st.header("📊 Dashboard Empresarial - Resumo Executivo")
+    st.markdown("**Indicadores-chave para tomada de decisão estratégica**")
+    
+    st.markdown("---")
+    
+    # Recuperar dados principais do plano completo
+    business_data = st.session_state.business_data
+    nome_negocio = business_data.get('nome_otica', business_data.get('nome_negocio', 'Sua Ótica'))
+    
+    # Dados financeiros das Projeções Financeiras (Etapa 10)
+    vendas_mes_1 = business_data.get('vendas_mes_1', 0)
+    ticket_medio = business_data.get('ticket_medio', 0)
+    investimento_total = business_data.get('investimento_total', 0)
+    
+    # Estrutura completa de custos
+    aluguel_mensal = business_data.get('aluguel', 0)
+    salarios_clt = business_data.get('salarios_clt', 0)
+    servicos_terceiros = business_data.get('servicos_terceiros', 0)
+    custo_combustivel = business_data.get('custo_combustivel_mensal', 0)
+    energia_eletrica = business_data.get('energia_eletrica', 0)
+    outros_custos = business_data.get('outros_custos_fixos', 0)
+    custo_captador = business_data.get('custo_captador_mensal_calculado', 0)
+    
+    # CMV estimado (45% da receita bruta é padrão no setor ótico)
+    cmv_estimado = vendas_mes_1 * 0.45 if vendas_mes_1 > 0 else 0
+    
+    # Calcular métricas operacionais
+    oculos_meta_mes = int(vendas_mes_1 / ticket_medio) if ticket_medio > 0 else 0
+    custos_fixos_totais = aluguel_mensal + salarios_clt + servicos_terceiros + custo_combustivel + energia_eletrica + outros_custos + custo_captador
+    
+    # Margem bruta (receita - CMV)
+    margem_bruta_real = vendas_mes_1 - cmv_estimado if vendas_mes_1 > 0 else 0
+    margem_bruta_percentual = (margem_bruta_real / vendas_mes_1 * 100) if vendas_mes_1 > 0 else 0
+    
+    # Lucro operacional (margem bruta - custos fixos)
+    lucro_operacional = margem_bruta_real - custos_fixos_totais if margem_bruta_real > 0 else 0
+    margem_operacional_percentual = (lucro_operacional / vendas_mes_1 * 100) if vendas_mes_1 > 0 else 0
+    
+    # Verificar se temos dados suficientes
+    dados_suficientes = vendas_mes_1 > 0 and ticket_medio > 0 and investimento_total > 0
+    
+    if not dados_suficientes:
+        st.warning("⚠️ Complete as Projeções Financeiras (Etapa 10) para ver o dashboard empresarial completo")
+        st.info("Após completar, você terá acesso a todos os indicadores de performance e insights estratégicos")
+        return
+    
+    # SEÇÃO 1: INDICADORES FINANCEIROS PRINCIPAIS
+    st.markdown("## 💰 Indicadores Financeiros")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); padding: 20px; border-radius: 15px; color: #2e7d32; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.08); border: 1px solid #a5d6a7;'>
+                <h3 style='margin: 0; color: #1b5e20; font-size: 16px;'>💰 Faturamento Mensal</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: #1b5e20; font-weight: bold;'>{format_currency(vendas_mes_1)}</p>
+                <p style='margin: 0; color: #388e3c; font-size: 12px;'>Meta de receita bruta</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Este é seu objetivo de faturamento bruto mensal")
+            st.write(f"• Equivale a {format_currency(vendas_mes_1 * 12)} por ano")
+            st.write(f"• Representa {oculos_meta_mes} óculos vendidos por mês")
+            if vendas_mes_1 > 50000:
+                st.success("✅ Faturamento robusto para sustentabilidade")
+            elif vendas_mes_1 > 25000:
+                st.info("🔵 Faturamento adequado para início")
+            else:
+                st.warning("⚠️ Considere revisar estratégias de pricing")
+    
+    with col2:
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); padding: 20px; border-radius: 15px; color: #0d47a1; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.08); border: 1px solid #90caf9;'>
+                <h3 style='margin: 0; color: #0d47a1; font-size: 16px;'>📈 Margem Bruta</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: #0d47a1; font-weight: bold;'>{margem_bruta_percentual:.1f}%</p>
+                <p style='margin: 0; color: #1565c0; font-size: 12px;'>{format_currency(margem_bruta_real)} líquido</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Margem bruta após descontar CMV (custo dos produtos)")
+            st.write(f"• CMV estimado: {format_currency(cmv_estimado)} (45% da receita)")
+            st.write(f"• Sobra {format_currency(margem_bruta_real)} para custos fixos e lucro")
+            st.write(f"• Benchmark setor ótico: 50-60%")
+            if margem_bruta_percentual > 55:
+                st.success("✅ Margem bruta excelente")
+            elif margem_bruta_percentual > 45:
+                st.info("🔵 Margem bruta adequada")
+            else:
+                st.warning("⚠️ Margem bruta baixa - revisar fornecedores")
+    
+    with col3:
+        payback_meses = investimento_total / lucro_operacional if lucro_operacional > 0 else 0
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #f3e5f5 0%, #e1bee7 100%); padding: 20px; border-radius: 15px; color: #4a148c; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.08); border: 1px solid #ce93d8;'>
+                <h3 style='margin: 0; color: #4a148c; font-size: 16px;'>⏱️ Tempo para Retorno</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: #4a148c; font-weight: bold;'>{payback_meses:.0f}</p>
+                <p style='margin: 0; color: #6a1b9a; font-size: 12px;'>meses para payback</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Tempo para recuperar investimento de {format_currency(investimento_total)}")
+            st.write(f"• Com lucro operacional de {format_currency(lucro_operacional)}/mês")
+            st.write(f"• Benchmark óticas: 12-24 meses")
+            if payback_meses <= 18:
+                st.success("✅ Payback excelente")
+            elif payback_meses <= 30:
+                st.info("🔵 Payback adequado")
+            else:
+                st.warning("⚠️ Payback longo - otimizar custos")
+    
+    with col4:
+        roi_anual = (lucro_operacional * 12 / investimento_total * 100) if investimento_total > 0 else 0
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #fff3e0 0%, #ffcc80 100%); padding: 20px; border-radius: 15px; color: #e65100; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.08); border: 1px solid #ffb74d;'>
+                <h3 style='margin: 0; color: #e65100; font-size: 16px;'>🎯 ROI Anual</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: #e65100; font-weight: bold;'>{roi_anual:.0f}%</p>
+                <p style='margin: 0; color: #f57c00; font-size: 12px;'>retorno sobre investimento</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Retorno anual sobre capital investido")
+            st.write(f"• CDI 2024: ~12% / Poupança: ~6%")
+            st.write(f"• Benchmark negócios: 20-40%")
+            if roi_anual > 30:
+                st.success("✅ ROI excelente - negócio altamente atrativo")
+            elif roi_anual > 15:
+                st.info("🔵 ROI adequado - supera investimentos tradicionais")
+            else:
+                st.warning("⚠️ ROI baixo - avaliar viabilidade")
+    
+    st.markdown("---")
+    
+    # SEÇÃO 2: INDICADORES OPERACIONAIS
+    st.markdown("## 🎯 Indicadores Operacionais")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Calcular vendas por dia útil (22 dias)
+    vendas_por_dia = oculos_meta_mes / 22
+    
+    with col1:
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%); padding: 20px; border-radius: 15px; color: #b71c1c; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.08); border: 1px solid #ef9a9a;'>
+                <h3 style='margin: 0; color: #b71c1c; font-size: 16px;'>👥 Meta Diária</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: #b71c1c; font-weight: bold;'>{vendas_por_dia:.1f}</p>
+                <p style='margin: 0; color: #c62828; font-size: 12px;'>óculos por dia útil</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Meta: {vendas_por_dia:.1f} óculos por dia útil")
+            st.write(f"• {oculos_meta_mes} óculos por mês")
+            st.write(f"• Horário 9h-18h: {vendas_por_dia/9:.1f} por hora")
+            if vendas_por_dia <= 3:
+                st.success("✅ Meta muito alcançável")
+            elif vendas_por_dia <= 5:
+                st.info("🔵 Meta realista com bom atendimento")
+            else:
+                st.warning("⚠️ Meta ambiciosa - foque em conversão")
+    
+    with col2:
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #388E3C 0%, #4CAF50 100%); padding: 20px; border-radius: 15px; color: white; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
+                <h3 style='margin: 0; color: white; font-size: 16px;'>💳 Ticket Médio</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: white; font-weight: bold;'>{format_currency(ticket_medio)}</p>
+                <p style='margin: 0; color: white; font-size: 12px;'>valor médio por venda</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Valor médio de cada venda")
+            st.write(f"• Benchmark óticas populares: R$ 350-500")
+            st.write(f"• Benchmark óticas premium: R$ 600-1.200")
+            if ticket_medio > 600:
+                st.success("✅ Ticket alto - posicionamento premium")
+            elif ticket_medio > 400:
+                st.info("🔵 Ticket adequado - classe média")
+            else:
+                st.warning("⚠️ Ticket baixo - revisar mix de produtos")
+    
+    with col3:
+        # Calcular ponto de equilíbrio
+        ponto_equilibrio_oculos = custos_fixos_totais / ticket_medio if ticket_medio > 0 else 0
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #455A64 0%, #607D8B 100%); padding: 20px; border-radius: 15px; color: white; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
+                <h3 style='margin: 0; color: white; font-size: 16px;'>⚖️ Ponto de Equilíbrio</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: white; font-weight: bold;'>{ponto_equilibrio_oculos:.0f}</p>
+                <p style='margin: 0; color: white; font-size: 12px;'>óculos para empatar</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Vendas mínimas para cobrir custos fixos")
+            st.write(f"• Custos fixos: {format_currency(custos_fixos_totais)}")
+            st.write(f"• Margem de segurança: {oculos_meta_mes - ponto_equilibrio_oculos:.0f} óculos")
+            margem_seguranca = ((oculos_meta_mes - ponto_equilibrio_oculos) / oculos_meta_mes * 100) if oculos_meta_mes > 0 else 0
+            if margem_seguranca > 40:
+                st.success(f"✅ Margem de segurança: {margem_seguranca:.0f}%")
+            elif margem_seguranca > 20:
+                st.info(f"🔵 Margem de segurança: {margem_seguranca:.0f}%")
+            else:
+                st.warning(f"⚠️ Margem baixa: {margem_seguranca:.0f}%")
+    
+    with col4:
+        # Calcular eficiência de capital (vendas/investimento)
+        eficiencia_capital = (vendas_mes_1 * 12) / investimento_total if investimento_total > 0 else 0
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #6A1B9A 0%, #8E24AA 100%); padding: 20px; border-radius: 15px; color: white; text-align: center; box-shadow: 0 4px 6px rgba(0,0,0,0.1);'>
+                <h3 style='margin: 0; color: white; font-size: 16px;'>⚡ Eficiência Capital</h3>
+                <p style='font-size: 28px; margin: 10px 0; color: white; font-weight: bold;'>{eficiencia_capital:.1f}x</p>
+                <p style='margin: 0; color: white; font-size: 12px;'>receita por R$ investido</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with st.expander("🔍 Análise Detalhada"):
+            st.write("**Como interpretar:**")
+            st.write(f"• Cada R$ 1 investido gera R$ {eficiencia_capital:.1f} em receita anual")
+            st.write(f"• Benchmark varejo: 2-4x")
+            st.write(f"• Benchmark serviços: 1-3x")
+            if eficiencia_capital > 3:
+                st.success("✅ Eficiência excelente")
+            elif eficiencia_capital > 1.5:
+                st.info("🔵 Eficiência adequada")
+            else:
+                st.warning("⚠️ Baixa eficiência de capital")
+    
+    st.markdown("---")
+    
+    # SEÇÃO 3: ANÁLISE DE RISCOS E OPORTUNIDADES
+    st.markdown("## ⚠️ Análise de Riscos e Cenários")
+    
+    # Cenários do cubo compartilhado (mesmos ajustes das Etapas 10 e 11)
+    cubo_cenarios = get_scenario_cube(st.session_state.business_data)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🔻 Cenário Pessimista (-20%)")
+        vendas_pessimista = float(cubo_cenarios.series('pessimista', 'receita_bruta')[0])
+        margem_pessimista = float(cubo_cenarios.series('pessimista', 'lucro_operacional')[0])
+        roi_pessimista = cubo_cenarios.annual_summary('pessimista')['roi']
+        
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #ffebee 0%, #ffcdd2 100%); padding: 15px; border-radius: 10px; color: #b71c1c; margin-bottom: 10px; border: 1px solid #ef9a9a;'>
+                <h4 style='margin: 0; color: #b71c1c;'>Receita: {format_currency(vendas_pessimista)}</h4>
+                <p style='margin: 5px 0; color: #c62828;'>Margem: {format_currency(margem_pessimista)} ({(margem_pessimista/vendas_pessimista*100 if vendas_pessimista > 0 else 0):.1f}%)</p>
+                <p style='margin: 0; color: #c62828;'>ROI: {roi_pessimista:.0f}%</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.write("**Principais riscos:**")
+        st.write("• Concorrência agressiva")
+        st.write("• Economia em recessão")
+        st.write("• Dificuldade para encontrar clientes")
+        st.write("• Problemas de fornecedores")
+        
+        if margem_pessimista > 0:
+            st.info("🔵 Ainda viável no cenário pessimista")
+        else:
+            st.error("❌ Negócio inviável no cenário pessimista")
+    
+    with col2:
+        st.markdown("### 🔺 Cenário Otimista (+30%)")
+        vendas_otimista = float(cubo_cenarios.series('otimista', 'receita_bruta')[0])
+        margem_otimista = float(cubo_cenarios.series('otimista', 'lucro_operacional')[0])
+        roi_otimista = cubo_cenarios.annual_summary('otimista')['roi']
+        
+        with st.container():
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); padding: 15px; border-radius: 10px; color: #1b5e20; margin-bottom: 10px; border: 1px solid #a5d6a7;'>
+                <h4 style='margin: 0; color: #1b5e20;'>Receita: {format_currency(vendas_otimista)}</h4>
+                <p style='margin: 5px 0; color: #2e7d32;'>Margem: {format_currency(margem_otimista)} ({(margem_otimista/vendas_otimista*100 if vendas_otimista > 0 else 0):.1f}%)</p>
+                <p style='margin: 0; color: #2e7d32;'>ROI: {roi_otimista:.0f}%</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.write("**Principais oportunidades:**")
+        st.write("• Marketing digital eficaz")
+        st.write("• Parcerias estratégicas")
+        st.write("• Expansão de serviços")
+        st.write("• Fidelização de clientes")
+        
+        st.success("✅ Grande potencial de crescimento")
+    
+    st.markdown("---")
+    
+    # SEÇÃO 4: ESTRATÉGIAS PARA O SUCESSO
+    st.markdown("## 🚀 Estratégias para o Sucesso")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("### 💰 Aumentar Faturamento")
+        st.write("**Estratégias de crescimento:**")
+        if ticket_medio < 500:
+            st.write("• **Upsell**: Oferecer lentes premium")
+            st.write("• **Cross-sell**: Vender óculos de sol")
+            st.write(f"• Meta: Elevar ticket para R$ 600 (+{((600/ticket_medio-1)*100):.0f}%)")
+        else:
+            st.write("• **Volume**: Aumentar fluxo de clientes")
+            st.write("• **Recorrência**: Programa de fidelidade")
+        st.write("• **Marketing**: Investir 5-8% do faturamento")
+        st.write("• **Referências**: Programa de indicação")
+        
+        # Simular impacto do aumento de ticket
+        if ticket_medio < 600:
+            novo_ticket = 600
+            novo_faturamento = oculos_meta_mes * novo_ticket
+            impacto = novo_faturamento - vendas_mes_1
+            st.info(f"💡 Aumentando ticket para R$ {novo_ticket}: +{format_currency(impacto)}/mês")
+    
+    with col2:
+        st.markdown("### 📉 Reduzir Custos")
+        st.write("**Otimizações possíveis:**")
+        if aluguel_mensal / vendas_mes_1 > 0.15:
+            st.write(f"• **Aluguel**: {(aluguel_mensal/vendas_mes_1*100):.1f}% da receita (alto)")
+            st.write("• Negociar desconto ou buscar local menor")
+        if (salarios_clt + outros_custos) / vendas_mes_1 > 0.25:
+            st.write("• **Pessoal**: Otimizar estrutura")
+            st.write("• Considerar comissionamento")
+        st.write("• **Fornecedores**: Negociar melhores condições")
+        st.write("• **Energia**: Equipamentos eficientes")
+        st.write("• **Automação**: Reduzir tarefas manuais")
+        
+        # Simular redução de 10% nos custos
+        reducao_custos = custos_fixos_totais * 0.1
+        nova_margem = lucro_operacional + reducao_custos
+        st.info(f"💡 Reduzindo custos 10%: +{format_currency(reducao_custos)}/mês")
+    
+    with col3:
+        st.markdown("### 🎯 Aumentar Eficiência")
+        st.write("**Melhorias operacionais:**")
+        st.write("• **Atendimento**: Treinar equipe")
+        st.write("• **Processo**: Reduzir tempo de venda")
+        st.write("• **Estoque**: Otimizar giro")
+        st.write("• **Tecnologia**: Sistema de gestão")
+        st.write("• **Experiência**: Ambiente acolhedor")
+        
+        # Taxa de conversão atual e meta
+        if vendas_por_dia <= 3:
+            st.write(f"• **Meta**: {vendas_por_dia:.1f} → {vendas_por_dia*1.5:.1f} óculos/dia")
+            st.info(f"💡 Melhorando conversão 50%: +{format_currency(vendas_mes_1*0.5)}/mês")
+        else:
+            st.write("• **Foco**: Manter qualidade do atendimento")
+            st.info("💡 Priorizar margem sobre volume")
+    
+    st.markdown("---")
+    
+    # SEÇÃO 5: RESUMO EXECUTIVO FINAL
+    st.markdown("## 📋 Resumo Executivo")
+    
+    # Calcular score geral do negócio
+    score_faturamento = min(100, (vendas_mes_1 / 50000) * 25) if vendas_mes_1 > 0 else 0
+    score_margem = min(100, (margem_operacional_percentual / 40) * 25) if margem_operacional_percentual > 0 else 0
+    score_payback = min(100, max(0, (36 - payback_meses) / 36 * 25)) if payback_meses > 0 else 0
+    score_roi = min(100, (roi_anual / 40) * 25) if roi_anual > 0 else 0
+    score_total = score_faturamento + score_margem + score_payback + score_roi
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("### 📊 Avaliação Geral do Negócio")
+        
+        # Barra de progresso para score
+        if score_total >= 80:
+            cor_score = "#4CAF50"
+            status_negocio = "EXCELENTE"
+            recomendacao = "Negócio altamente viável. Prossiga com confiança!"
+        elif score_total >= 60:
+            cor_score = "#FF9800"
+            status_negocio = "BOM"
+            recomendacao = "Negócio viável. Implemente melhorias sugeridas."
+        elif score_total >= 40:
+            cor_score = "#FF5722"
+            status_negocio = "REGULAR"
+            recomendacao = "Negócio arriscado. Revise custos e estratégias."
+        else:
+            cor_score = "#D32F2F"
+            status_negocio = "CRÍTICO"
+            recomendacao = "Negócio inviável. Reformule o plano completamente."
+        
+        st.markdown(f"""
+        <div style='background: linear-gradient(135deg, {cor_score} 0%, {cor_score}88 100%); padding: 20px; border-radius: 15px; color: white; text-align: center; margin-bottom: 20px;'>
+            <h2 style='margin: 0; color: white;'>SCORE: {score_total:.0f}/100</h2>
+            <h3 style='margin: 10px 0; color: white;'>{status_negocio}</h3>
+            <p style='margin: 0; color: white; font-size: 16px;'>{recomendacao}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("**Componentes do Score:**")
+        st.progress(score_faturamento/100, f"Faturamento: {score_faturamento:.0f}/25")
+        st.progress(score_margem/100, f"Margem: {score_margem:.0f}/25") 
+        st.progress(score_payback/100, f"Payback: {score_payback:.0f}/25")
+        st.progress(score_roi/100, f"ROI: {score_roi:.0f}/25")
+    
+    with col2:
+        st.markdown("### 🎯 Próximos Passos")
+        
+        if score_total >= 80:
+            st.write("**Ações prioritárias:**")
+            st.write("• Finalizar financiamento")
+            st.write("• Definir fornecedores")
+            st.write("• Contratar equipe")
+            st.write("• Começar marketing")
+        elif score_total >= 60:
+            st.write("**Melhorias necessárias:**")
+            st.write("• Otimizar custos fixos")
+            st.write("• Revisar ticket médio")
+            st.write("• Validar demanda")
+            st.write("• Ajustar projeções")
+        else:
+            st.write("**Revisões críticas:**")
+            st.write("• Rever modelo de negócio")
+            st.write("• Reduzir investimento")
+            st.write("• Buscar local mais barato")
+            st.write("• Considerar sociedade")
+        
+        # Botão de ação principal
+        if score_total >= 60:
+            st.success("✅ Prosseguir com implementação")
+        else:
+            st.error("❌ Revisar plano antes de prosseguir")
+    
+    st.markdown("---")
+    
+    # Footer com resumo numérico
+    st.markdown("### 📈 Resumo dos Números-Chave")
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric("💰 Faturamento", format_currency(vendas_mes_1), f"{format_currency(vendas_mes_1 * 12)}/ano")
+    
+    with col2:
+        st.metric("📊 Margem", f"{margem_operacional_percentual:.1f}%", format_currency(lucro_operacional))
+    
+    with col3:
+        st.metric("⏱️ Payback", f"{payback_meses:.0f} meses", f"{payback_meses/12:.1f} anos")
+    
+    with col4:
+        st.metric("🎯 ROI", f"{roi_anual:.0f}%", "ao ano")
+    
+    with col5:
+        st.metric("👥 Meta Diária", f"{vendas_por_dia:.1f}", "óculos/dia")
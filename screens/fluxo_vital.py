@@ -0,0 +1,287 @@
+"""
+Ferramenta Fluxo Vital
+Metas mensais de vendas e caixa para os primeiros meses da loja
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency
+
+
+def show_fluxo_vital_tool():
+    """Fluxo Vital - Guia Prático Passo a Passo para Abrir uma Ótica"""
+    
+    # Header with back button
+    col1, col2 = st.columns([1, 6])
+    with col1:
+        if st.button("⬅️ Voltar", key="back_fluxo_vital"):
+            st.session_state.show_fluxo_vital = False
+            st.rerun()
+    
+    with col2:
+        st.title("🚀 Fluxo Vital - Guia Prático para Sua Ótica")
+        st.markdown("**Checklist operacional desde a ideia até o primeiro giro**")
+    
+    # Recuperar APENAS dados reais do sistema - sem valores fictícios
+    investimento_total = st.session_state.business_data.get('investimento_total', 0)
+    capital_giro = st.session_state.business_data.get('capital_giro', 0)
+    receita_mes_1 = st.session_state.business_data.get('vendas_mes_1', 0) or st.session_state.business_data.get('receita_mensal', 0)
+    
+    # Investimento detalhado (dados reais dos campos do sistema)
+    reforma_loja = st.session_state.business_data.get('reforma_loja', 0)
+    equipamentos_moveis = st.session_state.business_data.get('equipamentos_moveis', 0)
+    mobiliario_decoracao = st.session_state.business_data.get('mobiliario_decoracao', 0)
+    sistema_eletrico = st.session_state.business_data.get('sistema_eletrico', 0)
+    consultorio_exames = st.session_state.business_data.get('consultorio_exames', 0)
+    area_vendas_estoque = st.session_state.business_data.get('area_vendas_estoque', 0)
+    total_infraestrutura = reforma_loja + equipamentos_moveis + mobiliario_decoracao + sistema_eletrico + consultorio_exames + area_vendas_estoque
+    
+    # Custos mensais reais do sistema
+    aluguel = st.session_state.business_data.get('aluguel', 0)
+    agua_luz = st.session_state.business_data.get('agua_luz', 0)
+    telefone_internet = st.session_state.business_data.get('telefone_internet', 0)  
+    marketing = st.session_state.business_data.get('marketing', 0)
+    outros_fixos = st.session_state.business_data.get('outros_fixos', 0)
+    # Removed invalid assignment
+    folha_mensal = st.session_state.business_data.get('salarios_total', 0)
+    
+    custos_operacionais = aluguel + agua_luz + telefone_internet + marketing + outros_fixos + 0
+    custo_total_mensal = folha_mensal + custos_operacionais
+    
+    st.info(f"""
+    💰 **Recursos Necessários (baseados no seu plano):**
+    - Investimento inicial: R$ {investimento_total:,.0f}
+    - Capital de giro: R$ {capital_giro:,.0f}
+    - Infraestrutura total: R$ {total_infraestrutura:,.0f} (Reforma: R$ {reforma_loja:,.0f} + Equipamentos: R$ {equipamentos_moveis:,.0f} + Móveis: R$ {mobiliario_decoracao:,.0f})
+    - Custo mensal: R$ {custo_total_mensal:,.0f}
+    - Meta de receita: R$ {receita_mes_1:,.0f}/mês
+    """)
+    
+    # Etapas do fluxo vital
+    etapas = [
+        {
+            "fase": "💡 PLANEJAMENTO",
+            "titulo": "1. Definição do Negócio",
+            "saldo_inicial": capital_giro,
+            "gastos": 0,
+            "descricao": "Validar o conceito e definir estratégia",
+            "acoes": [
+                "✅ Pesquisar mercado local e concorrência",
+                "✅ Definir público-alvo e posicionamento",
+                "✅ Elaborar plano de negócios (você já fez!)",
+                "✅ Projetar fluxo de caixa para 12 meses"
+            ]
+        },
+        {
+            "fase": "📋 LEGALIZAÇÃO",
+            "titulo": "2. Abertura da Empresa",
+            "saldo_inicial": capital_giro,
+            "gastos": st.session_state.business_data.get('custos_abertura_empresa', 0),
+            "descricao": "Formalizar o negócio e obter licenças",
+            "acoes": [
+                f"💰 Custos de abertura: {format_currency(st.session_state.business_data.get('custos_abertura_empresa', 0))}",
+                f"📄 Regime tributário: {st.session_state.business_data.get('regime_tributario', 'Não definido')}",
+                "📄 Obter CNPJ e inscrições estadual/municipal",
+                "📄 Alvará de funcionamento e sanitário"
+            ]
+        },
+        {
+            "fase": "🏢 INFRAESTRUTURA",
+            "titulo": "3. Montagem do Espaço",
+            "saldo_inicial": capital_giro - st.session_state.business_data.get('custos_abertura_empresa', 0),
+            "gastos": total_infraestrutura,
+            "descricao": "Preparar o ponto comercial",
+            "acoes": [
+                f"💰 Reforma do espaço: {format_currency(reforma_loja)}" if reforma_loja > 0 else "• Reforma não planejada",
+                f"💰 Equipamentos básicos: {format_currency(equipamentos_moveis)}" if equipamentos_moveis > 0 else "• Equipamentos não planejados",
+                f"💰 Mobiliário e decoração: {format_currency(mobiliario_decoracao)}" if mobiliario_decoracao > 0 else "• Mobiliário não planejado",
+                f"💰 Sistema elétrico: {format_currency(sistema_eletrico)}" if sistema_eletrico > 0 else "• Sistema elétrico não planejado",
+                f"💰 Consultório exames: {format_currency(consultorio_exames)}" if consultorio_exames > 0 else "• Consultório não planejado",
+                f"💰 Área vendas/estoque: {format_currency(area_vendas_estoque)}" if area_vendas_estoque > 0 else "• Área de vendas não planejada"
+            ]
+        },
+        {
+            "fase": "📦 ESTOQUE",
+            "titulo": "4. Compra do Estoque Inicial",
+            "saldo_inicial": capital_giro - st.session_state.business_data.get('custos_abertura_empresa', 0) - total_infraestrutura,
+            "gastos": st.session_state.business_data.get('estoque_inicial', 0),
+            "descricao": "Adquirir produtos para venda",
+            "acoes": [
+                f"💰 Estoque inicial: {format_currency(st.session_state.business_data.get('estoque_inicial', 0))}" if st.session_state.business_data.get('estoque_inicial', 0) > 0 else "• Estoque inicial não definido",
+                f"📦 Fornecedores configurados: {', '.join(st.session_state.business_data.get('fornecedores_selecionados', ['Não definidos']))}",
+                f"📦 Prazo pagamento: {st.session_state.business_data.get('forma_pagamento_fornecedor', 'Não definido')}",
+                "📦 Organizar sistema de controle de estoque"
+            ]
+        },
+        {
+            "fase": "👥 EQUIPE",
+            "titulo": "5. Contratação de Funcionários",
+            "saldo_inicial": capital_giro - st.session_state.business_data.get('custos_abertura_empresa', 0) - total_infraestrutura - st.session_state.business_data.get('estoque_inicial', 0),
+            "gastos": folha_mensal,
+            "descricao": "Formar a equipe de trabalho",
+            "acoes": [
+                f"💰 Folha mensal: {format_currency(folha_mensal)}" if folha_mensal > 0 else "• Equipe não definida",
+                "👥 Funcionários planejados no DP e Tributação",
+                "📚 Treinamento da equipe em produtos",
+                "📚 Capacitação em atendimento ao cliente"
+            ]
+        }
+    ]
+    
+    # Exibir etapas em formato de timeline
+    st.markdown("### 🛣️ Cronograma de Execução")
+    
+    saldo_atual = capital_giro
+    
+    for i, etapa in enumerate(etapas):
+        # Card para cada etapa
+        with st.expander(f"{etapa['fase']} - {etapa['titulo']}", expanded=i==0):
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                st.markdown(f"**{etapa['descricao']}**")
+                
+                for acao in etapa['acoes']:
+                    if acao.startswith('💰'):
+                        st.markdown(f"<span style='color: red'>{acao}</span>", unsafe_allow_html=True)
+                    else:
+                        st.markdown(acao)
+            
+            with col2:
+                saldo_antes = saldo_atual
+                saldo_atual -= etapa['gastos']
+                
+                st.metric("Saldo Inicial", f"R$ {saldo_antes:,.0f}")
+                if etapa['gastos'] > 0:
+                    st.metric("Gastos", f"R$ {etapa['gastos']:,.0f}", delta=f"-{etapa['gastos']:,.0f}")
+                st.metric("Saldo Final", f"R$ {saldo_atual:,.0f}")
+                
+                if saldo_atual < 0:
+                    st.error("⚠️ Saldo insuficiente!")
+                elif saldo_atual < 5000:
+                    st.warning("⚠️ Reserva baixa")
+                else:
+                    st.success("✅ Recursos OK")
+    
+    st.markdown("---")
+    
+    # Simulação do primeiro mês operacional
+    st.markdown("### 💼 Primeiro Mês de Operação")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**🔄 Ciclo Operacional Mensal**")
+        
+        # Entradas
+        st.markdown("**ENTRADAS:**")
+        vendas_vista = receita_mes_1 * 0.7
+        st.write(f"• Vendas à vista (70%): R$ {vendas_vista:,.0f}")
+        st.write(f"• Total de entrada: R$ {vendas_vista:,.0f}")
+        
+        # Saídas
+        st.markdown("**SAÍDAS:**")
+        
+        # Calcular CMV real baseado nos custos de materiais da precificação
+        custo_materiais_fisicos = st.session_state.business_data.get('custo_materiais_fisicos', 89.80)
+        ticket_medio = st.session_state.business_data.get('ticket_medio', 180)
+        vendas_quantidade = receita_mes_1 / ticket_medio if ticket_medio > 0 else 0
+        cmv_real = custo_materiais_fisicos * vendas_quantidade
+        percentual_cmv = (cmv_real / receita_mes_1 * 100) if receita_mes_1 > 0 else 0
+        
+        impostos = receita_mes_1 * 0.06
+        st.write(f"• Fornecedores ({percentual_cmv:.1f}%): R$ {cmv_real:,.0f}")
+        st.caption(f"   Baseado em: {vendas_quantidade:.0f} óculos × R$ {custo_materiais_fisicos:.2f} custo real")
+        st.write(f"• Impostos (6%): R$ {impostos:,.0f}")
+        st.write(f"• Folha de pagamento: R$ {folha_mensal:,.0f}")
+        st.write(f"• Aluguel: R$ {aluguel:,.0f}")
+        st.write(f"• Outros custos: R$ {custos_operacionais - aluguel:,.0f}")
+        
+        total_saidas = cmv_real + impostos + folha_mensal + custos_operacionais
+        st.write(f"• **Total de saídas: R$ {total_saidas:,.0f}**")
+    
+    with col2:
+        st.markdown("**📊 Resultado do Mês**")
+        
+        fluxo_mes = vendas_vista - total_saidas
+        
+        if fluxo_mes > 0:
+            st.success(f"✅ Fluxo positivo: R$ {fluxo_mes:,.0f}")
+            st.write("🎉 Parabéns! Seu primeiro mês será lucrativo")
+        else:
+            st.error(f"❌ Fluxo negativo: R$ {fluxo_mes:,.0f}")
+            st.write("⚠️ Atenção: revisar estratégia de vendas")
+        
+        saldo_final_mes = saldo_atual + fluxo_mes
+        st.metric("Saldo após 1º mês", f"R$ {saldo_final_mes:,.0f}")
+        
+        # Meta para equilíbrio
+        if fluxo_mes < 0:
+            vendas_necessarias = total_saidas / 0.7
+            st.write(f"💡 **Vendas necessárias:** R$ {vendas_necessarias:,.0f}")
+            diferenca = vendas_necessarias - receita_mes_1
+            st.write(f"📈 **Aumentar vendas em:** R$ {diferenca:,.0f}")
+    
+    # Dicas práticas
+    st.markdown("---")
+    st.markdown("### 💡 Dicas para o Sucesso")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("**🎯 Vendas**")
+        st.write("• Foque em serviços completos")
+        st.write("• Ofereça exames gratuitos")
+        st.write("• Crie pacotes promocionais")
+        st.write("• Invista em marketing digital")
+    
+    with col2:
+        st.markdown("**💰 Financeiro**")
+        st.write("• Monitore fluxo de caixa diário")
+        st.write("• Negocie prazos com fornecedores")
+        st.write("• Controle rigorosamente custos")
+        st.write("• Mantenha reserva de emergência")
+    
+    with col3:
+        st.markdown("**👥 Operacional**")
+        st.write("• Treine equipe continuamente")
+        st.write("• Mantenha estoque organizado")
+        st.write("• Acompanhe satisfação clientes")
+        st.write("• Invista em equipamentos qualidade")
+    
+    # Cronograma de 90 dias
+    st.markdown("---")
+    st.markdown("### 📅 Primeiros 90 Dias")
+    
+    meses_90_dias = [
+        {
+            "mes": "Mês 1",
+            "foco": "Estabilização",
+            "meta_vendas": receita_mes_1,
+            "acoes": ["Inauguração", "Campanhas de lançamento", "Networking local"]
+        },
+        {
+            "mes": "Mês 2", 
+            "foco": "Crescimento",
+            "meta_vendas": receita_mes_1 * 1.1,
+            "acoes": ["Fidelização clientes", "Parcerias médicos", "Marketing digital"]
+        },
+        {
+            "mes": "Mês 3",
+            "foco": "Consolidação", 
+            "meta_vendas": receita_mes_1 * 1.2,
+            "acoes": ["Avaliar resultados", "Ajustar estratégias", "Planejar expansão"]
+        }
+    ]
+    
+    for mes_info in meses_90_dias:
+        with st.expander(f"{mes_info['mes']}: {mes_info['foco']}"):
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                st.write("**Ações principais:**")
+                for acao in mes_info['acoes']:
+                    st.write(f"• {acao}")
+            
+            with col2:
+                st.metric("Meta de Vendas", f"R$ {mes_info['meta_vendas']:,.0f}")
@@ -0,0 +1,937 @@
+"""
+Ferramenta Relatório para Investidores
+Seções do relatório, DRE, downloads em Markdown e PDFs em segundo plano
+"""
+
+import streamlit as st
+import time
+from datetime import datetime
+
+from app_helpers import format_currency, show_report_job
+from investor_sections import get_investor_sections
+from report_jobs import get_report_queue
+
+
+def show_investor_report_tool():
+    """Relatório Completo para Investidores - Multilingual"""
+    
+    # Seletor de idioma no topo
+    col_header1, col_header2 = st.columns([3, 1])
+    
+    with col_header1:
+        st.header("📊 Relatório Completo para Investidores")
+        st.markdown("**Documento profissional baseado no checklist completo para análise de investimento**")
+    
+    with col_header2:
+        idioma = st.selectbox(
+            "🌐 Idioma / Language / Idioma",
+            ["Português", "English", "Español"],
+            key="investor_report_language"
+        )
+    
+
+    
+    # Verificar se há dados suficientes
+    if not st.session_state.business_data:
+        if idioma == "English":
+            st.warning("Complete all 12 steps of the business plan to generate the complete report")
+        elif idioma == "Español":
+            st.warning("Complete todas las 12 etapas del plan de negocios para generar el informe completo")
+        else:
+            st.warning("Complete todas as 12 etapas do plano de negócios para gerar o relatório completo")
+        return
+    
+    # Traduções dos textos
+    translations = {
+        "Português": {
+            "tabs": ["🎯 Propósito", "💡 Solução", "🏢 Mercado", "⚔️ Concorrência", "💰 Financeiro", "👥 Equipe", "📄 Download"],
+            "purpose_title": "1. PROPÓSITO E PROBLEMA",
+            "problem_identified": "Problema Identificado",
+            "problem": "Problema",
+            "validation": "Validação do Problema",
+            "latent_pain": "Dor Latente no Mercado:",
+            "evidence": "Evidências do Problema:",
+            "target_audience": "Público-alvo",
+            "relevance": "Relevância do Problema",
+            "impact": "Impacto: Afeta diretamente a qualidade de vida e produtividade de milhões de brasileiros",
+            "urgency": "Urgência: Necessidade crescente de correção visual e proteção ocular",
+            "frequency": "Frequência: Problema recorrente que afeta pessoas por toda a vida",
+            "solution_title": "2. SOLUÇÃO E PROPOSTA DE VALOR",
+            "our_solution": "Nossa Solução",
+            "value_proposition": "Proposta de Valor",
+            "competitive_diff": "Diferencial Competitivo",
+            "products_services": "Produtos e Serviços",
+            "unique_advantages": "Vantagens Únicas",
+            "solution_validation": "Validação da Solução",
+            "entrepreneur_exp": "Experiência do Empreendedor",
+            "business_status": "Status do Negócio: Pronto para operação",
+            "validation_complete": "Validação: Análise completa de mercado e viabilidade realizada",
+            "market_title": "3. MERCADO E OPORTUNIDADE",
+            "market_size": "Tamanho do Mercado",
+            "growth_analysis": "Análise de Crescimento",
+            "sector_trends": "Tendências do Setor:",
+            "strategic_location": "Localização Estratégica",
+            "city": "Cidade",
+            "pop_density": "Densidade Populacional",
+            "location_advantages": "Vantagens da Localização:",
+            "download_complete": "📄 Gerar Relatório Completo para Investidores",
+            "download_success": "Relatório completo gerado com sucesso!",
+            "download_preview": "📖 Prévia do Relatório Completo"
+        },
+        "English": {
+            "tabs": ["🎯 Purpose", "💡 Solution", "🏢 Market", "⚔️ Competition", "💰 Financial", "👥 Team", "📄 Download"],
+            "purpose_title": "1. PURPOSE AND PROBLEM",
+            "problem_identified": "Identified Problem",
+            "problem": "Problem",
+            "validation": "Problem Validation",
+            "latent_pain": "Latent Market Pain:",
+            "evidence": "Problem Evidence:",
+            "target_audience": "Target audience",
+            "relevance": "Problem Relevance",
+            "impact": "Impact: Directly affects the quality of life and productivity of millions of Brazilians",
+            "urgency": "Urgency: Growing need for vision correction and eye protection",
+            "frequency": "Frequency: Recurring problem that affects people throughout their lives",
+            "solution_title": "2. SOLUTION AND VALUE PROPOSITION",
+            "our_solution": "Our Solution",
+            "value_proposition": "Value Proposition",
+            "competitive_diff": "Competitive Differential",
+            "products_services": "Products and Services",
+            "unique_advantages": "Unique Advantages",
+            "solution_validation": "Solution Validation",
+            "entrepreneur_exp": "Entrepreneur Experience",
+            "business_status": "Business Status: Ready for operation",
+            "validation_complete": "Validation: Complete market and feasibility analysis conducted",
+            "market_title": "3. MARKET AND OPPORTUNITY",
+            "market_size": "Market Size",
+            "growth_analysis": "Growth Analysis",
+            "sector_trends": "Sector Trends:",
+            "strategic_location": "Strategic Location",
+            "city": "City",
+            "pop_density": "Population Density",
+            "location_advantages": "Location Advantages:",
+            "download_complete": "📄 Generate Complete Investor Report",
+            "download_success": "Complete report generated successfully!",
+            "download_preview": "📖 Complete Report Preview"
+        },
+        "Español": {
+            "tabs": ["🎯 Propósito", "💡 Solución", "🏢 Mercado", "⚔️ Competencia", "💰 Financiero", "👥 Equipo", "📄 Descarga"],
+            "purpose_title": "1. PROPÓSITO Y PROBLEMA",
+            "problem_identified": "Problema Identificado",
+            "problem": "Problema",
+            "validation": "Validación del Problema",
+            "latent_pain": "Dolor Latente del Mercado:",
+            "evidence": "Evidencias del Problema:",
+            "target_audience": "Público objetivo",
+            "relevance": "Relevancia del Problema",
+            "impact": "Impacto: Afecta directamente la calidad de vida y productividad de millones de brasileños",
+            "urgency": "Urgencia: Necesidad creciente de corrección visual y protección ocular",
+            "frequency": "Frecuencia: Problema recurrente que afecta a las personas durante toda su vida",
+            "solution_title": "2. SOLUCIÓN Y PROPUESTA DE VALOR",
+            "our_solution": "Nuestra Solución",
+            "value_proposition": "Propuesta de Valor",
+            "competitive_diff": "Diferencial Competitivo",
+            "products_services": "Productos y Servicios",
+            "unique_advantages": "Ventajas Únicas",
+            "solution_validation": "Validación de la Solución",
+            "entrepreneur_exp": "Experiencia del Emprendedor",
+            "business_status": "Estado del Negocio: Listo para operación",
+            "validation_complete": "Validación: Análisis completo de mercado y viabilidad realizado",
+            "market_title": "3. MERCADO Y OPORTUNIDAD",
+            "market_size": "Tamaño del Mercado",
+            "growth_analysis": "Análisis de Crecimiento",
+            "sector_trends": "Tendencias del Sector:",
+            "strategic_location": "Ubicación Estratégica",
+            "city": "Ciudad",
+            "pop_density": "Densidad Poblacional",
+            "location_advantages": "Ventajas de la Ubicación:",
+            "download_complete": "📄 Generar Informe Completo para Inversores",
+            "download_success": "¡Informe completo generado exitosamente!",
+            "download_preview": "📖 Vista Previa del Informe Completo"
+        }
+    }
+    
+    t = translations[idioma]
+    
+    # Números e textos do relatório calculados uma vez por versão do plano
+    secoes = get_investor_sections(st.session_state.business_data)
+    vm = secoes.view_model
+    
+    # Dados do negócio
+    nome_negocio = vm['nome_negocio']
+    cidade = vm['cidade']
+    estado = vm['estado']
+    vendas_mes_1 = vm['vendas_mes_1']
+    
+    # Tabs para o relatório completo
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(t["tabs"])
+    
+    with tab1:
+        st.subheader(t["purpose_title"])
+        
+        st.markdown(f"### {t['problem_identified']}")
+        problema = vm['problema_mercado']
+        st.write(f"**{t['problem']}:** {problema}")
+        
+        st.markdown(f"### {t['validation']}")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"**{t['latent_pain']}**")
+            if idioma == "English":
+                st.write("• Difficulty accessing quality optical products")
+                st.write("• High prices in traditional market")
+                st.write("• Limited personalized service")
+                st.write("• Delays in specialized product delivery")
+            elif idioma == "Español":
+                st.write("• Dificultad para acceder a productos ópticos de calidad")
+                st.write("• Precios elevados en el mercado tradicional")
+                st.write("• Atención personalizada limitada")
+                st.write("• Demoras en la entrega de productos especializados")
+            else:
+                st.write("• Dificuldade de acesso a produtos ópticos de qualidade")
+                st.write("• Preços elevados no mercado tradicional")
+                st.write("• Atendimento personalizado limitado")
+                st.write("• Demora na entrega de produtos especializados")
+        
+        with col2:
+            st.markdown(f"**{t['evidence']}**")
+            publico_alvo = vm['publico_alvo']
+            st.write(f"• {t['target_audience']}: {publico_alvo}")
+            if idioma == "English":
+                st.write("• Optical market growth: 8% annually")
+                st.write("• Population aging increasing demand")
+                st.write("• Intensive use of digital screens")
+            elif idioma == "Español":
+                st.write("• Crecimiento del mercado óptico: 8% anual")
+                st.write("• Envejecimiento poblacional aumentando demanda")
+                st.write("• Uso intensivo de pantallas digitales")
+            else:
+                st.write("• Crescimento do mercado óptico: 8% ao ano")
+                st.write("• Envelhecimento populacional aumentando demanda")
+                st.write("• Uso intensivo de telas digitais")
+        
+        st.markdown(f"### {t['relevance']}")
+        st.write(f"**{t['impact']}**")
+        st.write(f"**{t['urgency']}**")
+        st.write(f"**{t['frequency']}**")
+    
+    with tab2:
+        st.subheader("2. SOLUÇÃO E PROPOSTA DE VALOR")
+        
+        st.markdown("### Nossa Solução")
+        proposta_valor = vm['proposta_valor']
+        st.write(f"**Proposta de Valor:** {proposta_valor}")
+        
+        st.markdown("### Diferencial Competitivo")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Produtos e Serviços:**")
+            produtos = vm['produtos_servicos']
+            st.write(f"• {produtos}")
+            st.write("• Atendimento personalizado e consultorias")
+            st.write("• Tecnologia de ponta em exames")
+            st.write("• Parcerias com fornecedores premium")
+        
+        with col2:
+            st.markdown("**Vantagens Únicas:**")
+            st.write("• Localização estratégica privilegiada")
+            st.write("• Equipe especializada e experiente")
+            st.write("• Processo otimizado de atendimento")
+            st.write("• Relacionamento próximo com clientes")
+        
+        st.markdown("### Validação da Solução")
+        experiencia = vm['experiencia_setor']
+        st.write(f"**Experiência do Empreendedor:** {experiencia}")
+        st.write("**Status do Negócio:** Pronto para operação")
+        st.write("**Validação:** Análise completa de mercado e viabilidade realizada")
+    
+    with tab3:
+        st.subheader("3. MERCADO E OPORTUNIDADE")
+        
+        st.markdown("### Tamanho do Mercado")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**TAM - Total Addressable Market**")
+            st.metric("Mercado Óptico Brasil", "R$ 4,2 bi")
+            st.caption("Mercado total de produtos ópticos no Brasil")
+        
+        with col2:
+            st.markdown("**SAM - Serviceable Available Market**")
+            st.metric(f"Mercado Regional {estado}", format_currency(vm['mercado_sam']))
+            st.caption("Mercado acessível na região de atuação")
+        
+        with col3:
+            st.markdown("**SOM - Serviceable Obtainable Market**")
+            st.metric("Mercado Obtível", format_currency(vm['mercado_som']))
+            st.caption("Fatia de mercado realista nos primeiros anos")
+        
+        st.markdown("### Análise de Crescimento")
+        st.write("**Tendências do Setor:**")
+        st.write("• Crescimento médio anual: 8% (ABRAÃO - Associação Brasileira do Comércio Óptico)")
+        st.write("• Envelhecimento populacional: +60 anos crescendo 4% ao ano")
+        st.write("• Digitalização: aumento de 40% em problemas de visão relacionados a telas")
+        st.write("• Renda per capita: melhoria do poder aquisitivo da classe média")
+        
+        st.markdown("### Localização Estratégica")
+        st.write(f"**Cidade:** {cidade}, {estado}")
+        densidade_pop = vm['densidade_populacional']
+        st.write(f"**Densidade Populacional:** {densidade_pop}")
+        st.write("**Vantagens da Localização:**")
+        st.write("• Alto fluxo de pedestres e veículos")
+        st.write("• Proximidade a centros médicos e clínicas")
+        st.write("• Facilidade de acesso e estacionamento")
+        st.write("• Visibilidade comercial privilegiada")
+    
+    with tab4:
+        st.subheader("4. ANÁLISE DA CONCORRÊNCIA")
+        
+        st.markdown("### Concorrentes Identificados")
+        concorrentes = vm['principais_concorrentes']
+        st.write(f"**Principais Concorrentes:** {concorrentes}")
+        
+        st.markdown("### Matriz de Posicionamento")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Concorrentes Diretos:**")
+            st.write("• Óticas tradicionais da região")
+            st.write("• Redes nacionais (Óticas Carol, Diniz)")
+            st.write("• Franchises locais")
+            
+            st.markdown("**Pontos Fortes dos Concorrentes:**")
+            st.write("• Marca estabelecida (redes)")
+            st.write("• Volume de compras (preço)")
+            st.write("• Marketing padronizado")
+        
+        with col2:
+            st.markdown("**Concorrentes Indiretos:**")
+            st.write("• E-commerce de produtos ópticos")
+            st.write("• Óticas em shopping centers")
+            st.write("• Clínicas oftalmológicas")
+            
+            st.markdown("**Nossos Diferenciais:**")
+            st.write("• Atendimento personalizado e consultivo")
+            st.write("• Agilidade na entrega")
+            st.write("• Relacionamento próximo com clientes")
+            st.write("• Flexibilidade para customização")
+        
+        st.markdown("### Estratégia Competitiva")
+        estrategia_marketing = vm['estrategia_marketing']
+        st.write(f"**Estratégia de Marketing:** {estrategia_marketing}")
+        st.write("**Vantagem Competitiva Sustentável:**")
+        st.write("• Especialização em atendimento consultivo")
+        st.write("• Parcerias exclusivas com fornecedores premium")
+        st.write("• Sistema de fidelização de clientes")
+        st.write("• Localização estratégica privilegiada")
+    
+    with tab5:
+        st.subheader("5. ANÁLISE FINANCEIRA DETALHADA")
+        
+        investimento_total = vm['investimento_total']
+        faturamento_anual = vm['faturamento_anual']
+        
+        st.markdown("### Investimento Inicial")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            reforma = vm['reforma_loja']
+            st.metric("Reforma", format_currency(reforma))
+        
+        with col2:
+            equipamentos = vm['equipamentos_moveis']
+            st.metric("Equipamentos", format_currency(equipamentos))
+        
+        with col3:
+            estoque = vm['estoque_inicial']
+            st.metric("Estoque Inicial", format_currency(estoque))
+        
+        with col4:
+            capital_giro = vm['capital_giro']
+            st.metric("Capital de Giro", format_currency(capital_giro))
+        
+        st.metric("**INVESTIMENTO TOTAL**", format_currency(investimento_total))
+        
+        st.markdown("### Projeções Financeiras")
+        
+        dre_data = vm['dre']
+        if dre_data:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**DRE Projetado (Mensal):**")
+                st.write(f"• Receita Bruta: {format_currency(dre_data['receita_bruta'])}")
+                st.write(f"• (-) Impostos: {format_currency(dre_data['impostos'])}")
+                st.write(f"• (-) CMV: {format_currency(dre_data['cmv'])}")
+                st.write(f"• Lucro Bruto: {format_currency(dre_data['lucro_bruto'])}")
+                st.write(f"• (-) Despesas Operacionais: {format_currency(dre_data['despesas_operacionais'])}")
+                st.markdown(f"**• Lucro Líquido: {format_currency(dre_data['lucro_liquido'])}**")
+            
+            with col2:
+                st.markdown("**Indicadores de Performance:**")
+                st.metric("Margem Bruta", f"{dre_data['margem_bruta']:.1f}%")
+                st.metric("Margem Líquida", f"{dre_data['margem_liquida']:.1f}%")
+                
+                if dre_data['roi_anual'] is not None:
+                    st.metric("ROI Anual", f"{dre_data['roi_anual']:.1f}%")
+                    st.metric("Payback", f"{dre_data['payback_anos']:.1f} anos")
+            
+            st.markdown("### Análise de Viabilidade")
+            st.write("**Pontos Fortes Financeiros:**")
+            st.write(f"• Margem líquida atrativa: {dre_data['margem_liquida']:.1f}%")
+            if dre_data['payback_anos'] is not None:
+                st.write(f"• Payback aceitável: {dre_data['payback_anos']:.1f} anos")
+            st.write("• Baixo investimento inicial comparado ao potencial de retorno")
+            st.write("• Fluxo de caixa positivo desde o primeiro ano")
+        else:
+            st.warning("Complete as Projeções Financeiras (Etapa 10) para análise detalhada")
+        
+        st.markdown("### Cenários e Riscos")
+        st.markdown("**Cenário Conservador:** Redução de 20% no faturamento")
+        st.markdown("**Cenário Realista:** Projeções apresentadas")
+        st.markdown("**Cenário Otimista:** Crescimento de 30% sobre as projeções")
+        
+        st.markdown("**Principais Riscos:**")
+        st.write("• Concorrência de grandes redes")
+        st.write("• Variações na economia local")
+        st.write("• Mudanças na legislação do setor")
+        st.write("• Dependência de fornecedores")
+        
+        st.markdown("**Mitigação de Riscos:**")
+        st.write("• Diversificação de fornecedores")
+        st.write("• Reserva de capital de giro")
+        st.write("• Foco em fidelização de clientes")
+        st.write("• Monitoramento constante do mercado")
+    
+    with tab6:
+        st.subheader("6. EQUIPE E GESTÃO")
+        
+        st.markdown("### Perfil do Empreendedor")
+        experiencia = vm['experiencia_setor']
+        st.write(f"**Experiência no Setor:** {experiencia}")
+        
+        motivacao = vm['motivacao']
+        st.write(f"**Motivação:** {motivacao}")
+        
+        st.markdown("### Estrutura Organizacional")
+        num_funcionarios = vm['num_funcionarios']
+        st.write(f"**Número de Funcionários:** {num_funcionarios}")
+        
+        # Mostrar estrutura de funcionários se disponível
+        if hasattr(st.session_state, 'funcionarios') and st.session_state.funcionarios:
+            st.markdown("**Equipe Planejada:**")
+            for func in st.session_state.funcionarios:
+                salario = func.get('salario_base', 0)
+                cargo = func.get('cargo', 'Não definido')
+                st.write(f"• {cargo}: R$ {salario:,.2f}")
+        
+        st.markdown("### Competências da Equipe")
+        st.write("**Competências Técnicas:**")
+        st.write("• Conhecimento em produtos ópticos")
+        st.write("• Atendimento ao cliente especializado")
+        st.write("• Gestão comercial e financeira")
+        st.write("• Marketing digital e relacionamento")
+        
+        st.markdown("### Necessidades de Contratação")
+        st.write("**Perfis Necessários:**")
+        st.write("• Vendedor especializado em produtos ópticos")
+        st.write("• Atendente com experiência em relacionamento")
+        st.write("• Suporte administrativo")
+        
+        st.markdown("### Plano de Crescimento da Equipe")
+        st.write("**Ano 1:** Equipe inicial para operação")
+        st.write("**Ano 2:** Expansão com vendedor adicional")
+        st.write("**Ano 3:** Supervisão e gestão especializada")
+    
+    with tab7:
+        st.subheader(t["download_complete"].replace("📄 ", ""))
+        
+        # Mostrar duas opções de relatório
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📄 Relatório Padrão Multilíngue")
+            if idioma == "English":
+                st.info("Complete investor report with multilingual support and professional formatting")
+            elif idioma == "Español":
+                st.info("Informe completo para inversores con soporte multilingüe y formato profesional")
+            else:
+                st.info("Relatório completo para investidores com suporte multilíngue e formatação profissional")
+        
+        with col2:
+            st.markdown("#### 📊 Relatório Estruturado Profissional")
+            if idioma == "English":
+                st.info("Industry-standard structured report with KPIs, financial analysis, and risk assessment")
+            elif idioma == "Español":
+                st.info("Informe estructurado estándar de la industria con KPIs, análisis financiero y evaluación de riesgos")
+            else:
+                st.info("Relatório estruturado padrão da indústria com KPIs, análise financeira e avaliação de riscos")
+        
+        # Botões lado a lado
+        col_btn1, col_btn2 = st.columns(2)
+        
+        # Nome do arquivo baseado no idioma
+        if idioma == "English":
+            filename = f"complete_investor_report_{nome_negocio.replace(' ', '_')}.pdf"
+            label = "📥 Download Complete Investor Report (PDF)"
+            error_message = "Error generating report"
+        elif idioma == "Español":
+            filename = f"informe_completo_inversores_{nome_negocio.replace(' ', '_')}.pdf"
+            label = "📥 Descargar Informe Completo para Inversores (PDF)"
+            error_message = "Error al generar informe"
+        else:
+            filename = f"relatorio_completo_investidores_{nome_negocio.replace(' ', '_')}.pdf"
+            label = "📥 Download Relatório Completo para Investidores (PDF)"
+            error_message = "Erro ao gerar relatório"
+        
+        with col_btn1:
+            if st.button(t["download_complete"], type="primary", key="standard_report"):
+                # Gerar PDF profissional multilíngue em segundo plano (ou servir do cache)
+                st.session_state.report_job_investidor = get_report_queue().submit(
+                    'investidor', st.session_state.business_data, idioma
+                )
+            
+            gerando_padrao = show_report_job(
+                'investidor', idioma, filename, label, t["download_success"], error_message
+            )
+        
+        with col_btn2:
+            # Botão para relatório estruturado profissional
+            if idioma == "English":
+                structured_label = "📊 Generate Professional Report"
+                structured_filename = f"structured_investor_report_{nome_negocio.replace(' ', '_')}.pdf"
+            elif idioma == "Español":
+                structured_label = "📊 Generar Informe Estructurado"
+                structured_filename = f"informe_estructurado_inversor_{nome_negocio.replace(' ', '_')}.pdf"
+            else:
+                structured_label = "📊 Gerar Relatório Estruturado"
+                structured_filename = f"relatorio_estruturado_investidor_{nome_negocio.replace(' ', '_')}.pdf"
+            
+            if idioma == "English":
+                structured_success = "Professional structured report generated successfully!"
+                structured_error = "Error generating structured report"
+            elif idioma == "Español":
+                structured_success = "¡Informe estructurado profesional generado exitosamente!"
+                structured_error = "Error al generar informe estructurado"
+            else:
+                structured_success = "Relatório estruturado profissional gerado com sucesso!"
+                structured_error = "Erro ao gerar relatório estruturado"
+            
+            if st.button(structured_label, type="secondary", key="structured_report"):
+                # Gerar relatório estruturado em segundo plano (ou servir do cache)
+                st.session_state.report_job_estruturado = get_report_queue().submit(
+                    'estruturado', st.session_state.business_data, idioma
+                )
+            
+            gerando_estruturado = show_report_job(
+                'estruturado', idioma, structured_filename,
+                f"📥 Download {structured_label.replace('📊 Gerar ', '').replace('📊 Generate ', '').replace('📊 Generar ', '')}",
+                structured_success, structured_error
+            )
+        
+        # Pacote com o relatório nos três idiomas (ZIP)
+        if idioma == "English":
+            bundle_label = "📦 Generate PT/EN/ES Bundle (ZIP)"
+            bundle_download = "📥 Download Report Bundle (ZIP)"
+            bundle_success = "Report bundle generated successfully!"
+            bundle_error = "Error generating report bundle"
+        elif idioma == "Español":
+            bundle_label = "📦 Generar Paquete PT/EN/ES (ZIP)"
+            bundle_download = "📥 Descargar Paquete de Informes (ZIP)"
+            bundle_success = "¡Paquete de informes generado exitosamente!"
+            bundle_error = "Error al generar paquete de informes"
+        else:
+            bundle_label = "📦 Gerar Pacote PT/EN/ES (ZIP)"
+            bundle_download = "📥 Download Pacote de Relatórios (ZIP)"
+            bundle_success = "Pacote de relatórios gerado com sucesso!"
+            bundle_error = "Erro ao gerar pacote de relatórios"
+        
+        if st.button(bundle_label, key="bundle_report"):
+            # Números calculados uma vez; os três idiomas são renderizados em paralelo
+            st.session_state.report_job_pacote = get_report_queue().submit(
+                'pacote', st.session_state.business_data, idioma
+            )
+        
+        gerando_pacote = show_report_job(
+            'pacote', idioma, f"relatorios_investidores_{nome_negocio.replace(' ', '_')}.zip",
+            bundle_download, bundle_success, bundle_error, mime="application/zip"
+        )
+        
+        # Checklist "Resposta ao Investidor" em Markdown (seções já renderizadas para este plano)
+        st.download_button(
+            label="📝 Download Resposta ao Investidor (Markdown)",
+            data=secoes.markdown(),
+            file_name=f"resposta_investidor_{nome_negocio.replace(' ', '_')}.md",
+            mime="text/markdown",
+            key="investor_markdown_download"
+        )
+        
+        # Versão texto para compatibilidade (opcional)
+        if st.checkbox("Incluir versão texto", key="include_text_version"):
+            # Gerar versão texto para compatibilidade
+            if idioma == "English":
+                    relatorio_expandido = f"""
+COMPLETE INVESTOR REPORT
+{nome_negocio}
+Date: {datetime.now().strftime('%m/%d/%Y')}
+
+═══════════════════════════════════════════════════════════════
+
+1. PURPOSE AND PROBLEM
+
+Identified Problem:
+{st.session_state.business_data.get('problema_mercado', 'Difficulty accessing quality optical products with personalized service')}
+
+Market Validation:
+• Optical market growth: 8% annually
+• Population aging increasing demand
+• Intensive use of digital screens
+• Target audience: {st.session_state.business_data.get('publico_alvo', 'Not defined')}
+
+═══════════════════════════════════════════════════════════════
+
+2. SOLUTION AND VALUE PROPOSITION
+
+Value Proposition:
+{st.session_state.business_data.get('proposta_valor', 'Not defined')}
+
+Products and Services:
+{st.session_state.business_data.get('produtos_servicos', 'Complete optical products with specialized service')}
+
+Competitive Advantage:
+• Personalized and consultative service
+• Privileged strategic location
+• Close customer relationships
+• Delivery speed
+
+═══════════════════════════════════════════════════════════════
+
+3. MARKET AND OPPORTUNITY
+
+Location: {cidade}, {estado}
+
+Market Size:
+• TAM (Brazil): R$ 4.2 billion
+• SAM (Regional): R$ {vm['mercado_sam']:,.0f}
+• SOM (Obtainable): R$ {vm['mercado_som']:,.0f}
+
+Sector Trends:
+• Average annual growth: 8%
+• Population aging: +60 years growing 4% annually
+• Digitalization: 40% increase in vision problems
+
+═══════════════════════════════════════════════════════════════
+
+4. FINANCIAL ANALYSIS
+
+Initial Investment:
+• Renovation: R$ {vm['reforma_loja']:,.2f}
+• Equipment: R$ {vm['equipamentos_moveis']:,.2f}
+• Initial Stock: R$ {vm['estoque_inicial']:,.2f}
+• Working Capital: R$ {vm['capital_giro']:,.2f}
+TOTAL: R$ {investimento_total:,.2f}
+
+Annual Projections:
+• Revenue: R$ {faturamento_anual:,.2f}
+• Average Ticket: R$ {vm['ticket_medio']:,.2f}
+
+═══════════════════════════════════════════════════════════════
+
+5. TEAM AND MANAGEMENT
+
+Entrepreneur Experience:
+{st.session_state.business_data.get('experiencia_setor', 'Not informed')}
+
+Organizational Structure:
+• Employees: {num_funcionarios}
+• Payroll: R$ {vm['salarios_total']:,.2f}
+
+═══════════════════════════════════════════════════════════════
+
+6. CONCLUSION AND RECOMMENDATION
+
+Investment Strengths:
+• Constantly growing market
+• Low initial investment
+• Strategic location
+• Entrepreneur experience
+• Proven business model
+
+Identified Risks:
+• Competition from large chains
+• Local economy dependence
+• Market seasonality
+
+Recommendation:
+RECOMMENDED investment based on complete market analysis,
+financial viability and entrepreneur profile.
+
+═══════════════════════════════════════════════════════════════
+                    """
+            elif idioma == "Español":
+                    relatorio_expandido = f"""
+INFORME COMPLETO PARA INVERSORES
+{nome_negocio}
+Fecha: {datetime.now().strftime('%d/%m/%Y')}
+
+═══════════════════════════════════════════════════════════════
+
+1. PROPÓSITO Y PROBLEMA
+
+Problema Identificado:
+{st.session_state.business_data.get('problema_mercado', 'Dificultad para acceder a productos ópticos de calidad con atención personalizada')}
+
+Validación del Mercado:
+• Crecimiento del mercado óptico: 8% anual
+• Envejecimiento poblacional aumentando demanda
+• Uso intensivo de pantallas digitales
+• Público objetivo: {st.session_state.business_data.get('publico_alvo', 'No definido')}
+
+═══════════════════════════════════════════════════════════════
+
+2. SOLUCIÓN Y PROPUESTA DE VALOR
+
+Propuesta de Valor:
+{st.session_state.business_data.get('proposta_valor', 'No definida')}
+
+Productos y Servicios:
+{st.session_state.business_data.get('produtos_servicos', 'Productos ópticos completos con atención especializada')}
+
+Ventaja Competitiva:
+• Atención personalizada y consultiva
+• Ubicación estratégica privilegiada
+• Relación cercana con clientes
+• Rapidez en la entrega
+
+═══════════════════════════════════════════════════════════════
+
+3. MERCADO Y OPORTUNIDAD
+
+Ubicación: {cidade}, {estado}
+
+Tamaño del Mercado:
+• TAM (Brasil): R$ 4,2 mil millones
+• SAM (Regional): R$ {vm['mercado_sam']:,.0f}
+• SOM (Obtenible): R$ {vm['mercado_som']:,.0f}
+
+Tendencias del Sector:
+• Crecimiento promedio anual: 8%
+• Envejecimiento poblacional: +60 años creciendo 4% anual
+• Digitalización: aumento del 40% en problemas de visión
+
+═══════════════════════════════════════════════════════════════
+
+4. ANÁLISIS FINANCIERO
+
+Inversión Inicial:
+• Renovación: R$ {vm['reforma_loja']:,.2f}
+• Equipos: R$ {vm['equipamentos_moveis']:,.2f}
+• Stock Inicial: R$ {vm['estoque_inicial']:,.2f}
+• Capital de Trabajo: R$ {vm['capital_giro']:,.2f}
+TOTAL: R$ {investimento_total:,.2f}
+
+Proyecciones Anuales:
+• Facturación: R$ {faturamento_anual:,.2f}
+• Ticket Promedio: R$ {vm['ticket_medio']:,.2f}
+
+═══════════════════════════════════════════════════════════════
+
+5. EQUIPO Y GESTIÓN
+
+Experiencia del Emprendedor:
+{st.session_state.business_data.get('experiencia_setor', 'No informada')}
+
+Estructura Organizacional:
+• Empleados: {num_funcionarios}
+• Nómina: R$ {vm['salarios_total']:,.2f}
+
+═══════════════════════════════════════════════════════════════
+
+6. CONCLUSIÓN Y RECOMENDACIÓN
+
+Fortalezas de la Inversión:
+• Mercado en crecimiento constante
+• Baja inversión inicial
+• Ubicación estratégica
+• Experiencia del emprendedor
+• Modelo de negocio comprobado
+
+Riesgos Identificados:
+• Competencia de grandes cadenas
+• Dependencia de la economía local
+• Estacionalidad del mercado
+
+Recomendación:
+Inversión RECOMENDADA basada en análisis completo del mercado,
+viabilidad financiera y perfil del emprendedor.
+
+═══════════════════════════════════════════════════════════════
+                    """
+            else:  # Português
+                    relatorio_expandido = f"""
+RELATÓRIO COMPLETO PARA INVESTIDORES
+{nome_negocio}
+Data: {datetime.now().strftime('%d/%m/%Y')}
+
+═══════════════════════════════════════════════════════════════
+
+1. PROPÓSITO E PROBLEMA
+
+Problema Identificado:
+{st.session_state.business_data.get('problema_mercado', 'Dificuldade de acesso a produtos ópticos de qualidade com atendimento personalizado')}
+
+Validação do Mercado:
+• Crescimento do mercado óptico: 8% ao ano
+• Envelhecimento populacional aumentando demanda
+• Uso intensivo de telas digitais
+• Público-alvo: {vm['publico_alvo']}
+
+═══════════════════════════════════════════════════════════════
+
+2. SOLUÇÃO E PROPOSTA DE VALOR
+
+Proposta de Valor:
+{vm['proposta_valor']}
+
+Produtos e Serviços:
+{st.session_state.business_data.get('produtos_servicos', 'Produtos ópticos completos com atendimento especializado')}
+
+Diferencial Competitivo:
+• Atendimento personalizado e consultivo
+• Localização estratégica privilegiada
+• Relacionamento próximo com clientes
+• Agilidade na entrega
+
+═══════════════════════════════════════════════════════════════
+
+3. MERCADO E OPORTUNIDADE
+
+Localização: {cidade}, {estado}
+
+Tamanho de Mercado:
+• TAM (Brasil): R$ 4,2 bilhões
+• SAM (Regional): R$ {vm['mercado_sam']:,.0f}
+• SOM (Obtível): R$ {vm['mercado_som']:,.0f}
+
+Tendências do Setor:
+• Crescimento médio anual: 8%
+• Envelhecimento populacional: +60 anos crescendo 4% ao ano
+• Digitalização: aumento de 40% em problemas de visão
+
+═══════════════════════════════════════════════════════════════
+
+4. ANÁLISE FINANCEIRA
+
+Investimento Inicial:
+• Reforma: R$ {vm['reforma_loja']:,.2f}
+• Equipamentos: R$ {vm['equipamentos_moveis']:,.2f}
+• Estoque: R$ {vm['estoque_inicial']:,.2f}
+• Capital de Giro: R$ {vm['capital_giro']:,.2f}
+TOTAL: R$ {investimento_total:,.2f}
+
+Projeções Anuais:
+• Faturamento: R$ {faturamento_anual:,.2f}
+• Ticket Médio: R$ {vm['ticket_medio']:,.2f}
+
+═══════════════════════════════════════════════════════════════
+
+5. EQUIPE E GESTÃO
+
+Experiência do Empreendedor:
+{vm['experiencia_setor']}
+
+Estrutura Organizacional:
+• Funcionários: {num_funcionarios}
+• Folha de Pagamento: R$ {vm['salarios_total']:,.2f}
+
+═══════════════════════════════════════════════════════════════
+
+6. CONCLUSÃO E RECOMENDAÇÃO
+
+Pontos Fortes do Investimento:
+• Mercado em crescimento constante
+• Baixo investimento inicial
+• Localização estratégica
+• Experiência do empreendedor
+• Modelo de negócio comprovado
+
+Riscos Identificados:
+• Concorrência de grandes redes
+• Dependência da economia local
+• Sazonalidade do mercado
+
+Recomendação:
+Investimento RECOMENDADO com base na análise completa do mercado,
+viabilidade financeira e perfil do empreendedor.
+
+═══════════════════════════════════════════════════════════════
+                    """
+                
+            # Botão adicional para versão texto (compatibilidade)
+            st.markdown("---")
+            
+            if idioma == "English":
+                filename_txt = f"complete_investor_report_{nome_negocio.replace(' ', '_')}.txt"
+                label_txt = "📄 Download Text Version"
+            elif idioma == "Español":
+                filename_txt = f"informe_completo_inversores_{nome_negocio.replace(' ', '_')}.txt"
+                label_txt = "📄 Descargar Versión Texto"
+            else:
+                filename_txt = f"relatorio_completo_investidores_{nome_negocio.replace(' ', '_')}.txt"
+                label_txt = "📄 Download Versão Texto"
+            
+            st.download_button(
+                label=label_txt,
+                data=relatorio_expandido,
+                file_name=filename_txt,
+                mime="text/plain"
+            )
+            
+            # Mostrar prévia do conteúdo
+            with st.expander(t["download_preview"]):
+                if idioma == "English":
+                    st.info("PDF contains professional formatting with charts, tables, and executive layout")
+                elif idioma == "Español":
+                    st.info("El PDF contiene formato profesional con gráficos, tablas y diseño ejecutivo")
+                else:
+                    st.info("O PDF contém formatação profissional com gráficos, tabelas e layout executivo")
+                
+                st.text(relatorio_expandido[:2000] + "..." if len(relatorio_expandido) > 2000 else relatorio_expandido)
+        
+        st.markdown("---")
+        if idioma == "English":
+            st.markdown("**Important:** This report answers the complete investor checklist:")
+            st.write("✓ Purpose and problem clearly defined")
+            st.write("✓ Detailed solution and value proposition")
+            st.write("✓ Complete market and opportunity analysis")
+            st.write("✓ Competition study and positioning")
+            st.write("✓ Realistic financial projections")
+            st.write("✓ Team profile and competencies")
+            st.write("✓ Risk analysis and mitigation")
+            st.write("✓ Substantiated recommendation")
+        elif idioma == "Español":
+            st.markdown("**Importante:** Este informe responde al checklist completo para inversores:")
+            st.write("✓ Propósito y problema claramente definidos")
+            st.write("✓ Solución y propuesta de valor detalladas")
+            st.write("✓ Análisis completo de mercado y oportunidad")
+            st.write("✓ Estudio de competencia y posicionamiento")
+            st.write("✓ Proyecciones financieras realistas")
+            st.write("✓ Perfil del equipo y competencias")
+            st.write("✓ Análisis de riesgos y mitigación")
+            st.write("✓ Recomendación fundamentada")
+        else:
+            st.markdown("**Importante:** Este relatório responde ao checklist completo para investidores:")
+            st.write("✓ Propósito e problema claramente definidos")
+            st.write("✓ Solução e proposta de valor detalhadas")
+            st.write("✓ Análise completa de mercado e oportunidade")
+            st.write("✓ Estudo da concorrência e posicionamento")
+            st.write("✓ Projeções financeiras realistas")
+            st.write("✓ Perfil da equipe e competências")
+            st.write("✓ Análise de riscos e mitigação")
+            st.write("✓ Recomendação fundamentada")
+        
+        # Enquanto houver relatório sendo gerado, atualiza a página para acompanhar o progresso
+        if gerando_padrao or gerando_estruturado or gerando_pacote:
+            time.sleep(0.5)
+            st.rerun()
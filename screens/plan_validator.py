@@ -0,0 +1,1041 @@
+"""
+Ferramenta Validador do Plano
+Verificação de consistência e completude das 12 etapas
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency
+
+
+def show_plan_validator_tool():
+    """Validador do Plano - Auditoria Completa do Plano de Negócios"""
+    
+    # Header with back button
+    col1, col2 = st.columns([1, 6])
+    with col1:
+        if st.button("⬅️ Voltar", key="back_plan_validator"):
+            st.session_state.show_plan_validator = False
+            st.rerun()
+    
+    with col2:
+        st.title("🔍 Validador do Plano de Negócios")
+        st.markdown("**Auditoria completa - verifica se seu plano está consistente e completo**")
+    
+    # Contadores de status
+    total_checks = 0
+    passed_checks = 0
+    warnings = 0
+    errors = 0
+    
+    # Lista de validações
+    validations = []
+    
+    # 1. VALIDAÇÃO BÁSICA DO NEGÓCIO
+    st.subheader("📋 1. Informações Básicas do Negócio")
+    
+    # Verificar múltiplas possíveis chaves para nome da empresa
+    nome_empresa = (st.session_state.business_data.get('nome_otica', '') or 
+                   st.session_state.business_data.get('nome_negocio', '') or 
+                   st.session_state.business_data.get('nome_empresa', ''))
+    
+    if nome_empresa and len(nome_empresa.strip()) > 3:
+        validations.append({
+            "status": "✅", 
+            "item": "Nome da empresa definido", 
+            "details": f"'{nome_empresa}'",
+            "sugestao": "Nome adequado para identificação comercial"
+        })
+        passed_checks += 1
+    elif nome_empresa and len(nome_empresa.strip()) > 0:
+        validations.append({
+            "status": "⚠️", 
+            "item": "Nome da empresa muito curto", 
+            "details": f"'{nome_empresa}' tem apenas {len(nome_empresa.strip())} caracteres",
+            "sugestao": "AÇÃO: Vá para Etapa 1 → Campo 'Nome da Ótica' e digite um nome mais descritivo com pelo menos 4 caracteres. Ex: 'Ótica Vision', 'Ótica Central' ou 'Óptica do Bairro'"
+        })
+        warnings += 1
+    else:
+        validations.append({
+            "status": "❌", 
+            "item": "Nome da empresa não definido", 
+            "details": "Campo obrigatório vazio",
+            "sugestao": "AÇÃO CRÍTICA: Vá para Etapa 1 → Sumário Executivo → Campo 'Nome da Ótica' e defina o nome comercial. Este será o nome usado em contratos, notas fiscais e documentos oficiais."
+        })
+        errors += 1
+    total_checks += 1
+    
+    missao = st.session_state.business_data.get('missao', '')
+    if missao and len(missao) > 20:
+        validations.append({"status": "✅", "item": "Missão da empresa definida", "details": f"{len(missao)} caracteres"})
+        passed_checks += 1
+    else:
+        validations.append({"status": "⚠️", "item": "Missão muito curta ou não definida", "details": "Recomendado pelo menos 20 caracteres"})
+        warnings += 1
+    total_checks += 1
+    
+    # **VALIDAÇÃO TRIBUTÁRIA CRÍTICA** - Prioridade máxima
+    st.subheader("🚨 Validação Tributária Crítica")
+    
+    tipo_empresa = st.session_state.business_data.get('tipo_empresa', 'MEI')
+    objetivo_faturamento = st.session_state.business_data.get('objetivo_faturamento', 0)
+    receita_anual = objetivo_faturamento * 12
+    funcionarios_count = len(st.session_state.business_data.get('funcionarios_planejados', []))
+    
+    # Validações MEI
+    if tipo_empresa == 'MEI':
+        col_mei1, col_mei2 = st.columns(2)
+        
+        with col_mei1:
+            st.markdown("**Limites MEI:**")
+            if receita_anual > 81000:
+                validations.append({
+                    "status": "❌", 
+                    "item": "ERRO CRÍTICO: Receita MEI excedida", 
+                    "details": f"R$ {receita_anual:,.0f} > R$ 81.000 (limite MEI)",
+                    "sugestao": "AÇÃO URGENTE: Vá para Etapa 1 → Altere 'Tipo de empresa' para 'Microempresa' OU reduza meta de faturamento para R$ 6.750/mês"
+                })
+                errors += 1
+            else:
+                validations.append({
+                    "status": "✅", 
+                    "item": "Receita MEI dentro do limite", 
+                    "details": f"R$ {receita_anual:,.0f} ≤ R$ 81.000"
+                })
+                passed_checks += 1
+            total_checks += 1
+            
+            if funcionarios_count > 1:
+                validations.append({
+                    "status": "❌", 
+                    "item": "ERRO CRÍTICO: Funcionários MEI excedidos", 
+                    "details": f"{funcionarios_count} funcionários > 1 (limite MEI)",
+                    "sugestao": "AÇÃO URGENTE: Vá para Etapa 8 → Reduza para 1 funcionário OU altere regime para 'Microempresa'"
+                })
+                errors += 1
+            else:
+                validations.append({
+                    "status": "✅", 
+                    "item": "Funcionários MEI dentro do limite", 
+                    "details": f"{funcionarios_count} ≤ 1 funcionário"
+                })
+                passed_checks += 1
+            total_checks += 1
+        
+        with col_mei2:
+            st.markdown("**Quanto você vai pagar de impostos no MEI:**")
+            # Valores corretos MEI 2025: Óticas são comércio = R$ 76,90
+            custo_mei_mes = 76.90  # R$ 75,90 INSS + R$ 1,00 ICMS (comércio)
+            custo_mei_anual = custo_mei_mes * 12
+            perc_sobre_receita = (custo_mei_anual / receita_anual * 100) if receita_anual > 0 else 0
+            
+            # Formato claro: valor + explicação detalhada
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, #e8f5e8, #f0f8f0);
+                padding: 1.5rem;
+                border-radius: 12px;
+                border-left: 4px solid #28a745;
+                margin: 1rem 0;
+            ">
+                <div style="font-size: 1.1rem; font-weight: bold; color: #155724; margin-bottom: 0.5rem;">
+                    Você paga por mês (MEI Comércio)
+                </div>
+                <div style="font-size: 2rem; font-weight: bold; color: #28a745; margin-bottom: 1rem;">
+                    R$ {custo_mei_mes:.2f}
+                </div>
+                <div style="font-size: 1rem; font-weight: bold; color: #155724; margin-bottom: 0.5rem;">
+                    Porque?:
+                </div>
+                <div style="color: #155724; line-height: 1.5;">
+                    • <strong>É um valor fixo:</strong> Você paga sempre os mesmos R$ {custo_mei_mes:.2f}, mesmo que venda R$ 1.000 ou R$ 6.000 no mês<br>
+                    • <strong>Composição do DAS:</strong> INSS R$ 75,90 + ICMS R$ 1,00 (ótica é comércio)<br>
+                    • <strong>Sem surpresas:</strong> Não precisa calcular percentual sobre vendas, sempre o mesmo valor<br>
+                    • <strong>Muito barato:</strong> Representa apenas {perc_sobre_receita:.2f}% do que você fatura
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Comparar com Simples Nacional
+            if receita_anual > 0:
+                custo_simples_anual = receita_anual * 0.04  # 4% primeira faixa
+                custo_simples_mes = custo_simples_anual / 12
+                diferenca_anual = custo_simples_anual - custo_mei_anual
+                
+                st.markdown(f"""
+                <div style="
+                    background: linear-gradient(135deg, #fff3cd, #ffeaa7);
+                    padding: 1.5rem;
+                    border-radius: 12px;
+                    border-left: 4px solid #ffc107;
+                    margin: 1rem 0;
+                ">
+                    <div style="font-size: 1.1rem; font-weight: bold; color: #856404; margin-bottom: 0.5rem;">
+                        Se fosse Microempresa (Simples Nacional)
+                    </div>
+                    <div style="font-size: 1.8rem; font-weight: bold; color: #ffc107; margin-bottom: 1rem;">
+                        R$ {custo_simples_mes:.2f}/mês
+                    </div>
+                    <div style="font-size: 1rem; font-weight: bold; color: #856404; margin-bottom: 0.5rem;">
+                        Porque?:
+                    </div>
+                    <div style="color: #856404; line-height: 1.5;">
+                        • <strong>Baseado nas vendas:</strong> Você pagaria 4% de tudo que vender<br>
+                        • <strong>Varia todo mês:</strong> Vendeu mais = paga mais impostos<br>
+                        • <strong>Diferença anual:</strong> R$ {diferenca_anual:,.0f} {"a mais" if diferenca_anual > 0 else "a menos"} que o MEI<br>
+                        • <strong>Conclusão:</strong> {"MEI é mais barato para seu faturamento" if diferenca_anual > 0 else "Microempresa seria mais cara"}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # Validações Simples Nacional
+    elif tipo_empresa in ['Microempresa', 'Empresa de Pequeno Porte']:
+        st.markdown("**Verificando se sua empresa pode usar Simples Nacional:**")
+        
+        if receita_anual > 4800000:
+            validations.append({
+                "status": "❌", 
+                "item": "PROBLEMA: Sua empresa cresceu demais para o Simples Nacional", 
+                "details": f"Você fatura R$ {receita_anual:,.0f} por ano, mas o limite é R$ 4.800.000",
+                "sugestao": "O QUE FAZER: Procure um contador para mudar para Lucro Presumido. É mais caro, mas é obrigatório."
+            })
+            errors += 1
+        else:
+            # Calcular alíquota correta
+            if receita_anual <= 180000:
+                aliquota_correta = 4.0
+                faixa_explicacao = "faturamento baixo"
+            elif receita_anual <= 360000:
+                aliquota_correta = 5.47
+                faixa_explicacao = "faturamento médio-baixo"
+            elif receita_anual <= 720000:
+                aliquota_correta = 6.84
+                faixa_explicacao = "faturamento médio"
+            else:
+                aliquota_correta = 8.0
+                faixa_explicacao = "faturamento alto"
+            
+            impostos_atual = st.session_state.business_data.get('impostos_percentual', 6.0)
+            
+            col_sn1, col_sn2 = st.columns(2)
+            with col_sn1:
+                validations.append({
+                    "status": "✅", 
+                    "item": f"Você pode usar {tipo_empresa}", 
+                    "details": f"Seu faturamento é considerado {faixa_explicacao} (taxa de {aliquota_correta}%)"
+                })
+                passed_checks += 1
+                
+            with col_sn2:
+                # Cálculo do que vai pagar no Simples Nacional
+                custo_mensal_simples = (receita_anual * aliquota_correta / 100) / 12
+                
+                st.markdown(f"""
+                <div style="
+                    background: linear-gradient(135deg, #e3f2fd, #bbdefb);
+                    padding: 1.5rem;
+                    border-radius: 12px;
+                    border-left: 4px solid #2196f3;
+                    margin: 1rem 0;
+                ">
+                    <div style="font-size: 1.1rem; font-weight: bold; color: #0d47a1; margin-bottom: 0.5rem;">
+                        Você paga por mês no Simples Nacional
+                    </div>
+                    <div style="font-size: 2rem; font-weight: bold; color: #2196f3; margin-bottom: 1rem;">
+                        R$ {custo_mensal_simples:.2f}
+                    </div>
+                    <div style="font-size: 1rem; font-weight: bold; color: #0d47a1; margin-bottom: 0.5rem;">
+                        Porque?:
+                    </div>
+                    <div style="color: #0d47a1; line-height: 1.5;">
+                        • <strong>Taxa de {aliquota_correta}%:</strong> Você paga {aliquota_correta}% de tudo que vender<br>
+                        • <strong>Seu faturamento é {faixa_explicacao}:</strong> R$ {receita_anual:,.0f}/ano = faixa de {aliquota_correta}%<br>
+                        • <strong>Varia com as vendas:</strong> Vendeu R$ 10.000 = paga R$ {10000 * aliquota_correta / 100:.0f}<br>
+                        • <strong>Inclui vários impostos:</strong> IRPJ, CSLL, PIS, COFINS, ICMS, ISS em uma guia só
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Validação da taxa configurada (mais flexível)
+                diferenca_impostos = abs(impostos_atual - aliquota_correta)
+                if diferenca_impostos > 3.0:
+                    validations.append({
+                        "status": "⚠️", 
+                        "item": "Taxa de impostos muito diferente do padrão", 
+                        "details": f"Você configurou {impostos_atual}%, padrão seria {aliquota_correta}% (diferença: {diferenca_impostos:.1f}%)",
+                        "sugestao": f"INFORMATIVO: Se tem certeza do valor, mantenha. Se não, considere {aliquota_correta}% ou consulte contador"
+                    })
+                    warnings += 1
+                else:
+                    validations.append({
+                        "status": "✅", 
+                        "item": "Taxa de impostos configurada", 
+                        "details": f"{impostos_atual}% (padrão seria {aliquota_correta}% - diferença aceitável)"
+                    })
+                    passed_checks += 1
+                total_checks += 1
+        total_checks += 1
+    
+    # Validações Lucro Presumido
+    elif tipo_empresa in ['Ltda', 'Outro']:
+        st.markdown("**Verificando impostos para empresa comum (Lucro Presumido):**")
+        impostos_atual = st.session_state.business_data.get('impostos_percentual', 6.0)
+        
+        # Lucro Presumido típico: 13.33% (IR+CSLL+PIS+COFINS+ICMS/ISS)
+        st.info("💡 Empresas normais (Ltda) pagam mais impostos que MEI ou Simples Nacional")
+        
+        if impostos_atual < 10.0:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Sua taxa de impostos parece muito baixa", 
+                "details": f"Você configurou {impostos_atual}%, mas empresas normais pagam entre 13-15%",
+                "sugestao": "O QUE FAZER: Vá na Etapa 10 → Mude 'Impostos' para 13-15%. Converse com um contador para confirmar."
+            })
+            warnings += 1
+        else:
+            validations.append({
+                "status": "✅", 
+                "item": "Sua taxa de impostos está dentro do esperado", 
+                "details": f"{impostos_atual}% é uma taxa típica para empresas comuns"
+            })
+            passed_checks += 1
+        total_checks += 1
+    
+    st.markdown("---")
+    
+    # 2. VALIDAÇÃO FINANCEIRA
+    st.subheader("💰 2. Estrutura Financeira")
+    
+    vendas_mes_1 = st.session_state.business_data.get('vendas_mes_1', 0)
+    if vendas_mes_1 > 5000:
+        validations.append({"status": "✅", "item": "Meta de faturamento definida", "details": f"{format_currency(vendas_mes_1)}/mês"})
+        passed_checks += 1
+    else:
+        validations.append({"status": "❌", "item": "Meta de faturamento muito baixa ou não definida", "details": "Defina na Etapa 10"})
+        errors += 1
+    total_checks += 1
+    
+    investimento_total = st.session_state.business_data.get('investimento_total', 0)
+    capital_giro = st.session_state.business_data.get('capital_giro', 0)
+    if investimento_total > 0 and capital_giro > 0:
+        ratio_giro = (capital_giro / investimento_total) * 100
+        if ratio_giro >= 15:
+            validations.append({"status": "✅", "item": "Capital de giro adequado", "details": f"{ratio_giro:.1f}% do investimento total"})
+            passed_checks += 1
+        else:
+            validations.append({"status": "⚠️", "item": "Capital de giro pode ser insuficiente", "details": f"Apenas {ratio_giro:.1f}% do investimento"})
+            warnings += 1
+    else:
+        validations.append({"status": "❌", "item": "Investimento inicial não definido", "details": "Configure na Etapa 9"})
+        errors += 1
+    total_checks += 1
+    
+    # 3. VALIDAÇÕES MATEMÁTICAS AVANÇADAS
+    st.subheader("🧮 3. Validações Matemáticas e Financeiras")
+    
+    # 3.1 VALIDAÇÃO DE FOLHA DE PAGAMENTO
+    funcionarios_dp = st.session_state.business_data.get('funcionarios_dp', [])
+    salarios_total = st.session_state.business_data.get('salarios_total', 0)
+    folha_clt = st.session_state.business_data.get('folha_clt', 0)
+    total_optometrista = st.session_state.business_data.get('total_optometrista', 0)
+    
+    if funcionarios_dp:
+        # Calcular folha real baseada nos funcionários cadastrados
+        folha_calculada_clt = 0
+        folha_calculada_terceiros = 0
+        
+        for func in funcionarios_dp:
+            salario_base = func.get('salario_base', 0)
+            tipo_contrato = func.get('tipo_contrato', 'CLT')
+            
+            if tipo_contrato == 'CLT':
+                # CLT com encargos de 68%
+                custo_total = salario_base * 1.68
+                folha_calculada_clt += custo_total
+            else:
+                # MEI/Prestador sem encargos
+                folha_calculada_terceiros += salario_base
+        
+        # Comparar com valores informados nas projeções
+        if abs(folha_clt - folha_calculada_clt) < 100:  # Tolerância de R$ 100
+            validations.append({
+                "status": "✅", 
+                "item": "Folha CLT consistente", 
+                "details": f"Calculado: {format_currency(folha_calculada_clt)} = Informado: {format_currency(folha_clt)}",
+                "sugestao": "Valores de folha CLT estão corretos com encargos de 68%"
+            })
+            passed_checks += 1
+        else:
+            validations.append({
+                "status": "❌", 
+                "item": "Divergência na folha CLT", 
+                "details": f"Calculado: {format_currency(folha_calculada_clt)} ≠ Informado: {format_currency(folha_clt)}",
+                "sugestao": "AÇÃO: Vá para Etapa 10 → Folha CLT ou DP e Tributação para sincronizar os valores. A diferença pode indicar erro nos encargos (68%) ou funcionários não incluídos."
+            })
+            errors += 1
+        total_checks += 1
+        
+        if abs(total_optometrista - folha_calculada_terceiros) < 50:
+            validations.append({
+                "status": "✅", 
+                "item": "Serviços terceirizados consistentes", 
+                "details": f"Calculado: {format_currency(folha_calculada_terceiros)} = Informado: {format_currency(total_optometrista)}"
+            })
+            passed_checks += 1
+        else:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Divergência em serviços terceirizados", 
+                "details": f"Calculado: {format_currency(folha_calculada_terceiros)} ≠ Informado: {format_currency(total_optometrista)}",
+                "sugestao": "AÇÃO: Verifique na Etapa 10 se os valores de prestadores/MEI estão corretos (sem encargos)"
+            })
+            warnings += 1
+        total_checks += 1
+    else:
+        validations.append({
+            "status": "⚠️", 
+            "item": "Nenhum funcionário cadastrado no DP", 
+            "details": "Não é possível validar cálculos de folha",
+            "sugestao": "AÇÃO: Acesse DP e Tributação para cadastrar funcionários ou Etapa 8 para planejar equipe"
+        })
+        warnings += 1
+        total_checks += 1
+    
+    # 3.2 VALIDAÇÃO DE FATURAMENTO E TICKET MÉDIO
+    ticket_medio = st.session_state.business_data.get('ticket_medio', 0)
+    ticket_medio_esperado = st.session_state.business_data.get('ticket_medio_esperado', 0)
+    clientes_mes = st.session_state.business_data.get('clientes_mes', 0)
+    
+    if ticket_medio > 0 and clientes_mes > 0:
+        faturamento_calculado = ticket_medio * clientes_mes
+        if vendas_mes_1 > 0:
+            diferenca_faturamento = abs(faturamento_calculado - vendas_mes_1)
+            tolerancia = vendas_mes_1 * 0.05  # 5% de tolerância
+            
+            if diferenca_faturamento <= tolerancia:
+                validations.append({
+                    "status": "✅", 
+                    "item": "Faturamento matematicamente correto", 
+                    "details": f"{format_currency(ticket_medio)} × {clientes_mes} clientes = {format_currency(faturamento_calculado)}",
+                    "sugestao": "Cálculo: Ticket médio × Clientes/mês está consistente"
+                })
+                passed_checks += 1
+            else:
+                validations.append({
+                    "status": "❌", 
+                    "item": "Erro matemático no faturamento", 
+                    "details": f"Calculado: {format_currency(faturamento_calculado)} ≠ Informado: {format_currency(vendas_mes_1)}",
+                    "sugestao": "AÇÃO CRÍTICA: Vá para Etapa 10 → Corrija a fórmula: Faturamento = Ticket médio × Número de clientes. Valores devem ser consistentes."
+                })
+                errors += 1
+        total_checks += 1
+    
+    # Verificar consistência entre tickets médios de diferentes etapas
+    if ticket_medio > 0 and ticket_medio_esperado > 0:
+        if abs(ticket_medio - ticket_medio_esperado) < 50:
+            validations.append({
+                "status": "✅", 
+                "item": "Ticket médio sincronizado entre etapas", 
+                "details": f"Etapa 3: {format_currency(ticket_medio_esperado)} = Etapa 10: {format_currency(ticket_medio)}"
+            })
+            passed_checks += 1
+        else:
+            validations.append({
+                "status": "❌", 
+                "item": "Tickets médios divergentes entre etapas", 
+                "details": f"Etapa 3: {format_currency(ticket_medio_esperado)} ≠ Etapa 10: {format_currency(ticket_medio)}",
+                "sugestao": "AÇÃO: Sincronize os valores na Etapa 3 (Ticket médio esperado) e Etapa 10 (Projeções). Devem ser iguais."
+            })
+            errors += 1
+        total_checks += 1
+    
+    # 3.3 VALIDAÇÃO DE ENCARGOS E TRIBUTAÇÃO
+    regime_tributario = st.session_state.business_data.get('regime_tributario', '')
+    if regime_tributario and vendas_mes_1 > 0:
+        if regime_tributario == 'Simples Nacional':
+            # Simples Nacional - verificar alíquota
+            anexo = st.session_state.business_data.get('anexo_simples', 'Anexo I')
+            faturamento_anual = vendas_mes_1 * 12
+            
+            # Alíquotas aproximadas do Simples Nacional 2024
+            if anexo == 'Anexo I' and faturamento_anual <= 180000:
+                aliquota_esperada = 4.0  # Comércio
+            elif anexo == 'Anexo III' and faturamento_anual <= 180000:
+                aliquota_esperada = 6.0  # Serviços
+            else:
+                aliquota_esperada = 8.0  # Faixas superiores
+            
+            imposto_calculado = vendas_mes_1 * (aliquota_esperada / 100)
+            imposto_informado = st.session_state.business_data.get('impostos', 0)
+            
+            if abs(imposto_calculado - imposto_informado) < 200:
+                validations.append({
+                    "status": "✅", 
+                    "item": "Tributação Simples Nacional correta", 
+                    "details": f"{anexo}: {aliquota_esperada}% = {format_currency(imposto_calculado)}",
+                    "sugestao": f"Alíquota de {aliquota_esperada}% aplicada corretamente"
+                })
+                passed_checks += 1
+            else:
+                validations.append({
+                    "status": "❌", 
+                    "item": "Erro no cálculo tributário", 
+                    "details": f"Esperado: {format_currency(imposto_calculado)} ({aliquota_esperada}%) ≠ Informado: {format_currency(imposto_informado)}",
+                    "sugestao": "AÇÃO: Vá para DP e Tributação → Revise a alíquota do Simples Nacional. Para óticas, usar Anexo I (comércio) ou III (serviços)."
+                })
+                errors += 1
+            total_checks += 1
+    
+    # 3.4 VALIDAÇÃO DE CUSTOS E MARGENS
+    aluguel = st.session_state.business_data.get('aluguel', 0)
+    if aluguel > 0 and vendas_mes_1 > 0:
+        ratio_aluguel = (aluguel / vendas_mes_1) * 100
+        if ratio_aluguel <= 15:
+            validations.append({
+                "status": "✅", 
+                "item": "Aluguel proporcional à receita", 
+                "details": f"{ratio_aluguel:.1f}% da receita (ideal: até 15%)",
+                "sugestao": "Custo de aluguel dentro do recomendado para o setor óptico"
+            })
+            passed_checks += 1
+        elif ratio_aluguel <= 25:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Aluguel elevado mas aceitável", 
+                "details": f"{ratio_aluguel:.1f}% da receita (ideal: até 15%)",
+                "sugestao": "ATENÇÃO: Aluguel alto pode pressionar margem. Considere negociar ou buscar localização alternativa."
+            })
+            warnings += 1
+        else:
+            validations.append({
+                "status": "❌", 
+                "item": "Aluguel muito alto - risco financeiro", 
+                "details": f"{ratio_aluguel:.1f}% da receita (máximo recomendado: 15%)",
+                "sugestao": "AÇÃO CRÍTICA: Renegocie aluguel ou busque novo ponto. Aluguel acima de 25% da receita compromete viabilidade."
+            })
+            errors += 1
+        total_checks += 1
+    
+    # 3.5 ANÁLISE DE MARGEM DE PRODUTOS (EXEMPLO DETALHADO)
+    produtos_cadastrados = st.session_state.business_data.get('produtos_servicos', [])
+    if produtos_cadastrados:
+        produto_exemplo = None
+        for produto in produtos_cadastrados:
+            if produto.get('preco_venda', 0) > 0 and produto.get('custo_unitario', 0) > 0:
+                produto_exemplo = produto
+                break
+        
+        if produto_exemplo:
+            nome_produto = produto_exemplo.get('nome', 'Produto')
+            preco_venda = produto_exemplo.get('preco_venda', 0)
+            custo_unitario = produto_exemplo.get('custo_unitario', 0)
+            
+            margem_bruta = preco_venda - custo_unitario
+            margem_percentual = (margem_bruta / preco_venda) * 100 if preco_venda > 0 else 0
+            markup = (margem_bruta / custo_unitario) * 100 if custo_unitario > 0 else 0
+            
+            if margem_percentual >= 50:
+                validations.append({
+                    "status": "✅", 
+                    "item": f"Margem adequada - {nome_produto}", 
+                    "details": f"Custo: {format_currency(custo_unitario)} → Venda: {format_currency(preco_venda)} = {margem_percentual:.1f}% margem",
+                    "sugestao": f"Markup: {markup:.1f}% - margem saudável para o setor óptico"
+                })
+                passed_checks += 1
+            elif margem_percentual >= 30:
+                validations.append({
+                    "status": "⚠️", 
+                    "item": f"Margem apertada - {nome_produto}", 
+                    "details": f"Custo: {format_currency(custo_unitario)} → Venda: {format_currency(preco_venda)} = {margem_percentual:.1f}% margem",
+                    "sugestao": "ATENÇÃO: Margem baixa. Para óticas, ideal é 50-60%. Revise preços ou fornecedores."
+                })
+                warnings += 1
+            else:
+                validations.append({
+                    "status": "❌", 
+                    "item": f"Margem insuficiente - {nome_produto}", 
+                    "details": f"Custo: {format_currency(custo_unitario)} → Venda: {format_currency(preco_venda)} = {margem_percentual:.1f}% margem",
+                    "sugestao": "AÇÃO CRÍTICA: Margem abaixo de 30% inviabiliza operação. Reavalie precificação na Etapa 5 ou Sistema de Precificação."
+                })
+                errors += 1
+            total_checks += 1
+        else:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Produtos sem custos/preços definidos", 
+                "details": "Não é possível validar margens",
+                "sugestao": "AÇÃO: Vá para Etapa 5 ou Sistema de Precificação para definir custos e preços de venda"
+            })
+            warnings += 1
+            total_checks += 1
+    
+    # 3.6 VALIDAÇÃO DE CUSTOS FIXOS TOTAIS
+    aluguel = st.session_state.business_data.get('aluguel', 0)
+    salarios_total = st.session_state.business_data.get('salarios_total', 0)
+    outros_custos = st.session_state.business_data.get('outros_custos_fixos', 0)
+    
+    if aluguel > 0 and salarios_total > 0:
+        custo_fixo_total = aluguel + salarios_total + outros_custos
+        if vendas_mes_1 > 0:
+            ratio_custo = (custo_fixo_total / vendas_mes_1) * 100
+            if ratio_custo <= 60:
+                validations.append({
+                    "status": "✅", 
+                    "item": "Estrutura de custos equilibrada", 
+                    "details": f"Custos fixos: {ratio_custo:.1f}% da receita (ideal: até 60%)",
+                    "sugestao": f"Aluguel: {format_currency(aluguel)} + Folha: {format_currency(salarios_total)} + Outros: {format_currency(outros_custos)}"
+                })
+                passed_checks += 1
+            elif ratio_custo <= 80:
+                validations.append({
+                    "status": "⚠️", 
+                    "item": "Custos fixos elevados", 
+                    "details": f"{ratio_custo:.1f}% da receita (ideal: até 60%)",
+                    "sugestao": "ATENÇÃO: Estrutura de custos pesada. Considere otimizar folha ou renegociar aluguel."
+                })
+                warnings += 1
+            else:
+                validations.append({
+                    "status": "❌", 
+                    "item": "Custos fixos excessivos", 
+                    "details": f"{ratio_custo:.1f}% da receita - risco alto de prejuízo",
+                    "sugestao": "AÇÃO CRÍTICA: Custos fixos acima de 80% são insustentáveis. Reavalie toda estrutura de custos."
+                })
+                errors += 1
+        else:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Custos definidos mas receita não", 
+                "details": "Configure vendas na Etapa 10",
+                "sugestao": "AÇÃO: Defina metas de faturamento para validar proporção de custos"
+            })
+            warnings += 1
+    else:
+        validations.append({"status": "❌", "item": "Custos fixos não definidos", "details": "Configure aluguel e folha na Etapa 10"})
+        errors += 1
+    total_checks += 1
+    
+    # 4. VALIDAÇÃO DE PESSOAL
+    st.subheader("👥 4. Gestão de Pessoas")
+    
+    if hasattr(st.session_state, 'funcionarios') and st.session_state.funcionarios:
+        num_funcionarios = len(st.session_state.funcionarios)
+        funcionarios_clt = [f for f in st.session_state.funcionarios if f['tipo_contrato'] == 'CLT']
+        
+        if num_funcionarios >= 2:
+            validations.append({"status": "✅", "item": "Equipe dimensionada", "details": f"{num_funcionarios} funcionários cadastrados"})
+            passed_checks += 1
+        else:
+            validations.append({"status": "⚠️", "item": "Equipe pequena", "details": f"Apenas {num_funcionarios} funcionário(s)"})
+            warnings += 1
+        
+        # Verificar se há optometrista
+        tem_optometrista = any('optom' in f['cargo'].lower() for f in st.session_state.funcionarios)
+        if tem_optometrista:
+            validations.append({"status": "✅", "item": "Optometrista cadastrado", "details": "Essencial para ótica"})
+            passed_checks += 1
+        else:
+            validations.append({"status": "❌", "item": "Optometrista não encontrado", "details": "Obrigatório para óticas"})
+            errors += 1
+        
+        total_checks += 2
+    else:
+        validations.append({"status": "❌", "item": "Nenhum funcionário cadastrado", "details": "Configure no DP e Tributação"})
+        errors += 1
+        total_checks += 1
+    
+    # 5. VALIDAÇÃO DE MERCADO
+    st.subheader("🎯 5. Análise de Mercado")
+    
+    cidade = st.session_state.business_data.get('cidade', '')
+    estado = st.session_state.business_data.get('estado', '')
+    if cidade and estado:
+        validations.append({"status": "✅", "item": "Localização definida", "details": f"{cidade}, {estado}"})
+        passed_checks += 1
+    else:
+        validations.append({"status": "❌", "item": "Localização não definida", "details": "Configure na Etapa 2"})
+        errors += 1
+    total_checks += 1
+    
+    # Verificar múltiplos campos do público-alvo
+    faixa_etaria = st.session_state.business_data.get('faixa_etaria_principal', [])
+    classe_social = st.session_state.business_data.get('classe_social', [])
+    perfil_profissional = st.session_state.business_data.get('perfil_profissional', [])
+    necessidades = st.session_state.business_data.get('necessidades_principais', [])
+    
+    if faixa_etaria or classe_social or perfil_profissional or necessidades:
+        detalhes_publico = []
+        if faixa_etaria:
+            detalhes_publico.append(f"Idade: {', '.join(faixa_etaria[:2])}")
+        if classe_social:
+            detalhes_publico.append(f"Classe: {', '.join(classe_social[:2])}")
+        if perfil_profissional:
+            detalhes_publico.append(f"Perfil: {', '.join(perfil_profissional[:2])}")
+        
+        validations.append({"status": "✅", "item": "Público-alvo definido", "details": "; ".join(detalhes_publico)})
+        passed_checks += 1
+    else:
+        validations.append({"status": "⚠️", "item": "Público-alvo não definido", "details": "Configure na Etapa 3"})
+        warnings += 1
+    total_checks += 1
+    
+    # 6. VALIDAÇÃO DE PRODUTOS
+    st.subheader("🛍️ 6. Produtos e Serviços")
+    
+    ticket_medio = st.session_state.business_data.get('ticket_medio', 0)
+    if ticket_medio > 0:
+        if ticket_medio >= 150:
+            validations.append({"status": "✅", "item": "Ticket médio competitivo", "details": f"{format_currency(ticket_medio)}"})
+            passed_checks += 1
+        else:
+            validations.append({"status": "⚠️", "item": "Ticket médio baixo", "details": f"{format_currency(ticket_medio)} - considere aumentar"})
+            warnings += 1
+    else:
+        validations.append({"status": "❌", "item": "Ticket médio não definido", "details": "Configure na Etapa 5"})
+        errors += 1
+    total_checks += 1
+    
+    # 7. VALIDAÇÃO MATEMÁTICA RIGOROSA
+    st.subheader("🔍 7. Análise Matemática Crítica")
+    
+    objetivo_faturamento = st.session_state.business_data.get('objetivo_faturamento', 0)
+    aluguel = st.session_state.business_data.get('aluguel', 0)
+    salarios_total = st.session_state.business_data.get('salarios_total', 0)
+    investimento_total = st.session_state.business_data.get('investimento_total', 0)
+    area_loja = st.session_state.business_data.get('area_loja', 0)
+    num_funcionarios = len(st.session_state.funcionarios) if hasattr(st.session_state, 'funcionarios') else 0
+    
+    # VALIDAÇÃO 1: Realismo do faturamento por vendas/dia
+    if objetivo_faturamento > 0 and ticket_medio > 0:
+        vendas_mes = objetivo_faturamento / ticket_medio
+        vendas_dia_util = vendas_mes / 26  # 26 dias úteis
+        vendas_sabado = vendas_dia_util * 1.5  # Sábados são mais movimentados
+        
+        if vendas_dia_util > 12:
+            validations.append({
+                "status": "❌", 
+                "item": "CRÍTICO: Meta inviável operacionalmente", 
+                "details": f"{vendas_dia_util:.1f} vendas/dia útil impossível para ótica",
+                "sugestao": f"CORREÇÃO URGENTE: Vá para Etapa 1 → 'Meta de faturamento mensal' e reduza de {format_currency(objetivo_faturamento)} para no máximo {format_currency(12 * 26 * ticket_medio)}. OU vá para Etapa 5 → 'Faixa de preços' e aumente o ticket médio de {format_currency(ticket_medio)} para pelo menos {format_currency(objetivo_faturamento / (12 * 26))}."
+            })
+            errors += 1
+        elif vendas_dia_util > 8:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Meta muito desafiadora", 
+                "details": f"{vendas_dia_util:.1f} vendas/dia útil requer equipe experiente",
+                "sugestao": f"OTIMIZAÇÃO: Para facilitar o alcance da meta, considere: 1) Aumentar ticket médio na Etapa 5 de {format_currency(ticket_medio)} para {format_currency(objetivo_faturamento / (6 * 26))}, OU 2) Contratar mais vendedores na Etapa 8, OU 3) Reduzir meta para {format_currency(6 * 26 * ticket_medio)} na Etapa 1."
+            })
+            warnings += 1
+        else:
+            validations.append({
+                "status": "✅", 
+                "item": "Meta operacionalmente viável", 
+                "details": f"{vendas_dia_util:.1f} vendas/dia útil",
+                "sugestao": "Meta realista para operação de ótica"
+            })
+            passed_checks += 1
+        total_checks += 1
+        
+        # VALIDAÇÃO 2: Capacidade por funcionário
+        if num_funcionarios > 0:
+            vendas_por_funcionario_dia = vendas_dia_util / num_funcionarios
+            if vendas_por_funcionario_dia > 4:
+                validations.append({"status": "❌", "item": "CRÍTICO: Equipe insuficiente", "details": f"{vendas_por_funcionario_dia:.1f} vendas/funcionário/dia (máximo: 4)"})
+                errors += 1
+            elif vendas_por_funcionario_dia > 3:
+                validations.append({"status": "⚠️", "item": "Equipe no limite", "details": f"{vendas_por_funcionario_dia:.1f} vendas/funcionário/dia"})
+                warnings += 1
+            else:
+                validations.append({"status": "✅", "item": "Equipe adequada", "details": f"{vendas_por_funcionario_dia:.1f} vendas/funcionário/dia"})
+                passed_checks += 1
+            total_checks += 1
+    
+    # VALIDAÇÃO 3: Análise crítica do ticket médio
+    if ticket_medio > 0:
+        if ticket_medio < 100:
+            validations.append({
+                "status": "❌", 
+                "item": "CRÍTICO: Ticket médio inviável", 
+                "details": f"{format_currency(ticket_medio)} impossível cobrir custos",
+                "sugestao": f"AÇÃO CRÍTICA: Vá para Etapa 5 → Produtos e Serviços → 'Faixa de preços mais vendida' e selecione pelo menos 'R$ 150 - R$ 299'. Com {format_currency(ticket_medio)}, nem conseguirá pagar um funcionário (salário mínimo + encargos = R$ 2.550/mês ÷ 100 vendas = R$ 25,50 só de mão de obra por venda)."
+            })
+            errors += 1
+        elif ticket_medio < 200:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Ticket médio muito baixo", 
+                "details": f"{format_currency(ticket_medio)} dificulta rentabilidade",
+                "sugestao": f"MELHORIA: Vá para Etapa 5 → 'Faixa de preços mais vendida' e considere aumentar para 'R$ 200 - R$ 399'. Para referência: óticas bem-sucedidas têm ticket médio de R$ 250-400. Inclua mais serviços como consultas, tratamentos de lente ou acessórios."
+            })
+            warnings += 1
+        elif ticket_medio > 1000:
+            validations.append({
+                "status": "⚠️", 
+                "item": "Ticket médio muito alto", 
+                "details": f"{format_currency(ticket_medio)} pode reduzir demanda drasticamente",
+                "sugestao": f"CUIDADO: Ticket de {format_currency(ticket_medio)} é muito alto para maioria dos brasileiros. Vá para Etapa 5 → 'Faixa de preços' e considere oferecer opções mais acessíveis (R$ 300-600). OU vá para Etapa 3 → Público-Alvo e certifique-se de focar em classes A/B que podem pagar estes valores."
+            })
+            warnings += 1
+        else:
+            validations.append({
+                "status": "✅", 
+                "item": "Ticket médio realista", 
+                "details": f"{format_currency(ticket_medio)} dentro da faixa viável",
+                "sugestao": "Ticket médio adequado para o mercado brasileiro de óticas"
+            })
+            passed_checks += 1
+        total_checks += 1
+    
+    # VALIDAÇÃO 4: Estrutura de custos vs faturamento
+    if objetivo_faturamento > 0:
+        custos_fixos_principais = aluguel + salarios_total
+        if custos_fixos_principais > 0:
+            percentual_custos_fixos = (custos_fixos_principais / objetivo_faturamento) * 100
+            
+            if percentual_custos_fixos > 75:
+                validations.append({"status": "❌", "item": "CRÍTICO: Estrutura de custos insustentável", "details": f"{percentual_custos_fixos:.1f}% em custos fixos (máximo viável: 60%)"})
+                errors += 1
+            elif percentual_custos_fixos > 60:
+                validations.append({"status": "⚠️", "item": "Custos fixos excessivos", "details": f"{percentual_custos_fixos:.1f}% do faturamento (ideal: <50%)"})
+                warnings += 1
+            else:
+                validations.append({"status": "✅", "item": "Estrutura de custos saudável", "details": f"{percentual_custos_fixos:.1f}% em custos fixos"})
+                passed_checks += 1
+            total_checks += 1
+        
+        # VALIDAÇÃO 5: Aluguel específico
+        if aluguel > 0:
+            percentual_aluguel = (aluguel / objetivo_faturamento) * 100
+            if percentual_aluguel > 20:
+                validations.append({
+                    "status": "❌", 
+                    "item": "CRÍTICO: Aluguel proibitivo", 
+                    "details": f"{percentual_aluguel:.1f}% do faturamento (máximo: 15%)",
+                    "sugestao": f"CORREÇÃO: Vá para Etapa 10 → Projeções Financeiras → aba 'Estrutura de Custos' → campo 'Aluguel (R$)' e reduza de {format_currency(aluguel)} para no máximo {format_currency(objetivo_faturamento * 0.15)}. OU aumente a meta de faturamento na Etapa 1 para pelo menos {format_currency(aluguel / 0.15)}."
+                })
+                errors += 1
+            elif percentual_aluguel > 12:
+                validations.append({
+                    "status": "⚠️", 
+                    "item": "Aluguel elevado", 
+                    "details": f"{percentual_aluguel:.1f}% do faturamento (ideal: <10%)",
+                    "sugestao": f"OTIMIZAÇÃO: Vá para Etapa 10 → Projeções Financeiras → aba 'Estrutura de Custos' → reduza aluguel de {format_currency(aluguel)} para {format_currency(objetivo_faturamento * 0.10)} ou negocie um local mais barato."
+                })
+                warnings += 1
+            else:
+                validations.append({
+                    "status": "✅", 
+                    "item": "Aluguel proporcional", 
+                    "details": f"{percentual_aluguel:.1f}% do faturamento",
+                    "sugestao": "Proporção adequada entre aluguel e receita projetada"
+                })
+                passed_checks += 1
+            total_checks += 1
+    
+    # VALIDAÇÃO 6: Análise de área vs faturamento
+    if area_loja > 0 and objetivo_faturamento > 0:
+        faturamento_por_m2 = objetivo_faturamento / area_loja
+        if faturamento_por_m2 < 500:
+            validations.append({"status": "❌", "item": "CRÍTICO: Produtividade por m² muito baixa", "details": f"{format_currency(faturamento_por_m2)}/m² (mínimo: R$ 800/m²)"})
+            errors += 1
+        elif faturamento_por_m2 < 800:
+            validations.append({"status": "⚠️", "item": "Produtividade por m² baixa", "details": f"{format_currency(faturamento_por_m2)}/m² (ideal: >R$ 1.200/m²)"})
+            warnings += 1
+        else:
+            validations.append({"status": "✅", "item": "Produtividade por m² adequada", "details": f"{format_currency(faturamento_por_m2)}/m²"})
+            passed_checks += 1
+        total_checks += 1
+    
+    # VALIDAÇÃO 7: Payback realista
+    if investimento_total > 0 and objetivo_faturamento > 0:
+        margem_liquida_conservadora = 0.15  # 15% margem líquida realista
+        lucro_mensal = objetivo_faturamento * margem_liquida_conservadora
+        payback_meses = investimento_total / lucro_mensal if lucro_mensal > 0 else 999
+        
+        if payback_meses > 48:
+            validations.append({"status": "❌", "item": "CRÍTICO: Payback proibitivo", "details": f"{payback_meses:.0f} meses (máximo aceitável: 36 meses)"})
+            errors += 1
+        elif payback_meses > 30:
+            validations.append({"status": "⚠️", "item": "Payback elevado", "details": f"{payback_meses:.0f} meses (ideal: <24 meses)"})
+            warnings += 1
+        else:
+            validations.append({"status": "✅", "item": "Payback atrativo", "details": f"{payback_meses:.0f} meses"})
+            passed_checks += 1
+        total_checks += 1
+    
+    # VALIDAÇÃO 8: Capital de giro vs faturamento
+    if investimento_total > 0 and objetivo_faturamento > 0:
+        capital_giro_necessario = objetivo_faturamento * 2  # 2 meses de faturamento
+        if investimento_total < capital_giro_necessario:
+            deficit_capital = capital_giro_necessario - investimento_total
+            validations.append({
+                "status": "❌", 
+                "item": "CRÍTICO: Capital de giro insuficiente", 
+                "details": f"Faltam {format_currency(deficit_capital)} para 2 meses de operação",
+                "sugestao": f"CORREÇÃO URGENTE: Vá para Etapa 9 → Investimento Inicial → role até o final → campo 'Investimento total' e aumente de {format_currency(investimento_total)} para pelo menos {format_currency(capital_giro_necessario)}. Você precisa de dinheiro suficiente para operar 2 meses sem faturar nada (período de adaptação inicial)."
+            })
+            errors += 1
+        else:
+            validations.append({
+                "status": "✅", 
+                "item": "Capital de giro adequado", 
+                "details": f"Cobertura para {investimento_total/objetivo_faturamento:.1f} meses",
+                "sugestao": "Capital suficiente para operação inicial segura"
+            })
+            passed_checks += 1
+        total_checks += 1
+    
+    # VALIDAÇÃO 9: Viabilidade final integrada
+    # Definir custo_fixo_total se não foi definido na validação anterior
+    if 'custo_fixo_total' not in locals():
+        custo_fixo_total = aluguel + salarios_total + outros_custos
+    
+    if vendas_mes_1 > 0 and custo_fixo_total > 0:
+        # Ponto de equilíbrio com margem realista de 35%
+        ponto_equilibrio = custo_fixo_total / 0.35
+        
+        if vendas_mes_1 >= ponto_equilibrio:
+            margem_seguranca = ((vendas_mes_1 - ponto_equilibrio) / ponto_equilibrio) * 100
+            if margem_seguranca > 30:
+                validations.append({"status": "✅", "item": "Negócio matematicamente viável", "details": f"{margem_seguranca:.0f}% acima do ponto de equilíbrio"})
+                passed_checks += 1
+            else:
+                validations.append({"status": "⚠️", "item": "Viabilidade limitada", "details": f"Apenas {margem_seguranca:.0f}% acima do equilíbrio"})
+                warnings += 1
+        else:
+            deficit = ponto_equilibrio - vendas_mes_1
+            percentual_deficit = (deficit / ponto_equilibrio) * 100
+            validations.append({
+                "status": "❌", 
+                "item": "CRÍTICO: Negócio matematicamente inviável", 
+                "details": f"{percentual_deficit:.0f}% abaixo do ponto de equilíbrio",
+                "sugestao": f"CORREÇÃO CRÍTICA: Suas vendas previstas ({format_currency(vendas_mes_1)}) estão muito abaixo dos custos ({format_currency(ponto_equilibrio)}). Vá para Etapa 10 → Projeções Financeiras → aba 'DRE Mês a Mês' → linha 'Vendas mês 1' e verifique seus números. SOLUÇÕES: 1) Aumente ticket médio na Etapa 5, 2) Reduza custos fixos (aluguel/salários) na Etapa 10, ou 3) Aumente meta de faturamento na Etapa 1."
+            })
+            errors += 1
+        total_checks += 1
+    else:
+        validations.append({"status": "❌", "item": "CRÍTICO: Dados insuficientes para análise", "details": "Impossível validar viabilidade matemática"})
+        errors += 1
+        total_checks += 1
+    
+    # RESUMO EXECUTIVO CRÍTICO
+    st.markdown("---")
+    st.subheader("📋 Resumo Executivo da Auditoria")
+    
+    # Calcular porcentagem de conclusão
+    completion_percentage = (passed_checks / total_checks) * 100 if total_checks > 0 else 0
+    
+    # Determinar status geral e recomendação
+    if errors > 3:
+        status_geral = "🔴 CRÍTICO"
+        recomendacao = "PARE: O plano apresenta problemas matemáticos graves que tornam o negócio inviável. Revise fundamentalmente a estrutura financeira antes de prosseguir."
+        cor_status = "red"
+    elif errors > 0:
+        status_geral = "🟡 ALTO RISCO"
+        recomendacao = "CUIDADO: Existem problemas críticos que podem comprometer a viabilidade. Ajuste os itens marcados como críticos antes de investir."
+        cor_status = "orange"
+    elif warnings > 4:
+        status_geral = "🟡 MODERADO"
+        recomendacao = "ATENÇÃO: O plano tem potencial, mas requer ajustes importantes para maximizar as chances de sucesso."
+        cor_status = "orange"
+    elif warnings > 0:
+        status_geral = "🟢 VIÁVEL"
+        recomendacao = "BOM: O negócio é matematicamente viável, mas algumas otimizações podem melhorar a performance."
+        cor_status = "green"
+    else:
+        status_geral = "🟢 EXCELENTE"
+        recomendacao = "ÓTIMO: O plano está bem estruturado matematicamente e apresenta alta probabilidade de sucesso."
+        cor_status = "green"
+    
+    # Exibir status principal
+    st.markdown(f"""
+    <div style="background-color: {cor_status}; padding: 20px; border-radius: 10px; margin: 10px 0;">
+        <h3 style="color: white; margin: 0;">{status_geral}</h3>
+        <p style="color: white; margin: 10px 0 0 0; font-size: 16px;">{recomendacao}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Métricas detalhadas
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("✅ Aprovadas", passed_checks, f"{completion_percentage:.0f}%")
+    
+    with col2:
+        st.metric("⚠️ Atenção", warnings)
+    
+    with col3:
+        st.metric("❌ Críticas", errors)
+    
+    with col4:
+        st.metric("📊 Total", total_checks)
+    
+    # Status geral
+    if completion_percentage >= 80 and errors == 0:
+        st.success("🎉 Excelente! Seu plano está bem estruturado e pronto para implementação.")
+    elif completion_percentage >= 60 and errors <= 2:
+        st.warning("⚡ Bom progresso! Algumas melhorias são necessárias antes de implementar.")
+    else:
+        st.error("🚨 Atenção! Várias questões críticas precisam ser resolvidas antes de prosseguir.")
+    
+    # Barra de progresso
+    st.progress(completion_percentage / 100)
+    st.caption(f"Plano {completion_percentage:.0f}% completo e validado")
+    
+    # Detalhes das validações
+    st.markdown("### 📋 Detalhes da Auditoria")
+    
+    for validation in validations:
+        with st.expander(f"{validation['status']} {validation['item']}", expanded=(validation['status'] == "❌")):
+            st.write(f"**Detalhes:** {validation['details']}")
+            if 'sugestao' in validation and validation['sugestao']:
+                if validation['status'] == "❌":
+                    st.error(f"**🎯 {validation['sugestao']}**")
+                elif validation['status'] == "⚠️":
+                    st.warning(f"**💡 {validation['sugestao']}**")
+                else:
+                    st.info(f"**✓ {validation['sugestao']}**")
+    
+    # SEÇÃO DE PRÓXIMOS PASSOS RECOMENDADOS
+    if errors > 0 or warnings > 0:
+        st.markdown("---")
+        st.markdown("### 🎯 Próximos Passos Recomendados")
+        
+        # Priorizar ações por criticidade
+        acoes_criticas = [v for v in validations if v['status'] == "❌" and 'sugestao' in v]
+        acoes_melhorias = [v for v in validations if v['status'] == "⚠️" and 'sugestao' in v]
+        
+        if acoes_criticas:
+            st.error("**🚨 QUESTÕES CRÍTICAS (resolver primeiro):**")
+            for i, acao in enumerate(acoes_criticas[:3], 1):
+                st.write(f"• {acao['item']}: {acao['sugestao']}")
+        
+        if acoes_melhorias:
+            st.warning("**⚡ MELHORIAS RECOMENDADAS:**")
+            for i, acao in enumerate(acoes_melhorias[:3], 1):
+                st.write(f"• {acao['item']}: {acao['sugestao']}")
+    else:
+        st.success("🎉 **Parabéns!** Seu plano passou em todas as validações críticas!")
+    
+    # Recomendações antigas (manter por compatibilidade)
+    st.markdown("### 💡 Outras Recomendações")
+    
+    if errors > 0:
+        st.markdown("**🔴 Questões Críticas (resolver primeiro):**")
+        for validation in validations:
+            if validation['status'] == '❌':
+                st.write(f"• {validation['item']}: {validation['details']}")
+    
+    if warnings > 0:
+        st.markdown("**🟡 Melhorias Sugeridas:**")
+        for validation in validations:
+            if validation['status'] == '⚠️':
+                st.write(f"• {validation['item']}: {validation['details']}")
+    
+    if completion_percentage >= 80:
+        st.markdown("**🟢 Plano Aprovado - Próximas Ações:**")
+        st.write("• Revisar cronograma de implementação")
+        st.write("• Buscar financiamento se necessário")
+        st.write("• Iniciar processo de abertura da empresa")
+        st.write("• Começar negociações com fornecedores")
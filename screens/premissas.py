@@ -0,0 +1,249 @@
+"""
+Ferramenta Premissas
+Premissas do negócio usadas nas projeções financeiras
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, calcular_custo_captador_mensal
+
+
+def show_premissas():
+    """Central de Controle das Premissas - Atualiza todo o sistema"""
+    
+    st.title("⚙️ Premissas do Negócio")
+    st.markdown("**Central de controle para atualizar todas as variáveis do plano automaticamente**")
+    
+    # Card de status atual
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        vendas_atual = st.session_state.business_data.get('vendas_mes_1', 0)
+        st.metric("Vendas Mensais", format_currency(vendas_atual))
+    
+    with col2:
+        ticket_atual = st.session_state.business_data.get('ticket_medio', 0)
+        st.metric("Ticket Médio", format_currency(ticket_atual))
+    
+    with col3:
+        oculos_atual = int(vendas_atual / ticket_atual) if ticket_atual > 0 else 0
+        st.metric("Óculos/Mês", f"{oculos_atual} unidades")
+    
+    st.markdown("---")
+    
+    # Seção 1: Premissas de Vendas
+    st.markdown("### 📊 1. Premissas de Vendas")
+    
+    col_prem1, col_prem2 = st.columns(2)
+    
+    with col_prem1:
+        # Meta de óculos vendidos
+        nova_meta_oculos = st.number_input(
+            "Meta de óculos vendidos por mês:",
+            min_value=1,
+            max_value=500,
+            value=oculos_atual if oculos_atual > 0 else 30,
+            step=1,
+            help="Quantos óculos você planeja vender por mês",
+            key="nova_meta_oculos"
+        )
+        
+        # Ticket médio
+        novo_ticket_medio = st.number_input(
+            "Ticket médio por venda (R$):",
+            min_value=100.0,
+            max_value=5000.0,
+            value=float(ticket_atual) if ticket_atual > 0 else 500.0,
+            step=50.0,
+            help="Valor médio de cada venda",
+            key="novo_ticket_medio"
+        )
+    
+    with col_prem2:
+        # Faturamento calculado automaticamente
+        novo_faturamento = nova_meta_oculos * novo_ticket_medio
+        st.metric("Faturamento Mensal Calculado", format_currency(novo_faturamento))
+        
+        # Distribuição de vendas
+        st.markdown("**Distribuição de Vendas:**")
+        percentual_avista = st.slider(
+            "% Vendas à Vista:",
+            min_value=0,
+            max_value=100,
+            value=st.session_state.business_data.get('percentual_vendas_avista', 50),
+            step=5,
+            key="novo_percentual_avista"
+        )
+        
+        vendas_avista = int(nova_meta_oculos * (percentual_avista / 100))
+        vendas_parcelada = nova_meta_oculos - vendas_avista
+        
+        st.write(f"• À vista: {vendas_avista} óculos")
+        st.write(f"• Parcelado: {vendas_parcelada} óculos")
+    
+    # Seção 2: Custos e Margens
+    st.markdown("### 💰 2. Estrutura de Custos")
+    
+    col_custo1, col_custo2 = st.columns(2)
+    
+    with col_custo1:
+        # Custo médio por óculos
+        custo_medio_oculos = st.number_input(
+            "Custo médio por óculos (R$):",
+            min_value=50.0,
+            max_value=1000.0,
+            value=st.session_state.business_data.get('custo_medio_oculos', 180.0),
+            step=10.0,
+            help="Custo dos produtos (lente + armação + acessórios)",
+            key="novo_custo_medio_oculos"
+        )
+        
+        # Margem desejada
+        margem_desejada = st.number_input(
+            "Margem desejada (%):",
+            min_value=50,
+            max_value=500,
+            value=st.session_state.business_data.get('margem_desejada', 180),
+            step=10,
+            help="Margem de lucro sobre o custo",
+            key="nova_margem_desejada"
+        )
+    
+    with col_custo2:
+        # Preço sugerido
+        preco_sugerido = custo_medio_oculos * (1 + margem_desejada / 100)
+        st.metric("Preço Sugerido", format_currency(preco_sugerido))
+        
+        # Margem real vs ticket médio
+        if novo_ticket_medio > 0:
+            margem_real = ((novo_ticket_medio - custo_medio_oculos) / custo_medio_oculos) * 100
+            st.metric("Margem Real do Ticket", f"{margem_real:.1f}%")
+    
+    # Seção 3: Captador
+    st.markdown("### 👥 3. Sistema de Captação")
+    
+    usar_captador = st.checkbox(
+        "Usar sistema de captação",
+        value=st.session_state.business_data.get('usar_sistema_captacao', False),
+        key="usar_captador_premissas"
+    )
+    
+    if usar_captador:
+        col_capt1, col_capt2 = st.columns(2)
+        
+        with col_capt1:
+            comissao_avista = st.number_input(
+                "Comissão por venda à vista (R$):",
+                min_value=0.0,
+                max_value=100.0,
+                value=st.session_state.business_data.get('comissao_avista', 30.0),
+                step=1.0,
+                key="nova_comissao_avista"
+            )
+            
+            comissao_parcelada = st.number_input(
+                "Comissão por venda parcelada (R$):",
+                min_value=0.0,
+                max_value=50.0,
+                value=st.session_state.business_data.get('comissao_parcelada', 5.0),
+                step=1.0,
+                key="nova_comissao_parcelada"
+            )
+        
+        with col_capt2:
+            # Cálculo do custo do captador
+            custo_captador_avista = vendas_avista * comissao_avista
+            custo_captador_parcelada = vendas_parcelada * comissao_parcelada
+            custo_captador_total = custo_captador_avista + custo_captador_parcelada
+            
+            st.metric("Custo Captador/Mês", format_currency(custo_captador_total))
+            
+            # Memória de cálculo
+            with st.expander("🔍 Memória de Cálculo Captador"):
+                st.code(f"""
+Cálculo do Captador:
+• {vendas_avista} vendas à vista × R$ {comissao_avista:.2f} = R$ {custo_captador_avista:.2f}
+• {vendas_parcelada} vendas parceladas × R$ {comissao_parcelada:.2f} = R$ {custo_captador_parcelada:.2f}
+TOTAL: R$ {custo_captador_total:.2f}/mês
+                """)
+    
+    # Botão para aplicar todas as mudanças
+    st.markdown("---")
+    
+    col_botao1, col_botao2, col_botao3 = st.columns([1, 2, 1])
+    
+    with col_botao2:
+        if st.button("🔄 APLICAR TODAS AS PREMISSAS", type="primary", use_container_width=True, key="aplicar_premissas"):
+            
+            # Atualizar todas as variáveis do sistema
+            st.session_state.business_data.update({
+                # Vendas
+                'vendas_mes_1': novo_faturamento,
+                'ticket_medio': novo_ticket_medio,
+                'meta_oculos_mes': nova_meta_oculos,
+                'percentual_vendas_avista': percentual_avista,
+                
+                # Custos
+                'custo_medio_oculos': custo_medio_oculos,
+                'margem_desejada': margem_desejada,
+                
+                # Captador
+                'usar_sistema_captacao': usar_captador,
+                'comissao_avista': comissao_avista if usar_captador else 0,
+                'comissao_parcelada': comissao_parcelada if usar_captador else 0,
+                'custo_captador_mensal_calculado': custo_captador_total if usar_captador else 0,
+                
+
+                
+                # Sincronizar com outras etapas
+                'ticket_medio_esperado': novo_ticket_medio,  # Etapa 3
+                'meta_faturamento_mensal': novo_faturamento,  # Etapa 7
+                'faturamento_mensal': novo_faturamento,  # Etapa 10
+            })
+            
+            # Recalcular captador
+            if usar_captador:
+                custo_captador = calcular_custo_captador_mensal()
+                st.session_state.business_data['custo_captador_mensal_calculado'] = custo_captador
+            
+            st.success("✅ **Todas as premissas foram aplicadas com sucesso!**")
+            st.balloons()
+            
+            # Mostrar resumo das mudanças
+            with st.expander("📋 Resumo das Atualizações"):
+                st.markdown(f"""
+                **Vendas Atualizadas:**
+                • Meta: {nova_meta_oculos} óculos/mês
+                • Ticket: {format_currency(novo_ticket_medio)}
+                • Faturamento: {format_currency(novo_faturamento)}
+                • Distribuição: {percentual_avista}% à vista, {100-percentual_avista}% parcelado
+                
+                **Custos Atualizados:**
+                • Custo médio: {format_currency(custo_medio_oculos)}
+                • Margem: {margem_desejada}%
+                • Preço sugerido: {format_currency(preco_sugerido)}
+                
+                **Captador:** {'Ativo' if usar_captador else 'Inativo'}
+                {f'• Custo mensal: {format_currency(custo_captador_total)}' if usar_captador else ''}
+                
+                **Etapas Sincronizadas:**
+                • Etapa 3: Ticket médio esperado
+                • Etapa 7: Meta de faturamento
+                • Etapa 8: Sistema de captação  
+                • Etapa 10: Projeções financeiras
+                """)
+    
+    # Seção de auditoria
+    st.markdown("---")
+    st.markdown("### 🔍 Auditoria do Sistema")
+    
+    with st.expander("Ver dados atuais do sistema"):
+        dados_relevantes = {
+            'vendas_mes_1': st.session_state.business_data.get('vendas_mes_1', 0),
+            'ticket_medio': st.session_state.business_data.get('ticket_medio', 0),
+            'custo_captador_mensal_calculado': st.session_state.business_data.get('custo_captador_mensal_calculado', 0),
+            'usar_sistema_captacao': st.session_state.business_data.get('usar_sistema_captacao', False),
+            'comissao_avista': st.session_state.business_data.get('comissao_avista', 0),
+            'comissao_parcelada': st.session_state.business_data.get('comissao_parcelada', 0)
+        }
+        st.json(dados_relevantes)
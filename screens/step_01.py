@@ -0,0 +1,373 @@
+"""
+Etapa 1 - Sumário Executivo
+Informações iniciais da ótica, características e visão do negócio
+"""
+
+import streamlit as st
+import pandas as pd
+
+from app_helpers import format_currency, safe_multiselect_default, save_user_data
+from construction_cost_calculator import ConstructionCostCalculator
+
+
+def show_step_1():
+    """Etapa 1: Informações Iniciais"""
+    st.header("1️⃣ Informações Iniciais")
+    st.markdown("**FASE 1: CONCEITO** - Defina a identidade e visão da sua ótica")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("🏪 Informações Básicas")
+        
+        nome_otica = st.text_input(
+            "Nome da ótica *",
+            value=st.session_state.business_data.get('nome_otica', ''),
+            placeholder="Ex: Ótica Vista Clara"
+        )
+        # Auto-save nome_otica
+        if nome_otica != st.session_state.business_data.get('nome_otica'):
+            st.session_state.business_data['nome_otica'] = nome_otica
+            save_user_data()
+        
+        cnpj = st.text_input(
+            "CNPJ",
+            value=st.session_state.business_data.get('cnpj', ''),
+            placeholder="00.000.000/0001-00"
+        )
+        # Auto-save cnpj
+        if cnpj != st.session_state.business_data.get('cnpj'):
+            st.session_state.business_data['cnpj'] = cnpj
+            save_user_data()
+        
+        tipos_empresa_list = ["MEI", "Microempresa", "Empresa de Pequeno Porte", "Ltda", "Outro"]
+        current_tipo_empresa = st.session_state.business_data.get('tipo_empresa', 'MEI')
+        current_tipo_empresa_index = tipos_empresa_list.index(current_tipo_empresa) if current_tipo_empresa in tipos_empresa_list else 0
+        
+        tipo_empresa = st.selectbox(
+            "Tipo de empresa *",
+            tipos_empresa_list,
+            index=current_tipo_empresa_index
+        )
+        # Auto-save tipo_empresa com validação crítica
+        if tipo_empresa != st.session_state.business_data.get('tipo_empresa'):
+            # Validação crítica de mudança de regime
+            old_regime = st.session_state.business_data.get('tipo_empresa', 'MEI')
+            
+            # Validar compatibilidade com receita
+            objetivo_faturamento = st.session_state.business_data.get('objetivo_faturamento', 0)
+            receita_anual = objetivo_faturamento * 12
+            
+            # Validar limites MEI
+            if tipo_empresa == 'MEI':
+                if receita_anual > 81000:
+                    st.error(f"🚨 **PROBLEMA**: Sua meta é muito alta para MEI")
+                    st.write(f"Você quer faturar R$ {receita_anual:,.0f} por ano, mas o MEI só permite até R$ 81.000")
+                    st.warning("**Escolha uma das opções:**")
+                    st.write("• 💡 Diminuir sua meta para R$ 6.750 por mês (máximo do MEI)")
+                    st.write("• 🏢 Mudar para 'Microempresa' (pode faturar mais, mas paga mais impostos)")
+                    st.info("💰 **Dica**: MEI paga só R$ 76 por mês. Microempresa paga % sobre as vendas.")
+                    st.stop()
+                
+                # Validar funcionários
+                funcionarios_count = len(st.session_state.business_data.get('funcionarios_planejados', []))
+                if funcionarios_count > 1:
+                    st.error(f"🚨 **PROBLEMA**: Você tem muitos funcionários para MEI")
+                    st.write(f"Você planejou {funcionarios_count} funcionários, mas o MEI só permite 1 pessoa trabalhando")
+                    st.warning("**Escolha uma das opções:**")
+                    st.write("• 👤 Trabalhar só você (sem funcionários)")
+                    st.write("• 🏢 Mudar para 'Microempresa' (pode ter até 9 funcionários)")
+                    st.info("💡 **Explicação**: MEI é para negócios pequenos, só o dono trabalhando.")
+                    st.stop()
+            
+            # Alertar sobre mudanças importantes
+            if old_regime != tipo_empresa:
+                if old_regime == 'MEI' and tipo_empresa != 'MEI':
+                    st.warning(f"🔄 **MUDANÇA DE REGIME**: {old_regime} → {tipo_empresa}")
+                    
+                    # Calcular impacto tributário
+                    if tipo_empresa == 'Microempresa':
+                        custo_mei_mes = 76.60  # MEI 2024
+                        custo_simples_estimado = receita_anual * 0.06 / 12  # ~6% Simples Nacional
+                        diferenca_mensal = custo_simples_estimado - custo_mei_mes
+                        
+                        st.info(f"**Impacto Tributário Estimado:**")
+                        st.write(f"• MEI: R$ {custo_mei_mes:.2f}/mês")
+                        st.write(f"• Simples Nacional: R$ {custo_simples_estimado:.2f}/mês")
+                        st.write(f"• Diferença: +R$ {diferenca_mensal:.2f}/mês")
+                        
+                        if diferenca_mensal > 500:
+                            st.warning("⚠️ Impacto tributário significativo! Revisar viabilidade.")
+            
+            st.session_state.business_data['tipo_empresa'] = tipo_empresa
+            save_user_data()
+        
+        endereco = st.text_input(
+            "Endereço *",
+            value=st.session_state.business_data.get('endereco', ''),
+            placeholder="Rua, número, bairro"
+        )
+        # Auto-save endereco
+        if endereco != st.session_state.business_data.get('endereco'):
+            st.session_state.business_data['endereco'] = endereco
+            save_user_data()
+        
+        col3, col4 = st.columns(2)
+        with col3:
+            cidade = st.text_input(
+                "Cidade *",
+                value=st.session_state.business_data.get('cidade', ''),
+                placeholder="Ex: São Paulo"
+            )
+            # Auto-save cidade
+            if cidade != st.session_state.business_data.get('cidade'):
+                st.session_state.business_data['cidade'] = cidade
+                save_user_data()
+        
+        with col4:
+            # Get current state value
+            estados_list = ["AC", "AL", "AP", "AM", "BA", "CE", "DF", "ES", "GO", "MA", "MT", "MS", "MG", "PA", "PB", "PR", "PE", "PI", "RJ", "RN", "RS", "RO", "RR", "SC", "SP", "SE", "TO"]
+            current_estado = st.session_state.business_data.get('estado', 'SP')
+            current_index = estados_list.index(current_estado) if current_estado in estados_list else 22
+            
+            estado = st.selectbox(
+                "Estado",
+                estados_list,
+                index=current_index
+            )
+            
+            # Auto-save immediately when changed
+            if estado != st.session_state.business_data.get('estado'):
+                st.session_state.business_data['estado'] = estado
+                save_user_data()
+    
+    with col2:
+        st.subheader("📊 Características")
+        
+        area_loja = st.number_input(
+            "Área da loja (m²) *",
+            min_value=0.0,
+            value=float(st.session_state.business_data.get('area_loja', 50)),
+            step=5.0
+        )
+        # Auto-save area_loja
+        if area_loja != st.session_state.business_data.get('area_loja'):
+            st.session_state.business_data['area_loja'] = area_loja
+            save_user_data()
+        
+        tipos_list = ["Loja de Rua", "Shopping Center", "Galeria", "Centro Comercial"]
+        current_tipo = st.session_state.business_data.get('tipo_estabelecimento', 'Loja de Rua')
+        current_tipo_index = tipos_list.index(current_tipo) if current_tipo in tipos_list else 0
+        
+        tipo_estabelecimento = st.selectbox(
+            "Tipo de estabelecimento",
+            tipos_list,
+            index=current_tipo_index
+        )
+        
+        # Auto-save immediately when changed
+        if tipo_estabelecimento != st.session_state.business_data.get('tipo_estabelecimento'):
+            st.session_state.business_data['tipo_estabelecimento'] = tipo_estabelecimento
+            save_user_data()
+        
+        exp_list = ["Nenhuma", "1-2 anos", "3-5 anos", "5+ anos"]
+        current_exp = st.session_state.business_data.get('experiencia', 'Nenhuma')
+        current_exp_index = exp_list.index(current_exp) if current_exp in exp_list else 0
+        
+        experiencia = st.selectbox(
+            "Experiência no setor",
+            exp_list,
+            index=current_exp_index
+        )
+        
+        # Auto-save immediately when changed
+        if experiencia != st.session_state.business_data.get('experiencia'):
+            st.session_state.business_data['experiencia'] = experiencia
+            save_user_data()
+        
+        objetivo_faturamento = st.number_input(
+            "Objetivo de faturamento mensal",
+            min_value=0.0,
+            value=float(st.session_state.business_data.get('objetivo_faturamento', 30000)),
+            step=1000.0,
+            format="%.0f"
+        )
+        
+        # Auto-save com validação tributária crítica
+        if objetivo_faturamento != st.session_state.business_data.get('objetivo_faturamento'):
+            # Validação crítica baseada no regime tributário
+            tipo_empresa = st.session_state.business_data.get('tipo_empresa', 'MEI')
+            receita_anual = objetivo_faturamento * 12
+            
+            if tipo_empresa == 'MEI' and receita_anual > 81000:
+                st.error(f"⚠️ **LIMITE MEI EXCEDIDO**: Faturamento anual (R$ {receita_anual:,.0f}) > R$ 81.000")
+                st.warning("**Correções necessárias:**")
+                col_corr1, col_corr2 = st.columns(2)
+                with col_corr1:
+                    if st.button("🔧 Ajustar para limite MEI", type="secondary"):
+                        objetivo_faturamento = 6750  # R$ 81.000 / 12
+                        st.session_state.business_data['objetivo_faturamento'] = objetivo_faturamento
+                        save_user_data()
+                        st.success("Meta ajustada para R$ 6.750/mês (limite MEI)")
+                        st.rerun()
+                with col_corr2:
+                    if st.button("📈 Migrar para Microempresa", type="primary"):
+                        st.session_state.business_data['tipo_empresa'] = 'Microempresa'
+                        st.session_state.business_data['objetivo_faturamento'] = objetivo_faturamento
+                        save_user_data()
+                        st.success("Regime alterado para Microempresa!")
+                        st.rerun()
+                st.stop()
+            
+            st.session_state.business_data['objetivo_faturamento'] = objetivo_faturamento
+            save_user_data()
+        st.caption(f"💰 {format_currency(objetivo_faturamento)}")
+    
+    # Visão do negócio
+    st.markdown("---")
+    st.subheader("💼 Visão do Negócio")
+    
+    col5, col6 = st.columns(2)
+    
+    with col5:
+        missao = st.text_area(
+            "Missão da empresa",
+            value=st.session_state.business_data.get('missao', ''),
+            height=80,
+            placeholder="Qual é o propósito da sua ótica? Como ela ajuda os clientes?"
+        )
+        
+        visao = st.text_area(
+            "Visão de futuro",
+            value=st.session_state.business_data.get('visao', ''),
+            height=80,
+            placeholder="Como você vê sua ótica no futuro? Onde quer chegar?"
+        )
+    
+    with col6:
+        principais_diferenciais = st.multiselect(
+            "Principais diferenciais",
+            [
+                "Atendimento personalizado",
+                "Preços competitivos", 
+                "Localização privilegiada",
+                "Tecnologia avançada",
+                "Variedade de produtos",
+                "Facilidade de pagamento",
+                "Pós-venda diferenciado",
+                "Especialização técnica"
+            ],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('principais_diferenciais', []),
+                [
+                    "Atendimento personalizado",
+                    "Preços competitivos", 
+                    "Localização privilegiada",
+                    "Tecnologia avançada",
+                    "Variedade de produtos",
+                    "Facilidade de pagamento",
+                    "Pós-venda diferenciado",
+                    "Especialização técnica"
+                ],
+                ["Atendimento personalizado"]
+            )
+        )
+        
+        valores = st.text_area(
+            "Valores e princípios",
+            value=st.session_state.business_data.get('valores', ''),
+            height=80,
+            placeholder="Quais valores guiam o trabalho da sua ótica?"
+        )
+    
+    # Estimativa automática de custos de reforma
+    if area_loja > 0 and cidade and estado:
+        st.markdown("---")
+        st.subheader("🏗️ Estimativa Automática de Custos de Reforma")
+        
+        try:
+            calc = ConstructionCostCalculator()
+            tipo_reforma_list = ["basica", "intermediaria", "completa"]
+            current_tipo_reforma = st.session_state.business_data.get('tipo_reforma', 'basica')
+            current_tipo_reforma_index = tipo_reforma_list.index(current_tipo_reforma) if current_tipo_reforma in tipo_reforma_list else 0
+            
+            tipo_reforma = st.selectbox(
+                "Tipo de reforma/adequação",
+                tipo_reforma_list,
+                index=current_tipo_reforma_index,
+                format_func=lambda x: {
+                    "basica": "Básica - Pintura e pequenos ajustes",
+                    "intermediaria": "Intermediária - Reforma moderada", 
+                    "completa": "Completa - Reforma total"
+                }[x]
+            )
+            # Auto-save tipo_reforma
+            if tipo_reforma != st.session_state.business_data.get('tipo_reforma'):
+                st.session_state.business_data['tipo_reforma'] = tipo_reforma
+                save_user_data()
+            
+            custos_reforma = calc.calculate_reform_cost(estado, cidade, area_loja, tipo_reforma)
+            
+            if custos_reforma and custos_reforma.get('custo_total_com_adicional', 0) > 0:
+                col7, col8 = st.columns([2, 1])
+                
+                with col7:
+                    st.success(f"💰 **Custo estimado da reforma:** {format_currency(custos_reforma['custo_total_com_adicional'])}")
+                    st.info(f"📍 **Baseado em:** {custos_reforma['regiao']} - {cidade}/{estado}")
+                    
+                    # Breakdown detalhado
+                    if st.checkbox("Ver detalhamento dos custos"):
+                        breakdown = calc.format_cost_breakdown(custos_reforma)
+                        st.text(breakdown)
+                
+                with col8:
+                    # Comparação regional
+                    if st.checkbox("Comparar com outras regiões"):
+                        comparacao = calc.get_market_comparison(estado)
+                        if comparacao:
+                            df_comp = pd.DataFrame(comparacao).T
+                            df_comp = df_comp.round(0)
+                            
+                            # Format as currency
+                            for col in df_comp.columns:
+                                df_comp[col] = df_comp[col].apply(lambda x: format_currency(x))
+                            
+                            st.dataframe(df_comp, use_container_width=True)
+                
+                # Store reform data for use in investment calculation
+                st.session_state.business_data['custos_reforma'] = custos_reforma
+                st.session_state.business_data['tipo_reforma_escolhida'] = tipo_reforma
+        except Exception as e:
+            st.warning("Sistema de reforma temporariamente indisponível")
+    else:
+        st.info("ℹ️ Complete área da loja, cidade e estado para ver estimativa de reforma automaticamente")
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'nome_otica': nome_otica,
+        'cnpj': cnpj,
+        'tipo_empresa': tipo_empresa,
+        'endereco': endereco,
+        'cidade': cidade,
+        'estado': estado,
+        'area_loja': area_loja,
+        'tipo_estabelecimento': tipo_estabelecimento,
+        'experiencia': experiencia,
+        'objetivo_faturamento': objetivo_faturamento,
+        'missao': missao,
+        'visao': visao,
+        'principais_diferenciais': principais_diferenciais,
+        'valores': valores
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step1"):
+            st.session_state.step = 2
+            st.rerun()
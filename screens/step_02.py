@@ -0,0 +1,192 @@
+"""
+Etapa 2 - Análise de Mercado
+Panorama do mercado óptico local e oportunidades
+"""
+
+import streamlit as st
+
+from app_helpers import safe_multiselect_default, save_user_data
+
+
+def show_step_2():
+    """Etapa 2: Análise de Mercado"""
+    st.header("2️⃣ Análise de Mercado")
+    st.markdown("**FASE 2: MERCADO** - Entenda seu mercado e concorrência")
+    
+    # Tabs para organizar análise de mercado
+    tab1, tab2 = st.tabs(["📊 Panorama do Mercado", "📈 Oportunidades"])
+    
+    with tab1:
+        st.subheader("📊 Mercado Óptico Local")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            populacao_cidade = st.number_input(
+                "População estimada da cidade",
+                min_value=0,
+                value=int(st.session_state.business_data.get('populacao_cidade', 100000)),
+                step=5000
+            )
+            # Auto-save populacao_cidade
+            if populacao_cidade != st.session_state.business_data.get('populacao_cidade'):
+                st.session_state.business_data['populacao_cidade'] = populacao_cidade
+                save_user_data()
+            
+            renda_list = ["Baixa (até R$ 2.000)", "Média (R$ 2.000-5.000)", "Alta (R$ 5.000+)", "Mista"]
+            current_renda = st.session_state.business_data.get('renda_media', 'Média (R$ 2.000-5.000)')
+            current_renda_index = renda_list.index(current_renda) if current_renda in renda_list else 1
+            
+            renda_media = st.selectbox(
+                "Renda média da população",
+                renda_list,
+                index=current_renda_index
+            )
+            # Auto-save renda_media
+            if renda_media != st.session_state.business_data.get('renda_media'):
+                st.session_state.business_data['renda_media'] = renda_media
+                save_user_data()
+            
+            potencial_list = ["Baixo", "Médio", "Alto", "Muito Alto"]
+            current_potencial = st.session_state.business_data.get('potencial_mercado', 'Médio')
+            current_potencial_index = potencial_list.index(current_potencial) if current_potencial in potencial_list else 1
+            
+            potencial_mercado = st.selectbox(
+                "Potencial do mercado local",
+                potencial_list,
+                index=current_potencial_index
+            )
+            # Auto-save potencial_mercado
+            if potencial_mercado != st.session_state.business_data.get('potencial_mercado'):
+                st.session_state.business_data['potencial_mercado'] = potencial_mercado
+                save_user_data()
+        
+        with col2:
+            concorrencia_local = st.number_input(
+                "Número de óticas concorrentes na região",
+                min_value=0,
+                value=int(st.session_state.business_data.get('concorrencia_local', 3)),
+                step=1
+            )
+            # Auto-save concorrencia_local
+            if concorrencia_local != st.session_state.business_data.get('concorrencia_local'):
+                st.session_state.business_data['concorrencia_local'] = concorrencia_local
+                save_user_data()
+            
+            sazonalidade = st.multiselect(
+                "Períodos de maior demanda",
+                ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", 
+                 "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro", "O ano todo"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('sazonalidade', []),
+                    ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", 
+                     "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro", "O ano todo"],
+                    ["Janeiro"]
+                )
+            )
+            # Auto-save sazonalidade
+            if sazonalidade != st.session_state.business_data.get('sazonalidade'):
+                st.session_state.business_data['sazonalidade'] = sazonalidade
+                save_user_data()
+            
+            tendencias_mercado = st.text_area(
+                "Tendências observadas no mercado",
+                value=st.session_state.business_data.get('tendencias_mercado', ''),
+                height=100,
+                placeholder="Ex: Aumento da miopia, lentes multifocais, óculos de proteção..."
+            )
+            # Auto-save tendencias_mercado
+            if tendencias_mercado != st.session_state.business_data.get('tendencias_mercado'):
+                st.session_state.business_data['tendencias_mercado'] = tendencias_mercado
+                save_user_data()
+    
+    with tab2:
+        st.subheader("📈 Oportunidades de Mercado")
+        
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            oportunidades = st.multiselect(
+                "Oportunidades identificadas",
+                ["Mercado não saturado", "Poucos concorrentes", "Demanda crescente", "Localização estratégica", 
+                 "Falta de especialização", "Preços elevados na região", "Atendimento deficiente dos concorrentes"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('oportunidades', []),
+                    ["Mercado não saturado", "Poucos concorrentes", "Demanda crescente", "Localização estratégica", 
+                     "Falta de especialização", "Preços elevados na região", "Atendimento deficiente dos concorrentes"],
+                    ["Demanda crescente"]
+                )
+            )
+            # Auto-save oportunidades
+            if oportunidades != st.session_state.business_data.get('oportunidades'):
+                st.session_state.business_data['oportunidades'] = oportunidades
+                save_user_data()
+            
+            publicos_nao_atendidos = st.text_area(
+                "Públicos não bem atendidos",
+                value=st.session_state.business_data.get('publicos_nao_atendidos', ''),
+                height=100,
+                placeholder="Idosos, crianças, pessoas com necessidades especiais..."
+            )
+            # Auto-save publicos_nao_atendidos
+            if publicos_nao_atendidos != st.session_state.business_data.get('publicos_nao_atendidos'):
+                st.session_state.business_data['publicos_nao_atendidos'] = publicos_nao_atendidos
+                save_user_data()
+        
+        with col4:
+            barreiras_entrada = st.multiselect(
+                "Principais barreiras de entrada",
+                ["Alto investimento inicial", "Necessidade de especialização", "Concorrência estabelecida", 
+                 "Regulamentações", "Fornecedores limitados", "Localização escassa"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('barreiras_entrada', []),
+                    ["Alto investimento inicial", "Necessidade de especialização", "Concorrência estabelecida", 
+                     "Regulamentações", "Fornecedores limitados", "Localização escassa"],
+                    ["Alto investimento inicial"]
+                )
+            )
+            # Auto-save barreiras_entrada
+            if barreiras_entrada != st.session_state.business_data.get('barreiras_entrada'):
+                st.session_state.business_data['barreiras_entrada'] = barreiras_entrada
+                save_user_data()
+            
+            estrategia_entrada = st.text_area(
+                "Estratégia para superar barreiras",
+                value=st.session_state.business_data.get('estrategia_entrada', ''),
+                height=100,
+                placeholder="Como você pretende entrar e se estabelecer no mercado?"
+            )
+            # Auto-save estrategia_entrada
+            if estrategia_entrada != st.session_state.business_data.get('estrategia_entrada'):
+                st.session_state.business_data['estrategia_entrada'] = estrategia_entrada
+                save_user_data()
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'populacao_cidade': populacao_cidade,
+        'renda_media': renda_media,
+        'potencial_mercado': potencial_mercado,
+        'concorrencia_local': concorrencia_local,
+        'sazonalidade': sazonalidade,
+        'tendencias_mercado': tendencias_mercado,
+        'oportunidades': oportunidades,
+        'publicos_nao_atendidos': publicos_nao_atendidos,
+        'barreiras_entrada': barreiras_entrada,
+        'estrategia_entrada': estrategia_entrada
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step2"):
+            st.session_state.step = 1
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step2"):
+            st.session_state.step = 3
+            st.rerun()
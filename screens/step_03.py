@@ -0,0 +1,199 @@
+"""
+Etapa 3 - Público-Alvo
+Segmentação do público-alvo e estratégias de abordagem
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, safe_multiselect_default, save_user_data
+
+
+def show_step_3():
+    """Etapa 3: Público-Alvo"""
+    st.header("3️⃣ Público-Alvo")
+    st.markdown("**FASE 3: CLIENTES** - Defina e entenda seu público-alvo")
+    
+    # Segmentação do público
+    st.subheader("🎯 Segmentação do Público-Alvo")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**👥 Demografia Principal**")
+        
+        faixa_etaria_principal = st.multiselect(
+            "Faixa etária principal",
+            ["18-25 anos", "26-35 anos", "36-45 anos", "46-60 anos", "60+ anos"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('faixa_etaria_principal', []),
+                ["18-25 anos", "26-35 anos", "36-45 anos", "46-60 anos", "60+ anos"],
+                ["36-45 anos"]
+            )
+        )
+        # Auto-save faixa_etaria_principal
+        if faixa_etaria_principal != st.session_state.business_data.get('faixa_etaria_principal'):
+            st.session_state.business_data['faixa_etaria_principal'] = faixa_etaria_principal
+            save_user_data()
+        
+        classe_social = st.multiselect(
+            "Classe social",
+            ["Classe A", "Classe B", "Classe C", "Classe D"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('classe_social', []),
+                ["Classe A", "Classe B", "Classe C", "Classe D"],
+                ["Classe B", "Classe C"]
+            )
+        )
+        # Auto-save classe_social
+        if classe_social != st.session_state.business_data.get('classe_social'):
+            st.session_state.business_data['classe_social'] = classe_social
+            save_user_data()
+        
+        perfil_profissional = st.multiselect(
+            "Perfil profissional",
+            ["Estudantes", "Profissionais liberais", "Funcionários CLT", "Aposentados", "Autônomos", "Empresários"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('perfil_profissional', []),
+                ["Estudantes", "Profissionais liberais", "Funcionários CLT", "Aposentados", "Autônomos", "Empresários"],
+                ["Funcionários CLT"]
+            )
+        )
+        # Auto-save perfil_profissional
+        if perfil_profissional != st.session_state.business_data.get('perfil_profissional'):
+            st.session_state.business_data['perfil_profissional'] = perfil_profissional
+            save_user_data()
+    
+    with col2:
+        st.markdown("**🛍️ Comportamento de Compra**")
+        
+        necessidades_principais = st.multiselect(
+            "Necessidades principais",
+            ["Óculos de grau", "Óculos de sol", "Lentes de contato", "Exames oftalmológicos", "Óculos infantis", "Óculos de proteção"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('necessidades_principais', []),
+                ["Óculos de grau", "Óculos de sol", "Lentes de contato", "Exames oftalmológicos", "Óculos infantis", "Óculos de proteção"],
+                ["Óculos de grau"]
+            )
+        )
+        # Auto-save necessidades_principais
+        if necessidades_principais != st.session_state.business_data.get('necessidades_principais'):
+            st.session_state.business_data['necessidades_principais'] = necessidades_principais
+            save_user_data()
+        
+        freq_list = ["Anual", "A cada 2 anos", "A cada 3-4 anos", "Esporádica"]
+        current_freq = st.session_state.business_data.get('frequencia_compra', 'A cada 2 anos')
+        current_freq_index = freq_list.index(current_freq) if current_freq in freq_list else 1
+        
+        frequencia_compra = st.selectbox(
+            "Frequência de compra",
+            freq_list,
+            index=current_freq_index
+        )
+        # Auto-save frequencia_compra
+        if frequencia_compra != st.session_state.business_data.get('frequencia_compra'):
+            st.session_state.business_data['frequencia_compra'] = frequencia_compra
+            save_user_data()
+        
+        # Usar o mesmo ticket_medio da Etapa 10 para consistência
+        ticket_medio_etapa10 = st.session_state.business_data.get('ticket_medio', 460)
+        ticket_medio_esperado = st.number_input(
+            "Ticket médio esperado",
+            min_value=0.0,
+            value=float(ticket_medio_etapa10),
+            step=50.0,
+            format="%.0f",
+            help=f"Valor sincronizado com Etapa 10: {format_currency(ticket_medio_etapa10)}"
+        )
+        # Sincronizar ambas as chaves para manter consistência
+        if ticket_medio_esperado != st.session_state.business_data.get('ticket_medio'):
+            st.session_state.business_data['ticket_medio'] = ticket_medio_esperado
+            st.session_state.business_data['ticket_medio_esperado'] = ticket_medio_esperado
+            save_user_data()
+        st.caption(f"💰 {format_currency(ticket_medio_esperado)}")
+        
+        fatores_decisao = st.multiselect(
+            "Fatores de decisão de compra",
+            ["Preço", "Qualidade", "Atendimento", "Localização", "Variedade", "Marca", "Facilidade de pagamento"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('fatores_decisao', []),
+                ["Preço", "Qualidade", "Atendimento", "Localização", "Variedade", "Marca", "Facilidade de pagamento"],
+                ["Preço", "Qualidade"]
+            )
+        )
+        # Auto-save fatores_decisao
+        if fatores_decisao != st.session_state.business_data.get('fatores_decisao'):
+            st.session_state.business_data['fatores_decisao'] = fatores_decisao
+            save_user_data()
+    
+    # Estratégias de abordagem
+    st.markdown("---")
+    st.subheader("📢 Estratégias de Abordagem do Público")
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        canais_comunicacao = st.multiselect(
+            "Canais de comunicação preferidos",
+            ["Instagram", "Facebook", "WhatsApp", "Google Ads", "Panfletos", "Rádio local", "Indicações"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('canais_comunicacao', []),
+                ["Instagram", "Facebook", "WhatsApp", "Google Ads", "Panfletos", "Rádio local", "Indicações"],
+                ["Instagram", "Facebook"]
+            )
+        )
+        
+        horarios_preferidos = st.multiselect(
+            "Horários de maior movimento",
+            ["Manhã (8h-12h)", "Tarde (12h-18h)", "Noite (18h-22h)", "Finais de semana"],
+            default=safe_multiselect_default(
+                st.session_state.business_data.get('horarios_preferidos', []),
+                ["Manhã (8h-12h)", "Tarde (12h-18h)", "Noite (18h-22h)", "Finais de semana"],
+                ["Tarde (12h-18h)"]
+            )
+        )
+    
+    with col4:
+        perfil_detalhado = st.text_area(
+            "Perfil detalhado do cliente ideal",
+            value=st.session_state.business_data.get('perfil_detalhado', ''),
+            height=120,
+            placeholder="Descreva seu cliente ideal: necessidades, comportamento, poder aquisitivo, motivações..."
+        )
+        
+        estrategia_atracao = st.text_area(
+            "Estratégia para atrair este público",
+            value=st.session_state.business_data.get('estrategia_atracao', ''),
+            height=120,
+            placeholder="Como você pretende atrair e conquistar estes clientes?"
+        )
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'faixa_etaria_principal': faixa_etaria_principal,
+        'classe_social': classe_social,
+        'perfil_profissional': perfil_profissional,
+        'necessidades_principais': necessidades_principais,
+        'frequencia_compra': frequencia_compra,
+        'ticket_medio_esperado': ticket_medio_esperado,
+        'fatores_decisao': fatores_decisao,
+        'canais_comunicacao': canais_comunicacao,
+        'horarios_preferidos': horarios_preferidos,
+        'perfil_detalhado': perfil_detalhado,
+        'estrategia_atracao': estrategia_atracao
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step3"):
+            st.session_state.step = 2
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step3"):
+            st.session_state.step = 4
+            st.rerun()
@@ -0,0 +1,318 @@
+"""
+Etapa 4 - Concorrência
+Mapeamento dos concorrentes, análise comparativa e posicionamento
+"""
+
+import streamlit as st
+
+from app_helpers import safe_multiselect_default, save_user_data
+
+
+def show_step_4():
+    """Etapa 4: Concorrência"""
+    st.header("4️⃣ Análise da Concorrência")
+    st.markdown("**FASE 4: CONCORRÊNCIA** - Conheça seus concorrentes e defina vantagens")
+    
+    # Tabs para organizar análise da concorrência
+    tab1, tab2, tab3 = st.tabs(["🏪 Mapeamento de Concorrentes", "📊 Análise Comparativa", "🎯 Posicionamento"])
+    
+    with tab1:
+        st.subheader("🏪 Identificação dos Concorrentes")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Concorrentes Diretos**")
+            
+            num_concorrentes = st.number_input(
+                "Quantos concorrentes diretos identificou?",
+                min_value=0,
+                max_value=20,
+                value=int(st.session_state.business_data.get('num_concorrentes', 3)),
+                step=1
+            )
+            # Auto-save num_concorrentes
+            if num_concorrentes != st.session_state.business_data.get('num_concorrentes'):
+                st.session_state.business_data['num_concorrentes'] = num_concorrentes
+                save_user_data()
+            
+            if num_concorrentes > 0:
+                concorrentes_info = st.session_state.business_data.get('concorrentes_info', [])
+                
+                # Ensure we have enough entries
+                while len(concorrentes_info) < num_concorrentes:
+                    concorrentes_info.append({
+                        'nome': '',
+                        'localizacao': '',
+                        'porte': 'Pequeno',
+                        'tempo_mercado': 'Menos de 2 anos'
+                    })
+                
+                # Remove excess entries
+                concorrentes_info = concorrentes_info[:num_concorrentes]
+                
+                for i in range(num_concorrentes):
+                    with st.expander(f"Concorrente {i+1}"):
+                        concorrentes_info[i]['nome'] = st.text_input(
+                            "Nome da ótica",
+                            value=concorrentes_info[i].get('nome', ''),
+                            key=f"conc_nome_{i}"
+                        )
+                        
+                        concorrentes_info[i]['localizacao'] = st.text_input(
+                            "Localização",
+                            value=concorrentes_info[i].get('localizacao', ''),
+                            key=f"conc_loc_{i}",
+                            placeholder="Rua/Bairro"
+                        )
+                        
+                        porte_list = ["Pequeno", "Médio", "Grande", "Rede"]
+                        current_porte = concorrentes_info[i].get('porte', 'Pequeno')
+                        current_porte_index = porte_list.index(current_porte) if current_porte in porte_list else 0
+                        
+                        concorrentes_info[i]['porte'] = st.selectbox(
+                            "Porte",
+                            porte_list,
+                            index=current_porte_index,
+                            key=f"conc_porte_{i}"
+                        )
+                        
+                        tempo_list = ["Menos de 2 anos", "2-5 anos", "5-10 anos", "Mais de 10 anos"]
+                        current_tempo = concorrentes_info[i].get('tempo_mercado', 'Menos de 2 anos')
+                        current_tempo_index = tempo_list.index(current_tempo) if current_tempo in tempo_list else 0
+                        
+                        concorrentes_info[i]['tempo_mercado'] = st.selectbox(
+                            "Tempo no mercado",
+                            tempo_list,
+                            index=current_tempo_index,
+                            key=f"conc_tempo_{i}"
+                        )
+                
+                # Auto-save concorrentes_info
+                if concorrentes_info != st.session_state.business_data.get('concorrentes_info'):
+                    st.session_state.business_data['concorrentes_info'] = concorrentes_info
+                    save_user_data()
+        
+        with col2:
+            st.markdown("**Análise do Ambiente Competitivo**")
+            
+            nivel_list = ["Baixa", "Moderada", "Alta", "Muito Alta"]
+            current_nivel = st.session_state.business_data.get('nivel_concorrencia', 'Moderada')
+            current_nivel_index = nivel_list.index(current_nivel) if current_nivel in nivel_list else 1
+            
+            nivel_concorrencia = st.selectbox(
+                "Nível de concorrência na região",
+                nivel_list,
+                index=current_nivel_index
+            )
+            # Auto-save nivel_concorrencia
+            if nivel_concorrencia != st.session_state.business_data.get('nivel_concorrencia'):
+                st.session_state.business_data['nivel_concorrencia'] = nivel_concorrencia
+                save_user_data()
+            
+            tipos_concorrentes = st.multiselect(
+                "Tipos de concorrentes presentes",
+                ["Óticas independentes", "Redes nacionais", "Óticas de farmácias", "Óticas online", "Consultórios oftalmológicos"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('tipos_concorrentes', []),
+                    ["Óticas independentes", "Redes nacionais", "Óticas de farmácias", "Óticas online", "Consultórios oftalmológicos"],
+                    ["Óticas independentes"]
+                )
+            )
+            # Auto-save tipos_concorrentes
+            if tipos_concorrentes != st.session_state.business_data.get('tipos_concorrentes'):
+                st.session_state.business_data['tipos_concorrentes'] = tipos_concorrentes
+                save_user_data()
+            
+            barreiras_competitivas = st.multiselect(
+                "Principais barreiras competitivas",
+                ["Preços baixos", "Localização privilegiada", "Marca consolidada", "Variedade de produtos", 
+                 "Atendimento especializado", "Convênios", "Facilidades de pagamento"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('barreiras_competitivas', []),
+                    ["Preços baixos", "Localização privilegiada", "Marca consolidada", "Variedade de produtos", 
+                     "Atendimento especializado", "Convênios", "Facilidades de pagamento"],
+                    ["Preços baixos"]
+                )
+            )
+            # Auto-save barreiras_competitivas
+            if barreiras_competitivas != st.session_state.business_data.get('barreiras_competitivas'):
+                st.session_state.business_data['barreiras_competitivas'] = barreiras_competitivas
+                save_user_data()
+    
+    with tab2:
+        st.subheader("📊 Análise Comparativa")
+        
+        if num_concorrentes > 0:
+            st.markdown("**Comparação por Critérios**")
+            
+            # Create comparison matrix
+            criterios = ["Preços", "Variedade", "Atendimento", "Localização", "Marketing", "Tecnologia"]
+            
+            col1, col2 = st.columns([1, 2])
+            
+            with col1:
+                st.markdown("**Critérios de Avaliação:**")
+                for criterio in criterios:
+                    st.markdown(f"• {criterio}")
+                
+                st.markdown("**Escala:** 1-5 (1=Muito Fraco, 5=Excelente)")
+            
+            with col2:
+                # Initialize comparison data
+                comparacao_data = st.session_state.business_data.get('comparacao_concorrentes', {})
+                
+                for criterio in criterios:
+                    if criterio not in comparacao_data:
+                        comparacao_data[criterio] = {}
+                    
+                    st.markdown(f"**{criterio}**")
+                    cols = st.columns(min(num_concorrentes + 1, 4))  # Limit columns to prevent layout issues
+                    
+                    # Your business column
+                    with cols[0]:
+                        st.markdown("*Sua ótica*")
+                        comparacao_data[criterio]['sua_otica'] = st.slider(
+                            "Sua nota",
+                            1, 5, 
+                            comparacao_data[criterio].get('sua_otica', 3),
+                            key=f"sua_{criterio.lower()}"
+                        )
+                    
+                    # Competitor columns
+                    for i in range(min(num_concorrentes, 3)):  # Show max 3 competitors
+                        if i + 1 < len(cols):
+                            with cols[i + 1]:
+                                conc_name = concorrentes_info[i].get('nome', f'Concorrente {i+1}')[:15]
+                                st.markdown(f"*{conc_name}*")
+                                comparacao_data[criterio][f'concorrente_{i}'] = st.slider(
+                                    "Nota",
+                                    1, 5,
+                                    comparacao_data[criterio].get(f'concorrente_{i}', 3),
+                                    key=f"conc_{i}_{criterio.lower()}"
+                                )
+                
+                # Auto-save comparison data
+                st.session_state.business_data['comparacao_concorrentes'] = comparacao_data
+                save_user_data()
+        
+        else:
+            st.info("Configure os concorrentes na primeira aba para fazer a análise comparativa")
+    
+    with tab3:
+        st.subheader("🎯 Seu Posicionamento Competitivo")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Análise dos Pontos Fortes e Fracos**")
+            
+            forcas = st.text_area(
+                "✅ Pontos Fortes do seu negócio",
+                value=st.session_state.business_data.get('forcas', ''),
+                height=100,
+                placeholder="Ex: Atendimento personalizado, localização estratégica, preços justos..."
+            )
+            # Auto-save forcas
+            if forcas != st.session_state.business_data.get('forcas'):
+                st.session_state.business_data['forcas'] = forcas
+                save_user_data()
+            
+            fraquezas = st.text_area(
+                "⚠️ Pontos que precisa melhorar",
+                value=st.session_state.business_data.get('fraquezas', ''),
+                height=100,
+                placeholder="Ex: Marca nova no mercado, orçamento limitado, pouca experiência..."
+            )
+            # Auto-save fraquezas
+            if fraquezas != st.session_state.business_data.get('fraquezas'):
+                st.session_state.business_data['fraquezas'] = fraquezas
+                save_user_data()
+        
+        with col2:
+            oportunidades = st.text_area(
+                "🎯 Oportunidades no mercado",
+                value=st.session_state.business_data.get('oportunidades_swot', ''),
+                height=100,
+                placeholder="Ex: Mercado crescente, concorrentes com atendimento ruim, poucos especialistas..."
+            )
+            # Auto-save oportunidades_swot
+            if oportunidades != st.session_state.business_data.get('oportunidades_swot'):
+                st.session_state.business_data['oportunidades_swot'] = oportunidades
+                save_user_data()
+            
+            ameacas = st.text_area(
+                "🚨 Riscos externos",
+                value=st.session_state.business_data.get('ameacas', ''),
+                height=100,
+                placeholder="Ex: Entrada de grandes redes, crise econômica, mudanças na legislação..."
+            )
+            # Auto-save ameacas
+            if ameacas != st.session_state.business_data.get('ameacas'):
+                st.session_state.business_data['ameacas'] = ameacas
+                save_user_data()
+        
+        st.markdown("---")
+        
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            diferenciais_competitivos = st.multiselect(
+                "Seus principais diferenciais competitivos",
+                ["Preços competitivos", "Atendimento personalizado", "Tecnologia avançada", 
+                 "Variedade de produtos", "Rapidez na entrega", "Localização privilegiada",
+                 "Especialização técnica", "Parcerias estratégicas", "Horário diferenciado"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('diferenciais_competitivos', []),
+                    ["Preços competitivos", "Atendimento personalizado", "Tecnologia avançada", 
+                     "Variedade de produtos", "Rapidez na entrega", "Localização privilegiada",
+                     "Especialização técnica", "Parcerias estratégicas", "Horário diferenciado"],
+                    ["Atendimento personalizado"]
+                )
+            )
+            # Auto-save diferenciais_competitivos
+            if diferenciais_competitivos != st.session_state.business_data.get('diferenciais_competitivos'):
+                st.session_state.business_data['diferenciais_competitivos'] = diferenciais_competitivos
+                save_user_data()
+        
+        with col4:
+            estrategia_posicionamento = st.text_area(
+                "Estratégia de posicionamento",
+                value=st.session_state.business_data.get('estrategia_posicionamento', ''),
+                height=120,
+                placeholder="Como você pretende se posicionar no mercado em relação aos concorrentes?"
+            )
+            # Auto-save estrategia_posicionamento
+            if estrategia_posicionamento != st.session_state.business_data.get('estrategia_posicionamento'):
+                st.session_state.business_data['estrategia_posicionamento'] = estrategia_posicionamento
+                save_user_data()
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'num_concorrentes': num_concorrentes,
+        'nivel_concorrencia': nivel_concorrencia,
+        'tipos_concorrentes': tipos_concorrentes,
+        'barreiras_competitivas': barreiras_competitivas,
+        'forcas': forcas,
+        'fraquezas': fraquezas,
+        'oportunidades_swot': oportunidades,
+        'ameacas': ameacas,
+        'diferenciais_competitivos': diferenciais_competitivos,
+        'estrategia_posicionamento': estrategia_posicionamento
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step4"):
+            st.session_state.step = 3
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step4"):
+            st.session_state.step = 5
+            st.rerun()
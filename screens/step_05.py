@@ -0,0 +1,543 @@
+"""
+Etapa 5 - Produtos e Serviços
+Catálogo de produtos, serviços oferecidos e estratégia de preços
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, safe_multiselect_default, save_user_data
+
+
+def show_step_5():
+    """Etapa 5: Produtos e Serviços"""
+    st.header("5️⃣ Produtos e Serviços")
+    st.markdown("**FASE 5: PRODUTOS** - Configure produtos, fornecedores e margens")
+    
+    # Tabs para organizar produtos e serviços
+    tab1, tab2, tab3 = st.tabs(["👓 Produtos Principais", "🔧 Serviços", "💰 Estratégia de Preços"])
+    
+    with tab1:
+        st.subheader("👓 Catálogo de Produtos")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Categorias de Produtos**")
+            
+            categorias_produtos = st.multiselect(
+                "Produtos que pretende vender",
+                ["Óculos de grau", "Óculos de sol", "Lentes de contato", "Armações", 
+                 "Lentes oftálmicas", "Óculos infantis", "Óculos de proteção", "Acessórios"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('categorias_produtos', []),
+                    ["Óculos de grau", "Óculos de sol", "Lentes de contato", "Armações", 
+                     "Lentes oftálmicas", "Óculos infantis", "Óculos de proteção", "Acessórios"],
+                    ["Óculos de grau", "Óculos de sol"]
+                )
+            )
+            # Auto-save categorias_produtos
+            if categorias_produtos != st.session_state.business_data.get('categorias_produtos'):
+                st.session_state.business_data['categorias_produtos'] = categorias_produtos
+                save_user_data()
+            
+            marcas_trabalhar = st.text_area(
+                "Marcas que pretende trabalhar",
+                value=st.session_state.business_data.get('marcas_trabalhar', ''),
+                height=100,
+                placeholder="Ex: Ray-Ban, Oakley, Chilli Beans, Atitude, Prada..."
+            )
+            # Auto-save marcas_trabalhar
+            if marcas_trabalhar != st.session_state.business_data.get('marcas_trabalhar'):
+                st.session_state.business_data['marcas_trabalhar'] = marcas_trabalhar
+                save_user_data()
+            
+            faixa_preco_produtos = st.selectbox(
+                "Faixa de preço principal dos produtos",
+                ["Econômica (R$ 50-200)", "Intermediária (R$ 200-500)", "Premium (R$ 500-1000)", "Luxo (R$ 1000+)", "Mista"],
+                index=["Econômica (R$ 50-200)", "Intermediária (R$ 200-500)", "Premium (R$ 500-1000)", "Luxo (R$ 1000+)", "Mista"].index(
+                    st.session_state.business_data.get('faixa_preco_produtos', 'Intermediária (R$ 200-500)')
+                )
+            )
+            # Auto-save faixa_preco_produtos
+            if faixa_preco_produtos != st.session_state.business_data.get('faixa_preco_produtos'):
+                st.session_state.business_data['faixa_preco_produtos'] = faixa_preco_produtos
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Fornecedores e Parcerias**")
+            
+            tipos_fornecedores = st.multiselect(
+                "Tipos de fornecedores",
+                ["Distribuidores nacionais", "Importadores", "Fabricantes diretos", "Representantes regionais", 
+                 "Marketplace B2B", "Cooperativas de compra"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('tipos_fornecedores', []),
+                    ["Distribuidores nacionais", "Importadores", "Fabricantes diretos", "Representantes regionais", 
+                     "Marketplace B2B", "Cooperativas de compra"],
+                    ["Distribuidores nacionais"]
+                )
+            )
+            # Auto-save tipos_fornecedores
+            if tipos_fornecedores != st.session_state.business_data.get('tipos_fornecedores'):
+                st.session_state.business_data['tipos_fornecedores'] = tipos_fornecedores
+                save_user_data()
+            
+            criterios_fornecedores = st.multiselect(
+                "Critérios para escolha de fornecedores",
+                ["Preço competitivo", "Qualidade dos produtos", "Prazo de entrega", "Condições de pagamento", 
+                 "Suporte técnico", "Variedade de produtos", "Exclusividade territorial"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('criterios_fornecedores', []),
+                    ["Preço competitivo", "Qualidade dos produtos", "Prazo de entrega", "Condições de pagamento", 
+                     "Suporte técnico", "Variedade de produtos", "Exclusividade territorial"],
+                    ["Preço competitivo", "Qualidade dos produtos"]
+                )
+            )
+            # Auto-save criterios_fornecedores
+            if criterios_fornecedores != st.session_state.business_data.get('criterios_fornecedores'):
+                st.session_state.business_data['criterios_fornecedores'] = criterios_fornecedores
+                save_user_data()
+            
+            estoque_inicial = st.number_input(
+                "Investimento inicial em estoque (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('estoque_inicial', 15000)),
+                step=1000.0,
+                format="%.0f"
+            )
+            # Auto-save estoque_inicial
+            if estoque_inicial != st.session_state.business_data.get('estoque_inicial'):
+                st.session_state.business_data['estoque_inicial'] = estoque_inicial
+                save_user_data()
+            st.caption(f"💰 {format_currency(estoque_inicial)}")
+    
+    with tab2:
+        st.subheader("🔧 Serviços Oferecidos")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Serviços Principais**")
+            
+            servicos_oferecidos = st.multiselect(
+                "Serviços que pretende oferecer",
+                ["Exame de vista", "Montagem de óculos", "Ajustes e reparos", "Limpeza e manutenção", 
+                 "Consultoria em óculos", "Entrega domiciliar", "Garantia estendida", "Troca de lentes"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('servicos_oferecidos', []),
+                    ["Exame de vista", "Montagem de óculos", "Ajustes e reparos", "Limpeza e manutenção", 
+                     "Consultoria em óculos", "Entrega domiciliar", "Garantia estendida", "Troca de lentes"],
+                    ["Montagem de óculos", "Ajustes e reparos"]
+                )
+            )
+            # Auto-save servicos_oferecidos
+            if servicos_oferecidos != st.session_state.business_data.get('servicos_oferecidos'):
+                st.session_state.business_data['servicos_oferecidos'] = servicos_oferecidos
+                save_user_data()
+            
+            if "Exame de vista" in servicos_oferecidos:
+                parcerias_medicas = st.text_area(
+                    "Parcerias com oftalmologistas",
+                    value=st.session_state.business_data.get('parcerias_medicas', ''),
+                    height=80,
+                    placeholder="Descreva como pretende oferecer exames de vista..."
+                )
+                # Auto-save parcerias_medicas
+                if parcerias_medicas != st.session_state.business_data.get('parcerias_medicas'):
+                    st.session_state.business_data['parcerias_medicas'] = parcerias_medicas
+                    save_user_data()
+        
+        with col2:
+            st.markdown("**Diferenciais nos Serviços**")
+            
+            diferenciais_servicos = st.multiselect(
+                "Diferenciais que oferecerá",
+                ["Atendimento personalizado", "Serviço 24h/emergência", "Garantia vitalícia de ajustes", 
+                 "Programa de fidelidade", "Parcelamento facilitado", "Troca sem custos", "Consultoria especializada"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('diferenciais_servicos', []),
+                    ["Atendimento personalizado", "Serviço 24h/emergência", "Garantia vitalícia de ajustes", 
+                     "Programa de fidelidade", "Parcelamento facilitado", "Troca sem custos", "Consultoria especializada"],
+                    ["Atendimento personalizado"]
+                )
+            )
+            # Auto-save diferenciais_servicos
+            if diferenciais_servicos != st.session_state.business_data.get('diferenciais_servicos'):
+                st.session_state.business_data['diferenciais_servicos'] = diferenciais_servicos
+                save_user_data()
+            
+            tempo_entrega = st.selectbox(
+                "Tempo de entrega prometido",
+                ["Mesmo dia", "24 horas", "2-3 dias", "1 semana", "Conforme complexidade"],
+                index=["Mesmo dia", "24 horas", "2-3 dias", "1 semana", "Conforme complexidade"].index(
+                    st.session_state.business_data.get('tempo_entrega', '2-3 dias')
+                )
+            )
+            # Auto-save tempo_entrega
+            if tempo_entrega != st.session_state.business_data.get('tempo_entrega'):
+                st.session_state.business_data['tempo_entrega'] = tempo_entrega
+                save_user_data()
+    
+    with tab3:
+        st.subheader("💰 Estratégia de Preços")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Política de Preços**")
+            
+            estrategia_precificacao = st.selectbox(
+                "Estratégia de precificação",
+                ["Preços competitivos", "Premium/diferenciação", "Penetração (preços baixos)", "Preços psicológicos", "Valor percebido"],
+                index=["Preços competitivos", "Premium/diferenciação", "Penetração (preços baixos)", "Preços psicológicos", "Valor percebido"].index(
+                    st.session_state.business_data.get('estrategia_precificacao', 'Preços competitivos')
+                )
+            )
+            # Auto-save estrategia_precificacao
+            if estrategia_precificacao != st.session_state.business_data.get('estrategia_precificacao'):
+                st.session_state.business_data['estrategia_precificacao'] = estrategia_precificacao
+                save_user_data()
+            
+            margem_produtos = st.slider(
+                "Margem de lucro média nos produtos (%)",
+                min_value=10,
+                max_value=900,
+                value=int(st.session_state.business_data.get('margem_produtos', 100)),
+                step=10
+            )
+            # Auto-save margem_produtos
+            if margem_produtos != st.session_state.business_data.get('margem_produtos'):
+                st.session_state.business_data['margem_produtos'] = margem_produtos
+                save_user_data()
+            st.caption(f"Margem: {margem_produtos}%")
+            
+            formas_pagamento = st.multiselect(
+                "Formas de pagamento aceitas",
+                ["Dinheiro", "PIX", "Cartão débito", "Cartão crédito", "Cartão crediário", "Boleto", "Financiamento próprio"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('formas_pagamento', []),
+                    ["Dinheiro", "PIX", "Cartão débito", "Cartão crédito", "Cartão crediário", "Boleto", "Financiamento próprio"],
+                    ["Dinheiro", "PIX", "Cartão débito", "Cartão crédito"]
+                )
+            )
+            # Auto-save formas_pagamento
+            if formas_pagamento != st.session_state.business_data.get('formas_pagamento'):
+                st.session_state.business_data['formas_pagamento'] = formas_pagamento
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Políticas Comerciais**")
+            
+            parcelamento_maximo = st.selectbox(
+                "Parcelamento máximo no cartão",
+                ["À vista apenas", "3x", "6x", "10x", "12x", "18x", "24x"],
+                index=["À vista apenas", "3x", "6x", "10x", "12x", "18x", "24x"].index(
+                    st.session_state.business_data.get('parcelamento_maximo', '10x')
+                )
+            )
+            # Auto-save parcelamento_maximo
+            if parcelamento_maximo != st.session_state.business_data.get('parcelamento_maximo'):
+                st.session_state.business_data['parcelamento_maximo'] = parcelamento_maximo
+                save_user_data()
+            
+            desconto_avista = st.slider(
+                "Desconto para pagamento à vista (%)",
+                min_value=0,
+                max_value=20,
+                value=int(st.session_state.business_data.get('desconto_avista', 5)),
+                step=1
+            )
+            # Auto-save desconto_avista
+            if desconto_avista != st.session_state.business_data.get('desconto_avista'):
+                st.session_state.business_data['desconto_avista'] = desconto_avista
+                save_user_data()
+            st.caption(f"Desconto: {desconto_avista}%")
+            
+            politica_garantia = st.text_area(
+                "Política de garantia e trocas",
+                value=st.session_state.business_data.get('politica_garantia', ''),
+                height=100,
+                placeholder="Ex: 30 dias para troca, garantia de 1 ano contra defeitos..."
+            )
+            # Auto-save politica_garantia
+            if politica_garantia != st.session_state.business_data.get('politica_garantia'):
+                st.session_state.business_data['politica_garantia'] = politica_garantia
+                save_user_data()
+        
+        st.markdown("---")
+        show_lens_price_suggestions()
+        
+        st.markdown("---")
+        st.subheader("💳 Condições de Pagamento e Recebimento")
+        st.markdown("*Configure os percentuais de vendas à vista vs prazo e prazos de recebimento*")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Divisão de Recebimentos**")
+            
+            percentual_avista = st.slider(
+                "Vendas à vista (%)",
+                min_value=0,
+                max_value=100,
+                value=int(st.session_state.business_data.get('percentual_avista', 70)),
+                step=5,
+                help="Percentual das vendas que recebe no mesmo mês"
+            )
+            # Auto-save percentual_avista
+            if percentual_avista != st.session_state.business_data.get('percentual_avista'):
+                st.session_state.business_data['percentual_avista'] = percentual_avista
+                save_user_data()
+            
+            percentual_prazo = 100 - percentual_avista
+            st.info(f"**Vendas a prazo: {percentual_prazo}%**")
+            
+            st.markdown("**Prazos de Recebimento**")
+            
+            prazo_options = [0, 15, 30, 45, 60, 90]
+            prazo_labels = ["Na hora! (À vista)", "15 dias", "30 dias", "45 dias", "60 dias", "90 dias"]
+            
+            # Mapear valor salvo para índice
+            current_prazo = st.session_state.business_data.get('prazo_medio_recebimento', 30)
+            try:
+                current_index = prazo_options.index(current_prazo)
+            except ValueError:
+                current_index = 2  # Default para 30 dias
+            
+            prazo_medio_recebimento = st.selectbox(
+                "Prazo médio de recebimento (vendas a prazo)",
+                options=prazo_options,
+                format_func=lambda x: prazo_labels[prazo_options.index(x)],
+                index=current_index,
+                help="Quantos dias em média para receber vendas a prazo"
+            )
+            # Auto-save prazo_medio_recebimento
+            if prazo_medio_recebimento != st.session_state.business_data.get('prazo_medio_recebimento'):
+                st.session_state.business_data['prazo_medio_recebimento'] = prazo_medio_recebimento
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Modalidades de Recebimento**")
+            
+            # Explicar a diferença entre venda parcelada e recebimento
+            st.info("**💡 Importante:** Cliente pode parcelar em 3x, mas você pode receber antecipado!")
+            
+            st.markdown("**Cenários de Recebimento:**")
+            
+            if prazo_medio_recebimento == 0:
+                st.success("🚀 **Na Hora! (À vista)**")
+                st.write("• Cliente: Paga à vista (dinheiro/PIX/débito)")
+                st.write("• Você: Recebe na hora, sem intermediários")
+                st.write("• Financeira: Sem taxas")
+                st.write("• Fluxo de caixa: Instantâneo, sem risco")
+            elif prazo_medio_recebimento <= 30:
+                st.success("✅ **Recebimento Antecipado (D+1 a D+30)**")
+                st.write("• Cliente: Paga em 3x no cartão")
+                st.write("• Você: Recebe tudo em até 30 dias")
+                st.write("• Financeira: Desconta taxa (3-5%)")
+                st.write("• Fluxo de caixa: Rápido")
+            elif prazo_medio_recebimento <= 60:
+                st.warning("⚠️ **Recebimento Parcelado (30-60 dias)**")
+                st.write("• Cliente: Paga em 3x no cartão")
+                st.write("• Você: Recebe parcelado conforme cliente paga")
+                st.write("• Financeira: Taxa menor (1-3%)")
+                st.write("• Fluxo de caixa: Moderado")
+            else:
+                st.error("🚨 **Recebimento Direto (60+ dias)**")
+                st.write("• Cliente: Paga diretamente à você")
+                st.write("• Você: Assume risco de inadimplência")
+                st.write("• Financeira: Sem taxas")
+                st.write("• Fluxo de caixa: Lento, maior risco")
+            
+            # Taxa da financeira configurável
+            st.markdown("**💳 Taxa da Financeira (Editável):**")
+            
+            # Taxa da financeira baseada nas taxas reais do Mercado Pago
+            st.markdown("**💳 Taxas do Mercado Pago (2024):**")
+            
+            # Opções de recebimento baseadas nas taxas reais
+            opcao_recebimento = st.selectbox(
+                "Modalidade de recebimento",
+                [
+                    "PIX - Na hora (0%)",
+                    "Débito - Na hora (1,99%)",
+                    "Crédito à vista - Na hora (4,98%)",
+                    "Crédito 2x-12x - Na hora (5,31%)",
+                    "Crédito à vista - 14 dias (3,79%)",
+                    "Crédito 2x-12x - 14 dias (4,36%)",
+                    "Crédito à vista - 30 dias (3,03%)",
+                    "Crédito 2x-12x - 30 dias (3,60%)"
+                ],
+                index=0
+            )
+            
+            # Mapear taxas baseadas na seleção
+            taxas_mercado_pago = {
+                "PIX - Na hora (0%)": 0.0,
+                "Débito - Na hora (1,99%)": 1.99,
+                "Crédito à vista - Na hora (4,98%)": 4.98,
+                "Crédito 2x-12x - Na hora (5,31%)": 5.31,
+                "Crédito à vista - 14 dias (3,79%)": 3.79,
+                "Crédito 2x-12x - 14 dias (4,36%)": 4.36,
+                "Crédito à vista - 30 dias (3,03%)": 3.03,
+                "Crédito 2x-12x - 30 dias (3,60%)": 3.60
+            }
+            
+            taxa_selecionada = taxas_mercado_pago[opcao_recebimento]
+            
+            # Salvar configuração
+            st.session_state.business_data['opcao_recebimento_mp'] = opcao_recebimento
+            st.session_state.business_data['taxa_mercado_pago'] = taxa_selecionada
+            save_user_data()
+            
+            # Mostrar detalhes da taxa selecionada
+            if taxa_selecionada == 0:
+                st.success("**PIX:** Recebimento gratuito e instantâneo")
+                st.write("• **Taxa: 0%** - sem custos")
+                st.write("• Recebimento imediato")
+                st.write("• Sem risco de chargeback")
+            elif "Na hora" in opcao_recebimento:
+                st.info("**Recebimento Imediato:** Taxa mais alta, mas dinheiro na conta na hora")
+                st.write(f"• **Taxa: {taxa_selecionada}%**")
+                exemplo_desconto = 1000 * (taxa_selecionada / 100)
+                st.write(f"• Exemplo: R$ 1.000 → você recebe R$ {1000 - exemplo_desconto:,.2f}")
+                st.write("• Dinheiro disponível em segundos")
+            else:
+                st.warning("**Recebimento a Prazo:** Taxa menor, mas aguarda prazo para receber")
+                st.write(f"• **Taxa: {taxa_selecionada}%**")
+                exemplo_desconto = 1000 * (taxa_selecionada / 100)
+                st.write(f"• Exemplo: R$ 1.000 → você recebe R$ {1000 - exemplo_desconto:,.2f}")
+                prazo = "14 dias" if "14 dias" in opcao_recebimento else "30 dias"
+                st.write(f"• Recebimento em {prazo}")
+            
+            # Configuração customizada (opcional)
+            st.markdown("**🔧 Configuração Personalizada:**")
+            usar_customizada = st.checkbox("Usar taxa customizada diferente do Mercado Pago")
+            
+            if usar_customizada:
+                taxa_customizada = st.number_input(
+                    "Taxa customizada (%)",
+                    min_value=0.0,
+                    max_value=15.0,
+                    value=taxa_selecionada,
+                    step=0.01,
+                    format="%.2f",
+                    help="Caso use outra operadora ou tenha condições especiais"
+                )
+                st.session_state.business_data['taxa_customizada'] = taxa_customizada
+                st.session_state.business_data['usar_taxa_customizada'] = True
+                save_user_data()
+                
+                st.write(f"• **Taxa customizada: {taxa_customizada}%**")
+                exemplo_desconto = 1000 * (taxa_customizada / 100)
+                st.write(f"• Exemplo: R$ 1.000 → você recebe R$ {1000 - exemplo_desconto:,.2f}")
+            else:
+                st.session_state.business_data['usar_taxa_customizada'] = False
+                save_user_data()
+            
+            # Mostrar formas de pagamento aceitas
+            st.markdown("**Formas de Pagamento:**")
+            for forma in formas_pagamento:
+                if forma == "Dinheiro":
+                    st.write(f"💵 {forma} → Recebe na hora ({percentual_avista}%)")
+                elif forma in ["PIX", "Débito"]:
+                    st.write(f"💳 {forma} → Recebe D+1 ({percentual_avista}%)")
+                else:
+                    st.write(f"💰 {forma} → Recebe conforme configurado ({percentual_prazo}%)")
+            
+        st.markdown("---")
+        st.info(f"**💡 Resumo:** {percentual_avista}% à vista (recebe no mês) + {percentual_prazo}% a prazo (recebe em {prazo_medio_recebimento} dias)")
+    
+    # Store all data including payment conditions and configured fees
+    st.session_state.business_data.update({
+        'categorias_produtos': categorias_produtos,
+        'marcas_trabalhar': marcas_trabalhar,
+        'faixa_preco_produtos': faixa_preco_produtos,
+        'tipos_fornecedores': tipos_fornecedores,
+        'criterios_fornecedores': criterios_fornecedores,
+        'estoque_inicial': estoque_inicial,
+        'servicos_oferecidos': servicos_oferecidos,
+        'diferenciais_servicos': diferenciais_servicos,
+        'tempo_entrega': tempo_entrega,
+        'estrategia_precificacao': estrategia_precificacao,
+        'margem_produtos': margem_produtos,
+        'formas_pagamento': formas_pagamento,
+        'parcelamento_maximo': parcelamento_maximo,
+        'desconto_avista': desconto_avista,
+        'politica_garantia': politica_garantia,
+        'percentual_avista': percentual_avista,
+        'prazo_medio_recebimento': prazo_medio_recebimento
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    # Valores calculados para outras etapas (sem interface visual)
+    diaria_optometrista = st.session_state.business_data.get('diaria_optometrista', 150.0)
+    dias_optometrista_mes = st.session_state.business_data.get('dias_optometrista_mes', 4)
+    custo_optometrista_mensal = diaria_optometrista * dias_optometrista_mes
+    meta_oculos_mes = st.session_state.business_data.get('meta_oculos_mes', 80)
+    custo_exame_por_oculos = custo_optometrista_mensal / meta_oculos_mes if meta_oculos_mes > 0 else 0
+    
+    # Custos básicos para cálculos (sem interface visual)
+    custo_materiais_fisicos = 89.80  # Soma dos materiais básicos
+    custo_total_com_exame_visual = custo_materiais_fisicos + custo_exame_por_oculos
+    
+    # Armazenar valores para outras etapas
+    st.session_state.business_data.update({
+        'custo_exame_por_oculos': custo_exame_por_oculos,
+        'custo_materiais_fisicos': custo_materiais_fisicos,
+        'custo_total_com_exame_visual': custo_total_com_exame_visual
+    })
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step5"):
+            st.session_state.step = 4
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step5"):
+            st.session_state.step = 6
+            st.rerun()
+
+
+def show_lens_price_suggestions():
+    """Preços sugeridos das combinações de tratamentos/acessórios de uma lente (só as não dominadas)"""
+    from br_format import format_frame
+    from pricing_suggestions import LensPricingSuggestions
+    
+    st.subheader("🔎 Sugestão de Preços de Lentes")
+    st.markdown("*Combinações de tratamentos e acessórios que valem a pena oferecer para cada lente*")
+    
+    tipos_lente = {'simples': "Visão simples", 'bifocal': "Bifocal", 'multifocal': "Multifocal"}
+    linhas = {'basico': "Básico", 'intermediario': "Intermediário", 'premium': "Premium"}
+    estrategias = {'conservadora': "Conservadora", 'competitiva': "Competitiva", 'agressiva': "Agressiva"}
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        tipo_lente = st.selectbox("Tipo de lente", list(tipos_lente), format_func=tipos_lente.get, key="sugestao_tipo_lente")
+    with col2:
+        linha = st.selectbox("Linha", list(linhas), format_func=linhas.get, key="sugestao_linha")
+    with col3:
+        estrategia = st.selectbox("Estratégia", list(estrategias), index=1, format_func=estrategias.get,
+                                  key="sugestao_estrategia")
+    incluir_acessorios = st.checkbox("Incluir acessórios", value=True, key="sugestao_acessorios")
+    
+    # Combinações dominadas (outra custa menos e sai pelo mesmo preço ou mais) são descartadas antes dos rótulos
+    tabela = LensPricingSuggestions().gerar_combinacoes(
+        tipo_lente, linha, estrategia, incluir_acessorios=incluir_acessorios, podar_dominadas=True
+    )
+    tabela = tabela.drop(columns=['Tipo Lente', 'Linha', 'Máscara']).set_index('Tratamentos')
+    st.dataframe(
+        format_frame(
+            tabela,
+            currency=['Custo Total', 'Preço Sugerido', 'Mercado Min', 'Mercado Médio', 'Mercado Max'],
+            percent=['Margem (%)']
+        ),
+        use_container_width=True
+    )
+    st.caption(f"{len(tabela)} combinações não dominadas: nenhuma outra custa menos e é vendida por mais")
@@ -0,0 +1,327 @@
+"""
+Etapa 6 - Estratégia de Marketing
+Posicionamento e marca, canais de divulgação, campanhas e promoções
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, safe_multiselect_default, save_user_data
+
+
+def show_step_6():
+    """Etapa 6: Estratégia de Marketing"""
+    st.header("6️⃣ Estratégia de Marketing")
+    st.markdown("**FASE 6: MARKETING** - Defina como atrair e manter clientes")
+    
+    # Tabs para organizar estratégia de marketing
+    tab1, tab2, tab3 = st.tabs(["📢 Estratégia Geral", "🎯 Canais de Marketing", "💡 Campanhas e Promoções"])
+    
+    with tab1:
+        st.subheader("📢 Posicionamento e Marca")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Identidade da Marca**")
+            
+            proposta_valor = st.text_area(
+                "Proposta de valor (o que oferece de único)",
+                value=st.session_state.business_data.get('proposta_valor', ''),
+                height=100,
+                placeholder="Ex: Óculos de qualidade com atendimento personalizado e preços justos..."
+            )
+            # Auto-save proposta_valor
+            if proposta_valor != st.session_state.business_data.get('proposta_valor'):
+                st.session_state.business_data['proposta_valor'] = proposta_valor
+                save_user_data()
+            
+            publico_alvo_marketing = st.multiselect(
+                "Público-alvo prioritário para marketing",
+                ["Jovens (18-30)", "Adultos (30-50)", "Idosos (50+)", "Crianças/Pais", "Profissionais", "Estudantes"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('publico_alvo_marketing', []),
+                    ["Jovens (18-30)", "Adultos (30-50)", "Idosos (50+)", "Crianças/Pais", "Profissionais", "Estudantes"],
+                    ["Adultos (30-50)"]
+                )
+            )
+            # Auto-save publico_alvo_marketing
+            if publico_alvo_marketing != st.session_state.business_data.get('publico_alvo_marketing'):
+                st.session_state.business_data['publico_alvo_marketing'] = publico_alvo_marketing
+                save_user_data()
+            
+            tom_comunicacao = st.selectbox(
+                "Tom de comunicação",
+                ["Profissional e técnico", "Amigável e próximo", "Moderno e descontraído", "Elegante e sofisticado", "Familiar e caloroso"],
+                index=["Profissional e técnico", "Amigável e próximo", "Moderno e descontraído", "Elegante e sofisticado", "Familiar e caloroso"].index(
+                    st.session_state.business_data.get('tom_comunicacao', 'Amigável e próximo')
+                )
+            )
+            # Auto-save tom_comunicacao
+            if tom_comunicacao != st.session_state.business_data.get('tom_comunicacao'):
+                st.session_state.business_data['tom_comunicacao'] = tom_comunicacao
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Objetivos de Marketing**")
+            
+            objetivos_marketing = st.multiselect(
+                "Principais objetivos",
+                ["Aumentar conhecimento da marca", "Gerar leads qualificados", "Aumentar vendas", "Fidelizar clientes", 
+                 "Melhorar reputação", "Expandir base de clientes", "Posicionar como referência"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('objetivos_marketing', []),
+                    ["Aumentar conhecimento da marca", "Gerar leads qualificados", "Aumentar vendas", "Fidelizar clientes", 
+                     "Melhorar reputação", "Expandir base de clientes", "Posicionar como referência"],
+                    ["Aumentar vendas", "Fidelizar clientes"]
+                )
+            )
+            # Auto-save objetivos_marketing
+            if objetivos_marketing != st.session_state.business_data.get('objetivos_marketing'):
+                st.session_state.business_data['objetivos_marketing'] = objetivos_marketing
+                save_user_data()
+            
+            orcamento_marketing = st.number_input(
+                "Orçamento mensal para marketing (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('orcamento_marketing', 1000)),
+                step=100.0,
+                format="%.0f"
+            )
+            # Auto-save orcamento_marketing
+            if orcamento_marketing != st.session_state.business_data.get('orcamento_marketing'):
+                st.session_state.business_data['orcamento_marketing'] = orcamento_marketing
+                save_user_data()
+            st.caption(f"💰 {format_currency(orcamento_marketing)}/mês")
+            
+            estrategias_diferenciacao = st.multiselect(
+                "Como se diferenciará dos concorrentes",
+                ["Preços mais baixos", "Melhor atendimento", "Maior variedade", "Tecnologia avançada", 
+                 "Rapidez na entrega", "Localização conveniente", "Parcerias exclusivas", "Garantias estendidas"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('estrategias_diferenciacao', []),
+                    ["Preços mais baixos", "Melhor atendimento", "Maior variedade", "Tecnologia avançada", 
+                     "Rapidez na entrega", "Localização conveniente", "Parcerias exclusivas", "Garantias estendidas"],
+                    ["Melhor atendimento"]
+                )
+            )
+            # Auto-save estrategias_diferenciacao
+            if estrategias_diferenciacao != st.session_state.business_data.get('estrategias_diferenciacao'):
+                st.session_state.business_data['estrategias_diferenciacao'] = estrategias_diferenciacao
+                save_user_data()
+    
+    with tab2:
+        st.subheader("🎯 Canais de Marketing e Divulgação")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Marketing Digital**")
+            
+            canais_digitais = st.multiselect(
+                "Canais digitais que utilizará",
+                ["Facebook", "Instagram", "WhatsApp Business", "Google Ads", "Google Meu Negócio", 
+                 "Site próprio", "YouTube", "TikTok", "Email marketing"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('canais_digitais', []),
+                    ["Facebook", "Instagram", "WhatsApp Business", "Google Ads", "Google Meu Negócio", 
+                     "Site próprio", "YouTube", "TikTok", "Email marketing"],
+                    ["Facebook", "Instagram", "WhatsApp Business"]
+                )
+            )
+            # Auto-save canais_digitais
+            if canais_digitais != st.session_state.business_data.get('canais_digitais'):
+                st.session_state.business_data['canais_digitais'] = canais_digitais
+                save_user_data()
+            
+            frequencia_posts = st.selectbox(
+                "Frequência de postagens nas redes sociais",
+                ["Diariamente", "3-4 vezes por semana", "1-2 vezes por semana", "Esporadicamente"],
+                index=["Diariamente", "3-4 vezes por semana", "1-2 vezes por semana", "Esporadicamente"].index(
+                    st.session_state.business_data.get('frequencia_posts', '3-4 vezes por semana')
+                )
+            )
+            # Auto-save frequencia_posts
+            if frequencia_posts != st.session_state.business_data.get('frequencia_posts'):
+                st.session_state.business_data['frequencia_posts'] = frequencia_posts
+                save_user_data()
+            
+            tipos_conteudo = st.multiselect(
+                "Tipos de conteúdo para redes sociais",
+                ["Produtos em destaque", "Dicas de cuidados", "Tendências de moda", "Depoimentos de clientes", 
+                 "Bastidores da ótica", "Promoções", "Educativo sobre visão", "Antes e depois"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('tipos_conteudo', []),
+                    ["Produtos em destaque", "Dicas de cuidados", "Tendências de moda", "Depoimentos de clientes", 
+                     "Bastidores da ótica", "Promoções", "Educativo sobre visão", "Antes e depois"],
+                    ["Produtos em destaque", "Promoções"]
+                )
+            )
+            # Auto-save tipos_conteudo
+            if tipos_conteudo != st.session_state.business_data.get('tipos_conteudo'):
+                st.session_state.business_data['tipos_conteudo'] = tipos_conteudo
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Marketing Tradicional**")
+            
+            canais_tradicionais = st.multiselect(
+                "Canais tradicionais que utilizará",
+                ["Panfletos", "Cartões de visita", "Banner na loja", "Anúncios em jornal local", 
+                 "Rádio local", "Parcerias com médicos", "Indicações boca a boca", "Eventos locais"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('canais_tradicionais', []),
+                    ["Panfletos", "Cartões de visita", "Banner na loja", "Anúncios em jornal local", 
+                     "Rádio local", "Parcerias com médicos", "Indicações boca a boca", "Eventos locais"],
+                    ["Cartões de visita", "Indicações boca a boca"]
+                )
+            )
+            # Auto-save canais_tradicionais
+            if canais_tradicionais != st.session_state.business_data.get('canais_tradicionais'):
+                st.session_state.business_data['canais_tradicionais'] = canais_tradicionais
+                save_user_data()
+            
+            parcerias_marketing = st.text_area(
+                "Parcerias estratégicas para marketing",
+                value=st.session_state.business_data.get('parcerias_marketing', ''),
+                height=100,
+                placeholder="Ex: Oftalmologistas, clínicas, escolas, empresas locais..."
+            )
+            # Auto-save parcerias_marketing
+            if parcerias_marketing != st.session_state.business_data.get('parcerias_marketing'):
+                st.session_state.business_data['parcerias_marketing'] = parcerias_marketing
+                save_user_data()
+            
+            programa_indicacoes = st.selectbox(
+                "Programa de indicações",
+                ["Não pretendo ter", "Desconto para quem indica", "Desconto para ambos", "Sistema de pontos", "Brindes especiais"],
+                index=["Não pretendo ter", "Desconto para quem indica", "Desconto para ambos", "Sistema de pontos", "Brindes especiais"].index(
+                    st.session_state.business_data.get('programa_indicacoes', 'Desconto para ambos')
+                )
+            )
+            # Auto-save programa_indicacoes
+            if programa_indicacoes != st.session_state.business_data.get('programa_indicacoes'):
+                st.session_state.business_data['programa_indicacoes'] = programa_indicacoes
+                save_user_data()
+    
+    with tab3:
+        st.subheader("💡 Campanhas e Estratégias Promocionais")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Promoções Sazonais**")
+            
+            campanhas_sazonais = st.multiselect(
+                "Campanhas sazonais planejadas",
+                ["Volta às aulas", "Dia das Mães", "Dia dos Pais", "Black Friday", "Natal", 
+                 "Férias escolares", "Dia da Visão", "Aniversário da loja"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('campanhas_sazonais', []),
+                    ["Volta às aulas", "Dia das Mães", "Dia dos Pais", "Black Friday", "Natal", 
+                     "Férias escolares", "Dia da Visão", "Aniversário da loja"],
+                    ["Volta às aulas", "Black Friday"]
+                )
+            )
+            # Auto-save campanhas_sazonais
+            if campanhas_sazonais != st.session_state.business_data.get('campanhas_sazonais'):
+                st.session_state.business_data['campanhas_sazonais'] = campanhas_sazonais
+                save_user_data()
+            
+            tipos_promocoes = st.multiselect(
+                "Tipos de promoções que oferecerá",
+                ["Desconto percentual", "2ª unidade com desconto", "Frete grátis", "Brinde", 
+                 "Parcelamento sem juros", "Cashback", "Troca garantida", "Combo promocional"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('tipos_promocoes', []),
+                    ["Desconto percentual", "2ª unidade com desconto", "Frete grátis", "Brinde", 
+                     "Parcelamento sem juros", "Cashback", "Troca garantida", "Combo promocional"],
+                    ["Desconto percentual", "Parcelamento sem juros"]
+                )
+            )
+            # Auto-save tipos_promocoes
+            if tipos_promocoes != st.session_state.business_data.get('tipos_promocoes'):
+                st.session_state.business_data['tipos_promocoes'] = tipos_promocoes
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Fidelização de Clientes**")
+            
+            estrategias_fidelizacao = st.multiselect(
+                "Estratégias de fidelização",
+                ["Programa de pontos", "Desconto para clientes antigos", "Aniversário do cliente", 
+                 "Newsletter exclusiva", "Pré-venda de novidades", "Atendimento VIP", "Evento exclusivo"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('estrategias_fidelizacao', []),
+                    ["Programa de pontos", "Desconto para clientes antigos", "Aniversário do cliente", 
+                     "Newsletter exclusiva", "Pré-venda de novidades", "Atendimento VIP", "Evento exclusivo"],
+                    ["Aniversário do cliente"]
+                )
+            )
+            # Auto-save estrategias_fidelizacao
+            if estrategias_fidelizacao != st.session_state.business_data.get('estrategias_fidelizacao'):
+                st.session_state.business_data['estrategias_fidelizacao'] = estrategias_fidelizacao
+                save_user_data()
+            
+            metricas_acompanhar = st.multiselect(
+                "Métricas que acompanhará",
+                ["Número de seguidores", "Engajamento nas redes", "Conversões de vendas", "CAC (Custo de Aquisição)", 
+                 "LTV (Valor do cliente)", "Taxa de retenção", "NPS (Satisfação)", "ROI do marketing"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('metricas_acompanhar', []),
+                    ["Número de seguidores", "Engajamento nas redes", "Conversões de vendas", "CAC (Custo de Aquisição)", 
+                     "LTV (Valor do cliente)", "Taxa de retenção", "NPS (Satisfação)", "ROI do marketing"],
+                    ["Conversões de vendas", "NPS (Satisfação)"]
+                )
+            )
+            # Auto-save metricas_acompanhar
+            if metricas_acompanhar != st.session_state.business_data.get('metricas_acompanhar'):
+                st.session_state.business_data['metricas_acompanhar'] = metricas_acompanhar
+                save_user_data()
+            
+            plano_lancamento = st.text_area(
+                "Plano para lançamento/inauguração",
+                value=st.session_state.business_data.get('plano_lancamento', ''),
+                height=100,
+                placeholder="Ex: Evento de inauguração, promoções especiais, parcerias para divulgação..."
+            )
+            # Auto-save plano_lancamento
+            if plano_lancamento != st.session_state.business_data.get('plano_lancamento'):
+                st.session_state.business_data['plano_lancamento'] = plano_lancamento
+                save_user_data()
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'proposta_valor': proposta_valor,
+        'publico_alvo_marketing': publico_alvo_marketing,
+        'tom_comunicacao': tom_comunicacao,
+        'objetivos_marketing': objetivos_marketing,
+        'orcamento_marketing': orcamento_marketing,
+        'estrategias_diferenciacao': estrategias_diferenciacao,
+        'canais_digitais': canais_digitais,
+        'frequencia_posts': frequencia_posts,
+        'tipos_conteudo': tipos_conteudo,
+        'canais_tradicionais': canais_tradicionais,
+        'parcerias_marketing': parcerias_marketing,
+        'programa_indicacoes': programa_indicacoes,
+        'campanhas_sazonais': campanhas_sazonais,
+        'tipos_promocoes': tipos_promocoes,
+        'estrategias_fidelizacao': estrategias_fidelizacao,
+        'metricas_acompanhar': metricas_acompanhar,
+        'plano_lancamento': plano_lancamento
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step6"):
+            st.session_state.step = 5
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step6"):
+            st.session_state.step = 7
+            st.rerun()
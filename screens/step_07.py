@@ -0,0 +1,355 @@
+"""
+Etapa 7 - Plano Operacional
+Estrutura da loja, processos operacionais e controles de gestão
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, safe_multiselect_default, save_user_data
+
+
+def show_step_7():
+    """Etapa 7: Plano Operacional"""
+    st.header("7️⃣ Plano Operacional")
+    st.markdown("**FASE 7: OPERAÇÕES** - Defina como sua ótica funcionará no dia a dia")
+    
+    # Tabs para organizar plano operacional
+    tab1, tab2, tab3 = st.tabs(["🏪 Estrutura da Loja", "⚙️ Processos Operacionais", "📋 Gestão e Controles"])
+    
+    with tab1:
+        st.subheader("🏪 Layout e Infraestrutura")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Layout da Loja**")
+            
+            layout_areas = st.multiselect(
+                "Áreas que terá na loja",
+                ["Área de atendimento", "Exposição de armações", "Exposição de óculos de sol", "Área de ajustes", 
+                 "Estoque", "Caixa", "Área de espera", "Consultório/Exames", "Escritório"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('layout_areas', []),
+                    ["Área de atendimento", "Exposição de armações", "Exposição de óculos de sol", "Área de ajustes", 
+                     "Estoque", "Caixa", "Área de espera", "Consultório/Exames", "Escritório"],
+                    ["Área de atendimento", "Exposição de armações", "Caixa"]
+                )
+            )
+            # Auto-save layout_areas
+            if layout_areas != st.session_state.business_data.get('layout_areas'):
+                st.session_state.business_data['layout_areas'] = layout_areas
+                save_user_data()
+            
+            equipamentos_necessarios = st.multiselect(
+                "Equipamentos necessários",
+                ["Computador/PDV", "Impressora", "Leitor de cartão", "Balança de precisão", 
+                 "Kit de ajustes", "Expositor de armações", "Vitrine com segurança", "Sistema de segurança"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('equipamentos_necessarios', []),
+                    ["Computador/PDV", "Impressora", "Leitor de cartão", "Balança de precisão", 
+                     "Kit de ajustes", "Expositor de armações", "Vitrine com segurança", "Sistema de segurança"],
+                    ["Computador/PDV", "Kit de ajustes"]
+                )
+            )
+            # Auto-save equipamentos_necessarios
+            if equipamentos_necessarios != st.session_state.business_data.get('equipamentos_necessarios'):
+                st.session_state.business_data['equipamentos_necessarios'] = equipamentos_necessarios
+                save_user_data()
+            
+            investimento_equipamentos = st.number_input(
+                "Investimento em equipamentos (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('investimento_equipamentos', 10000)),
+                step=1000.0,
+                format="%.0f"
+            )
+            # Auto-save investimento_equipamentos
+            if investimento_equipamentos != st.session_state.business_data.get('investimento_equipamentos'):
+                st.session_state.business_data['investimento_equipamentos'] = investimento_equipamentos
+                save_user_data()
+            st.caption(f"💰 {format_currency(investimento_equipamentos)}")
+        
+        with col2:
+            st.markdown("**Funcionamento**")
+            
+            horario_funcionamento = st.text_input(
+                "Horário de funcionamento",
+                value=st.session_state.business_data.get('horario_funcionamento', ''),
+                placeholder="Ex: Segunda a Sexta 8h às 18h, Sábado 8h às 12h"
+            )
+            # Auto-save horario_funcionamento
+            if horario_funcionamento != st.session_state.business_data.get('horario_funcionamento'):
+                st.session_state.business_data['horario_funcionamento'] = horario_funcionamento
+                save_user_data()
+            
+            dias_funcionamento = st.multiselect(
+                "Dias de funcionamento",
+                ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('dias_funcionamento', []),
+                    ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado", "Domingo"],
+                    ["Segunda", "Terça", "Quarta", "Quinta", "Sexta", "Sábado"]
+                )
+            )
+            # Auto-save dias_funcionamento
+            if dias_funcionamento != st.session_state.business_data.get('dias_funcionamento'):
+                st.session_state.business_data['dias_funcionamento'] = dias_funcionamento
+                save_user_data()
+            
+            capacidade_atendimento = st.number_input(
+                "Capacidade de atendimento (clientes/dia)",
+                min_value=1,
+                value=int(st.session_state.business_data.get('capacidade_atendimento', 20)),
+                step=5
+            )
+            # Auto-save capacidade_atendimento
+            if capacidade_atendimento != st.session_state.business_data.get('capacidade_atendimento'):
+                st.session_state.business_data['capacidade_atendimento'] = capacidade_atendimento
+                save_user_data()
+            
+            sistema_gestao = st.selectbox(
+                "Sistema de gestão que utilizará",
+                ["Planilhas Excel", "Software específico para óticas", "Sistema ERP", "Software customizado", "Ainda não definido"],
+                index=["Planilhas Excel", "Software específico para óticas", "Sistema ERP", "Software customizado", "Ainda não definido"].index(
+                    st.session_state.business_data.get('sistema_gestao', 'Software específico para óticas')
+                )
+            )
+            # Auto-save sistema_gestao
+            if sistema_gestao != st.session_state.business_data.get('sistema_gestao'):
+                st.session_state.business_data['sistema_gestao'] = sistema_gestao
+                save_user_data()
+    
+    with tab2:
+        st.subheader("⚙️ Fluxos de Trabalho")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Processo de Atendimento**")
+            
+            fluxo_atendimento = st.text_area(
+                "Descreva o fluxo de atendimento ao cliente",
+                value=st.session_state.business_data.get('fluxo_atendimento', ''),
+                height=120,
+                placeholder="Ex: 1. Recepção e identificação da necessidade\n2. Análise da receita\n3. Orientação sobre produtos..."
+            )
+            # Auto-save fluxo_atendimento
+            if fluxo_atendimento != st.session_state.business_data.get('fluxo_atendimento'):
+                st.session_state.business_data['fluxo_atendimento'] = fluxo_atendimento
+                save_user_data()
+            
+            tempo_medio_atendimento = st.selectbox(
+                "Tempo médio de atendimento por cliente",
+                ["15-20 minutos", "20-30 minutos", "30-45 minutos", "45-60 minutos", "Mais de 1 hora"],
+                index=["15-20 minutos", "20-30 minutos", "30-45 minutos", "45-60 minutos", "Mais de 1 hora"].index(
+                    st.session_state.business_data.get('tempo_medio_atendimento', '30-45 minutos')
+                )
+            )
+            # Auto-save tempo_medio_atendimento
+            if tempo_medio_atendimento != st.session_state.business_data.get('tempo_medio_atendimento'):
+                st.session_state.business_data['tempo_medio_atendimento'] = tempo_medio_atendimento
+                save_user_data()
+            
+            politicas_atendimento = st.multiselect(
+                "Políticas de atendimento",
+                ["Atendimento por ordem de chegada", "Agendamento obrigatório", "Agendamento opcional", 
+                 "Prioridade para idosos", "Atendimento domiciliar", "Televendas", "WhatsApp"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('politicas_atendimento', []),
+                    ["Atendimento por ordem de chegada", "Agendamento obrigatório", "Agendamento opcional", 
+                     "Prioridade para idosos", "Atendimento domiciliar", "Televendas", "WhatsApp"],
+                    ["Atendimento por ordem de chegada", "WhatsApp"]
+                )
+            )
+            # Auto-save politicas_atendimento
+            if politicas_atendimento != st.session_state.business_data.get('politicas_atendimento'):
+                st.session_state.business_data['politicas_atendimento'] = politicas_atendimento
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Gestão de Estoque**")
+            
+            controle_estoque = st.selectbox(
+                "Método de controle de estoque",
+                ["Manual/Planilhas", "Sistema automatizado", "Código de barras", "RFID", "Controle misto"],
+                index=["Manual/Planilhas", "Sistema automatizado", "Código de barras", "RFID", "Controle misto"].index(
+                    st.session_state.business_data.get('controle_estoque', 'Sistema automatizado')
+                )
+            )
+            # Auto-save controle_estoque
+            if controle_estoque != st.session_state.business_data.get('controle_estoque'):
+                st.session_state.business_data['controle_estoque'] = controle_estoque
+                save_user_data()
+            
+            giro_estoque_planejado = st.selectbox(
+                "Giro de estoque planejado",
+                ["1-2 vezes por ano", "3-4 vezes por ano", "5-6 vezes por ano", "Mais de 6 vezes por ano"],
+                index=["1-2 vezes por ano", "3-4 vezes por ano", "5-6 vezes por ano", "Mais de 6 vezes por ano"].index(
+                    st.session_state.business_data.get('giro_estoque_planejado', '3-4 vezes por ano')
+                )
+            )
+            # Auto-save giro_estoque_planejado
+            if giro_estoque_planejado != st.session_state.business_data.get('giro_estoque_planejado'):
+                st.session_state.business_data['giro_estoque_planejado'] = giro_estoque_planejado
+                save_user_data()
+            
+            politicas_compra = st.text_area(
+                "Políticas de compra e reposição",
+                value=st.session_state.business_data.get('politicas_compra', ''),
+                height=100,
+                placeholder="Ex: Compras mensais, estoque mínimo de 30 dias, análise ABC..."
+            )
+            # Auto-save politicas_compra
+            if politicas_compra != st.session_state.business_data.get('politicas_compra'):
+                st.session_state.business_data['politicas_compra'] = politicas_compra
+                save_user_data()
+    
+    with tab3:
+        st.subheader("📋 Controles e Indicadores")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Indicadores de Performance**")
+            
+            kpis_acompanhar = st.multiselect(
+                "KPIs que acompanhará",
+                ["Faturamento diário", "Ticket médio", "Conversão de vendas", "Satisfação do cliente", 
+                 "Giro de estoque", "Margem de lucro", "Custo por cliente", "Taxa de retorno"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('kpis_acompanhar', []),
+                    ["Faturamento diário", "Ticket médio", "Conversão de vendas", "Satisfação do cliente", 
+                     "Giro de estoque", "Margem de lucro", "Custo por cliente", "Taxa de retorno"],
+                    ["Faturamento diário", "Ticket médio", "Satisfação do cliente"]
+                )
+            )
+            # Auto-save kpis_acompanhar
+            if kpis_acompanhar != st.session_state.business_data.get('kpis_acompanhar'):
+                st.session_state.business_data['kpis_acompanhar'] = kpis_acompanhar
+                save_user_data()
+            
+            frequencia_relatorios = st.selectbox(
+                "Frequência dos relatórios gerenciais",
+                ["Diário", "Semanal", "Quinzenal", "Mensal", "Conforme necessidade"],
+                index=["Diário", "Semanal", "Quinzenal", "Mensal", "Conforme necessidade"].index(
+                    st.session_state.business_data.get('frequencia_relatorios', 'Semanal')
+                )
+            )
+            # Auto-save frequencia_relatorios
+            if frequencia_relatorios != st.session_state.business_data.get('frequencia_relatorios'):
+                st.session_state.business_data['frequencia_relatorios'] = frequencia_relatorios
+                save_user_data()
+            
+            # Sincronização com projeções financeiras
+            valor_projecao = st.session_state.business_data.get('vendas_mes_1', None)
+            valor_atual_meta = st.session_state.business_data.get('metas_mensais', None)
+            
+            if valor_projecao:
+                col_sync1, col_sync2 = st.columns([3, 1])
+                with col_sync1:
+                    if valor_projecao != valor_atual_meta:
+                        st.warning(f"Valor das Projeções Financeiras: {format_currency(valor_projecao)} (diferente da meta atual)")
+                    else:
+                        st.success(f"Sincronizado com Projeções Financeiras: {format_currency(valor_projecao)}")
+                
+                with col_sync2:
+                    if st.button("🔄 Sincronizar", help="Atualizar com valor das Projeções Financeiras"):
+                        st.session_state.business_data['metas_mensais'] = valor_projecao
+                        save_user_data()
+                        st.rerun()
+            
+            valor_atual = st.session_state.business_data.get('metas_mensais', valor_projecao if valor_projecao else 20831)
+            
+            metas_mensais = st.number_input(
+                "Meta de faturamento mensal (R$)",
+                min_value=0.0,
+                value=float(valor_atual),
+                step=1000.0,
+                format="%.0f"
+            )
+            # Auto-save metas_mensais
+            if metas_mensais != st.session_state.business_data.get('metas_mensais'):
+                st.session_state.business_data['metas_mensais'] = metas_mensais
+                save_user_data()
+            st.caption(f"💰 {format_currency(metas_mensais)}/mês")
+        
+        with col2:
+            st.markdown("**Controles Operacionais**")
+            
+            controles_qualidade = st.multiselect(
+                "Controles de qualidade implementados",
+                ["Checklist de atendimento", "Pesquisa de satisfação", "Controle de prazos", 
+                 "Verificação dupla de receitas", "Testes de equipamentos", "Auditorias internas"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('controles_qualidade', []),
+                    ["Checklist de atendimento", "Pesquisa de satisfação", "Controle de prazos", 
+                     "Verificação dupla de receitas", "Testes de equipamentos", "Auditorias internas"],
+                    ["Pesquisa de satisfação", "Controle de prazos"]
+                )
+            )
+            # Auto-save controles_qualidade
+            if controles_qualidade != st.session_state.business_data.get('controles_qualidade'):
+                st.session_state.business_data['controles_qualidade'] = controles_qualidade
+                save_user_data()
+            
+            backup_dados = st.selectbox(
+                "Política de backup de dados",
+                ["Backup diário automático", "Backup semanal", "Backup mensal", "Backup em nuvem", "Não planejado ainda"],
+                index=["Backup diário automático", "Backup semanal", "Backup mensal", "Backup em nuvem", "Não planejado ainda"].index(
+                    st.session_state.business_data.get('backup_dados', 'Backup em nuvem')
+                )
+            )
+            # Auto-save backup_dados
+            if backup_dados != st.session_state.business_data.get('backup_dados'):
+                st.session_state.business_data['backup_dados'] = backup_dados
+                save_user_data()
+            
+            plano_contingencia = st.text_area(
+                "Plano de contingência/emergência",
+                value=st.session_state.business_data.get('plano_contingencia', ''),
+                height=100,
+                placeholder="Ex: Procedimentos em caso de falha do sistema, falta de energia, ausência de funcionários..."
+            )
+            # Auto-save plano_contingencia
+            if plano_contingencia != st.session_state.business_data.get('plano_contingencia'):
+                st.session_state.business_data['plano_contingencia'] = plano_contingencia
+                save_user_data()
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'layout_areas': layout_areas,
+        'equipamentos_necessarios': equipamentos_necessarios,
+        'investimento_equipamentos': investimento_equipamentos,
+        'horario_funcionamento': horario_funcionamento,
+        'dias_funcionamento': dias_funcionamento,
+        'capacidade_atendimento': capacidade_atendimento,
+        'sistema_gestao': sistema_gestao,
+        'fluxo_atendimento': fluxo_atendimento,
+        'tempo_medio_atendimento': tempo_medio_atendimento,
+        'politicas_atendimento': politicas_atendimento,
+        'controle_estoque': controle_estoque,
+        'giro_estoque_planejado': giro_estoque_planejado,
+        'politicas_compra': politicas_compra,
+        'kpis_acompanhar': kpis_acompanhar,
+        'frequencia_relatorios': frequencia_relatorios,
+        'metas_mensais': metas_mensais,
+        'controles_qualidade': controles_qualidade,
+        'backup_dados': backup_dados,
+        'plano_contingencia': plano_contingencia
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step7"):
+            st.session_state.step = 6
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step7"):
+            st.session_state.step = 8
+            st.rerun()
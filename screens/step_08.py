@@ -0,0 +1,830 @@
+"""
+Etapa 8 - Gestão de Pessoas
+Estrutura da equipe, pessoas e parceiros, sistema de captação e custos trabalhistas
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, safe_multiselect_default, save_user_data
+
+
+def show_step_8():
+    """Etapa 8: Gestão de Pessoas"""
+    st.header("8️⃣ Gestão de Pessoas")
+    st.markdown("**FASE 8: PESSOAS** - Planeje sua equipe e gestão de recursos humanos")
+    
+    # Tabs para organizar gestão de pessoas
+    tab1, tab2, tab3, tab4 = st.tabs(["👥 Estrutura da Equipe", "📋 Pessoas e Parceiros", "🎯 Sistema de Captação", "💰 Custos Trabalhistas"])
+    
+    with tab1:
+        st.subheader("👥 Planejamento da Equipe")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Cargos e Funções**")
+            
+            num_funcionarios = st.number_input(
+                "Número total de funcionários (incluindo você)",
+                min_value=0,
+                value=int(st.session_state.business_data.get('num_funcionarios', 1)),
+                step=1,
+                help="Para começar apenas aos sábados, você pode usar 0 e trabalhar só com comissionistas"
+            )
+            # Auto-save num_funcionarios
+            if num_funcionarios != st.session_state.business_data.get('num_funcionarios'):
+                st.session_state.business_data['num_funcionarios'] = num_funcionarios
+                save_user_data()
+            
+            cargos_necessarios = st.multiselect(
+                "Cargos que pretende ter na equipe",
+                ["Proprietário/Gerente", "Vendedor/Atendente", "Técnico em óptica", "Recepcionista", 
+                 "Auxiliar administrativo", "Técnico em lentes", "Oftalmologista parceiro", "Limpeza/Segurança"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('cargos_necessarios', []),
+                    ["Proprietário/Gerente", "Vendedor/Atendente", "Técnico em óptica", "Recepcionista", 
+                     "Auxiliar administrativo", "Técnico em lentes", "Oftalmologista parceiro", "Limpeza/Segurança"],
+                    ["Proprietário/Gerente", "Vendedor/Atendente"]
+                )
+            )
+            # Auto-save cargos_necessarios
+            if cargos_necessarios != st.session_state.business_data.get('cargos_necessarios'):
+                st.session_state.business_data['cargos_necessarios'] = cargos_necessarios
+                save_user_data()
+            
+            perfil_funcionarios = st.text_area(
+                "Perfil desejado dos funcionários",
+                value=st.session_state.business_data.get('perfil_funcionarios', ''),
+                height=100,
+                placeholder="Ex: Experiência em vendas, comunicativo, conhecimento em óptica..."
+            )
+            # Auto-save perfil_funcionarios
+            if perfil_funcionarios != st.session_state.business_data.get('perfil_funcionarios'):
+                st.session_state.business_data['perfil_funcionarios'] = perfil_funcionarios
+                save_user_data()
+            
+            estrategia_contratacao = st.selectbox(
+                "Estratégia de contratação",
+                ["Contratação imediata", "Contratação gradual", "Terceirização", "Parcerias", "Família/Conhecidos"],
+                index=["Contratação imediata", "Contratação gradual", "Terceirização", "Parcerias", "Família/Conhecidos"].index(
+                    st.session_state.business_data.get('estrategia_contratacao', 'Contratação gradual')
+                )
+            )
+            # Auto-save estrategia_contratacao
+            if estrategia_contratacao != st.session_state.business_data.get('estrategia_contratacao'):
+                st.session_state.business_data['estrategia_contratacao'] = estrategia_contratacao
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Organização da Equipe**")
+            
+            jornada_trabalho = st.selectbox(
+                "Jornada de trabalho padrão",
+                ["44h semanais", "40h semanais", "36h semanais", "Meio período", "Horário flexível"],
+                index=["44h semanais", "40h semanais", "36h semanais", "Meio período", "Horário flexível"].index(
+                    st.session_state.business_data.get('jornada_trabalho', '44h semanais')
+                )
+            )
+            # Auto-save jornada_trabalho
+            if jornada_trabalho != st.session_state.business_data.get('jornada_trabalho'):
+                st.session_state.business_data['jornada_trabalho'] = jornada_trabalho
+                save_user_data()
+            
+            escala_trabalho = st.multiselect(
+                "Organização dos turnos",
+                ["Turno único", "Dois turnos", "Escala de revezamento", "Horário corrido", "Plantão aos sábados"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('escala_trabalho', []),
+                    ["Turno único", "Dois turnos", "Escala de revezamento", "Horário corrido", "Plantão aos sábados"],
+                    ["Turno único"]
+                )
+            )
+            # Auto-save escala_trabalho
+            if escala_trabalho != st.session_state.business_data.get('escala_trabalho'):
+                st.session_state.business_data['escala_trabalho'] = escala_trabalho
+                save_user_data()
+            
+            faixa_salarial = st.text_area(
+                "Faixa salarial prevista por cargo",
+                value=st.session_state.business_data.get('faixa_salarial', ''),
+                height=100,
+                placeholder="Ex: Vendedor: R$ 1.500-2.000\nTécnico: R$ 2.000-2.500"
+            )
+            # Auto-save faixa_salarial
+            if faixa_salarial != st.session_state.business_data.get('faixa_salarial'):
+                st.session_state.business_data['faixa_salarial'] = faixa_salarial
+                save_user_data()
+            
+            plano_crescimento_equipe = st.text_area(
+                "Plano de crescimento da equipe",
+                value=st.session_state.business_data.get('plano_crescimento_equipe', ''),
+                height=80,
+                placeholder="Como pretende expandir a equipe conforme o negócio cresce?"
+            )
+            # Auto-save plano_crescimento_equipe
+            if plano_crescimento_equipe != st.session_state.business_data.get('plano_crescimento_equipe'):
+                st.session_state.business_data['plano_crescimento_equipe'] = plano_crescimento_equipe
+                save_user_data()
+    
+    with tab2:
+        st.subheader("👥 Funcionários Planejados")
+        
+        # Inicializar lista de funcionários planejados
+        if 'funcionarios_planejados' not in st.session_state.business_data:
+            st.session_state.business_data['funcionarios_planejados'] = []
+        
+        # Verificar se existem funcionários do DP e Tributação para sincronizar
+        funcionarios_dp = st.session_state.get('funcionarios', [])
+        
+        if funcionarios_dp and len(st.session_state.business_data['funcionarios_planejados']) == 0:
+            st.info("🔄 **Sincronização com DP e Tributação**: Encontrados funcionários cadastrados no DP. Deseja sincronizá-los?")
+            
+            col_sync1, col_sync2 = st.columns(2)
+            with col_sync1:
+                if st.button("✅ Sincronizar do DP e Tributação", type="primary"):
+                    funcionarios_sincronizados = []
+                    for func in funcionarios_dp:
+                        funcionarios_sincronizados.append({
+                            'nome': func.get('nome', 'Funcionário'),
+                            'cargo': func.get('cargo', 'Vendedor(a)'),
+                            'salario': func.get('salario_base', 1518.00),
+                            'tipo_contrato': func.get('tipo_contrato', 'CLT'),
+                            'data_admissao': func.get('data_admissao', '2024-01-01'),
+                            'vale_transporte': func.get('vale_transporte', True),
+                            'vale_refeicao': func.get('vale_refeicao', 25.00),
+                            'plano_saude': func.get('plano_saude', False),
+                            'comissao': func.get('comissao_percentual', 0.0),
+                            'escolaridade': func.get('grau_instrucao', 'Ensino Médio'),
+                            'dependentes': func.get('dependentes', 0)
+                        })
+                    
+                    st.session_state.business_data['funcionarios_planejados'] = funcionarios_sincronizados
+                    save_user_data()
+                    st.success(f"✅ {len(funcionarios_sincronizados)} funcionário(s) sincronizado(s) do DP!")
+                    st.rerun()
+            
+            with col_sync2:
+                if st.button("🔄 Manter Separado", type="secondary"):
+                    st.info("Os dados permanecem separados. Você pode gerenciar independentemente.")
+        
+        # Interface para adicionar funcionários planejados
+        with st.expander("➕ Adicionar Funcionário Planejado"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                nome_planejado = st.text_input("Nome do funcionário", key="nome_planejado")
+                cargo_planejado = st.selectbox(
+                    "Cargo planejado",
+                    ["Vendedor(a)", "Optometrista", "Gerente", "Recepcionista", "Técnico em Ótica", "Auxiliar Administrativo"],
+                    key="cargo_planejado"
+                )
+                salario_planejado = st.number_input(
+                    "Salário planejado (R$)",
+                    min_value=1518.00,
+                    value=1600.00,
+                    step=100.00,
+                    key="salario_planejado"
+                )
+                tipo_contrato_planejado = st.selectbox(
+                    "Tipo de contrato",
+                    ["CLT", "MEI", "Prestador de Serviços"],
+                    key="tipo_contrato_planejado"
+                )
+            
+            with col2:
+                data_admissao_planejada = st.date_input("Data de admissão planejada", key="data_planejada")
+                vale_transporte_planejado = st.checkbox("Vale transporte", key="vt_planejado")
+                vale_refeicao_planejado = st.number_input(
+                    "Vale refeição diário (R$)",
+                    min_value=0.00,
+                    value=25.00,
+                    step=5.00,
+                    key="vr_planejado"
+                )
+                plano_saude_planejado = st.checkbox("Plano de saúde", key="plano_planejado")
+            
+            if st.button("➕ Adicionar Funcionário Planejado", type="primary"):
+                if nome_planejado:
+                    novo_funcionario = {
+                        'nome': nome_planejado,
+                        'cargo': cargo_planejado,
+                        'salario': salario_planejado,
+                        'tipo_contrato': tipo_contrato_planejado,
+                        'data_admissao': str(data_admissao_planejada),
+                        'vale_transporte': vale_transporte_planejado,
+                        'vale_refeicao': vale_refeicao_planejado,
+                        'plano_saude': plano_saude_planejado,
+                        'comissao': 0.0,
+                        'escolaridade': 'Ensino Médio',
+                        'dependentes': 0
+                    }
+                    st.session_state.business_data['funcionarios_planejados'].append(novo_funcionario)
+                    save_user_data()
+                    st.success(f"✅ Funcionário {nome_planejado} adicionado com sucesso!")
+                    st.rerun()
+                else:
+                    st.error("⚠️ Por favor, preencha o nome do funcionário.")
+        
+        # Exibir funcionários planejados
+        if st.session_state.business_data['funcionarios_planejados']:
+            st.markdown("### 👥 Funcionários Planejados Cadastrados")
+            
+            for i, func in enumerate(st.session_state.business_data['funcionarios_planejados']):
+                with st.container():
+                    col1, col2, col3 = st.columns([3, 2, 1])
+                    
+                    with col1:
+                        st.markdown(f"**{func['nome']}**")
+                        st.caption(f"{func['cargo']} • {func['tipo_contrato']} • {format_currency(func['salario'])}")
+                    
+                    with col2:
+                        st.markdown(f"**Admissão:** {func['data_admissao']}")
+                        beneficios = []
+                        if func['vale_transporte']: beneficios.append("VT")
+                        if func['vale_refeicao'] > 0: beneficios.append(f"VR R${func['vale_refeicao']:.0f}")
+                        if func['plano_saude']: beneficios.append("Plano Saúde")
+                        st.caption(f"Benefícios: {', '.join(beneficios) if beneficios else 'Nenhum'}")
+                    
+                    with col3:
+                        if st.button("🗑️", key=f"remove_planejado_{i}", help="Remover funcionário"):
+                            st.session_state.business_data['funcionarios_planejados'].pop(i)
+                            save_user_data()
+                            st.rerun()
+                    
+                    st.divider()
+            
+            # Resumo de custos
+            total_salarios_planejados = sum(func['salario'] for func in st.session_state.business_data['funcionarios_planejados'])
+            total_funcionarios_planejados = len(st.session_state.business_data['funcionarios_planejados'])
+            
+            col_resumo1, col_resumo2, col_resumo3 = st.columns(3)
+            
+            with col_resumo1:
+                st.metric("Total de Funcionários", total_funcionarios_planejados)
+            
+            with col_resumo2:
+                st.metric("Folha Salarial Base", format_currency(total_salarios_planejados))
+            
+            with col_resumo3:
+                # Usar os dados diretamente do session_state
+                folha_com_encargos = 0
+                
+                # Usar dados do session_state
+                for func in st.session_state.business_data['funcionarios_planejados']:
+                    salario = float(func.get('salario', 0))
+                    tipo_contrato = func.get('tipo_contrato', 'CLT')
+                    
+                    if tipo_contrato == 'CLT':
+                        # Calcular encargos detalhados como na aba de custos
+                        inss_empresa = salario * 0.20
+                        fgts = salario * 0.08
+                        ferias = (salario * 1.33) / 12
+                        decimo_terceiro = salario / 12
+                        outros_encargos = salario * 0.10
+                        encargos_total = inss_empresa + fgts + ferias + decimo_terceiro + outros_encargos
+                        folha_com_encargos += salario + encargos_total
+                    else:
+                        # Prestadores sem encargos
+                        folha_com_encargos += salario
+                
+                st.metric("Custo Total Estimado", format_currency(folha_com_encargos))
+                
+                # Salvar o valor calculado para consistência entre abas
+                st.session_state.business_data['custo_total_estimado'] = folha_com_encargos
+                save_user_data()
+            
+            st.info("💡 **Dica**: Estes funcionários podem ser importados automaticamente para o **DP e Tributação** para cálculos detalhados.")
+        
+        else:
+            st.info("📝 Nenhum funcionário planejado cadastrado. Use o formulário acima para adicionar.")
+    
+    with tab3:
+        st.subheader("📋 Pessoas e Parceiros")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Políticas Trabalhistas**")
+            
+            regime_contratacao = st.multiselect(
+                "Regimes de contratação que utilizará",
+                ["CLT", "MEI parceiro", "Prestação de serviço", "Estágio", "Terceirização", "Comissionista"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('regime_contratacao', []),
+                    ["CLT", "MEI parceiro", "Prestação de serviço", "Estágio", "Terceirização", "Comissionista"],
+                    ["CLT"]
+                )
+            )
+            # Auto-save regime_contratacao
+            if regime_contratacao != st.session_state.business_data.get('regime_contratacao'):
+                st.session_state.business_data['regime_contratacao'] = regime_contratacao
+                save_user_data()
+            
+            beneficios_oferecidos = st.multiselect(
+                "Benefícios que oferecerá",
+                ["Vale transporte", "Vale alimentação", "Plano de saúde", "Comissões", 
+                 "Desconto em produtos", "13º salário", "Férias", "FGTS"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('beneficios_oferecidos', []),
+                    ["Vale transporte", "Vale alimentação", "Plano de saúde", "Comissões", 
+                     "Desconto em produtos", "13º salário", "Férias", "FGTS"],
+                    ["Vale transporte", "13º salário", "Férias", "FGTS"]
+                )
+            )
+            # Auto-save beneficios_oferecidos
+            if beneficios_oferecidos != st.session_state.business_data.get('beneficios_oferecidos'):
+                st.session_state.business_data['beneficios_oferecidos'] = beneficios_oferecidos
+                save_user_data()
+            
+            politica_comissoes = st.text_area(
+                "Política de comissões/metas",
+                value=st.session_state.business_data.get('politica_comissoes', ''),
+                height=100,
+                placeholder="Ex: 3% sobre vendas acima da meta, bônus por satisfação do cliente..."
+            )
+            # Auto-save politica_comissoes
+            if politica_comissoes != st.session_state.business_data.get('politica_comissoes'):
+                st.session_state.business_data['politica_comissoes'] = politica_comissoes
+                save_user_data()
+        
+        with col2:
+            st.markdown("**Desenvolvimento e Treinamento**")
+            
+            plano_treinamento = st.multiselect(
+                "Treinamentos que oferecerá",
+                ["Atendimento ao cliente", "Conhecimentos em óptica", "Vendas", "Sistema/Software", 
+                 "Produtos e marcas", "Ajustes técnicos", "Compliance/Segurança"],
+                default=safe_multiselect_default(
+                    st.session_state.business_data.get('plano_treinamento', []),
+                    ["Atendimento ao cliente", "Conhecimentos em óptica", "Vendas", "Sistema/Software", 
+                     "Produtos e marcas", "Ajustes técnicos", "Compliance/Segurança"],
+                    ["Atendimento ao cliente", "Vendas"]
+                )
+            )
+            # Auto-save plano_treinamento
+            if plano_treinamento != st.session_state.business_data.get('plano_treinamento'):
+                st.session_state.business_data['plano_treinamento'] = plano_treinamento
+                save_user_data()
+            
+            frequencia_treinamento = st.selectbox(
+                "Frequência dos treinamentos",
+                ["Mensal", "Trimestral", "Semestral", "Anual", "Conforme necessidade"],
+                index=["Mensal", "Trimestral", "Semestral", "Anual", "Conforme necessidade"].index(
+                    st.session_state.business_data.get('frequencia_treinamento', 'Trimestral')
+                )
+            )
+            # Auto-save frequencia_treinamento
+            if frequencia_treinamento != st.session_state.business_data.get('frequencia_treinamento'):
+                st.session_state.business_data['frequencia_treinamento'] = frequencia_treinamento
+                save_user_data()
+            
+            avaliacao_desempenho = st.text_area(
+                "Sistema de avaliação de desempenho",
+                value=st.session_state.business_data.get('avaliacao_desempenho', ''),
+                height=100,
+                placeholder="Como avaliará e acompanhará o desempenho da equipe?"
+            )
+            # Auto-save avaliacao_desempenho
+            if avaliacao_desempenho != st.session_state.business_data.get('avaliacao_desempenho'):
+                st.session_state.business_data['avaliacao_desempenho'] = avaliacao_desempenho
+                save_user_data()
+    
+    with tab3:
+        st.subheader("🎯 Sistema de Captação e Comissões")
+        st.markdown("Configure comissões diferenciadas por modalidade de venda e tipo de produto")
+        
+        # Ativar sistema de captação
+        usar_sistema_captacao = st.checkbox(
+            "Ativar sistema de captação com comissões",
+            value=st.session_state.business_data.get('usar_sistema_captacao', False),
+            help="Permite configurar comissões diferentes para vendas à vista e parceladas"
+        )
+        
+        if usar_sistema_captacao != st.session_state.business_data.get('usar_sistema_captacao'):
+            st.session_state.business_data['usar_sistema_captacao'] = usar_sistema_captacao
+            save_user_data()
+        
+        if usar_sistema_captacao:
+            st.markdown("### 💰 Configuração de Comissões por Modalidade")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**🟢 Vendas À Vista**")
+                comissao_avista = st.number_input(
+                    "Comissão por venda à vista (R$)",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('comissao_avista', 30.0)),
+                    step=5.0,
+                    format="%.2f",
+                    help="Valor fixo pago por cada venda à vista convertida"
+                )
+                
+                if comissao_avista != st.session_state.business_data.get('comissao_avista'):
+                    st.session_state.business_data['comissao_avista'] = comissao_avista
+                    save_user_data()
+                
+                # Tipo de comissão à vista
+                tipo_comissao_avista = st.selectbox(
+                    "Tipo de comissão à vista",
+                    ["Valor fixo por venda", "Percentual sobre valor"],
+                    index=0 if st.session_state.business_data.get('tipo_comissao_avista', 'Valor fixo por venda') == 'Valor fixo por venda' else 1
+                )
+                
+                if tipo_comissao_avista != st.session_state.business_data.get('tipo_comissao_avista'):
+                    st.session_state.business_data['tipo_comissao_avista'] = tipo_comissao_avista
+                    save_user_data()
+                
+                if tipo_comissao_avista == "Percentual sobre valor":
+                    percentual_avista = st.number_input(
+                        "Percentual sobre vendas à vista (%)",
+                        min_value=0.0,
+                        max_value=15.0,
+                        value=float(st.session_state.business_data.get('percentual_comissao_avista', 3.0)),
+                        step=0.5,
+                        format="%.1f"
+                    )
+                    
+                    if percentual_avista != st.session_state.business_data.get('percentual_comissao_avista'):
+                        st.session_state.business_data['percentual_comissao_avista'] = percentual_avista
+                        save_user_data()
+            
+            with col2:
+                st.markdown("**🟡 Vendas Parceladas**")
+                comissao_parcelada = st.number_input(
+                    "Comissão por venda parcelada (R$)",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('comissao_parcelada', 20.0)),
+                    step=5.0,
+                    format="%.2f",
+                    help="Valor fixo pago por cada venda parcelada convertida"
+                )
+                
+                if comissao_parcelada != st.session_state.business_data.get('comissao_parcelada'):
+                    st.session_state.business_data['comissao_parcelada'] = comissao_parcelada
+                    save_user_data()
+                
+                # Tipo de comissão parcelada
+                tipo_comissao_parcelada = st.selectbox(
+                    "Tipo de comissão parcelada",
+                    ["Valor fixo por venda", "Percentual sobre valor"],
+                    index=0 if st.session_state.business_data.get('tipo_comissao_parcelada', 'Valor fixo por venda') == 'Valor fixo por venda' else 1
+                )
+                
+                if tipo_comissao_parcelada != st.session_state.business_data.get('tipo_comissao_parcelada'):
+                    st.session_state.business_data['tipo_comissao_parcelada'] = tipo_comissao_parcelada
+                    save_user_data()
+                
+                if tipo_comissao_parcelada == "Percentual sobre valor":
+                    percentual_parcelada = st.number_input(
+                        "Percentual sobre vendas parceladas (%)",
+                        min_value=0.0,
+                        max_value=15.0,
+                        value=float(st.session_state.business_data.get('percentual_comissao_parcelada', 2.0)),
+                        step=0.5,
+                        format="%.1f"
+                    )
+                    
+                    if percentual_parcelada != st.session_state.business_data.get('percentual_comissao_parcelada'):
+                        st.session_state.business_data['percentual_comissao_parcelada'] = percentual_parcelada
+                        save_user_data()
+            
+            # Configurações adicionais
+            st.markdown("### 🎯 Configurações Adicionais do Sistema")
+            
+            col3, col4 = st.columns(2)
+            
+            with col3:
+                st.markdown("**Comissões por Tipo de Produto**")
+                
+                usar_comissao_produto = st.checkbox(
+                    "Diferenciar comissão por tipo de produto",
+                    value=st.session_state.business_data.get('usar_comissao_produto', False)
+                )
+                
+                if usar_comissao_produto != st.session_state.business_data.get('usar_comissao_produto'):
+                    st.session_state.business_data['usar_comissao_produto'] = usar_comissao_produto
+                    save_user_data()
+                
+                if usar_comissao_produto:
+                    comissao_lentes = st.number_input(
+                        "Comissão extra por lentes (R$)",
+                        min_value=0.0,
+                        value=float(st.session_state.business_data.get('comissao_lentes', 10.0)),
+                        step=2.5,
+                        format="%.2f"
+                    )
+                    
+                    if comissao_lentes != st.session_state.business_data.get('comissao_lentes'):
+                        st.session_state.business_data['comissao_lentes'] = comissao_lentes
+                        save_user_data()
+                    
+                    comissao_armacoes = st.number_input(
+                        "Comissão extra por armações (R$)",
+                        min_value=0.0,
+                        value=float(st.session_state.business_data.get('comissao_armacoes', 5.0)),
+                        step=2.5,
+                        format="%.2f"
+                    )
+                    
+                    if comissao_armacoes != st.session_state.business_data.get('comissao_armacoes'):
+                        st.session_state.business_data['comissao_armacoes'] = comissao_armacoes
+                        save_user_data()
+            
+            with col4:
+                st.markdown("**Configurações de Pagamento**")
+                
+                frequencia_pagamento = st.selectbox(
+                    "Frequência de pagamento das comissões",
+                    ["Semanal", "Quinzenal", "Mensal", "Por venda (imediato)"],
+                    index=["Semanal", "Quinzenal", "Mensal", "Por venda (imediato)"].index(
+                        st.session_state.business_data.get('frequencia_pagamento_comissao', 'Quinzenal')
+                    )
+                )
+                
+                if frequencia_pagamento != st.session_state.business_data.get('frequencia_pagamento_comissao'):
+                    st.session_state.business_data['frequencia_pagamento_comissao'] = frequencia_pagamento
+                    save_user_data()
+                
+                carencia_pagamento = st.number_input(
+                    "Carência para pagamento (dias)",
+                    min_value=0,
+                    max_value=30,
+                    value=int(st.session_state.business_data.get('carencia_pagamento', 7)),
+                    step=1,
+                    help="Dias após a venda para garantir que não há cancelamento"
+                )
+                
+                if carencia_pagamento != st.session_state.business_data.get('carencia_pagamento'):
+                    st.session_state.business_data['carencia_pagamento'] = carencia_pagamento
+                    save_user_data()
+                
+                meta_minima = st.number_input(
+                    "Meta mínima para receber comissão (vendas/mês)",
+                    min_value=0,
+                    value=int(st.session_state.business_data.get('meta_minima_comissao', 0)),
+                    step=1,
+                    help="Número mínimo de vendas no mês para receber comissão (0 = sem meta)"
+                )
+                
+                if meta_minima != st.session_state.business_data.get('meta_minima_comissao'):
+                    st.session_state.business_data['meta_minima_comissao'] = meta_minima
+                    save_user_data()
+            
+            # Simulador de comissões
+            st.markdown("### 📊 Simulador de Comissões")
+            
+            with st.expander("🧮 Simular Ganhos do Captador"):
+                col_sim1, col_sim2, col_sim3 = st.columns(3)
+                
+                with col_sim1:
+                    vendas_avista_sim = st.number_input("Vendas à vista no mês", min_value=0, value=15, step=1)
+                    ticket_medio_avista = st.number_input("Ticket médio à vista (R$)", min_value=0.0, value=450.0, step=50.0)
+                
+                with col_sim2:
+                    vendas_parcelada_sim = st.number_input("Vendas parceladas no mês", min_value=0, value=25, step=1)
+                    ticket_medio_parcelada = st.number_input("Ticket médio parcelado (R$)", min_value=0.0, value=380.0, step=50.0)
+                
+                with col_sim3:
+                    if usar_comissao_produto:
+                        vendas_com_lentes = st.number_input("Vendas com lentes", min_value=0, value=30, step=1)
+                        vendas_com_armacoes = st.number_input("Vendas com armações", min_value=0, value=40, step=1)
+                
+                # Calcular comissões simuladas
+                if tipo_comissao_avista == "Valor fixo por venda":
+                    total_comissao_avista = vendas_avista_sim * comissao_avista
+                else:
+                    total_comissao_avista = (vendas_avista_sim * ticket_medio_avista) * (percentual_avista / 100)
+                
+                if tipo_comissao_parcelada == "Valor fixo por venda":
+                    total_comissao_parcelada = vendas_parcelada_sim * comissao_parcelada
+                else:
+                    total_comissao_parcelada = (vendas_parcelada_sim * ticket_medio_parcelada) * (percentual_parcelada / 100)
+                
+                total_comissao_produtos = 0
+                if usar_comissao_produto:
+                    total_comissao_produtos = (vendas_com_lentes * comissao_lentes) + (vendas_com_armacoes * comissao_armacoes)
+                
+                total_comissao_mensal = total_comissao_avista + total_comissao_parcelada + total_comissao_produtos
+                
+                st.markdown("**Resultado da Simulação:**")
+                st.write(f"• Comissão vendas à vista: R$ {total_comissao_avista:,.2f}")
+                st.write(f"• Comissão vendas parceladas: R$ {total_comissao_parcelada:,.2f}")
+                if usar_comissao_produto:
+                    st.write(f"• Comissão produtos extras: R$ {total_comissao_produtos:,.2f}")
+                st.markdown(f"**Total mensal: R$ {total_comissao_mensal:,.2f}**")
+                
+                # Salvar projeção de comissões
+                st.session_state.business_data['projecao_comissoes_mensal'] = total_comissao_mensal
+                save_user_data()
+        
+        else:
+            st.info("📋 Sistema de captação desativado. Ative para configurar comissões diferenciadas.")
+    
+    with tab4:
+        st.subheader("💰 Custos Trabalhistas Calculados Automaticamente")
+        
+        # Buscar dados dos funcionários planejados
+        funcionarios_planejados = st.session_state.business_data.get('funcionarios_planejados', [])
+        
+        if funcionarios_planejados:
+            st.success(f"📊 **Calculando custos baseado em {len(funcionarios_planejados)} funcionários planejados**")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**Breakdown por Funcionário:**")
+                
+                total_salarios_base = 0
+                total_encargos = 0
+                
+                for i, func in enumerate(funcionarios_planejados):
+                    nome = func.get('nome', f'Funcionário {i+1}')
+                    cargo = func.get('cargo', 'N/A')
+                    salario = float(func.get('salario', 0))
+                    tipo_contrato = func.get('tipo_contrato', 'CLT')
+                    
+                    if salario > 0:
+                        # Verificar tipo de contrato para aplicar encargos corretos
+                        if tipo_contrato == 'CLT':
+                            # Cálculo de encargos CLT
+                            inss_empresa = salario * 0.20  # INSS empresa
+                            fgts = salario * 0.08          # FGTS
+                            ferias = (salario * 1.33) / 12 # Férias + 1/3
+                            decimo_terceiro = salario / 12  # 13º salário
+                            outros_encargos = salario * 0.10 # Provisões e outros
+                            
+                            encargos_funcionario = inss_empresa + fgts + ferias + decimo_terceiro + outros_encargos
+                            custo_total_funcionario = salario + encargos_funcionario
+                            
+                            with st.expander(f"💼 {nome} - {cargo} (CLT)"):
+                                st.write(f"• Salário base: {format_currency(salario)}")
+                                st.write(f"• INSS empresa: {format_currency(inss_empresa)}")
+                                st.write(f"• FGTS: {format_currency(fgts)}")
+                                st.write(f"• Férias + 1/3: {format_currency(ferias)}")
+                                st.write(f"• 13º salário: {format_currency(decimo_terceiro)}")
+                                st.write(f"• Outros encargos: {format_currency(outros_encargos)}")
+                                st.markdown(f"**Custo total: {format_currency(custo_total_funcionario)}**")
+                        
+                        else:
+                            # Prestador de serviços - sem encargos trabalhistas
+                            encargos_funcionario = 0
+                            custo_total_funcionario = salario
+                            
+                            with st.expander(f"💼 {nome} - {cargo} (Prestador de Serviços)"):
+                                st.write(f"• Valor do serviço: {format_currency(salario)}")
+                                st.write("• Sem encargos trabalhistas (prestador de serviços)")
+                                st.markdown(f"**Custo total: {format_currency(custo_total_funcionario)}**")
+                        
+                        total_salarios_base += salario
+                        total_encargos += encargos_funcionario
+            
+            with col2:
+                st.markdown("**Resumo dos Custos Trabalhistas:**")
+                
+                # Usar os mesmos totais calculados no loop anterior para consistência
+                folha_total_com_encargos = total_salarios_base + total_encargos
+                
+                # Separar CLT de Prestadores para análise detalhada
+                total_clt = 0
+                total_prestadores = 0
+                encargos_clt = 0
+                
+                for func in st.session_state.business_data.get('funcionarios_planejados', []):
+                    salario = float(func.get('salario', 0))
+                    tipo_contrato = func.get('tipo_contrato', 'CLT')
+                    
+                    if tipo_contrato == 'CLT':
+                        total_clt += salario
+                        # Usar exatamente o mesmo cálculo do primeiro loop
+                        inss_empresa = salario * 0.20
+                        fgts = salario * 0.08
+                        ferias = (salario * 1.33) / 12
+                        decimo_terceiro = salario / 12
+                        outros_encargos = salario * 0.10
+                        encargos_func = inss_empresa + fgts + ferias + decimo_terceiro + outros_encargos
+                        encargos_clt += encargos_func
+                    else:
+                        total_prestadores += salario
+                
+                # Verificar se os totais batem
+                folha_total_verificacao = total_clt + total_prestadores + encargos_clt
+                if abs(folha_total_com_encargos - folha_total_verificacao) > 0.01:
+                    # Usar o cálculo verificado para garantir consistência
+                    folha_total_com_encargos = folha_total_verificacao
+                
+                # Análise separada
+                st.markdown("**💼 Funcionários CLT:**")
+                if total_clt > 0:
+                    st.metric("Salários CLT", format_currency(total_clt))
+                    st.metric("Encargos CLT", format_currency(encargos_clt), 
+                             f"{(encargos_clt/total_clt*100):.1f}% dos salários")
+                else:
+                    st.info("Nenhum funcionário CLT")
+                
+                st.markdown("**🤝 Prestadores de Serviços:**")
+                if total_prestadores > 0:
+                    st.metric("Total Prestadores", format_currency(total_prestadores))
+                    st.caption("Sem encargos trabalhistas")
+                else:
+                    st.info("Nenhum prestador de serviços")
+                
+                st.markdown("---")
+                st.metric("💼 **Custo Total Mensal**", format_currency(folha_total_com_encargos))
+                
+                # Projeção anual
+                folha_anual = folha_total_com_encargos * 12
+                st.metric("📅 Projeção Anual", format_currency(folha_anual))
+                
+                # Análise de impacto no faturamento
+                vendas_mes_1 = st.session_state.business_data.get('vendas_mes_1', 25000)
+                if vendas_mes_1 > 0:
+                    percentual_faturamento = (folha_total_com_encargos / vendas_mes_1) * 100
+                    st.info(f"📈 **A folha representa {percentual_faturamento:.1f}% do faturamento mensal**")
+                    
+                    if percentual_faturamento > 30:
+                        st.warning("⚠️ Folha alta (>30% do faturamento). Considere otimizar.")
+                    elif percentual_faturamento < 15:
+                        st.success("✅ Folha equilibrada (<15% do faturamento)")
+                    else:
+                        st.info("ℹ️ Folha dentro da média (15-30% do faturamento)")
+                
+                # Salvar dados calculados automaticamente
+                st.session_state.business_data.update({
+                    'folha_total_com_encargos': folha_total_com_encargos,
+                    'folha_anual': folha_anual,
+                    'total_salarios_clt': total_clt,
+                    'total_prestadores': total_prestadores,
+                    'total_encargos_clt': encargos_clt,
+                    'total_salarios_base': total_salarios_base,
+                    'total_encargos': total_encargos
+                })
+                save_user_data()
+        
+        else:
+            st.info("📝 **Primeiro planeje sua equipe na aba 'Estrutura da Equipe'**")
+            st.write("Depois os custos trabalhistas serão calculados automaticamente aqui.")
+            
+            # Calculadora simples para referência
+            with st.expander("🧮 Calculadora de Referência (apenas para simular)"):
+                st.markdown("**Use para entender custos antes de planejar a equipe:**")
+                
+                salario_referencia = st.number_input(
+                    "Salário para simular (R$)",
+                    min_value=1518.0,  # Salário mínimo 2025
+                    value=2000.0,
+                    step=100.0,
+                    format="%.0f",
+                    help="Este é apenas um exemplo para você entender os custos"
+                )
+                
+                if salario_referencia > 0:
+                    # Cálculo dos encargos
+                    inss_empresa = salario_referencia * 0.20
+                    fgts = salario_referencia * 0.08
+                    ferias = (salario_referencia * 1.33) / 12
+                    decimo_terceiro = salario_referencia / 12
+                    outros_encargos = salario_referencia * 0.10
+                    
+                    encargos_total = inss_empresa + fgts + ferias + decimo_terceiro + outros_encargos
+                    custo_total = salario_referencia + encargos_total
+                    percentual = (encargos_total / salario_referencia) * 100
+                    
+                    st.write(f"• Salário: {format_currency(salario_referencia)}")
+                    st.write(f"• Encargos: {format_currency(encargos_total)} ({percentual:.1f}%)")
+                    st.write(f"• **Custo total: {format_currency(custo_total)}**")
+                    st.caption("💡 Esta é apenas uma simulação. Os valores reais virão dos funcionários planejados.")
+    
+    # Store all data
+    st.session_state.business_data.update({
+        'num_funcionarios': num_funcionarios,
+        'cargos_necessarios': cargos_necessarios,
+        'perfil_funcionarios': perfil_funcionarios,
+        'estrategia_contratacao': estrategia_contratacao,
+        'jornada_trabalho': jornada_trabalho,
+        'escala_trabalho': escala_trabalho,
+        'faixa_salarial': faixa_salarial,
+        'plano_crescimento_equipe': plano_crescimento_equipe,
+        'regime_contratacao': regime_contratacao,
+        'beneficios_oferecidos': beneficios_oferecidos,
+        'politica_comissoes': politica_comissoes,
+        'plano_treinamento': plano_treinamento,
+        'frequencia_treinamento': frequencia_treinamento,
+        'avaliacao_desempenho': avaliacao_desempenho
+    })
+    
+    # Auto-save
+    save_user_data()
+    
+    st.markdown("---")
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step8"):
+            st.session_state.step = 7
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step8"):
+            st.session_state.step = 9
+            st.rerun()
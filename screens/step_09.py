@@ -0,0 +1,358 @@
+"""
+Etapa 9 - Investimento Inicial
+Custos de instalação, custos legais e de marketing e resumo do investimento
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, save_user_data
+
+
+def show_step_9():
+    """Etapa 9: Investimento Inicial"""
+    st.header("9️⃣ Investimento Inicial")
+    st.markdown("**FASE 9: INVESTIMENTO** - Calcule todos os custos de abertura")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("💰 Custos de Instalação")
+        
+        # Usar valor do sumário executivo se disponível
+        custos_reforma_obj = st.session_state.business_data.get('custos_reforma', {})
+        reforma_automatica = custos_reforma_obj.get('custo_total_com_adicional', 0) if custos_reforma_obj else 0
+        
+        if reforma_automatica > 0:
+            st.info(f"💡 Valor automático do Sumário Executivo: {format_currency(reforma_automatica)}")
+            # Persistir estado do checkbox
+            checkbox_state = st.session_state.business_data.get('usar_reforma_auto', True)
+            usar_automatico = st.checkbox("Usar valor calculado automaticamente", value=checkbox_state, key="usar_reforma_auto")
+            
+            # Salvar estado do checkbox
+            if usar_automatico != st.session_state.business_data.get('usar_reforma_auto'):
+                st.session_state.business_data['usar_reforma_auto'] = usar_automatico
+                save_user_data()
+            
+            if usar_automatico:
+                reforma_loja = reforma_automatica
+                st.metric("Reforma/adequação (automática)", format_currency(reforma_loja))
+            else:
+                reforma_loja = st.number_input(
+                    "Reforma/adequação da loja (R$) - Manual",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('reforma_loja_manual', reforma_automatica)),
+                    step=1000.0,
+                    format="%.0f",
+                    key="reforma_loja_manual_input"
+                )
+                # Salvar valor manual separadamente
+                if reforma_loja != st.session_state.business_data.get('reforma_loja_manual'):
+                    st.session_state.business_data['reforma_loja_manual'] = reforma_loja
+        else:
+            st.warning("⚠️ Configure a reforma no Sumário Executivo (Etapa 1) para cálculo automático")
+            reforma_loja = st.number_input(
+                "Reforma/adequação da loja (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('reforma_loja', 15000)),
+                step=1000.0,
+                format="%.0f"
+            )
+        
+        if reforma_loja != st.session_state.business_data.get('reforma_loja'):
+            st.session_state.business_data['reforma_loja'] = reforma_loja
+            save_user_data()
+        
+        # Usar valor do plano operacional se disponível
+        equipamentos_automatico = st.session_state.business_data.get('investimento_equipamentos', 0)
+        
+        if equipamentos_automatico > 0:
+            st.info(f"💡 Valor do Plano Operacional: {format_currency(equipamentos_automatico)}")
+            # Persistir estado do checkbox
+            checkbox_equip_state = st.session_state.business_data.get('usar_equip_auto', True)
+            usar_equip_auto = st.checkbox("Usar valor do Plano Operacional", value=checkbox_equip_state, key="usar_equip_auto")
+            
+            # Salvar estado do checkbox
+            if usar_equip_auto != st.session_state.business_data.get('usar_equip_auto'):
+                st.session_state.business_data['usar_equip_auto'] = usar_equip_auto
+                save_user_data()
+            
+            if usar_equip_auto:
+                equipamentos_total = equipamentos_automatico
+                st.metric("Equipamentos (automático)", format_currency(equipamentos_total))
+            else:
+                equipamentos_total = st.number_input(
+                    "Equipamentos e mobiliário (R$) - Manual",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('equipamentos_total_manual', equipamentos_automatico)),
+                    step=1000.0,
+                    format="%.0f",
+                    key="equipamentos_total_manual_input"
+                )
+                # Salvar valor manual separadamente
+                if equipamentos_total != st.session_state.business_data.get('equipamentos_total_manual'):
+                    st.session_state.business_data['equipamentos_total_manual'] = equipamentos_total
+        else:
+            equipamentos_total = st.number_input(
+                "Equipamentos e mobiliário (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('equipamentos_total', 12000)),
+                step=1000.0,
+                format="%.0f"
+            )
+        
+        if equipamentos_total != st.session_state.business_data.get('equipamentos_total'):
+            st.session_state.business_data['equipamentos_total'] = equipamentos_total
+            save_user_data()
+        
+        # Estoque inicial - vem da etapa Produtos e Serviços
+        estoque_automatico = st.session_state.business_data.get('estoque_inicial', 0)
+        # Verifica se existe no context da etapa atual para evitar conflito
+        estoque_atual_contexto = float(st.session_state.business_data.get('estoque_inicial_investimento', 0))
+        
+        # Se já foi definido no contexto do investimento, usa esse valor
+        if estoque_atual_contexto > 0 and estoque_atual_contexto != estoque_automatico:
+            estoque_automatico = estoque_atual_contexto
+        
+        if estoque_automatico > 0:
+            st.info(f"💡 Valor da etapa Produtos e Serviços: {format_currency(estoque_automatico)}")
+            # Persistir estado do checkbox
+            checkbox_estoque_state = st.session_state.business_data.get('usar_estoque_auto', True)
+            usar_estoque_auto = st.checkbox("Usar valor da etapa Produtos e Serviços", value=checkbox_estoque_state, key="usar_estoque_auto")
+            
+            # Salvar estado do checkbox
+            if usar_estoque_auto != st.session_state.business_data.get('usar_estoque_auto'):
+                st.session_state.business_data['usar_estoque_auto'] = usar_estoque_auto
+                save_user_data()
+            
+            if usar_estoque_auto:
+                estoque_inicial = estoque_automatico
+                st.metric("Estoque inicial (automático)", format_currency(estoque_inicial))
+            else:
+                estoque_inicial = st.number_input(
+                    "Estoque inicial (R$) - Manual",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('estoque_inicial_manual', estoque_automatico)),
+                    step=1000.0,
+                    format="%.0f",
+                    key="estoque_inicial_manual_input"
+                )
+                # Salvar valor manual separadamente
+                if estoque_inicial != st.session_state.business_data.get('estoque_inicial_manual'):
+                    st.session_state.business_data['estoque_inicial_manual'] = estoque_inicial
+        else:
+            estoque_inicial = st.number_input(
+                "Estoque inicial (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('estoque_inicial', 25000)),
+                step=1000.0,
+                format="%.0f"
+            )
+        
+        if estoque_inicial != st.session_state.business_data.get('estoque_inicial'):
+            st.session_state.business_data['estoque_inicial'] = estoque_inicial
+            save_user_data()
+        
+        # Capital de giro - calcular automaticamente baseado no faturamento
+        objetivo_faturamento = st.session_state.business_data.get('objetivo_faturamento', 0)
+        capital_giro_automatico = objetivo_faturamento * 3 if objetivo_faturamento > 0 else 0  # 3 meses
+        
+        if capital_giro_automatico > 0:
+            st.info(f"💡 Sugestão: 3 meses de faturamento = {format_currency(capital_giro_automatico)}")
+            # Persistir estado do checkbox
+            checkbox_capital_state = st.session_state.business_data.get('usar_capital_auto', True)
+            usar_capital_auto = st.checkbox("Usar 3 meses de faturamento objetivo", value=checkbox_capital_state, key="usar_capital_auto")
+            
+            # Salvar estado do checkbox
+            if usar_capital_auto != st.session_state.business_data.get('usar_capital_auto'):
+                st.session_state.business_data['usar_capital_auto'] = usar_capital_auto
+                save_user_data()
+            
+            if usar_capital_auto:
+                capital_giro = capital_giro_automatico
+                st.metric("Capital de giro (automático)", format_currency(capital_giro))
+            else:
+                capital_giro = st.number_input(
+                    "Capital de giro (3-6 meses) (R$) - Manual",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('capital_giro_manual', capital_giro_automatico)),
+                    step=1000.0,
+                    format="%.0f",
+                    key="capital_giro_manual_input"
+                )
+                # Salvar valor manual separadamente
+                if capital_giro != st.session_state.business_data.get('capital_giro_manual'):
+                    st.session_state.business_data['capital_giro_manual'] = capital_giro
+        else:
+            capital_giro = st.number_input(
+                "Capital de giro (3-6 meses) (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('capital_giro', 18000)),
+                step=1000.0,
+                format="%.0f"
+            )
+        
+        if capital_giro != st.session_state.business_data.get('capital_giro'):
+            st.session_state.business_data['capital_giro'] = capital_giro
+            save_user_data()
+    
+    with col2:
+        st.subheader("📊 Custos Legais e Marketing")
+        
+        # Abertura da empresa - pode vir do plano operacional
+        abertura_automatica = st.session_state.business_data.get('custos_licencas', 0)
+        if abertura_automatica == 0:
+            abertura_automatica = st.session_state.business_data.get('licencas_alvara', 0)
+        
+        if abertura_automatica > 0:
+            st.info(f"💡 Valor do Plano Operacional: {format_currency(abertura_automatica)}")
+            # Persistir estado do checkbox
+            checkbox_abertura_state = st.session_state.business_data.get('usar_abertura_auto', True)
+            usar_abertura_auto = st.checkbox("Usar valor do Plano Operacional", value=checkbox_abertura_state, key="usar_abertura_auto")
+            
+            # Salvar estado do checkbox
+            if usar_abertura_auto != st.session_state.business_data.get('usar_abertura_auto'):
+                st.session_state.business_data['usar_abertura_auto'] = usar_abertura_auto
+                save_user_data()
+            
+            if usar_abertura_auto:
+                abertura_empresa = abertura_automatica
+                st.metric("Abertura/licenças (automática)", format_currency(abertura_empresa))
+            else:
+                abertura_empresa = st.number_input(
+                    "Abertura da empresa/licenças (R$) - Manual",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('abertura_empresa_manual', abertura_automatica)),
+                    step=500.0,
+                    format="%.0f",
+                    key="abertura_empresa_manual_input"
+                )
+                # Salvar valor manual separadamente
+                if abertura_empresa != st.session_state.business_data.get('abertura_empresa_manual'):
+                    st.session_state.business_data['abertura_empresa_manual'] = abertura_empresa
+        else:
+            abertura_empresa = st.number_input(
+                "Abertura da empresa/licenças (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('abertura_empresa', 3000)),
+                step=500.0,
+                format="%.0f"
+            )
+        
+        if abertura_empresa != st.session_state.business_data.get('abertura_empresa'):
+            st.session_state.business_data['abertura_empresa'] = abertura_empresa
+            save_user_data()
+        
+        # Marketing de lançamento - pode vir da estratégia de marketing
+        marketing_automatico = st.session_state.business_data.get('orcamento_marketing_inicial', 0)
+        if marketing_automatico == 0:
+            marketing_automatico = st.session_state.business_data.get('investimento_marketing_lancamento', 0)
+        
+        if marketing_automatico > 0:
+            st.info(f"💡 Valor da Estratégia de Marketing: {format_currency(marketing_automatico)}")
+            # Persistir estado do checkbox
+            checkbox_marketing_state = st.session_state.business_data.get('usar_marketing_auto', True)
+            usar_marketing_auto = st.checkbox("Usar valor da Estratégia de Marketing", value=checkbox_marketing_state, key="usar_marketing_auto")
+            
+            # Salvar estado do checkbox
+            if usar_marketing_auto != st.session_state.business_data.get('usar_marketing_auto'):
+                st.session_state.business_data['usar_marketing_auto'] = usar_marketing_auto
+                save_user_data()
+            
+            if usar_marketing_auto:
+                marketing_lancamento = marketing_automatico
+                st.metric("Marketing (automático)", format_currency(marketing_lancamento))
+            else:
+                marketing_lancamento = st.number_input(
+                    "Marketing de lançamento (R$) - Manual",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('marketing_lancamento_manual', marketing_automatico)),
+                    step=500.0,
+                    format="%.0f",
+                    key="marketing_lancamento_manual_input"
+                )
+                # Salvar valor manual separadamente
+                if marketing_lancamento != st.session_state.business_data.get('marketing_lancamento_manual'):
+                    st.session_state.business_data['marketing_lancamento_manual'] = marketing_lancamento
+        else:
+            marketing_lancamento = st.number_input(
+                "Marketing de lançamento (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('marketing_lancamento', 2000)),
+                step=500.0,
+                format="%.0f"
+            )
+        
+        if marketing_lancamento != st.session_state.business_data.get('marketing_lancamento'):
+            st.session_state.business_data['marketing_lancamento'] = marketing_lancamento
+            save_user_data()
+        
+        seguros_iniciais = st.number_input(
+            "Seguros e garantias (R$)",
+            min_value=0.0,
+            value=float(st.session_state.business_data.get('seguros_iniciais', 1500)),
+            step=500.0,
+            format="%.0f"
+        )
+        if seguros_iniciais != st.session_state.business_data.get('seguros_iniciais'):
+            st.session_state.business_data['seguros_iniciais'] = seguros_iniciais
+            save_user_data()
+        
+        contingencia = st.number_input(
+            "Reserva de contingência (R$)",
+            min_value=0.0,
+            value=float(st.session_state.business_data.get('contingencia', 5000)),
+            step=1000.0,
+            format="%.0f"
+        )
+        if contingencia != st.session_state.business_data.get('contingencia'):
+            st.session_state.business_data['contingencia'] = contingencia
+            save_user_data()
+    
+    # Usar valores finais corretos (manual ou automático)
+    reforma_final = reforma_loja
+    equipamentos_final = equipamentos_total  
+    estoque_final = estoque_inicial
+    capital_final = capital_giro
+    abertura_final = abertura_empresa
+    marketing_final = marketing_lancamento
+    
+    # Cálculo total
+    investimento_total = reforma_final + equipamentos_final + estoque_final + capital_final + abertura_final + marketing_final + seguros_iniciais + contingencia
+    
+    st.markdown("---")
+    st.subheader("💯 Resumo do Investimento")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Investimento Fixo", format_currency(reforma_loja + equipamentos_total))
+        st.metric("Investimento Variável", format_currency(estoque_inicial + capital_giro))
+    
+    with col2:
+        st.metric("Custos Iniciais", format_currency(abertura_empresa + marketing_lancamento + seguros_iniciais))
+        st.metric("Contingência", format_currency(contingencia))
+    
+    with col3:
+        st.metric("**INVESTIMENTO TOTAL**", format_currency(investimento_total), delta=None)
+        
+        # Explicação simples em reais
+        if investimento_total > 0:
+            valor_fixo = reforma_loja + equipamentos_total
+            valor_estoque = estoque_inicial
+            st.caption(f"💡 Dinheiro para reforma/equipamentos: {format_currency(valor_fixo)}")
+            st.caption(f"💡 Dinheiro para produtos na loja: {format_currency(valor_estoque)}")
+    
+    # Store total
+    st.session_state.business_data['investimento_total'] = investimento_total
+    save_user_data()
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step9"):
+            st.session_state.step = 8
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step9"):
+            st.session_state.step = 10
+            st.rerun()
@@ -0,0 +1,2381 @@
+"""
+Etapa 10 - Projeções Financeiras
+Receitas, custos, DRE mês a mês, fluxo de caixa e exportação dos relatórios
+"""
+
+import streamlit as st
+import time
+import numpy as np
+
+from app_helpers import format_currency, calcular_custo_captador_mensal, save_user_data, show_report_job
+from br_format import format_frame
+from financial_projection import FinancialProjection
+from goal_seek import GoalSeekSolver
+from receivables import ReceivablesEngine
+from report_jobs import get_report_queue
+from scenario_cube import get_scenario_cube
+
+
+def show_step_10():
+    """Etapa 10: Projeções Financeiras"""
+    st.header("📊 Etapa 10: Projeções Financeiras")
+    st.markdown("**FASE 3: FINANÇAS** - Calcule receitas, custos e lucratividade")
+    
+    # Import pandas no início da função
+    import pandas as pd
+    
+    # Carregar dados salvos
+    vendas_mes_1 = st.session_state.business_data.get('vendas_mes_1', 20831)
+    crescimento_mensal = st.session_state.business_data.get('crescimento_mensal', 2.0)
+    ticket_medio = st.session_state.business_data.get('ticket_medio', 180)
+    
+    # Abas para organizar o conteúdo
+    tab1, tab2, tab3, tab4 = st.tabs(["💰 Receitas", "💸 Custos", "📊 DRE Mês a Mês", "💸 Fluxo de Caixa"])
+    
+    with tab1:
+        st.subheader("💰 Projeção de Receitas")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            vendas_mes_1 = st.number_input(
+                "Vendas no primeiro mês (R$)",
+                min_value=1000.0,
+                value=float(vendas_mes_1),
+                step=500.0,
+                format="%.0f"
+            )
+            if vendas_mes_1 != st.session_state.business_data.get('vendas_mes_1'):
+                st.session_state.business_data['vendas_mes_1'] = vendas_mes_1
+                save_user_data()
+            
+            crescimento_mensal = st.slider(
+                "Crescimento mensal (%)",
+                min_value=0.0,
+                max_value=10.0,
+                value=float(crescimento_mensal),
+                step=0.5
+            )
+            if crescimento_mensal != st.session_state.business_data.get('crescimento_mensal'):
+                st.session_state.business_data['crescimento_mensal'] = crescimento_mensal
+                save_user_data()
+        
+        with col2:
+            ticket_medio = st.number_input(
+                "Ticket médio (R$)",
+                min_value=50.0,
+                value=max(50.0, float(ticket_medio)),
+                step=10.0,
+                format="%.0f"
+            )
+            if ticket_medio != st.session_state.business_data.get('ticket_medio'):
+                st.session_state.business_data['ticket_medio'] = ticket_medio
+                save_user_data()
+            
+            vendas_quantidade = vendas_mes_1 / ticket_medio if ticket_medio > 0 else 0
+            st.metric("Vendas por mês", f"{vendas_quantidade:.0f} unidades")
+        
+        # Projeção anual
+        receita_anual = vendas_mes_1 * 12 * (1 + crescimento_mensal/100 * 6)  # Crescimento médio
+        st.session_state.business_data['receita_anual'] = receita_anual
+        st.metric("Receita Anual Projetada", format_currency(receita_anual))
+        
+        # Análise de sazonalidade
+        st.markdown("### 📈 Análise de Sazonalidade")
+        col_saz1, col_saz2 = st.columns(2)
+        
+        with col_saz1:
+            meses_alta = st.multiselect(
+                "Meses de alta temporada",
+                ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                 "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"],
+                default=st.session_state.business_data.get('meses_alta', ["Janeiro", "Fevereiro", "Dezembro"])
+            )
+            if meses_alta != st.session_state.business_data.get('meses_alta'):
+                st.session_state.business_data['meses_alta'] = meses_alta
+                save_user_data()
+        
+        with col_saz2:
+            incremento_alta = st.slider(
+                "Incremento na alta temporada (%)",
+                min_value=0,
+                max_value=50,
+                value=st.session_state.business_data.get('incremento_alta', 25),
+                step=5
+            )
+            if incremento_alta != st.session_state.business_data.get('incremento_alta'):
+                st.session_state.business_data['incremento_alta'] = incremento_alta
+                save_user_data()
+        
+        # Projeção com sazonalidade
+        receita_com_sazonalidade = 0
+        for mes in range(12):
+            mes_nome = ["Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+                       "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro"][mes]
+            
+            if mes == 0:
+                receita_mes = vendas_mes_1
+            else:
+                receita_mes = vendas_mes_1 * (1 + crescimento_mensal/100) ** mes
+            
+            if mes_nome in meses_alta:
+                receita_mes *= (1 + incremento_alta/100)
+            
+            receita_com_sazonalidade += receita_mes
+        
+        st.session_state.business_data['receita_com_sazonalidade'] = receita_com_sazonalidade
+        st.metric("Receita Anual com Sazonalidade", format_currency(receita_com_sazonalidade))
+    
+    with tab2:
+        st.subheader("💸 Estrutura de Custos")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Custos Fixos Mensais**")
+            
+            # Calcular custos separados por tipo
+            folha_clt_total = 0
+            servicos_prestadores_total = 0
+            
+            if hasattr(st.session_state, 'funcionarios') and st.session_state.funcionarios:
+                for func in st.session_state.funcionarios:
+                    if func['tipo_contrato'] == 'CLT':
+                        folha_clt_total += func['salario_base'] * 1.68  # CLT com encargos
+                    else:
+                        servicos_prestadores_total += func['salario_base']  # MEI/Prestador
+            
+            # Calcular aluguel sugerido baseado no plano operacional
+            area_loja = st.session_state.business_data.get('area_loja', 0)
+            cidade = st.session_state.business_data.get('cidade', '')
+            aluguel_sugerido = 3500  # valor padrão
+            if area_loja > 0:
+                # Estimativa baseada na área e localização
+                preco_m2 = {"São Paulo": 80, "Rio de Janeiro": 70, "Fortaleza": 35, "Salvador": 40}.get(cidade, 50)
+                aluguel_sugerido = area_loja * preco_m2
+            
+            # Auto-aplicar valores integrados se ainda não foram definidos
+            if folha_clt_total > 0 and st.session_state.business_data.get('salarios_clt', 0) <= 0:
+                st.session_state.business_data['salarios_clt'] = folha_clt_total
+                save_user_data()
+            
+            if servicos_prestadores_total > 0 and st.session_state.business_data.get('total_optometrista', 0) <= 0:
+                st.session_state.business_data['total_optometrista'] = servicos_prestadores_total
+                save_user_data()
+            
+            # Para aluguel, só aplicar sugestão se nunca foi definido (None)
+            if area_loja > 0 and 'aluguel' not in st.session_state.business_data:
+                st.session_state.business_data['aluguel'] = aluguel_sugerido
+                save_user_data()
+            
+            # Usar dados salvos, incluindo zero se foi explicitamente definido
+            aluguel_salvo = st.session_state.business_data.get('aluguel', None)
+            if aluguel_salvo is not None:
+                aluguel_default = aluguel_salvo  # Usar valor salvo (incluindo zero)
+            else:
+                aluguel_default = aluguel_sugerido  # Usar sugestão apenas se nunca foi salvo
+            
+            # Priorizar sempre o valor calculado do DP se disponível para CLT
+            if folha_clt_total > 0:
+                salarios_clt_default = folha_clt_total
+                if st.session_state.business_data.get('salarios_clt', 0) != folha_clt_total:
+                    st.session_state.business_data['salarios_clt'] = folha_clt_total
+                    save_user_data()
+            else:
+                salarios_clt_salvo = st.session_state.business_data.get('salarios_clt', 0)
+                salarios_clt_default = salarios_clt_salvo  # Usar valor salvo, mesmo se for zero
+            
+            # Priorizar sempre o valor calculado do DP se disponível para prestadores
+            if servicos_prestadores_total > 0:
+                servicos_default = servicos_prestadores_total
+                if st.session_state.business_data.get('total_optometrista', 0) != servicos_prestadores_total:
+                    st.session_state.business_data['total_optometrista'] = servicos_prestadores_total
+                    save_user_data()
+            else:
+                servicos_salvo = st.session_state.business_data.get('total_optometrista', 0)
+                servicos_default = servicos_salvo  # Usar valor salvo, mesmo se for zero
+            
+            # Sistema flexível de aluguel: mensal ou diária
+            st.markdown("**💼 Configuração de Aluguel**")
+            col_alug1, col_alug2 = st.columns([1, 2])
+            
+            with col_alug1:
+                tipo_aluguel = st.selectbox(
+                    "Tipo de Aluguel",
+                    ["Mensal", "Diária"],
+                    index=0 if st.session_state.business_data.get('tipo_aluguel', 'Mensal') == 'Mensal' else 1,
+                    help="Para interior: use diária. Para ponto fixo: use mensal"
+                )
+                if tipo_aluguel != st.session_state.business_data.get('tipo_aluguel'):
+                    st.session_state.business_data['tipo_aluguel'] = tipo_aluguel
+                    save_user_data()
+            
+            with col_alug2:
+                if tipo_aluguel == "Mensal":
+                    aluguel_valor = st.number_input(
+                        "Aluguel mensal (R$)",
+                        min_value=0.0,
+                        value=float(aluguel_default),
+                        step=100.0,
+                        format="%.0f",
+                        help=f"Sugestão baseada na área: {format_currency(aluguel_sugerido)}" if area_loja > 0 else "Valor para ponto fixo"
+                    )
+                    aluguel_mensal = aluguel_valor
+                else:
+                    # Aluguel por diária - layout vertical para evitar colunas aninhadas
+                    aluguel_diaria = st.number_input(
+                        "Valor da diária (R$)",
+                        min_value=0.0,
+                        value=float(st.session_state.business_data.get('aluguel_diaria', 150)),
+                        step=10.0,
+                        format="%.0f",
+                        help="Valor da diária da sala/espaço no interior"
+                    )
+                    if aluguel_diaria != st.session_state.business_data.get('aluguel_diaria'):
+                        st.session_state.business_data['aluguel_diaria'] = aluguel_diaria
+                        save_user_data()
+                    
+                    # Predefinições para facilitar a configuração
+                    frequencia_opcoes = {
+                        "Apenas sábados (4 dias/mês)": 4,
+                        "Sábados + domingos (8 dias/mês)": 8,
+                        "Finais de semana + feriados (10 dias/mês)": 10,
+                        "Dias úteis (22 dias/mês)": 22,
+                        "Personalizado": 0
+                    }
+                    
+                    frequencia_selecionada = st.selectbox(
+                        "Frequência de trabalho",
+                        list(frequencia_opcoes.keys()),
+                        index=0,  # Default: apenas sábados
+                        help="Escolha uma opção comum ou personalize"
+                    )
+                    
+                    if frequencia_selecionada == "Personalizado":
+                        dias_mes = st.number_input(
+                            "Dias por mês",
+                            min_value=1,
+                            max_value=31,
+                            value=int(st.session_state.business_data.get('dias_mes_diaria', 4)),
+                            help="Digite o número exato de dias"
+                        )
+                    else:
+                        dias_mes = frequencia_opcoes[frequencia_selecionada]
+                        st.info(f"📅 {frequencia_selecionada}")
+                    
+                    if dias_mes != st.session_state.business_data.get('dias_mes_diaria'):
+                        st.session_state.business_data['dias_mes_diaria'] = dias_mes
+                        st.session_state.business_data['frequencia_trabalho'] = frequencia_selecionada
+                        save_user_data()
+                    
+                    aluguel_mensal = aluguel_diaria * dias_mes
+                    st.info(f"💡 **{dias_mes} dias × {format_currency(aluguel_diaria)} = {format_currency(aluguel_mensal)}/mês**")
+            
+            # Salvar o aluguel final calculado
+            if aluguel_mensal != st.session_state.business_data.get('aluguel'):
+                st.session_state.business_data['aluguel'] = aluguel_mensal
+                save_user_data()
+                
+            # Calculadora de combustível para trabalho no interior  
+            if tipo_aluguel == "Diária":
+                st.markdown("**⛽ Calculadora de Combustível (Interior)**")
+                with st.expander("🚗 Configurar custos de deslocamento", expanded=False):
+                    
+                    distancia_km = st.number_input(
+                        "Distância (km ida/volta)",
+                        min_value=0.0,
+                        value=float(st.session_state.business_data.get('distancia_km', 0)),
+                        step=10.0,
+                        help="Distância total ida e volta até o local"
+                    )
+                    if distancia_km != st.session_state.business_data.get('distancia_km'):
+                        st.session_state.business_data['distancia_km'] = distancia_km
+                        save_user_data()
+                    
+                    preco_combustivel = st.number_input(
+                        "Preço combustível (R$/L)",
+                        min_value=0.0,
+                        value=float(st.session_state.business_data.get('preco_combustivel', 5.50)),
+                        step=0.10,
+                        format="%.2f",
+                        help="Preço atual do combustível na região"
+                    )
+                    if preco_combustivel != st.session_state.business_data.get('preco_combustivel'):
+                        st.session_state.business_data['preco_combustivel'] = preco_combustivel
+                        save_user_data()
+                    
+                    autonomia_km_l = st.number_input(
+                        "Autonomia (km/L)",
+                        min_value=1.0,
+                        value=float(st.session_state.business_data.get('autonomia_km_l', 12.0)),
+                        step=0.5,
+                        help="Quantos km seu veículo faz por litro"
+                    )
+                    if autonomia_km_l != st.session_state.business_data.get('autonomia_km_l'):
+                        st.session_state.business_data['autonomia_km_l'] = autonomia_km_l
+                        save_user_data()
+                    
+                    # Calcular custos de combustível
+                    if distancia_km > 0 and preco_combustivel > 0 and autonomia_km_l > 0:
+                        dias_mes_combustivel = st.session_state.business_data.get('dias_mes_diaria', 4)
+                        litros_necessarios = distancia_km / autonomia_km_l
+                        custo_combustivel_dia = litros_necessarios * preco_combustivel
+                        custo_combustivel_mes = custo_combustivel_dia * dias_mes_combustivel
+                        
+                        st.session_state.business_data['custo_combustivel_mensal'] = custo_combustivel_mes
+                        save_user_data()
+                        
+                        st.metric(
+                            "💰 Combustível por dia",
+                            format_currency(custo_combustivel_dia),
+                            f"{litros_necessarios:.1f}L necessários"
+                        )
+                        st.metric(
+                            "💰 Combustível mensal",
+                            format_currency(custo_combustivel_mes),
+                            f"Para {dias_mes_combustivel} dias"
+                        )
+                        
+                        # Adicionar ao custo total mensal
+                        custo_total_com_combustivel = aluguel_mensal + custo_combustivel_mes
+                        
+                        # Mostrar detalhamento específico para frequência de trabalho
+                        frequencia_texto = st.session_state.business_data.get('frequencia_trabalho', 'Apenas sábados (4 dias/mês)')
+                        st.warning(f"**Custo total mensal: {format_currency(custo_total_com_combustivel)}**")
+                        st.info(f"**Baseado em:** {frequencia_texto} + Combustível {format_currency(custo_combustivel_mes)}")
+                    else:
+                        custo_combustivel_mes = 0
+                        st.session_state.business_data['custo_combustivel_mensal'] = 0
+                        save_user_data()
+            else:
+                # Para aluguel mensal, zerar custos de combustível
+                st.session_state.business_data['custo_combustivel_mensal'] = 0
+                save_user_data()
+            
+            # Campo de salários CLT separado (pode ser zero no início)
+            if folha_clt_total > 0:
+                help_text_clt = f"✅ Valor integrado do DP: {format_currency(folha_clt_total)} - Funcionários CLT com encargos"
+            else:
+                help_text_clt = "💡 Pode deixar zero para começar apenas com comissionistas - contrate CLT quando tiver caixa"
+            
+            salarios_clt = st.number_input(
+                "Folha CLT (salários + encargos) (R$)",
+                min_value=0.0,
+                value=float(salarios_clt_default),
+                step=100.0,
+                format="%.0f",
+                help=help_text_clt,
+                key="salarios_clt_input"
+            )
+            
+            if salarios_clt != st.session_state.business_data.get('salarios_clt'):
+                st.session_state.business_data['salarios_clt'] = salarios_clt
+                save_user_data()
+            
+            # Seção de Despesas Operacionais - Serviços Profissionais por Diária
+            st.markdown("**👩‍⚕️ Serviços Profissionais por Diária**")
+            
+            # Configuração do optometrista por diária
+            col_opt1, col_opt2 = st.columns(2)
+            
+            with col_opt1:
+                diaria_optometrista = st.number_input(
+                    "Diária Optometrista (R$)",
+                    min_value=0.0,
+                    value=float(st.session_state.business_data.get('diaria_optometrista', 150.0)),
+                    step=10.0,
+                    format="%.0f",
+                    help="Valor da diária do optometrista (despesa operacional)"
+                )
+                if diaria_optometrista != st.session_state.business_data.get('diaria_optometrista'):
+                    st.session_state.business_data['diaria_optometrista'] = diaria_optometrista
+                    save_user_data()
+            
+            with col_opt2:
+                dias_optometrista_mes = st.number_input(
+                    "Dias optometrista/mês",
+                    min_value=0,
+                    value=int(st.session_state.business_data.get('dias_optometrista_mes', 4)),
+                    step=1,
+                    help="Quantos dias por mês o optometrista trabalha"
+                )
+                if dias_optometrista_mes != st.session_state.business_data.get('dias_optometrista_mes'):
+                    st.session_state.business_data['dias_optometrista_mes'] = dias_optometrista_mes
+                    save_user_data()
+            
+            # Cálculo automático do custo mensal do optometrista
+            custo_optometrista_mensal = diaria_optometrista * dias_optometrista_mes
+            st.session_state.business_data['custo_optometrista_mensal'] = custo_optometrista_mensal
+            save_user_data()
+            
+            if custo_optometrista_mensal > 0:
+                st.info(f"💰 **Custo Optometrista:** {dias_optometrista_mes} dias × {format_currency(diaria_optometrista)} = **{format_currency(custo_optometrista_mensal)}/mês**")
+            
+
+            
+            # Mostrar breakdown se há funcionários
+            if folha_clt_total > 0 or servicos_prestadores_total > 0:
+                funcionarios_clt = [f for f in st.session_state.funcionarios if f['tipo_contrato'] == 'CLT']
+                funcionarios_prestadores = [f for f in st.session_state.funcionarios if f['tipo_contrato'] != 'CLT']
+                
+                if funcionarios_clt:
+                    st.caption(f"👥 CLT: {len(funcionarios_clt)} funcionários = {format_currency(folha_clt_total)}")
+                if funcionarios_prestadores:
+                    st.caption(f"🤝 Prestadores: {len(funcionarios_prestadores)} pessoas = {format_currency(servicos_prestadores_total)}")
+            
+            # Calcular totais separados para clareza contábil
+            total_folha_clt = salarios_clt
+            total_optometrista = custo_optometrista_mensal
+            
+            # Salvar apenas optometrista para Sistema Integrado (campo 0)
+            st.session_state.business_data['0'] = total_optometrista
+            
+            # Total geral de pessoal (CLT + Optometrista)
+            total_pessoal = total_folha_clt + total_optometrista
+            st.session_state.business_data['salarios_total'] = total_pessoal
+            
+            # Separar despesas operacionais
+            st.session_state.business_data['despesas_servicos_profissionais'] = total_optometrista
+            
+            # Painel de Auditoria de Duplicidades
+            st.markdown("---")
+            st.markdown("### 🔍 Auditoria de Duplicidades de Custos")
+            
+            with st.expander("⚠️ Verificar possíveis duplicidades", expanded=False):
+                st.markdown("**Análise de Sobreposições Detectadas:**")
+                
+                duplicidades_encontradas = []
+                
+                # Verificar se optometrista está em dois lugares
+                if custo_optometrista_mensal > 0 and servicos_prestadores_total > 0:
+                    # Verificar se há optometrista no DP também
+                    funcionarios_dp = st.session_state.get('funcionarios', [])
+                    optometrista_no_dp = any('optometrista' in str(f.get('cargo', '')).lower() for f in funcionarios_dp)
+                    
+                    if optometrista_no_dp:
+                        duplicidades_encontradas.append({
+                            'tipo': 'Optometrista duplicado',
+                            'descricao': f'Optometrista aparece tanto em Serviços Profissionais (R$ {custo_optometrista_mensal:.0f}) quanto no DP',
+                            'solucao': 'Remover optometrista do DP e manter apenas em Serviços Profissionais por diária'
+                        })
+                
+                # Verificar duplicidade de aluguel
+                aluguel_etapa10 = st.session_state.business_data.get('aluguel', 0)
+                outros_fixos = st.session_state.business_data.get('outros_fixos', 0)
+                if aluguel_etapa10 > 0 and outros_fixos > 2000:  # Se outros fixos muito alto, pode incluir aluguel
+                    duplicidades_encontradas.append({
+                        'tipo': 'Possível aluguel duplicado',
+                        'descricao': f'Aluguel: R$ {aluguel_etapa10:.0f} + Outros fixos muito alto: R$ {outros_fixos:.0f}',
+                        'solucao': 'Verificar se outros fixos não incluem aluguel novamente'
+                    })
+                
+
+                
+                # Verificar se marketing está duplicado
+                orcamento_marketing = st.session_state.business_data.get('orcamento_marketing', 0)
+                marketing_outros = st.session_state.business_data.get('marketing', 0)
+                if orcamento_marketing > 0 and marketing_outros > 0:
+                    duplicidades_encontradas.append({
+                        'tipo': 'Marketing duplicado',
+                        'descricao': f'Orçamento Marketing: R$ {orcamento_marketing:.0f} + Marketing outros: R$ {marketing_outros:.0f}',
+                        'solucao': 'Usar apenas um campo para marketing total'
+                    })
+                
+                # Exibir resultados
+                if duplicidades_encontradas:
+                    st.error(f"🚨 **{len(duplicidades_encontradas)} possíveis duplicidades encontradas:**")
+                    
+                    for i, dup in enumerate(duplicidades_encontradas, 1):
+                        st.markdown(f"""
+                        **{i}. {dup['tipo']}**
+                        - **Problema:** {dup['descricao']}
+                        - **Solução:** {dup['solucao']}
+                        """)
+                        
+                        # Botão de correção automática para optometrista
+                        if dup['tipo'] == 'Optometrista duplicado':
+                            if st.button(f"🔧 Corrigir automaticamente - {dup['tipo']}", key=f"fix_dup_{i}"):
+                                # Remover optometrista do DP
+                                funcionarios_limpos = [f for f in st.session_state.funcionarios 
+                                                     if 'optometrista' not in str(f.get('cargo', '')).lower()]
+                                st.session_state.funcionarios = funcionarios_limpos
+                                st.success("✅ Optometrista removido do DP - mantido apenas em Serviços Profissionais")
+                                st.rerun()
+                else:
+                    st.success("✅ **Nenhuma duplicidade detectada na estrutura atual**")
+                
+                # Resumo consolidado dos custos
+                st.markdown("---")
+                st.markdown("**📊 Resumo Consolidado dos Custos (sem duplicidades):**")
+                
+                custo_consolidado = {
+                    'Aluguel': aluguel_etapa10,
+                    'Folha CLT': total_folha_clt,
+                    'Optometrista (diárias)': total_optometrista,
+                    'Outros Custos Fixos': st.session_state.business_data.get('outros_fixos', 0),
+                    'Marketing': max(orcamento_marketing, marketing_outros),  # Pegar o maior, não somar
+                }
+                
+                total_consolidado = sum(custo_consolidado.values())
+                
+                for categoria, valor in custo_consolidado.items():
+                    if valor > 0:
+                        percentual = (valor / total_consolidado * 100) if total_consolidado > 0 else 0
+                        st.markdown(f"• **{categoria}:** {format_currency(valor)} ({percentual:.1f}%)")
+                
+                st.markdown(f"**📍 Total Mensal:** {format_currency(total_consolidado)}")
+                st.markdown(f"**📍 Total Anual:** {format_currency(total_consolidado * 12)}")
+            
+            # Painel de integração de dados (apenas se houver dados integrados válidos)
+            dados_integrados_validos = []
+            
+            if folha_clt_total > 0 or servicos_prestadores_total > 0:
+                dados_integrados_validos.append("folha")
+            if area_loja > 0 and aluguel_sugerido > 0:
+                dados_integrados_validos.append("operacional")
+            if st.session_state.business_data.get('investimento_total', 0) > 0:
+                dados_integrados_validos.append("investimento")
+            
+            if dados_integrados_validos:
+                with st.expander("📊 Dados Integrados do Plano", expanded=False):
+                    if folha_clt_total > 0 or servicos_prestadores_total > 0:
+                        total_funcionarios = folha_clt_total + servicos_prestadores_total
+                        st.success(f"✅ Folha de pagamento integrada: {format_currency(total_funcionarios)}")
+                        st.write(f"   {len(st.session_state.funcionarios)} funcionários do DP")
+                        
+                        if folha_clt_total > 0:
+                            funcionarios_clt = [f for f in st.session_state.funcionarios if f['tipo_contrato'] == 'CLT']
+                            st.write(f"   📋 CLT: {len(funcionarios_clt)} funcionários = {format_currency(folha_clt_total)}")
+                            for func in funcionarios_clt:
+                                custo_total = func['salario_base'] * 1.68
+                                st.write(f"      • {func['nome']} ({func['cargo']}): {format_currency(custo_total)}")
+                        
+                        if servicos_prestadores_total > 0:
+                            funcionarios_prestadores = [f for f in st.session_state.funcionarios if f['tipo_contrato'] != 'CLT']
+                            st.write(f"   🤝 Prestadores: {len(funcionarios_prestadores)} pessoas = {format_currency(servicos_prestadores_total)}")
+                            for func in funcionarios_prestadores:
+                                st.write(f"      • {func['nome']} ({func['cargo']}): {format_currency(func['salario_base'])}")
+                    
+                    if area_loja > 0 and aluguel_sugerido > 0:
+                        st.success(f"✅ Dados operacionais: {area_loja}m² em {cidade}")
+                        st.write(f"   Aluguel sugerido: {format_currency(aluguel_sugerido)}")
+                    
+                    investimento_total = st.session_state.business_data.get('investimento_total', 0)
+                    if investimento_total > 0:
+                        st.success(f"✅ Investimento inicial: {format_currency(investimento_total)}")
+                        depreciacao_calc = investimento_total * 0.3 / 120
+                        st.write(f"   Depreciação mensal: {format_currency(depreciacao_calc)}")
+            else:
+                st.info("💡 Complete o DP, Investimento Inicial ou Plano Operacional para ver dados integrados aqui.")
+            
+
+            
+            # Botão para forçar atualização
+            if st.button("Atualizar Custos das Etapas Anteriores", help="Força atualização com dados do DP, Investimento e Operacional"):
+                valores_atualizados = []
+                
+                # Forçar atualização da folha de salários
+                if folha_clt_total > 0 or servicos_prestadores_total > 0:
+                    total_folha = folha_clt_total + servicos_prestadores_total
+                    st.session_state.business_data['salarios_total'] = total_folha
+                    valores_atualizados.append(f"Folha de salários: {format_currency(total_folha)} (DP)")
+                
+                # Forçar atualização do aluguel
+                if area_loja > 0 and cidade:
+                    st.session_state.business_data['aluguel'] = aluguel_sugerido
+                    valores_atualizados.append(f"Aluguel: {format_currency(aluguel_sugerido)} ({area_loja}m² em {cidade})")
+                
+                # Calcular depreciação do investimento
+                investimento_total = st.session_state.business_data.get('investimento_total', 0)
+                if investimento_total > 0:
+                    depreciacao_mensal = investimento_total * 0.3 / 120
+                    st.session_state.business_data['depreciacao_mensal'] = depreciacao_mensal
+                    valores_atualizados.append(f"Depreciação: {format_currency(depreciacao_mensal)} (investimento)")
+                
+                if valores_atualizados:
+                    save_user_data()
+                    st.success("Custos atualizados: " + " | ".join(valores_atualizados))
+                    st.rerun()
+                else:
+                    st.warning("Complete o DP, Investimento Inicial ou Plano Operacional primeiro.")
+            
+
+            
+            # Calcular outros custos fixos incluindo combustível e captador
+            custo_combustivel_mensal = st.session_state.business_data.get('custo_combustivel_mensal', 0)
+            
+            # Calcular custo do captador e forçar atualização
+            custo_captador_calculado = calcular_custo_captador_mensal()
+            if custo_captador_calculado > 0:
+                st.session_state.business_data['custo_captador_mensal_calculado'] = custo_captador_calculado
+            
+            outros_fixos_base = st.session_state.business_data.get('outros_fixos_base', 0)
+            
+            # Botão para atualizar custos das etapas anteriores
+            if st.button("🔄 Atualizar Custos das Etapas Anteriores", use_container_width=True):
+                custo_captador_calculado = calcular_custo_captador_mensal()
+                st.session_state.business_data['custo_captador_mensal_calculado'] = custo_captador_calculado
+                save_user_data()
+                st.success(f"Custo do captador atualizado: {format_currency(custo_captador_calculado)}")
+                st.rerun()
+            
+            if custo_combustivel_mensal > 0 or custo_captador_calculado > 0:
+                # Mostrar breakdown quando há custos adicionais
+                num_cols = 2 + (1 if custo_combustivel_mensal > 0 else 0) + (1 if custo_captador_calculado > 0 else 0)
+                cols = st.columns([2] + [1] * (num_cols - 1))
+                
+                with cols[0]:
+                    outros_fixos_input = st.number_input(
+                        "Outros custos fixos (R$)",
+                        min_value=0.0,
+                        value=float(outros_fixos_base),
+                        step=100.0,
+                        format="%.0f",
+                        help="Energia, telefone, internet, seguros"
+                    )
+                    if outros_fixos_input != outros_fixos_base:
+                        st.session_state.business_data['outros_fixos_base'] = outros_fixos_input
+                        save_user_data()
+                
+                col_idx = 1
+                if custo_combustivel_mensal > 0:
+                    with cols[col_idx]:
+                        st.metric(
+                            "🚗 Combustível",
+                            format_currency(custo_combustivel_mensal),
+                            "Interior"
+                        )
+                    col_idx += 1
+                
+                if custo_captador_calculado > 0:
+                    with cols[col_idx]:
+                        st.metric(
+                            "👥 Captador",
+                            format_currency(custo_captador_calculado),
+                            "Gestão de Pessoas"
+                        )
+                        
+                        # Mostrar memória de cálculo
+                        if st.button("🔍 Memória de Cálculo", key="memoria_captador"):
+                            memoria = st.session_state.business_data.get('memoria_calculo_captador', 'Cálculo não disponível')
+                            st.code(memoria)
+                
+                # Apenas outros custos base (não incluir combustível aqui pois será mostrado separado)
+                outros_fixos = outros_fixos_input
+                breakdown_parts = [f"Base {format_currency(outros_fixos_input)}"]
+                if custo_combustivel_mensal > 0:
+                    breakdown_parts.append(f"Combustível {format_currency(custo_combustivel_mensal)}")
+                if custo_captador_calculado > 0:
+                    breakdown_parts.append(f"Captador {format_currency(custo_captador_calculado)}")
+                
+                breakdown_text = f"**Total: {format_currency(outros_fixos)}** = " + " + ".join(breakdown_parts)
+                st.info(breakdown_text)
+            else:
+                # Modo normal sem custos adicionais
+                outros_fixos = st.number_input(
+                    "Outros custos fixos (R$)",
+                    min_value=0.0,
+                    value=float(outros_fixos_base),
+                    step=100.0,
+                    format="%.0f",
+                    help="Energia, telefone, internet, seguros"
+                )
+                if outros_fixos != outros_fixos_base:
+                    st.session_state.business_data['outros_fixos_base'] = outros_fixos
+                    save_user_data()
+            
+            # Salvar apenas o combustível como outros custos
+            outros_fixos_final = custo_combustivel_mensal  # Apenas R$ 575,11
+            
+            if outros_fixos_final != st.session_state.business_data.get('outros_fixos'):
+                st.session_state.business_data['outros_fixos'] = outros_fixos_final
+                save_user_data()
+            
+            # Incluir custo do captador nos custos fixos
+            custo_captador_mensal = calcular_custo_captador_mensal()
+            
+            custos_fixos_total = aluguel_mensal + salarios_clt + total_optometrista + custo_captador_mensal + outros_fixos_final
+            st.metric("Total Custos Fixos", format_currency(custos_fixos_total))
+            
+            # Mostrar breakdown dos custos fixos incluindo captador
+            if st.checkbox("📊 Mostrar detalhamento dos custos fixos"):
+                st.markdown("**Detalhamento dos Custos Fixos:**")
+                st.write(f"• Aluguel: {format_currency(aluguel_mensal)}")
+                st.write(f"• Folha CLT: {format_currency(salarios_clt)}")
+                st.write(f"• Optometrista: {format_currency(total_optometrista)}")
+                st.write(f"• **Captador: {format_currency(custo_captador_mensal)}**")
+                st.write(f"• Outros custos: {format_currency(outros_fixos_final)}")
+                st.write(f"**Total: {format_currency(custos_fixos_total)}**")
+        
+        with col2:
+            st.markdown("**Custos Variáveis (%)**")
+            
+            # Calcular CMV automaticamente baseado nos custos reais da precificação
+            custo_materiais_fisicos = st.session_state.business_data.get('custo_materiais_fisicos', 89.80)
+            ticket_medio = st.session_state.business_data.get('ticket_medio', 180)
+            
+            if ticket_medio > 0:
+                cmv_percentual = (custo_materiais_fisicos / ticket_medio) * 100
+            else:
+                cmv_percentual = 45.0  # fallback
+            
+            st.session_state.business_data['cmv_percentual'] = cmv_percentual
+            save_user_data()
+            
+            st.success(f"✅ **CMV calculado automaticamente**: {cmv_percentual:.1f}% baseado nos custos reais")
+            st.caption(f"Baseado em: R$ {custo_materiais_fisicos:.2f} (custo) ÷ R$ {ticket_medio:.2f} (ticket médio)")
+            
+            # Validação crítica de impostos baseada no regime tributário
+            tipo_empresa = st.session_state.business_data.get('tipo_empresa', 'MEI')
+            objetivo_faturamento = st.session_state.business_data.get('objetivo_faturamento', 0)
+            receita_anual = objetivo_faturamento * 12
+            
+            # Calcular alíquota correta baseada na legislação brasileira atual
+            from tax_calculator import TaxCalculator
+            calc = TaxCalculator()
+            
+            impostos_sugerido = 6.0  # Default fallback
+            
+            if tipo_empresa == 'MEI':
+                impostos_sugerido = 0.3  # MEI paga valor fixo, não percentual sobre receita
+                st.info("💡 **MEI**: Você paga R$ 76,90 fixo por mês conforme legislação 2025")
+            elif tipo_empresa in ['Microempresa', 'Empresa de Pequeno Porte']:
+                # Calcular conforme tabela oficial do Simples Nacional
+                resultado_simples = calc.calculate_simples_nacional(receita_anual, "Anexo I - Comércio")
+                impostos_sugerido = resultado_simples['aliquota_efetiva']
+                
+                st.info(f"💡 **{tipo_empresa}**: Conforme Simples Nacional Anexo I, você paga {impostos_sugerido:.1f}% (alíquota oficial para R$ {receita_anual:,.0f}/ano)")
+                st.caption("📋 Base legal: Lei Complementar nº 123/2006 - Simples Nacional")
+            elif tipo_empresa in ['Ltda', 'Outro']:
+                impostos_sugerido = 13.33
+                st.warning(f"💡 **Lucro Presumido**: Conforme legislação, empresas normais pagam cerca de {impostos_sugerido}% (confirme com contador)")
+            
+            # Usar automaticamente o valor correto da legislação
+            impostos_percentual = impostos_sugerido
+            st.session_state.business_data['impostos_percentual'] = impostos_percentual
+            save_user_data()
+            
+            st.success(f"✅ **Impostos aplicados automaticamente**: {impostos_percentual:.1f}% conforme legislação brasileira")
+            
+            comissoes_percentual = st.slider(
+                "Comissões (%)",
+                min_value=0.0,
+                max_value=15.0,
+                value=float(st.session_state.business_data.get('comissoes_percentual', 3.0)),
+                step=0.5
+            )
+            if comissoes_percentual != st.session_state.business_data.get('comissoes_percentual'):
+                st.session_state.business_data['comissoes_percentual'] = comissoes_percentual
+                save_user_data()
+            
+            outros_variaveis_percentual = st.slider(
+                "Outros custos variáveis (%)",
+                min_value=0.0,
+                max_value=10.0,
+                value=float(st.session_state.business_data.get('outros_variaveis_percentual', 2.0)),
+                step=0.5
+            )
+            if outros_variaveis_percentual != st.session_state.business_data.get('outros_variaveis_percentual'):
+                st.session_state.business_data['outros_variaveis_percentual'] = outros_variaveis_percentual
+                save_user_data()
+            
+            total_variaveis_perc = cmv_percentual + impostos_percentual + comissoes_percentual + outros_variaveis_percentual
+            st.metric("Total Custos Variáveis", f"{total_variaveis_perc:.1f}%")
+        
+        # Configuração detalhada de despesas operacionais
+        st.markdown("### 🏢 Despesas Operacionais Detalhadas")
+        st.markdown("Configure cada despesa individualmente para cálculos precisos")
+        
+        col_desp1, col_desp2, col_desp3 = st.columns(3)
+        
+        with col_desp1:
+            st.markdown("**Utilidades e Infraestrutura**")
+            
+            energia_agua = st.number_input(
+                "Energia + Água (R$/mês)",
+                min_value=0.0,
+                max_value=2000.0,
+                value=float(st.session_state.business_data.get('energia_agua', 800)),
+                step=50.0,
+                help="Conta de luz + água + gás"
+            )
+            if energia_agua != st.session_state.business_data.get('energia_agua'):
+                st.session_state.business_data['energia_agua'] = energia_agua
+                save_user_data()
+            
+            telefone_internet = st.number_input(
+                "Telefone + Internet (R$/mês)",
+                min_value=0.0,
+                max_value=800.0,
+                value=float(st.session_state.business_data.get('telefone_internet', 350)),
+                step=25.0,
+                help="Telefone fixo + internet + celular"
+            )
+            if telefone_internet != st.session_state.business_data.get('telefone_internet'):
+                st.session_state.business_data['telefone_internet'] = telefone_internet
+                save_user_data()
+            
+            material_escritorio = st.number_input(
+                "Material de Escritório (R$/mês)",
+                min_value=0.0,
+                max_value=500.0,
+                value=float(st.session_state.business_data.get('material_escritorio', 200)),
+                step=25.0,
+                help="Papelaria, toner, material de limpeza"
+            )
+            if material_escritorio != st.session_state.business_data.get('material_escritorio'):
+                st.session_state.business_data['material_escritorio'] = material_escritorio
+                save_user_data()
+        
+        with col_desp2:
+            st.markdown("**Serviços Profissionais**")
+            
+            contabilidade = st.number_input(
+                "Contabilidade (R$/mês)",
+                min_value=0.0,
+                max_value=2000.0,
+                value=float(st.session_state.business_data.get('contabilidade', 800)),
+                step=50.0,
+                help="Contador + assessoria fiscal"
+            )
+            if contabilidade != st.session_state.business_data.get('contabilidade'):
+                st.session_state.business_data['contabilidade'] = contabilidade
+                save_user_data()
+            
+            # Optometrista removido - agora está em Serviços Profissionais por Diária
+            
+            limpeza_seguranca = st.number_input(
+                "Limpeza + Segurança (R$/mês)",
+                min_value=0.0,
+                max_value=1500.0,
+                value=float(st.session_state.business_data.get('limpeza_seguranca', 600)),
+                step=50.0,
+                help="Empresa de limpeza + segurança"
+            )
+            if limpeza_seguranca != st.session_state.business_data.get('limpeza_seguranca'):
+                st.session_state.business_data['limpeza_seguranca'] = limpeza_seguranca
+                save_user_data()
+        
+        with col_desp3:
+            st.markdown("**Seguros e Manutenção**")
+            
+            seguros = st.number_input(
+                "Seguros (R$/mês)",
+                min_value=0.0,
+                max_value=1000.0,
+                value=float(st.session_state.business_data.get('seguros', 400)),
+                step=25.0,
+                help="Seguro do estabelecimento + equipamentos"
+            )
+            if seguros != st.session_state.business_data.get('seguros'):
+                st.session_state.business_data['seguros'] = seguros
+                save_user_data()
+            
+            manutencao_equipamentos = st.number_input(
+                "Manutenção Equipamentos (R$/mês)",
+                min_value=0.0,
+                max_value=800.0,
+                value=float(st.session_state.business_data.get('manutencao_equipamentos', 300)),
+                step=25.0,
+                help="Manutenção de equipamentos ópticos"
+            )
+            if manutencao_equipamentos != st.session_state.business_data.get('manutencao_equipamentos'):
+                st.session_state.business_data['manutencao_equipamentos'] = manutencao_equipamentos
+                save_user_data()
+            
+            marketing_publicidade = st.number_input(
+                "Marketing + Publicidade (R$/mês)",
+                min_value=0.0,
+                max_value=2000.0,
+                value=float(st.session_state.business_data.get('marketing_publicidade', 500)),
+                step=50.0,
+                help="Redes sociais + anúncios + material gráfico"
+            )
+            if marketing_publicidade != st.session_state.business_data.get('marketing_publicidade'):
+                st.session_state.business_data['marketing_publicidade'] = marketing_publicidade
+                save_user_data()
+        
+        # Resumo das despesas operacionais (sem optometrista - agora está em Serviços Profissionais)
+        total_despesas_detalhadas = (energia_agua + telefone_internet + material_escritorio + 
+                                   contabilidade + limpeza_seguranca + 
+                                   seguros + manutencao_equipamentos + marketing_publicidade)
+        
+        st.markdown("**📊 Resumo das Despesas Operacionais:**")
+        col_res1, col_res2, col_res3 = st.columns(3)
+        
+        with col_res1:
+            st.metric("Utilidades", format_currency(energia_agua + telefone_internet + material_escritorio))
+        
+        with col_res2:
+            st.metric("Serviços Profissionais", format_currency(contabilidade + limpeza_seguranca))
+        
+        with col_res3:
+            st.metric("Seguros + Manutenção + Marketing", format_currency(seguros + manutencao_equipamentos + marketing_publicidade))
+        
+        st.metric("**Total Despesas Operacionais**", format_currency(total_despesas_detalhadas))
+        
+        # Sistema de Rateio por Óculos Vendidos
+        st.markdown("---")
+        st.markdown("### 🎯 Rateio de Custos por Óculos Vendidos")
+        st.markdown("Calcule quanto cada custo fixo representa por óculos vendido")
+        
+        # Pegar meta de óculos vendidos por mês
+        ticket_medio = st.session_state.business_data.get('ticket_medio', 180)
+        vendas_mes_1 = st.session_state.business_data.get('vendas_mes_1', 20831)
+        oculos_por_mes = int(vendas_mes_1 / ticket_medio) if ticket_medio > 0 else 100
+        
+        col_rateio1, col_rateio2 = st.columns([1, 1])
+        
+        with col_rateio1:
+            st.markdown("**Meta de Óculos por Mês**")
+            oculos_meta = st.number_input(
+                "Óculos vendidos por mês",
+                min_value=10,
+                max_value=1000,
+                value=oculos_por_mes,
+                step=5,
+                help="Quantos óculos você pretende vender por mês"
+            )
+            if oculos_meta != st.session_state.business_data.get('oculos_meta_mes'):
+                st.session_state.business_data['oculos_meta_mes'] = oculos_meta
+                save_user_data()
+            
+            st.metric("Faturamento por óculos", format_currency(ticket_medio))
+        
+        with col_rateio2:
+            st.markdown("**Custos Rateados por Óculos**")
+            
+            # Calcular custos totais fixos
+            aluguel_valor = st.session_state.business_data.get('aluguel', 3500)
+            folha_clt = st.session_state.business_data.get('salarios_clt', 0)
+            
+            # Obter dados do optometrista dos Serviços Profissionais por Diária
+            custo_optometrista_mensal = st.session_state.business_data.get('custo_optometrista_mensal', 0)
+            
+            # Incluir combustível no cálculo de custos fixos totais
+            custo_combustivel_mensal = st.session_state.business_data.get('custo_combustivel_mensal', 0)
+            
+            # Calcular custo do captador baseado nas configurações da Gestão de Pessoas
+            custo_captador_mensal = calcular_custo_captador_mensal()
+            
+            custos_fixos_totais = (aluguel_valor + folha_clt + total_despesas_detalhadas + custo_optometrista_mensal + custo_combustivel_mensal + custo_captador_mensal)
+            
+            if oculos_meta > 0:
+                # Rateio por óculos
+                aluguel_por_oculos = aluguel_valor / oculos_meta
+                optometrista_por_oculos = custo_optometrista_mensal / oculos_meta
+                combustivel_por_oculos = custo_combustivel_mensal / oculos_meta
+                captador_por_oculos = custo_captador_mensal / oculos_meta
+                despesas_por_oculos = total_despesas_detalhadas / oculos_meta
+                total_fixo_por_oculos = custos_fixos_totais / oculos_meta
+                
+                st.metric("Aluguel por óculos", format_currency(aluguel_por_oculos))
+                st.metric("Optometrista por óculos", format_currency(optometrista_por_oculos))
+                st.metric("Combustível por óculos", format_currency(combustivel_por_oculos))
+                st.metric("Captador por óculos", format_currency(captador_por_oculos))
+                st.metric("Despesas por óculos", format_currency(despesas_por_oculos))
+                st.metric("**Total fixo por óculos**", format_currency(total_fixo_por_oculos))
+                
+                # Salvar para uso no sistema
+                st.session_state.business_data['custo_fixo_por_oculos'] = total_fixo_por_oculos
+                save_user_data()
+            else:
+                st.warning("Configure a meta de óculos para ver o rateio")
+        
+        # Card visual do rateio com custos diretos incluídos
+        if oculos_meta > 0:
+            # Obter custos diretos da precificação (Composição do Produto)
+            custo_materiais_fisicos = st.session_state.business_data.get('custo_materiais_fisicos', 89.80)
+            
+            # Custos totais por óculos = Custos fixos (rateio) + Custos diretos (materiais)
+            custo_total_por_oculos = total_fixo_por_oculos + custo_materiais_fisicos
+            margem_real = ticket_medio - custo_total_por_oculos
+            percentual_margem_real = (margem_real / ticket_medio) * 100 if ticket_medio > 0 else 0
+            
+            cor_margem = "green" if percentual_margem_real > 40 else "orange" if percentual_margem_real > 25 else "red"
+            
+
+        
+        # Configuração de Termos de Pagamento aos Fornecedores
+        st.markdown("### 💳 Termos de Pagamento aos Fornecedores")
+        st.markdown("Configure como você paga seus fornecedores para cálculos precisos de fluxo de caixa")
+        
+        col_pag1, col_pag2, col_pag3 = st.columns(3)
+        
+        with col_pag1:
+            forma_pagamento = st.selectbox(
+                "Forma de Pagamento Principal",
+                ["À Vista", "30 dias", "45 dias", "60 dias", "Parcelado (30/60)", "Parcelado (30/60/90)", "Personalizado"],
+                index=["À Vista", "30 dias", "45 dias", "60 dias", "Parcelado (30/60)", "Parcelado (30/60/90)", "Personalizado"].index(
+                    st.session_state.business_data.get('forma_pagamento_fornecedor', 'Parcelado (30/60)')
+                ),
+                help="Como você paga seus fornecedores (ATAK, Brasil Lentes, GOLD, DSMHD)"
+            )
+            if forma_pagamento != st.session_state.business_data.get('forma_pagamento_fornecedor'):
+                st.session_state.business_data['forma_pagamento_fornecedor'] = forma_pagamento
+                save_user_data()
+        
+        with col_pag2:
+            # Configurar percentuais baseado na forma selecionada
+            if forma_pagamento == "À Vista":
+                percentual_mes_atual = 100.0
+                percentual_mes_seguinte = 0.0
+                percentual_terceiro_mes = 0.0
+            elif forma_pagamento == "30 dias":
+                percentual_mes_atual = 0.0
+                percentual_mes_seguinte = 100.0
+                percentual_terceiro_mes = 0.0
+            elif forma_pagamento == "45 dias":
+                percentual_mes_atual = 0.0
+                percentual_mes_seguinte = 50.0
+                percentual_terceiro_mes = 50.0
+            elif forma_pagamento == "60 dias":
+                percentual_mes_atual = 0.0
+                percentual_mes_seguinte = 0.0
+                percentual_terceiro_mes = 100.0
+            elif forma_pagamento == "Parcelado (30/60)":
+                percentual_mes_atual = 0.0
+                percentual_mes_seguinte = 80.0
+                percentual_terceiro_mes = 20.0
+            elif forma_pagamento == "Parcelado (30/60/90)":
+                percentual_mes_atual = 0.0
+                percentual_mes_seguinte = 60.0
+                percentual_terceiro_mes = 40.0
+            else:  # Personalizado
+                percentual_mes_atual = st.slider(
+                    "% Pago no Mês Atual",
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=float(st.session_state.business_data.get('pct_pagamento_mes_atual', 20.0)),
+                    step=5.0
+                )
+                if percentual_mes_atual != st.session_state.business_data.get('pct_pagamento_mes_atual'):
+                    st.session_state.business_data['pct_pagamento_mes_atual'] = percentual_mes_atual
+                    save_user_data()
+            
+            if forma_pagamento != "Personalizado":
+                st.session_state.business_data['pct_pagamento_mes_atual'] = percentual_mes_atual
+        
+        with col_pag3:
+            if forma_pagamento == "Personalizado":
+                percentual_mes_seguinte = st.slider(
+                    "% Pago no Mês Seguinte",
+                    min_value=0.0,
+                    max_value=100.0 - percentual_mes_atual,
+                    value=min(float(st.session_state.business_data.get('pct_pagamento_mes_seguinte', 60.0)), 100.0 - percentual_mes_atual),
+                    step=5.0
+                )
+                percentual_terceiro_mes = 100.0 - percentual_mes_atual - percentual_mes_seguinte
+                
+                st.session_state.business_data['pct_pagamento_mes_seguinte'] = percentual_mes_seguinte
+                st.session_state.business_data['pct_pagamento_terceiro_mes'] = percentual_terceiro_mes
+                save_user_data()
+            else:
+                # Para formas pré-definidas, salvar os valores calculados
+                st.session_state.business_data['pct_pagamento_mes_seguinte'] = percentual_mes_seguinte
+                st.session_state.business_data['pct_pagamento_terceiro_mes'] = percentual_terceiro_mes
+            
+            # Mostrar distribuição atual
+            st.info(f"""
+            **Distribuição de Pagamentos:**
+            • Mês atual: {percentual_mes_atual:.0f}%
+            • Mês seguinte: {percentual_mes_seguinte:.0f}%
+            • Terceiro mês: {percentual_terceiro_mes:.0f}%
+            """)
+        
+        # Desconto para pagamento à vista
+        if forma_pagamento != "À Vista":
+            desconto_avista = st.slider(
+                "Desconto por Pagamento à Vista (%)",
+                min_value=0.0,
+                max_value=10.0,
+                value=float(st.session_state.business_data.get('desconto_avista_fornecedor', 2.5)),
+                step=0.5,
+                help="Desconto oferecido pelo fornecedor para pagamento à vista"
+            )
+            if desconto_avista != st.session_state.business_data.get('desconto_avista_fornecedor'):
+                st.session_state.business_data['desconto_avista_fornecedor'] = desconto_avista
+                save_user_data()
+        else:
+            desconto_avista = float(st.session_state.business_data.get('desconto_avista_fornecedor', 2.5))
+        
+        # Impacto no fluxo de caixa
+        st.markdown("**💡 Impacto no Fluxo de Caixa:**")
+        exemplo_compra = 10000
+        valor_mes_atual = exemplo_compra * (percentual_mes_atual / 100)
+        valor_mes_seguinte = exemplo_compra * (percentual_mes_seguinte / 100)
+        valor_terceiro_mes = exemplo_compra * (percentual_terceiro_mes / 100)
+        
+        if forma_pagamento == "À Vista" and desconto_avista > 0:
+            valor_com_desconto = exemplo_compra * (1 - desconto_avista / 100)
+            st.success(f"Exemplo: Compra de R$ {exemplo_compra:,.2f} → Paga R$ {valor_com_desconto:,.2f} (desconto de {desconto_avista}%)")
+        else:
+            st.info(f"""
+            Exemplo: Compra de R$ {exemplo_compra:,.2f}
+            • Mês atual: R$ {valor_mes_atual:,.2f}
+            • Mês seguinte: R$ {valor_mes_seguinte:,.2f}
+            • Terceiro mês: R$ {valor_terceiro_mes:,.2f}
+            """)
+            if desconto_avista > 0:
+                economia_anual = exemplo_compra * 12 * (desconto_avista / 100)
+                st.warning(f"Oportunidade perdida: R$ {economia_anual:,.2f}/ano se pagasse à vista")
+        
+        # Atualizar outros_fixos com o total calculado
+        outros_fixos = total_despesas_detalhadas - 0  # Subtrair para não duplicar
+        if outros_fixos < 0:
+            outros_fixos = 0
+        
+        # Salvar percentuais para cálculos
+        st.session_state.business_data.update({
+            'cmv_percentual': cmv_percentual,
+            'impostos_percentual': impostos_percentual,
+            'comissoes_percentual': comissoes_percentual,
+            'outros_variaveis_percentual': outros_variaveis_percentual,
+            'aluguel': aluguel_mensal,
+            'salarios_clt': salarios_clt,
+            'total_optometrista': total_optometrista,
+            'salarios_total': salarios_clt + total_optometrista,
+
+            'outros_fixos': outros_fixos,
+            'total_despesas_operacionais': total_despesas_detalhadas
+        })
+        
+        # Análise de ponto de equilíbrio
+        st.markdown("### ⚖️ Análise de Ponto de Equilíbrio")
+        col_eq1, col_eq2, col_eq3 = st.columns(3)
+        
+        margem_contribuicao_perc = 100 - total_variaveis_perc
+        ponto_equilibrio_valor = custos_fixos_total / (margem_contribuicao_perc / 100) if margem_contribuicao_perc > 0 else 0
+        ponto_equilibrio_unidades = ponto_equilibrio_valor / ticket_medio if ticket_medio > 0 else 0
+        
+        with col_eq1:
+            st.metric("Margem de Contribuição", f"{margem_contribuicao_perc:.1f}%")
+        
+        with col_eq2:
+            st.metric("Ponto de Equilíbrio", format_currency(ponto_equilibrio_valor))
+        
+        with col_eq3:
+            st.metric("Vendas Necessárias", f"{ponto_equilibrio_unidades:.0f} unidades/mês")
+        
+        # Botão para explicar a origem do cálculo
+        col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
+        with col_btn2:
+            if st.button("📖 De onde vem esse valor do ponto de equilíbrio?", key="explain_equilibrio_main"):
+                st.info(f"""
+                💡 **Você precisa vender {format_currency(ponto_equilibrio_valor)} por mês**
+                
+                **Fórmula:** Custos Fixos ÷ Margem de Contribuição = Vendas Necessárias
+                
+                **Custos Fixos Totais: {format_currency(custos_fixos_total)}**
+                • Aluguel: {format_currency(aluguel_mensal)}
+                • Folha CLT: {format_currency(salarios_clt)}
+                • Serviços terceirizados: {format_currency(total_optometrista)}
+                • Serviços terceiros: {format_currency(0)}
+                • Outros custos: {format_currency(outros_fixos)}
+                
+                **Margem de Contribuição: {margem_contribuicao_perc:.1f}%**
+                • Custos variáveis: {total_variaveis_perc:.1f}%
+                • Sobra para custos fixos: {margem_contribuicao_perc:.1f}%
+                
+                **Cálculo:** {format_currency(custos_fixos_total)} ÷ {margem_contribuicao_perc:.1f}% = {format_currency(ponto_equilibrio_valor)}
+                
+                **Em resumo:** De cada R$ 100 vendidos, sobram R$ {margem_contribuicao_perc:.0f} para custos fixos. Como seus custos fixos são {format_currency(custos_fixos_total)}, você precisa vender {format_currency(ponto_equilibrio_valor)} para empatar.
+                """)
+        
+        # Salvar dados calculados
+        st.session_state.business_data.update({
+            'margem_contribuicao_perc': margem_contribuicao_perc,
+            'ponto_equilibrio_valor': ponto_equilibrio_valor,
+            'ponto_equilibrio_unidades': ponto_equilibrio_unidades
+        })
+    
+    with tab3:
+        st.subheader("📊 DRE Projetado Mês a Mês")
+        
+        # Calcular DRE mês a mês (modelo compartilhado com o solver de metas)
+        premissas_etapa10 = {
+            'vendas_mes_1': vendas_mes_1,
+            'crescimento_mensal': crescimento_mensal,
+            'cmv_percentual': cmv_percentual,
+            'impostos_percentual': impostos_percentual,
+            'comissoes_percentual': comissoes_percentual,
+            'outros_variaveis_percentual': outros_variaveis_percentual,
+            'aluguel': aluguel_mensal,
+            'salarios_clt': salarios_clt,
+            'total_optometrista': total_optometrista,
+            'outros_fixos': outros_fixos
+        }
+        projecao = FinancialProjection(st.session_state.business_data)
+        dre_mensal = projecao.monthly_dre(12, overrides=premissas_etapa10)
+        
+        # Mostrar tabela DRE
+        st.markdown("### DRE Detalhado Mês a Mês")
+        
+        df_dre = pd.DataFrame([
+            {
+                'Item': 'Receita Bruta',
+                **{f'Mês {i+1}': f"R$ {dre['receita_bruta']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['receita_bruta'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) CMV',
+                **{f'Mês {i+1}': f"R$ {dre['cmv']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['cmv'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Impostos',
+                **{f'Mês {i+1}': f"R$ {dre['impostos']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['impostos'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Taxas Financeiras',
+                **{f'Mês {i+1}': f"R$ {dre['taxas_financeiras']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['taxas_financeiras'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Comissões',
+                **{f'Mês {i+1}': f"R$ {dre['comissoes']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['comissoes'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Comissões Captador',
+                **{f'Mês {i+1}': f"R$ {dre['comissoes_captador']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['comissoes_captador'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '= Margem de Contribuição',
+                **{f'Mês {i+1}': f"R$ {dre['margem_contribuicao']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['margem_contribuicao'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Aluguel',
+                **{f'Mês {i+1}': f"R$ {dre['aluguel']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['aluguel'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Salários',
+                **{f'Mês {i+1}': f"R$ {dre['salarios']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['salarios'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '(-) Depreciação',
+                **{f'Mês {i+1}': f"R$ {dre['depreciacao']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['depreciacao'] for dre in dre_mensal):,.0f}"
+            },
+            {
+                'Item': '= LUCRO OPERACIONAL',
+                **{f'Mês {i+1}': f"R$ {dre['lucro_operacional']:,.0f}" for i, dre in enumerate(dre_mensal)},
+                'Total Anual': f"R$ {sum(dre['lucro_operacional'] for dre in dre_mensal):,.0f}"
+            }
+        ])
+        
+        st.dataframe(df_dre, use_container_width=True)
+        
+        # Breakdown detalhado por linha
+        st.markdown("### 🔍 Breakdown Detalhado")
+        
+        linha_selecionada = st.selectbox(
+            "Selecione uma linha para ver a composição detalhada:",
+            ["Receita Bruta", "CMV", "Impostos", "Taxas Financeiras", "Comissões", "Comissões Captador", "Salários", "Outros Custos Fixos"]
+        )
+        
+        if linha_selecionada == "Receita Bruta":
+            st.markdown("**Composição da Receita Bruta:**")
+            st.write(f"• Vendas mês 1: R$ {vendas_mes_1:,.2f}")
+            st.write(f"• Crescimento mensal: {crescimento_mensal}%")
+            st.write(f"• Ticket médio: R$ {ticket_medio:,.2f}")
+            st.write(f"• Vendas por mês: {vendas_mes_1/ticket_medio:.0f} unidades")
+        
+        elif linha_selecionada == "CMV":
+            st.markdown("**Composição do CMV:**")
+            st.write(f"• Percentual sobre receita: {cmv_percentual}%")
+            st.write("• Inclui: Custo das lentes, armações, materiais")
+            st.write("• Base: Preços de fornecedores (ATAK, Brasil Lentes, GOLD)")
+        
+        elif linha_selecionada == "Impostos":
+            st.markdown("**Composição dos Impostos:**")
+            regime_tributario = st.session_state.business_data.get('regime_tributario', 'Simples Nacional')
+            st.write(f"• Regime tributário: {regime_tributario}")
+            st.write(f"• Alíquota média: {impostos_percentual}%")
+            if regime_tributario == "Simples Nacional":
+                st.write("• Inclui: IRPJ, CSLL, PIS, COFINS, ICMS, CPP, ISS")
+        
+        elif linha_selecionada == "Taxas Financeiras":
+            st.markdown("**Composição das Taxas Financeiras:**")
+            usar_customizada = st.session_state.business_data.get('usar_taxa_customizada', False)
+            if usar_customizada:
+                taxa_percentual = st.session_state.business_data.get('taxa_customizada', 4.3)
+                st.write(f"• Taxa customizada: {taxa_percentual}%")
+            else:
+                taxa_percentual = st.session_state.business_data.get('taxa_mercado_pago', 4.3)
+                opcao_mp = st.session_state.business_data.get('opcao_recebimento_mp', 'Crédito à vista - 14 dias (3,79%)')
+                st.write(f"• Mercado Pago: {opcao_mp}")
+                st.write(f"• Taxa aplicada: {taxa_percentual}%")
+            
+            percentual_prazo = (100 - st.session_state.business_data.get('percentual_avista', 70))
+            percentual_avista = st.session_state.business_data.get('percentual_avista', 70)
+            st.write(f"• Vendas à vista: {percentual_avista}% (taxa 0%)")
+            st.write(f"• Vendas a prazo: {percentual_prazo}% (com taxa)")
+            valor_taxas_mensal = vendas_mes_1 * (percentual_prazo / 100) * (taxa_percentual / 100)
+            st.write(f"• Valor médio mensal: R$ {valor_taxas_mensal:,.2f}")
+            st.write(f"• Fórmula: Receita × {percentual_prazo}% × {taxa_percentual}%")
+        
+        elif linha_selecionada == "Comissões":
+            st.markdown("**Composição das Comissões:**")
+            st.write(f"• Percentual sobre vendas: {comissoes_percentual}%")
+            st.write("• Comissões de vendedores sobre receita bruta")
+            st.write("• Inclui: Comissão de vendas, prêmios por meta")
+            st.write("• Base de cálculo: Receita bruta mensal")
+            valor_comissao_mensal = vendas_mes_1 * (comissoes_percentual / 100)
+            st.write(f"• Valor médio mensal: R$ {valor_comissao_mensal:,.2f}")
+        
+        elif linha_selecionada == "Comissões Captador":
+            st.markdown("**Composição das Comissões do Captador:**")
+            
+            if st.session_state.business_data.get('usar_sistema_captacao', False):
+                # Calcular exemplo com dados do primeiro mês
+                ticket_medio_calc = st.session_state.business_data.get('ticket_medio', 180)
+                percentual_avista = st.session_state.business_data.get('percentual_avista', 70)
+                
+                total_vendas_exemplo = vendas_mes_1 / ticket_medio_calc
+                vendas_avista_exemplo = total_vendas_exemplo * (percentual_avista / 100)
+                vendas_parcelada_exemplo = total_vendas_exemplo * ((100 - percentual_avista) / 100)
+                
+                # Comissões configuradas
+                comissao_avista_config = st.session_state.business_data.get('comissao_avista', 30.0)
+                comissao_parcelada_config = st.session_state.business_data.get('comissao_parcelada', 20.0)
+                tipo_avista = st.session_state.business_data.get('tipo_comissao_avista', 'Valor fixo por venda')
+                tipo_parcelada = st.session_state.business_data.get('tipo_comissao_parcelada', 'Valor fixo por venda')
+                
+                st.write(f"• Sistema de captação: **Ativo**")
+                st.write(f"• Vendas estimadas/mês: {total_vendas_exemplo:.0f} unidades")
+                st.write(f"• Vendas à vista ({percentual_avista}%): {vendas_avista_exemplo:.0f} unidades")
+                st.write(f"• Vendas parceladas ({100-percentual_avista}%): {vendas_parcelada_exemplo:.0f} unidades")
+                
+                # Calcular comissões
+                if tipo_avista == "Valor fixo por venda":
+                    comissao_avista_total = vendas_avista_exemplo * comissao_avista_config
+                    st.write(f"• Comissão à vista: {vendas_avista_exemplo:.0f} × R$ {comissao_avista_config:.2f} = R$ {comissao_avista_total:.2f}")
+                else:
+                    percentual_comissao_avista = st.session_state.business_data.get('percentual_comissao_avista', 3.0)
+                    receita_avista = vendas_mes_1 * (percentual_avista / 100)
+                    comissao_avista_total = receita_avista * (percentual_comissao_avista / 100)
+                    st.write(f"• Comissão à vista: R$ {receita_avista:.2f} × {percentual_comissao_avista}% = R$ {comissao_avista_total:.2f}")
+                
+                if tipo_parcelada == "Valor fixo por venda":
+                    comissao_parcelada_total = vendas_parcelada_exemplo * comissao_parcelada_config
+                    st.write(f"• Comissão parcelada: {vendas_parcelada_exemplo:.0f} × R$ {comissao_parcelada_config:.2f} = R$ {comissao_parcelada_total:.2f}")
+                else:
+                    percentual_comissao_parcelada = st.session_state.business_data.get('percentual_comissao_parcelada', 2.0)
+                    receita_parcelada = vendas_mes_1 * ((100 - percentual_avista) / 100)
+                    comissao_parcelada_total = receita_parcelada * (percentual_comissao_parcelada / 100)
+                    st.write(f"• Comissão parcelada: R$ {receita_parcelada:.2f} × {percentual_comissao_parcelada}% = R$ {comissao_parcelada_total:.2f}")
+                
+                # Comissões por produto
+                if st.session_state.business_data.get('usar_comissao_produto', False):
+                    comissao_lentes = st.session_state.business_data.get('comissao_lentes', 10.0)
+                    comissao_armacoes = st.session_state.business_data.get('comissao_armacoes', 5.0)
+                    vendas_com_lentes = total_vendas_exemplo * 0.75
+                    vendas_com_armacoes = total_vendas_exemplo * 0.90
+                    comissao_produtos_total = (vendas_com_lentes * comissao_lentes) + (vendas_com_armacoes * comissao_armacoes)
+                    st.write(f"• Comissão produtos: R$ {comissao_produtos_total:.2f}")
+                    total_comissoes_captador = comissao_avista_total + comissao_parcelada_total + comissao_produtos_total
+                else:
+                    total_comissoes_captador = comissao_avista_total + comissao_parcelada_total
+                
+                st.write(f"• **Total comissões captador: R$ {total_comissoes_captador:.2f}**")
+                st.write("• Fonte: Configuração Etapa 8 - Sistema de Captação")
+            else:
+                st.write("• Sistema de captação: **Desativado**")
+                st.write("• Configure na Etapa 8 para ativar comissões do captador")
+                st.write("• Valor atual: R$ 0,00")
+        
+        elif linha_selecionada == "Salários":
+            st.markdown("**Composição dos Salários:**")
+            num_func = st.session_state.business_data.get('num_funcionarios', 2)
+            st.write(f"• Número de funcionários: {num_func}")
+            st.write(f"• Folha CLT: R$ {salarios_clt:,.2f}")
+            st.write(f"• Serviços terceirizados: R$ {total_optometrista:,.2f}")
+            st.write(f"• Total pessoal: R$ {salarios_clt + total_optometrista:,.2f}")
+            st.write("• Inclui: Salários + encargos (68% sobre salário base)")
+            if hasattr(st.session_state, 'funcionarios'):
+                for func in st.session_state.funcionarios:
+                    custo_func = func['salario_base'] * 1.68
+                    st.write(f"  - {func['nome']} ({func['cargo']}): R$ {custo_func:,.2f}")
+        
+        elif linha_selecionada == "Outros Custos Fixos":
+            st.markdown("**Composição dos Outros Custos Fixos:**")
+            st.write(f"• Serviços de terceiros: R$ {0:,.2f}")
+            st.write("  - Contabilidade, limpeza, segurança")
+            st.write("  - Manutenção de equipamentos")
+            st.write(f"• Outros custos fixos: R$ {outros_fixos:,.2f}")
+            st.write("  - Telefone, internet, energia")
+            st.write("  - Material de escritório, seguros")
+            st.write("  - Taxas e licenças")
+            total_outros = 0 + outros_fixos
+            st.write(f"• **Total outros custos: R$ {total_outros:,.2f}**")
+        
+        # Indicadores de rentabilidade avançados
+        st.markdown("### 📈 Indicadores de Rentabilidade e Viabilidade")
+        
+        receita_anual_total = sum(dre['receita_bruta'] for dre in dre_mensal)
+        lucro_operacional_total = sum(dre['lucro_operacional'] for dre in dre_mensal)
+        margem_contribuicao_total = sum(dre['margem_contribuicao'] for dre in dre_mensal)
+        
+        col_ind1, col_ind2, col_ind3, col_ind4 = st.columns(4)
+        
+        with col_ind1:
+            margem_operacional = (lucro_operacional_total / receita_anual_total * 100) if receita_anual_total > 0 else 0
+            st.metric("Margem Operacional", f"{margem_operacional:.1f}%", 
+                     help="Lucro operacional / Receita anual")
+        
+        with col_ind2:
+            investimento_total = st.session_state.business_data.get('investimento_total', 81500)
+            roi_anual = (lucro_operacional_total / investimento_total * 100) if investimento_total > 0 else 0
+            st.metric("ROI Anual", f"{roi_anual:.1f}%",
+                     help="Retorno sobre investimento anual")
+        
+        with col_ind3:
+            payback_anos = investimento_total / lucro_operacional_total if lucro_operacional_total > 0 else 0
+            st.metric("Payback", f"{payback_anos:.1f} anos",
+                     help="Tempo para recuperar investimento")
+        
+        with col_ind4:
+            margem_contribuicao_perc_real = (margem_contribuicao_total / receita_anual_total * 100) if receita_anual_total > 0 else 0
+            st.metric("Margem de Contribuição", f"{margem_contribuicao_perc_real:.1f}%",
+                     help="Margem após custos variáveis")
+        
+        # Análise de cenários
+        st.markdown("### 🎯 Análise de Cenários de Rentabilidade")
+        
+        cubo_cenarios = get_scenario_cube(st.session_state.business_data)
+        cenarios_data = []
+        
+        for cenario in cubo_cenarios.summary_table():
+            cenarios_data.append({
+                'Cenário': f"{cenario['label']} ({cenario['descricao']})",
+                'Receita Anual': f"R$ {cenario['receita_anual']:,.0f}",
+                'Lucro Operacional': f"R$ {cenario['lucro_operacional']:,.0f}",
+                'ROI': f"{cenario['roi']:.1f}%",
+                'Margem': f"{cenario['margem']:.1f}%"
+            })
+        
+        df_cenarios = pd.DataFrame(cenarios_data)
+        st.dataframe(df_cenarios, use_container_width=True)
+        
+        # Ponto de equilíbrio detalhado
+        st.markdown("### ⚖️ Análise de Ponto de Equilíbrio Detalhada")
+        col_eq1, col_eq2 = st.columns(2)
+        
+        with col_eq1:
+            st.write(f"**Custos Fixos Mensais:** R$ {custos_fixos_total:,.2f}")
+            st.write(f"**Margem de Contribuição:** {margem_contribuicao_perc:.1f}%")
+            st.write(f"**Ponto de Equilíbrio Mensal:** R$ {ponto_equilibrio_valor:,.2f}")
+            st.write(f"**Vendas Necessárias:** {ponto_equilibrio_unidades:.0f} unidades/mês")
+        
+        with col_eq2:
+            vendas_atual_mes = vendas_mes_1
+            if vendas_atual_mes > ponto_equilibrio_valor:
+                diferenca = vendas_atual_mes - ponto_equilibrio_valor
+                st.success(f"✅ Acima do ponto de equilíbrio em R$ {diferenca:,.2f}")
+                margem_seguranca = (diferenca / vendas_atual_mes * 100)
+                st.write(f"**Margem de Segurança:** {margem_seguranca:.1f}%")
+            else:
+                diferenca = ponto_equilibrio_valor - vendas_atual_mes
+                st.warning(f"⚠️ Abaixo do ponto de equilíbrio em R$ {diferenca:,.2f}")
+                st.write("Necessário aumentar vendas ou reduzir custos")
+        
+        # Botão para explicar a origem do cálculo (logo abaixo da análise)
+        if st.button("📖 De onde vem esse valor do ponto de equilíbrio?", key="explain_equilibrio_detalhado"):
+            st.markdown(f"""
+            <div style="
+                background: linear-gradient(135deg, #fff8e1, #fffef7);
+                padding: 1.5rem;
+                border-radius: 12px;
+                border-left: 4px solid #ff9800;
+                margin: 1rem 0;
+            ">
+                <div style="font-size: 1.1rem; font-weight: bold; color: #e65100; margin-bottom: 0.5rem;">
+                    Você precisa vender {format_currency(ponto_equilibrio_valor)} por mês
+                </div>
+                <div style="font-size: 1rem; font-weight: bold; color: #e65100; margin-bottom: 0.5rem;">
+                    Porque?:
+                </div>
+                <div style="color: #e65100; line-height: 1.5;">
+                    <strong>Fórmula do Ponto de Equilíbrio:</strong><br>
+                    Custos Fixos ÷ Margem de Contribuição = Vendas Necessárias<br><br>
+                    
+                    <strong>Seus Custos Fixos Totais:</strong> {format_currency(custos_fixos_total)}<br>
+                    • Aluguel: {format_currency(aluguel_mensal)}<br>
+                    • Folha CLT: {format_currency(salarios_clt)}<br>
+                    • Serviços terceirizados: {format_currency(total_optometrista)}<br>
+                    • Serviços terceiros: {format_currency(0)}<br>
+                    • Outros custos fixos: {format_currency(outros_fixos)}<br><br>
+                    
+                    <strong>Sua Margem de Contribuição:</strong> {margem_contribuicao_perc:.1f}%<br>
+                    • Custos variáveis: {total_variaveis_perc:.1f}% (CMV + impostos + comissões)<br>
+                    • Sobra para cobrir custos fixos: {margem_contribuicao_perc:.1f}%<br><br>
+                    
+                    <strong>Cálculo Final:</strong><br>
+                    {format_currency(custos_fixos_total)} ÷ {margem_contribuicao_perc:.1f}% = {format_currency(ponto_equilibrio_valor)}<br><br>
+                    
+                    <strong>Traduzindo:</strong> De cada R$ 100 que você vende, sobram R$ {margem_contribuicao_perc:.0f} para pagar os custos fixos. Como seus custos fixos são {format_currency(custos_fixos_total)}, você precisa vender {format_currency(ponto_equilibrio_valor)} para "empatar" (não ter lucro nem prejuízo).
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Solver de metas: encontra o valor de entrada que atinge o resultado desejado
+        st.markdown("### 🎯 Meta de Resultado (Goal Seek)")
+        st.caption("Encontre o ticket médio, volume, markup ou aluguel máximo que atinge sua meta usando a projeção completa")
+        
+        col_gs1, col_gs2, col_gs3 = st.columns(3)
+        
+        with col_gs1:
+            metrica_meta = st.selectbox(
+                "Meta",
+                list(GoalSeekSolver.METRICS.keys()),
+                format_func=lambda m: GoalSeekSolver.METRICS[m],
+                key="goal_seek_metrica"
+            )
+        
+        with col_gs2:
+            valores_padrao_meta = {'lucro_mensal_medio': 5000.0, 'roi_anual': 50.0, 'payback_meses': 24.0}
+            valor_meta = st.number_input(
+                "Valor desejado",
+                value=valores_padrao_meta[metrica_meta],
+                step=100.0 if metrica_meta == 'lucro_mensal_medio' else 1.0,
+                key=f"goal_seek_valor_{metrica_meta}"
+            )
+        
+        with col_gs3:
+            variavel_meta = st.selectbox(
+                "Ajustar",
+                list(GoalSeekSolver.VARIABLES.keys()),
+                format_func=lambda v: GoalSeekSolver.VARIABLES[v]['label'],
+                key="goal_seek_variavel"
+            )
+        
+        solver = GoalSeekSolver({**st.session_state.business_data, **premissas_etapa10})
+        resultado_meta = solver.solve(variavel_meta, metrica_meta, valor_meta)
+        
+        if resultado_meta['convergiu']:
+            valor_encontrado = resultado_meta['valor']
+            if variavel_meta in ('ticket_medio', 'aluguel'):
+                valor_texto = format_currency(valor_encontrado)
+            elif variavel_meta == 'markup':
+                valor_texto = f"{valor_encontrado:.2f}x"
+            else:
+                valor_texto = f"{valor_encontrado:.0f} óculos/mês"
+            st.success(f"✅ **{GoalSeekSolver.VARIABLES[variavel_meta]['label']}: {valor_texto}** para atingir {GoalSeekSolver.METRICS[metrica_meta].lower()} de {valor_meta:,.1f}")
+            st.caption(f"Resolvido em {resultado_meta['iteracoes']} iterações ({resultado_meta['avaliacoes']} projeções calculadas)")
+        else:
+            st.warning(f"⚠️ Não foi possível atingir a meta ajustando apenas {GoalSeekSolver.VARIABLES[variavel_meta]['label'].lower()}: {resultado_meta.get('erro', 'sem convergência')}")
+        
+        # Salvar todos os indicadores calculados
+        st.session_state.business_data.update({
+            'receita_anual': receita_anual_total,
+            'lucro_operacional': lucro_operacional_total,
+            'margem_operacional': margem_operacional,
+            'roi_anual': roi_anual,
+            'payback_anos': payback_anos,
+            'margem_contribuicao_real': margem_contribuicao_perc_real,
+            'ponto_equilibrio_status': 'acima' if vendas_atual_mes > ponto_equilibrio_valor else 'abaixo',
+            'margem_seguranca': (vendas_atual_mes - ponto_equilibrio_valor) / vendas_atual_mes * 100 if vendas_atual_mes > 0 else 0,
+            'projecoes_completas': True
+        })
+    
+    with tab4:
+        st.subheader("💸 Fluxo de Caixa Projetado")
+        
+        # Explicar origem do valor inicial
+        st.markdown("### 💰 Origem do Saldo Inicial")
+        
+        capital_giro_default = st.session_state.business_data.get('capital_giro', 18000)
+        reforma_loja = st.session_state.business_data.get('reforma_loja', 0)
+        equipamentos_moveis = st.session_state.business_data.get('equipamentos_moveis', 
+                                                                st.session_state.business_data.get('equipamentos_total', 
+                                                                st.session_state.business_data.get('investimento_equipamentos', 1500)))
+        estoque_inicial = st.session_state.business_data.get('estoque_inicial', 0)
+        
+        valor_total_investimento = reforma_loja + equipamentos_moveis + estoque_inicial + capital_giro_default
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Composição do Investimento Inicial:**")
+            st.write(f"• Reforma da loja: R$ {reforma_loja:,.2f}")
+            st.write(f"• Equipamentos e móveis: R$ {equipamentos_moveis:,.2f}")
+            st.write(f"• Estoque inicial: R$ {estoque_inicial:,.2f}")
+            st.write(f"• Capital de giro: R$ {capital_giro_default:,.2f}")
+            st.markdown(f"**• TOTAL: R$ {valor_total_investimento:,.2f}**")
+        
+        with col2:
+            st.markdown("**O que é Capital de Giro:**")
+            st.write("• Dinheiro disponível para operação diária")
+            st.write("• Pagamento de fornecedores")
+            st.write("• Folha de pagamento dos primeiros meses")
+            st.write("• Despesas operacionais iniciais")
+            st.write("• Reserva para imprevistos")
+        
+        st.info(f"""
+        💡 **Explicação do Saldo Inicial de R$ {capital_giro_default:,.2f}**
+        
+        Este valor representa o capital de giro necessário para iniciar as operações da ótica. 
+        É calculado baseado nos custos fixos mensais estimados e representa aproximadamente 
+        2-3 meses de operação para garantir fluxo de caixa positivo desde o início.
+        """)
+        
+        # Antecipação de recebíveis para manter um saldo mínimo de caixa
+        col_antecip1, col_antecip2 = st.columns(2)
+        with col_antecip1:
+            usar_antecipacao = st.checkbox(
+                "Antecipar recebíveis quando o saldo ficar abaixo do mínimo",
+                value=st.session_state.business_data.get('usar_antecipacao_recebiveis', False),
+                key="usar_antecipacao_fluxo"
+            )
+        with col_antecip2:
+            saldo_minimo_caixa = st.number_input(
+                "Saldo mínimo de caixa (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('saldo_minimo_caixa', 0.0)),
+                step=500.0,
+                key="saldo_minimo_fluxo",
+                disabled=not usar_antecipacao
+            )
+        st.session_state.business_data['usar_antecipacao_recebiveis'] = usar_antecipacao
+        st.session_state.business_data['saldo_minimo_caixa'] = saldo_minimo_caixa
+        
+        # Agenda de recebíveis: vendas a prazo distribuídas nas parcelas dos meses seguintes
+        receitas_fluxo = vendas_mes_1 * (1 + crescimento_mensal/100) ** np.arange(12)
+        percentual_prazo_fluxo = 1 - st.session_state.business_data.get('percentual_avista', 70) / 100
+        recebiveis = ReceivablesEngine.from_business_data(st.session_state.business_data)
+        recebimentos_agenda = recebiveis.schedule(receitas_fluxo * percentual_prazo_fluxo)
+        
+        # Estoque-alvo em meses de CMV, calculado pelo modelo de estoque da Análise de Custos
+        cobertura_estoque = st.session_state.business_data.get('cobertura_estoque_meses', 0)
+        valor_estoque_anterior = estoque_inicial
+        
+        # Calcular fluxo de caixa mês a mês
+        fluxo_caixa = []
+        saldo_acumulado = capital_giro_default  # Usar valor do capital de giro
+        
+        for mes in range(1, 13):
+            receita_mes = receitas_fluxo[mes-1]
+            
+            # Entradas baseadas nas configurações da Etapa 5
+            percentual_avista = st.session_state.business_data.get('percentual_avista', 70) / 100
+            percentual_prazo = 1 - percentual_avista
+            
+            # Usar taxas do Mercado Pago configuradas na Etapa 5
+            usar_customizada = st.session_state.business_data.get('usar_taxa_customizada', False)
+            if usar_customizada:
+                taxa_financeira = st.session_state.business_data.get('taxa_customizada', 4.3) / 100
+            else:
+                taxa_financeira = st.session_state.business_data.get('taxa_mercado_pago', 4.3) / 100
+            
+            # Vendas à vista entram no mês
+            entradas_vendas = receita_mes * percentual_avista
+            
+            # Vendas a prazo entram conforme a agenda de parcelas (taxa da financeira lançada nas saídas)
+            entradas_recebimentos = recebimentos_agenda[mes-1]
+            
+            entradas_total = entradas_vendas + entradas_recebimentos
+            
+            # Saídas detalhadas com todos os custos simulados
+            # Usar configurações personalizadas de pagamento aos fornecedores
+            pct_mes_atual = st.session_state.business_data.get('pct_pagamento_mes_atual', 20.0) / 100
+            pct_mes_seguinte = st.session_state.business_data.get('pct_pagamento_mes_seguinte', 80.0) / 100
+            forma_pag = st.session_state.business_data.get('forma_pagamento_fornecedor', 'Parcelado (30/60)')
+            desconto_avista = st.session_state.business_data.get('desconto_avista_fornecedor', 2.5) / 100
+            
+            # Calcular pagamento de fornecedores baseado nos custos reais das tabelas
+            # Buscar custos reais dos produtos configurados no sistema
+            custo_lentes_real = st.session_state.business_data.get('custo_lentes_total', 0)
+            custo_armacoes_real = st.session_state.business_data.get('custo_armacoes_total', 0)
+            custo_servicos_real = st.session_state.business_data.get('custo_servicos_total', 0)
+            
+            # Total de custos baseado nas tabelas reais dos fornecedores
+            cmv_real_total = custo_lentes_real + custo_armacoes_real + custo_servicos_real
+            
+            # Se não há dados reais, usar percentual como fallback
+            if cmv_real_total <= 0:
+                cmv_bruto = receita_mes * (cmv_percentual / 100)
+            else:
+                # Usar custos reais das tabelas dos fornecedores
+                cmv_bruto = cmv_real_total
+            
+            # Aplicar termos de pagamento configurados
+            if forma_pag == "À Vista":
+                cmv_pagamento = cmv_bruto * (1 - desconto_avista)  # Aplicar desconto à vista
+            else:
+                cmv_pagamento = cmv_bruto * pct_mes_atual  # Pagar conforme configurado
+            
+            # Capital parado em estoque: compra (ou libera) a diferença para o estoque-alvo do mês
+            variacao_estoque = 0
+            if cobertura_estoque > 0:
+                valor_estoque_mes = cmv_bruto * cobertura_estoque
+                variacao_estoque = valor_estoque_mes - valor_estoque_anterior
+                valor_estoque_anterior = valor_estoque_mes
+            
+            impostos_pagamento = receita_mes * (impostos_percentual / 100)
+            
+            # Folha de pagamento completa (incluindo todos os funcionários do DP)
+            folha_completa = 0
+            if hasattr(st.session_state, 'funcionarios') and st.session_state.funcionarios:
+                for func in st.session_state.funcionarios:
+                    if func['tipo_contrato'] == 'CLT':
+                        folha_completa += func['salario_base'] * 1.68  # CLT com encargos
+                    else:
+                        folha_completa += func['salario_base']  # MEI/Prestador
+            else:
+                folha_completa = salarios_clt + total_optometrista
+            
+            # Custos operacionais específicos da ótica - valores exatos do usuário
+            aluguel_pagamento = aluguel_mensal
+            
+            # Usar exatamente os valores configurados pelo usuário (podem ser zero)
+            energia_agua = st.session_state.business_data.get('energia_agua', 0)
+            telefone_internet = st.session_state.business_data.get('telefone_internet', 0)
+            
+            # Serviços profissionais - valores exatos do usuário
+            contabilidade = st.session_state.business_data.get('contabilidade', 0)
+            optometrista = st.session_state.business_data.get('custo_optometrista_mensal', 0)
+            limpeza_seguranca = st.session_state.business_data.get('limpeza_seguranca', 0)
+            
+            # Custos de vendas e marketing - valores exatos do usuário
+            comissoes_vendas = receita_mes * (comissoes_percentual / 100)
+            
+            # Comissões do captador baseadas na configuração
+            comissoes_captador_pagamento = 0
+            if st.session_state.business_data.get('usar_sistema_captacao', False):
+                # Usar o mesmo cálculo da DRE para manter consistência
+                ticket_medio_estimado = st.session_state.business_data.get('ticket_medio', 180)
+                if ticket_medio_estimado > 0:
+                    total_vendas_mes_fc = receita_mes / ticket_medio_estimado
+                    percentual_avista_fc = st.session_state.business_data.get('percentual_avista', 70) / 100
+                    vendas_avista_fc = total_vendas_mes_fc * percentual_avista_fc
+                    vendas_parceladas_fc = total_vendas_mes_fc * (1 - percentual_avista_fc)
+                    
+                    # Calcular comissões por modalidade
+                    tipo_comissao_avista = st.session_state.business_data.get('tipo_comissao_avista', 'Valor fixo por venda')
+                    tipo_comissao_parcelada = st.session_state.business_data.get('tipo_comissao_parcelada', 'Valor fixo por venda')
+                    
+                    if tipo_comissao_avista == "Valor fixo por venda":
+                        comissao_avista_fc = vendas_avista_fc * st.session_state.business_data.get('comissao_avista', 30.0)
+                    else:
+                        receita_avista_fc = receita_mes * percentual_avista_fc
+                        comissao_avista_fc = receita_avista_fc * (st.session_state.business_data.get('percentual_comissao_avista', 3.0) / 100)
+                    
+                    if tipo_comissao_parcelada == "Valor fixo por venda":
+                        comissao_parcelada_fc = vendas_parceladas_fc * st.session_state.business_data.get('comissao_parcelada', 20.0)
+                    else:
+                        receita_parcelada_fc = receita_mes * (1 - percentual_avista_fc)
+                        comissao_parcelada_fc = receita_parcelada_fc * (st.session_state.business_data.get('percentual_comissao_parcelada', 2.0) / 100)
+                    
+                    # Comissões por produto
+                    comissao_produtos_fc = 0
+                    if st.session_state.business_data.get('usar_comissao_produto', False):
+                        vendas_com_lentes_fc = total_vendas_mes_fc * 0.75
+                        vendas_com_armacoes_fc = total_vendas_mes_fc * 0.90
+                        comissao_produtos_fc = (
+                            vendas_com_lentes_fc * st.session_state.business_data.get('comissao_lentes', 10.0) +
+                            vendas_com_armacoes_fc * st.session_state.business_data.get('comissao_armacoes', 5.0)
+                        )
+                    
+                    comissoes_captador_pagamento = comissao_avista_fc + comissao_parcelada_fc + comissao_produtos_fc
+            
+            marketing_publicidade = st.session_state.business_data.get('marketing_publicidade', 0)
+            
+            # Despesas administrativas - valores exatos do usuário  
+            material_escritorio = st.session_state.business_data.get('material_escritorio', 0)
+            seguros = st.session_state.business_data.get('seguros', 0)
+            manutencao_equipamentos = st.session_state.business_data.get('manutencao_equipamentos', 0)
+            
+            # Taxas financeiras sobre vendas a prazo
+            receita_prazo_valor = receita_mes * percentual_prazo
+            taxas_financeiras_pagamento = receita_prazo_valor * taxa_financeira
+            
+            # Depreciação mensal
+            depreciacao = st.session_state.business_data.get('depreciacao_mensal', 0)
+            if depreciacao == 0:
+                investimento_total = st.session_state.business_data.get('investimento_total', 0)
+                if investimento_total > 0:
+                    depreciacao = investimento_total * 0.3 / 120  # 30% do investimento em 10 anos
+            
+            # Total de saídas detalhado
+            saidas_total = (cmv_pagamento + impostos_pagamento + taxas_financeiras_pagamento + 
+                          folha_completa + aluguel_pagamento + energia_agua + telefone_internet + 
+                          contabilidade + optometrista + limpeza_seguranca + 
+                          comissoes_vendas + comissoes_captador_pagamento + marketing_publicidade + material_escritorio + 
+                          seguros + manutencao_equipamentos + depreciacao + variacao_estoque)
+            
+            # Fluxo do mês
+            fluxo_mes = entradas_total - saidas_total
+            saldo_final = saldo_acumulado + fluxo_mes
+            
+            fluxo_caixa.append({
+                'mes': mes,
+                'receita_mes': receita_mes,
+                'saldo_inicial': saldo_acumulado,
+                'entradas_vendas': entradas_vendas,
+                'entradas_recebimentos': entradas_recebimentos,
+                'entradas_total': entradas_total,
+                'cmv_pagamento': cmv_pagamento,
+                'impostos_pagamento': impostos_pagamento,
+                'taxas_financeiras_pagamento': taxas_financeiras_pagamento,
+                'comissoes_captador_pagamento': comissoes_captador_pagamento,
+                'folha_completa': folha_completa,
+                'aluguel_pagamento': aluguel_pagamento,
+                'energia_agua': energia_agua,
+                'telefone_internet': telefone_internet,
+                'contabilidade': contabilidade,
+                'optometrista': optometrista,
+                'limpeza_seguranca': limpeza_seguranca,
+                'comissoes_vendas': comissoes_vendas,
+                'marketing_publicidade': marketing_publicidade,
+                'material_escritorio': material_escritorio,
+                'seguros': seguros,
+                'manutencao_equipamentos': manutencao_equipamentos,
+                'depreciacao': depreciacao,
+                'variacao_estoque': variacao_estoque,
+                'saidas_total': saidas_total,
+                'fluxo_mes': fluxo_mes,
+                'saldo_final': saldo_final
+            })
+            
+            saldo_acumulado = saldo_final
+        
+        if usar_antecipacao:
+            # Antecipar só o necessário, mês a mês, para não ficar abaixo do saldo mínimo
+            demais_fluxos = np.array([linha['entradas_vendas'] - linha['saidas_total'] for linha in fluxo_caixa])
+            plano_antecipacao = recebiveis.optimize(
+                receitas_fluxo * percentual_prazo_fluxo, demais_fluxos, capital_giro_default, saldo_minimo_caixa
+            )
+            saldo_acumulado = capital_giro_default
+            for i, linha in enumerate(fluxo_caixa):
+                linha['entradas_recebimentos'] = plano_antecipacao['recebimentos'][i]
+                linha['antecipacao_liquida'] = plano_antecipacao['antecipado'][i] - plano_antecipacao['custo_antecipacao'][i]
+                linha['entradas_total'] = linha['entradas_vendas'] + linha['entradas_recebimentos'] + linha['antecipacao_liquida']
+                linha['fluxo_mes'] = linha['entradas_total'] - linha['saidas_total']
+                linha['saldo_inicial'] = saldo_acumulado
+                linha['saldo_final'] = saldo_acumulado + linha['fluxo_mes']
+                saldo_acumulado = linha['saldo_final']
+            
+            if plano_antecipacao['antecipado'].sum() > 0:
+                st.info(f"💳 Antecipação necessária: {format_currency(plano_antecipacao['antecipado'].sum())} em recebíveis "
+                        f"(custo de {format_currency(plano_antecipacao['custo_total'])} a {recebiveis.taxa_antecipacao:.2f}%)")
+            else:
+                st.success("✅ O saldo fica acima do mínimo sem antecipar recebíveis")
+        
+        # Tabela do fluxo de caixa
+        st.markdown("### 📊 Fluxo de Caixa Detalhado")
+        
+        percentual_avista_fluxo = int(st.session_state.business_data.get("percentual_avista", 70))
+        linhas_fluxo = [
+            ('Saldo Inicial', 'saldo_inicial'),
+            (f'(+) Vendas à Vista ({percentual_avista_fluxo}%)', 'entradas_vendas'),
+            (f'(+) Recebimentos ({100 - percentual_avista_fluxo}%)', 'entradas_recebimentos'),
+            *([('(+) Antecipação de Recebíveis (líquida)', 'antecipacao_liquida')] if usar_antecipacao else []),
+            ('= Total Entradas', 'entradas_total'),
+            ('(-) Pagto. Fornecedores', 'cmv_pagamento'),
+            ('(-) Impostos', 'impostos_pagamento'),
+            ('(-) Taxas Financeiras', 'taxas_financeiras_pagamento'),
+            ('(-) Folha de Pagamento', 'folha_completa'),
+            ('(-) Aluguel', 'aluguel_pagamento'),
+            ('(-) Energia/Água', 'energia_agua'),
+            ('(-) Telefone/Internet', 'telefone_internet'),
+            ('(-) Contabilidade', 'contabilidade'),
+            ('(-) Optometrista', 'optometrista'),
+            ('(-) Limpeza/Segurança', 'limpeza_seguranca'),
+            ('(-) Comissões', 'comissoes_vendas'),
+            ('(-) Comissões Captador', 'comissoes_captador_pagamento'),
+            ('(-) Marketing', 'marketing_publicidade'),
+            ('(-) Material Escritório', 'material_escritorio'),
+            ('(-) Seguros', 'seguros'),
+            ('(-) Manutenção', 'manutencao_equipamentos'),
+            ('(-) Depreciação', 'depreciacao'),
+            *([('(-) Variação de Estoque', 'variacao_estoque')] if cobertura_estoque > 0 else []),
+            ('= Total Saídas', 'saidas_total'),
+            ('= Fluxo do Mês', 'fluxo_mes'),
+            ('= SALDO FINAL', 'saldo_final')
+        ]
+        
+        # Tabela numérica (linhas = itens, colunas = meses); formatação só na exibição
+        df_fluxo_mensal = pd.DataFrame(fluxo_caixa)
+        df_fluxo = df_fluxo_mensal[[chave for _, chave in linhas_fluxo]].T
+        df_fluxo.index = [rotulo for rotulo, _ in linhas_fluxo]
+        df_fluxo.index.name = 'Item'
+        df_fluxo.columns = [f'Mês {i+1}' for i in range(len(fluxo_caixa))]
+        
+        st.dataframe(
+            format_frame(df_fluxo, currency=df_fluxo.columns, decimals=0).reset_index(),
+            use_container_width=True
+        )
+        
+        # Auditoria detalhada linha por linha
+        st.markdown("### 🔍 Auditoria Detalhada - Fluxo de Caixa")
+        st.markdown("*Clique em cada item para ver fórmulas, origem dos dados e memória de cálculo*")
+        
+        item_fluxo = st.selectbox(
+            "Selecione um item para auditoria:",
+            ["Saldo Inicial", "Vendas à Vista", "Recebimentos", "Pagamento Fornecedores", "Impostos", 
+             "Taxas Financeiras", "Folha de Pagamento", "Aluguel", "Energia/Água", "Telefone/Internet", "Contabilidade",
+             "Optometrista", "Limpeza/Segurança", "Comissões", "Marketing", "Material Escritório",
+             "Seguros", "Manutenção", "Depreciação"]
+        )
+        
+        if item_fluxo == "Saldo Inicial":
+            st.markdown("**📊 AUDITORIA: Saldo Inicial (Capital de Giro)**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Capital de Giro = Custos Fixos Mensais × 2,5 meses")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {capital_giro_default:,.2f}")
+            st.write("• Base: Custos operacionais estimados")
+            st.write("• Multiplicador: 2,5 meses (padrão mercado)")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Representa reserva para primeiros meses de operação")
+            st.write("• Garante pagamento de fornecedores antes recebimento")
+            st.write("• Cobre variações sazonais de faturamento")
+            st.write("• Buffer de segurança para imprevistos")
+            
+        elif item_fluxo == "Vendas à Vista":
+            percentual_config = st.session_state.business_data.get('percentual_avista', 70)
+            st.markdown("**📊 AUDITORIA: Vendas à Vista**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code(f"Vendas à Vista = Receita Mensal × {percentual_config}%")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Percentual configurado: {percentual_config}% (Etapa 5 - Produtos e Serviços)")
+            st.write("• Base de cálculo: Receita bruta mensal")
+            st.write("• Formas de pagamento à vista: Dinheiro, PIX, Débito")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            exemplo_mes1 = vendas_mes_1 * (percentual_config / 100)
+            st.write(f"• Exemplo Mês 1: R$ {vendas_mes_1:,.2f} × {percentual_config}% = R$ {exemplo_mes1:,.2f}")
+            st.write("• Recebimento: No mesmo mês da venda")
+            st.write("• Impacto no fluxo: Positivo imediato")
+        
+        elif item_fluxo == "Recebimentos":
+            percentual_config = st.session_state.business_data.get('percentual_avista', 70)
+            percentual_prazo = 100 - percentual_config
+            prazo_config = st.session_state.business_data.get('prazo_medio_recebimento', 30)
+            
+            # Usar taxas do Mercado Pago configuradas na Etapa 5
+            usar_customizada = st.session_state.business_data.get('usar_taxa_customizada', False)
+            if usar_customizada:
+                taxa_financeira = st.session_state.business_data.get('taxa_customizada', 4.3)
+                modalidade = "Customizada"
+            else:
+                taxa_mp = st.session_state.business_data.get('taxa_mercado_pago', 4.3)
+                opcao_mp = st.session_state.business_data.get('opcao_recebimento_mp', 'Crédito à vista - 14 dias (3,79%)')
+                taxa_financeira = taxa_mp
+                if "PIX" in opcao_mp:
+                    modalidade = "PIX"
+                elif "Débito" in opcao_mp:
+                    modalidade = "Débito"
+                elif "Na hora" in opcao_mp:
+                    modalidade = "Crédito na hora"
+                elif "14 dias" in opcao_mp:
+                    modalidade = "Crédito 14 dias"
+                elif "30 dias" in opcao_mp:
+                    modalidade = "Crédito 30 dias"
+                else:
+                    modalidade = "Crédito"
+            
+            st.markdown("**📊 AUDITORIA: Recebimentos a Prazo**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code(f"Recebimentos = (Receita × {percentual_prazo}%) × (100% - {taxa_financeira}%)")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Percentual a prazo: {percentual_prazo}% (Etapa 5 - Produtos e Serviços)")
+            st.write(f"• Prazo médio: {prazo_config} dias")
+            st.write(f"• Modalidade: {modalidade}")
+            st.write(f"• Taxa da financeira: {taxa_financeira}%")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.markdown("**Exemplo prático:**")
+            st.write(f"• Cliente compra óculos de R$ 500 parcelado em 3x")
+            st.write(f"• Valor bruto a prazo: R$ 500 × {percentual_prazo}% = R$ {500 * (percentual_prazo / 100):,.2f}")
+            
+            if taxa_financeira > 0:
+                valor_liquido = 500 * (percentual_prazo / 100) * (1 - taxa_financeira / 100)
+                st.write(f"• Taxa da financeira: R$ {500 * (percentual_prazo / 100):,.2f} × {taxa_financeira}% = R$ {500 * (percentual_prazo / 100) * (taxa_financeira / 100):,.2f}")
+                st.write(f"• **Valor líquido recebido: R$ {valor_liquido:,.2f}**")
+                st.write(f"• Prazo de recebimento: {prazo_config} dias")
+            else:
+                st.write(f"• **Valor recebido: R$ {500 * (percentual_prazo / 100):,.2f}** (sem taxa)")
+                st.write("• Risco: Inadimplência assumida pela ótica")
+            
+            st.markdown("**💡 Entendimento:**")
+            st.write("• Cliente pode parcelar em quantas vezes quiser")
+            st.write("• Seu recebimento depende do contrato com a financeira")
+            st.write(f"• {modalidade}: melhor fluxo de caixa vs menor taxa")
+        
+        elif item_fluxo == "Pagamento Fornecedores":
+            st.markdown("**📊 AUDITORIA: Pagamento a Fornecedores (CMV)**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code(f"CMV = Custos Reais dos Produtos ou {cmv_percentual}% da Receita")
+            st.markdown("**📍 Origem dos Dados:**")
+            custo_lentes_real = st.session_state.business_data.get('custo_lentes_total', 0)
+            custo_armacoes_real = st.session_state.business_data.get('custo_armacoes_total', 0)
+            custo_servicos_real = st.session_state.business_data.get('custo_servicos_total', 0)
+            cmv_real_total = custo_lentes_real + custo_armacoes_real + custo_servicos_real
+            
+            if cmv_real_total > 0:
+                st.write(f"• Custos reais da precificação: R$ {cmv_real_total:,.2f}")
+                st.write(f"  - Lentes: R$ {custo_lentes_real:,.2f}")
+                st.write(f"  - Armações: R$ {custo_armacoes_real:,.2f}")
+                st.write(f"  - Serviços: R$ {custo_servicos_real:,.2f}")
+            else:
+                st.write(f"• Percentual estimado: {cmv_percentual}% da receita")
+                st.write("• Configure produtos na Etapa 5 para custos reais")
+            
+            st.write("• Fornecedores: ATAK, Brasil Lentes, GOLD, DSMHD")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            if cmv_real_total > 0:
+                exemplo_cmv = cmv_real_total
+                st.write(f"• Valor fixo mensal: R$ {exemplo_cmv:,.2f}")
+            else:
+                exemplo_cmv = vendas_mes_1 * (cmv_percentual / 100)
+                st.write(f"• Exemplo Mês 1: R$ {vendas_mes_1:,.2f} × {cmv_percentual}% = R$ {exemplo_cmv:,.2f}")
+            st.write("• Prazo pagamento: Conforme negociado com fornecedores")
+            st.write("• Impacto: Maior custo do negócio após impostos")
+        
+        elif item_fluxo == "Impostos":
+            regime = st.session_state.business_data.get('regime_tributario', 'Simples Nacional')
+            st.markdown("**📊 AUDITORIA: Impostos**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code(f"Impostos = Receita Mensal × {impostos_percentual}%")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Regime tributário: {regime}")
+            st.write(f"• Alíquota aplicada: {impostos_percentual}% (legislação brasileira)")
+            if regime == "Simples Nacional":
+                st.write("• Anexo I - Comércio (óticas)")
+                st.write("• Impostos unificados: IRPJ, CSLL, PIS, COFINS, ICMS, CPP, ISS")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            exemplo_imposto = vendas_mes_1 * (impostos_percentual / 100)
+            st.write(f"• Exemplo Mês 1: R$ {vendas_mes_1:,.2f} × {impostos_percentual}% = R$ {exemplo_imposto:,.2f}")
+            st.write("• Pagamento: DAS mensal até dia 20")
+            st.write("• Base legal: Lei Complementar 123/2006 (Simples Nacional)")
+            st.write("• Impacto: Obrigação fiscal automática sobre faturamento")
+        
+        elif item_fluxo == "Taxas Financeiras":
+            st.markdown("**📊 AUDITORIA: Taxas Financeiras**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Taxas = Receita × % Vendas a Prazo × Taxa da Financeira")
+            st.markdown("**📍 Origem dos Dados:**")
+            
+            usar_customizada = st.session_state.business_data.get('usar_taxa_customizada', False)
+            percentual_avista = st.session_state.business_data.get('percentual_avista', 70)
+            percentual_prazo = 100 - percentual_avista
+            
+            if usar_customizada:
+                taxa_config = st.session_state.business_data.get('taxa_customizada', 4.3)
+                st.write(f"• Taxa customizada: {taxa_config}%")
+                st.write("• Fonte: Configuração manual (Etapa 5)")
+            else:
+                taxa_config = st.session_state.business_data.get('taxa_mercado_pago', 4.3)
+                opcao_mp = st.session_state.business_data.get('opcao_recebimento_mp', 'Crédito à vista - 14 dias (3,79%)')
+                st.write(f"• Taxa Mercado Pago: {taxa_config}%")
+                st.write(f"• Modalidade: {opcao_mp}")
+                st.write("• Fonte: Configuração Etapa 5 - Produtos e Serviços")
+            
+            st.write(f"• Vendas à vista: {percentual_avista}% (taxa 0%)")
+            st.write(f"• Vendas a prazo: {percentual_prazo}% (com taxa)")
+            
+            st.markdown("**🎯 Memória de Cálculo:**")
+            exemplo_receita = vendas_mes_1
+            exemplo_prazo = exemplo_receita * (percentual_prazo / 100)
+            exemplo_taxa = exemplo_prazo * (taxa_config / 100)
+            
+            st.write(f"• Exemplo Mês 1:")
+            st.write(f"  - Receita total: R$ {exemplo_receita:,.2f}")
+            st.write(f"  - Vendas a prazo ({percentual_prazo}%): R$ {exemplo_prazo:,.2f}")
+            st.write(f"  - Taxa financeira ({taxa_config}%): R$ {exemplo_taxa:,.2f}")
+            st.write(f"• **Custo mensal das taxas: R$ {exemplo_taxa:,.2f}**")
+            
+            st.markdown("**💡 Entendimento:**")
+            st.write("• Custo das vendas parceladas e cartão de crédito")
+            st.write("• Reduz o valor líquido recebido das vendas a prazo")
+            st.write("• Impacto direto no fluxo de caixa e margem")
+        
+        elif item_fluxo == "Folha de Pagamento":
+            st.markdown("**📊 AUDITORIA: Folha de Pagamento**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Folha Total = Σ(Salário Base × Encargos por Tipo)")
+            st.markdown("**📍 Origem dos Dados:**")
+            if hasattr(st.session_state, 'funcionarios') and st.session_state.funcionarios:
+                st.write(f"• Funcionários cadastrados: {len(st.session_state.funcionarios)}")
+                st.write("• Fonte: DP e Tributação (sistema integrado)")
+                custo_total_folha = 0
+                clt_count = 0
+                terceirizado_count = 0
+                for func in st.session_state.funcionarios:
+                    if func['tipo_contrato'] == 'CLT':
+                        custo_func = func['salario_base'] * 1.68
+                        clt_count += 1
+                    else:
+                        custo_func = func['salario_base']
+                        terceirizado_count += 1
+                    custo_total_folha += custo_func
+                st.markdown("**🎯 Memória de Cálculo:**")
+                st.write(f"• Funcionários CLT: {clt_count} (com encargos 68%)")
+                st.write(f"• Terceirizados/MEI: {terceirizado_count} (sem encargos)")
+                for func in st.session_state.funcionarios:
+                    if func['tipo_contrato'] == 'CLT':
+                        custo_func = func['salario_base'] * 1.68
+                        st.write(f"  - {func['nome']} ({func['cargo']}) CLT: R$ {func['salario_base']:,.2f} × 1.68 = R$ {custo_func:,.2f}")
+                    else:
+                        st.write(f"  - {func['nome']} ({func['cargo']}) {func['tipo_contrato']}: R$ {func['salario_base']:,.2f}")
+                st.write(f"• **Total mensal: R$ {custo_total_folha:,.2f}**")
+            else:
+                st.write(f"• Folha CLT estimada: R$ {salarios_clt:,.2f}")
+                st.write(f"• Serviços terceirizados: R$ {total_optometrista:,.2f}")
+                st.write("• Configure funcionários no DP para cálculo detalhado")
+                st.markdown("**🎯 Memória de Cálculo:**")
+                st.write("• Encargos CLT incluem: INSS, FGTS, 13º, férias, rescisão")
+                st.write("• Base legal: CLT e legislação trabalhista brasileira")
+        
+        elif item_fluxo == "Aluguel":
+            aluguel_valor = st.session_state.business_data.get('aluguel_mensal', 0)
+            st.markdown("**📊 AUDITORIA: Aluguel**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Aluguel = Valor Fixo Mensal")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {aluguel_valor:,.2f}")
+            st.write("• Fonte: Etapa 9 - Investimento Inicial")
+            st.write("• Tipo: Custo fixo mensal")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Valor exato configurado pelo usuário")
+            st.write("• Pago mensalmente, independente do faturamento")
+            st.write("• Representa maior custo fixo da operação")
+            if aluguel_valor == 0:
+                st.warning("• Valor zerado - verifique se é propriedade própria")
+        
+        elif item_fluxo == "Energia/Água":
+            energia_agua_valor = st.session_state.business_data.get('energia_agua', 0)
+            st.markdown("**📊 AUDITORIA: Energia/Água**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Energia/Água = Valor Fixo + Variável")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {energia_agua_valor:,.2f}")
+            st.write("• Tipo: Custo semi-variável")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Energia elétrica + Água + Esgoto")
+            st.write("• Componentes: Taxa fixa + consumo variável")
+            st.write("• Estimativa baseada no funcionamento da ótica")
+            if energia_agua_valor == 0:
+                st.warning("• Valor zerado - verifique configuração")
+        
+        elif item_fluxo == "Telefone/Internet":
+            telefone_internet_valor = st.session_state.business_data.get('telefone_internet', 0)
+            st.markdown("**📊 AUDITORIA: Telefone/Internet**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Telefone/Internet = Planos Fixos Mensais")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {telefone_internet_valor:,.2f}")
+            st.write("• Tipo: Custo fixo operacional")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Internet banda larga + telefone fixo/móvel")
+            st.write("• Essencial para: Sistema de vendas, comunicação")
+            st.write("• Valor mensal fixo contratual")
+            if telefone_internet_valor == 0:
+                st.warning("• Valor zerado - verifique configuração")
+        
+        elif item_fluxo == "Contabilidade":
+            contabilidade_valor = st.session_state.business_data.get('contabilidade', 0)
+            st.markdown("**📊 AUDITORIA: Contabilidade**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Contabilidade = Honorários Mensais")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {contabilidade_valor:,.2f}")
+            st.write("• Tipo: Serviço profissional obrigatório")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Serviços: Escrituração contábil, impostos, folha")
+            st.write("• Obrigatoriedade: Pessoa jurídica")
+            st.write("• Frequência: Mensal")
+            if contabilidade_valor == 0:
+                st.warning("• Valor zerado - contabilidade é obrigatória para PJ")
+        
+        elif item_fluxo == "Optometrista":
+            optometrista_valor = st.session_state.business_data.get('custo_optometrista_mensal', 0)
+            st.markdown("**📊 AUDITORIA: Optometrista**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Optometrista = Diária × Dias no Mês")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor mensal: R$ {optometrista_valor:,.2f}")
+            st.write("• Fonte: Serviços Profissionais por Diária")
+            st.write("• Tipo: Prestador de serviços")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            diaria = st.session_state.business_data.get('diaria_optometrista', 150)
+            dias = st.session_state.business_data.get('dias_optometrista_mes', 4)
+            st.write(f"• Diária: R$ {diaria:,.2f}")
+            st.write(f"• Dias/mês: {dias}")
+            st.write(f"• Total: R$ {diaria:,.2f} × {dias} = R$ {optometrista_valor:,.2f}")
+            st.write("• Serviços: Exames de vista, prescrições")
+            if optometrista_valor == 0:
+                st.info("• Opcional - para ótica com exames completos")
+        
+        elif item_fluxo == "Limpeza/Segurança":
+            limpeza_valor = st.session_state.business_data.get('limpeza_seguranca', 0)
+            st.markdown("**📊 AUDITORIA: Limpeza/Segurança**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Limpeza/Segurança = Serviços Terceirizados")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {limpeza_valor:,.2f}")
+            st.write("• Tipo: Serviço terceirizado")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Limpeza diária + monitoramento")
+            st.write("• Frequência: Diária para limpeza")
+            st.write("• Valor mensal fixo contratual")
+            if limpeza_valor == 0:
+                st.info("• Opcional - pode ser feito pelo próprio proprietário")
+        
+        elif item_fluxo == "Comissões":
+            comissoes_percent = st.session_state.business_data.get('comissoes_percentual', 3)
+            st.markdown("**📊 AUDITORIA: Comissões de Vendas**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code(f"Comissões = Receita Mensal × {comissoes_percent}%")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Percentual: {comissoes_percent}% sobre vendas")
+            st.write("• Tipo: Custo variável sobre faturamento")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            exemplo_comissao = vendas_mes_1 * (comissoes_percent / 100)
+            st.write(f"• Exemplo Mês 1: R$ {vendas_mes_1:,.2f} × {comissoes_percent}% = R$ {exemplo_comissao:,.2f}")
+            st.write("• Base: Faturamento bruto mensal")
+            st.write("• Pagamento: Mensal conforme vendas realizadas")
+        
+        elif item_fluxo == "Marketing":
+            marketing_valor = st.session_state.business_data.get('marketing_publicidade', 0)
+            st.markdown("**📊 AUDITORIA: Marketing/Publicidade**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Marketing = Investimento Mensal Fixo")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {marketing_valor:,.2f}")
+            st.write("• Tipo: Investimento em divulgação")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Publicidade online, impressos, promocões")
+            st.write("• Estratégia: Atrair e reter clientes")
+            st.write("• Valor mensal planejado")
+            if marketing_valor == 0:
+                st.warning("• Marketing é essencial para crescimento do negócio")
+        
+        elif item_fluxo == "Material Escritório":
+            material_valor = st.session_state.business_data.get('material_escritorio', 0)
+            st.markdown("**📊 AUDITORIA: Material de Escritório**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Material Escritório = Consumo Mensal")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {material_valor:,.2f}")
+            st.write("• Tipo: Custo operacional variável")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Papel, canetas, formulários, impressões")
+            st.write("• Consumo: Conforme operação da ótica")
+            if material_valor == 0:
+                st.info("• Valor baixo mas necessário para operação")
+        
+        elif item_fluxo == "Seguros":
+            seguros_valor = st.session_state.business_data.get('seguros', 0)
+            st.markdown("**📊 AUDITORIA: Seguros**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Seguros = Prêmios Mensais")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {seguros_valor:,.2f}")
+            st.write("• Tipo: Proteção patrimonial")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Seguro contra incêndio, roubo, responsabilidade civil")
+            st.write("• Proteção: Estoque, equipamentos, estabelecimento")
+            if seguros_valor == 0:
+                st.warning("• Seguros são importantes para proteção do negócio")
+        
+        elif item_fluxo == "Manutenção":
+            manutencao_valor = st.session_state.business_data.get('manutencao_equipamentos', 0)
+            st.markdown("**📊 AUDITORIA: Manutenção de Equipamentos**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Manutenção = Custos Preventivos + Corretivos")
+            st.markdown("**📍 Origem dos Dados:**")
+            st.write(f"• Valor configurado: R$ {manutencao_valor:,.2f}")
+            st.write("• Tipo: Conservação de ativos")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Inclui: Equipamentos óticos, sistema, mobiliário")
+            st.write("• Frequência: Preventiva + corretiva conforme necessário")
+            if manutencao_valor == 0:
+                st.info("• Importante para manter equipamentos funcionando")
+        
+        elif item_fluxo == "Depreciação":
+            depreciacao_valor = st.session_state.business_data.get('depreciacao_mensal', 0)
+            investimento_total = st.session_state.business_data.get('investimento_total', 0)
+            st.markdown("**📊 AUDITORIA: Depreciação**")
+            st.markdown("---")
+            st.markdown("**🔢 Fórmula:**")
+            st.code("Depreciação = (Investimento × 30%) ÷ 120 meses")
+            st.markdown("**📍 Origem dos Dados:**")
+            if depreciacao_valor == 0 and investimento_total > 0:
+                depreciacao_calc = investimento_total * 0.3 / 120
+                st.write(f"• Investimento total: R$ {investimento_total:,.2f}")
+                st.write(f"• Depreciação calculada: R$ {depreciacao_calc:,.2f}/mês")
+            else:
+                st.write(f"• Valor configurado: R$ {depreciacao_valor:,.2f}")
+            st.write("• Base: 30% do investimento em 10 anos")
+            st.markdown("**🎯 Memória de Cálculo:**")
+            st.write("• Representa desgaste dos equipamentos ao longo do tempo")
+            st.write("• Contabilização do custo dos ativos fixos")
+            st.write("• Método linear: valor igual todos os meses")
+    
+    # Store financial projections for other steps
+    st.session_state.business_data.update({
+        'vendas_mes_1': vendas_mes_1,
+        'crescimento_mensal': crescimento_mensal,
+        'cmv_percentual': cmv_percentual,
+        'impostos_percentual': impostos_percentual,
+        'comissoes_percentual': comissoes_percentual,
+        'aluguel': aluguel_mensal,
+        'salarios_clt': salarios_clt,
+        'total_optometrista': total_optometrista,
+        'salarios_total': salarios_clt + total_optometrista
+    })
+    save_user_data()
+    
+    # Planilha para o contador: DRE mensal, fluxo de caixa, cenários e tabela de preços
+    st.markdown("### 📊 Exportar Planilha Excel")
+    # O fluxo de caixa vai exatamente como exibido na aba Fluxo de Caixa
+    figuras_planilha = {'fluxo_caixa': df_fluxo.to_dict('split')}
+    if st.button("📊 Gerar Planilha (XLSX)", key="xlsx_export"):
+        st.session_state.report_job_planilha = get_report_queue().submit(
+            'planilha', st.session_state.business_data, "Português", figuras_planilha
+        )
+    nome_planilha = st.session_state.business_data.get('nome_negocio', 'otica').replace(' ', '_')
+    gerando_planilha = show_report_job(
+        'planilha', "Português", f"projecoes_{nome_planilha}.xlsx", "📥 Download Planilha (XLSX)",
+        "Planilha gerada com sucesso!", "Erro ao gerar planilha", figures=figuras_planilha
+    )
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step10"):
+            st.session_state.step = 9
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step10"):
+            st.session_state.step = 11
+            st.rerun()
+    
+    if gerando_planilha:
+        # Atualiza o progresso até a planilha ficar pronta
+        time.sleep(0.5)
+        st.rerun()
@@ -0,0 +1,490 @@
+"""
+Etapa 11 - Análise de Viabilidade
+Indicadores de viabilidade, sensibilidade, cenários e expansão multi-lojas
+"""
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from app_helpers import format_currency
+from br_format import format_frame
+from rollout_simulator import RolloutSimulator
+from scenario_cube import get_scenario_cube
+
+
+def show_step_11():
+    """Etapa 11: Análise de Viabilidade"""
+    st.header("1️⃣1️⃣ Análise de Viabilidade")
+    st.markdown("**FASE 11: VIABILIDADE** - Análise matemática da viabilidade do negócio")
+    
+    # Recuperar dados das etapas anteriores
+    investimento_total = st.session_state.business_data.get('investimento_total', 81500)
+    receita_anual = st.session_state.business_data.get('receita_anual', 180000)
+    lucro_operacional = st.session_state.business_data.get('lucro_operacional', 25000)
+    ebitda = st.session_state.business_data.get('ebitda', 26350)
+    margem_contribuicao_perc = st.session_state.business_data.get('margem_contribuicao_perc', 44.0)
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Indicadores Chave", "💹 Análise de Sensibilidade", "🎯 Cenários", "🏬 Expansão Multi-Lojas"])
+    
+    with tab1:
+        st.subheader("📊 Indicadores de Viabilidade")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Rentabilidade**")
+            
+            # ROI
+            roi = (lucro_operacional / investimento_total) * 100 if investimento_total > 0 else 0
+            st.metric("ROI Anual", f"{roi:.1f}%", 
+                     delta="Acima de 20% = Excelente" if roi > 20 else "Abaixo de 15% = Atenção")
+            
+            # Botão explicação ROI
+            if st.button("📖 De onde vem esse ROI?", key="explain_roi"):
+                resultado = 'Excelente retorno!' if roi > 20 else 'Considere otimizar para melhorar o retorno.' if roi < 15 else 'Retorno adequado.'
+                
+                st.success(f"""
+                💰 **ROI de {roi:.1f}% ao ano**
+                
+                **Fórmula:** (Lucro Operacional ÷ Investimento Total) × 100
+                
+                **Seus Números:**
+                • Lucro Operacional: {format_currency(lucro_operacional)}
+                • Investimento Total: {format_currency(investimento_total)}
+                
+                **Cálculo:** ({format_currency(lucro_operacional)} ÷ {format_currency(investimento_total)}) × 100 = {roi:.1f}%
+                
+                **Em resumo:** Para cada R$ 100 investidos, você ganha R$ {roi:.0f} por ano. {resultado}
+                """)
+            
+            # Margem Operacional
+            margem_operacional = (lucro_operacional / receita_anual) * 100 if receita_anual > 0 else 0
+            st.metric("Margem Operacional", f"{margem_operacional:.1f}%",
+                     delta="Acima de 10% = Boa" if margem_operacional > 10 else "Melhorar eficiência")
+            
+            # Botão explicação Margem Operacional
+            if st.button("📖 De onde vem essa margem?", key="explain_margem"):
+                resultado = 'Margem saudável!' if margem_operacional > 10 else 'Considere revisar custos para melhorar a margem.' if margem_operacional < 5 else 'Margem adequada.'
+                st.info(f"""
+                📈 **Margem Operacional de {margem_operacional:.1f}%**
+                
+                **Fórmula:** (Lucro Operacional ÷ Receita Anual) × 100
+                
+                **Seus Números:**
+                • Lucro Operacional: {format_currency(lucro_operacional)}
+                • Receita Anual: {format_currency(receita_anual)}
+                
+                **Cálculo:** ({format_currency(lucro_operacional)} ÷ {format_currency(receita_anual)}) × 100 = {margem_operacional:.1f}%
+                
+                **Em resumo:** De cada R$ 100 vendidos, sobram R$ {margem_operacional:.0f} como lucro líquido. {resultado}
+                """)
+            
+            # EBITDA Margin
+            ebitda_margin = (ebitda / receita_anual) * 100 if receita_anual > 0 else 0
+            st.metric("Margem EBITDA", f"{ebitda_margin:.1f}%",
+                     delta="Acima de 15% = Saudável" if ebitda_margin > 15 else "Revisar custos")
+            
+            # Botão explicação EBITDA
+            if st.button("📖 De onde vem o EBITDA?", key="explain_ebitda"):
+                resultado = 'Excelente geração de caixa!' if ebitda_margin > 15 else 'Considere otimizar a operação.' if ebitda_margin < 10 else 'Geração de caixa adequada.'
+                st.info(f"""
+                📊 **Margem EBITDA de {ebitda_margin:.1f}%**
+                
+                **O que é:** Lucro antes de Juros, Impostos, Depreciação e Amortização
+                **Fórmula:** (EBITDA ÷ Receita Anual) × 100
+                
+                **Seus Números:**
+                • EBITDA: {format_currency(ebitda)}
+                • Receita Anual: {format_currency(receita_anual)}
+                
+                **Cálculo:** ({format_currency(ebitda)} ÷ {format_currency(receita_anual)}) × 100 = {ebitda_margin:.1f}%
+                
+                **Em resumo:** Sua operação gera {ebitda_margin:.1f}% de caixa sobre as vendas. {resultado}
+                """)
+            
+            # Payback
+            payback = investimento_total / lucro_operacional if lucro_operacional > 0 else float('inf')
+            payback_text = f"{payback:.1f} anos" if payback != float('inf') else "Indefinido"
+            st.metric("Payback", payback_text,
+                     delta="Menos de 4 anos = Bom" if payback < 4 else "Muito longo")
+            
+            # Botão explicação Payback
+            if st.button("📖 De onde vem esse tempo?", key="explain_payback"):
+                resultado = 'Excelente tempo de retorno!' if payback < 3 else 'Tempo aceitável.' if payback < 5 else 'Considere otimizar para acelerar o retorno.'
+                st.info(f"""
+                ⏱️ **Payback de {payback:.1f} anos**
+                
+                **Fórmula:** Investimento Total ÷ Lucro Operacional Anual
+                
+                **Seus Números:**
+                • Investimento Total: {format_currency(investimento_total)}
+                • Lucro Operacional: {format_currency(lucro_operacional)}
+                
+                **Cálculo:** {format_currency(investimento_total)} ÷ {format_currency(lucro_operacional)} = {payback:.1f} anos
+                
+                **Em resumo:** Com lucro de {format_currency(lucro_operacional)} por ano, você recupera o investimento em {payback:.1f} anos. {resultado}
+                """)
+        
+        with col2:
+            st.markdown("**Análise de Risco**")
+            
+            # Ponto de Equilíbrio
+            ponto_equilibrio = st.session_state.business_data.get('ponto_equilibrio_valor', 100000)
+            margem_seguranca = ((receita_anual - ponto_equilibrio) / receita_anual) * 100 if receita_anual > 0 else 0
+            st.metric("Margem de Segurança", f"{margem_seguranca:.1f}%",
+                     delta="Acima de 30% = Seguro" if margem_seguranca > 30 else "Risco elevado")
+            
+            # Botão explicação Margem de Segurança
+            if st.button("📖 De onde vem essa margem?", key="explain_margem_seg"):
+                resultado = 'Margem segura!' if margem_seguranca > 30 else 'Risco elevado - considere reduzir custos ou aumentar vendas.' if margem_seguranca < 15 else 'Margem aceitável.'
+                st.warning(f"""
+                🛡️ **Margem de Segurança de {margem_seguranca:.1f}%**
+                
+                **Fórmula:** ((Receita Atual - Ponto Equilíbrio) ÷ Receita Atual) × 100
+                
+                **Seus Números:**
+                • Receita Anual: {format_currency(receita_anual)}
+                • Ponto de Equilíbrio: {format_currency(ponto_equilibrio)}
+                • Diferença: {format_currency(receita_anual - ponto_equilibrio)}
+                
+                **Cálculo:** (({format_currency(receita_anual)} - {format_currency(ponto_equilibrio)}) ÷ {format_currency(receita_anual)}) × 100 = {margem_seguranca:.1f}%
+                
+                **Em resumo:** Suas vendas podem cair {margem_seguranca:.1f}% antes de ter prejuízo. {resultado}
+                """)
+            
+            # Grau de Alavancagem Operacional
+            custos_fixos_anual = (st.session_state.business_data.get('aluguel', 0) + 
+                                 st.session_state.business_data.get('salarios_clt', 2550) +
+                                 st.session_state.business_data.get('total_optometrista', 5000) +
+                                 st.session_state.business_data.get('outros_fixos', 500)) * 12
+            
+            gao = (receita_anual * (margem_contribuicao_perc/100)) / lucro_operacional if lucro_operacional > 0 else 0
+            st.metric("Alavancagem Operacional", f"{gao:.1f}x",
+                     delta="Menor = Menos risco" if gao < 3 else "Alto risco operacional")
+            
+            # Botão explicação Alavancagem Operacional
+            if st.button("📖 De onde vem essa alavancagem?", key="explain_alavancagem"):
+                margem_contribuicao_valor = receita_anual * (margem_contribuicao_perc/100)
+                resultado = 'Baixo risco operacional.' if gao < 3 else 'Alto risco - pequenas variações nas vendas impactam muito o lucro.' if gao > 5 else 'Risco moderado.'
+                st.info(f"""
+                ⚖️ **Alavancagem Operacional de {gao:.1f}x**
+                
+                **Fórmula:** Margem de Contribuição ÷ Lucro Operacional
+                
+                **Seus Números:**
+                • Margem de Contribuição: {format_currency(margem_contribuicao_valor)}
+                • Lucro Operacional: {format_currency(lucro_operacional)}
+                
+                **Cálculo:** {format_currency(margem_contribuicao_valor)} ÷ {format_currency(lucro_operacional)} = {gao:.1f}x
+                
+                **Em resumo:** Cada 1% de aumento nas vendas gera {gao:.1f}% de aumento no lucro. {resultado}
+                """)
+            
+            # Cobertura de Custos Fixos
+            margem_contribuicao_valor = receita_anual * (margem_contribuicao_perc/100)
+            cobertura_fixos = margem_contribuicao_valor / custos_fixos_anual if custos_fixos_anual > 0 else 0
+            st.metric("Cobertura Custos Fixos", f"{cobertura_fixos:.1f}x",
+                     delta="Acima de 2x = Seguro" if cobertura_fixos > 2 else "Margem apertada")
+            
+            # Botão explicação Cobertura
+            if st.button("📖 De onde vem essa cobertura?", key="explain_cobertura"):
+                resultado = 'Excelente cobertura!' if cobertura_fixos > 3 else 'Cobertura segura.' if cobertura_fixos > 2 else 'Margem apertada - monitore de perto.'
+                st.success(f"""
+                🏛️ **Cobertura de {cobertura_fixos:.1f}x dos custos fixos**
+                
+                **Fórmula:** Margem de Contribuição ÷ Custos Fixos Anuais
+                
+                **Seus Números:**
+                • Margem de Contribuição: {format_currency(margem_contribuicao_valor)}
+                • Custos Fixos Anuais: {format_currency(custos_fixos_anual)}
+                
+                **Cálculo:** {format_currency(margem_contribuicao_valor)} ÷ {format_currency(custos_fixos_anual)} = {cobertura_fixos:.1f}x
+                
+                **Em resumo:** Você gera {cobertura_fixos:.1f}x o dinheiro necessário para pagar custos fixos. {resultado}
+                """)
+            
+            # VPL (assumindo taxa de desconto de 12% a.a.)
+            taxa_desconto = 0.12
+            fluxos_5_anos = [lucro_operacional] * 5  # Simplificado
+            vpl = sum([fluxo / ((1 + taxa_desconto) ** (ano + 1)) for ano, fluxo in enumerate(fluxos_5_anos)]) - investimento_total
+            st.metric("VPL (5 anos)", format_currency(vpl),
+                     delta="Positivo = Viável" if vpl > 0 else "Inviável")
+            
+            # Botão explicação VPL
+            if st.button("📖 De onde vem esse VPL?", key="explain_vpl"):
+                if vpl > 0:
+                    st.success(f"""
+                    💰 **VPL de {format_currency(vpl)} em 5 anos**
+                    
+                    **O que é:** Valor Presente Líquido - quanto vale hoje o dinheiro futuro
+                    **Fórmula:** Soma dos lucros futuros descontados - Investimento inicial
+                    
+                    **Seus Números:**
+                    • Lucro anual: {format_currency(lucro_operacional)}
+                    • Taxa de desconto: {taxa_desconto:.0%}
+                    • Investimento inicial: {format_currency(investimento_total)}
+                    
+                    **Cálculo:**
+                    Valor presente dos lucros: {format_currency(vpl + investimento_total)}
+                    Menos investimento: {format_currency(investimento_total)}
+                    VPL = {format_currency(vpl)}
+                    
+                    **Em resumo:** Este negócio vale a pena - você ganha mais que investimentos seguros.
+                    """)
+                else:
+                    st.error(f"""
+                    📉 **VPL de {format_currency(vpl)} em 5 anos**
+                    
+                    **O que é:** Valor Presente Líquido - quanto vale hoje o dinheiro futuro
+                    **Fórmula:** Soma dos lucros futuros descontados - Investimento inicial
+                    
+                    **Seus Números:**
+                    • Lucro anual: {format_currency(lucro_operacional)}
+                    • Taxa de desconto: {taxa_desconto:.0%}
+                    • Investimento inicial: {format_currency(investimento_total)}
+                    
+                    **Cálculo:**
+                    Valor presente dos lucros: {format_currency(vpl + investimento_total)}
+                    Menos investimento: {format_currency(investimento_total)}
+                    VPL = {format_currency(vpl)}
+                    
+                    **Em resumo:** Este negócio não compensa - você ganharia mais em outros investimentos.
+                    """)
+    
+    with tab2:
+        st.subheader("💹 Análise de Sensibilidade")
+        
+        st.markdown("**Impacto de Variações na Receita**")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Variações na receita
+            variacoes = [-30, -20, -10, 0, 10, 20, 30]
+            resultados = []
+            
+            for var in variacoes:
+                receita_ajustada = receita_anual * (1 + var/100)
+                custos_variaveis_valor = receita_ajustada * (56/100)  # Assumindo 56% de custos variáveis
+                margem_contribuicao = receita_ajustada - custos_variaveis_valor
+                lucro_ajustado = margem_contribuicao - custos_fixos_anual - (investimento_total * 0.05)
+                roi_ajustado = (lucro_ajustado / investimento_total) * 100 if investimento_total > 0 else 0
+                resultados.append((var, receita_ajustada, lucro_ajustado, roi_ajustado))
+            
+            for var, receita, lucro, roi_calc in resultados:
+                if var == 0:
+                    st.markdown(f"**Base (0%): ROI {roi_calc:.1f}%**")
+                else:
+                    cor = "🟢" if var > 0 else "🔴"
+                    st.write(f"{cor} {var:+d}%: ROI {roi_calc:.1f}%")
+        
+        with col2:
+            st.markdown("**Análise Break-Even**")
+            
+            # Cálculo de quantas vendas precisa para break-even
+            ticket_medio = st.session_state.business_data.get('ticket_medio', 250)
+            vendas_break_even = ponto_equilibrio / ticket_medio if ticket_medio > 0 else 0
+            vendas_por_dia = vendas_break_even / 365 if vendas_break_even > 0 else 0
+            
+            st.metric("Vendas/mês Break-Even", f"{vendas_break_even/12:.0f}")
+            st.metric("Vendas/dia Break-Even", f"{vendas_por_dia:.1f}")
+            st.metric("Receita Break-Even", format_currency(ponto_equilibrio))
+            
+            # Capacidade atual vs necessária
+            capacidade_atendimento = st.session_state.business_data.get('capacidade_atendimento', 20)
+            utilizacao_necessaria = (vendas_por_dia / capacidade_atendimento) * 100 if capacidade_atendimento > 0 else 0
+            st.metric("Utilização Necessária", f"{utilizacao_necessaria:.1f}%",
+                     delta="Viável" if utilizacao_necessaria < 80 else "Capacidade insuficiente")
+    
+    with tab3:
+        st.subheader("🎯 Análise de Cenários")
+        
+        # Mesmos cenários da Etapa 10 e do Resumo Empreendedor (cubo compartilhado)
+        cubo_cenarios = get_scenario_cube(st.session_state.business_data)
+        cenarios_cubo = {c['cenario']: c for c in cubo_cenarios.summary_table()}
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("**CENÁRIO PESSIMISTA**")
+            st.caption(cenarios_cubo['pessimista']['descricao'].capitalize())
+            
+            receita_pess = cenarios_cubo['pessimista']['receita_anual']
+            lucro_pess = cenarios_cubo['pessimista']['lucro_operacional']
+            roi_pess = cenarios_cubo['pessimista']['roi']
+            
+            st.metric("Receita", format_currency(receita_pess))
+            st.metric("Lucro", format_currency(lucro_pess))
+            st.metric("ROI", f"{roi_pess:.1f}%")
+            
+            if lucro_pess > 0:
+                st.success("Ainda lucrativo")
+            else:
+                st.error("Prejuízo")
+        
+        with col2:
+            st.markdown("**CENÁRIO REALISTA**")
+            st.caption("Valores atuais")
+            
+            roi_real = cenarios_cubo['realista']['roi']
+            st.metric("Receita", format_currency(cenarios_cubo['realista']['receita_anual']))
+            st.metric("Lucro", format_currency(cenarios_cubo['realista']['lucro_operacional']))
+            st.metric("ROI", f"{roi_real:.1f}%")
+            
+            if roi_real > 15:
+                st.success("Viável")
+            elif roi_real > 10:
+                st.warning("Marginal")
+            else:
+                st.error("Inviável")
+        
+        with col3:
+            st.markdown("**CENÁRIO OTIMISTA**")
+            st.caption(cenarios_cubo['otimista']['descricao'].capitalize())
+            
+            receita_otim = cenarios_cubo['otimista']['receita_anual']
+            lucro_otim = cenarios_cubo['otimista']['lucro_operacional']
+            roi_otim = cenarios_cubo['otimista']['roi']
+            
+            st.metric("Receita", format_currency(receita_otim))
+            st.metric("Lucro", format_currency(lucro_otim))
+            st.metric("ROI", f"{roi_otim:.1f}%")
+            
+            if roi_otim > 25:
+                st.success("Excelente retorno")
+            else:
+                st.info("Bom potencial")
+        
+        st.markdown("---")
+        
+        # Recomendação final baseada nos cálculos
+        st.subheader("🎯 Recomendação de Viabilidade")
+        
+        score_viabilidade = 0
+        if roi > 15: score_viabilidade += 2
+        elif roi > 10: score_viabilidade += 1
+        
+        if margem_seguranca > 25: score_viabilidade += 2
+        elif margem_seguranca > 15: score_viabilidade += 1
+        
+        if payback < 3: score_viabilidade += 2
+        elif payback < 5: score_viabilidade += 1
+        
+        if vpl > 0: score_viabilidade += 2
+        
+        if lucro_pess > 0: score_viabilidade += 1  # Resistente ao cenário pessimista
+        
+        # Exibir recomendação
+        if score_viabilidade >= 7:
+            st.success("🟢 **ALTAMENTE VIÁVEL** - Negócio com forte potencial de retorno")
+        elif score_viabilidade >= 5:
+            st.warning("🟡 **VIÁVEL COM RESSALVAS** - Necessita ajustes para melhor performance")
+        elif score_viabilidade >= 3:
+            st.warning("🟠 **MARGINAL** - Viável mas com riscos significativos")
+        else:
+            st.error("🔴 **INVIÁVEL** - Recomenda-se revisão completa do modelo")
+        
+        st.caption(f"Score de viabilidade: {score_viabilidade}/9")
+    
+    with tab4:
+        st.subheader("🏬 Expansão Multi-Lojas")
+        st.caption("Aberturas escalonadas: cada loja com seu mês de abertura, maturação, aluguel e folha")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            num_lojas_rede = st.slider("Número de lojas", 1, 50, 10, key="rollout_num_lojas")
+            intervalo_aberturas = st.slider("Meses entre aberturas", 0, 12, 3, key="rollout_intervalo")
+        with col2:
+            meses_maturacao = st.slider("Meses até a maturidade", 1, 36, 12, key="rollout_maturacao")
+            curva_maturacao = st.selectbox(
+                "Curva de maturação",
+                list(RolloutSimulator.RAMP_CURVES),
+                format_func=RolloutSimulator.RAMP_CURVES.get,
+                key="rollout_curva"
+            )
+        with col3:
+            overhead_fixo = st.number_input("Custos centrais fixos (R$/mês)", 0.0, value=15000.0, step=1000.0, key="rollout_overhead_fixo")
+            overhead_por_loja = st.number_input("Custos centrais por loja (R$/mês)", 0.0, value=1000.0, step=100.0, key="rollout_overhead_loja")
+        
+        simulador = RolloutSimulator.from_business_data(
+            st.session_state.business_data, num_lojas_rede, intervalo_aberturas,
+            meses_maturacao=meses_maturacao, curva=curva_maturacao,
+            overhead_fixo=overhead_fixo, overhead_por_loja=overhead_por_loja
+        )
+        
+        # Edição loja a loja (what-if)
+        lojas_df = pd.DataFrame({
+            'Loja': [f"Loja {i + 1}" for i in range(num_lojas_rede)],
+            'Mês de Abertura': simulador.abertura_mes + 1,
+            'Receita Madura (R$)': simulador.receita_madura,
+            'Aluguel (R$)': simulador.aluguel,
+            'Folha (R$)': simulador.folha,
+            'Investimento (R$)': simulador.investimento
+        })
+        with st.expander("✏️ Ajustar lojas individualmente", expanded=False):
+            lojas_df = st.data_editor(
+                lojas_df, hide_index=True, use_container_width=True, disabled=['Loja'], key="rollout_lojas",
+                column_config={'Mês de Abertura': st.column_config.NumberColumn(min_value=1, step=1)}
+            )
+        # Abertura antes do mês 1 deixaria o investimento fora do horizonte
+        simulador.abertura_mes = np.maximum(lojas_df['Mês de Abertura'].to_numpy(dtype=int), 1) - 1
+        simulador.receita_madura = lojas_df['Receita Madura (R$)'].to_numpy(dtype=float)
+        simulador.aluguel = lojas_df['Aluguel (R$)'].to_numpy(dtype=float)
+        simulador.folha = lojas_df['Folha (R$)'].to_numpy(dtype=float)
+        simulador.investimento = lojas_df['Investimento (R$)'].to_numpy(dtype=float)
+        
+        rede = simulador.simulate(60)
+        resumo_rede = simulador.summary(60)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Investimento Total", format_currency(resumo_rede['investimento_total']))
+        with col2:
+            st.metric("Necessidade Máxima de Caixa", format_currency(resumo_rede['necessidade_maxima_caixa']),
+                      help=f"Atingida no mês {resumo_rede['mes_necessidade_maxima']}")
+        with col3:
+            st.metric("Lucro em 5 Anos", format_currency(resumo_rede['lucro_total']))
+        with col4:
+            payback_rede = resumo_rede['payback_mes']
+            st.metric("Payback da Rede", f"{payback_rede} meses" if payback_rede else "> 60 meses")
+        
+        fig_rede = go.Figure()
+        fig_rede.add_trace(go.Bar(x=rede['mes'], y=rede['lucro_operacional'], name='Resultado mensal da rede'))
+        fig_rede.add_trace(go.Scatter(x=rede['mes'], y=rede['caixa_acumulado'], name='Caixa acumulado', line=dict(width=3)))
+        fig_rede.add_trace(go.Scatter(x=rede['mes'], y=rede['lojas_abertas'], name='Lojas abertas', yaxis='y2', line=dict(dash='dot')))
+        fig_rede.update_layout(
+            height=420,
+            xaxis_title="Mês",
+            yaxis=dict(title="R$"),
+            yaxis2=dict(title="Lojas", overlaying='y', side='right'),
+            legend=dict(orientation='h', y=1.1)
+        )
+        st.plotly_chart(fig_rede, use_container_width=True)
+        
+        anual_rede = pd.DataFrame({
+            'Ano': np.arange(1, 6),
+            'Lojas (fim do ano)': rede['lojas_abertas'][11::12],
+            'Receita': rede['receita'].reshape(5, 12).sum(axis=1),
+            'Custos Centrais': rede['overhead'].reshape(5, 12).sum(axis=1),
+            'Resultado': rede['lucro_operacional'].reshape(5, 12).sum(axis=1),
+            'Investimento': rede['investimento'].reshape(5, 12).sum(axis=1),
+            'Caixa Acumulado': rede['caixa_acumulado'][11::12]
+        })
+        st.dataframe(
+            format_frame(anual_rede, currency=['Receita', 'Custos Centrais', 'Resultado', 'Investimento', 'Caixa Acumulado'], decimals=0),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step11"):
+            st.session_state.step = 10
+            st.rerun()
+    with col3:
+        if st.button("Próxima Etapa ➡️", type="primary", key="next_step11"):
+            st.session_state.step = 12
+            st.rerun()
@@ -0,0 +1,313 @@
+"""
+Etapa 12 - Cenários e Riscos
+Matriz de riscos, simulação Monte Carlo e planos de contingência
+"""
+
+import streamlit as st
+
+from app_helpers import format_currency, save_user_data
+
+
+def show_step_12():
+    """Etapa 12: Cenários e Riscos"""
+    st.header("1️⃣2️⃣ Cenários e Riscos")
+    st.markdown("**FASE 12: RISCOS** - Análise quantitativa de riscos e planos de contingência")
+    
+    # Recuperar dados das etapas anteriores
+    receita_anual = st.session_state.business_data.get('receita_anual', 180000)
+    investimento_total = st.session_state.business_data.get('investimento_total', 81500)
+    lucro_operacional = st.session_state.business_data.get('lucro_operacional', 25000)
+    
+    tab1, tab2, tab3 = st.tabs(["⚠️ Matriz de Riscos", "📈 Simulação Monte Carlo", "🛡️ Planos de Contingência"])
+    
+    with tab1:
+        st.subheader("⚠️ Análise Quantitativa de Riscos")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Riscos de Mercado**")
+            
+            # Concorrência
+            impacto_concorrencia = st.slider(
+                "Impacto da concorrência na receita (%)",
+                min_value=0.0,
+                max_value=50.0,
+                value=float(st.session_state.business_data.get('impacto_concorrencia', 15.0)),
+                step=5.0
+            )
+            if impacto_concorrencia != st.session_state.business_data.get('impacto_concorrencia'):
+                st.session_state.business_data['impacto_concorrencia'] = impacto_concorrencia
+                save_user_data()
+            
+            prob_concorrencia = st.slider(
+                "Probabilidade de entrada de concorrentes (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=float(st.session_state.business_data.get('prob_concorrencia', 30.0)),
+                step=10.0
+            )
+            if prob_concorrencia != st.session_state.business_data.get('prob_concorrencia'):
+                st.session_state.business_data['prob_concorrencia'] = prob_concorrencia
+                save_user_data()
+            
+            # Cálculo do risco esperado
+            risco_concorrencia = (impacto_concorrencia/100) * (prob_concorrencia/100) * receita_anual
+            st.metric("Risco Concorrência", format_currency(risco_concorrencia))
+            
+            # Risco de demanda
+            volatilidade_demanda = st.slider(
+                "Volatilidade da demanda (%)",
+                min_value=0.0,
+                max_value=50.0,
+                value=float(st.session_state.business_data.get('volatilidade_demanda', 20.0)),
+                step=5.0
+            )
+            if volatilidade_demanda != st.session_state.business_data.get('volatilidade_demanda'):
+                st.session_state.business_data['volatilidade_demanda'] = volatilidade_demanda
+                save_user_data()
+            
+            # Value at Risk (VaR) simplificado - 5% pior cenário
+            var_5_percent = receita_anual * (volatilidade_demanda/100) * 1.645  # Z-score para 95% confiança
+            st.metric("VaR (5% pior caso)", format_currency(var_5_percent))
+        
+        with col2:
+            st.markdown("**Riscos Operacionais**")
+            
+            # Risco de custos
+            inflacao_custos = st.slider(
+                "Inflação de custos anual (%)",
+                min_value=0.0,
+                max_value=20.0,
+                value=float(st.session_state.business_data.get('inflacao_custos', 8.0)),
+                step=1.0
+            )
+            if inflacao_custos != st.session_state.business_data.get('inflacao_custos'):
+                st.session_state.business_data['inflacao_custos'] = inflacao_custos
+                save_user_data()
+            
+            custos_fixos_anual = (st.session_state.business_data.get('aluguel', 3000) + 
+                                 st.session_state.business_data.get('total_folha_salarios', 4500) +
+                                 st.session_state.business_data.get('0', 800) +
+                                 st.session_state.business_data.get('outros_fixos', 500)) * 12
+            
+            impacto_inflacao = custos_fixos_anual * (inflacao_custos/100)
+            st.metric("Impacto Inflação", format_currency(impacto_inflacao))
+            
+            # Risco de inadimplência
+            taxa_inadimplencia = st.slider(
+                "Taxa de inadimplência (%)",
+                min_value=0.0,
+                max_value=15.0,
+                value=float(st.session_state.business_data.get('taxa_inadimplencia', 3.0)),
+                step=0.5
+            )
+            if taxa_inadimplencia != st.session_state.business_data.get('taxa_inadimplencia'):
+                st.session_state.business_data['taxa_inadimplencia'] = taxa_inadimplencia
+                save_user_data()
+            
+            perda_inadimplencia = receita_anual * (taxa_inadimplencia/100)
+            st.metric("Perda Inadimplência", format_currency(perda_inadimplencia))
+            
+            # Risco total
+            risco_total_anual = risco_concorrencia + impacto_inflacao + perda_inadimplencia
+            st.metric("Risco Total Anual", format_currency(risco_total_anual))
+            
+            # Impacto no ROI
+            lucro_com_riscos = lucro_operacional - risco_total_anual
+            roi_com_riscos = (lucro_com_riscos / investimento_total) * 100 if investimento_total > 0 else 0
+            st.metric("ROI Ajustado ao Risco", f"{roi_com_riscos:.1f}%")
+    
+    with tab2:
+        st.subheader("📈 Simulação de Cenários")
+        
+        if st.button("Executar Simulação Monte Carlo"):
+            import numpy as np
+            import plotly.graph_objects as go
+            
+            # Parâmetros da simulação
+            num_simulacoes = 1000
+            
+            # Distribuições das variáveis
+            receitas_sim = np.random.normal(receita_anual, receita_anual * (volatilidade_demanda/100), num_simulacoes)
+            receitas_sim = np.maximum(receitas_sim, receita_anual * 0.3)  # Mínimo 30% da receita base
+            
+            custos_variaveis_perc = np.random.normal(0.56, 0.05, num_simulacoes)  # 56% ± 5%
+            custos_variaveis_perc = np.clip(custos_variaveis_perc, 0.4, 0.7)
+            
+            custos_fixos_sim = np.random.normal(custos_fixos_anual, custos_fixos_anual * 0.1, num_simulacoes)
+            
+            # Cálculo dos lucros simulados
+            lucros_sim = []
+            for i in range(num_simulacoes):
+                receita = receitas_sim[i]
+                custo_var = receita * custos_variaveis_perc[i]
+                custo_fixo = custos_fixos_sim[i]
+                lucro = receita - custo_var - custo_fixo - (investimento_total * 0.05)
+                lucros_sim.append(lucro)
+            
+            lucros_sim = np.array(lucros_sim)
+            
+            # Estatísticas
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("Lucro Médio", format_currency(np.mean(lucros_sim)))
+                st.metric("Desvio Padrão", format_currency(np.std(lucros_sim)))
+            
+            with col2:
+                st.metric("Percentil 5%", format_currency(np.percentile(lucros_sim, 5)))
+                st.metric("Percentil 95%", format_currency(np.percentile(lucros_sim, 95)))
+            
+            with col3:
+                prob_prejuizo = (lucros_sim < 0).sum() / num_simulacoes * 100
+                st.metric("Prob. Prejuízo", f"{prob_prejuizo:.1f}%")
+                
+                prob_roi_15 = ((lucros_sim / investimento_total) > 0.15).sum() / num_simulacoes * 100
+                st.metric("Prob. ROI > 15%", f"{prob_roi_15:.1f}%")
+            
+            # Histograma dos resultados
+            fig = go.Figure(data=[go.Histogram(x=lucros_sim, nbinsx=50)])
+            fig.update_layout(
+                title="Distribuição de Lucros Simulados",
+                xaxis_title="Lucro Anual (R$)",
+                yaxis_title="Frequência",
+                height=400
+            )
+            fig.add_vline(x=0, line_dash="dash", line_color="red", annotation_text="Break-even")
+            fig.add_vline(x=np.mean(lucros_sim), line_dash="dash", line_color="green", annotation_text="Média")
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        else:
+            st.info("Clique no botão acima para executar simulação de 1000 cenários")
+    
+    with tab3:
+        st.subheader("🛡️ Planos de Contingência Quantificados")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Cenário: Queda de 30% nas Vendas**")
+            
+            receita_crisis = receita_anual * 0.7
+            custos_variaveis_crisis = receita_crisis * 0.56
+            
+            # Ações de contingência
+            reducao_custos_fixos = st.slider(
+                "Redução possível custos fixos (%)",
+                min_value=0.0,
+                max_value=50.0,
+                value=20.0,
+                step=5.0,
+                key="reducao_custos"
+            )
+            
+            custos_fixos_reduzidos = custos_fixos_anual * (1 - reducao_custos_fixos/100)
+            lucro_crisis = receita_crisis - custos_variaveis_crisis - custos_fixos_reduzidos - (investimento_total * 0.05)
+            
+            st.write(f"Receita em crise: {format_currency(receita_crisis)}")
+            st.write(f"Custos fixos reduzidos: {format_currency(custos_fixos_reduzidos)}")
+            st.write(f"Lucro em crise: {format_currency(lucro_crisis)}")
+            
+            if lucro_crisis > 0:
+                st.success("Ainda lucrativo com contingência")
+            else:
+                st.error("Necessita mais ajustes")
+            
+            # Tempo de sobrevivência
+            if lucro_crisis < 0:
+                capital_giro = st.session_state.business_data.get('capital_giro', 18000)
+                meses_sobrevivencia = capital_giro / abs(lucro_crisis/12) if lucro_crisis < 0 else float('inf')
+                st.metric("Meses de Sobrevivência", f"{meses_sobrevivencia:.1f}")
+        
+        with col2:
+            st.markdown("**Ações de Contingência Planejadas**")
+            
+            acoes_contingencia = st.multiselect(
+                "Ações implementáveis em crise",
+                ["Reduzir jornada funcionários", "Renegociar aluguel", "Focar produtos alta margem", 
+                 "Intensificar marketing digital", "Parcerias estratégicas", "Reduzir estoque",
+                 "Buscar capital adicional", "Diversificar serviços"],
+                default=st.session_state.business_data.get('acoes_contingencia', [])
+            )
+            if acoes_contingencia != st.session_state.business_data.get('acoes_contingencia'):
+                st.session_state.business_data['acoes_contingencia'] = acoes_contingencia
+                save_user_data()
+            
+            # Custos de implementação
+            custo_contingencia = st.number_input(
+                "Custo implementação contingência (R$)",
+                min_value=0.0,
+                value=float(st.session_state.business_data.get('custo_contingencia', 5000)),
+                step=1000.0,
+                format="%.0f"
+            )
+            if custo_contingencia != st.session_state.business_data.get('custo_contingencia'):
+                st.session_state.business_data['custo_contingencia'] = custo_contingencia
+                save_user_data()
+            
+            # Tempo para implementação
+            tempo_implementacao = st.selectbox(
+                "Tempo para implementar ações",
+                ["1-2 semanas", "1 mês", "2-3 meses", "Mais de 3 meses"],
+                index=["1-2 semanas", "1 mês", "2-3 meses", "Mais de 3 meses"].index(
+                    st.session_state.business_data.get('tempo_implementacao', '1 mês')
+                )
+            )
+            if tempo_implementacao != st.session_state.business_data.get('tempo_implementacao'):
+                st.session_state.business_data['tempo_implementacao'] = tempo_implementacao
+                save_user_data()
+            
+            # Eficácia esperada
+            eficacia_contingencia = st.slider(
+                "Eficácia esperada das ações (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=float(st.session_state.business_data.get('eficacia_contingencia', 60.0)),
+                step=10.0
+            )
+            if eficacia_contingencia != st.session_state.business_data.get('eficacia_contingencia'):
+                st.session_state.business_data['eficacia_contingencia'] = eficacia_contingencia
+                save_user_data()
+    
+    # Resumo final de riscos
+    st.markdown("---")
+    st.subheader("📊 Resumo Executivo de Riscos")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Risco Total", format_currency(risco_total_anual))
+    
+    with col2:
+        impacto_percentual = (risco_total_anual / receita_anual) * 100
+        st.metric("Impacto na Receita", f"{impacto_percentual:.1f}%")
+    
+    with col3:
+        nivel_risco = "BAIXO" if impacto_percentual < 10 else "MÉDIO" if impacto_percentual < 20 else "ALTO"
+        st.metric("Nível de Risco", nivel_risco)
+    
+    with col4:
+        st.metric("ROI Ajustado", f"{roi_com_riscos:.1f}%")
+    
+    # Store risk data
+    st.session_state.business_data.update({
+        'risco_total_anual': risco_total_anual,
+        'roi_com_riscos': roi_com_riscos,
+        'nivel_risco': nivel_risco
+    })
+    save_user_data()
+    
+    # Navigation
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        if st.button("⬅️ Etapa Anterior", key="prev_step12"):
+            st.session_state.step = 11
+            st.rerun()
+    with col3:
+        if st.button("🎯 Finalizar Plano", type="primary", key="finish_plan"):
+            st.balloons()
+            st.success("Plano de negócios concluído com análise completa!")
+            st.info("Use o menu lateral para navegar entre etapas ou gerar relatórios.")
+            st.rerun()
@@ -3,102 +3,41 @@ Gerador de Relatório Estruturado para Investidor
 Baseado no checklist profissional com KPIs específicos para óticas
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from io import BytesIO
 from datetime import datetime, timedelta
 import pandas as pd
 
+from scenario_cube import get_scenario_cube
+from investor_sections import get_investor_sections
+from br_format import format_currency
+from report_styles import get_report_styles
+
 class StructuredInvestorReport:
     """Gerador de relatório estruturado para investidores seguindo checklist profissional"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Configura estilos customizados para o PDF"""
-        
-        # Estilo do título principal
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=20,
-            textColor=colors.HexColor('#1a365d'),
-            alignment=TA_CENTER,
-            spaceAfter=30,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Estilo dos cabeçalhos de seção
-        self.section_style = ParagraphStyle(
-            'SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#2d3748'),
-            alignment=TA_LEFT,
-            spaceAfter=12,
-            spaceBefore=20,
-            fontName='Helvetica-Bold',
-            backColor=colors.HexColor('#f7fafc'),
-            borderPadding=8
-        )
-        
-        # Estilo dos subcabeçalhos
-        self.subsection_style = ParagraphStyle(
-            'SubsectionHeader',
-            parent=self.styles['Heading3'],
-            fontSize=12,
-            textColor=colors.HexColor('#4a5568'),
-            alignment=TA_LEFT,
-            spaceAfter=8,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Estilo do texto normal
-        self.normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            alignment=TA_JUSTIFY,
-            spaceAfter=6,
-            fontName='Helvetica'
-        )
-        
-        # Estilo para KPIs
-        self.kpi_style = ParagraphStyle(
-            'KPI',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            textColor=colors.HexColor('#2b6cb0'),
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Estilo para alertas
-        self.alert_style = ParagraphStyle(
-            'Alert',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#e53e3e'),
-            alignment=TA_LEFT,
-            spaceAfter=6,
-            fontName='Helvetica-Bold'
-        )
+        # Estilos criados uma vez por processo (report_styles)
+        self.report_styles = get_report_styles()
+        self.styles = self.report_styles.sheet
+        self.title_style = self.report_styles.title
+        self.section_style = self.report_styles.section
+        self.subsection_style = self.report_styles.subsection
+        self.normal_style = self.report_styles.normal
+        self.kpi_style = self.report_styles.kpi
+        self.alert_style = self.report_styles.highlight
     
     def _format_currency(self, value):
         """Formata valores monetários"""
-        if value is None or value == 0:
+        if value is None:
             return "R$ 0,00"
         try:
-            return f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-        except:
+            return format_currency(value)
+        except (TypeError, ValueError):
+            # Valor não numérico vindo de campo de texto: não derruba o PDF inteiro
             return "R$ 0,00"
     
     def _format_percentage(self, value):
@@ -111,11 +50,12 @@ class StructuredInvestorReport:
     def _calculate_kpis(self, business_data):
         """Calcula KPIs específicos para óticas"""
         
-        # Dados básicos
-        receita_mensal = business_data.get('vendas_mes_1', 20831)
-        receita_anual = business_data.get('receita_anual', 250000)
-        ticket_medio = business_data.get('ticket_medio', 180)
-        investimento_total = business_data.get('investimento_total', 81500)
+        # Dados básicos (mesmos números do relatório multilíngue e das abas da ferramenta)
+        vm = get_investor_sections(business_data).view_model
+        receita_mensal = vm['vendas_mes_1'] or 20831
+        receita_anual = vm['faturamento_anual'] or 250000
+        ticket_medio = vm['ticket_medio'] or 180
+        investimento_total = vm['investimento_total'] or 81500
         lucro_operacional = business_data.get('lucro_operacional', 45000)
         margem_operacional = business_data.get('margem_operacional', 18)
         
@@ -159,21 +99,14 @@ class StructuredInvestorReport:
             'payback_anos': business_data.get('payback_anos', 1.8)
         }
     
-    def generate_structured_report(self, business_data, language="pt"):
-        """Gera relatório estruturado completo"""
+    def generate_structured_report(self, business_data, language="pt", output=None):
+        """Gera relatório estruturado completo (em output, caminho ou arquivo, se informado)"""
         
-        # Configurar buffer
-        buffer = BytesIO()
+        # Configurar buffer (ou arquivo de spool em disco)
+        buffer = BytesIO() if output is None else output
         
         # Configurar documento
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=50,
-            leftMargin=50,
-            topMargin=80,
-            bottomMargin=80
-        )
+        doc = self.report_styles.document(buffer)
         
         story = []
         
@@ -420,6 +353,30 @@ class StructuredInvestorReport:
         • Monitoramento constante de margens e custos
         """
         story.append(Paragraph(riscos_text, self.normal_style))
+        story.append(Spacer(1, 15))
+        
+        # Cenários (mesmo cubo usado nas Etapas 10 e 11)
+        cenarios_data = [['Cenário (Ano 1)', 'Receita Anual', 'Lucro Operacional', 'ROI']]
+        for cenario in get_scenario_cube(business_data).summary_table():
+            cenarios_data.append([
+                f"{cenario['label']} ({cenario['descricao']})",
+                self._format_currency(cenario['receita_anual']),
+                self._format_currency(cenario['lucro_operacional']),
+                f"{cenario['roi']:.1f}%"
+            ])
+        
+        cenarios_table = Table(cenarios_data, colWidths=[2.4*inch, 1.4*inch, 1.4*inch, 0.8*inch])
+        cenarios_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2b6cb0')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0'))
+        ]))
+        
+        story.append(cenarios_table)
         story.append(Spacer(1, 20))
         
         # 10. PRÓXIMOS PASSOS E METAS
@@ -476,7 +433,9 @@ class StructuredInvestorReport:
         story.append(Paragraph(conclusao_text, self.normal_style))
         
         # Construir PDF
-        doc.build(story)
+        self.report_styles.build(doc, story, nome_negocio, language)
         
+        if output is not None:
+            return output
         buffer.seek(0)
         return buffer
\ No newline at end of file
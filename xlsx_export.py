@@ -0,0 +1,211 @@
+"""
+Exportação de Planilhas Excel (XLSX)
+DRE mensal, fluxo de caixa, cubo de cenários e tabela completa de preços em um
+workbook gravado em modo streaming (openpyxl write-only): cada linha vai direto
+para o arquivo com células numéricas nativas e formatos de moeda/percentual,
+sem manter a árvore de objetos do openpyxl na memória
+"""
+
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+from financial_projection import FinancialProjection
+from report_jobs import REPORT_MIME_TYPES
+from scenario_cube import get_scenario_cube
+
+XLSX_MIME = REPORT_MIME_TYPES['planilha']
+
+# Formatos numéricos do Excel (percentuais já vêm em pontos percentuais)
+NUMBER_FORMATS = {
+    'moeda': '"R$" #,##0.00',
+    'percentual': '0.0"%"',
+    'decimal': '0.00',
+    'inteiro': '0'
+}
+
+# Linhas do DRE mensal (mesmos rótulos da Etapa 10)
+DRE_LABELS = [
+    ('Receita Bruta', 'receita_bruta'),
+    ('(-) CMV', 'cmv'),
+    ('(-) Impostos', 'impostos'),
+    ('(-) Comissões', 'comissoes'),
+    ('(-) Taxas Financeiras', 'taxas_financeiras'),
+    ('(-) Comissões Captador', 'comissoes_captador'),
+    ('(-) Outros Variáveis', 'outros_variaveis'),
+    ('= Custos Variáveis', 'custos_variaveis_total'),
+    ('= Margem de Contribuição', 'margem_contribuicao'),
+    ('(-) Aluguel', 'aluguel'),
+    ('(-) Salários', 'salarios'),
+    ('(-) Serviços', 'servicos'),
+    ('(-) Outros Fixos', 'outros_fixos'),
+    ('(-) Depreciação', 'depreciacao'),
+    ('= Custos Fixos', 'custos_fixos_total'),
+    ('= LUCRO OPERACIONAL', 'lucro_operacional')
+]
+
+METRIC_LABELS = {
+    'receita_bruta': 'Receita Bruta',
+    'custos_variaveis': 'Custos Variáveis',
+    'custos_fixos': 'Custos Fixos',
+    'lucro_operacional': 'Lucro Operacional',
+    'lucro_acumulado': 'Lucro Acumulado',
+    'saldo_investimento': 'Saldo do Investimento'
+}
+
+HEADER_FONT = Font(bold=True, color='FFFFFF')
+HEADER_FILL = PatternFill('solid', fgColor='1F4E79')
+TOTAL_FONT = Font(bold=True)
+
+
+class WorkbookExporter:
+    """Streaming XLSX export of a plan's monthly DRE, cash flow, scenarios and price table"""
+
+    def __init__(self, months=12):
+        self.months = months
+
+    @staticmethod
+    def _cell(ws, value, formato=None, font=None, fill=None):
+        """Write-only cell with an optional number format and style (plain value when unstyled)"""
+        if formato is None and font is None and fill is None:
+            return value
+        cell = WriteOnlyCell(ws, value=value)
+        if formato:
+            cell.number_format = NUMBER_FORMATS[formato]
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
+
+    def _sheet(self, wb, title, headers, widths):
+        """New streamed sheet with column widths, frozen header and the header row"""
+        ws = wb.create_sheet(title)
+        for i, largura in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(i)].width = largura
+        ws.freeze_panes = 'B2'
+        ws.append([self._cell(ws, titulo, font=HEADER_FONT, fill=HEADER_FILL) for titulo in headers])
+        return ws
+
+    def _write_item_rows(self, ws, itens):
+        """Rows of (label, monthly values) with a total column, '=' rows in bold"""
+        for rotulo, valores in itens:
+            fonte = TOTAL_FONT if rotulo.startswith('=') or rotulo.isupper() else None
+            valores = np.asarray(valores, dtype=float)
+            # Saldos não são somáveis: linha sem coluna total
+            total = [] if 'saldo' in rotulo.lower() else [self._cell(ws, float(valores.sum()), 'moeda', TOTAL_FONT)]
+            ws.append(
+                [self._cell(ws, rotulo, font=fonte)]
+                + [self._cell(ws, float(v), 'moeda', fonte) for v in valores]
+                + total
+            )
+
+    def write_dre(self, wb, projecao):
+        """Monthly DRE sheet (items × months + total)"""
+        meses = [f'Mês {m}' for m in projecao['mes']]
+        ws = self._sheet(wb, 'DRE Mensal', ['Item'] + meses + ['Total'], [28] + [14] * (len(meses) + 1))
+        self._write_item_rows(ws, [(rotulo, projecao[chave]) for rotulo, chave in DRE_LABELS])
+
+    def write_cash_flow(self, wb, projecao, investimento_total, fluxo_caixa=None):
+        """Cash flow sheet: the step 10 table when given, else derived from the projection"""
+        if fluxo_caixa is not None:
+            # Tabela da Etapa 10 (linhas = itens, colunas = meses)
+            itens = [(str(rotulo), linha.to_numpy()) for rotulo, linha in fluxo_caixa.iterrows()]
+            meses = [str(coluna) for coluna in fluxo_caixa.columns]
+        else:
+            # Recebimentos já vêm líquidos da taxa do cartão: ela não entra de novo nos custos variáveis
+            recebimentos = projecao['recebimentos_vendas']
+            variaveis = projecao['custos_variaveis_total'] - projecao['taxas_financeiras']
+            fixos = projecao['custos_fixos_total'] - projecao['depreciacao']  # Depreciação não sai do caixa
+            fluxo = recebimentos - variaveis - fixos
+            itens = [
+                ('(+) Recebimentos de Vendas (líquidos de taxas)', recebimentos),
+                ('(-) Custos Variáveis (sem taxas financeiras)', variaveis),
+                ('(-) Custos Fixos (sem depreciação)', fixos),
+                ('= Fluxo do Mês', fluxo)
+            ]
+            meses = [f'Mês {m}' for m in projecao['mes']]
+
+        ws = self._sheet(wb, 'Fluxo de Caixa', ['Item'] + meses + ['Total'], [36] + [14] * (len(meses) + 1))
+        self._write_item_rows(ws, itens)
+
+        if fluxo_caixa is None:
+            # Saldo acumulado após o investimento inicial (não somável: sem coluna total)
+            saldo = np.cumsum(fluxo) - investimento_total
+            ws.append([self._cell(ws, '= Saldo Acumulado (após investimento)', font=TOTAL_FONT)]
+                      + [self._cell(ws, float(v), 'moeda', TOTAL_FONT) for v in saldo])
+
+    def write_scenarios(self, wb, cube):
+        """Scenario cube in long format: one row per scenario × store count × month"""
+        headers = ['Cenário', 'Lojas', 'Mês'] + [METRIC_LABELS[m] for m in cube.METRICS]
+        ws = self._sheet(wb, 'Cenários', headers, [14, 8, 8] + [18] * len(cube.METRICS))
+
+        rotulos = [s['label'] for s in cube.SCENARIOS.values()]
+        for s, rotulo in enumerate(rotulos):
+            for l, lojas in enumerate(cube.store_counts):
+                bloco = cube.data[s, :, l, :]
+                for mes in range(cube.horizon):
+                    ws.append(
+                        [self._cell(ws, rotulo), self._cell(ws, lojas, 'inteiro'), self._cell(ws, mes + 1, 'inteiro')]
+                        + [self._cell(ws, float(v), 'moeda') for v in bloco[mes]]
+                    )
+
+    def write_price_table(self, wb, tabela):
+        """Full lens price table with currency, margin and markup formats"""
+        formatos = []
+        for coluna in tabela.columns:
+            if not np.issubdtype(tabela[coluna].dtype, np.number):
+                formatos.append(None)
+            elif '%' in coluna:
+                formatos.append('percentual')
+            elif coluna == 'Markup':
+                formatos.append('decimal')
+            else:
+                formatos.append('moeda')
+
+        larguras = [max(12, len(str(coluna)) + 2) for coluna in tabela.columns]
+        ws = self._sheet(wb, 'Tabela de Preços', list(tabela.columns), larguras)
+        for linha in tabela.itertuples(index=False, name=None):
+            ws.append([
+                self._cell(ws, valor.item() if hasattr(valor, 'item') else valor, formato)
+                for valor, formato in zip(linha, formatos)
+            ])
+
+    def export(self, business_data, output, fluxo_caixa=None, tabela_precos=None):
+        """Write the workbook to output (path or binary file object)"""
+        projection = FinancialProjection(business_data)
+        projecao = projection.project(self.months)
+        investimento_total = projection.get_inputs()['investimento_total']
+
+        if tabela_precos is None:
+            from pricing_suggestions import LensPricingSuggestions
+            tabela_precos = LensPricingSuggestions().gerar_tabela_completa(incluir_acessorios=True)
+
+        wb = Workbook(write_only=True)
+        self.write_dre(wb, projecao)
+        self.write_cash_flow(wb, projecao, investimento_total, fluxo_caixa)
+        self.write_scenarios(wb, get_scenario_cube(business_data))
+        self.write_price_table(wb, tabela_precos)
+        wb.save(output)
+        return output
+
+    def generate_workbook(self, business_data, language="pt", output=None, figures=None):
+        """Report-queue entry point: XLSX in output if given, else a BytesIO (labels in Portuguese)
+
+        figures may carry the step 10 cash flow table ({'fluxo_caixa': DataFrame.to_dict('split')})
+        so the workbook matches the screen instead of the simplified projection cash flow
+        """
+        fluxo_caixa = None
+        if figures and figures.get('fluxo_caixa') is not None:
+            fluxo_caixa = pd.DataFrame(**figures['fluxo_caixa'])
+        if output is not None:
+            return self.export(business_data, output, fluxo_caixa)
+        buffer = BytesIO()
+        self.export(business_data, buffer, fluxo_caixa)
+        buffer.seek(0)
+        return buffer